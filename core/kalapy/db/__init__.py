@@ -9,7 +9,7 @@ inspired of OpenERP and Django ORM.
 :license: BSD, see LICENSE for more details.
 """
 from kalapy.db.engines import DatabaseError, IntegrityError, \
-    commit, rollback, run_in_transaction
+    commit, rollback, run_in_transaction, save_all, delete_all
 
 from kalapy.db.fields import *
 from kalapy.db.reference import *
@@ -84,6 +84,58 @@ def run_in_transaction(func, *args, **kw):
     return database.run_in_transaction(func, *args, **kw)
 
 
+#: maximum number of records written by :func:`save_all` and :func:`delete_all`
+#: with a single call to the database engine
+BATCH_SIZE = 500
+
+
+def save_all(*instances):
+    """Save all the given model instances. It works like :meth:`Model.save`
+    but writes the records in batches of at most :data:`BATCH_SIZE` records
+    instead of one at a time.
+
+    :returns: list of the keys of the instances
+    :raises: :class:`DatabaseError` if the instances could not be saved.
+    """
+    objects = []
+    seen = set()
+    for obj in instances:
+        if obj.is_saved and not obj.is_dirty:
+            continue
+        # the related records are saved first, in the same or an earlier batch
+        for o in obj._get_related() + [obj]:
+            if id(o) not in seen:
+                seen.add(id(o))
+                objects.append(o)
+    for i in range(0, len(objects), BATCH_SIZE):
+        database.update_records(*objects[i:i + BATCH_SIZE])
+    return [obj.key for obj in instances]
+
+
+def delete_all(*instances):
+    """Delete all the given model instances. It works like :meth:`Model.delete`
+    but deletes the records in batches of at most :data:`BATCH_SIZE` records.
+
+    :raises:
+        - :class:`TypeError`: if an instance is not saved
+        - :class:`DatabaseError`: if the instances could not be deleted.
+    """
+    # the engines delete a batch from the table of its first instance
+    models = []
+    groups = {}
+    for obj in instances:
+        if not obj.is_saved:
+            raise TypeError(_("Can't delete, instance doesn't exists."))
+        if obj.__class__ not in groups:
+            models.append(obj.__class__)
+            groups[obj.__class__] = []
+        groups[obj.__class__].append(obj)
+    for model in models:
+        group = groups[model]
+        for i in range(0, len(group), BATCH_SIZE):
+            database.delete_records(*group[i:i + BATCH_SIZE])
+
+
 def open_connection():
     """Open database connection when request started.
     """
@@ -30,6 +30,9 @@ CONV = {
     'text': datastore_types.Text,
 }
 
+#: maximum number of entities of a batch get, put or delete
+BATCH_SIZE = 500
+
 
 class DatabaseError(Exception):
     pass
@@ -83,7 +86,6 @@ class Database(IDatabase):
 
     def update_records(self, instance, *args):
 
-        result = []
         instances = [instance]
         instances.extend(args)
 
@@ -100,8 +102,13 @@ class Database(IDatabase):
                 check_unique(obj, items)
 
             obj._payload.update(items)
-            obj._key = str(datastore.Put(obj._payload))
 
+        # write all the entities with a single rpc
+        keys = datastore.Put([obj._payload for obj in instances])
+
+        result = []
+        for obj, key in zip(instances, keys):
+            obj._key = str(key)
             result.append(obj.key)
             obj.set_dirty(False)
 
@@ -142,8 +149,10 @@ class Database(IDatabase):
         keys = self._keys(qset)
         result = []
 
-        if keys: # if only key filter
-            result = [e for e in datastore.Get(keys) if e]
+        if keys is not None: # if only key filter
+            keys = self._valid_keys(qset.model._meta.table, keys)
+            if keys:
+                result = [e for e in datastore.Get(keys) if e]
         else: # else build query, the results should be ANDed
             query_set = self._build_query_set(qset, orderings)
             result_set = [[e for e in q.Get(limit, offset) if e] for q in query_set]
@@ -159,9 +168,125 @@ class Database(IDatabase):
         for e in sort_result(result, orderings)[:limit]:
             yield dict(e, key=str(e.key()), _payload=e)
 
+    def iterate(self, qset, chunk_size):
+        orderings = []
+        try:
+            name, how = qset.order
+            how = Query.ASCENDING if how == 'ASC' else Query.DESCENDING
+            orderings = [(name, how)]
+        except:
+            pass
+
+        keys = self._keys(qset)
+        if keys is not None: # if only key filter, get the keys by chunks
+            keys = self._valid_keys(qset.model._meta.table, keys)
+            result = []
+            for i in range(0, len(keys), chunk_size):
+                entities = [e for e in datastore.Get(keys[i:i + chunk_size]) if e]
+                # the order applies to all the keys, sort them at the end
+                if orderings:
+                    result.extend(entities)
+                    continue
+                for e in entities:
+                    yield dict(e, key=str(e.key()), _payload=e)
+            for e in sort_result(result, orderings):
+                yield dict(e, key=str(e.key()), _payload=e)
+            return
+
+        query_set = self._build_query_set(qset, orderings)
+        # a single plain query is streamed by the datastore iterator,
+        # which fetches the next batch only when the current is consumed
+        if len(query_set) == 1 and type(query_set[0]) is Query:
+            for e in query_set[0].Run(batch_size=chunk_size):
+                if e:
+                    yield dict(e, key=str(e.key()), _payload=e)
+            return
+        for item in super(Database, self).iterate(qset, chunk_size):
+            yield item
+
+    def update_query(self, qset, values):
+
+        # the unique contraints are checked per instance
+        if self.check_unique and qset.model._meta.unique:
+            return super(Database, self).update_query(qset, values)
+
+        fields = qset.model._meta.fields
+        items = {}
+        for name, value in values.items():
+            value = fields[name].python_to_database(value)
+            if fields[name].data_type in CONV:
+                value = CONV[fields[name].data_type](value)
+            items[name] = value
+
+        # the keys are read first, the updated entities may match the query again
+        keys = self._query_keys(qset)
+        for i in range(0, len(keys), BATCH_SIZE):
+            entities = [e for e in datastore.Get(keys[i:i + BATCH_SIZE]) if e]
+            for e in entities:
+                e.update(items)
+            datastore.Put(entities)
+        return len(keys)
+
+    def delete_query(self, qset):
+
+        # the referential integrity is checked per instance
+        if self.check_reference and qset.model._meta.virtual_fields:
+            return super(Database, self).delete_query(qset)
+
+        keys = self._query_keys(qset)
+        for i in range(0, len(keys), BATCH_SIZE):
+            datastore.Delete(keys[i:i + BATCH_SIZE])
+        return len(keys)
+
+    def _query_keys(self, qset):
+        """Return the keys of all the entities matched by the query set, with
+        a keys only query if possible.
+        """
+        keys = self._keys(qset)
+        if keys is not None:
+            return self._valid_keys(qset.model._meta.table, keys)
+        query = self._keys_only_query(qset)
+        if query is not None:
+            return list(query.Run())
+        return [e['_payload'].key() for e in self.fetch(qset, -1, 0)]
+
+    def _keys_only_query(self, qset):
+        """Return a keys only ``datastore.Query`` of the query set, or None
+        if the filters need more than a single datastore query.
+        """
+        query_set = self._build_query_set(qset, [])
+        if len(query_set) == 1 and type(query_set[0]) is Query:
+            return datastore.Query(
+                qset.model._meta.table, dict(query_set[0]), keys_only=True)
+        return None
+
     def count(self, qset):
+        keys = self._keys(qset)
+        if keys is not None:
+            keys = self._valid_keys(qset.model._meta.table, keys)
+            if not keys:
+                return 0
+            return len([e for e in datastore.Get(keys) if e])
+        query = self._keys_only_query(qset)
+        if query is not None:
+            return query.Count(datastore.MAXIMUM_RESULTS)
         return len(list(self.fetch(qset, -1, 0)))
 
+    def exists(self, qset):
+        keys = self._keys(qset)
+        if keys is not None:
+            keys = self._valid_keys(qset.model._meta.table, keys)
+            if not keys:
+                return False
+            return len([e for e in datastore.Get(keys) if e]) > 0
+        query = self._keys_only_query(qset)
+        if query is not None:
+            return len(query.Get(1)) > 0
+        # the limit applies to each of the queries before they are ANDed
+        for item in self.fetch(qset, -1, 0):
+            return True
+        return False
+
     def _keys(self, qset):
         if len(qset.items) == 1:
             q = qset.items[0]
@@ -170,7 +295,21 @@ class Database(IDatabase):
                 if not isinstance(keys, (list, tuple)):
                     return [keys]
                 return keys
-        return []
+        return None
+
+    def _valid_keys(self, kind, keys):
+        """Drop the malformed keys and the keys of other kinds, they can't
+        match any entity of this kind.
+        """
+        result = []
+        for key in keys:
+            try:
+                key = datastore_types.Key(str(key))
+            except (datastore_errors.BadKeyError, datastore_errors.BadArgumentError):
+                continue
+            if key.kind() == kind:
+                result.append(key)
+        return result
 
     def _build_query_set(self, qset, orderings):
 
@@ -192,14 +331,40 @@ class Database(IDatabase):
             else:
                 return Query(kind, {'%s %s' % (name, op): value}, orderings)
 
+        # plain comparisons are ANDed by the datastore in a single query, so
+        # limit and offset apply to the final result. Only the queries the
+        # built-in indexes can serve are merged: the equality filters of all
+        # the properties, or all the filters of a single property.
+        names = []
+        filters = {}
         result = []
         for q in qset:
             if len(q.items) > 1:
                 result.append(
                     MultiQuery([_query(item) for item in q.items], orderings))
+                continue
+            name, op, value = q.items[0]
+            spec = '%s %s' % (name, op)
+            if name != 'key' and op in ('==', '<', '<=', '>', '>=') \
+                    and spec not in filters.get(name, {}):
+                if name not in filters:
+                    names.append(name)
+                    filters[name] = {}
+                filters[name][spec] = value
             else:
                 result.append(_query(q.items[0]))
 
+        equals = {}
+        merged = []
+        for name in names:
+            if [spec for spec in filters[name] if not spec.endswith(' ==')]:
+                merged.append(Query(kind, filters[name], orderings))
+            else:
+                equals.update(filters[name])
+        if equals:
+            merged.insert(0, Query(kind, equals, orderings))
+        result[0:0] = merged
+
         if not result:
             return [Query(kind, {}, orderings)]
 
@@ -337,7 +502,7 @@ def check_unique(model_instance, values):
             q = model_instance.all()
             for field in items:
                 q = q.filter('%s ==' % field.name, values.get(field.name, ''))
-            if q.fetchone():
+            if q.exists():
                 msg = ngettext('column %(name)s is not unique',
                                'columns %(name)s are not unique',
                                len(items),
@@ -353,7 +518,7 @@ def check_integrity(model_instance):
     for field in model_instance._meta.virtual_fields.values():
         if isinstance(field, OneToMany):
             o2m = getattr(model_instance, field.name)
-            if not o2m.all().count():
+            if not o2m.all().exists():
                 continue
             reverse = getattr(field.reference, field.reverse_name)
             if reverse.cascade is None:
@@ -365,10 +530,10 @@ def check_integrity(model_instance):
                     _('Key %(key)r is still referenced from table %(name)r',
                         key=model_instance.key, name=field.reference._meta.table))
         if isinstance(field, ManyToMany):
-            if not field.m2m.all().count():
+            q = field.m2m.all().filter('%s ==' % field.source, model_instance.key)
+            if not q.exists():
                 continue
             if field.cascade:
-                q = field.m2m.all().filter('%s ==' % field.source, model_instance.key)
                 q.delete()
             else:
                 raise IntegrityError(
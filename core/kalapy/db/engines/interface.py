@@ -182,6 +182,72 @@ class IDatabase(object):
         """
         raise NotImplementedError
 
+    def iterate(self, qset, chunk_size):
+        """Iterate over all the records matched by the given query set,
+        reading them from the database `chunk_size` records at a time.
+
+        The default implementation fetches the chunks with :meth:`fetch`,
+        engines should override it to stream the records with a single
+        query if they can.
+
+        :param qset: the query set, an instance of :class:`db.query.QSet`
+        :param chunk_size: number of records to read at a time
+
+        :returns: an interator of dict of name, value mappings
+        :raises:
+            - :class:`db.DatabaseError`
+        """
+        offset = 0
+        while True:
+            result = list(self.fetch(qset, chunk_size, offset))
+            for item in result:
+                yield item
+            if len(result) < chunk_size:
+                break
+            offset += chunk_size
+
+    def update_query(self, qset, values):
+        """Update all the records matched by the given query set with the
+        given values.
+
+        The default implementation loads and saves the records as model
+        instances, engines should override it to update the records in bulk.
+
+        :param qset: the query set, an instance of :class:`db.query.QSet`
+        :param values: mapping of field name to the new value
+
+        :returns: number of records updated
+        :raises:
+            - :class:`db.DatabaseError`
+        """
+        instances = [qset.model._from_database_values(item) \
+                        for item in self.fetch(qset, -1, 0)]
+        for obj in instances:
+            for name, value in values.items():
+                setattr(obj, name, value)
+        if instances:
+            self.update_records(*instances)
+        return len(instances)
+
+    def delete_query(self, qset):
+        """Delete all the records matched by the given query set.
+
+        The default implementation loads the records as model instances and
+        deletes them with :meth:`delete_records`, engines should override it
+        to delete the records in bulk.
+
+        :param qset: the query set, an instance of :class:`db.query.QSet`
+
+        :returns: number of records deleted
+        :raises:
+            - :class:`db.DatabaseError`
+        """
+        instances = [qset.model._from_database_values(item) \
+                        for item in self.fetch(qset, -1, 0)]
+        if instances:
+            self.delete_records(*instances)
+        return len(instances)
+
     def count(self, qset):
         """Returns the total number of records matched by given query set.
 
@@ -193,3 +259,17 @@ class IDatabase(object):
         """
         raise NotImplementedError
 
+    def exists(self, qset):
+        """Check whether any record is matched by the given query set.
+
+        The default implementation fetches a single record, engines should
+        override it if they can check without reading the record.
+
+        :param qset: the query set, an instance of :class:`db.query.QSet`
+
+        :returns: True if any record is matched else False
+        :raises:
+            - :class:`DatabaseError`
+        """
+        return len(list(self.fetch(qset, 1, 0))) > 0
+
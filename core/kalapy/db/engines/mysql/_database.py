@@ -68,6 +68,11 @@ class Database(RelationalDatabase):
         self.connection = dbapi.connect(**args)
         return self
 
+    def stream_cursor(self):
+        # the result of an unbuffered cursor must be read to the end before
+        # the next query on the connection, read it page by page instead
+        return None
+
     def fix_quote(self, sql):
         return sql.replace('"', '`')
 
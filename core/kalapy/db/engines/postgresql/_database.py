@@ -40,6 +40,7 @@ class Database(RelationalDatabase):
     def __init__(self, name, host=None, port=None, user=None, password=None):
         super(Database, self).__init__(name, host, port, user, password)
         self.connection = None
+        self.stream_count = 0
 
     def connect(self):
         if self.connection is not None:
@@ -59,6 +60,14 @@ class Database(RelationalDatabase):
         self.connection.set_isolation_level(1) # make transaction transparent to all cursors
         return self
 
+    def stream_cursor(self):
+        # a named cursor keeps the result on the server, the name must be
+        # unique while the cursor is open
+        if not self.connection:
+            self.connect()
+        self.stream_count += 1
+        return self.connection.cursor('kalapy_stream_%d' % self.stream_count)
+
     def exists_table(self, model):
         cursor = self.cursor()
         cursor.execute("""
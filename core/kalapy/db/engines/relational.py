@@ -9,10 +9,9 @@ for relational database systems. Engines for an RDBMS should inherit from the
 :copyright: (c) 2010 Amit Mendapara.
 :license: BSD, see LICENSE for more details.
 """
-import re
-
 from kalapy.db.engines.interface import IDatabase
 from kalapy.db.model import Model
+from kalapy.db.query import Q
 from kalapy.db.reference import ManyToOne
 
 
@@ -25,9 +24,15 @@ class RelationalDatabase(IDatabase):
 
     schema_mime = 'text/x-sql'
 
+    #: maximum number of query plans kept by :meth:`compile`
+    plan_cache_size = 500
+
     def __init__(self, name, host=None, port=None, user=None, password=None):
         super(RelationalDatabase, self).__init__(name, host, port, user, password)
         self.connection = None
+        self.plan_cache = {}
+        self.plan_hits = 0
+        self.plan_misses = 0
 
     def get_data_type(self, field):
         """Get the internal datatype for the given field supported by the
@@ -189,19 +194,132 @@ class RelationalDatabase(IDatabase):
     def query_builder(self, qset):
         return QueryBuilder(qset)
 
+    def compile(self, qset, statement, *args):
+        """Compile the given :class:`QueryBuilder` statement of the query set
+        to a query plan, a tuple `(sql, extract)` where `extract` is a function
+        returning the params of the query from a query set.
+
+        The plans are cached by the model, the shape of the filters and the
+        order of the query set, so the SQL of a repeated query is built once.
+        The cache statistics are available with :meth:`plan_stats`.
+
+        :param qset: the query set, an instance of :class:`db.query.QSet`
+        :param statement: name of the :class:`QueryBuilder` method
+        :param args: arguments to the :class:`QueryBuilder` method
+
+        :returns: a tuple `(sql, extract)`
+        """
+        # keep the filters grouped by Q, each group is an OR of its items
+        shape = tuple([tuple([
+            (name, op, len(value) if isinstance(value, (list, tuple)) else None)
+            for name, op, value in q.items]) for q in qset])
+        key = (qset.model, statement, args, qset.order, shape)
+        try:
+            plan = self.plan_cache[key]
+            self.plan_hits += 1
+            return plan
+        except KeyError:
+            pass
+        self.plan_misses += 1
+        builder = self.query_builder(qset)
+        sql, params = getattr(builder, statement)(*args)
+        plan = (self.fix_quote(sql), builder.extractor())
+        # the filter shapes of 'in' queries are unbounded, start over if full
+        if len(self.plan_cache) >= self.plan_cache_size:
+            self.plan_cache.clear()
+        self.plan_cache[key] = plan
+        return plan
+
+    def plan_stats(self):
+        """Return the statistics of the query plan cache as a dict with
+        `hits`, `misses` and `size` items.
+        """
+        return {
+            'hits': self.plan_hits,
+            'misses': self.plan_misses,
+            'size': len(self.plan_cache),
+        }
+
     def fetch(self, qset, limit, offset):
         cursor = self.cursor()
-        sql, params = self.query_builder(qset).select('*', limit, offset)
-        cursor.execute(self.fix_quote(sql), params)
+        # only the presence of limit and offset is a part of the plan
+        sql, extract = self.compile(qset, 'select', '*', min(limit, 0), min(offset, 0))
+        params = extract(qset)
+        if limit > -1:
+            params.append(limit)
+            if offset > -1:
+                params.append(offset)
+        cursor.execute(sql, params)
         names = [desc[0] for desc in cursor.description]
         for row in cursor.fetchall():
             yield dict([(name, row[i]) for i, name in enumerate(names)])
 
+    def stream_cursor(self):
+        """Return a cursor reading the result of a query from the server as
+        the rows are fetched, used by :meth:`iterate`. Engines should override
+        it if the default cursor loads the whole result into memory, or return
+        None if the engine can't stream a result.
+        """
+        return self.cursor()
+
+    def iterate(self, qset, chunk_size):
+        cursor = self.stream_cursor()
+        if cursor is None:
+            for item in self.iterate_pages(qset, chunk_size):
+                yield item
+            return
+        # a single query, the rows are read from the cursor chunk by chunk
+        sql, extract = self.compile(qset, 'select', '*')
+        cursor.execute(sql, extract(qset))
+        names = None
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            # a server side cursor describes the result after the first fetch
+            if names is None:
+                names = [desc[0] for desc in cursor.description]
+            for row in rows:
+                yield dict([(name, row[i]) for i, name in enumerate(names)])
+
+    def iterate_pages(self, qset, chunk_size):
+        """Iterate over the records matched by the given query set with a
+        separate query for each chunk. The pages of a query without order
+        are selected by the primary key, so a page doesn't scan the rows of
+        the previous pages.
+        """
+        if qset.order is not None:
+            for item in super(RelationalDatabase, self).iterate(qset, chunk_size):
+                yield item
+            return
+        page = qset.ordered(('key', 'ASC'))
+        while True:
+            result = list(self.fetch(page, chunk_size, -1))
+            for item in result:
+                yield item
+            if len(result) < chunk_size:
+                break
+            page = qset.filter(Q('key >', result[-1]['key'])).ordered(('key', 'ASC'))
+
+    def update_query(self, qset, values):
+        fields = qset.model._meta.fields
+        names = values.keys()
+        vals = [fields[name].python_to_database(values[name]) for name in names]
+        sql, extract = self.compile(qset, 'update', tuple(names))
+        cursor = self.cursor()
+        cursor.execute(sql, vals + extract(qset))
+        return cursor.rowcount
+
+    def delete_query(self, qset):
+        sql, extract = self.compile(qset, 'delete')
+        cursor = self.cursor()
+        cursor.execute(sql, extract(qset))
+        return cursor.rowcount
+
     def count(self, qset):
         cursor = self.cursor()
-        sql, params = self.query_builder(qset).select('count("key")')
-        sql = re.sub(' ORDER BY "\w+" (ASC|DESC)', '', sql)
-        cursor.execute(self.fix_quote(sql), params)
+        sql, extract = self.compile(qset, 'count')
+        cursor.execute(sql, extract(qset))
         try:
             return cursor.fetchone()[0]
         except:
@@ -229,6 +347,7 @@ class QueryBuilder(object):
         self.model = qset.model
         self.order = None
         self.all = []
+        self.converters = []
 
         try:
             self.order = "ORDER BY \"%s\" %s" % tuple(qset.order)
@@ -256,14 +375,44 @@ class QueryBuilder(object):
         """Build the select query.
         """
         query = "SELECT %s FROM \"%s\"" % (what, self.model._meta.table)
-        if self.all:
-            query = "%s WHERE %s" % (query, " AND ".join(["(%s)" % s for s, b in self.all]))
+        query, params = self.where(query)
         if self.order:
             query = "%s %s" % (query, self.order)
         if limit > -1:
-            query = "%s LIMIT %d" % (query, limit)
+            query = "%s LIMIT %%s" % query
+            params.append(limit)
             if offset > -1:
-                query = "%s OFFSET %d" % (query, offset)
+                query = "%s OFFSET %%s" % query
+                params.append(offset)
+
+        return query, params
+
+    def count(self):
+        """Build the count query, the order is not needed to count.
+        """
+        query = "SELECT count(\"key\") FROM \"%s\"" % self.model._meta.table
+        return self.where(query)
+
+    def update(self, names):
+        """Build the update query setting the given fields.
+        """
+        query = "UPDATE \"%s\" SET %s" % (self.model._meta.table,
+                    ", ".join(['"%s" = %%s' % name for name in names]))
+        return self.where(query)
+
+    def delete(self):
+        """Build the delete query.
+        """
+        query = "DELETE FROM \"%s\"" % self.model._meta.table
+        return self.where(query)
+
+    def where(self, query):
+        """Append the WHERE clause to the given query.
+
+        :returns: a tuple `(query, params)`
+        """
+        if self.all:
+            query = "%s WHERE %s" % (query, " AND ".join(["(%s)" % s for s, b in self.all]))
 
         params = []
         for q, v in self.all:
@@ -274,6 +423,28 @@ class QueryBuilder(object):
 
         return query, params
 
+    def extractor(self):
+        """Return a function extracting the params of the WHERE clause from
+        a query set with the same filter shape as the query set of this
+        builder, see :meth:`RelationalDatabase.compile`.
+        """
+        converters = self.converters
+
+        def extract(qset):
+            params = []
+            i = 0
+            for q in qset:
+                for name, op, value in q.items:
+                    validator, field = converters[i]
+                    value = validator(field, value)
+                    if isinstance(value, (list, tuple)):
+                        params.extend(value)
+                    else:
+                        params.append(value)
+                    i += 1
+            return params
+        return extract
+
     def parse(self, name, operator, value):
         """Parse the simple query statement.
 
@@ -292,6 +463,7 @@ class QueryBuilder(object):
         handler = getattr(self, 'handle_%s' % op)
         validator = getattr(self, 'validate_%s' % op, self.validate)
         value = validator(field, value)
+        self.converters.append((validator, field))
 
         return handler(name, value), value
 
@@ -15,6 +15,9 @@ from copy import deepcopy
 
 __all__ = ('Query', 'Q')
 
+#: number of records read at a time when iterating over a query
+CHUNK_SIZE = 100
+
 _FILTER_REGEX = re.compile(
     '^\s*([\w]+)\s+(>|<|>=|<=|==|!=|=|in|not in)\s*$', re.I)
 
@@ -34,9 +37,25 @@ class Q(object):
             raise Exception(
                 _('Malformed filter string: %(filter)s', filter=query))
         self.items = [(name, op, value)]
+        self.__validated = {}
+
+    @classmethod
+    def _from_items(cls, items):
+        q = cls.__new__(cls)
+        q.items = items
+        q.__validated = {}
+        return q
 
     def validate(self, model):
-        for i, (name, operator, value) in enumerate(self.items):
+        """Return a new :class:`Q` with the values converted to the database
+        values of the fields of the given model. The result is cached, so the
+        values are validated only once per model.
+        """
+        if model in self.__validated:
+            return self.__validated[model]
+
+        items = []
+        for name, operator, value in self.items:
             if name not in model._meta.fields:
                 raise AttributeError(
                     _('No such field %(name)r in model %(model)r',
@@ -48,19 +67,16 @@ class Q(object):
                 value = [field.python_to_database(v) for v in value]
             else:
                 value = field.python_to_database(value)
-            self.items[i] = (name, operator, value)
-        return self
+            items.append((name, operator, value))
 
-    def __deepcopy__(self, meta):
-        n, o, v = self.items[0]
-        q = Q('%s %s' % (n, o), None)
-        q.items = deepcopy(self.items, meta)
+        q = self.__validated[model] = Q._from_items(items)
         return q
 
+    def __deepcopy__(self, meta):
+        return Q._from_items(deepcopy(self.items, meta))
+
     def __or__(self, other):
-        q = deepcopy(self)
-        q.items.extend(other.items)
-        return q
+        return Q._from_items(self.items + other.items)
 
     def __repr__(self):
         if len(self.items) == 1:
@@ -69,19 +85,46 @@ class Q(object):
 
 
 class QSet(object):
-    """A container of all the :class:`db.Q` instances of a :class:`db.Query`.
+    """An immutable container of all the :class:`db.Q` instances of a
+    :class:`db.Query`.
+
+    Every filter creates a new node pointing to the node it was created from,
+    so all the queries derived from a query share its filters instead of
+    copying them.
 
     It implements :meth:`fetch` and :meth:`count` which in turns calls database
     engine specific version of ``database.fetch`` and ``database.count`` methods.
     """
 
-    def __init__(self, model):
+    def __init__(self, model, parent=None, q=None, order=None):
         self.model = model
-        self.items = []
-        self.order = None
+        self.parent = parent
+        self.q = q
+        self.order = order
+        self.__items = None
+
+    def filter(self, q):
+        """Return a new node with the given :class:`db.Q` ANDed with the
+        filters of this node.
+        """
+        return QSet(self.model, self, q.validate(self.model), self.order)
 
-    def append(self, q):
-        self.items.append(q.validate(self.model))
+    def ordered(self, order):
+        """Return a new node with the filters of this node and the given
+        order.
+        """
+        return QSet(self.model, self.parent, self.q, order)
+
+    @property
+    def items(self):
+        if self.__items is None:
+            items = ()
+            if self.parent is not None:
+                items = self.parent.items
+            if self.q is not None:
+                items = items + (self.q,)
+            self.__items = items
+        return self.__items
 
     def fetch(self, limit, offset):
         from kalapy.db.engines import database
@@ -91,11 +134,24 @@ class QSet(object):
         from kalapy.db.engines import database
         return database.count(self)
 
+    def exists(self):
+        from kalapy.db.engines import database
+        return database.exists(self)
+
+    def iterate(self, chunk_size):
+        from kalapy.db.engines import database
+        return database.iterate(self, chunk_size)
+
+    def update(self, values):
+        from kalapy.db.engines import database
+        return database.update_query(self, values)
+
+    def delete(self):
+        from kalapy.db.engines import database
+        return database.delete_query(self)
+
     def __deepcopy__(self, meta):
-        qs = QSet(self.model)
-        qs.order = self.order
-        qs.items = deepcopy(self.items, meta)
-        return qs
+        return self
 
     def __iter__(self):
         return iter(self.items)
@@ -174,8 +230,8 @@ class Query(object):
             q = Q(*args)
         else:
             q = args[0]
-        query = deepcopy(self)
-        query.__qset.append(q)
+        query = Query(self.__model, self.__mapper)
+        query.__qset = self.__qset.filter(q)
         return query
 
     def order(self, spec):
@@ -187,9 +243,10 @@ class Query(object):
         :param spec: field name, if prefixed with `-` order by DESC else ASC
         """
         assert isinstance(spec, basestring)
-        self.__qset.order = (spec, 'ASC')
+        order = (spec, 'ASC')
         if spec.startswith('-'):
-            self.__qset.order = (spec[1:], 'DESC')
+            order = (spec[1:], 'DESC')
+        self.__qset = self.__qset.ordered(order)
         return self
 
     def fetch(self, limit, offset=0):
@@ -215,6 +272,24 @@ class Query(object):
             return map(self.__mapper, result)
         return result
 
+    def iterate(self, chunk_size=CHUNK_SIZE):
+        """Iterate over all the records of the query object, they are read
+        from the database `chunk_size` records at a time.
+
+        >>> for user in Query(User).filter('age >=', 20).iterate(500):
+        >>>     print user.name
+
+        :param chunk_size: number of records to read at a time
+
+        :returns: an iterator of model instances or content if mapper is applied
+        :raises: :class:`DatabaseError`
+        """
+        for item in self.__qset.iterate(chunk_size):
+            obj = self.__model._from_database_values(item)
+            if self.__mapper:
+                obj = self.__mapper(obj)
+            yield obj
+
     def fetchone(self, offset=0):
         """Fetch a single record from the query object with given offset.
 
@@ -238,6 +313,12 @@ class Query(object):
         """
         return self.__qset.count()
 
+    def exists(self):
+        """Check whether the query object matches any record. It is cheaper
+        than :meth:`count` as the database can stop at the first match.
+        """
+        return self.__qset.exists()
+
     def delete(self):
         """Delete all records matched by this query.
 
@@ -246,9 +327,12 @@ class Query(object):
         >>> Query(User).filter('name =', 'some%').delete()
 
         will delete all the User records by matching name starting with 'some'.
+
+        The records are deleted in bulk by the database engine.
+
+        :returns: number of records deleted
         """
-        for obj in self.fetch(-1):
-            obj.delete()
+        return self.__qset.delete()
 
     def update(self, **kw):
         """Update all the matched records with the given keywords mapping to
@@ -261,13 +345,22 @@ class Query(object):
         will update all the User records by matching name starting with 'some'
         by updating `lang` to `en_EN`.
 
+        The records are updated in bulk by the database engine.
+
         :keyword kw: keyword args mapping to the field properties
+        :returns: number of records updated
         """
-        for obj in self.fetch(-1):
-            for k, v in kw.items():
-                if k in obj._meta.fields:
-                    setattr(obj, k, v)
-            obj.save()
+        fields = self.__model._meta.fields
+        values = {}
+        for k, v in kw.items():
+            if k == 'key':
+                raise AttributeError(
+                    _('%(name)r is a read-only primary key field.', name=k))
+            if k in fields:
+                values[k] = fields[k]._validate(None, v)
+        if not values:
+            return 0
+        return self.__qset.update(values)
 
     def __getitem__(self, arg):
         if isinstance(arg, (int, long)):
@@ -281,17 +374,11 @@ class Query(object):
                 _('Only integer indices are supported.'))
 
     def __iter__(self):
-        offset = -1
-        try:
-            while True:
-                offset += 1
-                yield self.fetch(1, offset)[0]
-        except Exception:
-            pass
+        return self.iterate()
 
     def __deepcopy__(self, meta):
         q = Query(self.__model, self.__mapper)
-        q.__qset = deepcopy(self.__qset, meta)
+        q.__qset = self.__qset
         return q
 
     def __repr__(self):
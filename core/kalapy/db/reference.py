@@ -133,7 +133,18 @@ class ManyToOne(IRelation):
         self.reference.add_field(f)
 
     def __get__(self, model_instance, model_class):
-        return super(ManyToOne, self).__get__(model_instance, model_class)
+        value = super(ManyToOne, self).__get__(model_instance, model_class)
+        if model_instance is None or value is None or isinstance(value, self.reference):
+            return value
+        # the referenced instance is fetched on first access only
+        value = self.reference.get(value)
+        model_instance._values[self.name] = value
+        return value
+
+    def get_key(self, model_instance):
+        """Return the key of the referenced instance without fetching it.
+        """
+        return self.python_to_database(model_instance._values.get(self.name))
 
     def __set__(self, model_instance, value):
         if value is not None and not isinstance(value, self.reference):
@@ -148,10 +159,7 @@ class ManyToOne(IRelation):
         return value
 
     def database_to_python(self, value):
-        if value is None:
-            return value
-        if not isinstance(value, self.reference):
-            return self.reference.get(value)
+        # keep the key, see __get__
         return value
 
 
@@ -0,0 +1,149 @@
+#coding=utf-8
+from bisect import bisect_left
+
+def ngrams(string, size):
+    """
+    Return the set of the character n-grams of the string, from 1 up to
+    size characters long. Chinese has no spaces to split words on, so the
+    text is cut into characters instead.
+    """
+    result = set()
+    for n in range(1, size + 1):
+        for i in range(len(string) - n + 1):
+            result.add(string[i:i + n])
+    return result
+
+class KeyWordMatcher():
+    """
+    Prebuilt matcher over the decoded keyword rules, see KeyWord.getDecoded.
+
+    All the keywords of every rule are compiled into one Aho-Corasick
+    automaton, so a text is scanned only once no matter how many rules
+    there are. A rule matches when its keywords are found in order, the
+    same way Plurk.keyWordFilter used to do with str.find.
+    """
+
+    def __init__(self, keywords):
+        self.rules = []
+        self.ruleSizes = []
+        self.keyWordRules = {}
+        self.alwaysRules = []
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for (index, rule) in enumerate(keywords):
+            self.rules.append(rule)
+            distinct = []
+            for keyWord in rule['keyWordList']:
+                if keyWord and keyWord not in distinct:
+                    distinct.append(keyWord)
+            self.ruleSizes.append(len(distinct))
+            if len(distinct) == 0:
+                self.alwaysRules.append(index)
+            for keyWord in distinct:
+                if not self.keyWordRules.has_key(keyWord):
+                    self.keyWordRules[keyWord] = []
+                    self._addKeyWord(keyWord)
+                self.keyWordRules[keyWord].append(index)
+        self._buildFailure()
+
+    def _addKeyWord(self, keyWord):
+        state = 0
+        for char in keyWord:
+            nextState = self.goto[state].get(char)
+            if nextState is None:
+                nextState = len(self.goto)
+                self.goto[state][char] = nextState
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+            state = nextState
+        self.output[state] = self.output[state] + (keyWord,)
+
+    def _buildFailure(self):
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for (char, nextState) in self.goto[state].items():
+                queue.append(nextState)
+                fallback = self.fail[state]
+                while fallback and not self.goto[fallback].has_key(char):
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[nextState] = target
+                self.output[nextState] = self.output[nextState] + self.output[target]
+
+    def search(self, string):
+        """
+        Scan the string once and return {keyword: [start positions]}, the
+        positions of each keyword are in ascending order.
+        """
+        hits = {}
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        state = 0
+        for (position, char) in enumerate(string):
+            while state and not goto[state].has_key(char):
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyWord in output[state]:
+                start = position - len(keyWord) + 1
+                if hits.has_key(keyWord):
+                    hits[keyWord].append(start)
+                else:
+                    hits[keyWord] = [start]
+        return hits
+
+    def match(self, string):
+        """
+        Return the matched rules as [{'totalFound':n, 'answerList':[]}] in
+        the order of the rules, or None if nothing matched.
+        """
+        hits = self.search(string)
+
+        found = {}
+        for keyWord in hits:
+            for index in self.keyWordRules[keyWord]:
+                found[index] = found.get(index, 0) + 1
+
+        candidates = list(self.alwaysRules)
+        for (index, total) in found.items():
+            if total == self.ruleSizes[index]:
+                candidates.append(index)
+        candidates.sort()
+
+        answerList = []
+        for index in candidates:
+            rule = self.rules[index]
+            totalFound = self._countFound(rule['keyWordList'], hits)
+            if totalFound is not None:
+                answer = {'totalFound': totalFound, 'answerList': rule['answerList']}
+                answerList.append(answer)
+        if (len(answerList) > 0) is True:
+            return answerList
+        else:
+            return None
+
+    def _countFound(self, keyWordList, hits):
+        """
+        Same as the str.find loop: each keyword is searched from the
+        position where the previous one was found.
+        """
+        totalFound = 0
+        start = 0
+        for keyWord in keyWordList:
+            if not keyWord:
+                index = start
+            else:
+                positions = hits[keyWord]
+                i = bisect_left(positions, start)
+                if i == len(positions):
+                    return None
+                index = positions[i]
+            totalFound += 1
+            start = index
+        return totalFound
@@ -0,0 +1,84 @@
+import time
+import threading
+
+class LRUCache():
+    """
+    In-process cache of at most maxSize entries, each living ttl seconds.
+
+    The entries are kept in a doubly linked list from the least to the most
+    recently used one, so get, set and the eviction are all O(1).
+    """
+
+    def __init__(self, maxSize=128, ttl=60*60):
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.entries = {}
+        #[prev, next, key, value, expires], the root is the list head
+        self.root = []
+        self.root[:] = [self.root, self.root, None, None, None]
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        self._lock.acquire()
+        try:
+            link = self.entries.get(key)
+            if link is None:
+                return default
+            if link[4] < time.time():
+                self._unlink(link)
+                del self.entries[key]
+                return default
+            self._unlink(link)
+            self._append(link)
+            return link[3]
+        finally:
+            self._lock.release()
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+        self._lock.acquire()
+        try:
+            link = self.entries.get(key)
+            if link is not None:
+                self._unlink(link)
+            elif len(self.entries) >= self.maxSize:
+                oldest = self.root[1]
+                self._unlink(oldest)
+                del self.entries[oldest[2]]
+            link = [None, None, key, value, time.time() + ttl]
+            self._append(link)
+            self.entries[key] = link
+        finally:
+            self._lock.release()
+
+    def delete(self, key):
+        self._lock.acquire()
+        try:
+            link = self.entries.pop(key, None)
+            if link is not None:
+                self._unlink(link)
+        finally:
+            self._lock.release()
+
+    def clear(self):
+        self._lock.acquire()
+        try:
+            self.entries.clear()
+            self.root[:] = [self.root, self.root, None, None, None]
+        finally:
+            self._lock.release()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _unlink(self, link):
+        link[0][1] = link[1]
+        link[1][0] = link[0]
+
+    def _append(self, link):
+        last = self.root[0]
+        link[0] = last
+        link[1] = self.root
+        last[1] = link
+        self.root[0] = link
@@ -0,0 +1,115 @@
+import time
+import random
+import threading
+
+class RetryError(Exception):
+    
+    def __init__(self, value, error=None):
+        self.value = value
+        self.error = error
+        
+    def __str__(self):
+        return repr(self.value)
+
+class CircuitOpenError(RetryError):
+    pass
+
+class CircuitBreaker():
+    """
+    Stops calling a service that keeps failing.
+    
+    After failureThreshold failed calls in a row the circuit opens and
+    every call fails at once for resetTimeout seconds. Then one call is let
+    through: if it succeeds the circuit closes again, otherwise it opens
+    for another resetTimeout seconds.
+    """
+    
+    def __init__(self, failureThreshold=5, resetTimeout=60):
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+        self.failures = 0
+        self.openedAt = None
+        self._lock = threading.Lock()
+    
+    def allow(self):
+        self._lock.acquire()
+        try:
+            if self.openedAt is None:
+                return True
+            if time.time() - self.openedAt >= self.resetTimeout:
+                # half open, let this call try the service
+                self.openedAt = time.time()
+                return True
+            return False
+        finally:
+            self._lock.release()
+    
+    def recordSuccess(self):
+        self._lock.acquire()
+        try:
+            self.failures = 0
+            self.openedAt = None
+        finally:
+            self._lock.release()
+    
+    def recordFailure(self):
+        self._lock.acquire()
+        try:
+            self.failures += 1
+            if self.failures >= self.failureThreshold:
+                self.openedAt = time.time()
+        finally:
+            self._lock.release()
+
+class RetryPolicy():
+    """
+    Calls a function again when it raises one of the retryOn exceptions.
+    
+    The n-th retry waits backoff * 2 ** (n - 1) seconds, at most maxBackoff,
+    plus a random jitter of up to that much times jitter. It gives up after
+    maxAttempts calls or when the next try would end after deadline seconds
+    from the first call, and raises RetryError with the last error. The
+    giveUpOn exceptions count as failures but are not retried, RetryError
+    is raised at once. Calls are refused with CircuitOpenError while the
+    breaker is open.
+    """
+    
+    def __init__(self, maxAttempts=4, backoff=0.5, maxBackoff=8, jitter=0.5,
+                 deadline=20, retryOn=(Exception,), giveUpOn=(), breaker=None):
+        self.maxAttempts = maxAttempts
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retryOn = retryOn
+        self.giveUpOn = giveUpOn
+        self.breaker = breaker
+    
+    def getDelay(self, attempt):
+        delay = min(self.maxBackoff, self.backoff * (2 ** (attempt - 1)))
+        return delay + random.uniform(0, delay * self.jitter)
+    
+    def call(self, func, *args, **kw):
+        start = time.time()
+        attempt = 0
+        while True:
+            if self.breaker is not None and not self.breaker.allow():
+                raise CircuitOpenError('Circuit is open, call refused')
+            attempt += 1
+            try:
+                result = func(*args, **kw)
+            except self.retryOn, error:
+                if self.breaker is not None:
+                    self.breaker.recordFailure()
+                if isinstance(error, self.giveUpOn):
+                    raise RetryError('Gave up on %s' % error.__class__.__name__, error)
+                if attempt >= self.maxAttempts:
+                    raise RetryError('Gave up after %d attempts' % attempt, error)
+                delay = self.getDelay(attempt)
+                if time.time() - start + delay > self.deadline:
+                    raise RetryError('Deadline of %s seconds exceeded' % self.deadline, error)
+                time.sleep(delay)
+            else:
+                if self.breaker is not None:
+                    self.breaker.recordSuccess()
+                return result
@@ -1,95 +1,157 @@
-from xml.dom import minidom
-import simplejson as json
-import urllib, urllib2
-import random
-import math
-
-class WebServices():
-    
-        def youtubeQuery(self,keyword,max=3):
-        
-            params={
-                'q':keyword,
-                'max-results':max,
-                'v':2,
-            }
-            post=urllib.urlencode(params)
-            request = urllib2.Request(url = 'http://gdata.youtube.com/feeds/api/videos?'+post)
-            try:
-                response = urllib2.urlopen(request)
-            except urllib2.HTTPError:
-                response = self.youtubeQuery(keyword)
-                return response
-            videos=[]
-            dom=minidom.parseString(response.read().decode("utf-8"))
-            tags=dom.getElementsByTagName('yt:videoid')
-            for vid in tags:
-                videos.append('http://www.youtube.com/watch?v='+vid.childNodes[0].data)
-                
-            return videos
-    
-        def flickrQuery(self,params):
-
-            defaultParams={
-                'format':'json',
-                'nojsoncallback':1,
-                'api_key': '02da438efb7efd986d899fb66076532e'
-            }
-            params.update(defaultParams)
-            post=urllib.urlencode(params)
-            request = urllib2.Request(url = 'http://api.flickr.com/services/rest/?'+post)
-            try:
-                response = urllib2.urlopen(request)
-            except urllib2.HTTPError:
-                response = self.flickrQuery(params)
-                return response
-            return json.loads(response.read().decode("utf-8"))
-            
-        def flickrPhotoQuery(self,keywords,max=3,perPage=300):
-            params={
-                'method': 'flickr.photos.search',
-                'tags':keywords.replace(' ',','),
-                'per_page':1,
-            }
-            detail=self.flickrQuery(params)
-            total=int(detail['photos']['total'])
-            totalPages=math.ceil(total/perPage)
-            if perPage<total:
-                total=perPage
-            if totalPages>=2:
-                page=random.randrange(1,totalPages)
-            else:
-                page=1
-            updatedParams={
-                'per_page':perPage,
-                'page':page
-            }
-            params.update(updatedParams)
-            photosArr=self.flickrQuery(params)
-        
-            photos=[]
-            for i in range(max):
-                randNum=random.randrange(1,total)
-                secret=photosArr['photos']['photo'][randNum]['secret']
-                id=photosArr['photos']['photo'][randNum]['id']
-                farmID=photosArr['photos']['photo'][randNum]['farm']
-                serverID=photosArr['photos']['photo'][randNum]['server']
-                photos.append('http://farm'+str(farmID)+'.static.flickr.com/'+str(serverID)+'/'+str(id)+'_'+str(secret)+'_z.jpg')
-    
-            return photos
-        
-        def googleUrlShortener(self,url):
-            jData=json.dumps({"longUrl": url})
-            request=urllib2.Request('https://www.googleapis.com/urlshortener/v1/url',jData, {'content-type': 'application/json'})
-            
-            try:
-                response=urllib2.urlopen(request)
-            except urllib2.HTTPError,message:
-                if message.code==400:
-                    successed=True
-                    result=json.loads(message.read().decode("utf-8"))
-                    raise ValueError(str(url))
-            result=json.loads(response.read().decode("utf-8"))
-            return result['id']
-            
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError:
+    from xml.etree import ElementTree
+import simplejson as json
+import urllib, urllib2
+import random
+import math
+import hashlib
+from retry import RetryPolicy, CircuitBreaker
+from lrucache import LRUCache
+
+#one policy for all the web services, a dead service is not called again and again
+retryPolicy=RetryPolicy(maxAttempts=3,backoff=0.5,maxBackoff=4,deadline=10,retryOn=(urllib2.URLError,),breaker=CircuitBreaker())
+
+YOUTUBE_VIDEO_ID_TAG='{http://gdata.youtube.com/schemas/2007}videoid'
+ATOM_ENTRY_TAG='{http://www.w3.org/2005/Atom}entry'
+
+#results of the same query are reused for an hour
+RESULT_TTL=60*60
+resultCache=LRUCache(maxSize=256,ttl=RESULT_TTL)
+
+class WebServices():
+    
+        def __init__(self,cache=None):
+            """ cache: optional werkzeug cache shared by the instances, e.g. memcache """
+            self.cache=cache
+        
+        def normalizeQuery(self,keyword):
+            if isinstance(keyword,unicode):
+                keyword=keyword.encode('utf-8')
+            return ' '.join(keyword.lower().split())
+        
+        def getCachedResult(self,key):
+            result=resultCache.get(key)
+            if result is None and self.cache is not None:
+                result=self.cache.get(self.getCacheKey(key))
+                if result is not None:
+                    resultCache.set(key,result)
+            return result
+        
+        def setCachedResult(self,key,result):
+            resultCache.set(key,result)
+            if self.cache is not None:
+                self.cache.set(self.getCacheKey(key),result,timeout=RESULT_TTL)
+        
+        def getCacheKey(self,key):
+            #memcache keys can not have spaces or be too long
+            return 'WebServices:'+hashlib.md5(key).hexdigest()
+        
+        def youtubeQuery(self,keyword,max=3):
+            
+            key='youtube:%d:%s' % (max,self.normalizeQuery(keyword))
+            videos=self.getCachedResult(key)
+            if videos is not None:
+                return list(videos)
+            
+            params={
+                'q':keyword,
+                'max-results':max,
+                'v':2,
+            }
+            post=urllib.urlencode(params)
+            request = urllib2.Request(url = 'http://gdata.youtube.com/feeds/api/videos?'+post)
+            response = retryPolicy.call(urllib2.urlopen,request)
+            videos=[]
+            for videoID in self.youtubeVideoIDs(response,max):
+                videos.append('http://www.youtube.com/watch?v='+videoID)
+            
+            self.setCachedResult(key,videos)
+            return list(videos)
+    
+        def youtubeVideoIDs(self,stream,max=3):
+            """ Parse the feed stream incrementally, stop reading after max video ids """
+            videoIDs=[]
+            try:
+                for event,element in ElementTree.iterparse(stream):
+                    if element.tag==YOUTUBE_VIDEO_ID_TAG:
+                        videoIDs.append(element.text)
+                        if (len(videoIDs)>=max) is True:
+                            break
+                    elif element.tag==ATOM_ENTRY_TAG:
+                        #an entry is done, its elements are not needed anymore
+                        element.clear()
+            finally:
+                stream.close()
+            return videoIDs
+        
+        def flickrQuery(self,params):
+
+            defaultParams={
+                'format':'json',
+                'nojsoncallback':1,
+                'api_key': '02da438efb7efd986d899fb66076532e'
+            }
+            params.update(defaultParams)
+            post=urllib.urlencode(params)
+            request = urllib2.Request(url = 'http://api.flickr.com/services/rest/?'+post)
+            response = retryPolicy.call(urllib2.urlopen,request)
+            return json.loads(response.read().decode("utf-8"))
+            
+        def flickrPhotoQuery(self,keywords,max=3,perPage=300):
+            
+            key='flickr:%d:%s' % (perPage,self.normalizeQuery(keywords))
+            photoPage=self.getCachedResult(key)
+            if photoPage is None:
+                photoPage=self.flickrPhotoPage(keywords,perPage)
+                self.setCachedResult(key,photoPage)
+            
+            #new random picks of the cached page need no request
+            photos=[]
+            if (len(photoPage)>0) is True:
+                for i in range(max):
+                    photos.append(random.choice(photoPage))
+            return photos
+        
+        def flickrPhotoPage(self,keywords,perPage=300):
+            """ Return the photo urls of a random result page of the keywords """
+            params={
+                'method': 'flickr.photos.search',
+                'tags':keywords.replace(' ',','),
+                'per_page':1,
+            }
+            detail=self.flickrQuery(params)
+            total=int(detail['photos']['total'])
+            totalPages=int(math.ceil(float(total)/perPage))
+            if totalPages>=2:
+                page=random.randrange(1,totalPages)
+            else:
+                page=1
+            updatedParams={
+                'per_page':perPage,
+                'page':page
+            }
+            params.update(updatedParams)
+            photosArr=self.flickrQuery(params)
+            
+            photoPage=[]
+            for photo in photosArr['photos']['photo']:
+                photoPage.append('http://farm'+str(photo['farm'])+'.static.flickr.com/'+str(photo['server'])+'/'+str(photo['id'])+'_'+str(photo['secret'])+'_z.jpg')
+            return photoPage
+        
+        def googleUrlShortener(self,url):
+            jData=json.dumps({"longUrl": url})
+            request=urllib2.Request('https://www.googleapis.com/urlshortener/v1/url',jData, {'content-type': 'application/json'})
+            
+            try:
+                response=urllib2.urlopen(request)
+            except urllib2.HTTPError,message:
+                if message.code==400:
+                    successed=True
+                    result=json.loads(message.read().decode("utf-8"))
+                    raise ValueError(str(url))
+            result=json.loads(response.read().decode("utf-8"))
+            return result['id']
+            
             
\ No newline at end of file
@@ -0,0 +1,57 @@
+import thread
+import threading
+import Queue
+
+#set to False when a thread can't be started, the python 2.5 runtime of
+#App Engine doesn't allow threads, only the python27 runtime does
+threadsAvailable = True
+
+def runConcurrently(func, items, concurrency=1):
+    """
+    Call func with every item, using at most concurrency threads.
+    
+    Results are returned in the order of items. With a concurrency of 1
+    the items are handled one by one in the calling thread. Otherwise the
+    first exception raised by func is raised again after all the workers
+    are done. If no thread can be started the items are handled one by
+    one as with a concurrency of 1.
+    """
+    global threadsAvailable
+    items = list(items)
+    if concurrency <= 1 or len(items) <= 1 or not threadsAvailable:
+        return [func(item) for item in items]
+    
+    results = [None] * len(items)
+    errors = []
+    queue = Queue.Queue()
+    for index in range(len(items)):
+        queue.put(index)
+    
+    def worker():
+        while True:
+            try:
+                index = queue.get_nowait()
+            except Queue.Empty:
+                return
+            try:
+                results[index] = func(items[index])
+            except Exception, error:
+                errors.append(error)
+    
+    workers = []
+    for i in range(min(concurrency, len(items))):
+        workerThread = threading.Thread(target=worker)
+        try:
+            workerThread.start()
+        except (thread.error, RuntimeError, NotImplementedError):
+            break
+        workers.append(workerThread)
+    if not workers:
+        threadsAvailable = False
+        worker()
+    for workerThread in workers:
+        workerThread.join()
+    
+    if errors:
+        raise errors[0]
+    return results
@@ -0,0 +1,45 @@
+import time
+import models
+
+class APIKeyRotator():
+    """
+    Picks the least used of the Plurk API keys in the current quota window.
+
+    The usage of a key is counted by a CounterShard named after the key and
+    the window, so the counts start again from 0 at every window boundary
+    without resetting anything.
+    """
+
+    def __init__(self,keys,quotaWindow=24*60*60):
+        self.keys=list(keys)
+        self.quotaWindow=quotaWindow
+
+    def getWindow(self):
+        return int(time.time())//self.quotaWindow
+
+    def getCounterName(self,key):
+        return '%s:%d' % (key,self.getWindow())
+
+    def getUsage(self):
+        """ Return {key:API calls in this window} of all the keys with one query """
+        names={}
+        for key in self.keys:
+            names[self.getCounterName(key)]=key
+        counter=models.CounterShard()
+        usage={}
+        for (name,count) in counter.getCounts({'names':names.keys()}).items():
+            usage[names[name]]=count
+        return usage
+
+    def getKey(self):
+        usage=self.getUsage()
+        keyToUse=None
+        for key in self.keys:
+            if keyToUse is None or usage[key] < usage[keyToUse]:
+                keyToUse=key
+        return keyToUse
+
+    def addUsage(self,key,count):
+        counter=models.CounterShard()
+        counterData={'name':self.getCounterName(key),'value':count}
+        return counter.updateCount(counterData)
@@ -0,0 +1,24 @@
+from werkzeug.contrib.cache import GAEMemcachedCache, NullCache
+from kalapy.conf import settings
+
+class GAECache(GAEMemcachedCache):
+    """
+    GAEMemcachedCache whose add returns the result of memcache, False
+    when the key already exists.
+    """
+
+    def add(self,key,value,timeout=None):
+        if timeout is None:
+            timeout=self.default_timeout
+        if isinstance(key,unicode):
+            key=key.encode('utf-8')
+        if self.key_prefix:
+            key=self.key_prefix+key
+        return self._client.add(key,value,timeout)
+
+
+#shared memcache of all the instances, nothing is cached when not on GAE
+if settings.DATABASE_ENGINE == 'gae':
+    cache=GAECache(default_timeout=0, key_prefix='zoe:')
+else:
+    cache=NullCache()
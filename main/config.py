@@ -1,5 +1,21 @@
-PLURK_PASSWORD='password'
-
-PLURK_USERNAME='username'
-
-PLURK_API_KEY=('key')
\ No newline at end of file
+PLURK_PASSWORD='password'
+
+PLURK_USERNAME='username'
+
+PLURK_API_KEY=('key',)
+
+#seconds of the API quota window, the usage of the keys starts from 0 in every window
+PLURK_API_QUOTA_WINDOW=24*60*60
+
+#number of plurks the cron job handles at the same time, 1 handles them one by one
+#more than 1 needs the python27 runtime, the python 2.5 runtime of app.yaml can't start threads
+#and falls back to 1
+PLURK_CONCURRENCY=1
+
+#number of rules on a page of the keyword management page
+KEYWORD_PAGE_SIZE=50
+
+#fan-out mode, the cron job only polls and queues a task per PLURK_TASK_BATCH_SIZE plurks
+PLURK_TASK_QUEUE=False
+
+PLURK_TASK_BATCH_SIZE=5
\ No newline at end of file
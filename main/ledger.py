@@ -0,0 +1,49 @@
+from cache import cache as sharedCache
+
+#seconds an answered plurk is remembered
+LEDGER_TTL=24*60*60
+#seconds a plurk is left to the tick which claimed it
+CLAIM_TTL=5*60
+
+class ResponseLedger():
+    """
+    Remembers the plurks the bot has answered, with the response_count of
+    the plurk right after the answer, so isResponded needs no API call. A
+    plurk missing from the ledger is checked with the API as before.
+    """
+
+    def __init__(self,cache=None):
+        """ cache: werkzeug cache whose add returns False for an existing key, the shared memcache by default """
+        if cache is None:
+            cache=sharedCache
+        self.cache=cache
+
+    def getKey(self,plurkID):
+        return 'Plurk:responded:%s' % plurkID
+
+    def getResponded(self,plurkIDs):
+        """ Return {plurk_id:response_count after the answer or None} with one memcache call """
+        keys={}
+        for plurkID in plurkIDs:
+            keys[self.getKey(plurkID)]=plurkID
+        result={}
+        for (key,count) in self.cache.get_dict(*keys.keys()).items():
+            result[keys[key]]=count
+        return result
+
+    def setResponded(self,plurkID,responseCount):
+        self.cache.set(self.getKey(plurkID),responseCount,LEDGER_TTL)
+
+    def claim(self,plurk):
+        """
+        Claim the plurk at its response_count for this tick, False if an
+        overlapping tick has already claimed it.
+        """
+        return self.cache.add(self.getClaimKey(plurk),1,CLAIM_TTL) is not False
+
+    def release(self,plurk):
+        """ Give up the claim of a plurk which could not be answered, so a retry can answer it """
+        self.cache.delete(self.getClaimKey(plurk))
+
+    def getClaimKey(self,plurk):
+        return 'Plurk:claim:%s:%s' % (plurk['plurk_id'],plurk['response_count'])
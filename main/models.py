@@ -1,149 +1,603 @@
-from kalapy import db
-from kalapy.web import json
-
-class KeyWord(db.Model):
-    keyWordList=db.String()
-    answerList=db.String()
-    lastModified=db.DateTime(None,True)
-    dateCreated=db.DateTime(None,True,True)
-    
-    def getDecoded(self,arg={}):
-        """
-        Acceptable list structures:{
-            limit:number of records to be fetch, if -1 fetch all,
-            from:from where to fetch records should be >= 0
-        }
-        """
-        if arg.has_key('limit') is False:
-            records=self.all().fetchall()
-        else:
-            records=self.all().fetch(arg['limit'],arg['from'])
-        
-        result=[]
-        for item in records:
-            tempData={}
-            tempData['key']=item.key
-            tempData['lastModified']=item.lastModified
-            tempData['dateCreated']=item.dateCreated
-            tempData['keyWordList']=json.loads(item.keyWordList)
-            tempData['answerList']=json.loads(item.answerList)
-            result.append(tempData)
-        return result
-            
-    
-    def updateKeyWord(self,data):
-        """
-        Acceptable list structures:{
-        keyWordList:[
-                {
-                    key:key,
-                    keywords:[],
-                    answers:[]
-                }
-            ] 
-        }
-        """
-        keyWordMainList=data['keyWordList']
-        
-        for keyWordSubList in keyWordMainList:
-            if keyWordSubList['key'] is not None:
-                try:
-                    keyWord=self.get(keyWordSubList['key'])
-                except:
-                    keyWord=None
-                    
-                if keyWord is None:
-                    self.keyWordList=json.dumps(keyWordSubList['keywords'])
-                    self.answerList=json.dumps(keyWordSubList['answers'])
-                    keyWordKey=self.save()
-                    counter=Counter()
-                    counterData={'name':'KeyWord'}
-                    counter.increase(counterData)
-                else:
-                    keyWord.keyWordList=json.dumps(keyWordSubList['keywords'])
-                    keyWord.answerList=json.dumps(keyWordSubList['answers'])
-                    keyWordKey=keyWord.save()
-            else:
-                    self.keyWordList=json.dumps(keyWordSubList['keywords'])
-                    self.answerList=json.dumps(keyWordSubList['answers'])
-                    keyWordKey=self.save()
-                    counter=Counter()
-                    counterData={'name':'KeyWord'}
-                    counter.increase(counterData)
-        db.commit()
-        return keyWordKey
-    
-    def deleteKeyWord(self,key):
-        try:
-            keyWord=self.get(key)
-        except:
-            keyWord=None
-        if keyWord is not None:
-            keyWord.delete()
-            counter=Counter()
-            counterData={'name':'KeyWord'}
-            counter.decrease(counterData)
-            
-        
-        
-class Counter(db.Model):
-    count=db.Integer(required=True,default=0)
-    name=db.String(required=True)
-    dateModified=db.DateTime(None,True)
-    
-    def increase(self,data):
-        """
-        Acceptable list structures:{
-        name:name
-        }
-        """
-        data['value']=1
-        data['default']=1
-        return self.updateCount(data)
-        
-    def decrease(self,data):
-        """
-        Acceptable list structures:{
-        name:name
-        }
-        """
-        data['value']=-1
-        data['default']=0
-        return self.updateCount(data)
-        
-    def reset(self,data):
-        """
-        Acceptable list structures:{
-            name:name,
-            value:reset to value
-        }
-        """
-        counter=self.all().filter('name ==', data['name']).first()
-        if counter is not None:
-            counter.count=data['value']
-            self.save()
-            db.commit()
-            return counter.key
-        
-    def updateCount(self,data):
-        """
-        Acceptable list structures:{
-            name:name,
-            value:value to update,
-            default:value if record dosen't exist
-        }
-        """
-        counter=self.all().filter('name ==', data['name']).first()
-        if counter is None:            
-            self.count=abs(data['default'])
-            self.name=data['name']
-            self.save()
-            db.commit()
-            return self.key
-        else:
-            counter.count+=data['value']
-            counter.save()
-            db.commit()
-            return counter.key
-    
-    
\ No newline at end of file
+import random
+import uuid
+import cPickle as pickle
+from kalapy import db
+from kalapy.web import json
+from keywordmatcher import KeyWordMatcher,ngrams
+from cache import cache
+
+#decoded rules and their matcher of the rule generation seen last
+_keyWordCache={'generation':None,'rules':None,'matcher':None}
+#bytes of a memcache chunk of the decoded rules, memcache values are limited to 1MB
+RULES_CHUNK_SIZE=900*1024
+
+class KeyWord(db.Model):
+    keyWordList=db.String()
+    answerList=db.String()
+    #first keyword in lower case + tab + unique suffix, for paging and prefix search
+    searchKey=db.String(indexed=True)
+    lastModified=db.DateTime(None,True)
+    dateCreated=db.DateTime(None,True,True)
+    
+    def getDecoded(self,arg={}):
+        """
+        Acceptable list structures:{
+            limit:number of records to be fetch, if -1 fetch all,
+            from:from where to fetch records should be >= 0
+        }
+        """
+        if arg.has_key('limit') is False:
+            records=self.all().fetchall()
+        else:
+            records=self.all().fetch(arg['limit'],arg['from'])
+        
+        result=[]
+        for item in records:
+            result.append(self.decode(item))
+        return result
+    
+    def decode(self,item):
+        tempData={}
+        tempData['key']=item.key
+        tempData['lastModified']=item.lastModified
+        tempData['dateCreated']=item.dateCreated
+        tempData['keyWordList']=json.loads(item.keyWordList)
+        tempData['answerList']=json.loads(item.answerList)
+        return tempData
+    
+    def getPage(self,arg={}):
+        """
+        Return {keyWordList:[decoded rules], cursor:cursor of the next page or None}
+        Acceptable list structures:{
+            limit:number of records to be fetch,
+            cursor:cursor returned with the previous page, optional,
+            prefix:prefix of the first keyword to search for, optional
+        }
+        """
+        query=self.all()
+        prefix=None
+        if arg.get('prefix'):
+            prefix=self.normalizeSearch(arg['prefix'])
+        if arg.get('cursor'):
+            query=query.filter('searchKey >', arg['cursor'])
+        elif prefix:
+            query=query.filter('searchKey >=', prefix)
+        if prefix:
+            query=query.filter('searchKey <', prefix+u'\ufffd')
+        query.order('searchKey')
+        
+        #one more record tells if there is a next page
+        records=query.fetch(arg['limit']+1)
+        cursor=None
+        if (len(records)>arg['limit']) is True:
+            records=records[:arg['limit']]
+            cursor=records[-1].searchKey
+        
+        result=[]
+        for item in records:
+            result.append(self.decode(item))
+        return {'keyWordList':result,'cursor':cursor}
+    
+    def normalizeSearch(self,keyWord):
+        if isinstance(keyWord,str):
+            keyWord=keyWord.decode('utf-8')
+        return keyWord.strip().lower()[:100]
+    
+    def setSearchKey(self):
+        keyWords=json.loads(self.keyWordList)
+        firstKeyWord=u''
+        if (len(keyWords)>0) is True:
+            firstKeyWord=self.normalizeSearch(keyWords[0])
+        if self.searchKey:
+            suffix=self.searchKey.rsplit(u'\t',1)[-1]
+        else:
+            suffix=uuid.uuid4().hex
+        self.searchKey=firstKeyWord+u'\t'+suffix
+    
+    def backfillSearchKey(self,arg):
+        """
+        Give a batch of the rules saved before searchKey existed their search
+        key, the datastore leaves them out of the queries on searchKey. Return
+        the number of rules read.
+        Acceptable list structures:{
+            limit:number of rules,
+            from:from where to fetch the rules, should be >= 0
+        }
+        """
+        records=self.all().fetch(arg['limit'],arg['from'])
+        missing=[]
+        for item in records:
+            if not item.searchKey:
+                item.setSearchKey()
+                missing.append(item)
+        if (len(missing)>0) is True:
+            db.save_all(*missing)
+            db.commit()
+        return len(records)
+    
+    def getGeneration(self):
+        """
+        Return the generation of the rules, it is bumped every time
+        updateKeyWord or deleteKeyWord changed the rules.
+        """
+        counter=CounterShard()
+        return counter.getCount({'name':'KeyWordGeneration'})
+    
+    def bumpGeneration(self):
+        counter=CounterShard()
+        counterData={'name':'KeyWordGeneration'}
+        counter.increase(counterData)
+        _keyWordCache['generation']=None
+    
+    def getCachedDecoded(self):
+        """
+        Same as getDecoded() of all the rules, but only reads the rules
+        again when the generation has changed.
+        """
+        generation=self.getGeneration()
+        if _keyWordCache['generation'] != generation:
+            rules=self.getMemcachedRules(generation)
+            if rules is None:
+                rules=self.getDecoded()
+                self.setMemcachedRules(generation,rules)
+            _keyWordCache['rules']=rules
+            _keyWordCache['matcher']=None
+            _keyWordCache['generation']=generation
+        return _keyWordCache['rules']
+
+    def getMemcachedRules(self,generation):
+        """ The decoded rules of the generation in memcache, None if any chunk is missing """
+        key='KeyWord:rules:%s' % generation
+        chunkCount=cache.get(key)
+        if chunkCount is None:
+            return None
+        chunks=cache.get_many(*[key+':%d' % i for i in range(chunkCount)])
+        if None in chunks:
+            return None
+        return pickle.loads(''.join(chunks))
+
+    def setMemcachedRules(self,generation,rules):
+        """
+        Store the decoded rules in chunks, a memcache value can't be larger
+        than 1MB. The number of chunks is set last, so a partly stored rule
+        base is never read.
+        """
+        key='KeyWord:rules:%s' % generation
+        data=pickle.dumps(rules,pickle.HIGHEST_PROTOCOL)
+        chunks={}
+        for (i,start) in enumerate(range(0,len(data),RULES_CHUNK_SIZE)):
+            chunks[key+':%d' % i]=data[start:start+RULES_CHUNK_SIZE]
+        try:
+            cache.set_many(chunks)
+            cache.set(key,len(chunks))
+        except Exception:
+            #memcache is only a shortcut, the rules are read from the datastore next time
+            pass
+
+    def getMatcher(self):
+        """
+        Return the KeyWordMatcher of all the rules, it is only rebuilt
+        when the rule generation has changed.
+        """
+        rules=self.getCachedDecoded()
+        if _keyWordCache['matcher'] is None:
+            _keyWordCache['matcher']=KeyWordMatcher(rules)
+        return _keyWordCache['matcher']
+            
+    
+    def updateKeyWord(self,data):
+        """
+        Acceptable list structures:{
+        keyWordList:[
+                {
+                    key:key,
+                    keywords:[],
+                    answers:[]
+                }
+            ] 
+        }
+        """
+        keyWordMainList=data['keyWordList']
+        
+        #one batch get for all the existing rules
+        keys=[keyWordSubList['key'] for keyWordSubList in keyWordMainList if keyWordSubList['key'] is not None]
+        existed={}
+        if (len(keys)>0) is True:
+            for keyWord in self.get(keys):
+                existed[str(keyWord.key)]=keyWord
+        
+        changed=[]
+        replaced=[]
+        created=0
+        for keyWordSubList in keyWordMainList:
+            keyWordList=json.dumps(keyWordSubList['keywords'])
+            answerList=json.dumps(keyWordSubList['answers'])
+            keyWord=existed.get(str(keyWordSubList['key']))
+            if keyWord is None:
+                keyWord=KeyWord()
+                created+=1
+            elif keyWord.keyWordList == keyWordList and keyWord.answerList == answerList:
+                continue
+            else:
+                replaced.append(keyWord.key)
+            keyWord.keyWordList=keyWordList
+            keyWord.answerList=answerList
+            keyWord.setSearchKey()
+            changed.append(keyWord)
+        
+        if (len(changed)>0) is True:
+            #batch puts for all the changed rules
+            db.save_all(*changed)
+            entry=KeyWordEntry()
+            #only the rules saved before have entries to replace
+            entry.setEntries(changed,replaced)
+            db.commit()
+            if (created>0) is True:
+                counter=CounterShard()
+                counterData={'name':'KeyWord','value':created}
+                counter.updateCount(counterData)
+            self.bumpGeneration()
+        return [keyWord.key for keyWord in changed]
+    
+    def deleteKeyWord(self,key):
+        return self.deleteKeyWords([key])
+    
+    def deleteKeyWords(self,keys):
+        """
+        Delete the rules of the keys with batch calls, the keys of missing
+        rules are skipped. Return the keys of the deleted rules.
+        """
+        keyWords=[]
+        if (len(keys)>0) is True:
+            keyWords=self.get(keys)
+        deleted=[keyWord.key for keyWord in keyWords]
+        if (len(keyWords)>0) is True:
+            entry=KeyWordEntry()
+            entry.deleteEntries(deleted)
+            db.delete_all(*keyWords)
+            db.commit()
+            counter=CounterShard()
+            counterData={'name':'KeyWord','value':-len(keyWords)}
+            counter.updateCount(counterData)
+            self.bumpGeneration()
+        return deleted
+    
+    def getCandidates(self,string):
+        """
+        Return the decoded rules that may match the string, found by the
+        KeyWordEntry index instead of reading all the rules.
+        """
+        entry=KeyWordEntry()
+        keys=entry.getCandidateKeys(string)
+        result=[]
+        if (len(keys)>0) is True:
+            for item in self.get(keys):
+                result.append(self.decode(item))
+        return result
+
+
+#number of leading characters of a keyword its entry is indexed by
+TOKEN_SIZE=2
+#the datastore runs an 'in' filter as one query per value and refuses more than 30
+IN_FILTER_SIZE=30
+
+class KeyWordEntry(db.Model):
+    """
+    One keyword of a KeyWord rule, the entries are an inverted index of
+    the rules. A rule without keywords has one entry with an empty keyword.
+    """
+    rule=db.ManyToOne(KeyWord,reverse_name='entries',cascade=True)
+    keyWord=db.String()
+    position=db.Integer(default=0)
+    token=db.String(indexed=True)
+    
+    def getTokens(self,string):
+        """ Return the tokens of all the keywords the string can contain """
+        tokens=ngrams(string,TOKEN_SIZE)
+        tokens.add(u'')
+        return list(tokens)
+    
+    def getCandidateKeys(self,string):
+        """ Return the keys of the rules having a keyword found in the string """
+        keys=[]
+        tokens=self.getTokens(string)
+        for start in range(0,len(tokens),IN_FILTER_SIZE):
+            #iterated, fetchall would stop at the datastore limit of a fetch
+            for entry in self.all().filter('token in', tokens[start:start+IN_FILTER_SIZE]):
+                if entry.keyWord in string:
+                    key=KeyWordEntry.rule.get_key(entry)
+                    if key not in keys:
+                        keys.append(key)
+        return keys
+    
+    def setEntries(self,rules,replaced=None):
+        """
+        Replace the entries of the saved rules, replaced is the keys of the
+        rules which may have entries already, all the rules if None
+        """
+        if replaced is None:
+            replaced=[rule.key for rule in rules]
+        if (len(replaced)>0) is True:
+            self.deleteEntries(replaced)
+        entries=[]
+        for rule in rules:
+            keyWords=filter(None,json.loads(rule.keyWordList))
+            if (len(keyWords)>0) is not True:
+                keyWords=[u'']
+            for (position,keyWord) in enumerate(keyWords):
+                entry=KeyWordEntry()
+                entry.rule=rule
+                entry.keyWord=keyWord
+                entry.position=position
+                entry.token=keyWord[:TOKEN_SIZE]
+                entries.append(entry)
+        if (len(entries)>0) is True:
+            db.save_all(*entries)
+        return entries
+    
+    def deleteEntries(self,keys):
+        entries=[]
+        for start in range(0,len(keys),IN_FILTER_SIZE):
+            entries.extend(self.all().filter('rule in', keys[start:start+IN_FILTER_SIZE]).fetchall())
+        if (len(entries)>0) is True:
+            db.delete_all(*entries)
+    
+    def rebuild(self,arg):
+        """
+        Build the entries of a batch of rules, for the rules saved before
+        the entries existed. Return the number of rules done.
+        Acceptable list structures:{
+            limit:number of rules,
+            from:from where to fetch the rules, should be >= 0
+        }
+        """
+        rules=KeyWord.all().fetch(arg['limit'],arg['from'])
+        if (len(rules)>0) is True:
+            self.setEntries(rules)
+            db.commit()
+        return len(rules)
+        
+        
+class Counter(db.Model):
+    count=db.Integer(required=True,default=0)
+    name=db.String(required=True)
+    dateModified=db.DateTime(None,True)
+    
+    def increase(self,data):
+        """
+        Acceptable list structures:{
+        name:name
+        }
+        """
+        data['value']=1
+        data['default']=1
+        return self.updateCount(data)
+        
+    def decrease(self,data):
+        """
+        Acceptable list structures:{
+        name:name
+        }
+        """
+        data['value']=-1
+        data['default']=0
+        return self.updateCount(data)
+        
+    def reset(self,data):
+        """
+        Acceptable list structures:{
+            name:name,
+            value:reset to value
+        }
+        """
+        counter=self.all().filter('name ==', data['name']).first()
+        if counter is not None:
+            counter.count=data['value']
+            self.save()
+            db.commit()
+            return counter.key
+        
+    def updateCount(self,data):
+        """
+        Acceptable list structures:{
+            name:name,
+            value:value to update,
+            default:value if record dosen't exist
+        }
+        """
+        counter=self.all().filter('name ==', data['name']).first()
+        if counter is None:            
+            self.count=abs(data['default'])
+            self.name=data['name']
+            self.save()
+            db.commit()
+            return self.key
+        else:
+            counter.count+=data['value']
+            counter.save()
+            db.commit()
+            return counter.key
+
+
+#number of shards a counter spreads its writes on
+COUNTER_SHARDS=10
+#seconds a count or the shard keys of a counter are cached, a stale copy can't live longer
+COUNTER_CACHE_TTL=60
+
+class CounterShard(db.Model):
+    """
+    One shard of a sharded counter, the count of a name is the sum of all
+    its shards. Each update goes to a random shard in a transaction, so
+    concurrent updates neither get lost nor wait on one entity.
+    """
+    name=db.String(required=True,indexed=True)
+    shard=db.Integer(required=True,default=0)
+    count=db.Integer(required=True,default=0)
+    dateModified=db.DateTime(None,True)
+    
+    def increase(self,data):
+        """
+        Acceptable list structures:{
+        name:name
+        }
+        """
+        data['value']=1
+        return self.updateCount(data)
+        
+    def decrease(self,data):
+        """
+        Acceptable list structures:{
+        name:name
+        }
+        """
+        data['value']=-1
+        return self.updateCount(data)
+    
+    def getCount(self,data):
+        """
+        Acceptable list structures:{
+            name:name
+        }
+        """
+        key='CounterShard:count:%s' % data['name']
+        count=cache.get(key)
+        if count is None:
+            count=0
+            #a get by keys is strongly consistent, a query may miss the latest update
+            keys=[]
+            for shardKeys in self.getShardKeys(data['name']).values():
+                keys.extend(shardKeys)
+            if (len(keys)>0) is True:
+                for shard in self.get(keys):
+                    count+=shard.count
+            cache.set(key,count,COUNTER_CACHE_TTL)
+        return count
+    
+    def getCounts(self,data):
+        """
+        Return {name:count} of the names, the counts not cached are read
+        with one query
+        Acceptable list structures:{
+            names:[name]
+        }
+        """
+        keys={}
+        for name in data['names']:
+            keys['CounterShard:count:%s' % name]=name
+        counts={}
+        missing={}
+        for (key,count) in cache.get_dict(*keys.keys()).items():
+            if count is None:
+                missing['CounterShard:count:%s' % keys[key]]=0
+                counts[keys[key]]=0
+            else:
+                counts[keys[key]]=count
+        if (len(missing)>0) is True:
+            names=[keys[key] for key in missing.keys()]
+            for shard in self.all().filter('name in', names).fetchall():
+                counts[shard.name]+=shard.count
+                missing['CounterShard:count:%s' % shard.name]+=shard.count
+            cache.set_many(missing,COUNTER_CACHE_TTL)
+        return counts
+        
+    def updateCount(self,data):
+        """
+        Acceptable list structures:{
+            name:name,
+            value:value to update
+        }
+        """
+        if data['value'] == 0:
+            return None
+        shardKeys=self.getShardKeys(data['name'])
+        index=random.randrange(COUNTER_SHARDS)
+        if shardKeys.has_key(index):
+            #the first of the shards a racing update may have duplicated
+            shardKey=shardKeys[index][0]
+            db.run_in_transaction(_updateShard,shardKey,data['value'])
+        else:
+            shard=CounterShard()
+            shard.name=data['name']
+            shard.shard=index
+            shard.count=data['value']
+            shardKey=shard.save()
+            db.commit()
+            cache.delete('CounterShard:shardKeys:%s' % data['name'])
+        cache.delete('CounterShard:count:%s' % data['name'])
+        return shardKey
+    
+    def getShards(self,name):
+        shards=self.all().filter('name ==', name).fetchall()
+        if len(shards) == 0:
+            shard=self.seedShard(name)
+            if shard is not None:
+                shards=[shard]
+        return shards
+    
+    def getShardKeys(self,name):
+        """
+        Return {shard:[keys]} of the shards of the name, two racing updates
+        may both create a shard, all the duplicates are kept to be summed
+        """
+        key='CounterShard:shardKeys:%s' % name
+        shardKeys=cache.get(key)
+        if shardKeys is None:
+            shardKeys={}
+            for shard in self.getShards(name):
+                shardKeys.setdefault(shard.shard,[]).append(shard.key)
+            cache.set(key,shardKeys,COUNTER_CACHE_TTL)
+        return shardKeys
+    
+    def seedShard(self,name):
+        """ Move the count of the old Counter record of the name to shard 0 """
+        counter=Counter.all().filter('name ==', name).first()
+        if counter is None:
+            return None
+        shard=CounterShard()
+        shard.name=name
+        shard.shard=0
+        shard.count=counter.count
+        shard.save()
+        counter.delete()
+        db.commit()
+        return shard
+
+def _updateShard(key,value):
+    shard=CounterShard.get(key)
+    shard.count+=value
+    shard.save()
+    return shard.key
+
+
+class PollingOffset(db.Model):
+    name=db.String(required=True)
+    offset=db.String()
+    dateModified=db.DateTime(None,True)
+    
+    def getOffset(self,data):
+        """
+        Acceptable list structures:{
+            name:name
+        }
+        """
+        pollingOffset=self.all().filter('name ==', data['name']).first()
+        if pollingOffset is not None:
+            return pollingOffset.offset
+        return None
+    
+    def setOffset(self,data):
+        """
+        Acceptable list structures:{
+            name:name,
+            offset:time of the newest plurk seen, formatted as 2009-6-20T21:55:34
+        }
+        """
+        pollingOffset=self.all().filter('name ==', data['name']).first()
+        if pollingOffset is None:
+            pollingOffset=self
+            pollingOffset.name=data['name']
+        if pollingOffset.offset != data['offset']:
+            pollingOffset.offset=data['offset']
+            pollingOffset.save()
+            db.commit()
+        return pollingOffset.key
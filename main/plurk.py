@@ -1,233 +1,444 @@
-#coding=utf-8
-import time,random
-from plurklib import PlurkAPI
-from services import WebServices
-import models
-from idiom import idioms
-import random
-
-class Plurk(PlurkAPI):
-    
-    def __init__(self, apiKey,username,password):
-        
-        PlurkAPI.__init__(self, apiKey)
-        self.login(username, password, 1)
-        self.uid = self.usernameToUid(username)
-        self.username=username
-
-    def youtubeQueryResponse(self, plurk):
-        
-        if ('想聽' == plurk['content'][0:2] or '點播' == plurk['content'][0:2]) and len(plurk['content']) > 3:
-            plurkID = plurk['plurk_id']
-            webServices=WebServices()
-            if plurk['response_count'] == 0:
-                videos = webServices.youtubeQuery(plurk['content'][3:])
-                for content in videos:
-                    self.responseAdd(plurkID, content, ':')
-            elif not self.isResponded(plurkID):
-                videos = webServices.youtubeQuery(plurk['content'][3:])
-                for content in videos:
-                    self.responseAdd(plurkID,content, ':')
-            return videos
-        return None
-    
-    def flickrQueryResponse(self, plurk):
-        
-        if ('找圖' == plurk['content'][0:2]) and len(plurk['content']) > 3:
-            plurkID = plurk['plurk_id']
-            webServices=WebServices()
-            if plurk['response_count'] == 0:
-                photos = webServices.flickrPhotoQuery(plurk['content'][3:])
-                for content in photos:
-                    self.responseAdd(plurkID, content, ':')
-            elif not self.isResponded(plurkID):
-                photos = webServices.flickrPhotoQuery(plurk['content'][3:])
-                for content in photos:
-                    self.responseAdd(plurkID,content, ':')
-            return True
-        return None
-    
-    def urlShortenerResponse(self, plurk):
-        
-        if ('短網址' == plurk['content_raw'][0:3]) and len(plurk['content']) > 4:
-            plurkID = plurk['plurk_id']
-            webServices=WebServices()
-            if plurk['response_count'] == 0:
-                url = webServices.googleUrlShortener(plurk['content_raw'][4:])
-                self.responseAdd(plurkID,'短死人不償命的短網址來唷： '+url, ':')
-            elif not self.isResponded(plurkID):
-                url = webServices.googleUrlShortener(plurk['content_raw'][4:])
-                self.responseAdd(plurkID,'短死人不償命的短網址來唷： '+url, ':')
-            return True
-        return None
-    
-    def idiomResponse(self,plurk):
-        
-        if '成語接龍' == plurk['content_raw'][0:4]:
-            plurkID = plurk['plurk_id']
-            if not self.isResponded(plurkID):
-                total=len(idioms)
-                randNum=random.randrange(0,total)
-                responseContent=idioms[randNum]
-                self.responseAdd(plurkID,': '+responseContent, ':')   
-            else:
-                responses=self.getResponses(plurkID,0)
-                responsesCount=plurk['response_count']
-                response=responses['responses'][responsesCount-1]
-                if (self.uid != response['user_id']) is True:
-                    nickName='@'+responses['friends'][str(response['user_id'])]['nick_name']+': '
-                    
-                    respondedContentList=[]
-                    for respondedContent in responses['responses']:
-                        respondedContent=respondedContent['content_raw']
-                        i=respondedContent.find(':')
-                        respondedContent=respondedContent[i+2:]
-                        respondedContentList.append(respondedContent)
-                        
-                    plurkContent=response['content_raw']
-                    i=plurkContent.find(':')
-                    plurkContent=plurkContent[i+2:]
-                    try:
-                        existed=respondedContentList.index(plurkContent)
-                    except:
-                        existed=-1
-                    if existed>0:
-                        try:
-                            existed=idioms.index(plurkContent)
-                        except:
-                            existed=-1
-                        if existed>0:
-                            idioms.remove(plurkContent)
-                            responseContentList=[]
-                            for word in idioms:
-                                if plurkContent[-1]== word[0]:
-                                    try:
-                                        existed=respondedContentList.index(word)
-                                    except:
-                                        existed=-1
-                                    if existed<0:
-                                        responseContentList.append(word)
-                            else:
-                                total=len(responseContentList)
-                                if  total> 0:
-                                    randNum=random.randrange(0,total)
-                                    responseContent=responseContentList[randNum]
-                                else:
-                                    responseContent=[' 你的腦是千核心的嘛？我輸了T_T','你連機器人都打敗，你還是人嘛？']
-                        else:
-                            responseContent=['成語不是用掰就掰得出的，你以為你是掰噗喔？','你再掰(annoyed)']
-                    else:
-                        responseContent=['重複了，重複了，我贏了XDD','重複了！！你要怎麼跟我鬥，我可是千核心機器人耶(dance)']
-                    
-                    randNum=random.randrange(0,len(responseContent))
-                    self.responseAdd(plurkID,nickName+responseContent[randNum], ':')
-            return True
-        
-    
-    def chatResponse(self, plurk,keywords):
-        
-        plurkID=plurk['plurk_id']
-        responsesCount=plurk['response_count']
-        if (responsesCount>0) is True:
-            responses=self.getResponses(plurkID,0)
-            response=responses['responses'][responsesCount-1]
-            if ( (plurk['owner_id'] == response['user_id']) and (response['content_raw'].find(self.username)>=0) ) is True:
-                plurkContent=response['content_raw']
-                nickName='@'+responses['friends'][str(response['user_id'])]['nick_name']+': '
-            elif self.isResponded(plurkID,responses) is not True:
-                plurkContent=plurk['content_raw']
-                nickName=''
-            else:
-                plurkContent=None
-        else:
-            plurkContent=plurk['content_raw']
-            nickName=''
-            
-        if plurkContent is not None:
-            answerList=self.keyWordFilter(keywords,plurkContent)
-            if answerList is not None:
-                max=-1
-                for (index,answer) in enumerate(answerList):
-                    current=answer['totalFound']
-                    if (current>max) is True:
-                        max=current
-                        maxIndex=index
-                
-                length=len(answerList[maxIndex]['answerList'])
-                if (length>1) is True:
-                    randNum=random.randrange(0,length)-1
-                else:
-                    randNum=0
-                self.responseAdd(plurkID,nickName+answerList[maxIndex]['answerList'][randNum],':')
-            else:
-                defaultAnswer=[
-                    '我的偶像->(droid_dance)',
-                    '這是不能說的秘密><',
-                    'yo',
-                    '噗哈哈',
-                    '是這樣喔？',
-                    '嗯啊',
-                    '我的電池快沒電了(哭哭',
-                    '目前休眠中',
-                    '嗯呀呀',
-                    '呼哈',
-                    '(gaha)',
-                    '對不起',
-                    '不理你',
-                    '(裝傻ing',
-                    '你壞壞><'
-                ]
-                length=len(defaultAnswer)
-                randNum=random.randrange(0,length)-1
-                self.responseAdd(plurkID,nickName+defaultAnswer[randNum],':')
-                
-    def keyWordFilter(self,keywords,string):
-        
-        answerList=[]
-        for keyWordList in keywords:
-            totalFound=0
-            start=0
-            for keyWord in keyWordList['keyWordList']:
-                index=string.find(keyWord,start)
-                if (index >=0) is True:
-                    totalFound+=1
-                    start=index
-                else:
-                    break
-            else:
-                answer={'totalFound':totalFound,'answerList':keyWordList['answerList']}
-                answerList.append(answer)
-        if (len(answerList)>0) is True:
-            return answerList
-        else:
-            return None
-        
-    
-    def isResponded(self, plurkID,responses=None):
-        
-        if responses is None:
-            responses=self.getResponses(plurkID,0)
-            
-        if type(responses['friends']).__name__ == 'dict':
-            if responses['friends'].has_key(str(self.uid)):
-                return True
-        else:
-            return None
-        
-    def callResponder(self,keywords=None):
-
-        timestamp=time.strftime('%Y-%m-%dT%H:%M:%S',time.gmtime(time.time()))##offset seem is not working now
-        self.savedPlurks = self.getPlurks()
-        read=[]
-        if self.savedPlurks.has_key('plurks'):
-            for plurk in self.savedPlurks['plurks']:
-                if ((plurk['owner_id'] != self.uid) is True) and (plurk['replurker_id'] is None):
-                    self.youtubeQueryResponse(plurk)
-                    self.flickrQueryResponse(plurk)
-                    self.urlShortenerResponse(plurk)
-                    if (self.idiomResponse(plurk) is None):
-                        self.chatResponse(plurk,keywords)
-                    read.append(plurk['plurk_id'])
-            if (len(read) >0) is True:
-                self.markAsRead(str(read))
-        return self.savedPlurks
+#coding=utf-8
+import time,random,calendar
+import logging
+from plurklib import PlurkAPI
+from retry import RetryError
+from services import WebServices
+from keywordmatcher import KeyWordMatcher
+from workerpool import runConcurrently
+import models
+from cache import cache
+from ledger import ResponseLedger
+from idiom import idioms,idiomSet,idiomsByFirstChar
+import random
+import threading
+
+#seconds a login session is reused before logging in again
+SESSION_TTL=60*60
+
+class Plurk(PlurkAPI):
+    
+    def __init__(self, apiKey,username,password,concurrency=1):
+        
+        PlurkAPI.__init__(self, apiKey)
+        self.concurrency=concurrency
+        self.username=username
+        self.password=password
+        self.sessionLock=threading.RLock()
+        session=cache.get('Plurk:session:%s' % username)
+        if session is not None:
+            self.setCookies(session['cookies'])
+            self.uid=session['uid']
+        else:
+            self.startSession()
+        self.responsesCache={}
+        self.respondedPlurks=set()
+        self.ledger=ResponseLedger()
+        self.respondedCounts={}
+        self.responseCounts={}
+        self.offset=None
+
+    def startSession(self):
+        """
+        Login and cache the session cookies and the uid of the user, so
+        the next ticks don't have to login again.
+        """
+        self.login(self.username, self.password, 1)
+        self.uid = self.usernameToUid(self.username)
+        session={'cookies':self.getCookies(),'uid':self.uid}
+        cache.set('Plurk:session:%s' % self.username,session,SESSION_TTL)
+    
+    def _call_api(self, apirequest, parameters, https=False):
+        
+        result=PlurkAPI._call_api(self, apirequest, parameters, https)
+        if apirequest != '/API/Users/login' and isinstance(result,dict) and result.get('error_text') == 'Requires login':
+            self.sessionLock.acquire()
+            try:
+                self.startSession()
+            finally:
+                self.sessionLock.release()
+            result=PlurkAPI._call_api(self, apirequest, parameters, https)
+        return result
+    
+    def youtubeQueryResponse(self, plurk):
+        
+        if ('想聽' == plurk['content'][0:2] or '點播' == plurk['content'][0:2]) and len(plurk['content']) > 3:
+            plurkID = plurk['plurk_id']
+            webServices=WebServices(cache)
+            if plurk['response_count'] == 0:
+                videos = webServices.youtubeQuery(plurk['content'][3:])
+                for content in videos:
+                    self.responseAdd(plurkID, content, ':')
+            elif not self.isResponded(plurk):
+                videos = webServices.youtubeQuery(plurk['content'][3:])
+                for content in videos:
+                    self.responseAdd(plurkID,content, ':')
+            return videos
+        return None
+    
+    def flickrQueryResponse(self, plurk):
+        
+        if ('找圖' == plurk['content'][0:2]) and len(plurk['content']) > 3:
+            plurkID = plurk['plurk_id']
+            webServices=WebServices(cache)
+            if plurk['response_count'] == 0:
+                photos = webServices.flickrPhotoQuery(plurk['content'][3:])
+                for content in photos:
+                    self.responseAdd(plurkID, content, ':')
+            elif not self.isResponded(plurk):
+                photos = webServices.flickrPhotoQuery(plurk['content'][3:])
+                for content in photos:
+                    self.responseAdd(plurkID,content, ':')
+            return True
+        return None
+    
+    def urlShortenerResponse(self, plurk):
+        
+        if ('短網址' == plurk['content_raw'][0:3]) and len(plurk['content']) > 4:
+            plurkID = plurk['plurk_id']
+            webServices=WebServices(cache)
+            if plurk['response_count'] == 0:
+                url = webServices.googleUrlShortener(plurk['content_raw'][4:])
+                self.responseAdd(plurkID,'短死人不償命的短網址來唷： '+url, ':')
+            elif not self.isResponded(plurk):
+                url = webServices.googleUrlShortener(plurk['content_raw'][4:])
+                self.responseAdd(plurkID,'短死人不償命的短網址來唷： '+url, ':')
+            return True
+        return None
+    
+    def idiomResponse(self,plurk):
+        
+        if '成語接龍' == plurk['content_raw'][0:4]:
+            plurkID = plurk['plurk_id']
+            if self.isAnsweredLast(plurk):
+                #nobody has answered the bot yet
+                return True
+            responses=self.getPlurkResponses(plurk)
+            if not self.isResponded(plurk,responses):
+                total=len(idioms)
+                randNum=random.randrange(0,total)
+                responseContent=idioms[randNum]
+                self.responseAdd(plurkID,': '+responseContent, ':')   
+            else:
+                responsesCount=plurk['response_count']
+                response=responses['responses'][responsesCount-1]
+                if (self.uid != response['user_id']) is True:
+                    nickName='@'+responses['friends'][str(response['user_id'])]['nick_name']+': '
+                    
+                    usedIdioms=set()
+                    for (index,respondedContent) in enumerate(responses['responses']):
+                        if index != responsesCount-1:
+                            respondedContent=respondedContent['content_raw']
+                            i=respondedContent.find(':')
+                            usedIdioms.add(respondedContent[i+2:])
+                        
+                    plurkContent=response['content_raw']
+                    i=plurkContent.find(':')
+                    plurkContent=plurkContent[i+2:]
+                    if plurkContent not in usedIdioms:
+                        if plurkContent in idiomSet:
+                            usedIdioms.add(plurkContent)
+                            responseContentList=[]
+                            for word in idiomsByFirstChar.get(plurkContent[-1],()):
+                                if word not in usedIdioms:
+                                    responseContentList.append(word)
+                            total=len(responseContentList)
+                            if  total> 0:
+                                randNum=random.randrange(0,total)
+                                responseContent=[responseContentList[randNum]]
+                            else:
+                                responseContent=[' 你的腦是千核心的嘛？我輸了T_T','你連機器人都打敗，你還是人嘛？']
+                        else:
+                            responseContent=['成語不是用掰就掰得出的，你以為你是掰噗喔？','你再掰(annoyed)']
+                    else:
+                        responseContent=['重複了，重複了，我贏了XDD','重複了！！你要怎麼跟我鬥，我可是千核心機器人耶(dance)']
+                    
+                    randNum=random.randrange(0,len(responseContent))
+                    self.responseAdd(plurkID,nickName+responseContent[randNum], ':')
+            return True
+        
+    
+    def chatResponse(self, plurk,keywords):
+        
+        plurkID=plurk['plurk_id']
+        responsesCount=plurk['response_count']
+        if (responsesCount>0) is True:
+            if self.isAnsweredLast(plurk):
+                return None
+            responses=self.getPlurkResponses(plurk)
+            response=responses['responses'][responsesCount-1]
+            if ( (plurk['owner_id'] == response['user_id']) and (response['content_raw'].find(self.username)>=0) ) is True:
+                plurkContent=response['content_raw']
+                nickName='@'+responses['friends'][str(response['user_id'])]['nick_name']+': '
+            elif self.isResponded(plurk,responses) is not True:
+                plurkContent=plurk['content_raw']
+                nickName=''
+            else:
+                plurkContent=None
+        else:
+            plurkContent=plurk['content_raw']
+            nickName=''
+            
+        if plurkContent is not None:
+            answerList=self.keyWordFilter(keywords,plurkContent)
+            if answerList is not None:
+                max=-1
+                for (index,answer) in enumerate(answerList):
+                    current=answer['totalFound']
+                    if (current>max) is True:
+                        max=current
+                        maxIndex=index
+                
+                length=len(answerList[maxIndex]['answerList'])
+                if (length>1) is True:
+                    randNum=random.randrange(0,length)-1
+                else:
+                    randNum=0
+                self.responseAdd(plurkID,nickName+answerList[maxIndex]['answerList'][randNum],':')
+            else:
+                defaultAnswer=[
+                    '我的偶像->(droid_dance)',
+                    '這是不能說的秘密><',
+                    'yo',
+                    '噗哈哈',
+                    '是這樣喔？',
+                    '嗯啊',
+                    '我的電池快沒電了(哭哭',
+                    '目前休眠中',
+                    '嗯呀呀',
+                    '呼哈',
+                    '(gaha)',
+                    '對不起',
+                    '不理你',
+                    '(裝傻ing',
+                    '你壞壞><'
+                ]
+                length=len(defaultAnswer)
+                randNum=random.randrange(0,length)-1
+                self.responseAdd(plurkID,nickName+defaultAnswer[randNum],':')
+                
+    def keyWordFilter(self,keywords,string):
+        """
+        keywords should be a KeyWordMatcher, a list of decoded rules is
+        compiled into one on the fly. Without keywords the matcher of all
+        the rules is used, see KeyWord.getMatcher.
+        """
+        if keywords is None:
+            keyWordObj=models.KeyWord()
+            keywords=keyWordObj.getMatcher()
+        if not isinstance(keywords,KeyWordMatcher):
+            keywords=KeyWordMatcher(keywords)
+        return keywords.match(string)
+        
+    
+    def getPlurkResponses(self, plurk):
+        """
+        getResponses() of the plurk, fetched at most once per tick and
+        shared by all the responders.
+        """
+        key=(plurk['plurk_id'],plurk['response_count'])
+        if not self.responsesCache.has_key(key):
+            if plurk['response_count'] == 0:
+                self.responsesCache[key]={'responses':[],'friends':{}}
+            else:
+                self.responsesCache[key]=self.getResponses(plurk['plurk_id'],0)
+        return self.responsesCache[key]
+    
+    def responseAdd(self, plurk_id, content, qualifier):
+        
+        response=PlurkAPI.responseAdd(self, plurk_id, content, qualifier)
+        if not response.has_key('error_text'):
+            self.respondedPlurks.add(plurk_id)
+            self.responseCounts[plurk_id]=self.responseCounts.get(plurk_id,0)+1
+            self.respondedCounts[plurk_id]=self.responseCounts[plurk_id]
+            self.ledger.setResponded(plurk_id,self.responseCounts[plurk_id])
+        return response
+    
+    def getRespondedCount(self, plurkID):
+        """
+        response_count of the plurk right after the last answer of the bot,
+        None if the plurk is not in the ledger.
+        """
+        if not self.respondedCounts.has_key(plurkID):
+            self.respondedCounts.update(self.ledger.getResponded([plurkID]))
+        return self.respondedCounts[plurkID]
+    
+    def isAnsweredLast(self, plurk):
+        """ True if the answer of the bot is the newest response of the plurk """
+        return self.getRespondedCount(plurk['plurk_id']) == plurk['response_count']
+    
+    def isResponded(self, plurk,responses=None):
+        
+        plurkID=plurk['plurk_id']
+        if plurkID in self.respondedPlurks:
+            return True
+        
+        if self.getRespondedCount(plurkID) is not None:
+            return True
+        
+        if responses is None:
+            responses=self.getPlurkResponses(plurk)
+            
+        if type(responses['friends']).__name__ == 'dict':
+            if responses['friends'].has_key(str(self.uid)):
+                return True
+        else:
+            return None
+        
+    def pollPlurks(self,offset=None,limit=50,maxPages=5):
+        """
+        The plurks to respond: the plurks newer than offset, then the unread
+        plurks, which are the new plurks not marked as read yet and the
+        plurks with new responses, like the turns of an idiom chain. The
+        unread plurks are paged backwards, so a burst of more than limit
+        plurks is read page by page. self.offset is moved to the time of
+        the newest plurk only when all the new plurks were read, otherwise
+        it stays at offset and the rest is read by the next poll.
+        """
+        self.offset=offset
+        result={'plurks':[],'plurk_users':{}}
+        #getPlurks is by the second, the plurks of the same second as offset are polled again
+        response=self.getPlurks(self.shiftOffset(offset,-1),limit)
+        if not response.has_key('plurks'):
+            return response
+        self.addPolledPlurks(result,response)
+        complete=len(response['plurks']) < limit
+        older=None
+        for page in range(maxPages):
+            response=self.getUnreadPlurks(older,limit)
+            if not response.has_key('plurks'):
+                break
+            self.addPolledPlurks(result,response)
+            if len(response['plurks']) < limit:
+                complete=True
+                break
+            #getUnreadPlurks is older than offset, the pages overlap by a second
+            oldest=min([self.postedToOffset(plurk['posted']) for plurk in response['plurks']])
+            if older is not None and self.shiftOffset(oldest,1) >= older:
+                #a whole page in one second, the next page would be the same
+                break
+            older=self.shiftOffset(oldest,1)
+        if complete is True:
+            for plurk in result['plurks']:
+                posted=self.postedToOffset(plurk['posted'])
+                if self.offset is None or posted > self.offset:
+                    self.offset=posted
+        return result
+    
+    def addPolledPlurks(self,result,response):
+        """ Merge the plurks of a poll response into result, the newest response_count of a plurk is kept """
+        indexes={}
+        for (index,plurk) in enumerate(result['plurks']):
+            indexes[plurk['plurk_id']]=index
+        for plurk in response['plurks']:
+            index=indexes.get(plurk['plurk_id'])
+            if index is None:
+                indexes[plurk['plurk_id']]=len(result['plurks'])
+                result['plurks'].append(plurk)
+            elif (plurk['response_count'] > result['plurks'][index]['response_count']) is True:
+                result['plurks'][index]=plurk
+        if response.has_key('plurk_users'):
+            result['plurk_users'].update(response['plurk_users'])
+    
+    def shiftOffset(self,offset,seconds):
+        if offset is None:
+            return None
+        offsetTime=calendar.timegm(time.strptime(offset,'%Y-%m-%dT%H:%M:%S'))
+        return time.strftime('%Y-%m-%dT%H:%M:%S',time.gmtime(offsetTime+seconds))
+    
+    def postedToOffset(self,posted):
+        """
+        Convert the posted time of a plurk, like 'Fri, 05 Jun 2009 23:07:13 GMT',
+        to the offset format of getPlurks.
+        """
+        postedTime=time.strptime(posted,'%a, %d %b %Y %H:%M:%S GMT')
+        return time.strftime('%Y-%m-%dT%H:%M:%S',postedTime)
+    
+    def callResponder(self,keywords=None,offset=None):
+        
+        self.savedPlurks = self.pollPlurks(offset)
+        plurks=self.getPlurksToRespond(self.savedPlurks)
+        #the skipped plurks are marked as read with the responded ones, in one call
+        self.respondPlurks(plurks,keywords,self.getSkipped(self.savedPlurks,plurks))
+        return self.savedPlurks
+    
+    def getPlurksToRespond(self,savedPlurks):
+        """ The polled plurks which are not posted or replurked by the bot """
+        plurks=[]
+        if savedPlurks.has_key('plurks'):
+            for plurk in savedPlurks['plurks']:
+                if ((plurk['owner_id'] != self.uid) is True) and (plurk['replurker_id'] is None):
+                    plurks.append(plurk)
+        return plurks
+    
+    def getSkipped(self,savedPlurks,plurks):
+        """
+        The ids of the polled plurks which are not responded, they are marked
+        as read too, or the own plurks of the bot would come back with every
+        poll of the unread plurks.
+        """
+        respondIDs=set([plurk['plurk_id'] for plurk in plurks])
+        skipped=[]
+        if savedPlurks.has_key('plurks'):
+            for plurk in savedPlurks['plurks']:
+                if plurk['plurk_id'] not in respondIDs:
+                    skipped.append(plurk['plurk_id'])
+        return skipped
+    
+    def markSkippedAsRead(self,savedPlurks,plurks):
+        """ Mark the skipped plurks as read, when the others are responded by tasks """
+        skipped=self.getSkipped(savedPlurks,plurks)
+        self.markPlurksAsRead(skipped)
+        return skipped
+    
+    def markPlurksAsRead(self,plurkIDs):
+        """
+        Mark the plurks and their responses as read, the unread plurks would
+        return the plurks with responses not seen yet otherwise.
+        """
+        if (len(plurkIDs) >0) is True:
+            self.markAsRead(str(list(plurkIDs)),True)
+    
+    def respondPlurks(self,plurks,keywords=None,skipped=()):
+        """
+        Respond the plurks and mark them as read with the skipped plurk ids,
+        return the ids of the responded plurks. The plurks claimed by an
+        overlapping tick are left to it.
+        """
+        if keywords is not None and not isinstance(keywords,KeyWordMatcher):
+            keywords=KeyWordMatcher(keywords)
+        
+        self.responsesCache={}
+        self.respondedPlurks=set()
+        self.responseCounts={}
+        for plurk in plurks:
+            self.responseCounts[plurk['plurk_id']]=plurk['response_count']
+        #one memcache call for the ledger entries of all the plurks
+        self.respondedCounts=self.ledger.getResponded(self.responseCounts.keys())
+        
+        def respond(plurk):
+            #an overlapping tick may be answering the same plurk
+            if not self.ledger.claim(plurk):
+                return None
+            try:
+                self.respondPlurk(plurk,keywords)
+            except:
+                #a retry of the tick must be able to claim it again
+                self.ledger.release(plurk)
+                raise
+            return plurk['plurk_id']
+        
+        read=[plurkID for plurkID in runConcurrently(respond,plurks,self.concurrency) if plurkID is not None]
+        self.markPlurksAsRead(read+list(skipped))
+        return read
+    
+    def respondPlurk(self,plurk,keywords):
+        
+        for responder in (self.youtubeQueryResponse,self.flickrQueryResponse,self.urlShortenerResponse):
+            try:
+                responder(plurk)
+            except RetryError,error:
+                #a dead web service only skips its own answer, the other answers go on
+                logging.warning('%s of plurk %s failed: %s' % (responder.__name__,plurk['plurk_id'],error))
+        if (self.idiomResponse(plurk) is None):
+            self.chatResponse(plurk,keywords)
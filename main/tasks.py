@@ -0,0 +1,58 @@
+from kalapy.conf import settings
+
+class GAETaskQueue():
+    """
+    Push queue of App Engine, every task is a POST to url with params
+    handled by its own request.
+    """
+
+    def __init__(self,queueName='default'):
+        try:
+            from google.appengine.api import taskqueue
+        except ImportError:
+            from google.appengine.api.labs import taskqueue
+        self.taskqueue=taskqueue
+        self.queueName=queueName
+
+    def add(self,url,params):
+        self.taskqueue.add(url=url,params=params,queue_name=self.queueName)
+
+    def register(self,url,handler):
+        """ nothing to do, App Engine posts the tasks to their url """
+        pass
+
+    def runTasks(self):
+        """ nothing to do, App Engine runs the tasks """
+        return None
+
+
+class LocalTaskQueue():
+    """
+    In-process queue of the tasks, they are run by runTasks() with the
+    handler registered for their url. Used when not on GAE and in tests.
+    """
+
+    def __init__(self):
+        self.tasks=[]
+        self.handlers={}
+
+    def add(self,url,params):
+        self.tasks.append((url,params))
+
+    def register(self,url,handler):
+        """ handler is called with the params of the task """
+        self.handlers[url]=handler
+
+    def runTasks(self):
+        results=[]
+        while (len(self.tasks)>0) is True:
+            (url,params)=self.tasks.pop(0)
+            results.append(self.handlers[url](params))
+        return results
+
+
+#queue of the cron fan-out mode, see PLURK_TASK_QUEUE
+if settings.DATABASE_ENGINE == 'gae':
+    taskQueue=GAETaskQueue()
+else:
+    taskQueue=LocalTaskQueue()
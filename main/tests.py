@@ -1,8 +1,770 @@
-from kalapy.test import TestCase
-
-# Create your unittest classes here
-
-# If your package is complex and tests need to be organized within seperate
-# modules, create a package with name `tests` and remove this module. All
-# the modules within the package will be loaded automatically.
-
+#coding=utf-8
+import os
+import time
+import random
+import calendar
+import tempfile
+import uuid
+from kalapy import db
+from kalapy.web import json
+from kalapy.db.engines import database
+from kalapy.test import TestCase
+
+import models
+import views
+from tasks import LocalTaskQueue
+from plurk import Plurk
+from apikey import APIKeyRotator
+from ledger import ResponseLedger
+from werkzeug.contrib.cache import SimpleCache
+import idiom
+from keywordmatcher import KeyWordMatcher
+from lrucache import LRUCache
+from retry import RetryPolicy,CircuitBreaker,RetryError,CircuitOpenError
+from plurklib import PlurkAPI,PlurklibError,PlurklibUnknownResultError
+import httplib
+import socket
+from StringIO import StringIO
+
+# Create your unittest classes here
+
+# If your package is complex and tests need to be organized within seperate
+# modules, create a package with name `tests` and remove this module. All
+# the modules within the package will be loaded automatically.
+
+def findKeyWords(keywords,string):
+    """
+    The str.find loop Plurk.keyWordFilter used before KeyWordMatcher.
+    """
+    answerList=[]
+    for keyWordList in keywords:
+        totalFound=0
+        start=0
+        for keyWord in keyWordList['keyWordList']:
+            index=string.find(keyWord,start)
+            if (index >=0) is True:
+                totalFound+=1
+                start=index
+            else:
+                break
+        else:
+            answer={'totalFound':totalFound,'answerList':keyWordList['answerList']}
+            answerList.append(answer)
+    if (len(answerList)>0) is True:
+        return answerList
+    else:
+        return None
+
+class ClaimCache(SimpleCache):
+    """ SimpleCache whose add returns False for an existing key, like memcache """
+
+    def add(self,key,value,timeout=None):
+        if self.get(key) is not None:
+            return False
+        self.set(key,value,timeout)
+        return True
+
+class FakePlurk(Plurk):
+    """
+    Plurk of the bot with the Plurk API replaced by a timeline in memory.
+    The plurks are dicts with plurk_id, posted (seconds), owner_id,
+    response_count and content, all the plurks are unread at first.
+    """
+
+    def __init__(self,plurks=(),concurrency=1,cache=None):
+        self.plurks=[self.makePlurk(plurk) for plurk in plurks]
+        self.unread=set([plurk['plurk_id'] for plurk in self.plurks])
+        self.calls=[]
+        self.added=[]
+        Plurk.__init__(self,'key','zoe','password',concurrency)
+        #the ledger of a test is not shared with the other tests
+        if cache is None:
+            cache=ClaimCache()
+        self.ledger=ResponseLedger(cache)
+
+    def makePlurk(self,data):
+        result={'owner_id':2,'replurker_id':None,'response_count':0,'content':'yo'}
+        result.update(data)
+        result['content_raw']=result['content']
+        result['posted']=time.strftime('%a, %d %b %Y %H:%M:%S GMT',time.gmtime(data['posted']))
+        return result
+
+    def startSession(self):
+        self.uid=1
+
+    def postedTime(self,plurk):
+        return calendar.timegm(time.strptime(plurk['posted'],'%a, %d %b %Y %H:%M:%S GMT'))
+
+    def offsetTime(self,offset):
+        return calendar.timegm(time.strptime(offset,'%Y-%m-%dT%H:%M:%S'))
+
+    def getTimeline(self,plurks,limit):
+        plurks=list(plurks)
+        plurks.sort(key=self.postedTime,reverse=True)
+        return {'plurks':plurks[:int(limit)],'plurk_users':{}}
+
+    def _call_api(self,apirequest,parameters,https=False):
+        self.calls.append((apirequest,parameters))
+        offset=parameters.get('offset')
+        if apirequest == '/API/Polling/getPlurks':
+            return self.getTimeline([plurk for plurk in self.plurks
+                if offset is None or self.postedTime(plurk) > self.offsetTime(offset)],parameters['limit'])
+        if apirequest == '/API/Timeline/getUnreadPlurks':
+            return self.getTimeline([plurk for plurk in self.plurks if plurk['plurk_id'] in self.unread
+                and (offset is None or self.postedTime(plurk) < self.offsetTime(offset))],parameters['limit'])
+        if apirequest == '/API/Timeline/markAsRead':
+            self.unread.difference_update(eval(parameters['ids']))
+            return {'success_text':'ok'}
+        if apirequest == '/API/Responses/responseAdd':
+            self.added.append((parameters['plurk_id'],parameters['content']))
+            return {'id':len(self.added)}
+        if apirequest == '/API/Responses/get':
+            return {'responses':[],'friends':{},'responses_seen':0}
+        raise AssertionError('unexpected call of %s' % apirequest)
+
+    def getCalls(self,apirequest):
+        return [parameters for (request,parameters) in self.calls if request == apirequest]
+
+class KeyWordMatcherTest(TestCase):
+
+    chars=u'ab噗浪c'
+
+    def randomString(self,rand,size):
+        return u''.join([rand.choice(self.chars) for i in range(size)])
+
+    def test_same_as_find(self):
+        rand=random.Random(20101017)
+        for i in range(200):
+            keywords=[]
+            for j in range(rand.randint(0,8)):
+                keyWordList=[self.randomString(rand,rand.randint(0,3)) for k in range(rand.randint(0,3))]
+                keywords.append({'keyWordList':keyWordList,'answerList':[j]})
+            matcher=KeyWordMatcher(keywords)
+            for j in range(20):
+                string=self.randomString(rand,rand.randint(0,12))
+                self.assertEqual(matcher.match(string),findKeyWords(keywords,string))
+
+class IdiomTest(TestCase):
+
+    words=[u'一心一意',u'意氣風發',u'發憤圖強',u'一帆風順',u'強詞奪理',u'一心一意',u' ']
+
+    def setUp(self):
+        (handle,self.path)=tempfile.mkstemp('.dat')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        self.assertEqual(idiom.build(self.words,self.path),5)
+        data=idiom.IdiomData(self.path)
+        idioms=idiom.IdiomList(data)
+        expected=sorted(set([word for word in self.words if word.strip()]))
+        self.assertEqual(list(idioms),expected)
+        self.assertEqual(idioms[-1],expected[-1])
+        self.assertEqual(idioms.index(u'發憤圖強'),expected.index(u'發憤圖強'))
+        self.assert_(u'強詞奪理' in idioms)
+        self.assert_(u'強詞奪理'.encode('utf-8') in idioms)
+        self.assert_(u'一心二意' not in idioms)
+
+        byFirstChar=idiom.IdiomIndex(data)
+        self.assertEqual(byFirstChar[u'一'],(u'一帆風順',u'一心一意'))
+        self.assertEqual(byFirstChar.get(u'理'),None)
+        byLastChar=idiom.IdiomIndex(data,True)
+        self.assertEqual(byLastChar[u'意'],(u'一心一意',))
+        self.assertEqual(sorted(byLastChar.keys()),sorted([word[-1] for word in expected]))
+
+class RetryTest(TestCase):
+
+    def failing(self,errors):
+        calls=[]
+        def func():
+            calls.append(1)
+            if (len(calls)<=errors) is True:
+                raise IOError('failed')
+            return len(calls)
+        return func
+
+    def test_retry(self):
+        policy=RetryPolicy(maxAttempts=3,backoff=0,jitter=0)
+        self.assertEqual(policy.call(self.failing(2)),3)
+        self.assertRaises(RetryError,policy.call,self.failing(3))
+
+    def test_not_retried(self):
+        policy=RetryPolicy(backoff=0,retryOn=(ValueError,))
+        self.assertRaises(IOError,policy.call,self.failing(1))
+
+    def test_deadline(self):
+        #the first retry would wait past the deadline
+        policy=RetryPolicy(backoff=10,jitter=0,deadline=1)
+        try:
+            policy.call(self.failing(1))
+        except RetryError,error:
+            self.assert_(isinstance(error.error,IOError))
+        else:
+            self.fail('RetryError not raised')
+
+    def test_circuit_breaker(self):
+        breaker=CircuitBreaker(failureThreshold=2,resetTimeout=60)
+        policy=RetryPolicy(maxAttempts=2,backoff=0,jitter=0,breaker=breaker)
+        self.assertRaises(RetryError,policy.call,self.failing(2))
+        self.assertEqual(breaker.allow(),False)
+        self.assertRaises(CircuitOpenError,policy.call,self.failing(0))
+        #half open after the timeout, a success closes the circuit
+        breaker.openedAt-=60
+        self.assertEqual(policy.call(self.failing(0)),1)
+        self.assertEqual(breaker.openedAt,None)
+        self.assertEqual(breaker.failures,0)
+
+    def test_web_service_failure(self):
+        class DeadYouTubePlurk(FakePlurk):
+            def youtubeQueryResponse(self,plurk):
+                raise CircuitOpenError('Circuit is open, call refused')
+        bot=DeadYouTubePlurk([{'plurk_id':1,'posted':1300000000,'content':'想聽 yo'}])
+        #the chat answer is still sent
+        bot.respondPlurks(bot.plurks,[])
+        self.assertEqual(len(bot.added),1)
+
+class FakeResponse:
+
+    def __init__(self,status=200,body='{"success_text": "ok"}'):
+        self.status=status
+        self.body=body
+        self.will_close=False
+        self.msg=httplib.HTTPMessage(StringIO(''))
+
+    def read(self):
+        return self.body
+
+class FakeConnection:
+    """
+    Fails with the scripted error at 'connect', 'request' or 'getresponse'.
+    """
+
+    def __init__(self,pool,failAt=None,error=None):
+        self.pool=pool
+        self.failAt=failAt
+        self.error=error
+
+    def fail(self,step):
+        if (self.failAt==step) is True:
+            raise self.error
+
+    def connect(self):
+        self.fail('connect')
+
+    def request(self,method,url,body,headers):
+        self.fail('request')
+        self.pool.sent.append(url)
+
+    def getresponse(self):
+        self.fail('getresponse')
+        return FakeResponse()
+
+    def close(self):
+        pass
+
+class FakePool:
+
+    def __init__(self,idle=(),new=()):
+        self.idle=list(idle)
+        self.new=list(new)
+        self.sent=[]
+
+    def get_idle(self,https=False):
+        if (len(self.idle)>0) is True:
+            return FakeConnection(self,*self.idle.pop(0))
+        return None
+
+    def connect(self,https=False):
+        if (len(self.new)>0) is True:
+            return FakeConnection(self,*self.new.pop(0))
+        return FakeConnection(self)
+
+    def put(self,connection,https=False):
+        pass
+
+class PlurkAPISendTest(TestCase):
+
+    def call(self,pool,apirequest='/API/Responses/responseAdd'):
+        policy=RetryPolicy(maxAttempts=4,backoff=0,jitter=0,
+                           retryOn=(PlurklibError,httplib.HTTPException,socket.error),
+                           giveUpOn=(PlurklibUnknownResultError,))
+        api=PlurkAPI('key',pool,policy)
+        return api._call_api(apirequest,{'plurk_id':1})
+
+    def test_stale_connection(self):
+        #the server closed the idle connection, sent again on a new one
+        pool=FakePool(idle=[('getresponse',httplib.BadStatusLine(''))])
+        self.assertEqual(self.call(pool),{'success_text':'ok'})
+        self.assertEqual(len(pool.sent),2)
+
+    def test_timeout(self):
+        #a timed out post may have gone through, it is posted once
+        pool=FakePool(idle=[('getresponse',socket.timeout('timed out'))])
+        self.assertRaises(RetryError,self.call,pool)
+        self.assertEqual(len(pool.sent),1)
+
+    def test_new_connection(self):
+        #a new connection that fails is not used to send again
+        pool=FakePool(new=[('getresponse',httplib.BadStatusLine(''))])
+        self.assertRaises(RetryError,self.call,pool)
+        self.assertEqual(len(pool.sent),1)
+        #but a request that can be sent twice is retried
+        pool=FakePool(new=[('getresponse',httplib.BadStatusLine(''))])
+        self.assertEqual(self.call(pool,'/API/Timeline/getPlurks'),{'success_text':'ok'})
+        self.assertEqual(len(pool.sent),2)
+
+    def test_not_connected(self):
+        #nothing was sent, so the post is retried
+        pool=FakePool(new=[('connect',socket.error('refused'))])
+        self.assertEqual(self.call(pool),{'success_text':'ok'})
+        self.assertEqual(len(pool.sent),1)
+
+class LRUCacheTest(TestCase):
+
+    def test_eviction(self):
+        cache=LRUCache(maxSize=2)
+        cache.set('a',1)
+        cache.set('b',2)
+        self.assertEqual(cache.get('a'),1)
+        cache.set('c',3)
+        self.assertEqual(len(cache),2)
+        self.assertEqual(cache.get('b'),None)
+        self.assertEqual(cache.get('a'),1)
+        self.assertEqual(cache.get('c'),3)
+        #replacing a key doesn't evict anything
+        cache.set('a',4)
+        self.assertEqual(len(cache),2)
+        self.assertEqual(cache.get('a'),4)
+        self.assertEqual(cache.get('c'),3)
+
+    def test_ttl(self):
+        cache=LRUCache()
+        cache.set('a',1,-1)
+        self.assertEqual(cache.get('a','expired'),'expired')
+        self.assertEqual(len(cache),0)
+
+class CounterShardTest(TestCase):
+
+    def setUp(self):
+        #the counts are cached by name, a name is not used twice
+        self.name='test:%s' % uuid.uuid4().hex
+        self.counter=models.CounterShard()
+
+    def tearDown(self):
+        db.delete_all(*models.CounterShard.all().filter('name ==',self.name).fetchall())
+        db.delete_all(*models.Counter.all().filter('name ==',self.name).fetchall())
+        db.commit()
+
+    def addShard(self,index,count):
+        shard=models.CounterShard(name=self.name,shard=index,count=count)
+        shard.save()
+        db.commit()
+
+    def test_count(self):
+        for i in range(25):
+            self.counter.increase({'name':self.name})
+        self.counter.decrease({'name':self.name})
+        self.assertEqual(self.counter.getCount({'name':self.name}),24)
+        self.assertEqual(self.counter.getCounts({'names':[self.name,self.name+':none']}),{self.name:24,self.name+':none':0})
+        self.assert_(models.CounterShard.all().filter('name ==',self.name).count() <= models.COUNTER_SHARDS)
+
+    def test_duplicated_shards(self):
+        #two racing updates created shard 3
+        self.addShard(3,1)
+        self.addShard(3,1)
+        self.assertEqual(self.counter.getCount({'name':self.name}),2)
+        for i in range(30):
+            self.counter.increase({'name':self.name})
+        self.assertEqual(self.counter.getCount({'name':self.name}),32)
+        self.assertEqual(self.counter.getCounts({'names':[self.name]}),{self.name:32})
+
+    def test_seed(self):
+        #the count of an old Counter is moved to the shards
+        models.Counter(name=self.name,count=5).save()
+        db.commit()
+        self.assertEqual(self.counter.getCount({'name':self.name}),5)
+        self.counter.increase({'name':self.name})
+        self.assertEqual(self.counter.getCount({'name':self.name}),6)
+        self.assertEqual(models.Counter.all().filter('name ==',self.name).count(),0)
+
+class APIKeyRotatorTest(TestCase):
+
+    def setUp(self):
+        prefix='test:%s:' % uuid.uuid4().hex
+        self.rotator=APIKeyRotator([prefix+'a',prefix+'b',prefix+'c'])
+
+    def tearDown(self):
+        names=[self.rotator.getCounterName(key) for key in self.rotator.keys]
+        db.delete_all(*models.CounterShard.all().filter('name in',names).fetchall())
+        db.commit()
+
+    def test_least_used(self):
+        (a,b,c)=self.rotator.keys
+        self.assertEqual(self.rotator.getKey(),a)
+        self.rotator.addUsage(a,5)
+        self.rotator.addUsage(b,2)
+        self.rotator.addUsage(c,3)
+        self.assertEqual(self.rotator.getUsage(),{a:5,b:2,c:3})
+        self.assertEqual(self.rotator.getKey(),b)
+        self.rotator.addUsage(b,2)
+        self.assertEqual(self.rotator.getKey(),c)
+
+    def test_window(self):
+        #the usage of the previous window is not counted
+        (a,b,c)=self.rotator.keys
+        self.rotator.addUsage(a,5)
+        self.rotator.quotaWindow=60*60
+        self.assertEqual(self.rotator.getUsage()[a],0)
+        self.rotator.quotaWindow=24*60*60
+
+class KeyWordTest(TestCase):
+
+    def setUp(self):
+        self.keyWord=models.KeyWord()
+        self.keys=[]
+
+    def tearDown(self):
+        self.keyWord.deleteKeyWords(self.keys)
+
+    def addRules(self,rules):
+        keyWordList=[]
+        for (keywords,answers) in rules:
+            keyWordList.append({'key':None,'keywords':keywords,'answers':answers})
+        keys=self.keyWord.updateKeyWord({'keyWordList':keyWordList})
+        self.keys.extend(keys)
+        return keys
+
+    def countEntries(self,keys):
+        return models.KeyWordEntry.all().filter('rule in',keys).count()
+
+    def getRuleCount(self):
+        return models.CounterShard().getCount({'name':'KeyWord'})
+
+    def test_update_delete(self):
+        count=self.getRuleCount()
+        generation=self.keyWord.getGeneration()
+        keys=self.addRules([([u'早安'],[u'早']),([u'晚安',u'睡'],[u'晚']),([u'吃'],[u'餓'])])
+        self.assertEqual(len(keys),3)
+        self.assertEqual(self.countEntries(keys),4)
+        self.assertEqual(self.getRuleCount(),count+3)
+
+        #the rules are deleted with their entries, a missing rule is skipped
+        deleted=self.keyWord.deleteKeyWords(keys[:2])
+        self.assertEqual(sorted(deleted),sorted(keys[:2]))
+        self.assertEqual(self.keyWord.deleteKeyWords(keys[:1]),[])
+        self.assertEqual(models.KeyWord.all().filter('key in',keys).count(),1)
+        self.assertEqual(self.countEntries(keys),1)
+        self.assertEqual(self.getRuleCount(),count+1)
+        self.assert_(self.keyWord.getGeneration() > generation)
+
+    def test_entries(self):
+        (a,b)=self.addRules([([u'早安'],[u'早']),([u'晚',u'睡'],[u'晚'])])
+        entries=models.KeyWordEntry.all().filter('rule ==',b).order('position').fetchall()
+        self.assertEqual([(entry.keyWord,entry.token) for entry in entries],[(u'晚',u'晚'),(u'睡',u'睡')])
+        #a changed rule gets new entries
+        self.keyWord.updateKeyWord({'keyWordList':[{'key':b,'keywords':[u'吃飯'],'answers':[u'餓']}]})
+        entries=models.KeyWordEntry.all().filter('rule ==',b).fetchall()
+        self.assertEqual([(entry.keyWord,entry.token) for entry in entries],[(u'吃飯',u'吃飯')])
+        self.assertEqual(self.countEntries([a]),1)
+
+    def test_candidates(self):
+        (a,b,c)=self.addRules([([u'早安'],[u'早']),([u'晚',u'睡'],[u'晚']),([u'吃飯'],[u'餓'])])
+        string=u'早安你好睡晚'
+        candidates=[rule for rule in self.keyWord.getCandidates(string) if rule['key'] in (a,b,c)]
+        self.assertEqual(sorted([rule['key'] for rule in candidates]),sorted([a,b]))
+        #the keywords of b are not in order
+        self.assertEqual(KeyWordMatcher(candidates).match(string),[{'totalFound':1,'answerList':[u'早']}])
+
+    def test_page(self):
+        prefix='test%s' % uuid.uuid4().hex
+        self.addRules([([prefix+u'c'],[u'c']),([prefix.upper()+u'a',u'x'],[u'a']),([prefix+u'b'],[u'b']),([u'x'+prefix],[u'x'])])
+        #the rules of the prefix by their first keyword in lower case
+        page=self.keyWord.getPage({'limit':2,'prefix':prefix.upper()})
+        self.assertEqual([rule['answerList'] for rule in page['keyWordList']],[[u'a'],[u'b']])
+        self.assertNotEqual(page['cursor'],None)
+        page=self.keyWord.getPage({'limit':2,'prefix':prefix,'cursor':page['cursor']})
+        self.assertEqual([rule['answerList'] for rule in page['keyWordList']],[[u'c']])
+        self.assertEqual(page['cursor'],None)
+        #the cursor pages through all the rules
+        found=[]
+        cursor=None
+        while True:
+            page=self.keyWord.getPage({'limit':2,'cursor':cursor})
+            found.extend([rule['key'] for rule in page['keyWordList']])
+            cursor=page['cursor']
+            if cursor is None:
+                break
+        self.assertEqual(len(found),len(set(found)))
+        self.assert_(set(self.keys) <= set(found))
+
+    def test_backfill(self):
+        #a rule saved before searchKey existed
+        rule=models.KeyWord(keyWordList='["Hello"]',answerList='["hi"]')
+        rule.save()
+        db.commit()
+        self.keys.append(rule.key)
+        start=0
+        while True:
+            done=self.keyWord.backfillSearchKey({'limit':100,'from':start})
+            if (done>0) is not True:
+                break
+            start+=done
+        searchKey=models.KeyWord.get(rule.key).searchKey
+        self.assertEqual(searchKey.split(u'\t')[0],u'hello')
+
+    def test_delete_all_models(self):
+        #a batch of several models is deleted from the table of each model
+        name='test:%s' % uuid.uuid4().hex
+        records=[models.Counter(name=name),models.CounterShard(name=name),models.Counter(name=name)]
+        db.save_all(*records)
+        db.delete_all(*records)
+        db.commit()
+        self.assertEqual(models.Counter.all().filter('name ==',name).count(),0)
+        self.assertEqual(models.CounterShard.all().filter('name ==',name).count(),0)
+
+class PollTest(TestCase):
+
+    base=1300000000
+
+    def makeBot(self):
+        #a burst of 120 new plurks, 2 a second, and an older plurk with new responses
+        plurks=[{'plurk_id':i,'posted':self.base+100+i//2} for i in range(120)]
+        plurks.append({'plurk_id':999,'posted':self.base+50,'response_count':3})
+        return FakePlurk(plurks)
+
+    def getOffset(self,seconds):
+        return time.strftime('%Y-%m-%dT%H:%M:%S',time.gmtime(self.base+seconds))
+
+    def getIDs(self,result):
+        return set([plurk['plurk_id'] for plurk in result['plurks']])
+
+    def test_burst(self):
+        bot=self.makeBot()
+        result=bot.pollPlurks(self.getOffset(99))
+        self.assertEqual(self.getIDs(result),set(range(120)+[999]))
+        self.assertEqual(bot.offset,self.getOffset(159))
+
+    def test_incomplete_burst(self):
+        #the rest of the burst is read by the next poll, from the same offset
+        bot=self.makeBot()
+        result=bot.pollPlurks(self.getOffset(99),50,1)
+        self.assertEqual(len(result['plurks']),50)
+        self.assertEqual(bot.offset,self.getOffset(99))
+
+    def test_same_second(self):
+        #the plurks of the second of the offset are polled again
+        bot=self.makeBot()
+        bot.unread=set()
+        result=bot.pollPlurks(self.getOffset(159))
+        self.assertEqual(self.getIDs(result),set([118,119]))
+        self.assertEqual(bot.offset,self.getOffset(159))
+
+    def test_tick(self):
+        bot=FakePlurk([{'plurk_id':1,'posted':self.base},{'plurk_id':2,'posted':self.base+1,'owner_id':1}])
+        bot.callResponder([],self.getOffset(-10))
+        self.assertEqual([plurkID for (plurkID,content) in bot.added],[1])
+        #the responded and the skipped plurks are marked as read with one call
+        calls=bot.getCalls('/API/Timeline/markAsRead')
+        self.assertEqual(len(calls),1)
+        self.assertEqual(sorted(eval(calls[0]['ids'])),[1,2])
+        self.assertEqual(calls[0]['note_position'],True)
+        #nothing new for the next tick
+        bot.calls=[]
+        self.assertEqual(bot.callResponder([],bot.offset)['plurks'][0]['plurk_id'],2)
+        self.assertEqual(bot.added,[(1,bot.added[0][1])])
+        self.assertEqual(len(bot.getCalls('/API/Responses/responseAdd')),0)
+
+class FanOutTest(TestCase):
+
+    base=1300000000
+
+    def setUp(self):
+        #the cron job of the fan-out mode with the local task queue
+        self.saved=(views.Plurk,views.taskQueue,views.plurkTaskQueue,views.plurkUsername)
+        self.timeline=FakePlurk([{'plurk_id':i,'posted':self.base+i} for i in range(7)]
+            +[{'plurk_id':7,'posted':self.base+7,'owner_id':1}])
+        self.bots=[]
+        self.queue=LocalTaskQueue()
+        self.queue.register('/respond-plurks',views.respondPlurksTask)
+        views.Plurk=self.makePlurk
+        views.taskQueue=self.queue
+        views.plurkTaskQueue=True
+        views.plurkUsername='test:%s' % uuid.uuid4().hex
+
+    def tearDown(self):
+        offsets=models.PollingOffset.all().filter('name ==',views.plurkUsername).fetchall()
+        if (len(offsets)>0) is True:
+            db.delete_all(*offsets)
+            db.commit()
+        (views.Plurk,views.taskQueue,views.plurkTaskQueue,views.plurkUsername)=self.saved
+
+    def makePlurk(self,apiKey,username,password,concurrency):
+        #the cron job and the tasks share the timeline and the ledger
+        bot=FakePlurk((),concurrency,self.timeline.ledger.cache)
+        bot.plurks=self.timeline.plurks
+        bot.unread=self.timeline.unread
+        bot.calls=self.timeline.calls
+        bot.added=self.timeline.added
+        self.bots.append(bot)
+        return bot
+
+    def test_cron(self):
+        views.RunCronJob()
+        #the cron job and a task per 5 plurks
+        self.assertEqual(len(self.bots),3)
+        self.assertEqual(sorted([plurkID for (plurkID,content) in self.timeline.added]),range(7))
+        self.assertEqual(self.timeline.unread,set())
+        calls=self.timeline.getCalls('/API/Timeline/markAsRead')
+        self.assertEqual([len(eval(call['ids'])) for call in calls],[1,5,2])
+        self.assertEqual(eval(calls[0]['ids']),[7])
+        offset=models.PollingOffset().getOffset({'name':views.plurkUsername})
+        self.assertEqual(offset,time.strftime('%Y-%m-%dT%H:%M:%S',time.gmtime(self.base+7)))
+        #the next tick has nothing to answer
+        views.RunCronJob()
+        self.assertEqual(len(self.timeline.added),7)
+
+    def test_retried_task(self):
+        self.queue.add('/respond-plurks',{'api_key':'key','plurks':json.dumps(self.timeline.plurks[:2])})
+        self.queue.add('/respond-plurks',{'api_key':'key','plurks':json.dumps(self.timeline.plurks[:2])})
+        self.queue.runTasks()
+        #the plurks are answered once
+        self.assertEqual(sorted([plurkID for (plurkID,content) in self.timeline.added]),[0,1])
+
+class ResponseLedgerTest(TestCase):
+
+    def setUp(self):
+        self.cache=ClaimCache()
+        self.ledger=ResponseLedger(self.cache)
+
+    def test_responded(self):
+        self.ledger.setResponded(1,3)
+        self.assertEqual(self.ledger.getResponded([1,2]),{1:3,2:None})
+
+    def test_claim(self):
+        plurk={'plurk_id':1,'response_count':0}
+        self.assertEqual(self.ledger.claim(plurk),True)
+        self.assertEqual(self.ledger.claim(plurk),False)
+        #a new response can be claimed again
+        self.assertEqual(self.ledger.claim({'plurk_id':1,'response_count':1}),True)
+        self.ledger.release(plurk)
+        self.assertEqual(self.ledger.claim(plurk),True)
+
+    def test_overlapping_ticks(self):
+        plurks=[{'plurk_id':1,'posted':1300000000},{'plurk_id':2,'posted':1300000001}]
+        first=FakePlurk(plurks,cache=self.cache)
+        second=FakePlurk(plurks,cache=self.cache)
+        #the first tick is still answering plurk 1
+        first.ledger.claim(first.plurks[0])
+        self.assertEqual(second.respondPlurks(second.plurks,[]),[2])
+        self.assertEqual([plurkID for (plurkID,content) in second.added],[2])
+        self.assertEqual(second.unread,set([1]))
+        #the answer is in the ledger, no API call is needed to know it
+        self.assertEqual(first.isResponded(first.plurks[1]),True)
+        self.assertEqual(first.getCalls('/API/Responses/get'),[])
+
+    def test_failed_plurk(self):
+        class FailingPlurk(FakePlurk):
+            def respondPlurk(self,plurk,keywords):
+                raise IOError('failed')
+        bot=FailingPlurk([{'plurk_id':1,'posted':1300000000}],cache=self.cache)
+        self.assertRaises(IOError,bot.respondPlurks,bot.plurks,[])
+        #a retry answers it
+        retry=FakePlurk([{'plurk_id':1,'posted':1300000000}],cache=self.cache)
+        self.assertEqual(retry.respondPlurks(retry.plurks,[]),[1])
+        self.assertEqual(len(retry.added),1)
+
+class QueryTest(TestCase):
+
+    names=['test:a','test:b','test:c']
+
+    def setUp(self):
+        self.counters=[
+            models.Counter(name='test:a',count=1),
+            models.Counter(name='test:a',count=2),
+            models.Counter(name='test:b',count=1),
+            models.Counter(name='test:c',count=3),
+        ]
+        db.save_all(*self.counters)
+        db.commit()
+
+    def tearDown(self):
+        db.delete_all(*[counter for counter in models.Counter.all().filter('name in',self.names)])
+        db.commit()
+
+    def query(self):
+        return models.Counter.all().filter('name in',self.names)
+
+    def test_iterate(self):
+        counts=[counter.count for counter in self.query().iterate(3)]
+        self.assertEqual(sorted(counts),[1,1,2,3])
+        self.assertEqual(len(list(self.query())),4)
+        counts=[counter.count for counter in self.query().order('-count').iterate(3)]
+        self.assertEqual(counts,[3,2,1,1])
+
+    def test_iterate_keys(self):
+        #a key filter is read chunk by chunk too
+        keys=[counter.key for counter in self.counters]
+        result=[counter.key for counter in models.Counter.all().filter('key in',keys).iterate(3)]
+        self.assertEqual(sorted(result),sorted(keys))
+
+    def test_update(self):
+        self.assertEqual(self.query().filter('name ==','test:a').update(count=5),2)
+        self.assertEqual(self.query().filter('count ==',5).count(),2)
+        self.assertEqual(self.query().filter('name ==','test:d').update(count=5),0)
+
+    def test_delete(self):
+        self.assertEqual(self.query().filter('count ==',1).delete(),2)
+        self.assertEqual(self.query().count(),2)
+
+    def test_count_exists(self):
+        self.assertEqual(self.query().count(),4)
+        self.assertEqual(self.query().filter('count ==',3).exists(),True)
+        self.assertEqual(self.query().filter('count ==',4).exists(),False)
+        keys=[counter.key for counter in self.counters[:2]]
+        self.assertEqual(models.Counter.all().filter('key in',keys).count(),2)
+
+    def test_shared_filters(self):
+        query=self.query()
+        first=query.filter('count ==',1)
+        second=query.filter('count ==',2)
+        #the derived queries point to the filters of the query they came from
+        self.assert_(first._Query__qset.parent is query._Query__qset)
+        self.assert_(second._Query__qset.parent is query._Query__qset)
+        self.assertEqual(first.count(),2)
+        self.assertEqual(second.count(),1)
+        self.assertEqual(query.count(),4)
+
+    def test_cached_validation(self):
+        q=db.Q('count ==',1)
+        validated=q.validate(models.Counter)
+        self.assert_(q.validate(models.Counter) is validated)
+        self.assertEqual(q.items,[('count','==',1)])
+
+    def countOr(self):
+        return self.query().filter(db.Q('name ==','test:a')|db.Q('count ==',1)).count()
+
+    def countAnd(self):
+        return self.query().filter('name ==','test:a').filter('count ==',1).count()
+
+    def test_plan_cache(self):
+        #only the relational engines keep query plans
+        if hasattr(database,'plan_stats') is False:
+            return
+        self.countAnd()
+        hits=database.plan_stats()['hits']
+        self.assertEqual(self.countAnd(),1)
+        self.assertEqual(database.plan_stats()['hits'],hits+1)
+
+    def test_same_shape(self):
+        #only the relational engines keep query plans
+        if hasattr(database,'plan_stats') is False:
+            return
+        #an OR and an AND of the same filters must not share a plan
+        for i in range(2):
+            self.assertEqual(self.countOr(),3)
+            self.assertEqual(self.countAnd(),1)
+        for i in range(2):
+            self.assertEqual(self.countAnd(),1)
+            self.assertEqual(self.countOr(),3)
@@ -1,67 +1,132 @@
-# -*- coding: utf-8 -*-
-from kalapy import web
-from kalapy.web import request
-import models
-from config import PLURK_PASSWORD as plurkPassword,PLURK_USERNAME as plurkUsername,PLURK_API_KEY as plurkAPIKey
-from plurk import Plurk
-
-
-@web.route('/')
-def KeyWordManage():
-    keyWordObj=models.KeyWord()
-    keyWordList=keyWordObj.getDecoded({'from':0})
-    return web.render_template('keyword-manage.html',mainKeyWordList=keyWordList)
-
-@web.route('/update-keyword', methods=('POST',))
-def KeyWordUpdate():
-    keyWordKeys=request.form.getlist('keyword_keys')
-    if keyWordKeys is not None:
-        keyWordObj=models.KeyWord()
-        data={'keyWordList':[]}
-        for key in keyWordKeys:
-            tempList={}
-            tempList['keywords']=filter(None,request.form.getlist('k_'+key))
-            tempList['answers']=filter(None,request.form.getlist('a_'+key))
-            tempList['key']=key
-            if ((len(tempList['keywords']) > 0) and (len(tempList['answers']) > 0) ) is not True:
-                keyWordObj.deleteKeyWord(key)
-            else:
-                data['keyWordList'].append(tempList)
-            
-        if (len(data['keyWordList']) > 0) is True:
-            keyWordObj.updateKeyWord(data)
-            
-    return web.redirect('/')
-    
-@web.route('/run-cron-job')
-def RunCronJob():
-    
-    APIKey=getAPIKey(plurkAPIKey)
-    plurk=Plurk(APIKey,plurkUsername,plurkPassword)
-    keyWordList=models.KeyWord()
-    keyWords=keyWordList.getDecoded()
-    result=plurk.callResponder(keyWords)
-    counter=models.Counter()
-    counterData={'name':APIKey,'value':plurk.APICallTimes,'default':plurk.APICallTimes}
-    counter.updateCount(counterData)
-    return str(result)
-    
-def getAPIKey(plurkAPIKey):
-    
-    counter=models.Counter()
-    APIKeyToUse=None
-    count=None
-    for keyName in plurkAPIKey:
-        APIKey=counter.all().filter('name ==', keyName).first()
-        if APIKey is not None:
-            if APIKey.count < count or count is None:
-                APIKeyToUse=APIKey.name
-                count=APIKey.count
-        else:
-            return keyName
-    
-    return APIKeyToUse
-    
-    
-
-    
\ No newline at end of file
+# -*- coding: utf-8 -*-
+from kalapy import web
+from kalapy.web import request,json
+import models
+from config import PLURK_PASSWORD as plurkPassword,PLURK_USERNAME as plurkUsername,PLURK_API_KEY as plurkAPIKey
+from config import PLURK_CONCURRENCY as plurkConcurrency,PLURK_API_QUOTA_WINDOW as plurkAPIQuotaWindow
+from config import KEYWORD_PAGE_SIZE as keyWordPageSize
+from config import PLURK_TASK_QUEUE as plurkTaskQueue,PLURK_TASK_BATCH_SIZE as plurkTaskBatchSize
+from plurk import Plurk
+from apikey import APIKeyRotator
+from tasks import taskQueue
+
+
+@web.route('/')
+def KeyWordManage():
+    keyWordObj=models.KeyWord()
+    page=keyWordObj.getPage(getPageArg())
+    return web.render_template('keyword-manage.html',mainKeyWordList=page['keyWordList'],cursor=page['cursor'],prefix=request.args.get('prefix',''),start=0)
+
+@web.route('/keyword-page')
+def KeyWordPage():
+    keyWordObj=models.KeyWord()
+    page=keyWordObj.getPage(getPageArg())
+    html=web.render_template('keyword-list.html',mainKeyWordList=page['keyWordList'],start=request.args.get('start',0,type=int))
+    return web.jsonify(html=html,cursor=page['cursor'])
+
+def getPageArg():
+    limit=request.args.get('limit',keyWordPageSize,type=int)
+    if (limit>0 and limit<=500) is not True:
+        limit=keyWordPageSize
+    return {
+        'limit':limit,
+        'cursor':request.args.get('cursor'),
+        'prefix':request.args.get('prefix'),
+    }
+
+@web.route('/update-keyword', methods=('POST',))
+def KeyWordUpdate():
+    keyWordKeys=request.form.getlist('keyword_keys')
+    if keyWordKeys is not None:
+        keyWordObj=models.KeyWord()
+        data={'keyWordList':[]}
+        deleted=[]
+        for key in keyWordKeys:
+            tempList={}
+            tempList['keywords']=filter(None,request.form.getlist('k_'+key))
+            tempList['answers']=filter(None,request.form.getlist('a_'+key))
+            tempList['key']=key
+            if ((len(tempList['keywords']) > 0) and (len(tempList['answers']) > 0) ) is not True:
+                deleted.append(key)
+            else:
+                data['keyWordList'].append(tempList)
+            
+        if (len(deleted) > 0) is True:
+            keyWordObj.deleteKeyWords(deleted)
+        if (len(data['keyWordList']) > 0) is True:
+            keyWordObj.updateKeyWord(data)
+            
+    return web.redirect('/')
+    
+@web.route('/backfill-search-keys')
+def BackfillSearchKeys():
+    """ Migrate the rules to searchKey a batch at a time, call it again with the returned from until done """
+    keyWordObj=models.KeyWord()
+    start=request.args.get('from',0,type=int)
+    done=keyWordObj.backfillSearchKey({'limit':100,'from':start})
+    if (done>0) is True:
+        return 'from=%d' % (start+done)
+    return 'done'
+    
+@web.route('/rebuild-keyword-entries')
+def RebuildKeyWordEntries():
+    """ Migrate the rules to KeyWordEntry a batch at a time, call it again with the returned from until done """
+    entry=models.KeyWordEntry()
+    start=request.args.get('from',0,type=int)
+    done=entry.rebuild({'limit':100,'from':start})
+    if (done>0) is True:
+        return 'from=%d' % (start+done)
+    return 'done'
+    
+@web.route('/run-cron-job')
+def RunCronJob():
+    
+    keyRotator=APIKeyRotator(plurkAPIKey,plurkAPIQuotaWindow)
+    APIKey=keyRotator.getKey()
+    plurk=Plurk(APIKey,plurkUsername,plurkPassword,plurkConcurrency)
+    pollingOffset=models.PollingOffset()
+    offset=pollingOffset.getOffset({'name':plurkUsername})
+    if plurkTaskQueue is True:
+        #only poll here, the plurks are responded by the /respond-plurks tasks
+        result=plurk.pollPlurks(offset)
+        plurks=plurk.getPlurksToRespond(result)
+        plurk.markSkippedAsRead(result,plurks)
+        for start in range(0,len(plurks),plurkTaskBatchSize):
+            params={'api_key':APIKey,'plurks':json.dumps(plurks[start:start+plurkTaskBatchSize])}
+            taskQueue.add('/respond-plurks',params)
+    else:
+        keyWordList=models.KeyWord()
+        keyWords=keyWordList.getMatcher()
+        result=plurk.callResponder(keyWords,offset)
+    if plurk.offset is not None:
+        pollingOffset.setOffset({'name':plurkUsername,'offset':plurk.offset})
+    keyRotator.addUsage(APIKey,plurk.APICallTimes)
+    taskQueue.runTasks()
+    return str(result)
+
+@web.route('/respond-plurks', methods=('POST',))
+def RespondPlurks():
+    #App Engine removes the header from the requests not sent by the task queue
+    if request.headers.get('X-AppEngine-QueueName') is None:
+        web.abort(403)
+    return respondPlurksTask(request.form)
+
+def respondPlurksTask(params):
+    """
+    Task of the fan-out mode
+    Acceptable list structures:{
+        api_key:API key the plurks were polled with,
+        plurks:plurks to respond in JSON
+    }
+    """
+    APIKey=params['api_key']
+    plurk=Plurk(APIKey,plurkUsername,plurkPassword,plurkConcurrency)
+    #the matcher is cached by rule generation, in memcache and on the instance
+    keyWordList=models.KeyWord()
+    keyWords=keyWordList.getMatcher()
+    result=plurk.respondPlurks(json.loads(params['plurks']),keyWords)
+    keyRotator=APIKeyRotator(plurkAPIKey,plurkAPIQuotaWindow)
+    keyRotator.addUsage(APIKey,plurk.APICallTimes)
+    return str(result)
+
+taskQueue.register('/respond-plurks',respondPlurksTask)
@@ -1,46217 +1,259 @@
-# -*- coding: utf-8 -*-
-idioms=[
-u'阿保之功',
-u'阿保之勞',
-u'阿鼻地獄',
-u'阿鼻叫喚',
-u'阿狗阿貓',
-u'阿姑阿翁',
-u'阿嬌金屋',
-u'阿匼取容',
-u'阿郎雜碎',
-u'阿貓阿狗',
-u'阿娜多姿',
-u'阿娜妩媚',
-u'阿毗地獄',
-u'阿平絕倒',
-u'阿婆生兒子',
-u'阿世徇俗',
-u'阿順取容',
-u'阿私所好',
-u'阿私下比',
-u'阿魏無真',
-u'阿意苟合',
-u'阿旨順情',
-u'哀哀父母',
-u'挨挨搶搶',
-u'哀哀欲絕',
-u'挨挨拶拶',
-u'偷龍轉鳳',
-u'哀兵必勝',
-u'周而復始',
-u'愛博而情不專',
-u'愛不忍釋',
-u'愛不釋手',
-u'愛财不愛命',
-u'愛才憐弱',
-u'愛才如渴',
-u'愛财如命',
-u'愛才若渴',
-u'挨打受罵',
-u'挨打受氣',
-u'愛戴高帽子',
-u'挨餓受凍',
-u'哀而不傷',
-u'艾發衰容',
-u'愛非其道',
-u'挨風緝縫',
-u'捱風緝縫',
-u'愛富嫌貧',
-u'哀感天地',
-u'哀感頑豔',
-u'哀感中年',
-u'哀告賓服',
-u'愛國如家',
-u'愛鶴失衆',
-u'愛河永浴',
-u'哀鴻遍地',
-u'哀鴻遍野',
-u'哀鴻滿路',
-u'哀毀骨立',
-u'哀毀瘠立',
-u'挨家挨戶',
-u'挨家按戶',
-u'挨肩并足',
-u'挨肩擦膀',
-u'挨肩擦背',
-u'挨肩擦臉',
-u'挨肩搭背',
-u'挨肩叠背',
-u'挨肩疊足',
-u'僾見忾聞',
-u'愛叫的狗不咬人',
-u'哀矜懲創',
-u'哀矜勿喜',
-u'愛口識羞',
-u'愛老慈幼',
-u'哀梨并剪',
-u'愛禮存羊',
-u'哀梨蒸食',
-u'愛毛反裘',
-u'暧昧不明',
-u'暧昧之情',
-u'暧昧之事',
-u'挨門挨戶',
-u'挨門逐戶',
-u'愛民如子',
-u'愛民恤物',
-u'哀莫大于心死',
-u'愛莫能助',
-u'愛莫爲助',
-u'愛莫之助',
-u'愛莫助之',
-u'礙難從命',
-u'礙難遵命',
-u'愛鬧的孩子吃奶多',
-u'騃女癡兒',
-u'騃女癡男',
-u'哀戚之情',
-u'愛錢如命',
-u'矮牆淺屋',
-u'愛妾換馬',
-u'愛親做親',
-u'哀窮悼屈',
-u'藹然可親',
-u'藹然仁者',
-u'矮人觀場',
-u'愛人好士',
-u'矮人看場',
-u'矮人看戲',
-u'愛人利物',
-u'愛人以德',
-u'愛日惜力',
-u'愛如已出',
-u'愛如珍寶',
-u'挨三頂四',
-u'挨三頂五',
-u'挨山塞海',
-u'哀聲歎氣',
-u'愛生惡死',
-u'礙手礙腳',
-u'哀絲豪肉',
-u'哀絲豪竹',
-u'挨絲切縫',
-u'哀思如潮',
-u'哀死事生',
-u'愛素好古',
-u'哀天叫地',
-u'騃童鈍夫',
-u'哀恸頑豔',
-u'哀痛欲絕',
-u'愛屋及烏',
-u'愛物仁民',
-u'哀喜交并',
-u'愛惜羽毛',
-u'愛賢念舊',
-u'矮小精悍',
-u'愛遠惡近',
-u'愛月不梳頭',
-u'哀樂相生',
-u'哀樂中節',
-u'愛則加諸膝',
-u'愛則加諸膝惡則墜諸淵',
-u'愛憎分明',
-u'愛憎無常',
-u'挨着勤的沒懶的',
-u'愛者如寶',
-u'愛之如寶',
-u'愛之炫光',
-u'愛之欲其生',
-u'愛之欲其生惡之欲其死',
-u'矮子觀場',
-u'矮子看戲',
-u'矮子看戲随人道好',
-u'矮子面前不說短話',
-u'愛子先愛妻',
-u'礙足礙手',
-u'安安穩穩',
-u'安邦定國',
-u'安邦治國',
-u'按兵不動',
-u'按兵不舉',
-u'暗冰反射',
-u'按兵束甲',
-u'案兵無動',
-u'安步當車',
-u'按部就班',
-u'按部就隊',
-u'鞍不離馬',
-u'鞍不離馬背',
-u'鞍不離馬背甲不離将身',
-u'鞍不離馬甲不離身',
-u'安不忘危',
-u'安不忘虞',
-u'暗察明訪',
-u'安常處順',
-u'安常履順',
-u'安常守分',
-u'安常守故',
-u'安常習故',
-u'暗潮湖岸',
-u'暗潮營地',
-u'安車蒲輪',
-u'安車軟輪',
-u'暗錘打人',
-u'暗淡幻象',
-u'黯淡無光',
-u'暗鬥明争',
-u'暗度陳倉',
-u'暗度金針',
-u'案牍勞形',
-u'安堵樂業',
-u'安堵如常',
-u'安堵如故',
-u'安度晚年',
-u'案牍之勞',
-u'安分潔已',
-u'安份守己',
-u'安分守理',
-u'安分守命',
-u'安分守已',
-u'安分守拙',
-u'安分随時',
-u'安分循理',
-u'安分知足',
-u'安富恤貧',
-u'安富恤窮',
-u'暗縛之指',
-u'安富尊榮',
-u'暗鋼飛刀',
-u'岸谷之變',
-u'安故重遷',
-u'安國富民',
-u'安國寧家',
-u'黯晦消沉',
-u'安魂定魄',
-u'按迹循蹤',
-u'按甲不出',
-u'按甲不動',
-u'安家樂業',
-u'安家立業',
-u'安家落戶',
-u'按甲寝兵',
-u'按甲休兵',
-u'鞍甲之勞',
-u'案劍瞋目',
-u'暗箭明槍',
-u'暗劍難防',
-u'暗箭傷人',
-u'暗箭中人',
-u'暗礁險灘',
-u'安居樂俗',
-u'安居樂業',
-u'安居慮危',
-u'按軍不動',
-u'安老懷少',
-u'安樂世界',
-u'谙練通達',
-u'安良除暴',
-u'暗綠稀紅',
-u'鞍馬勞頓',
-u'鞍馬勞倦',
-u'鞍馬勞困',
-u'鞍馬勞神',
-u'鞍馬之勞',
-u'俺買酒他先醉',
-u'安眉帶眼',
-u'安民濟物',
-u'安民則惠',
-u'按名責實',
-u'按捺不下',
-u'按捺不住',
-u'安難樂死',
-u'安内攮外',
-u'安内攘外',
-u'按辔徐行',
-u'安貧樂道',
-u'安貧樂贱',
-u'安貧守道',
-u'安貧知命',
-u'暗氣暗惱',
-u'安其所習',
-u'鞍前馬後',
-u'按強扶弱',
-u'按強助弱',
-u'岸然道貌',
-u'黯然魂銷',
-u'安然如故',
-u'黯然傷神',
-u'黯然神傷',
-u'黯然失色',
-u'黯然無色',
-u'安然無事',
-u'安然無恙',
-u'黯然銷魂',
-u'安忍無親',
-u'安忍之懷',
-u'安忍阻兵',
-u'安如盤石',
-u'安如泰山',
-u'安弱守雌',
-u'安若泰山',
-u'暗弱無斷',
-u'安神定魄',
-u'安身樂業',
-u'安身立命',
-u'安身立業',
-u'安身爲樂',
-u'安生服業',
-u'安生樂業',
-u'暗室不欺',
-u'安時處順',
-u'暗室逢燈',
-u'暗室虧心',
-u'暗室虧心神目如電',
-u'安室利處',
-u'安世默識',
-u'暗室欺心',
-u'暗室求物',
-u'安适如常',
-u'安世三箧',
-u'暗室私心',
-u'暗室屋漏',
-u'暗室無欺',
-u'暗送秋波',
-u'安土樂業',
-u'安土戀本',
-u'按圖索骥',
-u'按圖索駿',
-u'安土息民',
-u'安土重舊',
-u'安土重居',
-u'安土重遷',
-u'安危冷暖',
-u'安危相易',
-u'安危相易禍福相生',
-u'安危與共',
-u'安危之機',
-u'案無留牍',
-u'黯無天日',
-u'安閑自得',
-u'安閑自在',
-u'安詳恭敬',
-u'暗香疏影',
-u'安心定志',
-u'安心樂業',
-u'安心樂意',
-u'安心立命',
-u'安心落意',
-u'安心恬蕩',
-u'安行疾鬥',
-u'按行自抑',
-u'按需知密',
-u'案螢幹死',
-u'安營下寨',
-u'安營紮寨',
-u'安于覆盂',
-u'安于故俗',
-u'安于故俗溺于舊聞',
-u'安于盤石',
-u'安于所習',
-u'安于泰山',
-u'安于現狀',
-u'安于一隅',
-u'暗約私期',
-u'暗約偷期',
-u'安宅正路',
-u'安枕而卧',
-u'安之若固',
-u'安之若命',
-u'安之若素',
-u'暗中摸索',
-u'暗中傾軋',
-u'暗中作梗',
-u'安坐待斃',
-u'昂昂不動',
-u'昂昂得意',
-u'昂昂自若',
-u'昂藏七尺',
-u'昂然而入',
-u'昂然直入',
-u'昂然自得',
-u'昂然自若',
-u'昂首闊步',
-u'昂首齊步',
-u'昂首伸眉',
-u'昂首天外',
-u'昂首挺胸',
-u'昂首望天',
-u'卬首信眉',
-u'卬頭闊步',
-u'昂頭天外',
-u'昂頭挺胸',
-u'昂霄聳壑',
-u'盎盂相擊',
-u'盎盂相敲',
-u'嗷嗷待哺',
-u'嗷嗷待食',
-u'嗷嗷無告',
-u'鏖兵赤壁',
-u'傲不可長',
-u'熬腸刮肚',
-u'奧地利一八四八年革命',
-u'鳌憤龍愁',
-u'熬更守夜',
-u'傲骨嶙嶙',
-u'傲骨天生',
-u'懊悔無及',
-u'熬姜呷醋',
-u'熬枯受淡',
-u'鳌裏奪尊',
-u'傲慢不遜',
-u'傲慢少禮',
-u'傲慢無禮',
-u'鳌鳴鼈應',
-u'傲睨得志',
-u'傲睨萬物',
-u'傲睨一切',
-u'傲睨一世',
-u'傲睨自若',
-u'熬清受淡',
-u'傲然矗立',
-u'傲然睥睨',
-u'傲然挺立',
-u'傲然屹立',
-u'傲上矜下',
-u'傲世輕才',
-u'傲世輕物',
-u'傲世妄榮',
-u'傲霜鬥雪',
-u'傲霜淩雪',
-u'傲頭傲腦',
-u'鳌頭獨步',
-u'鳌頭獨占',
-u'傲賢慢士',
-u'遨翔自得',
-u'熬心費力',
-u'傲雪淩霜',
-u'傲雪欺霜',
-u'聱牙戟口',
-u'聱牙诘屈',
-u'聱牙诘曲',
-u'熬油費火',
-u'鳌魚脫釣',
-u'鳌擲鲸呿',
-u'鳌擲鲸吞',
-u'巴巴急急',
-u'巴巴劫劫',
-u'八拜定交',
-u'八百孤寒',
-u'八拜至交',
-u'拔本塞原',
-u'把臂入林',
-u'把臂徐去',
-u'八病九痛',
-u'把持不定',
-u'罷黜百家',
-u'拔出蘿蔔帶出泥',
-u'八窗玲珑',
-u'拔叢出類',
-u'拔萃出類',
-u'拔萃出群',
-u'八大人覺',
-u'霸道橫行',
-u'拔刀相濟',
-u'拔刀相向',
-u'拔刀相助',
-u'拔地參天',
-u'拔地擎天',
-u'拔地搖山',
-u'拔地倚天',
-u'拔丁抽楔',
-u'疤丁解牛',
-u'八鬥陳思',
-u'八鬥之才',
-u'把飯叫饑',
-u'八方風雨',
-u'八方呼應',
-u'八方來财',
-u'八方支持',
-u'八方支援',
-u'八府巡按',
-u'扒高踩低',
-u'巴高望上',
-u'巴高枝兒',
-u'把個煮熟的鴨子給飛了',
-u'拔根汗毛比腰粗',
-u'八公山上草木皆兵',
-u'拔鍋卷席',
-u'八恒河沙',
-u'八纮同軌',
-u'跋扈飛揚',
-u'跋胡疐尾',
-u'跋扈恣睢',
-u'跋扈自恣',
-u'八花九裂',
-u'八荒九垓',
-u'八荒之外',
-u'拔戟成一隊',
-u'把家成人',
-u'拔劍論功',
-u'八角長錘',
-u'拔角脫距',
-u'八街九陌',
-u'八九不離十',
-u'把酒持螯',
-u'拔葵啖棗',
-u'拔葵去織',
-u'拔葵飲水',
-u'跋來報去',
-u'跋來報往',
-u'拔了蘿蔔地皮寬',
-u'拔類超群',
-u'八兩半斤',
-u'霸陵醉尉',
-u'跋履山川',
-u'疤麻歪嘴',
-u'拔毛濟世',
-u'拔茅連茹',
-u'八門五花',
-u'八面見光',
-u'八面見線',
-u'八面玲珑',
-u'八面駛風',
-u'八面受敵',
-u'八面威風',
-u'八面瑩澈',
-u'八面圓通',
-u'八面張羅',
-u'拔苗助長',
-u'八難三災',
-u'跋前踕後',
-u'巴前算後',
-u'跋前踬後',
-u'拔去眼中釘',
-u'罷卻虎狼之威',
-u'拔群出萃',
-u'拔群出類',
-u'巴人下裏',
-u'拔刃張弩',
-u'罷軟無爲',
-u'巴三覽四',
-u'拔山超海',
-u'巴山度嶺',
-u'拔山蓋世',
-u'拔山扛鼎',
-u'拔山舉鼎',
-u'跋山涉川',
-u'跋山涉水',
-u'巴山蜀水',
-u'巴山夜雨',
-u'巴山越嶺',
-u'跋涉長途',
-u'跋涉山川',
-u'巴蛇吞象',
-u'拔十得五',
-u'拔十失五',
-u'八十一元士',
-u'八十一種好',
-u'拔樹撼山',
-u'拔樹搜根',
-u'拔樹尋根',
-u'把素持齋',
-u'八擡八簇',
-u'八擡大轎請不去',
-u'霸天之力',
-u'巴頭探腦',
-u'把玩不厭',
-u'八萬四千',
-u'把玩無厭',
-u'霸王別姬',
-u'霸王風月',
-u'拔犀擢象',
-u'拔轄投井',
-u'八仙過海',
-u'八仙過海各顯其能',
-u'八仙過海各顯神通',
-u'拔新領異',
-u'把薪助火',
-u'拔一毛而利天下不爲也',
-u'八一三事變',
-u'八音叠奏',
-u'八音遏密',
-u'拔宅飛升',
-u'拔宅上升',
-u'拔趙易漢',
-u'八珍玉食',
-u'拔幟樹幟',
-u'拔幟易幟',
-u'霸主套裝',
-u'八字還沒一撇兒',
-u'八字還沒有一撇',
-u'八字沒見一撇',
-u'八字沒一撇',
-u'八子七婿',
-u'擺八挂陣',
-u'百敗不折',
-u'白白朱朱',
-u'百般刁難',
-u'百般奉承',
-u'百般撫慰',
-u'白斑黑豹',
-u'白闆天子',
-u'百般責難',
-u'百般折磨',
-u'百寶萬貨',
-u'敗筆成丘',
-u'百弊叢生',
-u'白壁青蠅',
-u'白璧三獻',
-u'敗壁頹垣',
-u'白璧微瑕',
-u'白璧無瑕',
-u'百病叢生',
-u'百病回春',
-u'敗兵折将',
-u'百步穿楊',
-u'百不存一',
-u'百不當一',
-u'百不得一',
-u'敗部複活',
-u'百不獲一',
-u'百不失一',
-u'百不随一',
-u'百不爲多一不爲少',
-u'百步無輕擔',
-u'敗不旋踵',
-u'百不一存',
-u'百不一貸',
-u'百不一見',
-u'百不一失',
-u'百不一爽',
-u'百不一遇',
-u'百菜不如白菜',
-u'敗材傷錦',
-u'白草黃沙',
-u'白草黃雲',
-u'敗常亂俗',
-u'百城之富',
-u'百尺竿頭',
-u'百尺竿頭更進一步',
-u'白齒青眉',
-u'百尺無枝',
-u'百川朝海',
-u'百川赴海',
-u'百川歸海',
-u'百川儡海',
-u'百川之主',
-u'百辭莫辯',
-u'拜賜之師',
-u'百挫不折',
-u'百代過客',
-u'百代文宗',
-u'拜倒轅門',
-u'白刀子進紅刀子出',
-u'白刀子進去紅刀子出來',
-u'敗德亂行',
-u'敗德辱行',
-u'白藋同心',
-u'白丁俗客',
-u'百動不如一靜',
-u'百讀不厭',
-u'百堵皆興',
-u'百堵皆作',
-u'百堵朋興',
-u'百堵鹹作',
-u'百端待舉',
-u'百端待理',
-u'百端交集',
-u'百端街舉',
-u'百鍛千煉',
-u'白鳄長靴',
-u'拜恩私室',
-u'百二關河',
-u'百二關山',
-u'百二河山',
-u'百二金瓯',
-u'百二山川',
-u'百二山河',
-u'百發百中',
-u'白發蒼蒼',
-u'白發蒼顔',
-u'白發丹心',
-u'白發紅顔',
-u'白發郎潛',
-u'敗法亂紀',
-u'白發婆娑',
-u'白發千長',
-u'白發千丈',
-u'白發青衫',
-u'白發人送黑發人',
-u'白發相守',
-u'白發朱顔',
-u'百凡待舉',
-u'白飯青刍',
-u'百廢備舉',
-u'百廢待舉',
-u'百廢待興',
-u'百沸滾湯',
-u'百廢俱舉',
-u'百廢俱興',
-u'百廢俱修',
-u'百廢具作',
-u'白費力氣',
-u'百廢鹹舉',
-u'百福具臻',
-u'百夫決拾',
-u'百感交乘',
-u'百感交集',
-u'白剛之石',
-u'敗梗飛絮',
-u'白骨廢墟',
-u'白骨荒野',
-u'白骨露野',
-u'白骨熔化',
-u'白骨碎片',
-u'白骨再肉',
-u'白骨之盾',
-u'白骨之谷',
-u'敗鼓之皮',
-u'白骨墜子',
-u'百怪千奇',
-u'稗官小說',
-u'稗官野乘',
-u'稗官野史',
-u'白圭可磨',
-u'拜鬼求神',
-u'白圭之玷',
-u'百鬼衆魅',
-u'敗國喪家',
-u'敗國亡家',
-u'白毫銀針',
-u'白毫之賜',
-u'捭阖縱橫',
-u'白黑不分',
-u'白黑顛倒',
-u'白黑分明',
-u'白黑混淆',
-u'白虹貫日',
-u'白話八股',
-u'百花凋零',
-u'百花齊放',
-u'百花齊放百家争鳴',
-u'敗化傷風',
-u'百花盛開',
-u'百花生日',
-u'百花争豔',
-u'白華之怨',
-u'敗壞門風',
-u'敗壞門楣',
-u'敗壞門面',
-u'百卉含英',
-u'百堕俱舉',
-u'百喙莫辯',
-u'百喙莫辭',
-u'百喙莫明',
-u'百喙難辯',
-u'百喙難辭',
-u'百卉千葩',
-u'百喙如一',
-u'百喙一詞',
-u'白魂頭盔',
-u'百計千方',
-u'百計千謀',
-u'百計千心',
-u'敗績失據',
-u'白袷藍衫',
-u'敗家破業',
-u'百家姓不曾開簿面',
-u'百家争鳴',
-u'百家諸子',
-u'敗将殘兵',
-u'敗将封侯',
-u'敗将求和',
-u'敗将求活',
-u'百結愁腸',
-u'百結鹑衣',
-u'百結懸鹑',
-u'百金買鄰',
-u'百金之士',
-u'敗井頹垣',
-u'白酒紅人面黃金黑世心',
-u'白酒釀成緣好客',
-u'百舉百捷',
-u'百舉百全',
-u'白駒過隙',
-u'白駒空谷',
-u'白絹斜封',
-u'敗軍折将',
-u'敗軍之将',
-u'敗軍之将不言勇',
-u'敗軍之将不足言勇',
-u'掰開揉碎',
-u'百孔千創',
-u'百口不辯',
-u'敗寇成王',
-u'百口莫辯',
-u'百口難辯',
-u'百口難分',
-u'百口難訴',
-u'百口同聲',
-u'百口奚解',
-u'白蠟明經',
-u'白浪如山',
-u'白狼手套',
-u'白浪滔天',
-u'白浪掀天',
-u'百裏不同風千裏不同俗',
-u'百裏不同俗',
-u'百裏風趠',
-u'百裏挑一',
-u'百裏異習',
-u'百裏之才',
-u'百裏之命',
-u'百裏之任',
-u'百鏈成鋼',
-u'百練之鋼',
-u'百兩爛盈',
-u'百了千當',
-u'敗鱗殘甲',
-u'白霖項鏈',
-u'百伶百俐',
-u'百靈百驗',
-u'白領犯罪',
-u'百齡眉壽',
-u'百靈上衣',
-u'敗柳殘花',
-u'百六陽九',
-u'百六之會',
-u'白龍皮盔',
-u'白龍微服',
-u'白龍魚服',
-u'百龍之智',
-u'白露凝霜',
-u'百慮一緻',
-u'百慮攢心',
-u'百馬伐骥',
-u'白馬缰繩',
-u'白馬素車',
-u'白旄黃钺',
-u'白眉赤臉',
-u'白眉赤眼',
-u'百媚千嬌',
-u'百密一疏',
-u'白面儒冠',
-u'白面儒生',
-u'白面書郎',
-u'白面書生',
-u'敗名失德',
-u'百謀千計',
-u'百能百俐',
-u'百年不遇',
-u'百年成之不足',
-u'百年大計',
-u'百年大業',
-u'百年到老',
-u'百年好合',
-u'百年好事',
-u'百念灰冷',
-u'百念皆灰',
-u'百念俱冷',
-u'百年難遇',
-u'百年樹人',
-u'百年諧老',
-u'百年修得同船渡',
-u'百年修來同船渡',
-u'百年之柄',
-u'百年之好',
-u'百年之後',
-u'百年之歡',
-u'百年之業',
-u'百年之約',
-u'百鳥朝鳳',
-u'百辟腰飾',
-u'白披一張人皮',
-u'百品千條',
-u'白帢青衫',
-u'百巧成窮',
-u'百巧千窮',
-u'白朐過隙',
-u'百犬吠聲',
-u'敗群之馬',
-u'白熱烈焰',
-u'百人百姓',
-u'百忍成金',
-u'百人傳實',
-u'百人附和',
-u'白日飛升',
-u'白日見鬼',
-u'白日青天',
-u'白日上升',
-u'白日升天',
-u'白日說夢',
-u'白日說夢話',
-u'白日繡衣',
-u'白日衣繡',
-u'白日作夢',
-u'白色恐怖',
-u'白沙在涅',
-u'白沙在涅與之俱黑',
-u'白山黑水',
-u'白商素節',
-u'百舍重繭',
-u'百舌之聲',
-u'百身何贖',
-u'百身可贖',
-u'百身莫贖',
-u'百世不磨',
-u'百世不易',
-u'百事大吉',
-u'白石道人詩說',
-u'百事亨通',
-u'百事可樂',
-u'百世流芳',
-u'百世流芬',
-u'百事無成',
-u'百世修來同船渡',
-u'百世一人',
-u'百世姻緣',
-u'敗事有餘',
-u'敗事有馀成事不足',
-u'百世之利',
-u'百世之師',
-u'白首北面',
-u'白首不渝',
-u'白手成家',
-u'白首方悔讀書遲',
-u'白首黃童',
-u'白首空歸',
-u'白手空拳',
-u'白手起家',
-u'白首齊眉',
-u'拜手稽首',
-u'白首窮經',
-u'白首如新',
-u'百獸率舞',
-u'白首同歸',
-u'白首爲郎',
-u'白首無成',
-u'白首相知',
-u'白首相莊',
-u'白首偕老',
-u'白手興家',
-u'白首一節',
-u'白首之心',
-u'白水鑒心',
-u'白水盟心',
-u'百順百依',
-u'百順千随',
-u'白說綠道',
-u'百思不得',
-u'百思不得其解',
-u'百思不解',
-u'百思莫解',
-u'百死一生',
-u'百誦不厭',
-u'白叟黃童',
-u'敗俗傷風',
-u'敗俗傷化',
-u'百歲千秋',
-u'百歲之好',
-u'百歲之後',
-u'百歲之盟',
-u'百歲之秋',
-u'百态橫生',
-u'百态千嬌',
-u'白頭不終',
-u'白頭到老',
-u'白頭而新',
-u'擺頭撼腦',
-u'白頭如新',
-u'白頭相并',
-u'白頭相守',
-u'白頭偕老',
-u'白頭之歎',
-u'白兔赤烏',
-u'敗瓦頹垣',
-u'百萬伏特',
-u'百萬買宅',
-u'百萬買宅千萬買鄰',
-u'百萬雄兵',
-u'百萬雄師',
-u'白往黑歸',
-u'白往黑來',
-u'百痏千瘡',
-u'擺尾搖頭',
-u'百問不煩',
-u'百聞不如一見',
-u'百問不厭',
-u'白屋寒門',
-u'百無禁忌',
-u'百無聊賴',
-u'百無是處',
-u'百無所成',
-u'百無所忌',
-u'百無一成',
-u'百無一二',
-u'百無一堪',
-u'百無一漏',
-u'百無一能',
-u'百無一失',
-u'百無一用',
-u'百無一用是書生',
-u'白霧之石',
-u'百下百全',
-u'百下百着',
-u'白苋紫茄',
-u'白箱測試',
-u'百曉星君',
-u'百姓安樂五谷豐登',
-u'百星不如一月',
-u'敗興而歸',
-u'百姓利益無小事',
-u'擺袖卻金',
-u'敗絮其中',
-u'白雪皚皚',
-u'白雪難和',
-u'白雪陽春',
-u'白眼狼王',
-u'白眼相看',
-u'白洋澱紀事',
-u'百樣玲珑',
-u'百樣依順',
-u'百業凋敝',
-u'敗業傾家',
-u'敗也蕭何',
-u'百業蕭條',
-u'百依百從',
-u'百依百順',
-u'百衣百随',
-u'白衣蒼狗',
-u'百藝防身',
-u'白衣公卿',
-u'白衣卿相',
-u'白衣送酒',
-u'白衣秀士',
-u'白衣宰相',
-u'白蟻争穴',
-u'白銀矛柄',
-u'白魚赤烏',
-u'敗于垂成',
-u'白魚登舟',
-u'白玉青絲',
-u'白魚入舟',
-u'敗宇頹垣',
-u'白玉微瑕',
-u'白玉無瑕',
-u'白玉映沙',
-u'白玉之石',
-u'白雲蒼狗',
-u'白雲出岫本無心',
-u'白雲孤飛',
-u'白雲親舍',
-u'百載樹人',
-u'敗則爲寇',
-u'敗則爲虜',
-u'敗則爲賊',
-u'百戰百敗',
-u'百戰百勝',
-u'百戰不殆',
-u'百戰勝出一戰覆',
-u'百丈竿頭',
-u'百折不摧',
-u'百折不回',
-u'百折不磨',
-u'百折不撓',
-u'百折不屈',
-u'百折不移',
-u'百折千回',
-u'敗者爲寇',
-u'百治百效',
-u'白紙黑字',
-u'白紙寫黑字',
-u'百中百發',
-u'白晝見鬼',
-u'柏舟之節',
-u'柏舟之誓',
-u'柏舟之痛',
-u'白晝做夢',
-u'百啭千聲',
-u'百拙千醜',
-u'敗子回頭',
-u'敗子回頭金不換',
-u'百紫千紅',
-u'敗子三變',
-u'百縱千随',
-u'百足不僵',
-u'百足之蟲',
-u'百足之蟲斷而不蹶',
-u'百足之蟲死而不僵',
-u'百足之蟲至斷不蹶',
-u'百足之蟲至死不僵',
-u'斑白毛皮',
-u'班班可稽',
-u'斑斑可考',
-u'半半拉拉',
-u'闆闆六十四',
-u'半半路路',
-u'半壁河山',
-u'半壁江山',
-u'半壁山河',
-u'半臂之勞',
-u'半臂之力',
-u'斑駁陸離',
-u'半部論語',
-u'半部論語治天下',
-u'半嗔半喜',
-u'半癡不顛',
-u'半籌不納',
-u'半籌不展',
-u'半籌莫展',
-u'搬唇遞舌',
-u'搬唇撅嘴',
-u'搬唇弄舌',
-u'半村半郭',
-u'半道上殺出了個程咬金',
-u'半低不高',
-u'半懂不懂',
-u'搬鬥是非',
-u'半分不識錯一字不饒人',
-u'班功行賞',
-u'半含不吐',
-u'半饑半飽',
-u'半濟而擊',
-u'班姬題扇',
-u'半價倍息',
-u'半間半界',
-u'半間不界',
-u'半截入泥',
-u'半截入土',
-u'半截身子入土',
-u'半解一知',
-u'半斤八兩',
-u'半斤八面',
-u'搬斤播兩',
-u'半斤對八兩',
-u'班荊道故',
-u'班荊道舊',
-u'搬口弄舌',
-u'半零不落',
-u'扳龍附鳳',
-u'半路出家',
-u'半路上出家',
-u'半路修行',
-u'班馬文章',
-u'班門弄斧',
-u'班門取罪',
-u'半夢半醒',
-u'半面不忘',
-u'半面之交',
-u'半面之舊',
-u'半面之識',
-u'半面之雅',
-u'半明不滅',
-u'搬弄是非',
-u'搬起石頭打自己的腳',
-u'扮俏臉給瞎子看',
-u'半青半黃',
-u'半晴半陰',
-u'半三不四',
-u'半上半下',
-u'闆上釘釘',
-u'半上落下',
-u'闆上砸釘',
-u'阪上走丸',
-u'半身不攝',
-u'半身不遂',
-u'半身入土',
-u'半生半熟',
-u'半生半死',
-u'半生不熟',
-u'半生嘗膽',
-u'半生潦倒',
-u'班師得勝',
-u'班師回朝',
-u'班師回俯',
-u'搬是挑非',
-u'搬石砸腳',
-u'伴食宰相',
-u'搬是造非',
-u'班師振旅',
-u'伴食中書',
-u'半死半活',
-u'半絲半縷',
-u'半死半生',
-u'半死不活',
-u'半死辣活',
-u'伴蒜加蔥',
-u'半糖夫妻',
-u'扳藤附葛',
-u'半天朱霞',
-u'半吐半露',
-u'半吐半吞',
-u'半途而罷',
-u'半途而廢',
-u'半途之廢',
-u'半推半就',
-u'半吞半吐',
-u'半僞半真',
-u'半文半白',
-u'半文不白',
-u'半文不值',
-u'半線性集',
-u'班香宋豔',
-u'半笑半嗔',
-u'半新半舊',
-u'半信半疑',
-u'半新不舊',
-u'半信不信',
-u'半羞半喜',
-u'半掩門兒',
-u'半夜三更',
-u'半疑半信',
-u'斑衣戲彩',
-u'扳轅卧轍',
-u'半藏之劍',
-u'半真半假',
-u'版築飯牛',
-u'半子之靠',
-u'半子之勞',
-u'搬嘴弄舌',
-u'蚌病成珠',
-u'蚌病生珠',
-u'膀大腰圓',
-u'棒打鴛鴦',
-u'幫狗吃食',
-u'傍觀必審',
-u'傍觀冷眼',
-u'傍觀者清',
-u'傍觀者審當局者迷',
-u'邦國殄瘁',
-u'幫虎吃食',
-u'傍花随柳',
-u'幫急不幫窮',
-u'蚌殼護腕',
-u'幫懶鑽閑',
-u'幫理不幫親',
-u'傍柳随花',
-u'傍門依戶',
-u'傍人籬壁',
-u'傍人籬落',
-u'傍人門戶',
-u'蚌肉大餐',
-u'傍若無人',
-u'榜上無名',
-u'幫手主體',
-u'謗書一箧',
-u'幫閑偷懶',
-u'幫閑鑽懶',
-u'邦以民爲本',
-u'蚌鹬相持',
-u'蚌鹬相争',
-u'蚌鹬争衡',
-u'飽谙經史',
-u'飽谙世故',
-u'包辦代替',
-u'抱寶懷珍',
-u'報本反始',
-u'褒貶揚抑',
-u'褒貶與奪',
-u'抱表寝繩',
-u'報冰公事',
-u'飽病難醫',
-u'暴病身亡',
-u'抱布貿絲',
-u'暴不肖人',
-u'抱才而困',
-u'褒采一介',
-u'保殘守阙',
-u'包藏禍胎',
-u'苞藏禍心',
-u'包藏奸心',
-u'苞藏逆心',
-u'飽嘗世故',
-u'抱誠守真',
-u'抱成一團',
-u'報仇泄恨',
-u'報仇雪恥',
-u'報雠雪恨',
-u'薄唇輕言',
-u'保存實力',
-u'抱打不平',
-u'包打天下',
-u'飽當知人饑溫當知人寒',
-u'寶刀不老',
-u'寶刀藏鞘',
-u'寶刀未老',
-u'抱獨守殘',
-u'鸨兒愛的是鈔',
-u'抱法處勢',
-u'抱憤入地',
-u'暴風暴雨',
-u'暴風疾雨',
-u'暴風山脈',
-u'暴風紋章',
-u'暴風要塞',
-u'暴風之怒',
-u'暴風驟雨',
-u'抱負不凡',
-u'暴骨如莽',
-u'暴骨沙場',
-u'暴骨原野',
-u'保固自守',
-u'抱關擊柝',
-u'抱關之怨',
-u'抱關執鑰',
-u'保國安民',
-u'飽漢不知餓漢饑',
-u'苞含萬象',
-u'抱撼終身',
-u'抱撼終天',
-u'飽漢子不知餓漢子饑',
-u'抱恨黃泉',
-u'抱恨泉壤',
-u'抱恨終天',
-u'暴虎馮河',
-u'抱虎枕蛟',
-u'包荒匿瑕',
-u'抱火厝薪',
-u'寶貨難售',
-u'抱火寝薪',
-u'抱火卧薪',
-u'抱雞養竹',
-u'保家衛國',
-u'寶劍鋒從磨砺出',
-u'飽經滄桑',
-u'飽經冬寒知春暖',
-u'飽經風霜',
-u'飽經風雨',
-u'飽經世變',
-u'飽經世故',
-u'飽經霜雪',
-u'飽經痛苦',
-u'保境息民',
-u'飽經憂患',
-u'飽經憂慮',
-u'苞苴竿牍',
-u'苞苴公行',
-u'苞苴賄賂',
-u'包舉宇内',
-u'暴君印記',
-u'暴君之冠',
-u'寶窟腿甲',
-u'包括萬象',
-u'包攬詞訟',
-u'寶藍項鏈',
-u'寶藍腰佩',
-u'飽了不剃頭餓了不洗澡',
-u'暴雷也似',
-u'堡壘主機',
-u'飽曆風霜',
-u'報李投桃',
-u'暴厲之氣',
-u'葆力之士',
-u'暴厲恣睢',
-u'暴斂橫墳',
-u'暴斂橫賦',
-u'暴斂橫征',
-u'飽練世故',
-u'抱令守律',
-u'報劉一丈書',
-u'包龍圖鐵面無私',
-u'苞籠萬象',
-u'暴露目标',
-u'暴露傷口',
-u'暴露無遺',
-u'包羅萬彙',
-u'包羅萬象',
-u'包羅萬有',
-u'寶馬雕車',
-u'寶馬香車',
-u'暴慢恣睢',
-u'保密防諜',
-u'保納舍藏',
-u'暴内陵外',
-u'暴怒圖騰',
-u'暴怒藥水',
-u'飽暖生淫',
-u'飽暖生淫欲',
-u'飽暖思淫',
-u'飽暖思淫欲',
-u'暴虐浮躁',
-u'暴虐無道',
-u'剝皮抽筋',
-u'抱樸寡欲',
-u'抱樸含真',
-u'抱璞泣血',
-u'抱椠懷鉛',
-u'抱椠書生',
-u'包殼礦石',
-u'抱屈含冤',
-u'暴取豪奪',
-u'抱屈銜冤',
-u'豹群守護',
-u'飽人不知餓人饑',
-u'暴腮之魚',
-u'包山包海',
-u'褒善貶惡',
-u'寶山空回',
-u'飽食豐衣',
-u'暴食花鼠',
-u'飽食暖衣',
-u'暴屍于市',
-u'飽食終日',
-u'飽受冬寒知春暖',
-u'抱首鼠竄',
-u'抱首四竄',
-u'豹死留皮',
-u'豹死留皮人死留名',
-u'抱素懷樸',
-u'抱素懷真',
-u'保泰持盈',
-u'抱炭希涼',
-u'暴殄輕生',
-u'暴殄天物',
-u'暴跳如雷',
-u'抱痛西河',
-u'抱痛終身',
-u'抱頭大哭',
-u'豹頭環眼',
-u'抱頭鼠竄',
-u'抱頭痛哭',
-u'抱蔓摘瓜',
-u'報往跋來',
-u'抱甕出灌',
-u'抱甕灌畦',
-u'抱甕灌園',
-u'報喜不報優',
-u'褒賢遏惡',
-u'飽飨老拳',
-u'寶相莊嚴',
-u'報效祖國',
-u'抱薪救焚',
-u'抱薪救火',
-u'抱薪趨火',
-u'保形插值',
-u'包羞忍恥',
-u'包胥之哭',
-u'飽學君子',
-u'抱雪向火',
-u'飽學秀才',
-u'飽學之士',
-u'爆牙山貓',
-u'暴眼赤腮',
-u'飽揚饑附',
-u'褒衣博帶',
-u'飽以老拳',
-u'褒衣危冠',
-u'報應不爽',
-u'保盈持泰',
-u'報應甚速',
-u'抱有成見',
-u'抱有偏見',
-u'暴雨護符',
-u'抱玉懷珠',
-u'抱愚守迷',
-u'抱瑜握瑾',
-u'抱玉握珠',
-u'飽饫郇廚',
-u'鮑魚之次',
-u'鮑魚之肆',
-u'包元履德',
-u'報怨雪恥',
-u'報怨以德',
-u'報怨以直',
-u'暴殒輕生',
-u'抱贓叫屈',
-u'暴躁如雷',
-u'暴漲暴跌',
-u'抱着個不哭的孩兒',
-u'暴征橫斂',
-u'豹之快捷',
-u'抱枝拾葉',
-u'豹之迅捷',
-u'豹之優雅',
-u'抱終身恨',
-u'抱終天恨',
-u'抱柱含謗',
-u'報竹平安',
-u'爆竹聲中辭舊歲',
-u'寶珠市餅',
-u'寶珠市餅寶中之寶',
-u'抱柱之信',
-u'包裝拆器',
-u'抱子弄孫',
-u'鮑子知我',
-u'孢子之雲',
-u'抱罪懷瑕',
-u'悲哀襯肩',
-u'悲哀使者',
-u'悲哀之杖',
-u'背暗投明',
-u'卑卑不足道',
-u'背碑覆局',
-u'杯杯先勸有錢人',
-u'背本就末',
-u'背本趨末',
-u'背本逐末',
-u'卑鄙龌龊',
-u'卑鄙無恥',
-u'北鄙之聲',
-u'北鄙之音',
-u'北部城牆',
-u'北部海岸',
-u'北部聖殿',
-u'背部突刺',
-u'悲不自勝',
-u'卑不足道',
-u'杯殘炙冷',
-u'背槽抛糞',
-u'卑谄足恭',
-u'備嘗艱苦',
-u'備嘗艱難',
-u'備嘗辛苦',
-u'庳車羸馬',
-u'北辰星拱',
-u'背城而戰',
-u'背城借一',
-u'背城一戰',
-u'倍稱之息',
-u'背馳于道',
-u'被寵若驚',
-u'悲愁垂涕',
-u'北窗高卧',
-u'北窗之友',
-u'北槌哨塔',
-u'卑辭厚币',
-u'卑辭厚禮',
-u'卑辭重币',
-u'悲從中來',
-u'倍道并行',
-u'背道而馳',
-u'倍道而進',
-u'背道而行',
-u'倍道兼進',
-u'倍道兼行',
-u'杯底逢蛇',
-u'背地厮說',
-u'被底鴛鴦',
-u'北鬥之尊',
-u'備多力分',
-u'背恩負義',
-u'背恩棄義',
-u'背恩忘義',
-u'備而不用',
-u'被發陽狂',
-u'北方城堡',
-u'悲憤兼集',
-u'悲憤交集',
-u'悲憤填膺',
-u'北風裂谷',
-u'北風之戀',
-u'背腹受敵',
-u'備感溫馨',
-u'悲歌當哭',
-u'悲歌擊築',
-u'悲歌忼慨',
-u'悲歌易水',
-u'杯羹之讓',
-u'卑宮菲食',
-u'杯觥交錯',
-u'卑躬屈節',
-u'卑躬屈膝',
-u'卑躬屈已',
-u'杯弓蛇影',
-u'杯弓市虎',
-u'卑躬下士',
-u'背公向私',
-u'背公循私',
-u'北宮嬰兒',
-u'背公營私',
-u'卑恭自牧',
-u'背故向新',
-u'悲觀論調',
-u'悲觀厭世',
-u'北郭先生',
-u'背河一戰',
-u'背後摯肘',
-u'陂湖禀量',
-u'悲歡合散',
-u'悲歡聚散',
-u'悲歡離合',
-u'背惠食言',
-u'背井離鄉',
-u'杯酒戈矛',
-u'杯酒解怨',
-u'杯酒釋兵權',
-u'杯酒言歡',
-u'悲慨交集',
-u'悲愧交集',
-u'被麗被離',
-u'卑禮厚币',
-u'悖理違情',
-u'卑陋龌龊',
-u'卑論侪俗',
-u'北芒壘壘',
-u'北門管鍵',
-u'北門管鑰',
-u'北門南牙',
-u'北門哨崗',
-u'北門鎖鑰',
-u'北門之管',
-u'北門之寄',
-u'北門之歎',
-u'背盟敗約',
-u'北面稱臣',
-u'杯茗之敬',
-u'杯盤狼藉',
-u'背前面後',
-u'背曲腰躬',
-u'背曲腰彎',
-u'杯圈之思',
-u'貝阙珠宮',
-u'被人賣了還幫着數錢',
-u'倍日并行',
-u'悖入悖出',
-u'背若芒刺',
-u'北山伐木場中間的箱子',
-u'被苫蒙荊',
-u'背山面水',
-u'背山起樓',
-u'悲傷憔悴',
-u'悲傷沼澤',
-u'杯蛇弓影',
-u'杯蛇鬼車',
-u'杯蛇幻影',
-u'卑身贱體',
-u'卑身屈體',
-u'背生芒刺',
-u'悲聲載道',
-u'碑石長條',
-u'背室棄家',
-u'背施幸災',
-u'倍受歡迎',
-u'備受艱難',
-u'倍受尊敬',
-u'杯水車薪',
-u'背水而戰',
-u'背水而陣',
-u'背水結陣',
-u'杯水救薪',
-u'杯水粒粟',
-u'背水爲陣',
-u'背水一戰',
-u'杯水輿薪',
-u'杯水之餞',
-u'杯水之敬',
-u'杯水之謝',
-u'悲泗淋漓',
-u'北叟失馬',
-u'被蓑救火',
-u'北讨南征',
-u'卑體屈已',
-u'悲天憫人',
-u'悲恸欲絕',
-u'備位充數',
-u'備位将相',
-u'悲喜兼集',
-u'悲喜交并',
-u'悲喜交集',
-u'悲喜交切',
-u'悲喜交至',
-u'北鹹南甜東辣西酸',
-u'背鄉離井',
-u'背信棄義',
-u'悖言亂辭',
-u'背義負恩',
-u'背義負信',
-u'背義忘恩',
-u'悲翼之地',
-u'卑以自牧',
-u'杯影蛇弓',
-u'備預不虞',
-u'北轅南轍',
-u'北轅适楚',
-u'北轅适越',
-u'被災蒙禍',
-u'被擇蒙庥',
-u'備戰備荒',
-u'背着抱着一般沉',
-u'北轍南轅',
-u'悲者胸甲',
-u'卑之無甚高論',
-u'杯中蛇影',
-u'杯中之物',
-u'背住扣子了',
-u'背紫腰金',
-u'卑陬失色',
-u'本本元元',
-u'本本正正',
-u'奔波爾霸',
-u'奔波勞碌',
-u'奔播四出',
-u'奔車朽索',
-u'奔馳如電',
-u'奔馳如雷',
-u'奔出朽索',
-u'本地防務',
-u'本地加電',
-u'本地接口',
-u'本地終端',
-u'本固邦寧',
-u'奔井投河',
-u'奔競之士',
-u'奔駒朽索',
-u'贲軍之将',
-u'本來面目',
-u'奔流不息',
-u'本末倒置',
-u'本末源流',
-u'本末終始',
-u'坌鳥先飛',
-u'奔跑速度',
-u'本輕利重',
-u'本盛末榮',
-u'本事不用借',
-u'笨手笨腳',
-u'奔騰澎湃',
-u'本同末離',
-u'本同末異',
-u'本鄉本土',
-u'本相畢露',
-u'奔相走告',
-u'本小利薄',
-u'本小利微',
-u'本性難移',
-u'奔轶絕塵',
-u'贲育弗奪',
-u'贲育之勇',
-u'本原演繹',
-u'本支百世',
-u'奔走不遑',
-u'奔走風塵',
-u'奔走逢迎',
-u'奔走呼号',
-u'奔走來告',
-u'奔走如市',
-u'奔走相告',
-u'奔走衣食',
-u'奔走之友',
-u'奔走鑽營',
-u'笨嘴笨舌',
-u'笨嘴拙舌',
-u'繃巴吊拷',
-u'繃爬吊拷',
-u'筆飽墨酣',
-u'比比皆然',
-u'比比皆是',
-u'閉壁清野',
-u'鄙薄之志',
-u'逼不得已',
-u'必不撓北',
-u'筆補造化',
-u'筆參造化',
-u'碧草如茵',
-u'必操勝券',
-u'匕鬯不驚',
-u'彼倡此和',
-u'匕鬯無驚',
-u'蔽車羸馬',
-u'弊車驽馬',
-u'必傳之作',
-u'彼此彼此',
-u'彼此一時',
-u'蔽聰塞明',
-u'筆大如椽',
-u'彼得和狼',
-u'筆底超生',
-u'筆底春風',
-u'筆底龍蛇',
-u'敝窦百出',
-u'鼻端出火',
-u'鼻端生火',
-u'鼻垩揮斤',
-u'比而不黨',
-u'避而不談',
-u'比而不周',
-u'斃而後已',
-u'筆伐口誅',
-u'避煩鬥捷',
-u'避繁就簡',
-u'碧風海岸',
-u'敝蓋不棄',
-u'筆杆殺人勝槍杆',
-u'比個高低',
-u'比個高下',
-u'筆歌墨舞',
-u'閉閣思過',
-u'閉閣自責',
-u'筆耕硯田',
-u'必恭必敬',
-u'必躬必親',
-u'敝鼓喪豚',
-u'避瓜防李',
-u'閉關絕市',
-u'閉關卻掃',
-u'閉關鎖國',
-u'閉關投轄',
-u'閉關自守',
-u'閉關自主',
-u'避害就利',
-u'碧海青天',
-u'筆酣墨飽',
-u'鼻鼾如雷',
-u'筆翰如流',
-u'彼何人斯',
-u'璧合珠聯',
-u'閉戶讀書',
-u'比戶而封',
-u'庇護法杖',
-u'比葫畫瓢',
-u'比戶可封',
-u'庇護治療',
-u'庇護祝福',
-u'筆畫編碼',
-u'閉花羞月',
-u'碧鬟紅袖',
-u'避毀就譽',
-u'筆回造化',
-u'避禍就福',
-u'避禍求福',
-u'碧火小徑',
-u'避迹藏時',
-u'碧雞金馬',
-u'避迹違心',
-u'比肩并起',
-u'比肩叠迹',
-u'比肩叠踵',
-u'比肩而立',
-u'比肩而事',
-u'比肩繼踵',
-u'比肩接迹',
-u'比肩皆是',
-u'比肩接踵',
-u'比肩連袂',
-u'比肩齊聲',
-u'壁間蛇影',
-u'比肩随踵',
-u'比肩系踵',
-u'比肩相親',
-u'彼竭我盈',
-u'必敬必恭',
-u'筆精墨妙',
-u'避井入坎',
-u'避阱入坑',
-u'必經之路',
-u'閉境自守',
-u'比居同勢',
-u'弊絕風清',
-u'避軍三舍',
-u'避坑落井',
-u'鼻孔朝天',
-u'鼻孔遼天',
-u'碧空如洗',
-u'碧空萬裏',
-u'碧空之歌',
-u'閉口捕舌',
-u'閉口不言',
-u'閉口藏舌',
-u'閉口結舌',
-u'閉口深藏舌安身處處樂',
-u'閉口無言',
-u'碧藍雕像',
-u'碧藍崗哨',
-u'碧藍護肩',
-u'碧藍腰帶',
-u'碧藍鑰匙',
-u'避勞就逸',
-u'筆老墨秀',
-u'比類從事',
-u'壁壘分明',
-u'壁壘披風',
-u'壁壘森嚴',
-u'壁裏安柱',
-u'必裏遲離',
-u'筆力獨扛',
-u'筆力杠鼎',
-u'筆力回春',
-u'筆力扛鼎',
-u'鄙俚淺陋',
-u'壁立千仞',
-u'筆力遒勁',
-u'髀裏肉生',
-u'畢力同心',
-u'筆力萬鈞',
-u'壁立萬仞',
-u'避李嫌瓜',
-u'筆力縱橫',
-u'璧聯珠燦',
-u'避涼附炎',
-u'比量齊觀',
-u'逼良爲娼',
-u'鄙吝冰消',
-u'鄙吝複萌',
-u'碧磷鬼火',
-u'碧鱗胸甲',
-u'鄙吝意消',
-u'荜露藍蒌',
-u'荜路藍縷',
-u'碧落黃泉',
-u'蔽美揚惡',
-u'閉門不出',
-u'閉門不納',
-u'閉門不問世事',
-u'閉門讀書',
-u'荜門閨窦',
-u'荜門圭窬',
-u'閉門酣歌',
-u'閉門合轍',
-u'閉門家裏坐禍從天上來',
-u'閉門墐戶',
-u'荜門陋巷',
-u'閉門覓句',
-u'荜門蓬戶',
-u'閉門潛思',
-u'閉門卻軌',
-u'閉門卻掃',
-u'閉門埽軌',
-u'閉門塞窦',
-u'閉門塞戶',
-u'閉門思過',
-u'閉門思愆',
-u'閉門投轄',
-u'荜門委巷',
-u'閉門造車',
-u'閉門造車出門不合轍',
-u'閉門造車出門合轍',
-u'閉門斫輪',
-u'閉門自守',
-u'避面尹邢',
-u'蔽明塞聰',
-u'筆墨官司',
-u'筆墨橫姿',
-u'筆墨之林',
-u'比目連枝',
-u'閉目塞聰',
-u'閉目塞耳',
-u'閉目塞聽',
-u'比目雙刀',
-u'閉目掩耳',
-u'避難谷地',
-u'避難就易',
-u'避難趨易',
-u'聛睨窺觎',
-u'避溺山隅',
-u'聛睨物表',
-u'聛睨一切',
-u'聛睨一世',
-u'比年不登',
-u'畢其功于一役',
-u'避其銳氣',
-u'避其銳氣擊其惰歸',
-u'彼棄我取',
-u'避強打弱',
-u'避強擊惰',
-u'避強擊弱',
-u'筆槍紙彈',
-u'鼻青額腫',
-u'鼻青臉腫',
-u'鼻青眼烏',
-u'鼻青眼腫',
-u'鼻青眼紫',
-u'敝裘羸馬',
-u'筆驅造化',
-u'比權量力',
-u'避讓賢路',
-u'避人耳目',
-u'逼人太甚',
-u'避人眼目',
-u'蔽日幹雲',
-u'蔽日遮天',
-u'髀肉複生',
-u'髀肉皆消',
-u'髀肉之歎',
-u'筆掃千軍',
-u'鼻塞聲重',
-u'閉塞眼睛捉麻雀',
-u'比上不足',
-u'比上不足比下有馀',
-u'逼上梁山',
-u'蔽傷之憂',
-u'筆生春意',
-u'避世長袍',
-u'避實擊虛',
-u'避世金馬',
-u'避世金門',
-u'避實就虛',
-u'避世絕俗',
-u'避世離俗',
-u'避世牆東',
-u'避世輕靴',
-u'匕首打擊',
-u'比手劃腳',
-u'匕首技能',
-u'匕首強化',
-u'匕首掌握',
-u'匕首專精',
-u'碧水青山',
-u'碧水青天',
-u'碧水萦回',
-u'比死人多口氣',
-u'碧絲項鏈',
-u'避俗趨新',
-u'比歲不登',
-u'鼻塌唇青',
-u'鼻塌嘴歪',
-u'敝绨惡粟',
-u'鼻涕沒有倒流的',
-u'筆頭生花',
-u'碧瓦朱甍',
-u'弊帷不棄',
-u'比物醜類',
-u'比物此志',
-u'比屋而封',
-u'比物假事',
-u'比屋可封',
-u'比屋可誅',
-u'比物連類',
-u'比屋連甍',
-u'鼻無梁柱',
-u'比物屬事',
-u'鼻息雷鳴',
-u'婢膝奴顔',
-u'鼻息如雷',
-u'敝屣尊榮',
-u'筆下超生',
-u'筆下春風',
-u'筆下龍蛇',
-u'筆下生春',
-u'筆下生花',
-u'筆下有鐵',
-u'比下有馀',
-u'必先利其器',
-u'避嫌守義',
-u'必先與之',
-u'避嚣習靜',
-u'避兇就吉',
-u'避兇趨吉',
-u'比修消失',
-u'筆削褒貶',
-u'碧血丹心',
-u'婢學夫人',
-u'碧血紅心',
-u'鼻偃齒露',
-u'鄙言累句',
-u'秕言謬說',
-u'必也正名',
-u'俾夜作晝',
-u'鄙夷不屑',
-u'弊衣箪食',
-u'比翼分飛',
-u'敝衣粝食',
-u'比翼連枝',
-u'比翼齊飛',
-u'彼一時此一時',
-u'弊衣蔬食',
-u'比翼雙飛',
-u'比翼雙劍',
-u'敝衣枵腹',
-u'必飲必敬',
-u'避影斂迹',
-u'避影匿形',
-u'必有近憂',
-u'臂有四肘',
-u'必有所成',
-u'必有我師',
-u'必有一彪',
-u'必有一得',
-u'必有一傷',
-u'必有一失',
-u'必有勇夫',
-u'必由之路',
-u'鄙于不屑',
-u'畢雨箕風',
-u'碧玉戒指',
-u'碧玉礦洞',
-u'碧月寶珠',
-u'蔽月羞花',
-u'閉月羞花般',
-u'閉造出合',
-u'比張比李',
-u'閉着眼睛捉麻雀',
-u'逼真逼肖',
-u'必争之地',
-u'比值控制',
-u'碧指魔棒',
-u'避之若浼',
-u'比衆不同',
-u'鼻中出火',
-u'避重就輕',
-u'筆冢墨池',
-u'彼衆我寡',
-u'筆冢研穿',
-u'币重言甘',
-u'鼻腫眼青',
-u'避重逐輕',
-u'弊帚千金',
-u'敝帚自享',
-u'弊帚自珍',
-u'俾晝作夜',
-u'筆誅口伐',
-u'筆誅墨伐',
-u'鼻子裏笑',
-u'鼻子氣歪了',
-u'筆走龍蛇',
-u'婢作夫人',
-u'璧坐玑馳',
-u'便把令來行',
-u'變本加厲',
-u'鞭辟近裏',
-u'鞭不及腹',
-u'辯才無礙',
-u'辯才無閡',
-u'辯才無滞',
-u'鞭長不及',
-u'鞭長不及馬腹',
-u'鞭長駕遠',
-u'鞭長莫及',
-u'鞭長難及',
-u'邊塵不驚',
-u'鞭笞天下',
-u'鞭笞腰帶',
-u'便辭巧說',
-u'扁擔沒紮兩頭打塌',
-u'扁擔壓不出屁來',
-u'遍地開花',
-u'變動不居',
-u'變風改俗',
-u'忭風舞潤',
-u'變風易俗',
-u'邊幅不修',
-u'變服詭行',
-u'鞭根塊莖',
-u'變躬遷席',
-u'變古亂常',
-u'變古亂常不死則亡',
-u'變古易常',
-u'變古易俗',
-u'變化不測',
-u'變化不窮',
-u'變化多端',
-u'變化莫測',
-u'變化如神',
-u'變化無常',
-u'變化無方',
-u'變化無窮',
-u'變化有時',
-u'變幻不測',
-u'變幻靡常',
-u'變幻莫測',
-u'變幻無常',
-u'變幻無窮',
-u'變迹埋名',
-u'辯口利辭',
-u'辯口利舌',
-u'變醨養瘠',
-u'變臉變色',
-u'鞭麟笞鳳',
-u'鞭鵉笞鳳',
-u'變亂叠起',
-u'變亂紛乘',
-u'變亂四起',
-u'弁髦法紀',
-u'變名易姓',
-u'鞭墓戮屍',
-u'鞭驽策蹇',
-u'便辟側媚',
-u'鞭擗進裏',
-u'鞭辟入裏',
-u'鞭辟向裏',
-u'鞭辟着裏',
-u'變起蕭牆',
-u'扁鵲複生',
-u'砭人肌骨',
-u'辨日炎涼',
-u'變容改俗',
-u'辨如懸河',
-u'辨若懸河',
-u'邊塞把手',
-u'變色易容',
-u'變色之言',
-u'變身強化',
-u'變生不測',
-u'變生肘腋',
-u'便失大道',
-u'便是是非人',
-u'辯說屬辭',
-u'鞭絲帽影',
-u'變俗移風',
-u'變俗易教',
-u'變态百出',
-u'變貪厲薄',
-u'遍體鱗傷',
-u'變危爲安',
-u'辨物居方',
-u'邊寫邊讀',
-u'變心易慮',
-u'變炫無窮',
-u'變顔變色',
-u'便宜從事',
-u'便宜施行',
-u'便宜行事',
-u'砭庸針俗',
-u'鞭約近裏',
-u'編造謊言',
-u'邊整邊改',
-u'變徴之聲',
-u'卞莊刺虎',
-u'便作等閑看',
-u'彪炳千古',
-u'飙發電舉',
-u'膘肥體壯',
-u'飙舉電至',
-u'表裏不一',
-u'表裏河山',
-u'表裏精粗',
-u'表裏如一',
-u'表裏山河',
-u'表裏受敵',
-u'表裏爲奸',
-u'表裏相符',
-u'表裏相合',
-u'表裏相濟',
-u'表裏相依',
-u'表裏相應',
-u'表裏一緻',
-u'表裏作奸',
-u'摽梅之候',
-u'摽梅之年',
-u'表面文章',
-u'摽末之功',
-u'标情奪趣',
-u'表情見意',
-u'标同伐異',
-u'标新創異',
-u'标新競異',
-u'标新立異',
-u'标新領異',
-u'标新取異',
-u'标新豎異',
-u'彪形大漢',
-u'标枝野鹿',
-u'表壯不如裏壯',
-u'婊子無情',
-u'別抱琵琶',
-u'別财異居',
-u'別出機杼',
-u'別出手眼',
-u'別出心裁',
-u'別出新意',
-u'別創一格',
-u'別風淮雨',
-u'別婦抛雛',
-u'別鶴孤鵉',
-u'別鶴離鵉',
-u'別恨離愁',
-u'別籍異财',
-u'別籍異居',
-u'別徑奇道',
-u'別具肺腸',
-u'別具慧眼',
-u'別具匠心',
-u'別具爐錘',
-u'別具手眼',
-u'別具心腸',
-u'別居異财',
-u'別具一格',
-u'別具隻眼',
-u'別開町畦',
-u'別開生路',
-u'別開生面',
-u'別開世界',
-u'別開蹊徑',
-u'別開一格',
-u'別來無恙',
-u'別類分門',
-u'別名分析',
-u'別啓生面',
-u'別饒風趣',
-u'別人的子死未了',
-u'別人懷寶劍',
-u'別人牽驢你拔橛子',
-u'別人牽驢他拔橛兒',
-u'別生枝節',
-u'別是一番滋味',
-u'別樹一旗',
-u'別樹一幟',
-u'別無長物',
-u'別無二緻',
-u'別無分店',
-u'別無他物',
-u'別尋蹊徑',
-u'別易會難',
-u'別有洞天',
-u'別有肺腸',
-u'別有風趣',
-u'別有風味',
-u'別有風緻',
-u'別有會心',
-u'別有乾坤',
-u'別有人間',
-u'別有他腸',
-u'別有天地',
-u'別有心腸',
-u'別有心肝',
-u'別有用心',
-u'別有滋味',
-u'別置一喙',
-u'別作良圖',
-u'別作一眼',
-u'彬彬濟濟',
-u'彬彬文質',
-u'彬彬有禮',
-u'賓從如雲',
-u'賓餞日月',
-u'賓客滿門',
-u'賓客如雲',
-u'賓客迎門',
-u'賓來如歸',
-u'鬓亂钗橫',
-u'鬓亂钗斜',
-u'賓朋成市',
-u'賓朋滿座',
-u'賓入如歸',
-u'鬓絲禅榻',
-u'賓斯匹德',
-u'鬓影衣香',
-u'賓至如歸',
-u'掤扒吊拷',
-u'兵敗如山倒',
-u'秉筆直書',
-u'炳炳烺烺',
-u'炳炳麟麟',
-u'病病歪歪',
-u'炳炳鑿鑿',
-u'兵不逼好',
-u'兵不接刃',
-u'兵不畏死敵必克',
-u'兵不畏死戰必勇',
-u'兵不污刃',
-u'兵不血刃',
-u'兵不厭權',
-u'兵不厭詐',
-u'兵不由将',
-u'兵藏武庫',
-u'兵藏武庫馬入華山',
-u'兵車之會',
-u'兵出無名',
-u'并垂不朽',
-u'病從口入',
-u'病從口入禍從口出',
-u'并存不悖',
-u'兵挫地削',
-u'并膽同心',
-u'并蒂芙蓉',
-u'并蒂蓮花',
-u'冰凍三尺',
-u'冰凍三尺非一日之寒',
-u'冰凍災害',
-u'冰凍之矢',
-u'兵對兵将對将',
-u'兵多将廣',
-u'兵多将勇',
-u'兵多者敗',
-u'兵分勢弱',
-u'病風喪心',
-u'并概青雲',
-u'兵革互興',
-u'兵革滿道',
-u'兵戈搶攘',
-u'兵戈擾攘',
-u'秉公辦理',
-u'秉公滅私',
-u'秉公任直',
-u'秉公無私',
-u'病骨支離',
-u'兵貴神速',
-u'兵貴先聲',
-u'病國病民',
-u'病國殃民',
-u'冰寒雪冷',
-u'冰寒于水',
-u'冰壑玉壺',
-u'冰壺秋月',
-u'冰壺玉尺',
-u'冰壺玉衡',
-u'冰花雪舞',
-u'兵荒馬亂',
-u'冰魂素魄',
-u'冰魂雪魄',
-u'冰火溫泉',
-u'病急亂投醫',
-u'冰肌雪腸',
-u'冰肌雪膚',
-u'冰肌雪豔',
-u'冰肌玉骨',
-u'冰肌玉姿',
-u'并駕齊驅',
-u'并肩作戰',
-u'并疆兼巷',
-u'兵驕必敗',
-u'兵驕将傲',
-u'兵驕者滅',
-u'秉節持重',
-u'冰解的破',
-u'冰解凍釋',
-u'冰解壤分',
-u'冰解雪釋',
-u'冰潔玉清',
-u'冰潔淵清',
-u'冰解雲散',
-u'并介之人',
-u'兵精将勇',
-u'兵精糧廣',
-u'兵精糧足',
-u'兵精馬強',
-u'秉鈞持軸',
-u'秉鈞當軸',
-u'兵靠将帶',
-u'病狂喪心',
-u'冰壸秋月',
-u'兵來将擋',
-u'兵來将擋水來土屯',
-u'兵來将擋水來土掩',
-u'兵來将敵',
-u'兵來将敵水來土堰',
-u'兵來将迎',
-u'兵來将迎水來土堰',
-u'病來如山倒',
-u'兵老将驕',
-u'冰冷無味',
-u'并立不悖',
-u'兵離将敗',
-u'兵連禍接',
-u'兵連禍深',
-u'兵連衆結',
-u'兵臨城下',
-u'兵亂年荒',
-u'兵馬不動糧草先行',
-u'兵馬精強',
-u'兵馬倥偬',
-u'兵馬未動',
-u'兵馬未動糧草先行',
-u'秉旄仗钺',
-u'病民蠱國',
-u'病民害國',
-u'病魔纏身',
-u'兵拏禍結',
-u'冰瓯雪椀',
-u'并辔齊驅',
-u'兵疲意阻',
-u'屏氣累息',
-u'屏氣斂息',
-u'屏氣凝神',
-u'屏氣懾息',
-u'屏氣咋舌',
-u'兵強将勇',
-u'兵強馬壯',
-u'兵強士勇',
-u'兵強則滅',
-u'冰清水冷',
-u'冰清玉粹',
-u'冰清玉骨',
-u'冰清玉潔',
-u'冰清玉潤',
-u'并驅齊駕',
-u'并驅争先',
-u'病染膏肓',
-u'病人福音',
-u'兵刃相接',
-u'并日而食',
-u'并容徧覆',
-u'并容不悖',
-u'并容偏覆',
-u'兵戎相見',
-u'病入膏肓',
-u'病入骨随',
-u'炳如觀火',
-u'炳如日星',
-u'炳若觀火',
-u'炳若日星',
-u'冰散瓦解',
-u'冰鲨墓地',
-u'冰山難靠',
-u'冰山難恃',
-u'冰山失勢',
-u'冰山已倒',
-u'冰山之春',
-u'兵殇怨靈',
-u'屏聲靜氣',
-u'屏聲靜息',
-u'屏聲息氣',
-u'冰釋理順',
-u'病勢尪羸',
-u'并世無兩',
-u'并世無雙',
-u'冰炭不洽',
-u'冰炭不容',
-u'冰炭不同爐',
-u'冰炭不同器',
-u'冰炭不投',
-u'冰炭不相容',
-u'冰炭不言',
-u'冰炭不言冷熱自明',
-u'冰炭同器',
-u'冰炭相愛',
-u'冰炭相息',
-u'冰蹄水井',
-u'冰天雪地',
-u'冰天雪窖',
-u'冰天雪窯',
-u'并頭之花',
-u'兵爲邦捍',
-u'兵微将乏',
-u'兵微将寡',
-u'并威偶勢',
-u'兵未血刃',
-u'并爲一談',
-u'秉文兼武',
-u'秉文經武',
-u'兵聞拙速',
-u'并無不當',
-u'兵無常勝',
-u'兵無常勢',
-u'兵無常形',
-u'并無此事',
-u'兵無血刃',
-u'屏息凝神',
-u'冰弦玉柱',
-u'兵燹之禍',
-u'兵相骀藉',
-u'冰消凍解',
-u'冰消凍釋',
-u'兵銷革偃',
-u'冰消瓦解',
-u'冰消瓦離',
-u'冰銷霧散',
-u'冰消雪釋',
-u'冰銷葉散',
-u'冰消雲散',
-u'并心同力',
-u'冰心一片',
-u'冰心玉壺',
-u'冰心玉監',
-u'并行不悖',
-u'并行不厲',
-u'兵行詭道',
-u'禀性難移',
-u'兵熊熊一個',
-u'兵兇戰危',
-u'冰雪聰明',
-u'冰雪嚴寒',
-u'秉要執本',
-u'兵已在頸',
-u'兵以詐立',
-u'病有高人說藥方',
-u'病由口入',
-u'病在膏肓',
-u'病在骨髓',
-u'兵在精不在多',
-u'兵在精而不在多',
-u'兵在其頸',
-u'并贓拿敗',
-u'并贓拿賊',
-u'秉政勞民',
-u'秉正無私',
-u'秉軸持鈞',
-u'秉燭待旦',
-u'炳燭夜遊',
-u'炳燭之明',
-u'冰姿玉骨',
-u'博愛濟群',
-u'博愛濟衆',
-u'勃暗作色',
-u'博釆衆美',
-u'博釆衆益',
-u'跛鼈千裏',
-u'博采旁搜',
-u'博采窮搜',
-u'博采群議',
-u'博采輿情',
-u'博采衆長',
-u'博采衆議',
-u'撥草尋蛇',
-u'撥草瞻風',
-u'剝床及膚',
-u'剝床之災',
-u'薄此厚彼',
-u'博大闳深',
-u'博大精深',
-u'博大思深',
-u'伯道無兒',
-u'伯道之嗟',
-u'伯道之戚',
-u'伯道之憂',
-u'踣地呼天',
-u'播惡遺臭',
-u'博而不精',
-u'博而寡要',
-u'撥煩理劇',
-u'撥煩理亂',
-u'撥煩理難',
-u'撥風也似',
-u'剝膚椎髓',
-u'剝膚及髓',
-u'博夫營地',
-u'剝膚之痛',
-u'伯歌季舞',
-u'博古通今',
-u'博古知今',
-u'博觀泛覽',
-u'博關經典',
-u'博觀強記',
-u'博觀慎取',
-u'波光鱗鱗',
-u'薄海歡騰',
-u'薄海騰歡',
-u'波駭雲屬',
-u'薄寒中人',
-u'剝極必複',
-u'擘肌分理',
-u'搏擊棍棒',
-u'剝極将複',
-u'博極群書',
-u'薄技在身',
-u'剝極則複',
-u'剝繭抽絲',
-u'博見多聞',
-u'博見強志',
-u'伯喈倒屣',
-u'薄今厚古',
-u'波谲雲詭',
-u'撥開雲霧見青天',
-u'播穅眯目',
-u'博拉爾德',
-u'博覽古今',
-u'波瀾開阖',
-u'波瀾老成',
-u'波瀾起伏',
-u'博覽群書',
-u'博覽書傳',
-u'博覽五車',
-u'波瀾壯闊',
-u'博浪飛椎',
-u'伯勞飛燕',
-u'伯樂相馬',
-u'伯樂一顧',
-u'伯樂之顧',
-u'擘兩分星',
-u'波流茅靡',
-u'波路壯闊',
-u'撥亂返正',
-u'撥亂反治',
-u'撥亂濟時',
-u'撥亂濟危',
-u'撥亂爲治',
-u'撥亂興治',
-u'撥亂之才',
-u'撥亂誅暴',
-u'波羅塞戲',
-u'波羅奢花',
-u'伯慮愁眠',
-u'跛驢之伍',
-u'薄命佳人',
-u'薄暮冥冥',
-u'薄暮之錘',
-u'伯牛之疾',
-u'搏牛之虻',
-u'撥弄是非',
-u'薄批細抹',
-u'波平風靜',
-u'波平浪靜',
-u'博洽多聞',
-u'薄情寡義',
-u'薄情無義',
-u'勃然變色',
-u'勃然不悅',
-u'勃然大怒',
-u'勃然奮勵',
-u'勃然作色',
-u'般若心經',
-u'搏砂弄汞',
-u'博識多通',
-u'博識多聞',
-u'博施濟衆',
-u'博士買驢',
-u'博識洽聞',
-u'搏手無策',
-u'博碩肥腯',
-u'剝絲抽繭',
-u'波濤起伏',
-u'波濤洶湧',
-u'博通經籍',
-u'簸土揚沙',
-u'撥萬論千',
-u'博聞辯言',
-u'博聞多見',
-u'博聞多識',
-u'博聞闳覽',
-u'博聞強記',
-u'博聞強識',
-u'博文約禮',
-u'博物多識',
-u'博物多聞',
-u'博物君子',
-u'博物洽聞',
-u'薄霧山谷',
-u'博物通達',
-u'薄物細故',
-u'勃谿相向',
-u'渤澥桑田',
-u'跛行千裏',
-u'博學多才',
-u'博學多記',
-u'博學多能',
-u'博學多聞',
-u'博學宏才',
-u'博學宏詞',
-u'博學鴻儒',
-u'博學洽聞',
-u'博學審問',
-u'博學通識',
-u'伯埙仲篪',
-u'伯牙鼓琴',
-u'伯牙絕弦',
-u'撥一撥動一動',
-u'薄衣輕衫',
-u'博弈猶賢',
-u'博引旁搜',
-u'博引旁征',
-u'波湧雲亂',
-u'撥雨撩雲',
-u'伯俞泣仗',
-u'伯玉知非',
-u'撥雲睹日',
-u'撥雲見日',
-u'撥雲見天',
-u'撥雲撩雨',
-u'撥雲霧見青天',
-u'薄志弱行',
-u'伯仲叔季',
-u'伯仲之間',
-u'波屬雲委',
-u'撥嘴撩牙',
-u'薄祚寒門',
-u'不安本分',
-u'不按君臣',
-u'不谙禮節',
-u'不安其室',
-u'不安其位',
-u'不谙事務',
-u'不安小成',
-u'不安于室',
-u'不安于位',
-u'不拔一毛',
-u'不拔之策',
-u'不拔之志',
-u'不白之謗',
-u'不敗之地',
-u'不白之冤',
-u'不卑不亢',
-u'布被瓦器',
-u'不比不知道一比吓一跳',
-u'不辟斧钺',
-u'不避艱險',
-u'補弊救偏',
-u'不避勞苦',
-u'補敝起廢',
-u'不避強禦',
-u'不避菽麥',
-u'不避水火',
-u'不避湯火',
-u'不變其文',
-u'不辨清渾',
-u'不辨清濁',
-u'不辨菽麥',
-u'不辨菽粟',
-u'不便水土',
-u'不辨真僞',
-u'不變之法',
-u'不別菽麥',
-u'不賓之士',
-u'布帛菽粟',
-u'逋播之臣',
-u'步步登高',
-u'步步高陞',
-u'不蔔可知',
-u'步步蓮花',
-u'不步人腳',
-u'步步生蓮花',
-u'步步爲營',
-u'不擦紅粉也風流',
-u'不睬不瞅',
-u'不才之事',
-u'補殘守缺',
-u'不慚屋漏',
-u'不測風雲',
-u'不測之禍',
-u'不測之憂',
-u'不測之淵',
-u'不測之智',
-u'不測之誅',
-u'不測之罪',
-u'不茶不飯',
-u'不差毫發',
-u'不差毫厘',
-u'不差累黍',
-u'不差上下',
-u'不臣之心',
-u'不成方圓',
-u'不成三瓦',
-u'不成體統',
-u'不逞之輩',
-u'不逞之徒',
-u'不癡不聾',
-u'不癡不聾不做阿家翁',
-u'不吃黃連不知啥叫苦',
-u'不吃饅頭蒸口氣',
-u'不吃饅頭争蒸口汽',
-u'不啻天地',
-u'不啻天淵',
-u'不恥下問',
-u'不吃羊肉空惹一身膻',
-u'不齒于人',
-u'不偢不采',
-u'不愁吃不愁穿',
-u'不愁海龍王沒寶',
-u'不愁沒柴燒',
-u'不愁無處下金鈎',
-u'不出所料',
-u'不揣冒昧',
-u'不傳之妙',
-u'補瘡剜肉',
-u'不雌不雄',
-u'不辭而別',
-u'不辭而行',
-u'不辭勞苦',
-u'不辭勞怨',
-u'不次之遷',
-u'不此之圖',
-u'不次之位',
-u'不聰不明',
-u'不存不濟',
-u'不存芥蒂',
-u'不存之地',
-u'不打不成相識',
-u'不打不成相與',
-u'不打不相識',
-u'不達大體',
-u'不達世故',
-u'不達時務',
-u'不達時宜',
-u'不打無把握之仗',
-u'不打自招',
-u'不待明言',
-u'不待蓍龜',
-u'不待思索',
-u'不擔斤兩',
-u'不憚勞苦',
-u'不憚其煩',
-u'不憚強禦',
-u'不當不正',
-u'不當家不知柴米貴',
-u'不當人子',
-u'不到白頭死',
-u'不到黃河不死心',
-u'不到黃河不脫鞋',
-u'不到黃河心不死',
-u'不到烏江不盡頭',
-u'不到烏江不肯休',
-u'不到烏江心不死',
-u'不得安身',
-u'不得安穩',
-u'不得不爾',
-u'不德而功',
-u'不得而聞',
-u'不得而知',
-u'不得開交',
-u'不得其法',
-u'不得其門而入',
-u'不得其死',
-u'不得其所',
-u'不得其詳',
-u'不得人心',
-u'不得如意',
-u'不得善終',
-u'不得聲張',
-u'布德施恩',
-u'布德施惠',
-u'不得台盤',
-u'不得違誤',
-u'不得相幹',
-u'不得已而爲之',
-u'不得已而用之',
-u'不得有違',
-u'不得有誤',
-u'不得主意',
-u'不登大雅',
-u'不登大雅之堂',
-u'不登高山不顯平地',
-u'步調一緻',
-u'不動筆墨不看書',
-u'不動聲色',
-u'不動形色',
-u'不懂裝懂',
-u'步鬥踏罡',
-u'不讀書有權不識字有錢',
-u'不斷如帶',
-u'不奪農時',
-u'不惡而嚴',
-u'不惡下問',
-u'布恩施德',
-u'不二法門',
-u'不二之老',
-u'不法常可',
-u'不法古不修今',
-u'不乏其人',
-u'不乏其事',
-u'不發聲色',
-u'不乏斯人',
-u'不乏先例',
-u'步伐一緻',
-u'不發之地',
-u'布颿無恙',
-u'不煩蠅削',
-u'不悱不發',
-u'不費吹灰之力',
-u'不廢江河',
-u'不費之惠',
-u'不分彼此',
-u'不分彼我',
-u'不分伯仲',
-u'不憤不啓',
-u'不分敵我',
-u'不分好歹',
-u'不分青白',
-u'不分青紅皂白',
-u'不分勝負',
-u'不分軒轾',
-u'不分玉石',
-u'不分皁白',
-u'不分畛畦',
-u'不分畛域',
-u'不豐不儉',
-u'不逢不若',
-u'不豐不殺',
-u'捕風弄月',
-u'捕風系影',
-u'捕風捉影',
-u'不伏個燒埋',
-u'不複堪命',
-u'不伏燒埋',
-u'不伏水土',
-u'不負所托',
-u'不負衆望',
-u'不扶自直',
-u'不改其樂',
-u'不尴不尬',
-u'不幹不淨',
-u'不甘雌伏',
-u'不敢告勞',
-u'不敢高攀',
-u'不敢苟同',
-u'不敢後人',
-u'不甘寂寥',
-u'不甘寂寞',
-u'不敢吭聲',
-u'不敢掠美',
-u'不敢旁骛',
-u'不敢啓齒',
-u'不甘示弱',
-u'不敢問津',
-u'不敢越雷池一步',
-u'不敢造次',
-u'不敢自專',
-u'步罡踏鬥',
-u'不高興你呢',
-u'不根持論',
-u'不根之論',
-u'不根之談',
-u'不根之言',
-u'不耕而獲',
-u'不公不法',
-u'不共戴天',
-u'不共天地',
-u'不共之仇',
-u'不恭之詞',
-u'不攻自拔',
-u'不攻自潰',
-u'不攻自破',
-u'不夠塞牙縫的',
-u'不苟笑語',
-u'不苟言笑',
-u'不苟訾笑',
-u'不古不今',
-u'不瞽不聾',
-u'不顧大局',
-u'布鼓雷門',
-u'不顧前後',
-u'不顧生死',
-u'不顧死活',
-u'不顧一切',
-u'不管不顧',
-u'不管好賴',
-u'不關緊要',
-u'不管三七二十一',
-u'不關痛癢',
-u'不管一二',
-u'不軌不物',
-u'不歸零制',
-u'不龜手藥',
-u'不軌之徒',
-u'不過爾爾',
-u'補過飾非',
-u'補過拾遺',
-u'不寒而栗',
-u'不寒而慓',
-u'不合邏輯',
-u'不和你一般見識',
-u'不合時宜',
-u'不哼不哈',
-u'不護細行',
-u'不懷好意',
-u'不歡而別',
-u'不歡而散',
-u'不慌不忙',
-u'不遑多讓',
-u'不遑枚舉',
-u'不遑寧處',
-u'不遑寧息',
-u'不遑啓處',
-u'不遑暇食',
-u'不惠不夷',
-u'不會說無禮',
-u'不諱之變',
-u'不諱之朝',
-u'不諱之路',
-u'不諱之門',
-u'不毀之制',
-u'不葷不素',
-u'不惑不解',
-u'不惑之年',
-u'不饑不寒',
-u'不即不離',
-u'不疾不徐',
-u'不擊乃無煙',
-u'不計其數',
-u'不及其餘',
-u'不記前仇',
-u'不羁之才',
-u'不及之法',
-u'不羁之民',
-u'不羁之士',
-u'不急之務',
-u'不稼不穑',
-u'不假雕镂',
-u'不假雕飾',
-u'不假思量',
-u'不假思慮',
-u'不假思索',
-u'不假蠅削',
-u'不間不界',
-u'不見大體',
-u'不減對合利錢',
-u'不見棺材不掉淚',
-u'不見棺材不落淚',
-u'不見棺材不下淚',
-u'不見圭角',
-u'不見鬼子不開火',
-u'不見鬼子不拉栓',
-u'不見經傳',
-u'不見可欲使心不亂',
-u'不見人下',
-u'不見人下來',
-u'不見森林',
-u'不見泰山',
-u'不見天日',
-u'不見兔子不撒鷹',
-u'不見輿薪',
-u'不見真佛不燒香',
-u'不驕不躁',
-u'不教而殺',
-u'不教而誅',
-u'不交付項',
-u'不教之教',
-u'不解衣帶',
-u'不解之仇',
-u'不解之緣',
-u'不矜不伐',
-u'不今不古',
-u'不緊不慢',
-u'不矜不盈',
-u'不禁不由',
-u'不近道理',
-u'不矜而莊',
-u'不近人情',
-u'不進山門不受戒',
-u'不矜細行',
-u'不矜小節',
-u'不進則退',
-u'不胫而馳',
-u'不胫而走',
-u'不驚雞犬',
-u'不經世故',
-u'不經一事',
-u'不經一事不長一智',
-u'不經之說',
-u'不經之談',
-u'不經之語',
-u'不揪不采',
-u'不酒而醉',
-u'不咎既往',
-u'不拘常次',
-u'不拘常格',
-u'不拘禁忌',
-u'不拘繩墨',
-u'補苴調胹',
-u'不拘文法',
-u'不拘細節',
-u'不拘細行',
-u'補苴罅漏',
-u'不拘小節',
-u'不拘形迹',
-u'不拘一格',
-u'不拘一體',
-u'不拘一塗',
-u'不覺不知',
-u'不覺技癢',
-u'不絕如帶',
-u'不絕如發',
-u'不絕如縷',
-u'不絕如綖',
-u'不絕若繩',
-u'不絕若線',
-u'不絕于耳',
-u'不堪回首',
-u'不堪其憂',
-u'不堪人目',
-u'不堪入耳',
-u'不堪入目',
-u'不看僧而看佛面',
-u'不看僧面看佛面',
-u'不堪設想',
-u'不堪視聽',
-u'不堪言狀',
-u'不堪一擊',
-u'不堪造就',
-u'不刊之筆',
-u'不刊之典',
-u'不刊之法',
-u'不刊之範',
-u'不堪之患',
-u'不刊之論',
-u'不刊之書',
-u'不刊之說',
-u'不刊之訓',
-u'不刊之語',
-u'不刊之則',
-u'不刊之作',
-u'不堪卒讀',
-u'不亢不卑',
-u'不可逼視',
-u'不可比狀',
-u'不可辨駁',
-u'不可不信不可全信',
-u'不可殚舉',
-u'不可得詳',
-u'不可抵賴',
-u'不可動搖',
-u'不可端倪',
-u'不可多得',
-u'不可遏止',
-u'不可告人',
-u'不可估量',
-u'不可忽視',
-u'不可教訓',
-u'不可究诘',
-u'不可救療',
-u'不可救藥',
-u'不可開交',
-u'不可抗拒',
-u'不可揆度',
-u'不可理喻',
-u'不可枚舉',
-u'不可名貌',
-u'不可名目',
-u'不可名狀',
-u'不可磨滅',
-u'不可摸捉',
-u'不可奈何',
-u'不可偏廢',
-u'不可偏棄',
-u'不可企及',
-u'不可曲中求',
-u'不可勝道',
-u'不可勝計',
-u'不可勝舉',
-u'不可勝論',
-u'不可勝書',
-u'不可勝算',
-u'不可勝言',
-u'不可勝用',
-u'不可勝載',
-u'不可示弱',
-u'不可收拾',
-u'不可思議',
-u'不可讨究',
-u'不可同年',
-u'不可同年而語',
-u'不可同日而語',
-u'不可悉數',
-u'不可限量',
-u'不可鄉迩',
-u'不可邪而有餘',
-u'不可軒轾',
-u'不可言傳',
-u'不可言宣',
-u'不可言喻',
-u'不可言狀',
-u'不可一視',
-u'不可移易',
-u'不可預見',
-u'不可逾越',
-u'不可造次',
-u'不可知的命運',
-u'不可指數',
-u'不可終日',
-u'不可捉摸',
-u'不克自拔',
-u'不克自振',
-u'不肯苟同',
-u'不肯一世',
-u'不愧不作',
-u'不揆梼昧',
-u'不愧屋漏',
-u'不媿下學',
-u'不拉屎占茅坑',
-u'不郎不秀',
-u'不稂不莠',
-u'不勞而成',
-u'不勞而獲',
-u'不勞而食',
-u'補牢顧犬',
-u'不冷不熱',
-u'不立文字',
-u'不戀風景戀風月',
-u'不涼不酸',
-u'不良法術',
-u'不了不當',
-u'不了而了',
-u'不了了之',
-u'不了自了',
-u'不劣方頭',
-u'不磷不缁',
-u'不吝賜教',
-u'不吝指教',
-u'不吝珠玉',
-u'不伶不俐',
-u'不零不落',
-u'不留餘地',
-u'不露辭色',
-u'不露鋒芒',
-u'不露斧斤',
-u'不露圭角',
-u'不露神色',
-u'不露聲色',
-u'不露形色',
-u'不倫不類',
-u'不論秧子',
-u'不落邊際',
-u'不落窠臼',
-u'不落人後',
-u'不落俗套',
-u'不落蹊徑',
-u'不落言筌',
-u'不落畛畦',
-u'步履安詳',
-u'步履艱辛',
-u'步履矯健',
-u'步履蹒跚',
-u'步履如飛',
-u'步履維艱',
-u'不蔓不支',
-u'逋慢之罪',
-u'不忙不暴',
-u'不毛之地',
-u'不迷鮮花迷煙花',
-u'不免虎口',
-u'不滅信仰',
-u'不明不暗',
-u'不明不白',
-u'不明道理',
-u'不明底蘊',
-u'不明事理',
-u'不明所以',
-u'不名一格',
-u'不名一錢',
-u'不名一文',
-u'不鳴則已一鳴驚人',
-u'不謀而合',
-u'不謀而同',
-u'不謀而信',
-u'不謀其政',
-u'不謀私利',
-u'不謀同辭',
-u'不牧之地',
-u'不奈之何',
-u'不撓不屈',
-u'不撓不折',
-u'不能成方圓',
-u'不能持論',
-u'不能出口',
-u'不能登大雅之堂',
-u'不能反躬',
-u'不能己己',
-u'不能盡數',
-u'不能容物',
-u'不能善後',
-u'不能勝數',
-u'不能忘懷',
-u'不能忘情',
-u'不能越雷池一步',
-u'不能贊一辭',
-u'不能正己焉能正人',
-u'不能自拔',
-u'不能自保',
-u'不能自己',
-u'不能自食',
-u'不能自休',
-u'不能自已',
-u'不能自制',
-u'不能自主',
-u'不念舊惡',
-u'不念僧面念佛面',
-u'不寧唯是',
-u'不怕不識貨',
-u'不怕不識貨就怕貨比貨',
-u'不怕官隻怕管',
-u'不怕貓兒不上樹',
-u'不怕沒好事就怕沒好人',
-u'不怕人不敬就怕己不正',
-u'不怕縣官隻怕現管',
-u'不怕一萬就怕萬一',
-u'不怕賊偷就怕賊惦心',
-u'不辟子卯',
-u'不偏不黨',
-u'不偏不徇',
-u'不偏不倚',
-u'補偏救弊',
-u'不平而鳴',
-u'不平則鳴',
-u'不平之鳴',
-u'不破不立',
-u'哺粕啜醨',
-u'不欺闇室',
-u'不棄草昧',
-u'不期而會',
-u'不期而集',
-u'不期而然',
-u'不期而同',
-u'不期而遇',
-u'不棄故劍',
-u'不期然而然',
-u'不欺室漏',
-u'不欺屋漏',
-u'不期修古',
-u'不器之器',
-u'不乾不淨',
-u'不遷之廟',
-u'不切實際',
-u'不勤而獲',
-u'不擒二毛',
-u'不情不緒',
-u'不輕然諾',
-u'不傾之地',
-u'不情之請',
-u'不求金玉重重貴',
-u'不求上進',
-u'不求甚解',
-u'不求同日生隻願同日死',
-u'不求聞達',
-u'不求有功',
-u'不求有功但求無過',
-u'不屈不撓',
-u'不屈精神',
-u'不屈意志',
-u'補阙燈檠',
-u'補阙挂漏',
-u'補阙拾遺',
-u'布裙荊钗',
-u'不染一塵',
-u'不讓之責',
-u'不忍不耐',
-u'不仁不義',
-u'步人後塵',
-u'不任其煩',
-u'不仁起富',
-u'不忍釋卷',
-u'不忍釋手',
-u'不仁之器',
-u'不忍卒讀',
-u'不日不月',
-u'不容分說',
-u'不容分訴',
-u'不容置辯',
-u'不容置喙',
-u'不容置疑',
-u'不如暗處一燈',
-u'不如薄技在身',
-u'不茹不吐',
-u'不入佛門不受戒',
-u'不如孤月獨明',
-u'不如歸去',
-u'不入虎穴',
-u'不入虎穴不得虎子',
-u'不入虎穴焉得虎子',
-u'不如明解經書',
-u'不辱使命',
-u'不入時宜',
-u'不入獸穴安得獸子',
-u'不如意事常八九',
-u'不如自生',
-u'不塞不流',
-u'不塞不流不止不行',
-u'不三不四',
-u'不塞下流',
-u'不塞下流不止不行',
-u'不僧不俗',
-u'不衫不屦',
-u'不衫不履',
-u'不善自謀',
-u'不上不落',
-u'不上不下',
-u'不傷大體',
-u'不上蘆葦',
-u'不傷脾胃',
-u'不上台盤',
-u'不賞之功',
-u'不少概見',
-u'不涉你目',
-u'不涉你足',
-u'不舍晝夜',
-u'不甚了了',
-u'不甚軒轾',
-u'不勝杯杓',
-u'不勝杯酌',
-u'不聲不吭',
-u'不生不滅',
-u'不聲不氣',
-u'捕生不如捕熟',
-u'不生不死',
-u'不聲不響',
-u'不勝技癢',
-u'不勝枚舉',
-u'不勝其弊',
-u'不勝其煩',
-u'不勝其忿',
-u'不勝其苦',
-u'不勝其怒',
-u'不勝其任',
-u'不勝之任',
-u'不勝之喜',
-u'不飾邊幅',
-u'不識不知',
-u'不是才人莫獻詩',
-u'不是撐船手休來弄竹竿',
-u'不識大體',
-u'不識東家',
-u'不識風色',
-u'不識高低',
-u'不失圭撮',
-u'不識好歹',
-u'不失毫厘',
-u'不識好惡',
-u'不事稼穑',
-u'不識斤兩',
-u'不識進退',
-u'不失舊物',
-u'不識局面',
-u'不識廉恥',
-u'不識廬山真面目',
-u'不識馬肝',
-u'不識起倒',
-u'不識去就',
-u'不食人間煙火',
-u'不識人間有羞恥事',
-u'不事生計',
-u'不識時變',
-u'不失時機',
-u'不識時務',
-u'不适時宜',
-u'不失黍累',
-u'不識擡舉',
-u'不識泰山',
-u'不識痛癢',
-u'不識賢愚',
-u'不飾小節',
-u'不識羞恥',
-u'不食煙火',
-u'不食煙火食',
-u'不識一丁',
-u'不是一家人不進一家門',
-u'不失一字',
-u'不是魚死就是網破',
-u'不是冤家不聚頭',
-u'不是冤家不碰頭',
-u'不世之才',
-u'不世之臣',
-u'不食之地',
-u'不世之功',
-u'不世之略',
-u'不識之無',
-u'不時之需',
-u'不世之勳',
-u'不世之業',
-u'不是知音莫與彈',
-u'不世之姿',
-u'不食周粟',
-u'不失铢黍',
-u'不守本分',
-u'不受苦中苦難爲人上人',
-u'不受擡舉',
-u'不守小節',
-u'蔔數隻偶',
-u'不爽分毫',
-u'不爽毫發',
-u'不爽累黍',
-u'不爽锱铢',
-u'不說不笑不打不叫',
-u'不死不活',
-u'不死不生',
-u'不死也扒成皮',
-u'不死也帶傷',
-u'布素之交',
-u'不速之客',
-u'不速之客不請自來',
-u'不随以止',
-u'步态蹒跚',
-u'不貪不倚',
-u'不貪爲寶',
-u'逋逃幽薮',
-u'逋逃淵薮',
-u'逋逃之臣',
-u'逋逃之薮',
-u'不疼不熱',
-u'布天蓋地',
-u'補天欲日',
-u'不腆之地',
-u'不腆之敬',
-u'不腆之酒',
-u'不腆之儀',
-u'補天柱地',
-u'不祧之宗',
-u'不挑之祖',
-u'不聽老人言吃虧在眼前',
-u'不痛不癢',
-u'不通大體',
-u'不同戴天',
-u'不同的腳色',
-u'不通吊慶',
-u'不同凡流',
-u'不同凡調',
-u'不同凡響',
-u'不同凡庸',
-u'不通痾癢',
-u'不同流俗',
-u'不同日月',
-u'不通世故',
-u'不通水火',
-u'不同天地',
-u'不通聞問',
-u'不吐不茹',
-u'不圖打魚隻圖混水',
-u'布襪青鞋',
-u'不外乎一個勤字',
-u'捕網法術',
-u'不忘溝壑',
-u'不忘故舊',
-u'不亡何時',
-u'不忘久要',
-u'不妄言笑',
-u'不爲凡響',
-u'不爲苟同',
-u'不爲牛後',
-u'不違農時',
-u'不畏強圉',
-u'不爲戎首',
-u'不違天時',
-u'不爲瓦全',
-u'不爲五鬥米折腰',
-u'不爲小補',
-u'蔔微言輕',
-u'不爲已甚',
-u'不爲畛畦',
-u'不問不聞',
-u'不文不武',
-u'不問青紅皂白',
-u'不問青黃',
-u'不問皂白',
-u'不猧不魀',
-u'不侮暗室',
-u'不舞不鶴',
-u'不務空名',
-u'不無小補',
-u'不務正業',
-u'不舞之鶴',
-u'不習地土',
-u'不惜工本',
-u'不襲窠臼',
-u'不習水土',
-u'不惜一辭',
-u'不惜一語',
-u'不系之舟',
-u'補罅葺漏',
-u'不鹹不淡',
-u'步線行針',
-u'不相妨礙',
-u'不相來往',
-u'不相上下',
-u'不相适應',
-u'不相往來',
-u'不相爲謀',
-u'不相問聞',
-u'不祥之金',
-u'不祥之木',
-u'不祥之言',
-u'不祥之兆',
-u'不曉世務',
-u'不孝有三無後爲大',
-u'不肖之徒',
-u'不肖子孫',
-u'不挾不矜',
-u'不屑齒及',
-u'不屑毀譽',
-u'不屑教誨',
-u'不屑一顧',
-u'不屑一世',
-u'不屑與齒',
-u'不屑置辯',
-u'不信但看筵中酒',
-u'不信老人言吃虧在眼前',
-u'不幸而言中',
-u'不省人事',
-u'捕熊陷阱',
-u'不脩邊幅',
-u'不修邊疆',
-u'不羞當面',
-u'不朽軍帽',
-u'不朽手套',
-u'不修小節',
-u'不朽之芳',
-u'不朽之功',
-u'不朽之勳',
-u'不許百姓點燈',
-u'不徐不疾',
-u'不虛此行',
-u'不恤人言',
-u'不虛是行',
-u'步雪履穿',
-u'不學無識',
-u'不學無術',
-u'不學無文',
-u'不學無知',
-u'不學亦徒然',
-u'不學者如蒿如草',
-u'不徇私情',
-u'不徇顔面',
-u'不言不語',
-u'不言不語念真經',
-u'不言不語心計多',
-u'不言而信',
-u'不言而谕',
-u'不厭其煩',
-u'不厭其詳',
-u'不厭求詳',
-u'不餍人望',
-u'不厭于詳',
-u'不言之化',
-u'不言之聽',
-u'不言之言',
-u'不養兒不知父母恩',
-u'不要得福不知覺',
-u'不藥而愈',
-u'蔔夜蔔晝',
-u'不夷不惠',
-u'不依不饒',
-u'不遺尺寸',
-u'不以辭害志',
-u'不遺寸草',
-u'不遺寸長',
-u'不翼而飛',
-u'不壹而三',
-u'不一而止',
-u'不一而足',
-u'不遺葑菲',
-u'不義富貴',
-u'不以規矩',
-u'不以規矩不成方圓',
-u'不以規矩不能成方圓',
-u'不易乎世',
-u'不以介懷',
-u'不以介意',
-u'不遺巨細',
-u'不亦樂乎',
-u'布衣粝食',
-u'布衣芒屩',
-u'不一其人',
-u'布衣黔首',
-u'不以人廢言',
-u'不亦善夫',
-u'布衣蔬食',
-u'布衣碎片',
-u'不以爲恥',
-u'布衣韋帶',
-u'不以爲奇',
-u'不以爲然',
-u'不以爲意',
-u'不以我爲德',
-u'布衣雄世',
-u'不以一眚掩大德',
-u'不易一字',
-u'不遺馀力',
-u'不遺餘慮',
-u'不義之财',
-u'不義之财如流水',
-u'不易之道',
-u'不易之地',
-u'不易之典',
-u'不易之分',
-u'布衣之交',
-u'布衣之舊',
-u'不易之論',
-u'不一緻性',
-u'布衣之雄',
-u'不瘖不聾',
-u'不陰不陽',
-u'不因不由',
-u'不飲從他酒價高',
-u'不飲盜泉',
-u'不因人熱',
-u'不憖一老',
-u'不因一事',
-u'不因漁父引',
-u'捕影撈風',
-u'捕影拿風',
-u'捕影系風',
-u'不用不知道一用吓一跳',
-u'不由分說',
-u'不由自主',
-u'不虞匮乏',
-u'不預則廢',
-u'不虞之備',
-u'不虞之變',
-u'不虞之隙',
-u'不虞之譽',
-u'不遠千裏',
-u'不怨天不尤人',
-u'不遠萬裏',
-u'步月登雲',
-u'不約而合',
-u'不約而同',
-u'不越雷池',
-u'不在話下',
-u'不在其位',
-u'不在其位不謀其政',
-u'不贊一詞',
-u'餔糟啜醨',
-u'不擇生冷',
-u'不擇手段',
-u'蔔宅蔔鄰',
-u'不長一智',
-u'不着邊際',
-u'不着筋節',
-u'不折不扣',
-u'不正之風',
-u'不置褒貶',
-u'不知不覺',
-u'不止不可',
-u'不忮不求',
-u'不知不識',
-u'不止不行',
-u'不知不罪',
-u'不忮叉求',
-u'不知大體',
-u'不知道哪頭炕熱',
-u'不知顛倒',
-u'不知薡董',
-u'不知端倪',
-u'不知恩義',
-u'不知凡幾',
-u'不知分限',
-u'不知甘苦',
-u'不知高低',
-u'不知高下',
-u'不知好歹',
-u'不知好歉',
-u'不知合變',
-u'不知何故',
-u'不知葫蘆裏賣的什麽藥',
-u'不知忌諱',
-u'不知紀極',
-u'不知戒後必有',
-u'不栉進士',
-u'不知進退',
-u'不知就裏',
-u'不置可否',
-u'不知老之将至',
-u'不知利害',
-u'不知哪塊雲彩下雨',
-u'不知哪塊雲采有雨',
-u'不知起倒',
-u'不知其二',
-u'不知其非',
-u'不知其可',
-u'不知其數',
-u'不知其詳',
-u'不知寝食',
-u'不知輕重',
-u'不知去向',
-u'不知人間有羞恥事',
-u'不知人事',
-u'不知肉味',
-u'不知深淺',
-u'不知世事',
-u'不知世務',
-u'不知死活',
-u'不知所出',
-u'不知所錯',
-u'不知所可',
-u'不知所适',
-u'不知所爲',
-u'不知所言',
-u'不知所以',
-u'不知所喻',
-u'不知所雲',
-u'不知所之',
-u'不知所終',
-u'不知疼癢',
-u'不知天高地厚',
-u'不知通變',
-u'不知痛癢',
-u'不知頭腦',
-u'不知下落',
-u'不知香臭',
-u'不值一駁',
-u'不值一顧',
-u'不值一噱',
-u'不值一錢',
-u'不值一哂',
-u'不值一談',
-u'不直一文',
-u'不值一笑',
-u'不知有漢',
-u'不知有漢何論魏晉',
-u'不知皁白',
-u'不知怎的',
-u'不知者不怪罪',
-u'不知者不罪',
-u'不治之症',
-u'不知自愛',
-u'不知自己',
-u'不知自檢',
-u'不知自量',
-u'不中不發',
-u'不中規狷',
-u'不中繩墨',
-u'不中擡舉',
-u'不中相與',
-u'不中于款',
-u'不終之藥',
-u'蔔晝蔔夜',
-u'不著邊際',
-u'不著不落',
-u'不主故常',
-u'不著痕迹',
-u'不著筋節',
-u'不著疼熱',
-u'不著痛癢',
-u'不著一字',
-u'不追既往',
-u'不贅一辭',
-u'不着疼熱',
-u'不自矜伐',
-u'不自量力',
-u'不自滿假',
-u'不自由毋寧死',
-u'不赀之費',
-u'不赀之祿',
-u'不赀之器',
-u'不赀之軀',
-u'不赀之賞',
-u'不赀之損',
-u'不足比數',
-u'不足不數',
-u'不足采信',
-u'不足齒及',
-u'不足齒數',
-u'不足挂齒',
-u'不足回旋',
-u'不足介意',
-u'不足輕重',
-u'不足任使',
-u'不足爲道',
-u'不足爲法',
-u'不足爲怪',
-u'不足爲據',
-u'不足爲慮',
-u'不足爲憑',
-u'不足爲奇',
-u'不足爲外人道',
-u'不足爲訓',
-u'不足爲異',
-u'不足以喻',
-u'不足與謀',
-u'不足之症',
-u'不足重輕',
-u'不做不休',
-u'不左右袒',
-u'擦拳抹幾',
-u'擦拳抹掌',
-u'擦油抹粉',
-u'擦掌摩拳',
-u'擦脂抹粉',
-u'材鄙怯勇',
-u'彩筆生花',
-u'才蔽識淺',
-u'才薄智淺',
-u'材薄質衰',
-u'财不苟取飲不亂性',
-u'财不露白',
-u'裁長補短',
-u'财成輔相',
-u'才儲八鬥',
-u'采椽不斫',
-u'才大難用',
-u'财大氣粗',
-u'才大氣高',
-u'才大如海',
-u'才大心細',
-u'彩帶之舞',
-u'财殚力竭',
-u'财殚力盡',
-u'财殚力痡',
-u'才當曹鬥',
-u'才德兼備',
-u'才德肩全',
-u'财動人心',
-u'才短氣粗',
-u'才短思澀',
-u'才短學荒',
-u'财多害自己',
-u'财多命殆',
-u'才多識寡',
-u'财多勢重',
-u'才多爲患',
-u'财多招忌損人苗',
-u'才乏兼人',
-u'才非玉潤',
-u'采葑采菲',
-u'采鳳随鴉',
-u'采風問俗',
-u'才富八鬥',
-u'才高八鬥',
-u'才高氣傲',
-u'才高七步',
-u'才高氣清',
-u'才高識廣',
-u'才高識遠',
-u'才高行厚',
-u'才高行潔',
-u'才高學富',
-u'才高意廣',
-u'才高倚馬',
-u'才高運蹇',
-u'才高志廣',
-u'才高知深',
-u'才貫二酉',
-u'才廣妨身',
-u'采光剖璞',
-u'才過屈宋',
-u'菜果之物',
-u'才過子建',
-u'裁紅點翠',
-u'彩虹束帶',
-u'彩虹之錘',
-u'才華超衆',
-u'才華出衆',
-u'才華蓋世',
-u'才華橫溢',
-u'才懷隋和',
-u'彩火魔杖',
-u'采集草藥',
-u'采及葑菲',
-u'裁剪曲面',
-u'才兼萬人',
-u'才兼文武',
-u'财竭力盡',
-u'才竭智疲',
-u'才盡詞窮',
-u'裁錦萬裏',
-u'材劇志大',
-u'裁決腰帶',
-u'裁決之槌',
-u'材堪盤錯',
-u'才枯文澀',
-u'才誇八鬥',
-u'财匮力绌',
-u'采蘭贈芍',
-u'采蘭贈藥',
-u'财連如命',
-u'彩鵉逐雞',
-u'才貌出衆',
-u'才貌兼全',
-u'才貌俱全',
-u'才貌兩全',
-u'才貌雙絕',
-u'才貌雙全',
-u'材茂行潔',
-u'猜枚行令',
-u'财迷心竅',
-u'才墨之薮',
-u'才能幹濟',
-u'才能兼備',
-u'才氣過人',
-u'才氣無雙',
-u'才傾八鬥',
-u'才輕德薄',
-u'才情橫溢',
-u'才輕任重',
-u'才清志高',
-u'财取爲用',
-u'材全能钜',
-u'猜拳行令',
-u'裁然不同',
-u'才人行短',
-u'才如史遷',
-u'猜三劃五',
-u'采善貶惡',
-u'财上分明大丈夫',
-u'才識不逮',
-u'才識過人',
-u'材士練兵',
-u'才識有餘',
-u'才疏德薄',
-u'才疏計拙',
-u'才疏識暗',
-u'才疏學淺',
-u'才疏意廣',
-u'才疏志大',
-u'才疏智淺',
-u'菜蔬之色',
-u'才說嘴就打嘴',
-u'才思出衆',
-u'才調無倫',
-u'才調秀出',
-u'裁彎取直',
-u'才望高雅',
-u'才望兼隆',
-u'才爲世出',
-u'才微智淺',
-u'财務主管',
-u'才小任大',
-u'裁心镂舌',
-u'彩心炫光',
-u'采薪之患',
-u'采薪之疾',
-u'采薪之憂',
-u'材雄德茂',
-u'才秀人微',
-u'才朽行穢',
-u'才朽學淺',
-u'才須學也',
-u'才學過人',
-u'才學兼優',
-u'财壓奴婢藝壓當行',
-u'彩翼龍鹫',
-u'彩衣娛親',
-u'才藝卓絕',
-u'财用不足',
-u'才勇兼優',
-u'材優幹濟',
-u'财源廣進',
-u'财源滾滾',
-u'财源亨通',
-u'财源恒足',
-u'裁月镂雲',
-u'财運亨通',
-u'裁雲剪水',
-u'裁雲镂月',
-u'彩雲易散',
-u'才藻富贍',
-u'才占八鬥',
-u'才長識寡',
-u'材智高奇',
-u'才智過人',
-u'采擢薦進',
-u'才子佳人',
-u'殘暴不仁',
-u'殘暴之刃',
-u'殘杯冷炙',
-u'殘編斷簡',
-u'殘編裂簡',
-u'殘編落簡',
-u'殘編墜簡',
-u'殘兵敗将',
-u'殘兵敗卒',
-u'慘不忍睹',
-u'慘不忍聞',
-u'慘不忍言',
-u'參參伍伍',
-u'殘茶剩飯',
-u'殘喘待終',
-u'殘喘苟延',
-u'慘怆怛悼',
-u'蠶叢鳥道',
-u'慘怛之疾',
-u'慘淡經營',
-u'殘燈末廟',
-u'殘冬臘月',
-u'殘廢掃擊',
-u'殘廢詛咒',
-u'餐風露宿',
-u'餐風沐雨',
-u'餐風齧雪',
-u'餐風欽露',
-u'餐風茹雪',
-u'骖風驷霞',
-u'餐風宿草',
-u'餐風宿露',
-u'餐風宿水',
-u'餐風宿雨',
-u'餐風吸露',
-u'餐風咽露',
-u'餐風飲露',
-u'慚凫企鶴',
-u'殘膏賸馥',
-u'殘羹冷飯',
-u'殘羹冷炙',
-u'殘羹剩飯',
-u'殘圭斷璧',
-u'慘礉少恩',
-u'殘花敗柳',
-u'粲花妙論',
-u'粲花妙舌',
-u'粲花之論',
-u'粲花之舌',
-u'慘禍飛災',
-u'蠶績蟹匡',
-u'慘絕人寰',
-u'殘軍敗将',
-u'殘軍廢壘',
-u'殘酷倒鈎',
-u'慚愧無地',
-u'燦爛炳煥',
-u'燦爛輝煌',
-u'骖鸾馭鶴',
-u'慘綠愁紅',
-u'慘綠年華',
-u'慘綠少年',
-u'殘民害理',
-u'殘民害物',
-u'殘民以逞',
-u'殘民以訪',
-u'殘年暮景',
-u'殘年餘力',
-u'殘虐不仁',
-u'餐葩飲露',
-u'殘槃冷炙',
-u'殘篇斷簡',
-u'殘破不堪',
-u'參前倚衡',
-u'殘缺不全',
-u'慘然不樂',
-u'粲然可觀',
-u'燦然一新',
-u'殘忍不仁',
-u'殘忍刻薄',
-u'殘忍利刃',
-u'燦若晨星',
-u'燦若繁星',
-u'殘殺無辜',
-u'殘山賸水',
-u'殘生将盡',
-u'殘屍敗蛻',
-u'蠶食鲸吞',
-u'殘絲斷魂',
-u'蠶絲弓弦',
-u'蠶絲絞絲',
-u'蠶絲牛毛',
-u'餐松啖柏',
-u'餐松食柏',
-u'餐松飲澗',
-u'殘湯剩飯',
-u'參天貳地',
-u'參天兩地',
-u'參透機關',
-u'殘頭落腳',
-u'蠶頭燕尾',
-u'參伍錯縱',
-u'慘無人道',
-u'慘無人理',
-u'慘無天日',
-u'餐霞漱瀣',
-u'餐霞吸露',
-u'餐霞飲景',
-u'餐霞飲瀣',
-u'餐霞飲液',
-u'殘賢害善',
-u'餐腥啄腐',
-u'慘雨愁雲',
-u'慘雨酸風',
-u'殘垣敗壁',
-u'慘月洞穴',
-u'殘月曉風',
-u'餐雲卧石',
-u'殘渣馀孽',
-u'殘章斷稿',
-u'殘章斷簡',
-u'殘璋斷玦',
-u'蒼白無力',
-u'藏寶海灣',
-u'倉倉皇皇',
-u'滄滄涼涼',
-u'蒼蒼烝民',
-u'倉卒之際',
-u'倉卒主人',
-u'蒼翠欲滴',
-u'藏帆暗礁',
-u'藏鋒斂锷',
-u'藏鋒斂銳',
-u'藏鋒斂穎',
-u'倉腐寄頓',
-u'伧夫俗吏',
-u'藏富于民',
-u'藏弓烹狗',
-u'蒼狗白衣',
-u'蒼狗白雲',
-u'藏垢納洿',
-u'藏垢納污',
-u'藏垢遮污',
-u'滄海塵飛',
-u'滄海橫流',
-u'滄海桑田',
-u'滄海揚塵',
-u'滄海一鱗',
-u'滄海一粟',
-u'滄海遺珠',
-u'倉皇不定',
-u'倉皇出逃',
-u'蒼黃反複',
-u'倉皇流離',
-u'倉皇失措',
-u'倉皇退遁',
-u'倉皇無措',
-u'藏奸賣俏',
-u'藏奸耍滑',
-u'藏奸挾詐',
-u'藏奸養逆',
-u'藏嬌金屋',
-u'滄浪老人',
-u'倉廪虛兮歲月乏',
-u'藏龍卧虎',
-u'倉忙失措',
-u'倉忙無措',
-u'蒼茫之石',
-u'藏怒宿怨',
-u'藏器待人',
-u'藏器待時',
-u'藏器俟時',
-u'藏巧守拙',
-u'藏巧于拙',
-u'蒼穹寶珠',
-u'蒼穹手杖',
-u'蒼穹之脊',
-u'蒼髯如戟',
-u'滄桑之變',
-u'蒼生塗炭',
-u'蒼松翠柏',
-u'藏頭護尾',
-u'藏頭亢腦',
-u'藏頭露角',
-u'藏頭露尾',
-u'藏污納垢',
-u'藏污遮垢',
-u'倉箱可期',
-u'藏形匿影',
-u'藏修遊息',
-u'蒼顔白發',
-u'蒼顔皓首',
-u'蒼蠅不叮沒縫的蛋',
-u'蒼蠅不叮無縫蛋',
-u'蒼蠅不叮無縫的蛋',
-u'蒼蠅不鑽沒縫兒的蛋',
-u'蒼蠅附骥',
-u'蒼蠅見血',
-u'蒼蠅碰壁',
-u'藏有露影',
-u'藏賊引盜',
-u'藏之名山',
-u'藏之名山傳之其人',
-u'藏諸名山',
-u'藏諸名山傳之其人',
-u'藏蹤蹑迹',
-u'倉卒從事',
-u'草草不恭',
-u'草草了事',
-u'嘈嘈切切',
-u'草草收兵',
-u'草草完事',
-u'草船借箭',
-u'草創未就',
-u'操刀必割',
-u'操刀不割',
-u'操刀割錦',
-u'操刀能割',
-u'操刀傷錦',
-u'操刀制錦',
-u'草腹菜腸',
-u'操斧伐柯',
-u'操戈入室',
-u'操戈同室',
-u'操觚弄翰',
-u'操觚染翰',
-u'操翰成章',
-u'草菅民命',
-u'草間求活',
-u'草菅人命',
-u'草間偷活',
-u'草芥人命',
-u'槽裏吃食胃裏擦癢',
-u'草廬三顧',
-u'草率将事',
-u'草滿囹圄',
-u'草莽寒門',
-u'草莽流寇',
-u'草莽英雄',
-u'草莽之臣',
-u'操矛入室',
-u'草茅危言',
-u'草茅下士',
-u'草茅之産',
-u'草茅之臣',
-u'草靡風行',
-u'草木黃落',
-u'草木皆兵',
-u'草木俱腐',
-u'草木俱朽',
-u'草木同腐',
-u'草木蕭疏',
-u'草木愚夫',
-u'草木之人',
-u'草木知威',
-u'操奇計赢',
-u'操其奇赢',
-u'操奇逐赢',
-u'操揉磨治',
-u'草蛇灰線',
-u'曹社之謀',
-u'操身行世',
-u'草生一春',
-u'草書體勢',
-u'草書之法',
-u'草率從事',
-u'草率了事',
-u'草率收兵',
-u'草藤纏繞',
-u'草藤根須',
-u'草藤之座',
-u'草薙禽狝',
-u'槽頭買馬看母子',
-u'草頭天子',
-u'操心不見老',
-u'草行露宿',
-u'草偃風從',
-u'草偃風行',
-u'草衣木食',
-u'操赢緻奇',
-u'草澤英雄',
-u'草長莺飛',
-u'操之過蹙',
-u'操之過急',
-u'操之過切',
-u'操縱如意',
-u'操縱自如',
-u'恻怛之心',
-u'策馬飛輿',
-u'策名就列',
-u'策名委質',
-u'側目而視',
-u'側目傾耳',
-u'策驽砺鈍',
-u'廁身其間',
-u'策頑磨鈍',
-u'策無遺算',
-u'策勳飲至',
-u'恻隐之心',
-u'側足而立',
-u'廁足其間',
-u'參差不齊',
-u'參差不一',
-u'參差錯落',
-u'岑樓齊末',
-u'岑牟單絞',
-u'參伍錯綜',
-u'層出不窮',
-u'層出叠見',
-u'層出間見',
-u'層次井然',
-u'曾幾何時',
-u'層見錯出',
-u'層見叠出',
-u'曾經滄海',
-u'層樓疊榭',
-u'層巒叠障',
-u'層巒聳翠',
-u'層山疊嶂',
-u'層台累榭',
-u'曾無與二',
-u'層序分明',
-u'層岩疊嶂',
-u'差不及一步',
-u'茶不思飯不想',
-u'察察而明',
-u'插插花花',
-u'察察爲明',
-u'察察爲智',
-u'插翅難飛',
-u'插翅難逃',
-u'插翅也難飛',
-u'差錯或變故',
-u'茶飯無心',
-u'插漢幹雲',
-u'察己知人',
-u'差肩接迹',
-u'察見淵魚',
-u'察今知古',
-u'差堪自慰',
-u'插科打诨',
-u'差可人意',
-u'插科使砌',
-u'差快人意',
-u'茶來張手飯來張口',
-u'察能論行',
-u'差強人意',
-u'插圈弄套',
-u'差若告慰',
-u'差若毫厘',
-u'差若毫厘謬以千裏',
-u'差若豪氂缪以千裏',
-u'差若天淵',
-u'差三錯四',
-u'察三訪四',
-u'差适人意',
-u'差慰人意',
-u'查無實據',
-u'察言觀色',
-u'察言觀行',
-u'差以毫厘',
-u'差以豪厘謬以千裏',
-u'差以毫厘失之千裏',
-u'差以千裏',
-u'搽油抹粉',
-u'茶餘飯飽',
-u'茶餘飯後',
-u'茶餘酒後',
-u'插針之地',
-u'差之毫厘',
-u'差之毫厘謬以千裏',
-u'差之毫厘失之千裏',
-u'差之毫氂失之千裏',
-u'搽脂抹粉',
-u'差之千裏',
-u'插燭闆床',
-u'奼紫嫣紅',
-u'拆白道字',
-u'柴車幅巾',
-u'拆東補西',
-u'拆東牆補西牆',
-u'钗橫鬓亂',
-u'豺虎肆虐',
-u'豺狐之心',
-u'柴毀骨立',
-u'柴毀滅性',
-u'钗荊裙布',
-u'豺狼成性',
-u'豺狼當道',
-u'豺狼當路',
-u'豺狼當塗',
-u'豺狼當轍',
-u'豺狼橫道',
-u'豺狼虎豹',
-u'豺狼其性',
-u'豺狼塞道',
-u'豺狼塞路',
-u'豺狼野心',
-u'豺狼之吻',
-u'拆了東牆補西牆',
-u'柴立不阿',
-u'柴米夫妻',
-u'柴米油鹽',
-u'拆牌道字',
-u'豺群噬虎',
-u'柴天改物',
-u'柴天改玉',
-u'拆西補東',
-u'蟬不知雪',
-u'刬草除根',
-u'蟾蜍爆炸',
-u'蟬喘雷幹',
-u'谄詞令色',
-u'刬惡鋤奸',
-u'蟬腹龜腸',
-u'蟾宮折桂',
-u'攙行奪市',
-u'忏悔攻擊',
-u'忏悔光環',
-u'鏟迹銷聲',
-u'纏夾不清',
-u'刬舊謀新',
-u'蟬娟此豸',
-u'攙科打诨',
-u'讒口嗷嗷',
-u'讒口流涎',
-u'讒口铄金',
-u'蟬聯不絕',
-u'蟬聯冠軍',
-u'讒獠生涎',
-u'纏綿床第',
-u'纏綿床褥',
-u'纏綿悱恻',
-u'纏綿凄恻',
-u'纏綿凄怆',
-u'纏綿幽怨',
-u'纏綿蘊藉',
-u'纏綿枕席',
-u'攙前落後',
-u'冁然而咍',
-u'冁然而笑',
-u'冁然一笑',
-u'纏繞之藤',
-u'蟬衫麟帶',
-u'谄上傲下',
-u'谄上驕下',
-u'谄上欺下',
-u'谄上抑下',
-u'産生式語言知識',
-u'禅世雕龍',
-u'讒慝之口',
-u'蟬脫濁穢',
-u'讒涎欲垂',
-u'饞涎欲滴',
-u'谄笑脅肩',
-u'禅絮沾泥',
-u'讒言佞語',
-u'讒言三及',
-u'闡揚光大',
-u'蟬翼爲重',
-u'蟬翼爲重千鈞爲輕',
-u'闡幽抉微',
-u'闡幽明微',
-u'闡幽顯微',
-u'谄谀取容',
-u'長安登科',
-u'長安居大不易',
-u'長安棋局',
-u'長安紙貴',
-u'常備不懈',
-u'長兵精通',
-u'長柄武器',
-u'長才大略',
-u'長材短用',
-u'長才短馭',
-u'長才廣度',
-u'長材茂學',
-u'長材小試',
-u'怅怅不樂',
-u'長呈短歎',
-u'長城萬裏',
-u'唱籌量沙',
-u'昌歜羊棗',
-u'長春不老',
-u'長啜大嚼',
-u'長此以往',
-u'嘗膽眠薪',
-u'嘗膽卧薪',
-u'長刀鬼将',
-u'償得夙願',
-u'嘗鼎一脔',
-u'唱對台戲',
-u'長惡不悛',
-u'長惡靡悛',
-u'倡而不和',
-u'長發其祥',
-u'腸肥滿腦',
-u'腸肥腦滿',
-u'長風破浪',
-u'唱高和寡',
-u'長歌代哭',
-u'長歌當哭',
-u'長歌當泣',
-u'唱紅白臉',
-u'苌弘碧血',
-u'苌弘化碧',
-u'長話短說',
-u'常懷千歲憂',
-u'惝恍迷離',
-u'腸回氣蕩',
-u'長戟高門',
-u'長計遠慮',
-u'長駕遠馭',
-u'長江後浪推前浪',
-u'長江七号',
-u'長江天塹',
-u'長江天險',
-u'常将有日思無日',
-u'唱叫揚疾',
-u'長街短巷',
-u'長頸鳥喙',
-u'長久之計',
-u'猖獗一時',
-u'長樂未央',
-u'長樂永康',
-u'常鱗凡介',
-u'長林豐草',
-u'長慮顧後',
-u'長慮後顧',
-u'長慮卻顧',
-u'常罵不驚常打不怕',
-u'長蠻喽羅',
-u'長蠻探子',
-u'長蠻先鋒',
-u'唱米作沙',
-u'長眠不起',
-u'長命百歲',
-u'長明燈籠',
-u'長鳴都尉',
-u'長命富貴',
-u'長目飛耳',
-u'長年累月',
-u'長念卻慮',
-u'長辔遠馭',
-u'長篇大論',
-u'長篇大套',
-u'長篇累牍',
-u'償其大欲',
-u'長橋碼頭',
-u'倡情冶思',
-u'長驅而入',
-u'長驅徑入',
-u'長驅深入',
-u'長驅直進',
-u'長驅直入',
-u'長驅直突',
-u'怅然若失',
-u'怅然自失',
-u'長嫂就是母',
-u'唱沙作米',
-u'長蛇封豕',
-u'長蛇焰火',
-u'長舌之婦',
-u'長身暴起',
-u'長身鶴立',
-u'長生不老',
-u'長生不滅',
-u'長生不死',
-u'長繩系日',
-u'常勝将軍',
-u'長生久視',
-u'長繩系景',
-u'長首彩鹫',
-u'長壽神像',
-u'常說口裏順常做手不笨',
-u'長算遠略',
-u'暢所欲爲',
-u'暢所欲言',
-u'長他人志氣滅自己威風',
-u'長歎不如慢磨',
-u'長談闊論',
-u'長天大日',
-u'長添燈草滿添油',
-u'長天老日',
-u'常調官好做家常飯好吃',
-u'倡條冶葉',
-u'長亭短亭',
-u'昌亭旅食',
-u'昌亭之客',
-u'暢通無阻',
-u'長途跋涉',
-u'長往遠引',
-u'暢行無礙',
-u'暢行無阻',
-u'敞胸露懷',
-u'長袖善舞',
-u'長籲短氣',
-u'長籲短歎',
-u'長須火槍',
-u'暢叙幽情',
-u'昌言無忌',
-u'徜徉恣肆',
-u'長夜漫漫',
-u'長夜難明',
-u'長夜之飲',
-u'長揖不拜',
-u'常在河邊站哪有不濕鞋',
-u'長齋禮佛',
-u'長齋佞佛',
-u'長齋繡佛',
-u'長爪猛鹫',
-u'長枕大被',
-u'長枕大衾',
-u'長治久安',
-u'長足進展',
-u'怊怅若失',
-u'怊怊惕惕',
-u'超超玄著',
-u'超塵拔俗',
-u'超塵出俗',
-u'超馳控制',
-u'超出三界外不在五行中',
-u'炒豆衆人吃炸鍋一人事',
-u'超度亡靈',
-u'超度衆生',
-u'超凡出世',
-u'超凡入妙',
-u'超凡入聖',
-u'超凡越聖',
-u'超凡之妙',
-u'巢焚原燎',
-u'嘲風弄月',
-u'嘲風詠月',
-u'超古超今',
-u'朝懽暮樂',
-u'吵蛤蟆坑',
-u'巢毀卵破',
-u'超階越次',
-u'超今冠古',
-u'超今絕古',
-u'超今越古',
-u'抄舊文章',
-u'巢居穴處',
-u'超絕塵寰',
-u'朝客高流',
-u'超類絕倫',
-u'朝裏無人莫做官',
-u'朝裏有人好做官',
-u'巢林一枝',
-u'超倫轶群',
-u'超邁絕倫',
-u'潮鳴電掣',
-u'潮鳴電摯',
-u'朝名市利',
-u'嘲弄風月',
-u'超前絕後',
-u'朝遷市變',
-u'巢傾卵覆',
-u'巢傾卵破',
-u'超群拔類',
-u'超群出倫',
-u'超群出衆',
-u'超群絕倫',
-u'超群轶類',
-u'超群越輩',
-u'超然避世',
-u'超然不群',
-u'超然獨處',
-u'超然獨立',
-u'超然絕俗',
-u'超然邁倫',
-u'超然物外',
-u'超然象外',
-u'超然玄著',
-u'超然遠舉',
-u'超然遠引',
-u'超然自得',
-u'超然自逸',
-u'超然自引',
-u'超人意表',
-u'朝深暮死',
-u'超神入化',
-u'朝生三千暮死八百',
-u'超世拔塵',
-u'超世拔俗',
-u'超世絕倫',
-u'超世絕俗',
-u'超世之才',
-u'超世之功',
-u'超世之傑',
-u'超俗絕世',
-u'朝天一柱香',
-u'朝廷不可一日無君',
-u'朝陽丹鳳',
-u'朝野側目',
-u'朝野上下',
-u'朝衣朝冠',
-u'超轶絕塵',
-u'超以象外',
-u'朝章國典',
-u'朝章國故',
-u'朝中有人好做官',
-u'朝宗法王',
-u'扯扯連連',
-u'扯扯拽拽',
-u'車塵馬迹',
-u'車塵馬足',
-u'車馳馬驟',
-u'扯大旗作虎皮',
-u'車怠馬煩',
-u'車到山前必有路',
-u'徹底澄清',
-u'車煩馬斃',
-u'扯弓搭箭',
-u'車攻馬同',
-u'扯鼓奪旗',
-u'車過腹痛',
-u'扯謊撩白',
-u'車擊舟連',
-u'掣襟露肘',
-u'掣襟肘見',
-u'扯空砑光',
-u'徹裏徹外',
-u'車笠之交',
-u'車笠之盟',
-u'徹裏至外',
-u'車馬輻辏',
-u'車馬骈阗',
-u'車馬軿馳',
-u'車馬如龍',
-u'車馬填門',
-u'車馬盈門',
-u'徹内徹外',
-u'扯牛尾巴',
-u'扯蓬拉纖',
-u'扯皮弄筋',
-u'扯破臉皮',
-u'扯旗放炮',
-u'扯纖拉煙',
-u'車如流水馬如龍',
-u'徹桑未雨',
-u'徹上徹下',
-u'車神勳章',
-u'扯是搬非',
-u'扯手扯腳',
-u'徹首徹尾',
-u'車水馬龍',
-u'扯順風旗',
-u'車填馬隘',
-u'徹頭徹尾',
-u'車無退表',
-u'車轄鐵盡',
-u'扯閑盤兒',
-u'車薪杯水',
-u'徹心徹骨',
-u'車胤盛螢',
-u'車載船裝',
-u'車載鬥量',
-u'車在馬前',
-u'車轍馬迹',
-u'扯著脖子',
-u'沉博絕麗',
-u'趁波逐浪',
-u'陳蔡之厄',
-u'晨參暮禮',
-u'晨參暮省',
-u'陳倉暗度',
-u'陳陳相因',
-u'晨炊星飯',
-u'陳詞濫調',
-u'陳鼎擊鍾',
-u'陳蕃下榻',
-u'沉烽靜柝',
-u'晨風零雨',
-u'趁風使船',
-u'趁風使柁',
-u'陳腐不堪',
-u'沉浮俯仰',
-u'塵羹土飯',
-u'塵垢秕糠',
-u'陳古刺今',
-u'陳谷子爛芝麻',
-u'沉痼自若',
-u'晨光熹微',
-u'陳規陋習',
-u'趁哄打劫',
-u'沉厚寡言',
-u'晨昏定省',
-u'趁火打劫',
-u'趁火搶劫',
-u'沉幾觀變',
-u'稱家有無',
-u'沉漸剛克',
-u'沉浸醲郁',
-u'沉靜寡言',
-u'沉靜少言',
-u'晨兢夕厲',
-u'沉疴頓愈',
-u'沉疴難起',
-u'沉疴宿疾',
-u'趁浪逐波',
-u'塵勞碌碌',
-u'陳雷膠漆',
-u'沉李浮瓜',
-u'陳力就列',
-u'沉淪之羽',
-u'臣門如市',
-u'沉迷不悟',
-u'沉密寡言',
-u'沉湎酒色',
-u'沉湎淫逸',
-u'沉默寡言',
-u'沉謀重慮',
-u'沉謀研慮',
-u'瞋目扼腕',
-u'嗔目切齒',
-u'瞋目張膽',
-u'塵泥沼澤',
-u'陳平分肉',
-u'沉潛剛克',
-u'晨乾夕惕',
-u'晨秦暮楚',
-u'嗔拳不打笑面',
-u'嗔拳不打笑面人',
-u'趁熱打鐵',
-u'趁熱竈火',
-u'趁人之危',
-u'陳善閉邪',
-u'沉聲靜氣',
-u'陳師鞠旅',
-u'趁勢落蓬',
-u'塵世褶裙',
-u'趁水和泥',
-u'沉水龍雀',
-u'沉思默慮',
-u'沉思默想',
-u'沉思熟慮',
-u'稱體裁衣',
-u'晨提夕命',
-u'塵頭大起',
-u'塵霧之雲',
-u'沉小霞相會出師表',
-u'沉心靜氣',
-u'稱心快意',
-u'稱心滿意',
-u'臣心如水',
-u'趁心如意',
-u'趁心像意',
-u'晨興夜寐',
-u'晨星之塔',
-u'沉雄悲壯',
-u'沉雄古逸',
-u'趁虛而入',
-u'塵削煙滅',
-u'陳言膚詞',
-u'陳言腐語',
-u'陳言老套',
-u'陳言務去',
-u'沉毅寡言',
-u'臣一主二',
-u'沉吟不決',
-u'沉吟不語',
-u'沉吟未決',
-u'沉吟章句',
-u'沉魚出聽',
-u'沉郁頓挫',
-u'沉魚落雁',
-u'塵羽峽谷',
-u'塵羽腰帶',
-u'塵魚甑釜',
-u'沉冤莫白',
-u'沉冤莫雪',
-u'沉竈産蛙',
-u'沉竈生蛙',
-u'沉渣泛起',
-u'沉重寡言',
-u'晨鍾暮鼓',
-u'晨鍾暮磬',
-u'沉重少言',
-u'沉舟破釜',
-u'沉滓泛起',
-u'陳遵投轄',
-u'撐岸就船',
-u'成敗得失',
-u'成敗利鈍',
-u'成敗論人',
-u'成敗榮枯',
-u'成敗未決',
-u'成敗蕭何',
-u'成敗興廢',
-u'成敗在此一舉',
-u'成幫結隊',
-u'城北徐公',
-u'乘奔禦風',
-u'乘奔逐北',
-u'稱不絕口',
-u'秤不離錘',
-u'秤不離砣',
-u'稱不容舌',
-u'稱柴而爨',
-u'撐腸拄肚',
-u'撐腸拄腹',
-u'乘車戴笠',
-u'稱臣納貢',
-u'成城斷金',
-u'撐持門戶',
-u'撐船就岸',
-u'秤錘落井',
-u'成大事者不惜小費',
-u'稱貸無門',
-u'撐的撐死餓的餓死',
-u'成德達材',
-u'稱德度功',
-u'乘敵不虞',
-u'乘敵之隙',
-u'成都蔔肆',
-u'成都賣蔔',
-u'懲惡勸善',
-u'承訛襲舛',
-u'承訛踵謬',
-u'承恩邀寵',
-u'懲罰光環',
-u'乘肥衣輕',
-u'懲忿窒欲',
-u'乘風而歸',
-u'乘風鼓浪',
-u'成風盡垩',
-u'乘風破浪',
-u'承風希旨',
-u'乘風興浪',
-u'成風之斫',
-u'乘風轉舵',
-u'乘風縱火',
-u'成佛有餘',
-u'成佛作祖',
-u'乘桴浮海',
-u'城府深沉',
-u'城府深密',
-u'秤杆離不開秤铊',
-u'乘高居險',
-u'乘高決水',
-u'乘高臨下',
-u'懲羹吹齑',
-u'成功不居',
-u'稱功頌德',
-u'逞工衒巧',
-u'稱孤道寡',
-u'逞怪披奇',
-u'乘鶴駕雲',
-u'成何世界',
-u'成何事體',
-u'成何體面',
-u'成何體統',
-u'瞠乎後矣',
-u'瞠乎其後',
-u'城狐社鼠',
-u'騁懷遊目',
-u'誠歡誠喜',
-u'承歡膝下',
-u'承歡獻媚',
-u'誠惶誠懼',
-u'誠惶誠恐',
-u'橙黃桔綠',
-u'乘火打劫',
-u'成己成物',
-u'乘機打劫',
-u'乘機抵巇',
-u'懲擊惡魔',
-u'乘機而入',
-u'懲擊法術',
-u'懲擊節杖',
-u'成績平平',
-u'逞己失衆',
-u'乘機應變',
-u'成家立計',
-u'成家立業',
-u'乘堅策肥',
-u'乘間抵隙',
-u'乘間而入',
-u'乘間擊瑕',
-u'乘間竊發',
-u'乘間取利',
-u'乘堅驅良',
-u'乘間伺隙',
-u'成見太深',
-u'乘間投隙',
-u'澄江如練',
-u'逞嬌呈美',
-u'逞嬌鬥媚',
-u'懲戒長戟',
-u'懲戒烈焰',
-u'懲戒猛擊',
-u'懲戒痛擊',
-u'懲戒之盾',
-u'懲戒指環',
-u'懲戒之弩',
-u'澄襟似水朗抱凝冰',
-u'秤斤注兩',
-u'成精作怪',
-u'乘酒假氣',
-u'誠恐誠惶',
-u'乘利席勝',
-u'稱量而出',
-u'乘流得坎',
-u'乘龍貴婿',
-u'乘龍佳客',
-u'乘龍佳婿',
-u'乘龍快婿',
-u'乘龍配鳳',
-u'乘龍新吉',
-u'乘龍之客',
-u'乘亂不祥',
-u'乘鸾跨鳳',
-u'乘亂坐大',
-u'撐眉努目',
-u'撐眉努眼',
-u'稱美頌德',
-u'撐門抵戶',
-u'程門立雪',
-u'城門失火',
-u'城門失火殃及池魚',
-u'城門魚殃',
-u'成名成家',
-u'承命惟謹',
-u'瞠目而視',
-u'瞠目結舌',
-u'瞠目伸舌',
-u'成年古代',
-u'成年累月',
-u'秤平鬥滿',
-u'承平盛世',
-u'騁耆奔欲',
-u'乘其不備',
-u'乘其不意',
-u'稱奇道絕',
-u'逞奇眩異',
-u'懲前毖後',
-u'成千成萬',
-u'成千累萬',
-u'成千論萬',
-u'承前啓後',
-u'成千上萬',
-u'成千逾萬',
-u'逞強稱能',
-u'逞強好勝',
-u'乘輕驅肥',
-u'澄清天下',
-u'成群打夥',
-u'成群集黨',
-u'成群結黨',
-u'成群結隊',
-u'成群結夥',
-u'成群逐隊',
-u'成群作隊',
-u'乘熱打鐵',
-u'成人不自在',
-u'成人不自在自在不成人',
-u'成仁取義',
-u'乘人之厄',
-u'乘人之急',
-u'成人之美',
-u'成人之善',
-u'乘人之危',
-u'成日成夜',
-u'承嬗離合',
-u'稱賞不已',
-u'承上接下',
-u'承上起下',
-u'撐上水船',
-u'澄神離形',
-u'乘勝逐北',
-u'乘勝追擊',
-u'騁嗜奔欲',
-u'成事不足',
-u'成事不足敗事有馀',
-u'乘時乘勢',
-u'成事莫說',
-u'成始善終',
-u'乘勢使氣',
-u'成事在人',
-u'成事在天',
-u'成雙成對',
-u'成雙捉對',
-u'成雙作對',
-u'盛水不漏',
-u'乘順水船',
-u'撐死膽大的餓死膽小的',
-u'澄思寂慮',
-u'澄思靜慮',
-u'澄思渺慮',
-u'成算在心',
-u'成算在胸',
-u'秤铊雖小壓千斤',
-u'成天平地',
-u'承天之祜',
-u'承天之佑',
-u'撐天拄地',
-u'撐霆裂月',
-u'成童之年',
-u'撐頭獲腦',
-u'成團打塊',
-u'秤砣雖小壓千金',
-u'成王敗寇',
-u'成王敗賊',
-u'稱王稱霸',
-u'乘危下石',
-u'乘僞行詐',
-u'稱物平施',
-u'乘隙搗虛',
-u'乘隙而入',
-u'乘隙而逃',
-u'成蹊桃李',
-u'承膝下歡',
-u'乘瑕蹈隙',
-u'乘瑕抵隙',
-u'撐下水船',
-u'城下之盟',
-u'城下之辱',
-u'乘險抵巇',
-u'稱賢薦能',
-u'承先啓後',
-u'成效卓著',
-u'誠心誠意',
-u'澄心滌慮',
-u'秤薪而爨',
-u'誠心敬意',
-u'稱薪量水',
-u'澄心清意',
-u'逞心如意',
-u'誠心實意',
-u'誠心正意',
-u'乘興而來',
-u'乘興而來敗興而返',
-u'乘興而來敗興而歸',
-u'乘興而來敗興而去',
-u'承星履草',
-u'逞性妄爲',
-u'稱兄道弟',
-u'逞兇肆虐',
-u'乘兇完配',
-u'乘虛蹈隙',
-u'乘虛叠出',
-u'乘虛而入',
-u'乘虛可驚',
-u'乘軒食祿',
-u'逞妍鬥色',
-u'逞妍鬥豔',
-u'承顔候色',
-u'承顔接辭',
-u'承顔順旨',
-u'成妖作怪',
-u'成也蕭何',
-u'成也蕭何敗蕭何',
-u'成也蕭何敗也蕭何',
-u'成一家言',
-u'懲一戒百',
-u'懲一警百',
-u'懲一警衆',
-u'乘疑可間',
-u'逞異誇能',
-u'成陰結子',
-u'撐硬船兒',
-u'成由勤儉敗由奢',
-u'秤有頭高頭低',
-u'乘輿播越',
-u'稱雨道晴',
-u'澄源節流',
-u'澄源正本',
-u'乘雲行泥',
-u'成則王侯敗則寇',
-u'成則王侯敗則賊',
-u'成則爲王',
-u'成則爲王敗則爲寇',
-u'成則爲王敗則爲虜',
-u'成則爲王敗則爲賊',
-u'成者王侯敗者寇',
-u'成者王侯敗者賊',
-u'誠至金開',
-u'城中桃李',
-u'成竹在胸',
-u'持螯把酒',
-u'持螯封菊',
-u'持螯下酒',
-u'尺八尺爲步',
-u'齒白唇紅',
-u'尺闆鬥食',
-u'赤壁鏖兵',
-u'尺壁寸陰',
-u'尺璧非寶',
-u'齒弊舌存',
-u'尺表度天',
-u'吃別人嚼過的馍不香',
-u'尺兵寸鐵',
-u'尺波電謝',
-u'赤膊上陣',
-u'尺布鬥粟',
-u'吃不了兜着走',
-u'尺步繩趨',
-u'馳騁疆場',
-u'赤誠相待',
-u'侈侈不休',
-u'遲遲吾行',
-u'蚩蚩者民',
-u'持籌握算',
-u'踟蹰不前',
-u'尺椽片瓦',
-u'吃穿用度',
-u'吃醋拈酸',
-u'吃醋争風',
-u'尺寸可取',
-u'尺寸千裏',
-u'尺寸驅動',
-u'尺寸之兵',
-u'尺寸之地',
-u'尺寸之功',
-u'尺寸之效',
-u'吃錯了耗子藥',
-u'吃大鍋飯',
-u'匙大碗小',
-u'癡呆懵懂',
-u'癡呆詛咒',
-u'赤膽忠肝',
-u'赤膽忠心',
-u'持刀動杖',
-u'持刀弄棒',
-u'齒德兼隆',
-u'齒德兼尊',
-u'齒德俱增',
-u'齒德俱尊',
-u'吃的鹽比你吃的飯多',
-u'吃得筵席打得柴',
-u'吃地面兒',
-u'赤地千裏',
-u'尺度空間',
-u'尺短寸長',
-u'遲鈍毒藥',
-u'遲鈍誘餌',
-u'侈恩席寵',
-u'癡兒騃女',
-u'癡兒呆女',
-u'癡兒驕女',
-u'癡兒說夢',
-u'尺二秀才',
-u'尺二冤家',
-u'持法森嚴',
-u'持法有恒',
-u'吃飯別忘了種谷人',
-u'吃飯穿衣量家當',
-u'吃飯防噎走路防跌',
-u'吃飯先喝湯不用請藥方',
-u'吃飯想撐死幹活怕累死',
-u'癡肥臃腫',
-u'馳風掣電',
-u'馳風騁雨',
-u'叱風戰錘',
-u'尺幅寸缣',
-u'尺幅千裏',
-u'尺幅萬裏',
-u'齒甘乘肥',
-u'馳高鹜遠',
-u'持戈試馬',
-u'尺功寸效',
-u'赤恭之石',
-u'齒過肩随',
-u'吃果子拜樹頭',
-u'癡漢不會饒人',
-u'摛翰振藻',
-u'吃好鬥相報',
-u'吃喝玩樂',
-u'持衡擁璇',
-u'赤紅王座',
-u'赤紅之霧',
-u'斥候徽章',
-u'斥候之箭',
-u'斥候之刃',
-u'遲徊不決',
-u'遲徊觀望',
-u'遲回觀望',
-u'馳魂宕魄',
-u'馳魂奪魄',
-u'尺蠖求伸',
-u'齒豁頭童',
-u'尺蠖之屈',
-u'持己端方',
-u'尺籍伍符',
-u'赤脊峽谷',
-u'齒頰挂人',
-u'齒頰回甘',
-u'齒頰生香',
-u'齒劍如歸',
-u'赤腳伴驢蹄',
-u'赤腳蓬頭',
-u'叱嗟風雲',
-u'持戒見性',
-u'赤金項鏈',
-u'赤金腰佩',
-u'吃驚受怕',
-u'池酒林胾',
-u'持久之計',
-u'絺句繪章',
-u'恥居人下',
-u'恥居王後',
-u'赤口白舌',
-u'赤口毒舌',
-u'赤口上天白舌入地',
-u'吃苦耐勞',
-u'吃苦在先',
-u'吃寬心丸',
-u'吃了迷混藥',
-u'吃了槍藥了',
-u'吃了上頓兒沒下頓兒',
-u'吃力不讨好',
-u'持蠡測海',
-u'侈麗闳衍',
-u'吃裏扒外',
-u'赤練王蛇',
-u'吃糧不管事',
-u'持梁齒肥',
-u'持梁刺肥',
-u'熾烈拳套',
-u'尺六尺四寸爲步',
-u'赤龍法杖',
-u'赤龍腰佩',
-u'持祿保位',
-u'持祿固寵',
-u'持祿取容',
-u'持祿養交',
-u'持祿養身',
-u'持論公允',
-u'齒落發白',
-u'齒落發斑',
-u'齒落舌鈍',
-u'馳馬試劍',
-u'馳馬思墜',
-u'持滿保泰',
-u'持滿戒盈',
-u'遲眉鈍眼',
-u'魑魅魍魉',
-u'吃米不知米價',
-u'吃迷魂藥',
-u'馳名當世',
-u'馳名世界',
-u'馳名天下',
-u'馳名于世',
-u'馳名中外',
-u'鸱目虎吻',
-u'遲暮之年',
-u'癡男騃女',
-u'癡男怨女',
-u'赤貧如洗',
-u'持平之論',
-u'池淺王八多',
-u'持槍鹄立',
-u'持槍實彈',
-u'癡情女子負心漢',
-u'癡情女子絕情漢',
-u'癡情總被薄情負',
-u'持權合變',
-u'癡然如醉',
-u'熾熱火焰',
-u'熾熱疾速',
-u'熾熱魔符',
-u'熾熱頭盔',
-u'熾熱之地',
-u'熾熱之核',
-u'持人長短',
-u'癡人癡福',
-u'吃人的嘴軟',
-u'吃人飯拉狗屎',
-u'侈人觀聽',
-u'吃人家飯受人家管',
-u'吃人家碗半被人家使喚',
-u'癡人說夢',
-u'癡人畏婦',
-u'癡人呓語',
-u'遲日曠久',
-u'赤日之石',
-u'吃肉不如喝湯',
-u'齒如編貝',
-u'齒如含貝',
-u'齒如瓠犀',
-u'齒如齊貝',
-u'恥辱印記',
-u'吃軟不吃硬',
-u'齒若編貝',
-u'齒若含貝',
-u'赤色飛龍',
-u'赤色聖戰',
-u'尺山寸水',
-u'齒少氣銳',
-u'齒少心銳',
-u'赤舌燒城',
-u'赤身露體',
-u'赤身裸體',
-u'赤繩罣足',
-u'赤繩系足',
-u'赤繩绾足',
-u'馳聲走譽',
-u'敕始毖終',
-u'叱石成羊',
-u'鸱視虎顧',
-u'鸱視狼顧',
-u'吃虱子留大腿兒',
-u'赤手空拳',
-u'赤手起家',
-u'尺樹寸泓',
-u'癡鼠拖姜',
-u'吃水不忘打井人',
-u'吃水莫忘打井人',
-u'吃水忘源',
-u'尺水丈波',
-u'吃順不吃戗',
-u'池塘積水須防旱',
-u'赤體上陣',
-u'吃天鵝肉',
-u'尺土之封',
-u'持橐簪筆',
-u'齒亡舌存',
-u'尺枉尋直',
-u'齒危發秃',
-u'齒危發秀',
-u'持危扶顛',
-u'摛文掞藻',
-u'馳檄可定',
-u'赤縣神州',
-u'鸱鸮弄舌',
-u'赤心報國',
-u'赤心奉國',
-u'癡心婦人負心漢',
-u'赤心耿耿',
-u'癡心女人負心漢',
-u'癡心女子負心漢',
-u'癡心妄想',
-u'赤心相待',
-u'赤心忠膽',
-u'持續護盾',
-u'吃啞巴虧',
-u'齒牙春色',
-u'鸱鴉嗜鼠',
-u'齒牙爲猾',
-u'齒牙爲禍',
-u'齒牙馀惠',
-u'齒牙馀論',
-u'齒牙之猾',
-u'恥言人過',
-u'熾炎戰斧',
-u'赤眼之石',
-u'池養化龍魚',
-u'遲疑不定',
-u'遲疑不斷',
-u'遲疑不決',
-u'吃一分虧受無量福',
-u'遲疑顧望',
-u'遲疑觀望',
-u'吃一看十',
-u'侈衣美食',
-u'吃一塹長一智',
-u'遲疑未決',
-u'吃衣著飯',
-u'遲疑坐困',
-u'尺蚓穿堤',
-u'尺蚓穿堤能漂一邑',
-u'持盈保泰',
-u'吃硬不吃軟',
-u'持盈守成',
-u'持盈守虛',
-u'尺有所短',
-u'尺有所短寸有所長',
-u'尺瑜寸瑕',
-u'恥與哙伍',
-u'池魚林木',
-u'池魚籠鳥',
-u'池魚幕燕',
-u'池魚堂燕',
-u'池魚遭殃',
-u'池魚之禍',
-u'池魚之慮',
-u'赤玉之石',
-u'池魚之殃',
-u'馳譽中外',
-u'吃冤枉飯',
-u'摛藻雕章',
-u'尺澤之鲵',
-u'叱咤風雲',
-u'叱咤腕甲',
-u'叱咤下铠',
-u'叱咤喑嗚',
-u'叱咤戰铠',
-u'持齋把素',
-u'吃齋能得道牛馬上西天',
-u'持齋繡佛',
-u'摛章繪句',
-u'鸱張門戶',
-u'鸱張鼠伏',
-u'笞杖徒流',
-u'鸱張蟻聚',
-u'鸱張魚爛',
-u'吃着碗裏的望着鍋裏的',
-u'吃着碗裏看着鍋裏',
-u'吃着碗裏瞧着鍋裏',
-u'持正不阿',
-u'持正不撓',
-u'嗤之以鼻',
-u'持之以恒',
-u'持之以久',
-u'馳志伊吾',
-u'持之有故',
-u'持重待機',
-u'池中之物',
-u'吃著不盡',
-u'尺竹伍符',
-u'吃着不盡',
-u'赤子蒼頭',
-u'吃自來食',
-u'吃子孫飯',
-u'赤子之心',
-u'侈縱偷苟',
-u'吃罪不輕',
-u'崇本棄末',
-u'崇本抑末',
-u'蟲臂鼠汴',
-u'蟲臂鼠肝',
-u'重操舊業',
-u'重抄舊業',
-u'蟲蟲蟻蟻',
-u'重床叠架',
-u'重床叠屋',
-u'蟲刺塑像',
-u'重蹈覆轍',
-u'崇德報功',
-u'重疊寄存器窗口',
-u'充棟汗牛',
-u'充棟盈車',
-u'充棟折軸',
-u'重睹天日',
-u'充耳不聞',
-u'重返家園',
-u'重逢舊雨',
-u'沖風冒雨',
-u'沖風破浪',
-u'沖冠發怒',
-u'沖冠怒發',
-u'沖冠一怒爲紅顔',
-u'沖冠眦裂',
-u'重光累洽',
-u'重規沓矩',
-u'重規叠矩',
-u'重圭疊組',
-u'重規累矩',
-u'重規襲矩',
-u'沖昏頭腦',
-u'重迹屏氣',
-u'充饑畫餅',
-u'重見疊出',
-u'沖堅毀銳',
-u'重建家園',
-u'重見天日',
-u'沖堅陷陣',
-u'重金兼紫',
-u'重金襲湯',
-u'蟲殼強弩',
-u'蟲孔尋徑',
-u'沖口而出',
-u'沖口而發',
-u'充類至盡',
-u'重理舊業',
-u'寵柳嬌花',
-u'重樓疊閣',
-u'重樓飛閣',
-u'重樓複閣',
-u'重巒叠巘',
-u'重巒叠嶂',
-u'重巒複嶂',
-u'崇論谹議',
-u'充闾之慶',
-u'充滿生機',
-u'重明繼焰',
-u'蟲鳴水沸',
-u'重葩累藻',
-u'充沛之力',
-u'重纰貤缪',
-u'重起爐竈',
-u'舂容大雅',
-u'寵辱不驚',
-u'寵辱何驚',
-u'寵辱皆驚',
-u'寵辱皆忘',
-u'寵辱若驚',
-u'寵辱無驚',
-u'重三叠四',
-u'蟲沙微類',
-u'蟲沙猿鶴',
-u'重山複嶺',
-u'重山複水',
-u'重山峻嶺',
-u'重生父母',
-u'重生圖騰',
-u'重生爺娘',
-u'蟲蝕尋徑',
-u'重手累足',
-u'蟲霜水旱',
-u'重彈老調',
-u'充天塞地',
-u'重溫舊夢',
-u'重溫舊業',
-u'重熙累績',
-u'重熙累盛',
-u'重熙累葉',
-u'充箱盈架',
-u'重新做人',
-u'重興旗鼓',
-u'崇雅黜浮',
-u'重岩叠障',
-u'崇洋媚外',
-u'崇洋迷外',
-u'重裀列鼎',
-u'崇墉百雉',
-u'重郵程序',
-u'蟲魚之學',
-u'重垣叠鎖',
-u'沖雲破霧',
-u'重張旗鼓',
-u'重振旗鼓',
-u'重整旗鼓',
-u'重整槍旗',
-u'沖州過府',
-u'沖州撞府',
-u'蟲篆之技',
-u'沖撞痛擊',
-u'重足屏氣',
-u'重足而立',
-u'重足而立側目而視',
-u'重足累息',
-u'重足一迹',
-u'抽拔幽陋',
-u'臭不可當',
-u'臭不可聞',
-u'愁腸百結',
-u'愁腸寸斷',
-u'愁腸九回',
-u'愁腸九轉',
-u'愁腸殢酒',
-u'愁城難解',
-u'愁城兀坐',
-u'抽抽嗒嗒',
-u'抽抽噎噎',
-u'躊躇不決',
-u'躊躇不前',
-u'躊躇滿志',
-u'躊躇未定',
-u'躊躇未決',
-u'抽刀斷水',
-u'抽刀斷絲',
-u'稠叠連綿',
-u'抽釘拔楔',
-u'愁多夜長',
-u'醜惡嘴臉',
-u'臭腐神奇',
-u'酬功報德',
-u'酬功給效',
-u'愁海無涯',
-u'愁紅慘綠',
-u'愁紅怨綠',
-u'醜話說在前面',
-u'抽黃對白',
-u'抽簡祿馬',
-u'抽筋拔骨',
-u'抽筋剝皮',
-u'醜類惡物',
-u'抽梁換柱',
-u'醜劣不堪',
-u'醜虜入梁',
-u'愁眉不開',
-u'愁眉不舒',
-u'愁眉不展',
-u'愁眉蹙額',
-u'愁眉緊鎖',
-u'愁眉苦臉',
-u'愁眉苦目',
-u'愁眉苦眼',
-u'愁眉淚睫',
-u'愁眉淚眼',
-u'愁眉鎖眼',
-u'愁眉啼妝',
-u'抽秘騁妍',
-u'醜名遠播',
-u'臭名遠揚',
-u'臭名昭彰',
-u'臭名昭著',
-u'綢缪束薪',
-u'籌謀帷幄',
-u'綢缪未雨',
-u'綢缪牖戶',
-u'醜女三日看慣',
-u'醜女效颦',
-u'愁潘病沈',
-u'醜妻家中寶',
-u'醜妻近地家中寶',
-u'臭氣陷阱',
-u'醜腔惡态',
-u'抽青配白',
-u'抽青配黃',
-u'抽取法力',
-u'抽取靈魂',
-u'醜人多做怪',
-u'稠人廣衆',
-u'稠人廣坐',
-u'仇人見面分外眼紅',
-u'仇人相見',
-u'仇人相見分外明白',
-u'仇人相見分外眼紅',
-u'仇人相見分外眼明',
-u'仇人相見分外眼睜',
-u'臭肉來蠅',
-u'愁山悶海',
-u'仇深似海',
-u'醜聲四溢',
-u'醜聲遠播',
-u'抽絲剝繭',
-u'抽絲剝筍',
-u'愁思茫茫',
-u'醜态百出',
-u'醜態畢露',
-u'抽胎換骨',
-u'醜态盡露',
-u'籌添海屋',
-u'醜頭怪臉',
-u'醜頭怪腦',
-u'臭味相投',
-u'臭味相投便稱知己',
-u'醜媳婦也得見公婆',
-u'醜媳婦早晚也得見公婆',
-u'醜媳婦總得見公婆',
-u'疇昔之夜',
-u'抽薪止沸',
-u'愁緒冥冥',
-u'愁緒如麻',
-u'愁顔不展',
-u'愁煙苦霧',
-u'抽演微言',
-u'酬應如流',
-u'愁雲慘淡',
-u'愁雲慘霧',
-u'愁雲毒霧',
-u'愁雲苦霧',
-u'抽簪散發',
-u'疇咨之憂',
-u'處安思危',
-u'出榜安民',
-u'除暴安良',
-u'楚璧隋珍',
-u'出不得手',
-u'楚才晉用',
-u'除殘去暴',
-u'除殘去穢',
-u'除殘去亂',
-u'除殘掃穢',
-u'出塵不染',
-u'除塵滌垢',
-u'出塵離染',
-u'出陳易新',
-u'出塵之表',
-u'出塵之想',
-u'出塵之姿',
-u'出醜放乖',
-u'出醜狼狽',
-u'出醜揚疾',
-u'楚楚不凡',
-u'出處不如聚處',
-u'楚楚動人',
-u'出處非千佛',
-u'觸處機來',
-u'出處進退',
-u'楚楚可愛',
-u'楚楚可觀',
-u'楚楚可憐',
-u'楚楚可人',
-u'出出律律',
-u'初出茅廬',
-u'出處殊途',
-u'楚楚谡谡',
-u'怵怵忐忐',
-u'怵怵惕惕',
-u'處處有路透長安',
-u'楚楚有緻',
-u'出處語默',
-u'楚楚作态',
-u'出詞吐氣',
-u'楚得楚弓',
-u'出敵不意',
-u'觸地号天',
-u'出敵意外',
-u'觸點間距',
-u'觸鬥蠻争',
-u'楚毒備至',
-u'初度之辰',
-u'出多少汗吃多少飯',
-u'黜惡若仇',
-u'除惡務本',
-u'除惡務盡',
-u'出爾反爾',
-u'觸而即發',
-u'初發芙蓉',
-u'觸發特效',
-u'處繁理劇',
-u'出凡入勝',
-u'除非己莫爲',
-u'楚鳳稱珍',
-u'雛鳳清聲',
-u'雛鳳聲清',
-u'處高臨深',
-u'楚歌四合',
-u'楚歌四面',
-u'楚歌四起',
-u'楚歌之計',
-u'除根剪草',
-u'楚弓楚得',
-u'楚弓複得',
-u'出公忘私',
-u'楚弓遺影',
-u'出谷遷喬',
-u'出乖丢醜',
-u'出乖露醜',
-u'出乖弄醜',
-u'楚管蠻弦',
-u'楚館秦樓',
-u'出鬼入神',
-u'除害興利',
-u'初荷出水',
-u'出何典記',
-u'楚河漢界',
-u'出何經典',
-u'出乎爾反乎爾',
-u'出乎反乎',
-u'出乎意表',
-u'出乎意料',
-u'出乎意外',
-u'出乎預料',
-u'除患寧亂',
-u'除患興利',
-u'除穢布新',
-u'黜昏啓聖',
-u'觸機便發',
-u'觸機即發',
-u'初級臨時駕駛執照',
-u'觸機落阱',
-u'除疾遺類',
-u'出家不離俗',
-u'出家從夫',
-u'出家人不說在家話',
-u'出家如初',
-u'除奸革弊',
-u'除奸去暴',
-u'處降納叛',
-u'出将入相',
-u'出疆載質',
-u'楚界漢河',
-u'觸禁犯忌',
-u'處境尴尬',
-u'出警入跸',
-u'觸景傷懷',
-u'觸景傷情',
-u'觸景傷心',
-u'觸景生懷',
-u'觸景生情',
-u'處靜息迹',
-u'儲精蓄銳',
-u'除舊布新',
-u'杵臼之交',
-u'出口成章',
-u'出口入耳',
-u'出口傷人',
-u'處裈之虱',
-u'觸來莫與說',
-u'除狼得虎',
-u'除了死法有活法',
-u'出類拔萃',
-u'出類超群',
-u'觸類而長',
-u'觸類而通',
-u'觸類可通',
-u'觸類旁通',
-u'樗栎凡材',
-u'樗栎散材',
-u'樗栎庸材',
-u'出林乳虎',
-u'雛龍之翼',
-u'雛龍之語',
-u'初露鋒芒',
-u'初露頭角',
-u'觸蠻交戰',
-u'出門不認帳',
-u'出門合轍',
-u'出門看天色',
-u'出門靠朋友',
-u'出門如賓',
-u'出門應轍',
-u'出門在外',
-u'楚夢雲雨',
-u'出沒不常',
-u'出沒無常',
-u'出沒無際',
-u'出謀劃策',
-u'出謀獻策',
-u'觸目悲感',
-u'觸目崩心',
-u'觸目成誦',
-u'觸目駭心',
-u'觸目皆是',
-u'觸目警心',
-u'觸目琳琅',
-u'觸目如故',
-u'觸目傷懷',
-u'觸目傷心',
-u'觸目神傷',
-u'觸目恸心',
-u'觸目興懷',
-u'觸目興歎',
-u'楚幕有烏',
-u'出納之吝',
-u'楚囊之情',
-u'處囊之錐',
-u'出内之吝',
-u'出奴入主',
-u'處女之戒',
-u'怵魄動心',
-u'出其不備',
-u'出奇不窮',
-u'出其不意',
-u'出其不意攻其不備',
-u'出其不意攻其無備',
-u'出其不意掩其不備',
-u'出其不虞',
-u'礎泣而雨',
-u'出奇劃策',
-u'出奇取勝',
-u'出奇無窮',
-u'出奇用詐',
-u'出奇緻勝',
-u'出淺入深',
-u'鋤強扶弱',
-u'楚囚對泣',
-u'楚囚相對',
-u'楚囚相泣',
-u'出群拔萃',
-u'刍荛之見',
-u'刍荛之言',
-u'刍荛之議',
-u'出人頭地',
-u'出人望外',
-u'楚人養狙',
-u'出人意表',
-u'出人意料',
-u'出人意外',
-u'出人豫料',
-u'出人之才',
-u'出入将相',
-u'出入起居',
-u'出入人罪',
-u'出入神鬼',
-u'出入生死',
-u'出如脫兔',
-u'出入無常',
-u'出入無間',
-u'出入無時',
-u'礎潤而雨',
-u'出色當行',
-u'出山濟世',
-u'出山泉水',
-u'黜奢崇儉',
-u'出神入定',
-u'出神入化',
-u'出神入妙',
-u'處身涉世',
-u'初生牛犢不怕虎',
-u'出聖入神',
-u'出生入死',
-u'初生之犢',
-u'初生之犢不懼虎',
-u'初生之犢不畏虎',
-u'出師不利',
-u'出世超凡',
-u'初試鋒芒',
-u'觸石決木',
-u'出世離群',
-u'觸事面牆',
-u'初試啼聲',
-u'出師無名',
-u'處實效功',
-u'出師有名',
-u'觸手礙腳',
-u'出手不落空',
-u'出手得盧',
-u'觸手可及',
-u'觸手生春',
-u'出水才見兩腿泥',
-u'出水芙蓉',
-u'楚水吳山',
-u'處順安常',
-u'出死斷亡',
-u'出死入生',
-u'處堂燕雀',
-u'怵惕恻隐',
-u'楚天雲雨',
-u'出頭的椽子先爛',
-u'出頭的橼子先爛',
-u'出頭露相',
-u'出頭露面',
-u'出頭有日',
-u'出頭之日',
-u'出外方知少主人',
-u'出位僭言',
-u'楚尾吳頭',
-u'出位之謀',
-u'出文入武',
-u'出污泥而不染',
-u'觸物傷情',
-u'楚舞吳歌',
-u'觸物興懷',
-u'除邪懲惡',
-u'黜邪崇正',
-u'初寫黃庭',
-u'除邪去害',
-u'出血筒子',
-u'怵心刿目',
-u'處心積慮',
-u'初學塗鴉',
-u'出言不遜',
-u'出言成章',
-u'出言挺撞',
-u'出言吐詞',
-u'出言吐氣',
-u'出言吐語',
-u'出言無忌',
-u'出言無狀',
-u'出言有章',
-u'楚腰蛴領',
-u'楚腰衛鬓',
-u'楚腰纖細',
-u'處易備猝',
-u'出以公心',
-u'出夷入險',
-u'黜衣縮食',
-u'出一頭地',
-u'初一一回十五一回',
-u'雛鷹展翅',
-u'出幽遷喬',
-u'出有入無',
-u'出幽升高',
-u'除莠務盡',
-u'黜幽陟明',
-u'出語成章',
-u'出淤泥而不染',
-u'出輿入辇',
-u'出于水火',
-u'出于無奈',
-u'出于污泥而不染',
-u'出于無意',
-u'楚雨巫雲',
-u'出于意表',
-u'出于意外',
-u'出于一轍',
-u'楚越之急',
-u'出雲入泥',
-u'楚雲湘雨',
-u'出震繼離',
-u'處之綽然',
-u'處之泰然',
-u'處之坦然',
-u'處之恬然',
-u'處之宴然',
-u'處之夷然',
-u'黜陟幽明',
-u'處中之軸',
-u'出自意外',
-u'處尊居顯',
-u'出作入息',
-u'揣骨聽聲',
-u'揣合逢迎',
-u'揣奸把猾',
-u'踹兩腳船',
-u'揣摩迎合',
-u'揣情度理',
-u'揣時度力',
-u'揣歪捏怪',
-u'傳杯換盞',
-u'傳杯弄斝',
-u'傳杯弄盞',
-u'傳杯送盞',
-u'穿壁引光',
-u'傳柄移藉',
-u'傳播差錯',
-u'傳播誤差',
-u'船不漏針',
-u'串成一氣',
-u'穿刺射擊',
-u'穿刺之傷',
-u'船到江心補漏遲',
-u'船到橋門自會直',
-u'船到橋頭自然直',
-u'穿道窮經',
-u'傳道受業',
-u'船多不礙港車多不礙路',
-u'舛訛百出',
-u'穿房過屋',
-u'穿房入戶',
-u'傳風扇火',
-u'傳龜襲紫',
-u'傳圭襲組',
-u'穿紅着綠',
-u'穿花蛱蝶',
-u'穿花納錦',
-u'船骥之托',
-u'船家的孩子會浮水',
-u'船堅炮利',
-u'穿井得人',
-u'傳經送寶',
-u'傳爵襲紫',
-u'串老婆舌頭',
-u'川流不舍',
-u'川流不息',
-u'串親訪友',
-u'穿青衣抱黑柱',
-u'穿山貂王',
-u'穿山幼貂',
-u'傳神阿堵',
-u'穿濕布衫',
-u'傳誦不絕',
-u'傳誦一時',
-u'穿堂入舍',
-u'川渟嶽峙',
-u'串通一氣',
-u'傳爲佳話',
-u'傳爲美談',
-u'傳爲笑柄',
-u'傳爲笑談',
-u'傳聞不如親見',
-u'傳聞失實',
-u'傳聞異詞',
-u'傳檄而定',
-u'喘息未安',
-u'喘息未定',
-u'喘息之間',
-u'船小掉頭快',
-u'穿胸步槍',
-u'穿楊百步',
-u'穿楊貫虱',
-u'穿楊射柳',
-u'川壅必潰',
-u'穿窬之盜',
-u'喘月吳牛',
-u'穿雲化蛇',
-u'穿雲裂石',
-u'穿鑿附會',
-u'川澤納污',
-u'川澤之示',
-u'穿針引線',
-u'傳之不朽',
-u'傳之其人',
-u'傳宗接代',
-u'闖蕩江湖',
-u'怆地呼天',
-u'床第之私',
-u'床第之言',
-u'瘡好忘痛',
-u'窗戶紙一點就破',
-u'闖禍生非',
-u'創家立業',
-u'瘡痂之嗜',
-u'窗間過馬',
-u'創钜痛仍',
-u'創钜痛深',
-u'闖開臉兒',
-u'窗明幾潔',
-u'窗明幾淨',
-u'闖南走北',
-u'怆然涕下',
-u'床上安床',
-u'床上叠床',
-u'床上施床',
-u'創深痛巨',
-u'怆天呼地',
-u'床頭吵架床尾和',
-u'床頭金盡',
-u'窗外有耳',
-u'床下安床',
-u'床下鬥牛',
-u'床下牛鬥',
-u'創業垂統',
-u'創業難守業更難',
-u'創業容易守業難',
-u'創業守成',
-u'創業維艱',
-u'創一警百',
-u'瘡痍滿道',
-u'瘡痍滿目',
-u'瘡痍彌目',
-u'創痍未瘳',
-u'創意造言',
-u'創制垂基',
-u'床笫之私',
-u'垂成之功',
-u'吹篪乞食',
-u'捶床搗枕',
-u'捶床拍枕',
-u'吹吹打打',
-u'吹唇唱吼',
-u'吹唇沸地',
-u'吹大法螺',
-u'吹燈拔蠟',
-u'垂餌虎口',
-u'垂耳下首',
-u'垂發戴白',
-u'垂範百世',
-u'垂芳千載',
-u'椎鋒陷陳',
-u'椎鋒陷陣',
-u'椎膚剝髓',
-u'椎膚剝體',
-u'垂拱而治',
-u'垂拱仰成',
-u'垂拱之化',
-u'吹垢索瘢',
-u'捶骨瀝髓',
-u'槌鼓撞鍾',
-u'吹胡子瞪眼',
-u'吹花嚼蕊',
-u'吹灰找縫',
-u'吹灰之力',
-u'錘擊昏迷',
-u'吹角連營',
-u'炊金馔玉',
-u'炊臼之夢',
-u'炊臼之戚',
-u'炊臼之痛',
-u'吹糠見米',
-u'吹拉彈唱',
-u'垂簾聽決',
-u'垂簾聽政',
-u'炊粱跨衛',
-u'吹亂求疵',
-u'椎埋穿掘',
-u'椎埋狗竊',
-u'椎埋屠狗',
-u'吹毛利刃',
-u'吹毛覓瑕',
-u'吹毛求瘢',
-u'吹毛求疵',
-u'吹毛求瑕',
-u'吹毛取瑕',
-u'吹毛數睫',
-u'吹毛索瘢',
-u'吹毛索疵',
-u'吹毛索垢',
-u'吹毛洗垢',
-u'垂沒之命',
-u'吹面不寒楊柳風',
-u'垂名青史',
-u'垂名史冊',
-u'垂名竹帛',
-u'垂暮之年',
-u'椎牛發冢',
-u'吹牛拍馬',
-u'椎牛歃血',
-u'槌牛酾酒',
-u'椎牛飨士',
-u'吹氣如蘭',
-u'吹氣若蘭',
-u'吹氣勝蘭',
-u'垂磬之室',
-u'炊瓊爇桂',
-u'槌仁提義',
-u'炊沙成飯',
-u'炊沙镂冰',
-u'吹沙走石',
-u'炊沙作飯',
-u'炊沙作糜',
-u'垂裳而治',
-u'垂紳正笏',
-u'垂世不朽',
-u'垂手而得',
-u'垂手恭立',
-u'垂手可得',
-u'垂首喪氣',
-u'垂手侍立',
-u'垂死掙紮',
-u'吹彈得破',
-u'吹彈歌舞',
-u'垂堂之戒',
-u'垂涕而道',
-u'垂髫戴白',
-u'垂頭塞耳',
-u'垂頭喪氣',
-u'垂頭铩羽',
-u'垂頭塌翅',
-u'垂頭塌翼',
-u'吹網欲滿',
-u'炊鮮漉清',
-u'垂涎三尺',
-u'垂涎欲滴',
-u'吹箫乞食',
-u'椎心頓足',
-u'椎心嘔血',
-u'椎心泣血',
-u'垂馨千祀',
-u'椎心飲泣',
-u'捶胸跌腳',
-u'捶胸跌足',
-u'捶胸頓腳',
-u'捶胸頓足',
-u'捶胸拍臆',
-u'槌胸蹋地',
-u'吹埙吹篪',
-u'吹葉嚼蕊',
-u'垂翼暴鱗',
-u'椎膺頓足',
-u'吹影镂塵',
-u'垂裕後昆',
-u'吹皺一池春水',
-u'吹竹彈絲',
-u'吹竹調絲',
-u'垂朱拖紫',
-u'唇敝舌腐',
-u'春冰虎尾',
-u'唇不離腮',
-u'春蠶抽絲',
-u'春蠶到死絲方盡',
-u'春蠶自縛',
-u'唇齒相濟',
-u'唇齒相須',
-u'唇齒相依',
-u'唇齒之邦',
-u'唇齒之國',
-u'唇齒之戲',
-u'蠢蠢欲動',
-u'春風不入驢耳',
-u'春風吹又生',
-u'春風得意',
-u'春風風人',
-u'春風浩蕩',
-u'春風和氣',
-u'春風和煦',
-u'春風化雨',
-u'春風漏泄',
-u'春風滿面',
-u'春風夏雨',
-u'春風野火',
-u'春風一度',
-u'春風沂水',
-u'春風雨露',
-u'春風中坐',
-u'唇腐齒落',
-u'唇輔相連',
-u'唇幹口燥',
-u'蓴羹鲈脍',
-u'莼羹千裏',
-u'春耕夏耘',
-u'莼羹魚脍',
-u'春光漏泄',
-u'春光明媚',
-u'春光如海',
-u'春光無限',
-u'春歸人老',
-u'春寒料峭',
-u'春和景明',
-u'春和人暢',
-u'唇紅齒白',
-u'春花秋實',
-u'春花秋月',
-u'春晖寸草',
-u'春回大地',
-u'春回寒谷',
-u'春回臘盡',
-u'唇尖舌利',
-u'唇焦口燥',
-u'唇焦舌敝',
-u'純潔百合',
-u'唇揭齒寒',
-u'春節快樂',
-u'純潔項鏈',
-u'春節煙花',
-u'春景常勝',
-u'純淨心靈',
-u'醇酒夫人',
-u'醇酒美人',
-u'春韭秋菘',
-u'鹑居鷇食',
-u'鹑居鷇飲',
-u'春困秋乏夏打盹',
-u'春來無處不花香',
-u'春蘭秋菊',
-u'椿齡無盡',
-u'春露秋霜',
-u'莼鲈之思',
-u'春滿人間',
-u'春滿神州',
-u'春夢求屁',
-u'春夢無痕',
-u'春夢一場',
-u'純綿裹鐵',
-u'純綿裹針',
-u'春暖花開',
-u'春暖花香',
-u'春葩麗藻',
-u'唇槍舌劍',
-u'春秋筆法',
-u'春秋鼎盛',
-u'春秋非我',
-u'春秋積序',
-u'春秋日高',
-u'春秋無義戰',
-u'春秋責備賢者',
-u'春秋責賢',
-u'春秋之義',
-u'春去秋來',
-u'蠢然思動',
-u'蠢人詛咒',
-u'蠢如鹿豕',
-u'蠢若木雞',
-u'春色撩人',
-u'春色滿園',
-u'春山八字',
-u'春山如笑',
-u'春蛇秋蚓',
-u'春深似海',
-u'春生秋殺',
-u'春生夏長',
-u'春生夏長秋收冬藏',
-u'春事闌珊',
-u'春數暮雲',
-u'純屬偶然',
-u'純屬騙局',
-u'春霜秋露',
-u'春誦夏弦',
-u'春筍怒發',
-u'椿庭萱室',
-u'椿庭萱堂',
-u'春蛙秋蟬',
-u'唇亡齒寒',
-u'春爲花博士酒是色媒人',
-u'春捂秋凍',
-u'春宵苦短',
-u'春宵一刻',
-u'春宵一刻值千金',
-u'椿萱并茂',
-u'純焰精華',
-u'春意盎然',
-u'鹑衣百結',
-u'純一不雜',
-u'鹑衣鹄面',
-u'鹑衣鷇食',
-u'春意闌珊',
-u'春蚓秋蛇',
-u'春雨如油',
-u'春袗輕筇',
-u'純真無邪',
-u'純正無邪',
-u'綽綽有裕',
-u'惙怛傷悴',
-u'辍毫栖牍',
-u'踔絕之能',
-u'踔厲奮發',
-u'踔厲風發',
-u'踔厲駿發',
-u'辍食吐哺',
-u'歠菽飲水',
-u'逴俗絕物',
-u'啜粟飲水',
-u'戳無路兒',
-u'戳心灌髓',
-u'啜英咀華',
-u'綽有餘地',
-u'綽有餘力',
-u'綽有餘暇',
-u'綽有餘妍',
-u'綽有餘裕',
-u'綽約多姿',
-u'綽約披風',
-u'慈悲善目',
-u'慈悲爲本',
-u'辭鄙義拙',
-u'詞不達意',
-u'詞不逮理',
-u'詞不逮意',
-u'辭不獲命',
-u'辭不獲已',
-u'詞不悉心',
-u'辭不意逮',
-u'慈不掌兵',
-u'慈不掌兵義不掌财',
-u'此唱彼和',
-u'此處不留人會有留人處',
-u'此處不留人自有留人處',
-u'刺刺不休',
-u'刺促不休',
-u'刺刀見紅',
-u'此地無銀三百兩',
-u'此動彼應',
-u'詞鈍意虛',
-u'辭多受少',
-u'刺耳尖嘯',
-u'此而可忍孰不可忍',
-u'刺耳怒吼',
-u'刺耳之言',
-u'此發彼應',
-u'此風不可長',
-u'辭豐意雄',
-u'此伏彼起',
-u'辭富居貧',
-u'刺骨暗影',
-u'刺股讀書',
-u'刺骨寒冰',
-u'刺骨尖嘯',
-u'刺骨痛心',
-u'刺股懸梁',
-u'刺骨之地',
-u'慈航普度',
-u'此恨綿綿',
-u'此呼彼應',
-u'刺虎持鹬',
-u'詞華典贍',
-u'雌黃黑白',
-u'茨棘之間',
-u'辭簡理博',
-u'辭簡義赅',
-u'辭簡意足',
-u'此疆彼界',
-u'此疆爾界',
-u'此界彼疆',
-u'辭金蹈海',
-u'辭舊迎新',
-u'刺舉無避',
-u'慈老愛幼',
-u'辭淚俱下',
-u'賜茅授土',
-u'慈眉善目',
-u'慈眉善眼',
-u'慈明無雙',
-u'慈母有敗子',
-u'此起彼伏',
-u'此起彼落',
-u'賜牆及肩',
-u'詞強理直',
-u'辭巧理拙',
-u'詞清訟簡',
-u'詞窮理極',
-u'詞窮理盡',
-u'詞窮理絕',
-u'詞窮理屈',
-u'辭窮情竭',
-u'辭趣翩翩',
-u'詞人才子',
-u'詞人墨客',
-u'辭色俱厲',
-u'詞少理暢',
-u'此事今已一筆勾斷',
-u'此事體大',
-u'辭順理正',
-u'慈孫孝子',
-u'辭微旨遠',
-u'此問彼難',
-u'此物比志',
-u'慈烏返哺',
-u'辭無所假',
-u'詞無枝葉',
-u'此心耿耿',
-u'刺心刻骨',
-u'刺心裂肝',
-u'刺心切骨',
-u'雌雄未決',
-u'刺須鲶魚',
-u'詞嚴理正',
-u'辭嚴氣正',
-u'詞嚴義密',
-u'詞言義正',
-u'此一時彼一時',
-u'辭喻橫生',
-u'詞約指明',
-u'詞正理直',
-u'辭指甚切',
-u'辭緻雅贍',
-u'此中多有',
-u'此中三昧',
-u'辭尊居卑',
-u'從壁上觀',
-u'從不間斷',
-u'從長計較',
-u'從長計議',
-u'從長商議',
-u'蔥翠欲滴',
-u'從刀尖上爬過來的',
-u'從惡如崩',
-u'從惡若崩',
-u'從惡是崩',
-u'從風而服',
-u'從風而靡',
-u'從誨如流',
-u'從谏如流',
-u'從儉入奢易',
-u'從井救人',
-u'從寬發落',
-u'從來好事多磨',
-u'叢林之戒',
-u'叢林之證',
-u'從令如流',
-u'從流忘反',
-u'聰明不可用盡',
-u'聰明才智',
-u'聰明出衆',
-u'聰明反被聰明誤',
-u'聰明過人',
-u'聰明絕世',
-u'聰明伶俐',
-u'聰明能幹',
-u'聰明人做糊塗事',
-u'聰明睿達',
-u'聰明睿哲',
-u'聰明睿智',
-u'聰明一世',
-u'聰明一世胡塗一時',
-u'聰明英毅',
-u'聰明正直',
-u'聰明智慧',
-u'聰明智能',
-u'聰明自誤',
-u'從前恩愛反爲仇',
-u'從前做過事沒興一齊來',
-u'從輕發落',
-u'叢輕折軸',
-u'叢雀淵魚',
-u'從容不迫',
-u'從容就義',
-u'從容無爲',
-u'從容應對',
-u'從容有常',
-u'從容中道',
-u'從容自如',
-u'從容自若',
-u'從容自在',
-u'叢山峻嶺',
-u'從善如登',
-u'從善如登從惡如崩',
-u'從善如流',
-u'從善若流',
-u'從奢入儉難',
-u'叢矢之的',
-u'從俗浮沉',
-u'從俗就簡',
-u'從天而降',
-u'從天而下',
-u'從頭徹尾',
-u'從頭到尾',
-u'從頭至尾',
-u'蔥蔚洇潤',
-u'從小看大三歲看老',
-u'從小離娘到大話長',
-u'從心所欲',
-u'從心之年',
-u'從一而終',
-u'從一以終',
-u'聰穎過人',
-u'從者如雲',
-u'從之如流',
-u'叢至沓來',
-u'從中漁利',
-u'從中作梗',
-u'湊手不及',
-u'猝不及防',
-u'粗布鞋底',
-u'粗茶淡飯',
-u'促促刺刺',
-u'粗粗咧咧',
-u'蹙蹙靡騁',
-u'蹙額攢眉',
-u'粗風暴雨',
-u'粗服亂頭',
-u'蹙國百裏',
-u'蹙國喪師',
-u'醋海翻撥',
-u'踧踖不安',
-u'蔟錦攢花',
-u'蹙金結繡',
-u'簇錦團花',
-u'粗具梗概',
-u'促忙促急',
-u'粗袍粝食',
-u'粗識之無',
-u'促死促滅',
-u'粗銅拳套',
-u'粗通文墨',
-u'粗通文藝',
-u'促膝密談',
-u'促膝談心',
-u'粗心大氣',
-u'粗心大意',
-u'粗心浮氣',
-u'粗衣淡飯',
-u'粗衣惡食',
-u'粗衣粝食',
-u'粗有眉目',
-u'粗枝大葉',
-u'粗制濫造',
-u'粗制砂輪',
-u'粗中有細',
-u'篡黨奪權',
-u'竄端匿迹',
-u'躥房越脊',
-u'攢鋒聚镝',
-u'爨桂炊玉',
-u'撺哄鳥亂',
-u'撺花蔟錦',
-u'攢零合整',
-u'撺眉蹙額',
-u'撺眉苦臉',
-u'篡權複辟',
-u'撺拳攏袖',
-u'攢三集五',
-u'撺三聚五',
-u'篡位奪權',
-u'爨柱炊玉',
-u'翠被豹舄',
-u'榱崩棟折',
-u'璀璨奪目',
-u'啛啛喳喳',
-u'榱棟崩折',
-u'脆而不堅',
-u'摧鋒陷堅',
-u'摧鋒陷陣',
-u'摧剛爲柔',
-u'摧花斫柳',
-u'催毀廓清',
-u'摧堅獲醜',
-u'摧堅陷陣',
-u'摧堅殪敵',
-u'摧堅折銳',
-u'摧枯拉腐',
-u'摧枯拉朽',
-u'摧枯折腐',
-u'摧枯振朽',
-u'摧蘭折玉',
-u'翠綸桂餌',
-u'翠綠炫光',
-u'摧眉折腰',
-u'翠繞珠圍',
-u'催人淚下',
-u'摧山攪海',
-u'摧身碎首',
-u'翠圍珠繞',
-u'摧陷廓清',
-u'翠消紅減',
-u'摧心剖汴',
-u'摧心剖肝',
-u'摧胸破汴',
-u'摧胸破肝',
-u'摧胸剖肝',
-u'摧朽拉枯',
-u'翠玉雕像',
-u'催折惡類',
-u'催折豪強',
-u'摧志屈道',
-u'翠竹黃花',
-u'寸碧遙岑',
-u'寸兵尺劍',
-u'寸兵尺鐵',
-u'寸步不離',
-u'寸步不讓',
-u'寸步不移',
-u'寸步難行',
-u'寸步難移',
-u'寸步千裏',
-u'寸草不留',
-u'寸草不生',
-u'寸草春晖',
-u'寸草無遺',
-u'寸草銜結',
-u'寸長尺短',
-u'寸長尺技',
-u'寸長片善',
-u'寸椽片瓦',
-u'寸椽隻瓦',
-u'寸寸計較',
-u'村村勢勢',
-u'寸地尺天',
-u'存而不論',
-u'存而不議',
-u'存而勿論',
-u'村夫俗子',
-u'村夫野老',
-u'村哥裏婦',
-u'村歌社鼓',
-u'村歌社舞',
-u'寸晷風檐',
-u'存候踵路',
-u'存乎其人',
-u'存乎一心',
-u'寸積铢累',
-u'寸甲不留',
-u'寸進尺退',
-u'村筋俗骨',
-u'村酒野蔬',
-u'寸累铢積',
-u'寸利必得',
-u'寸利不讓',
-u'寸量铢稱',
-u'寸量铢較',
-u'寸馬豆人',
-u'寸木岑樓',
-u'寸男尺女',
-u'存榮沒哀',
-u'寸善片長',
-u'存神索至',
-u'村生泊長',
-u'存十一于千百',
-u'寸絲半粟',
-u'寸絲不挂',
-u'寸絲爲縷千金不移',
-u'寸蹄尺缣',
-u'寸田尺宅',
-u'寸鐵入木九牛之力',
-u'寸鐵殺人',
-u'寸鐵在手',
-u'寸莛擊鍾',
-u'寸土必較',
-u'寸土必争',
-u'寸土不讓',
-u'寸土尺地',
-u'寸土尺金',
-u'存亡安危',
-u'存亡繼絕',
-u'存亡絕續',
-u'存亡生死',
-u'存亡未蔔',
-u'存亡續絕',
-u'存亡有分',
-u'存亡之秋',
-u'寸隙難留',
-u'寸轄制輪',
-u'村箫社鼓',
-u'存心不良',
-u'寸心不昧',
-u'存心積慮',
-u'寸心千古',
-u'寸心如割',
-u'存心養性',
-u'存恤耆老',
-u'村學究語',
-u'村野匹夫',
-u'寸陰尺璧',
-u'寸陰可惜',
-u'寸陰若歲',
-u'寸陰是競',
-u'寸陰是惜',
-u'寸陰自惜',
-u'寸有所長',
-u'寸指測淵',
-u'錯彩镂金',
-u'錯打了定盤星',
-u'搓粉團朱',
-u'剉骨揚灰',
-u'厝火積薪',
-u'厝火燎原',
-u'錯節盤根',
-u'撮科打閧',
-u'撮科打诨',
-u'錯亂密碼',
-u'錯落不齊',
-u'錯落高下',
-u'錯落有緻',
-u'搓綿扯絮',
-u'錯認顔标',
-u'錯上加錯',
-u'措手不叠',
-u'措手不及',
-u'搓手頓腳',
-u'搓手頓足',
-u'搓手跺腳',
-u'搓酥滴粉',
-u'撮土焚香',
-u'撮土爲香',
-u'蹉跎日月',
-u'蹉跎時日',
-u'蹉跎歲月',
-u'蹉跎自誤',
-u'措心積慮',
-u'厝薪于火',
-u'撮鹽入火',
-u'撮鹽入水',
-u'措顔無地',
-u'撮要删繁',
-u'措置乖方',
-u'挫志怒吼',
-u'挫志咆哮',
-u'措置失宜',
-u'措置有方',
-u'措置裕如',
-u'矬子裏拔将軍',
-u'錯綜變化',
-u'錯綜複雜',
-u'大敗虧輪',
-u'大敗虧輸',
-u'大白天說夢話',
-u'大白天做夢',
-u'大敗塗地',
-u'大幫壓境',
-u'打抱不平',
-u'大本大宗',
-u'大筆如椽',
-u'大筆一揮',
-u'大辯不言',
-u'大辯若讷',
-u'打遍天下無敵手',
-u'達變通機',
-u'大辯無聲',
-u'達不離道',
-u'大步流星',
-u'大不如前',
-u'打不着狐狸惹身騷',
-u'打不着野狼打家狗',
-u'大才必有大用',
-u'大才榱槃',
-u'大才槃槃',
-u'大才小用',
-u'打草驚蛇',
-u'打草蛇驚',
-u'打柴的不能跟放羊的走',
-u'大徹大悟',
-u'大車驷馬',
-u'大車無輗',
-u'大車以載',
-u'大秤分金',
-u'大騁厥辭',
-u'達誠申信',
-u'打成相識',
-u'大秤小鬥',
-u'打成一片',
-u'大成之人',
-u'大恥奇辱',
-u'大吃一驚',
-u'打出吊入',
-u'大處落筆',
-u'大處落墨',
-u'大處著眼',
-u'大處着墨',
-u'大處着眼',
-u'大吹大打',
-u'大吹大擂',
-u'大吹法螺',
-u'大醇小疵',
-u'大慈大悲',
-u'打撺鼓兒',
-u'大錯特錯',
-u'大打出手',
-u'大大法法',
-u'大大咧咧',
-u'大大落落',
-u'搭搭撒撒',
-u'大膽包身',
-u'大膽包天',
-u'大膽海口',
-u'達旦通宵',
-u'大啖一番',
-u'大纛高牙',
-u'大道康莊',
-u'大刀闊斧',
-u'大盜竊國',
-u'大盜移國',
-u'大德必壽',
-u'大德不酬',
-u'打得火熱',
-u'大得人心',
-u'打燈籠找不着',
-u'大地沖擊',
-u'大地春回',
-u'大敵當前',
-u'大地粉碎',
-u'大地回春',
-u'大地踐踏',
-u'大地破裂',
-u'大抵選他肌骨好',
-u'大地印記',
-u'大敵在前',
-u'大地震顫',
-u'大地震擊',
-u'達地知根',
-u'打掉門牙往肚裏咽',
-u'打掉牙往肚裏咽',
-u'大動幹戈',
-u'大動肝火',
-u'大動公慣',
-u'大垌之慚',
-u'大鬥小秤',
-u'大度包容',
-u'大肚便便',
-u'大度豁達',
-u'大度兼容',
-u'大度君子',
-u'大度汪洋',
-u'大多鼎鼎',
-u'大恩不報',
-u'大恩不謝',
-u'大恩大德',
-u'大而化之',
-u'大而無當',
-u'大發慈悲',
-u'大發厥詞',
-u'大發雷霆',
-u'大發謬論',
-u'大法小廉',
-u'大發議論',
-u'大放悲聲',
-u'大放光明',
-u'大放厥詞',
-u'答非所問',
-u'大費周折',
-u'大風大浪',
-u'大俸大祿',
-u'打鳳撈龍',
-u'大風漫急火',
-u'大風有遂',
-u'大風之歌',
-u'大福不再',
-u'打富濟貧',
-u'打富救貧',
-u'大附魔袋',
-u'大腹便便',
-u'大婦小妻',
-u'大富由命小富由勤',
-u'大孚衆望',
-u'大幹物議',
-u'大綱小紀',
-u'打個噴嚏二百歲',
-u'打隔山炮',
-u'打個小傘前來',
-u'打個照面',
-u'大公畢成',
-u'答工部郎中',
-u'大功垂成',
-u'大功告成',
-u'大公無私',
-u'大公無我',
-u'大公至正',
-u'打躬作揖',
-u'打狗還得看主人',
-u'打狗看主',
-u'打狗看主人',
-u'大鼓大吹',
-u'大冠高履',
-u'達官貴人',
-u'達官貴要',
-u'大關節目',
-u'達官聞人',
-u'達官顯宦',
-u'達官顯吏',
-u'達官要人',
-u'達觀知命',
-u'打滾撒潑',
-u'大海不讓細流',
-u'大海沉石',
-u'大海撈針',
-u'大海石沉',
-u'大海一針',
-u'大海終須納細流',
-u'大汗涔涔',
-u'大喊大叫',
-u'大寒索裘',
-u'大旱望霓',
-u'大旱望雨',
-u'大旱望雲',
-u'大旱望雲霓',
-u'大含細入',
-u'大旱雲霓',
-u'大旱之望',
-u'大行大市',
-u'大好河山',
-u'大好山河',
-u'大喝一聲',
-u'大紅大綠',
-u'大哄大嗡',
-u'大紅大紫',
-u'打虎不成反被虎傷',
-u'打虎牢龍',
-u'大呼小喝',
-u'大呼小叫',
-u'大瓠之用',
-u'打花胡哨',
-u'大化有四',
-u'打诨插科',
-u'打诨發科',
-u'打诨說笑',
-u'大惑不解',
-u'大惑莫解',
-u'大獲全勝',
-u'打擊報複',
-u'大吉大利',
-u'打雞罵狗',
-u'大計小用',
-u'大機械師卡斯派普',
-u'大家都是命',
-u'大家風範',
-u'大家閨範',
-u'大家閨秀',
-u'打家劫盜',
-u'打家劫舍',
-u'大家舉止',
-u'大駕莅臨',
-u'大家馬兒大家騎',
-u'大家小戶',
-u'大簡車徒',
-u'大奸大慝',
-u'大奸巨滑',
-u'大漸彌留',
-u'大奸似忠',
-u'大匠不斫',
-u'大江東去',
-u'大将風度',
-u'大江南北',
-u'大匠運斤',
-u'大節不奪',
-u'大節凜然',
-u'打街罵巷',
-u'大劫難逃',
-u'大桀小桀',
-u'大街小巷',
-u'打進冷宮',
-u'大經大法',
-u'大驚失色',
-u'大驚小怪',
-u'大酒大肉',
-u'大酒肥肉',
-u'打酒向提瓶子的要錢',
-u'大舉進攻',
-u'大爵屠門',
-u'打開窗戶說亮話',
-u'大開大合',
-u'大開方便之門',
-u'大開狗窦',
-u'打開天窗說亮話',
-u'大開眼界',
-u'大可師法',
-u'大可有爲',
-u'大塊朵頤',
-u'大快人心',
-u'大快人意',
-u'大魁天下',
-u'大來小往',
-u'大浪淘沙',
-u'大樂必易',
-u'大利不利',
-u'大力鬼王',
-u'大路朝天各走半邊',
-u'大路生在嘴邊',
-u'大路椎輪',
-u'打亂陣腳',
-u'大略雄才',
-u'大蘿蔔不用屎澆',
-u'大鑼大鼓',
-u'打落水狗',
-u'大羅仙使',
-u'大馬當先',
-u'打馬虎眼',
-u'大馬金刀',
-u'打謾評跋',
-u'大門不出二門不邁',
-u'打悶葫蘆',
-u'大夢初醒',
-u'大夢方醒',
-u'大名鼎鼎',
-u'大明法度',
-u'大命将泛',
-u'大鳴驚人',
-u'大名難居',
-u'大謬不然',
-u'大模大樣',
-u'大模屍樣',
-u'大模厮樣',
-u'大莫與京',
-u'大漠之錘',
-u'大謀不謀',
-u'大難不死',
-u'大難不死必有後福',
-u'大難臨頭',
-u'大男小女',
-u'大男幼女',
-u'大腦凍結',
-u'大逆不道',
-u'大睨高談',
-u'大逆無道',
-u'大炮而紅',
-u'大烹五鼎',
-u'大鵬展翅恨天低',
-u'大篇長什',
-u'打破常規',
-u'打破飯碗',
-u'打破迷關',
-u'打破沙鍋',
-u'打破沙鍋問到底',
-u'打破疑團',
-u'大璞不完',
-u'大酺三日',
-u'大起大落',
-u'大起磅礴',
-u'大器晚成',
-u'大器小用',
-u'大錢大物',
-u'大千世界',
-u'大巧若拙',
-u'大衾長枕',
-u'打勤獻趣',
-u'大青大綠',
-u'大請大受',
-u'打情罵俏',
-u'打情罵趣',
-u'打情賣笑',
-u'打情獻趣',
-u'大權獨攬',
-u'大權旁落',
-u'達權通變',
-u'大權在握',
-u'達權知變',
-u'怛然失色',
-u'大嚷大叫',
-u'打人別打臉',
-u'打人不打笑臉人',
-u'大人不記小人過',
-u'大人不見小人怪',
-u'大人不曲',
-u'達人大觀',
-u'大仁大義',
-u'大仁大勇',
-u'達人高緻',
-u'大人虎變',
-u'大人君子',
-u'達人立人',
-u'打人罵狗',
-u'大人先生',
-u'達人之節',
-u'達人知命',
-u'打入冷宮',
-u'打入另冊',
-u'打入贅字号去',
-u'大阮小阮',
-u'大撒手兒',
-u'大廈棟梁',
-u'大殺風景',
-u'大煞風趣',
-u'大廈将顛',
-u'大廈将傾',
-u'大廈千間',
-u'大山廣川',
-u'大山小山',
-u'大傷元氣',
-u'打蛇不死必挨咬',
-u'打蛇不死必被咬',
-u'打蛇不死反挨咬',
-u'打蛇不死反被咬',
-u'打蛇不死反受其害',
-u'打蛇打七寸',
-u'大聲喝采',
-u'大聲疾呼',
-u'大聲嚷嚷',
-u'大聲小氣',
-u'大聲吆喝',
-u'達士拔俗',
-u'大事不糊塗',
-u'大時不齊',
-u'大是不同',
-u'大師長袍',
-u'大是大非',
-u'大事化小小事化了',
-u'大勢軍馬',
-u'大事鋪張',
-u'大事去矣',
-u'大失人望',
-u'大勢所迫',
-u'大勢所趨',
-u'大失所望',
-u'打是疼罵是愛',
-u'達士通人',
-u'大勢雄兵',
-u'大勢已見',
-u'大勢已去',
-u'大手大腳',
-u'大受小知',
-u'大樹大陰涼',
-u'大樹底下好乘涼',
-u'大樹将軍',
-u'大書特書',
-u'大水沖了龍王廟',
-u'大水漫不過鴨子背',
-u'打順風鑼',
-u'大肆揮霍',
-u'大肆厥辭',
-u'大肆咆哮',
-u'大肆鋪張',
-u'打死人不償命',
-u'大肆宣傳',
-u'打它個落花流水',
-u'打桃射柳',
-u'大慝巨奸',
-u'打嚏噴有人念叨',
-u'大題小作',
-u'大天白亮',
-u'大天白日',
-u'打鐵趁熱',
-u'打鐵還得自身硬',
-u'打鐵還需本身硬',
-u'打鐵還需自身硬',
-u'打鐵先得自身硬',
-u'打鐵需得自身硬',
-u'大庭廣衆',
-u'大同境域',
-u'大同小異',
-u'大頭小尾',
-u'打頭一炮',
-u'打退堂鼓',
-u'大宛列傳',
-u'大爲折服',
-u'打甕墩盆',
-u'打窩裏炮',
-u'大毋侵小',
-u'大喜過望',
-u'大喜若狂',
-u'大喜逾望',
-u'打下馬威',
-u'打瞎子罵啞巴',
-u'大賢虎變',
-u'大限來時各自飛',
-u'大限臨身',
-u'大限臨頭',
-u'搭線竊聽',
-u'大顯身手',
-u'大顯神通',
-u'大相迳娣',
-u'大相迳庭',
-u'大相矛盾',
-u'打小算盤',
-u'大信不約',
-u'大興土木',
-u'大興問罪之師',
-u'打旋磨兒',
-u'打旋磨子',
-u'打牙打令',
-u'打牙逗嘴',
-u'打牙犯嘴',
-u'大雅扶輪',
-u'大雅宏達',
-u'打鴨驚鴛',
-u'打鴨驚鴛鴦',
-u'大雅君子',
-u'打牙撂嘴',
-u'打牙配嘴',
-u'大雅之人',
-u'大雅之堂',
-u'打鴨子上架',
-u'大言不慚',
-u'大言弗怍',
-u'大言欺人',
-u'大言聳聽',
-u'大眼望小眼',
-u'大言無當',
-u'大言無實',
-u'大言相駭',
-u'大搖大擺',
-u'大吆小喝',
-u'大葉粗枝',
-u'大夜彌天',
-u'打一巴掌給個甜棗',
-u'打一棒快球子',
-u'大義薄雲',
-u'大意拉拉',
-u'大義來親',
-u'大義凜凜',
-u'大義凜然',
-u'大義滅親',
-u'大義微言',
-u'大飲長歠',
-u'大隐朝市',
-u'大音希聲',
-u'大勇不鬥',
-u'大勇若怯',
-u'大有裨益',
-u'大有見地',
-u'大有迳娣',
-u'大有迳庭',
-u'大有可觀',
-u'大有可爲',
-u'大有其人',
-u'大有起色',
-u'大有人在',
-u'大有所爲',
-u'大有文章',
-u'大有作爲',
-u'大愚不靈',
-u'大魚吃小魚小魚吃蝦米',
-u'大雨滂沱',
-u'大雨傾盆',
-u'大雨如注',
-u'大禹治水',
-u'大宇中傾',
-u'大院深宅',
-u'達則兼濟天下',
-u'大擇礨空',
-u'大詐似信',
-u'大展鴻圖',
-u'大展經綸',
-u'大丈夫寧死不屈',
-u'大丈夫視死如歸',
-u'大丈夫有淚不輕彈',
-u'大丈夫志在四方',
-u'大張其詞',
-u'大張旗鼓',
-u'大張旗幟',
-u'大張聲勢',
-u'大張撻伐',
-u'大杖則走',
-u'打着燈籠沒處找',
-u'打着燈籠找不着',
-u'大者數百',
-u'打枕捶床',
-u'大陣仗兒',
-u'大政方針',
-u'大智不智',
-u'大智大勇',
-u'大智如愚',
-u'大直若诎',
-u'大智若遇',
-u'大中見小',
-u'打腫臉充胖子',
-u'大中至正',
-u'打嘴現世',
-u'大做文章',
-u'代矮相傳',
-u'骀背鶴發',
-u'待哺嗷嗷',
-u'代拆代行',
-u'戴大帽子',
-u'代代相傳',
-u'呆呆掙掙',
-u'怠惰效果',
-u'怠惰因循',
-u'戴發含齒',
-u'戴發含牙',
-u'戴高履厚',
-u'戴高帽兒',
-u'戴高帽子',
-u'怠忽荒政',
-u'戴圜履方',
-u'戴雞佩豚',
-u'待機再舉',
-u'帶甲百萬',
-u'待價藏珠',
-u'待賈而沽',
-u'代價函數',
-u'帶減腰圍',
-u'戴角傅翼',
-u'戴角披毛',
-u'帶金佩紫',
-u'戴逵破琴',
-u'待勞以逸',
-u'待理不理',
-u'呆裏藏乖',
-u'戴笠乘車',
-u'戴笠故交',
-u'戴笠荷鋤',
-u'帶厲河山',
-u'代李僵桃',
-u'呆裏撒奸',
-u'帶砺山河',
-u'黛琳希亞',
-u'戴綠帽子',
-u'代馬望北',
-u'代馬依風',
-u'戴眉含齒',
-u'待命中斷',
-u'待命狀态',
-u'呆腦呆頭',
-u'帶牛佩犢',
-u'代庖越俎',
-u'戴盆望夫',
-u'戴盆望天',
-u'戴憑奪席',
-u'戴憑重席',
-u'戴清履濁',
-u'待阙鴛鴦',
-u'待人接物',
-u'代人受過',
-u'呆人說夢',
-u'代人說項',
-u'代人捉刀',
-u'戴日戴鬥',
-u'代入複合',
-u'呆如木雞',
-u'呆若木雞',
-u'待勢乘時',
-u'待時而動',
-u'待時而舉',
-u'待時而行',
-u'待時守分',
-u'戴霜履冰',
-u'帶水帶漿',
-u'帶水拖泥',
-u'待說不說',
-u'呆似木雞',
-u'戴炭簍子',
-u'戴天蹐地',
-u'戴天履地',
-u'戴天之仇',
-u'呆頭呆腦',
-u'戴頭而來',
-u'戴頭識臉',
-u'帶頭作用',
-u'待兔守株',
-u'待兔之人',
-u'代爲說項',
-u'殆無孑遺',
-u'戴烏紗帽',
-u'殆無虛日',
-u'戴星而出',
-u'殆虛幾乎',
-u'戴玄履黃',
-u'帶眼安眉',
-u'待用無遺',
-u'帶雨梨花',
-u'戴玉披銀',
-u'帶雨拖泥',
-u'戴圓履方',
-u'代越庖俎',
-u'帶月披星',
-u'待月西廂',
-u'待诏公車',
-u'戴着鐐铐',
-u'帶着鈴铛去做賊',
-u'貸真價實',
-u'呆衷撒奸',
-u'帶注釋的圖像交換',
-u'待字閨中',
-u'待字深閨',
-u'待罪行間',
-u'帶罪立功',
-u'帶罪圖功',
-u'戴罪自效',
-u'單兵孤城',
-u'澹泊寡欲',
-u'淡泊明志',
-u'澹泊明志寧靜緻遠',
-u'淡泊以明志',
-u'淡泊以明志寧靜以緻遠',
-u'淡泊之心',
-u'旦不保夕',
-u'單步負笈',
-u'耽财竭力',
-u'殚财勞力',
-u'膽顫心驚',
-u'單車就路',
-u'單車之使',
-u'殚誠畢慮',
-u'殚誠竭慮',
-u'丹赤漆黑',
-u'單傳心印',
-u'膽粗氣壯',
-u'但存方寸土',
-u'膽大包身',
-u'膽大包天',
-u'膽大潑天',
-u'彈打雀飛',
-u'膽大如鬥',
-u'膽大如天',
-u'膽大妄爲',
-u'膽大心粗',
-u'膽大心細',
-u'膽大心小',
-u'膽大心雄',
-u'膽大于身',
-u'膽大于天',
-u'擔戴不起',
-u'旦旦而伐',
-u'耽耽虎視',
-u'旦旦信誓',
-u'耽耽逐逐',
-u'擔當不過',
-u'擔當不起',
-u'單刀赴會',
-u'單刀趣入',
-u'單刀直入',
-u'擔簦蹑屩',
-u'箪豆見色',
-u'丹垩一新',
-u'瘅惡彰善',
-u'淡而不厭',
-u'淡而無味',
-u'淡飯粗茶',
-u'淡飯黃齑',
-u'啖飯之道',
-u'丹鳳朝陽',
-u'旦複旦兮',
-u'單夫隻婦',
-u'單複之術',
-u'擔隔夜憂',
-u'耽擱一半天',
-u'耽古笃學',
-u'彈冠結绶',
-u'膽寒發豎',
-u'憚赫千裏',
-u'單鹄寡凫',
-u'淡乎寡味',
-u'耽花戀酒',
-u'誕幻不經',
-u'丹黃甲乙',
-u'丹雞白犬',
-u'丹加洛克',
-u'彈铗無魚',
-u'殚見洽聞',
-u'單見淺聞',
-u'但将冷眼看螃蟹',
-u'單椒秀澤',
-u'單孑獨立',
-u'殚竭其力',
-u'彈盡糧絕',
-u'彈盡援絕',
-u'殚精畢力',
-u'殚精畢思',
-u'殚精極慮',
-u'殚精極思',
-u'殚精竭誠',
-u'殚精竭力',
-u'殚精竭慮',
-u'殚精竭能',
-u'殚精竭思',
-u'殚精覃思',
-u'擔驚忍怕',
-u'擔驚受恐',
-u'耽驚受怕',
-u'膽驚心顫',
-u'但看三五日',
-u'膽靠聲來壯',
-u'膽靠聲壯',
-u'但恐誠心未至',
-u'箪醪投川',
-u'膽力過人',
-u'膽裂魂飛',
-u'丹陵若水',
-u'膽略魂飛',
-u'膽略兼人',
-u'單輪不返',
-u'誕謾不經',
-u'淡抹濃妝',
-u'殚謀戮力',
-u'旦暮入地',
-u'旦暮朝夕',
-u'旦暮之期',
-u'旦暮之人',
-u'旦暮之業',
-u'但能依本分',
-u'箪瓢陋室',
-u'箪瓢陋巷',
-u'箪瓢屢空',
-u'膽破心寒',
-u'膽破衆散',
-u'膽氣橫秋',
-u'膽氣淩雲',
-u'丹漆随夢',
-u'丹鉛甲乙',
-u'丹鉛弱質',
-u'單槍獨馬',
-u'單槍匹馬',
-u'膽且心虛',
-u'丹青不渝',
-u'丹青過實',
-u'丹青妙筆',
-u'丹青妙手',
-u'丹青難寫是精神',
-u'單茕隻立',
-u'但求如願',
-u'但求無過',
-u'淡然處之',
-u'淡然置之',
-u'單人獨騎',
-u'單人獨馬',
-u'單人匹馬',
-u'旦日日夕',
-u'膽如鬥大',
-u'膽若鼷鼠',
-u'膽喪魂驚',
-u'膽喪魂消',
-u'膽喪心驚',
-u'淡掃蛾眉',
-u'單身隻手',
-u'儋石之儲',
-u'丹書白馬',
-u'丹書鐵劵',
-u'丹書鐵契',
-u'丹書鐵券',
-u'淡水交情',
-u'淡水之交',
-u'單絲不成線',
-u'單絲不線',
-u'箪食豆羹',
-u'箪食壺漿',
-u'箪食壺酒',
-u'殚思極慮',
-u'單絲難成線',
-u'箪食瓢漿',
-u'箪食瓢飲',
-u'箪食與餓',
-u'單特孑立',
-u'單挑獨鬥',
-u'彈丸黑志',
-u'彈丸黑子',
-u'彈丸之地',
-u'誕妄不經',
-u'單文孤證',
-u'彈無虛發',
-u'耽習不倦',
-u'旦夕之費',
-u'旦夕之間',
-u'旦夕之危',
-u'膽小不得将軍做',
-u'膽小怕事',
-u'膽小如豆',
-u'膽小如鼠',
-u'膽小如鼷',
-u'單校雙檢',
-u'淡寫輕描',
-u'丹心碧血',
-u'丹心赤忱',
-u'丹心耿耿',
-u'殚心竭力',
-u'殚心竭慮',
-u'殚心竭智',
-u'丹心如故',
-u'擔雪塞井',
-u'擔雪填河',
-u'擔雪填井',
-u'淡血褶裙',
-u'單眼立體',
-u'丹陽布衣',
-u'啖以甘言',
-u'啖以厚利',
-u'啖以美利',
-u'啖以重利',
-u'丹楹刻桷',
-u'膽勇過人',
-u'單憂極瘁',
-u'但有進兮不有止',
-u'但有綠楊堪系馬',
-u'單語片言',
-u'彈雨槍林',
-u'殚雨尤雲',
-u'但願兒孫個個賢',
-u'但願如此',
-u'淡雲圓盾',
-u'單則易折',
-u'單則易折衆則難摧',
-u'膽戰魂驚',
-u'膽顫心寒',
-u'膽戰心慌',
-u'膽戰心驚',
-u'膽戰心搖',
-u'殚智畢精',
-u'殚智竭力',
-u'殚智竭慮',
-u'丹之所藏者赤',
-u'但知行好事不必問前程',
-u'啖之以利',
-u'旦種暮成',
-u'淡妝濃抹',
-u'膽壯氣粗',
-u'淡妝輕抹',
-u'膽壯心雄',
-u'檔案文件',
-u'黨豺爲虐',
-u'蕩産傾家',
-u'當場出采',
-u'當場出醜',
-u'當場丢醜',
-u'當場獻醜',
-u'當場作戲',
-u'當車螳臂',
-u'蕩蕩之勳',
-u'當道撅坑',
-u'當道築室',
-u'蕩滌放情',
-u'當地生姜不辣',
-u'蕩滌瑕穢',
-u'蕩滌邪穢',
-u'當墊腳石',
-u'當斷不斷',
-u'當斷不斷反受其亂',
-u'當斷失斷',
-u'黨惡朋奸',
-u'黨惡佑奸',
-u'當耳邊風',
-u'當耳旁風',
-u'當風秉燭',
-u'當刮目相待',
-u'當光賣絕',
-u'蕩海拔山',
-u'當行出色',
-u'蕩穢滌瑕',
-u'蕩魂攝魄',
-u'當火頭軍',
-u'當機貴斷',
-u'當機立斷',
-u'當機立決',
-u'當家方知柴米貴',
-u'當家理紀',
-u'當家立事',
-u'當家立業',
-u'當家三年狗也嫌',
-u'當家作主',
-u'黨堅勢盛',
-u'蕩檢逾閑',
-u'當今無輩',
-u'當今之務',
-u'當局稱迷',
-u'當局苦迷',
-u'當局者迷',
-u'當局者迷旁觀者清',
-u'當立之年',
-u'當路豺狼',
-u'谠論侃侃',
-u'谠論危言',
-u'當門抵戶',
-u'當門對戶',
-u'當面錯過',
-u'當面鼓對面鑼',
-u'當面教子背地教妻',
-u'當面鑼對面鼓',
-u'當面是人',
-u'當面是人背後是鬼',
-u'當面輸心背面笑',
-u'當面銀子對面錢',
-u'蕩氣回腸',
-u'當前決意',
-u'當前快意',
-u'蕩然回腸',
-u'蕩然肆志',
-u'蕩然無存',
-u'蕩然無遺',
-u'蕩然無餘',
-u'蕩然一空',
-u'當仁不讓',
-u'當仁不遜',
-u'當仁無遜',
-u'當世才度',
-u'當世才具',
-u'當世辭宗',
-u'當世得失',
-u'當世名人',
-u'當世取舍',
-u'當時若不登高望',
-u'當世無雙',
-u'當替罪羊',
-u'黨同妒異',
-u'黨同伐異',
-u'當頭棒喝',
-u'當頭對面',
-u'當頭一棒',
-u'蕩爲寒煙',
-u'當務始終',
-u'當務爲急',
-u'當務之急',
-u'蕩析離居',
-u'黨邪醜正',
-u'黨邪陷正',
-u'蕩心悅目',
-u'當行本色',
-u'當刑而王',
-u'谠言嘉論',
-u'谠言直聲',
-u'蕩倚沖冒',
-u'當一日和尚撞一天鍾',
-u'當一天和尚撞一天鍾',
-u'當着矬人別說短話',
-u'當着矬子不說短話',
-u'當之無愧',
-u'當之有愧',
-u'當衆出醜',
-u'當軸處中',
-u'當軸之士',
-u'當着不着',
-u'刀把兒遞給外人',
-u'道傍苦李',
-u'道傍之築',
-u'道傍築室',
-u'道被飛潛',
-u'倒背如流',
-u'倒繃孩兒',
-u'刀筆賈豎',
-u'刀筆老手',
-u'刀筆訟師',
-u'刀筆先生',
-u'刀筆之吏',
-u'道邊苦李',
-u'道不掇遺',
-u'道不舉遺',
-u'道不拾遺',
-u'道不拾移夜不閉戶',
-u'道不同不相謀',
-u'道不同不相爲謀',
-u'道不相謀',
-u'道不由衷',
-u'稻草人者',
-u'道長論短',
-u'倒裳索領',
-u'蹈常襲故',
-u'道長争短',
-u'倒吃甘蔗',
-u'道出個不字',
-u'倒垂之急',
-u'倒刺木棒',
-u'道存目擊',
-u'道大莫容',
-u'倒打一耙',
-u'倒打一瓦',
-u'叨叨絮絮',
-u'道德敗壞',
-u'道德名望',
-u'導德齊禮',
-u'道德文章',
-u'道弟稱兄',
-u'倒地葫蘆',
-u'倒吊深淵',
-u'道東說西',
-u'倒舵随風',
-u'道而不徑',
-u'盜匪長劍',
-u'倒鳳顛鸾',
-u'蹈鋒飲血',
-u'刀鋒之路',
-u'蹈赴湯火',
-u'道高德重',
-u'道高龍虎伏',
-u'道高魔重',
-u'道高望重',
-u'道高益安',
-u'道高益安勢高益危',
-u'道高一尺',
-u'道高一尺魔高一丈',
-u'道高一丈',
-u'倒戈棄甲',
-u'倒戈相向',
-u'倒戈卸甲',
-u'刀耕火耨',
-u'刀耕火耘',
-u'刀耕火種',
-u'刀耕水耨',
-u'倒鈎之刺',
-u'蹈故習常',
-u'道骨仙風',
-u'道寡稱孤',
-u'倒冠落佩',
-u'刀光劍影',
-u'刀光血影',
-u'搗鬼吊白',
-u'蹈規循矩',
-u'倒果爲因',
-u'刀過竹解',
-u'倒海翻江',
-u'倒海排山',
-u'倒海傾江',
-u'倒海移山',
-u'蹈海之節',
-u'蹈海之志',
-u'刀好刃口利',
-u'道合志同',
-u'刀痕箭瘢',
-u'搗謊駕舌',
-u'蹈火赴湯',
-u'蹈火探湯',
-u'倒戢幹戈',
-u'蹈機握杼',
-u'刀架脖子上',
-u'道鍵禅關',
-u'道間串擾',
-u'刀劍精通',
-u'蹈節死義',
-u'倒街卧巷',
-u'道盡途殚',
-u'道盡途窮',
-u'道殣相屬',
-u'道殣相望',
-u'道殣相枕',
-u'刀鋸不辭',
-u'刀鋸不加',
-u'刀鋸不如',
-u'刀鋸鼎镬',
-u'刀鋸斧钺',
-u'蹈矩踐墨',
-u'蹈矩循規',
-u'蹈矩循彟',
-u'刀鋸餘人',
-u'刀鋸之餘',
-u'刀快不怕脖子粗',
-u'到老終無怨恨心',
-u'到了如今',
-u'蹈厲發揚',
-u'蹈厲奮發',
-u'刀利傷人指',
-u'蹈厲之志',
-u'刀林彈雨',
-u'倒廪傾囷',
-u'盜靈襯肩',
-u'盜鈴掩耳',
-u'道路側目',
-u'道路傳聞',
-u'道路各別',
-u'道路藉藉',
-u'道路相告',
-u'道路相望',
-u'道路以目',
-u'道路指目',
-u'道路之人',
-u'道路之言',
-u'道貌岸然',
-u'道貌凜然',
-u'道貌俨然',
-u'盜名暗世',
-u'盜名欺世',
-u'道謀築室',
-u'盜墓筆記',
-u'道旁苦李',
-u'道旁之築',
-u'蹈其覆轍',
-u'刀槍劍戟',
-u'刀槍入庫',
-u'刀槍藥雖好不破手爲高',
-u'盜竊公行',
-u'倒箧傾筐',
-u'倒箧傾囊',
-u'蹈刃不旋',
-u'蹈人舊轍',
-u'蹈仁履義',
-u'刀刃峽谷',
-u'刀刃之蜜',
-u'導入規約',
-u'道三不道兩',
-u'倒三顛四',
-u'盜嫂受金',
-u'刀山火海',
-u'刀山劍樹',
-u'倒山傾海',
-u'道山學海',
-u'到什麽山上唱什麽歌',
-u'到什麽時候說什麽話',
-u'道是無情卻有情',
-u'盜食緻飽',
-u'島瘦郊寒',
-u'道書禅機',
-u'刀樹劍山',
-u'倒四顛三',
-u'蹈湯赴火',
-u'道聽耳食',
-u'道聽途傳',
-u'道聽途說',
-u'道同契合',
-u'道同義合',
-u'道同志合',
-u'道頭會尾',
-u'道頭知尾',
-u'道微德薄',
-u'蹈危如平',
-u'道吾惡者是吾師',
-u'道吾好者是吾賊',
-u'道無拾遺',
-u'倒屣而迎',
-u'蹈襲覆轍',
-u'蹈襲前人',
-u'道西說東',
-u'倒屣相迎',
-u'倒屣迎賓',
-u'刀下留人',
-u'倒峽瀉河',
-u'倒心伏計',
-u'悼心疾首',
-u'悼心失圖',
-u'倒行逆施',
-u'搗虛敵随',
-u'搗虛批吭',
-u'搗虛批亢',
-u'搗虛撇抗',
-u'倒懸之厄',
-u'倒懸之患',
-u'倒懸之急',
-u'倒懸之苦',
-u'倒懸之危',
-u'道學先生',
-u'導以取保',
-u'盜亦有道',
-u'道義之交',
-u'倒因爲果',
-u'盜玉竊鈎',
-u'道遠任重',
-u'道遠日暮',
-u'道院僧堂終不如',
-u'道遠無輕載',
-u'道院迎仙客',
-u'道遠知骥',
-u'道遠知骥世僞知賢',
-u'盜怨主人',
-u'倒載幹戈',
-u'道在人爲',
-u'盜賊襯肩',
-u'盜賊出于貧窮',
-u'盜賊公行',
-u'盜賊天賦',
-u'盜賊營地',
-u'盜憎主人',
-u'道長說短',
-u'刀折矢盡',
-u'倒枕垂床',
-u'倒枕着床',
-u'倒植浮圖',
-u'倒置幹戈',
-u'倒執手版',
-u'盜跖之物',
-u'盜鍾掩耳',
-u'倒拽橫拖',
-u'刀錐之利',
-u'刀子嘴豆腐心',
-u'刀俎魚肉',
-u'刀俎馀生',
-u'刀鑽古怪',
-u'德備才全',
-u'德本财末',
-u'德薄才疏',
-u'德薄才鮮',
-u'德薄才庸',
-u'得薄能鮮',
-u'德薄任重',
-u'德薄望輕',
-u'德薄位尊',
-u'得不補失',
-u'得不償費',
-u'得不償喪',
-u'得不償失',
-u'德不稱位',
-u'得不酬失',
-u'得步進步',
-u'德才兼備',
-u'得财買放',
-u'德稱日盛',
-u'得尺得寸',
-u'得寵若驚',
-u'得寵思辱',
-u'得此失彼',
-u'得粗忘精',
-u'得寸得尺',
-u'得寸進尺',
-u'得寸觑尺',
-u'得寸入尺',
-u'得寸思尺',
-u'得寸則尺',
-u'得寸則寸',
-u'得當以報',
-u'得道多助',
-u'得道多助失道寡助',
-u'得而複失',
-u'得放手時須放手',
-u'得風便轉',
-u'得風就轉',
-u'得福不知',
-u'得高歌處且高歌',
-u'德高毀來',
-u'德高望重',
-u'得過且過',
-u'德國十一月革命',
-u'德厚流光',
-u'得江山助',
-u'得精忘粗',
-u'得隽之句',
-u'得君行道',
-u'得窺門徑',
-u'得來全不費工夫',
-u'得了顔色兒就開染房',
-u'得理不得勢',
-u'德涼才薄',
-u'得隴望蜀',
-u'德隆望重',
-u'德隆望尊',
-u'得馬折足',
-u'得馬生災',
-u'得馬失馬',
-u'得耐且耐',
-u'德配天地',
-u'得便宜賣乖',
-u'得其皮毛',
-u'得其三昧',
-u'得其死力',
-u'得其所哉',
-u'得錢買放',
-u'德淺行薄',
-u'得趣忘形',
-u'德全如醉',
-u'得全要領',
-u'德讓君子',
-u'得饒人處且饒人',
-u'得人錢财與人消災',
-u'得忍且忍',
-u'得人死力',
-u'得人爲枭',
-u'得人心者得天下',
-u'得人者昌',
-u'得人者昌失人者亡',
-u'德容功貌',
-u'德容兼備',
-u'德容言功',
-u'德劭年高',
-u'德深望重',
-u'得勝回朝',
-u'得勝頭回',
-u'得失參半',
-u'得失成敗',
-u'得失利病',
-u'得失榮枯',
-u'得時無怠',
-u'得失相半',
-u'得失在人',
-u'得售其奸',
-u'得獸失人',
-u'得手應心',
-u'得水蛟龍',
-u'得縮頭時且縮頭',
-u'得天獨厚',
-u'得天之厚',
-u'得兔忘蹄',
-u'德望日重',
-u'德威并施',
-u'德威并用',
-u'得未曾有',
-u'得未嘗有',
-u'德爲人表',
-u'得匣還珠',
-u'得新棄舊',
-u'得新忘故',
-u'得新忘舊',
-u'得新厭舊',
-u'得心應手',
-u'得休便休',
-u'得婿如龍',
-u'德言工貌',
-u'德言工容',
-u'德言容功',
-u'德洋恩普',
-u'德以報怨',
-u'得意門生',
-u'得意濃時便可休',
-u'得以氣勝',
-u'得意鼠鼠',
-u'德藝雙馨',
-u'得一望十',
-u'得一望十得十望百',
-u'得意忘象',
-u'得意忘形',
-u'得意忘言',
-u'得意揚揚',
-u'得意之筆',
-u'得意之鳴',
-u'得意之色',
-u'得意之作',
-u'德音莫違',
-u'得蔭忘身',
-u'德輶如毛',
-u'德輶如羽',
-u'得魚忘荃',
-u'得月較先',
-u'德之水精',
-u'得之易失之也易',
-u'德重恩弘',
-u'得衷合度',
-u'德尊望重',
-u'登崇俊良',
-u'登第之後',
-u'燈蛾撲火',
-u'等而上之',
-u'等而下之',
-u'登鋒履刃',
-u'登鋒陷陣',
-u'登峰造頂',
-u'登峰造極',
-u'登高必賦',
-u'登高博見',
-u'登高而招見者遠',
-u'登高履危',
-u'登高能賦',
-u'登高去梯',
-u'登高望遠',
-u'登高一呼',
-u'登高自卑',
-u'登高作賦',
-u'燈鬼之殼',
-u'燈紅酒綠',
-u'燈紅綠酒',
-u'燈火輝煌',
-u'燈火萬家',
-u'燈火熒煌',
-u'登界遊方',
-u'燈盡油幹',
-u'登科之喜',
-u'等禮相亢',
-u'等量齊觀',
-u'登樓望阙',
-u'等米下鍋',
-u'登明選公',
-u'瞪目哆口',
-u'瞪目結舌',
-u'登木求魚',
-u'澄沙汰礫',
-u'登山踄嶺',
-u'登山泛水',
-u'登山臨水',
-u'登山蓦嶺',
-u'登山涉水',
-u'登山小魯',
-u'登山越嶺',
-u'登山陟嶺',
-u'等身著述',
-u'等身著作',
-u'等式邏輯',
-u'等式系統',
-u'登手登腳',
-u'登台拜将',
-u'登壇拜将',
-u'登堂拜母',
-u'登堂入室',
-u'等閑人家',
-u'等閑人物',
-u'等閑視之',
-u'等閑之輩',
-u'等閑之人',
-u'瞪眼咋舌',
-u'等一大車',
-u'等夷之志',
-u'等因奉此',
-u'登庸納揆',
-u'等值連接',
-u'等值線圖',
-u'等之自郐',
-u'燈燭輝煌',
-u'低昂不就',
-u'抵背扼喉',
-u'地北天南',
-u'地崩山摧',
-u'敵變我變',
-u'砥兵砺伍',
-u'敵不可假',
-u'敵不可縱',
-u'地慘天愁',
-u'地慘天昏',
-u'地拆天崩',
-u'低唱淺斟',
-u'低唱淺酌',
-u'低唱微吟',
-u'地坼天崩',
-u'低沉咆哮',
-u'地醜德齊',
-u'地醜力敵',
-u'滴翠流香',
-u'地悴天荒',
-u'地大物博',
-u'地大物阜',
-u'地大物夥',
-u'地大物衆',
-u'滌蕩邪穢',
-u'低地荒野',
-u'滌地無類',
-u'地動山摧',
-u'地動山搖',
-u'地凍天寒',
-u'地肥鼠穴多',
-u'滴粉搓酥',
-u'谛分審布',
-u'砥鋒挺锷',
-u'地負海涵',
-u'地覆天翻',
-u'地縛圖騰',
-u'地府陰曹',
-u'地格方圓',
-u'地歌瀑布',
-u'滌垢洗瑕',
-u'蒂固根深',
-u'滌故更新',
-u'地廣民稀',
-u'地廣民衆',
-u'地廣人希',
-u'敵國通舟',
-u'敵國外患',
-u'敵國隐然',
-u'帝虎魯魚',
-u'棣華增映',
-u'低回不去',
-u'滌穢布新',
-u'低回不已',
-u'滌穢蕩瑕',
-u'敵惠敵怨',
-u'低級互斥',
-u'地脊民貧',
-u'低級趣味',
-u'地棘天荊',
-u'低級語言',
-u'地角方圓',
-u'地角天涯',
-u'砥節奉公',
-u'砥節勵行',
-u'砥節守公',
-u'诋盡流俗',
-u'地盡其利',
-u'地精暗雷',
-u'地精車手',
-u'地精飛艇',
-u'地精龍槍',
-u'地精炸彈',
-u'地久天長',
-u'敵忾同仇',
-u'地曠人稀',
-u'堤潰蟻孔',
-u'堤潰蟻穴',
-u'地闊天長',
-u'地老地荒',
-u'地老天荒',
-u'地老天昏',
-u'地雷沖擊',
-u'地雷裝備',
-u'地利不如人和',
-u'砥砺德行',
-u'砥砺風節',
-u'敵力角氣',
-u'砥厲廉隅',
-u'砥厲名号',
-u'砥砺名節',
-u'砥砺名行',
-u'砥砺清節',
-u'地利人和',
-u'砥砺琢磨',
-u'砥廉峻隅',
-u'地裂山崩',
-u'地靈矮人',
-u'地靈人傑',
-u'滴露研朱',
-u'低眉垂眼',
-u'低眉順眼',
-u'低眉下首',
-u'低眉下眼',
-u'低眉下意',
-u'低眉折腰',
-u'地面震擊',
-u'地滅天誅',
-u'砥名砺節',
-u'抵暮張燭',
-u'弟男子侄',
-u'帝辇之下',
-u'地痞流氓',
-u'地辟天開',
-u'砥平繩直',
-u'地平天成',
-u'低情曲意',
-u'地瓊山盡',
-u'羝乳得歸',
-u'低三下四',
-u'地上天宮',
-u'地上天官',
-u'砥身砺行',
-u'低聲悄語',
-u'低聲細語',
-u'低聲下氣',
-u'低聲啞氣',
-u'地勢便利',
-u'低首俯心',
-u'低首下氣',
-u'低首下心',
-u'低首心折',
-u'滴水不羼',
-u'滴水不漏',
-u'滴水成冰',
-u'滴水成凍',
-u'滴水成河',
-u'滴水成渠',
-u'滴水穿石',
-u'滴水難消',
-u'滴水石穿',
-u'底死謾生',
-u'地塌天荒',
-u'荻塘女子',
-u'低頭不見擡頭見',
-u'低頭耷腦',
-u'地頭地腦',
-u'低頭哈腰',
-u'低頭傾首',
-u'低頭喪氣',
-u'低頭下心',
-u'帝王寶石',
-u'帝王将相',
-u'敵王所忾',
-u'地網天羅',
-u'帝王之墓',
-u'帝王之座',
-u'地紋披風',
-u'地無三尺平',
-u'地無遺利',
-u'滌瑕蕩垢',
-u'滌瑕蕩穢',
-u'抵瑕蹈隙',
-u'地狹人稠',
-u'抵瑕陷厄',
-u'地嫌勢逼',
-u'地險俗殊',
-u'低心下氣',
-u'低心下意',
-u'遞興遞廢',
-u'帝幸東都',
-u'砥行立名',
-u'砥行磨名',
-u'羝羊觸藩',
-u'羝羊絓棘',
-u'低腰斂手',
-u'第一莫欺心',
-u'敵意平息',
-u'低吟淺唱',
-u'地獄變相',
-u'地遠山險',
-u'地在人種事在人爲',
-u'抵掌而談',
-u'抵掌談兵',
-u'砥志研思',
-u'敵衆我寡',
-u'地主之誼',
-u'砥柱中流',
-u'弟子孩兒',
-u'抵足而眠',
-u'抵足而卧',
-u'抵足談心',
-u'點兵排将',
-u'顛簸不破',
-u'典冊高文',
-u'電掣風馳',
-u'電掣星馳',
-u'顛唇簸舌',
-u'顛唇簸嘴',
-u'顛倒白黑',
-u'顛倒錯亂',
-u'顛倒幹坤',
-u'顛倒黑白',
-u'顛倒夢魂',
-u'顛倒乾坤',
-u'顛倒是非',
-u'顛倒妍媸',
-u'顛倒衣裳',
-u'顛倒陰陽',
-u'點滴歸公',
-u'顛顛癡癡',
-u'顛顛倒倒',
-u'點點搠搠',
-u'電鍍膜盤',
-u'點段搐搐',
-u'店多成市',
-u'點凡成聖',
-u'靛缸裏扯不出白布來',
-u'典诰大語',
-u'電光石火',
-u'電光朝露',
-u'電駭風馳',
-u'顛寒作熱',
-u'電荷沖擊',
-u'钿合金钗',
-u'電弧打擊',
-u'點化秘銀',
-u'點火成土',
-u'電火行空',
-u'掂腳舒腰',
-u'電角蜥蜴',
-u'顛斤播兩',
-u'點金成鐵',
-u'點金乏術',
-u'掂斤估兩',
-u'掂斤抹兩',
-u'點金無術',
-u'點金作鐵',
-u'點睛傳神',
-u'點睛之筆',
-u'電卷風馳',
-u'電卷星飛',
-u'點臘燭不知油價',
-u'顛來播去',
-u'顛來倒去',
-u'典麗堂皇',
-u'顛連窮困',
-u'顛連無告',
-u'電流星散',
-u'顛鸾倒鳳',
-u'點卯應名',
-u'顛毛種種',
-u'典谟訓诰',
-u'顛沛流離',
-u'點屏成蠅',
-u'顛撲不磨',
-u'顛撲不破',
-u'顛撲不碎',
-u'顛仆流離',
-u'點氣成火',
-u'典妻鬻子',
-u'顛乾倒坤',
-u'顛三倒四',
-u'電閃雷鳴',
-u'掂梢折本',
-u'典身賣命',
-u'點石成金',
-u'點石化金',
-u'點石化爲金',
-u'點石爲金',
-u'點手劃腳',
-u'點手莋腳',
-u'點水不漏',
-u'點水成氣',
-u'點水蜻蜓',
-u'點塔七層',
-u'殿堂樓閣',
-u'點鐵成金',
-u'顛頭播腦',
-u'點頭稱善',
-u'點頭稱是',
-u'點頭道是',
-u'癫頭癫腦',
-u'點頭哈腰',
-u'顛頭晃腦',
-u'點頭會意',
-u'顛頭聳腦',
-u'點頭咂嘴',
-u'點頭之交',
-u'點頭朱衣',
-u'阽危之域',
-u'簟紋如水',
-u'點胸洗眼',
-u'顛衣到裳',
-u'點一點二',
-u'阽于死亡',
-u'顛越不恭',
-u'典則俊雅',
-u'典章文物',
-u'電照風行',
-u'奠枕而卧',
-u'點陣精度',
-u'點指劃腳',
-u'點指畫字',
-u'點指莋腳',
-u'電子資金轉賬系統',
-u'掉臂不顧',
-u'雕冰畫脂',
-u'調兵遣将',
-u'貂不足狍尾續',
-u'貂蟬滿坐',
-u'貂蟬盈坐',
-u'雕蟲薄技',
-u'雕蟲刻篆',
-u'雕蟲末伎',
-u'雕蟲小技',
-u'雕蟲小巧',
-u'雕蟲小事',
-u'雕蟲小藝',
-u'雕蟲篆刻',
-u'吊膽驚心',
-u'吊膽提心',
-u'刁蹬用強',
-u'刁鬥森嚴',
-u'吊二郎當',
-u'刁風拐月',
-u'雕風镂月',
-u'雕肝镂腎',
-u'雕肝掐腎',
-u'雕肝琢膂',
-u'雕肝琢腎',
-u'吊鈎外套',
-u'貂狗相屬',
-u'吊古傷今',
-u'吊古尋幽',
-u'吊詭矜奇',
-u'雕蚶镂蛤',
-u'吊賀迎送',
-u'雕虎焦原',
-u'調虎離山',
-u'刁滑詭谲',
-u'刁滑奸詐',
-u'雕花刻葉',
-u'雕花皮靴',
-u'雕缋滿眼',
-u'刁健訟棍',
-u'吊腳兒事',
-u'雕金篆玉',
-u'刁決古嫶',
-u'吊拷繃扒',
-u'吊拷絣把',
-u'雕闌玉砌',
-u'雕梁畫棟',
-u'雕龍畫鳳',
-u'雕龍繡虎',
-u'雕龍炙輠',
-u'雕镂藻繪',
-u'雕甍畫棟',
-u'刁民惡棍',
-u'吊民伐罪',
-u'釣名沽譽',
-u'釣名欺世',
-u'釣名拾紫',
-u'釣名要譽',
-u'釣名之人',
-u'凋年景急',
-u'雕盤绮食',
-u'雕牆峻宇',
-u'貂裘換酒',
-u'吊喪問疾',
-u'掉舌鼓唇',
-u'刁聲浪氣',
-u'吊死扶傷',
-u'吊死問孤',
-u'吊死問疾',
-u'吊死問生',
-u'吊死唁生',
-u'雕塑曲面',
-u'刁天決地',
-u'掉頭不顧',
-u'掉頭弗顧',
-u'掉頭鼠竄',
-u'刁徒潑皮',
-u'雕文刻镂',
-u'雕文織采',
-u'調弦品竹',
-u'雕心刻腎',
-u'雕心雁爪',
-u'雕心鷹爪',
-u'吊形吊影',
-u'吊腰撒跨',
-u'掉以粗心',
-u'掉以輕心',
-u'雕楹碧檻',
-u'吊影自憐',
-u'釣遊之地',
-u'釣魚大師',
-u'釣譽沽名',
-u'雕玉雙聯',
-u'雕章繪句',
-u'雕章镂句',
-u'雕章缛彩',
-u'雕章缛句',
-u'雕章琢句',
-u'刁鑽促搯',
-u'刁鑽促狹',
-u'刁鑽古怪',
-u'刁鑽刻薄',
-u'掉嘴弄舌',
-u'叠出叠入',
-u'叠床架屋',
-u'碟大碗小難免磕着碰着',
-u'跌彈斑鸠',
-u'跌蕩不羁',
-u'跌蕩不拘',
-u'跌蕩放言',
-u'跌蕩風流',
-u'跌宕遒麗',
-u'跌宕昭彰',
-u'喋喋不休',
-u'喋喋不已',
-u'喋喋利口',
-u'跌而不振',
-u'疊二連三',
-u'蝶粉蜂黃',
-u'疊閣連樓',
-u'疊見層出',
-u'叠見雜出',
-u'跌腳絆手',
-u'跌腳捶胸',
-u'叠矩重規',
-u'鲽離鹣背',
-u'蝶戀蜂狂',
-u'疊嶺層巒',
-u'蝶亂蜂狂',
-u'蝶亂蜂喧',
-u'蝶使蜂媒',
-u'爹死娘嫁人各人顧各人',
-u'蝶舞莺歌',
-u'蹀躞不下',
-u'疊影危情',
-u'叠嶂層巒',
-u'鼎成龍去',
-u'鼎成龍升',
-u'鼎铛有耳',
-u'鼎铛玉石',
-u'丁寵家庭',
-u'釘刺沖鋒',
-u'釘刺獵弓',
-u'釘刺木闆',
-u'釘刺噴射',
-u'釘刺突擊',
-u'鼎鼎大名',
-u'丁丁當當',
-u'丁丁列列',
-u'定鼎訏谟',
-u'鼎鼎有名',
-u'鼎沸不絕',
-u'鼎分三足',
-u'頂風臭十裏',
-u'丁公被戮',
-u'定功行封',
-u'丁公鑿井',
-u'丁固生松',
-u'頂冠束帶',
-u'定光拳套',
-u'定國安邦',
-u'鼎湖龍去',
-u'鼎镬刀鋸',
-u'鼎镬如饴',
-u'釘擊魔杖',
-u'定計鋪謀',
-u'鼎力扶持',
-u'頂禮膜拜',
-u'鼎力提攜',
-u'鼎力相助',
-u'鼎力玉成',
-u'丁鈴當啷',
-u'定靈玉片',
-u'铤鹿走險',
-u'定亂扶衰',
-u'頂門立戶',
-u'頂門一針',
-u'頂門壯戶',
-u'頂名冒姓',
-u'頂名替身',
-u'定謀貴決',
-u'鼎鼐調和',
-u'丁娘十索',
-u'丁寧告戒',
-u'丁寧戒告',
-u'丁寧周至',
-u'定傾扶危',
-u'鼎折覆餗',
-u'鼎折餗覆',
-u'定身攻擊',
-u'鼎盛春秋',
-u'釘是釘鉚是鉚',
-u'鼎食鳴鍾',
-u'鼎食之家',
-u'鼎食鍾鳴',
-u'定數難逃',
-u'鼎水之沸',
-u'頂替冒名',
-u'頂天立地',
-u'頂天踵地',
-u'釘頭磷磷',
-u'鼎新革故',
-u'定省晨昏',
-u'定省溫清',
-u'丁一卯二',
-u'丁一确二',
-u'鼎玉龜符',
-u'鼎魚幕燕',
-u'定于一尊',
-u'鼎元之分',
-u'丁真楷草',
-u'頂針續麻',
-u'鼎峙而立',
-u'鼎峙而三',
-u'鼎峙之業',
-u'頂踵盡捐',
-u'頂踵捐糜',
-u'鼎中一脔',
-u'丁子有尾',
-u'鼎足而居',
-u'鼎足而立',
-u'鼎足而三',
-u'鼎足三分',
-u'鼎足之臣',
-u'鼎足之勢',
-u'釘嘴鐵舌',
-u'定罪之槌',
-u'丢丢秀秀',
-u'丢風撒腳',
-u'丢魂丢魄',
-u'丢魂喪膽',
-u'丢魂喪魄',
-u'丢魂失魄',
-u'丢盔抛甲',
-u'丢盔棄甲',
-u'丢盔卸甲',
-u'丢了西瓜揀芝麻',
-u'丢輪扯炮',
-u'丢帽落鞋',
-u'丢眉丢眼',
-u'丢眉擠眼',
-u'丢眉弄色',
-u'丢棄武器',
-u'丢人現眼',
-u'丢三落四',
-u'丢三忘四',
-u'丢失中斷處理程序',
-u'丢下耙兒弄掃帚',
-u'丢下武器',
-u'丢心落意',
-u'丢在腦後',
-u'丢卒保車',
-u'東挨西問',
-u'東挨西撞',
-u'東奔西波',
-u'東奔西竄',
-u'東奔西跑',
-u'東奔西逃',
-u'東奔西向',
-u'東奔西撞',
-u'東奔西走',
-u'東壁餘光',
-u'動必緣義',
-u'東壁之光',
-u'東邊日出西邊下雨',
-u'東播西流',
-u'冬不借衣夏不借扇',
-u'動不失時',
-u'東補西湊',
-u'東猜西揣',
-u'東猜西疑',
-u'東藏西躲',
-u'洞察其奸',
-u'洞察秋毫',
-u'洞察束帶',
-u'東差西誤',
-u'動常得咎',
-u'東抄西襲',
-u'東抄西轉',
-u'洞徹事理',
-u'東扯西拉',
-u'東扯西唠',
-u'東扯西拽',
-u'東成西就',
-u'冬吃蘿蔔夏吃姜',
-u'東馳西騁',
-u'東馳西擊',
-u'東馳西骛',
-u'東馳西撞',
-u'棟充牛汗',
-u'東沖西決',
-u'東沖西突',
-u'東沖西撞',
-u'東穿西撞',
-u'東床腹坦',
-u'東床佳婿',
-u'東床嬌客',
-u'東床姣婿',
-u'東床快婿',
-u'東窗事發',
-u'東窗事犯',
-u'東床坦腹',
-u'東闖西踱',
-u'東闖西走',
-u'東窗消息',
-u'東床擇對',
-u'東床之選',
-u'動詞短語',
-u'棟榱崩折',
-u'洞達事理',
-u'東打西椎',
-u'動憚不得',
-u'動蕩不安',
-u'動蕩不定',
-u'東蕩西馳',
-u'東蕩西除',
-u'東擋西殺',
-u'東蕩西遊',
-u'東倒西欹',
-u'東倒西歪',
-u'東道之誼',
-u'動地驚天',
-u'洞洞屬屬',
-u'洞洞惺惺',
-u'東躲西藏',
-u'東躲西跑',
-u'東躲西逃',
-u'動而得謗',
-u'動而若靜',
-u'東翻西倒',
-u'東翻西閱',
-u'東方不亮西方亮',
-u'洞房花燭',
-u'東方将白',
-u'東方千騎',
-u'東方聖人',
-u'東方兄弟',
-u'東風吹馬耳',
-u'東風過耳',
-u'東風浩蕩',
-u'東風化雨',
-u'東風料峭',
-u'東風馬耳',
-u'東風人面',
-u'東風入律',
-u'東風射馬耳',
-u'東封西款',
-u'東風壓倒西風',
-u'東扶西倒',
-u'東扶西傾',
-u'東觀續史',
-u'東觀之殃',
-u'東觀西望',
-u'東滾西爬',
-u'東郭先生',
-u'東郭之疇',
-u'東郭之迹',
-u'東海塵飛',
-u'東海鲸波',
-u'東海撈針',
-u'東海逝波',
-u'東海揚塵',
-u'冬寒抱冰',
-u'冬寒抱冰夏熱握火',
-u'東合待賢',
-u'恫喝虛聲',
-u'東橫西倒',
-u'冬烘頭腦',
-u'冬烘學究',
-u'董狐之筆',
-u'冬季酸菜',
-u'東家長西家短',
-u'東家夫子',
-u'東家孔子',
-u'東家西舍',
-u'東家效颦',
-u'洞見底裏',
-u'洞見底蘊',
-u'洞見肺腑',
-u'洞見肺肝',
-u'洞鑒廢興',
-u'洞見肝鬲',
-u'洞鑒古今',
-u'東箭南金',
-u'洞見其奸',
-u'東漸西被',
-u'洞見隐微',
-u'洞見幽微',
-u'動見臧否',
-u'洞見症結',
-u'凍結标記',
-u'凍解冰釋',
-u'動靜有常',
-u'動靜有法',
-u'東砍西斫',
-u'東磕西撞',
-u'洞口桃花也笑人',
-u'東诓西騙',
-u'東拉西扯',
-u'東來西去',
-u'東來紫氣',
-u'東攔西阻',
-u'東撈西摸',
-u'東勞西燕',
-u'棟梁崩壞',
-u'東量西折',
-u'棟梁之才',
-u'棟梁之器',
-u'棟梁之任',
-u'棟梁之用',
-u'東獵西漁',
-u'東鄰西家',
-u'東鄰西舍',
-u'東鱗西爪',
-u'東零西落',
-u'東零西散',
-u'東零西碎',
-u'東磂西逛',
-u'東流西落',
-u'東流西上',
-u'東馬嚴徐',
-u'東門黃犬',
-u'東門之達',
-u'東門之役',
-u'東門種瓜',
-u'東門逐兔',
-u'東覓西尋',
-u'東廟燒香西廟許願',
-u'東鳴西應',
-u'東抹西塗',
-u'冬幕大餐',
-u'東南半壁',
-u'東南雀飛',
-u'東南一尉西北一候',
-u'東南之寶',
-u'東南之美',
-u'東南之秀',
-u'東南竹箭',
-u'凍餒交迫',
-u'凍餒之患',
-u'凍餒之憂',
-u'東扭西捏',
-u'東怒西怨',
-u'冬暖夏清',
-u'東挪西辏',
-u'東挪西撮',
-u'東挪西貸',
-u'東挪西借',
-u'東跑西竄',
-u'東跑西顛',
-u'東碰西撞',
-u'東飄西泊',
-u'東飄西蕩',
-u'東飄西散',
-u'東飄西徙',
-u'東拼西湊',
-u'動魄驚心',
-u'凍浦魚驚',
-u'東牽西扯',
-u'東遷西徙',
-u'東牆處子',
-u'東牆大門',
-u'東牆窺宋',
-u'東牆哨塔',
-u'東牆之門',
-u'東牆之塔',
-u'東敲西逼',
-u'東瞧西望',
-u'冬裘夏葛',
-u'東趨西步',
-u'冬泉火酒',
-u'動人心脾',
-u'動人心魄',
-u'動人心弦',
-u'冬日黑裘',
-u'冬日可愛',
-u'冬日夏雲',
-u'冬日之溫',
-u'冬日之陽',
-u'動容周旋',
-u'動如參商',
-u'洞如觀火',
-u'動如雷霆',
-u'動如脫兔',
-u'洞如指掌',
-u'洞若觀火',
-u'動若脫兔',
-u'東三西四',
-u'東山複起',
-u'東山高卧',
-u'冬山如睡',
-u'東閃西躲',
-u'東閃西挪',
-u'冬扇夏爐',
-u'東山謝氏',
-u'東山再起',
-u'東山之志',
-u'棟折榱崩',
-u'棟折榱壞',
-u'東聲西擊',
-u'東施棒心',
-u'東市朝衣',
-u'凍石農場',
-u'東食西宿',
-u'東施效颦',
-u'東手接錢西手送',
-u'東搜西羅',
-u'東睃西望',
-u'動彈不得',
-u'東談西說',
-u'東逃西竄',
-u'東讨西伐',
-u'東逃西散',
-u'東讨西征',
-u'洞天福地',
-u'東眺西望',
-u'東投西竄',
-u'東偷西摸',
-u'東塗西抹',
-u'東兔西烏',
-u'東歪西倒',
-u'東完西缺',
-u'動罔不吉',
-u'東望西觀',
-u'動惟厥時',
-u'冬溫夏凊',
-u'洞無城府',
-u'東骛西馳',
-u'洞悉底蘊',
-u'洞悉兜帽',
-u'東曦既駕',
-u'東曦既上',
-u'東西南北',
-u'東西南北客',
-u'東西南北人',
-u'東西南朔',
-u'洞悉其奸',
-u'洞悉無遺',
-u'東徙西遷',
-u'洞犀項鏈',
-u'東西易面',
-u'冬夏青青',
-u'東挦西扯',
-u'東向而望不見西牆',
-u'動心怵目',
-u'洞心駭耳',
-u'動心駭目',
-u'動心駭聽',
-u'動心驚魄',
-u'動心忍性',
-u'動心娛目',
-u'東行西步',
-u'東行西走',
-u'棟朽榱崩',
-u'洞穴麥酒',
-u'東踅西倒',
-u'洞穴震顫',
-u'動循矩法',
-u'東尋西覓',
-u'東掩西遮',
-u'東洋大海',
-u'東揚西蕩',
-u'東央西告',
-u'東央西浼',
-u'東搖西擺',
-u'東搖西蕩',
-u'東野巴人',
-u'東野敗駕',
-u'冬夜法袍',
-u'東一榔頭西一棒子',
-u'東一耙子西一掃帚',
-u'恫疑虛猲',
-u'恫疑虛喝',
-u'洞隐燭微',
-u'洞幽察微',
-u'東幽蘭谷',
-u'東遊西蕩',
-u'東遊西逛',
-u'洞幽燭微',
-u'洞幽燭遠',
-u'東隅已逝',
-u'東隅已逝桑榆非晚',
-u'東園秘密',
-u'東怨西怒',
-u'東月廢墟',
-u'冬箑夏爐',
-u'冬箑夏裘',
-u'東瞻西望',
-u'東張西觑',
-u'東張西望',
-u'東張西張',
-u'動辄得咎',
-u'動辄見咎',
-u'東遮西掩',
-u'東征西讨',
-u'東征西怨',
-u'冬至後至清明',
-u'東指西畫',
-u'東指西殺',
-u'東支西吾',
-u'動之以情',
-u'洞中方七日世上已千年',
-u'動中肯綮',
-u'動中窾要',
-u'動中窽要',
-u'動衆興兵',
-u'洞燭底蘊',
-u'洞燭其奸',
-u'洞燭先機',
-u'東轉西轉',
-u'東走西顧',
-u'東走西移',
-u'東走西撞',
-u'東撙西節',
-u'東作西成',
-u'鬥敗公雞',
-u'陡壁懸崖',
-u'鬥杓東指',
-u'鬥杓轉勢',
-u'鬥柄指東',
-u'鬥草簪花',
-u'鬥重山齊',
-u'豆重榆瞑',
-u'鬥唇合舌',
-u'鬥大金印',
-u'鬥大字不識一升',
-u'饾饤堆砌',
-u'兜兜搭搭',
-u'兜肚連腸',
-u'鬥而鑄兵',
-u'鬥而鑄錐',
-u'鬥方名士',
-u'豆分瓜剖',
-u'豆付掉到灰堆裏',
-u'豆腐是水閻王是鬼',
-u'豆付一方扁擔一條',
-u'鬥怪争奇',
-u'鬥斛之祿',
-u'鬥換星移',
-u'鬥雞養狗',
-u'鬥雞走狗',
-u'鬥雞走馬',
-u'鬥雞走犬',
-u'鬥酒百篇',
-u'鬥酒雙柑',
-u'鬥酒學士',
-u'鬥酒隻雞',
-u'鬥絶一隅',
-u'豆蔻詞工',
-u'豆蔻年華',
-u'豆蔻之年',
-u'鬥力不如鬥智',
-u'鬥麗争妍',
-u'鬥量車載',
-u'鬥量明珠',
-u'鬥量筲計',
-u'鬥美誇麗',
-u'鬥媚争妍',
-u'鬥米尺布',
-u'鬥靡誇多',
-u'鬥米十肉',
-u'鬥南一人',
-u'豆棚瓜架',
-u'豆剖瓜分',
-u'豆萁燃豆',
-u'豆萁相煎',
-u'鬥巧争奇',
-u'鬥巧争新',
-u'鬥色争妍',
-u'鬥山安仰',
-u'豆觞之會',
-u'鬥筲穿窬',
-u'鬥筲小器',
-u'鬥筲小人',
-u'鬥筲之輩',
-u'鬥筲之才',
-u'鬥筲之器',
-u'鬥筲之人',
-u'鬥筲之徒',
-u'鬥筲之役',
-u'鬥筲之子',
-u'鬥升之祿',
-u'鬥升之水',
-u'鬥室生輝',
-u'都是随人說短長',
-u'鬥霜傲雪',
-u'鬥水活鱗',
-u'抖摟精神',
-u'鬥粟尺布',
-u'鬥粟囊金',
-u'鬥榫合縫',
-u'兜頭蓋腦',
-u'鬥牙拌齒',
-u'鬥豔争芳',
-u'鬥豔争輝',
-u'鬥豔争妍',
-u'鬥挹箕揚',
-u'都俞籲咈',
-u'鬥折蛇行',
-u'鬥志昂揚',
-u'鬥志鬥力',
-u'鬥轉參斜',
-u'鬥轉參橫',
-u'鬥轉星移',
-u'逗嘴皮子',
-u'獨霸一方',
-u'杜弊清源',
-u'都鄙有章',
-u'獨步當世',
-u'讀不舍手',
-u'獨步天下',
-u'獨步一時',
-u'妒财莫妒食',
-u'賭彩一擲',
-u'毒草汁液',
-u'賭長較短',
-u'度長絜短',
-u'毒腸之藥',
-u'都城紙貴',
-u'獨吃自屙',
-u'獨吃自呵',
-u'獨出己見',
-u'獨出機杼',
-u'獨出手眼',
-u'獨出心裁',
-u'獨出一時',
-u'獨創一格',
-u'毒刺射擊',
-u'獨此一家',
-u'獨此一家別無分店',
-u'獨膽英雄',
-u'獨當一面',
-u'獨到之處',
-u'獨到之見',
-u'度德而讓',
-u'度德而師',
-u'獨得之見',
-u'獨得之秘',
-u'笃定泰山',
-u'嘟嘟哝哝',
-u'獨斷獨行',
-u'杜斷房謀',
-u'獨斷專行',
-u'杜耳惡聞',
-u'笃而論之',
-u'妒富愧貧',
-u'獨夫民賊',
-u'毒賦賸斂',
-u'毒婦心似鶴頂紅',
-u'獨根孤種',
-u'妒功忌能',
-u'蠹國病民',
-u'蠹國殘民',
-u'蠹國害民',
-u'蠹國耗民',
-u'蠹國嚼民',
-u'蠹國殃民',
-u'獨鶴雞群',
-u'渡河香象',
-u'渡河自有撐篙人',
-u'渎貨無厭',
-u'睹幾而作',
-u'蠹簡殘編',
-u'獨繭抽絲',
-u'杜漸除微',
-u'獨見獨知',
-u'杜漸防萌',
-u'杜漸防微',
-u'杜漸消萌',
-u'蠹簡遺編',
-u'獨見之慮',
-u'獨見之明',
-u'渡江亡楫',
-u'獨角天狼',
-u'獨角玉墜',
-u'笃近舉遠',
-u'讀盡王叔和不如臨證多',
-u'睹景傷情',
-u'獨具會心',
-u'獨具匠心',
-u'獨具冷眼',
-u'蠹居棊處',
-u'獨具一格',
-u'獨具隻眼',
-u'杜鵑啼血',
-u'杜絕後患',
-u'杜絕人事',
-u'杜絕言路',
-u'獨開生面',
-u'獨開蹊徑',
-u'杜口裹足',
-u'杜口結舌',
-u'杜口絕舌',
-u'杜口絕言',
-u'杜口木舌',
-u'杜口吞聲',
-u'杜口無言',
-u'獨來獨往',
-u'獨攬大權',
-u'獨立不群',
-u'肚裏躊躇',
-u'肚裏打稿',
-u'肚裏蛔蟲',
-u'肚裏淚下',
-u'肚裏落淚',
-u'獨力難成',
-u'獨力難支',
-u'獨立自主',
-u'度量宏大',
-u'毒燎虐焰',
-u'毒龍惡霧',
-u'笃論高言',
-u'獨馬單槍',
-u'睹貌獻飧',
-u'杜門不出',
-u'杜門晦迹',
-u'杜門絕迹',
-u'杜門絕客',
-u'杜門面壁',
-u'杜門屏迹',
-u'杜門卻掃',
-u'杜門塞窦',
-u'杜門謝客',
-u'杜門齚舌',
-u'杜門自絕',
-u'杜門自守',
-u'蠹民梗政',
-u'肚明心知',
-u'毒魔狠怪',
-u'杜默爲詩',
-u'獨木不成林',
-u'獨木不林',
-u'犢牧采薪',
-u'獨木難成林',
-u'獨木難支',
-u'妒能害賢',
-u'獨拍無聲',
-u'獨排衆議',
-u'獨辟町徑',
-u'獨辟町畦',
-u'獨辟畦徑',
-u'獨辟蹊徑',
-u'獨辟新界',
-u'賭錢場上無父子',
-u'杜牆不出',
-u'獨清獨醒',
-u'杜秋之年',
-u'度人金針',
-u'度日如年',
-u'堵塞漏卮',
-u'獨擅其美',
-u'獨善其身',
-u'獨善吾身',
-u'獨善一身',
-u'獨善自養',
-u'毒殇怨靈',
-u'賭神發咒',
-u'獨是獨非',
-u'賭誓發原',
-u'笃實好學',
-u'度時揆勢',
-u'度時審勢',
-u'讀史使人明志',
-u'睹始知終',
-u'毒手尊前',
-u'毒手尊拳',
-u'讀書百遍其義自見',
-u'讀書得間',
-u'讀書破萬卷',
-u'讀書破萬卷下筆如有神',
-u'讀書三到',
-u'肚束三蔑',
-u'讀書三餘',
-u'讀書須用意',
-u'讀書養性',
-u'獨樹一家',
-u'獨樹一幟',
-u'度體裁衣',
-u'都頭異姓',
-u'度外之人',
-u'度外置之',
-u'獨往獨來',
-u'杜微慎防',
-u'睹微知顯',
-u'睹微知著',
-u'睹物懷人',
-u'獨無聊賴',
-u'黩武窮兵',
-u'睹物傷情',
-u'賭物思人',
-u'睹物興悲',
-u'睹物興情',
-u'杜隙防微',
-u'獨弦哀歌',
-u'妒賢嫉能',
-u'笃新怠舊',
-u'笃信好古',
-u'笃信好學',
-u'笃行不倦',
-u'獨行獨斷',
-u'獨醒獨清',
-u'度形而衣',
-u'獨行踽踽',
-u'獨行君子',
-u'獨行其道',
-u'獨行其是',
-u'獨行特立',
-u'笃學不倦',
-u'獨學孤陋',
-u'獨學寡聞',
-u'笃學好古',
-u'獨一無二',
-u'獨異于人',
-u'睹影知竿',
-u'獨遊偶影',
-u'獨有千古',
-u'獨有千秋',
-u'杜郵之賜',
-u'杜郵之戮',
-u'獨運匠心',
-u'獨占鳌頭',
-u'睹着知微',
-u'蠹政病民',
-u'蠹政害民',
-u'蠹政虐民',
-u'笃志愛古',
-u'笃志好學',
-u'獨知之契',
-u'蠹衆木折',
-u'睹終原始',
-u'都中紙貴',
-u'賭咒發誓',
-u'獨杼己見',
-u'睹著知微',
-u'蠹啄剖梁柱',
-u'獨子得惜',
-u'獨自機杼',
-u'獨自樂樂',
-u'獨自茕茕',
-u'肚子疼怨竈王爺',
-u'獨坐愁城',
-u'斷鳌立極',
-u'斷背崗哨',
-u'斷背小徑',
-u'端本澄源',
-u'端本清源',
-u'端本正源',
-u'斷璧殘圭',
-u'斷壁殘垣',
-u'斷壁殘璋',
-u'斷臂燃身',
-u'斷壁頹垣',
-u'斷編殘簡',
-u'短兵接戰',
-u'短兵相接',
-u'斷不可信',
-u'斷钗重合',
-u'斷長補短',
-u'斷腸消魂',
-u'斷長續短',
-u'短吃少穿',
-u'斷楮零缣',
-u'短刀直入',
-u'端點編碼',
-u'斷脰決腹',
-u'斷斷繼繼',
-u'斷斷休休',
-u'斷斷續續',
-u'斷而敢行',
-u'斷發請戰',
-u'斷發文身',
-u'斷幅殘紙',
-u'斷凫續鶴',
-u'斷港絕潢',
-u'斷根絕種',
-u'斷梗飛蓬',
-u'斷梗浮萍',
-u'短绠汲深',
-u'斷梗流蓬',
-u'斷梗流萍',
-u'斷梗飄蓬',
-u'斷梗飄萍',
-u'斷骨圓盾',
-u'斷怪除妖',
-u'斷管殘沈',
-u'斷珪缺璧',
-u'斷圭碎璧',
-u'短褐不全',
-u'短褐不完',
-u'短褐穿結',
-u'斷鶴繼凫',
-u'短褐椎結',
-u'斷乎不可',
-u'斷還歸宗',
-u'斷潢絕港',
-u'斷虀畫粥',
-u'斷機教子',
-u'斷齑塊粥',
-u'短見薄識',
-u'斷簡殘編',
-u'斷缣殘楮',
-u'斷簡陳編',
-u'斷缣尺楮',
-u'斷缣寸紙',
-u'斷缣零璧',
-u'斷缣片紙',
-u'斷簡遺編',
-u'斷蛟刺虎',
-u'斷金零粉',
-u'短斤少兩',
-u'斷金亭子',
-u'斷金之交',
-u'斷井頹垣',
-u'斷絕來往',
-u'斷決如流',
-u'斷絕往來',
-u'斷爛朝報',
-u'斷纜開舵',
-u'端老窩兒',
-u'斷流絕港',
-u'斷矛路口',
-u'斷墨殘楮',
-u'斷木掘地',
-u'斷難從命',
-u'端倪可察',
-u'斷蓬泛梗',
-u'短鞘套長刀',
-u'斷然不可',
-u'斷然處置',
-u'端然無恙',
-u'端人家碗受人家管',
-u'端人正士',
-u'斷事如神',
-u'斷事以理',
-u'短壽促命',
-u'斷首捐軀',
-u'斷首騎兵',
-u'斷手續玉',
-u'短歎長籲',
-u'斷頭将軍',
-u'斷頭将茄',
-u'斷位連噴',
-u'斷位飄移',
-u'斷尾雄雞',
-u'斷無此理',
-u'斷席別坐',
-u'斷線風筝',
-u'斷線偶戲',
-u'斷線鹞子',
-u'斷弦再續',
-u'斷線珍珠',
-u'斷香零玉',
-u'短小精辯',
-u'短小精幹',
-u'短小精悍',
-u'斷袖分桃',
-u'斷袖餘桃',
-u'斷袖之寵',
-u'斷袖之好',
-u'斷袖之歡',
-u'斷袖之癖',
-u'斷袖之契',
-u'短籲長歎',
-u'斷雁孤鴻',
-u'端妍絕倫',
-u'端陽有雨是豐年',
-u'斷幺絕六',
-u'短衣匹馬',
-u'短衣窄袖',
-u'斷雨殘雲',
-u'斷羽絕鱗',
-u'斷垣殘壁',
-u'短垣自逾',
-u'斷雲零雨',
-u'斷章截句',
-u'斷章取義',
-u'斷章摘句',
-u'短章醉墨',
-u'短針攻疽',
-u'斷織勸學',
-u'斷紙馀墨',
-u'斷織之誡',
-u'短中取長',
-u'斷竹續竹',
-u'斷杼擇鄰',
-u'斷子絕孫',
-u'堆案積幾',
-u'堆案盈幾',
-u'對病用藥',
-u'對薄公堂',
-u'對薄公庭',
-u'對簿公堂',
-u'對床風雨',
-u'對床聽語',
-u'對床聞雨',
-u'對床夜語',
-u'對答如流',
-u'對地平衡',
-u'堆垛陳腐',
-u'堆垛死屍',
-u'堆幾積案',
-u'堆集如山',
-u'隊間二十五步',
-u'堆金叠玉',
-u'堆金積帛',
-u'堆金積玉',
-u'堆金累玉',
-u'對景挂畫',
-u'對景傷懷',
-u'對景傷情',
-u'對酒當歌',
-u'對客揮毫',
-u'對驢彈琴',
-u'對面不見人',
-u'對面不識',
-u'對牛鼓簧',
-u'對牛彈琴',
-u'堆山積海',
-u'堆山塞海',
-u'對天長歎',
-u'對天發誓',
-u'對頭冤家',
-u'對證處方',
-u'對症發藥',
-u'對症良劑',
-u'對證下藥',
-u'對症用藥',
-u'對症之藥',
-u'對嘴對舌',
-u'敦本務實',
-u'敦本正源',
-u'頓挫抑揚',
-u'鈍刀不入嫩肉',
-u'鈍刀慢剮',
-u'鈍刀切物',
-u'敦風厲俗',
-u'頓腹之言',
-u'頓綱振紀',
-u'遁光不耀',
-u'敦厚溫柔',
-u'遁迹藏名',
-u'遁迹方外',
-u'遁迹黃冠',
-u'遁迹空門',
-u'遁迹匿影',
-u'遁迹潛形',
-u'遁迹桑門',
-u'遁迹銷聲',
-u'頓腳捶胸',
-u'頓開茅塞',
-u'頓口無言',
-u'鈍口拙腮',
-u'炖陸行鳥',
-u'遁名改作',
-u'遁名匿迹',
-u'敦默寡言',
-u'敦睦邦交',
-u'敦龐之樸',
-u'遁入空門',
-u'遁身遠迹',
-u'遁世長往',
-u'遁世絕俗',
-u'遁世離群',
-u'遁世離俗',
-u'敦詩說禮',
-u'遁世無悶',
-u'遁世遺榮',
-u'遁世隐居',
-u'遁世幽居',
-u'遁世重腕',
-u'頓首百拜',
-u'頓首再拜',
-u'遁俗無悶',
-u'遁天倍情',
-u'遁天妄行',
-u'遁天之刑',
-u'惇信明義',
-u'遁形遠世',
-u'鈍學累功',
-u'遁逸無悶',
-u'遁陰匿景',
-u'鈍爪幼貓',
-u'頓足不前',
-u'頓足捶胸',
-u'頓足搓手',
-u'頓足搥胸',
-u'頓足捩耳',
-u'頓足失色',
-u'頓足椎胸',
-u'多病多愁',
-u'多病多災',
-u'多病能醫',
-u'多不勝數',
-u'多材多巧',
-u'多才多藝',
-u'多采多姿',
-u'多才豐藝',
-u'多财善賈',
-u'多才爲累',
-u'多才子建',
-u'多藏厚亡',
-u'度長絜大',
-u'多愁多病',
-u'多愁善病',
-u'多愁善感',
-u'多此一舉',
-u'多此一事',
-u'奪戴憑席',
-u'多道散說',
-u'多得不如少得',
-u'躲得和尚躲不得寺',
-u'度德量力',
-u'多端寡要',
-u'咄咄逼人',
-u'咄咄不樂',
-u'咄咄怪事',
-u'躲躲閃閃',
-u'咄咄書空',
-u'多多益辦',
-u'多多益善',
-u'多多益嗜',
-u'掇而不跂',
-u'堕珥遺簪',
-u'多方百計',
-u'多方句容',
-u'多方牽掣',
-u'多方招撫',
-u'多費口舌',
-u'多分辨率',
-u'多富自求',
-u'多功能光',
-u'多蠱多妒',
-u'剁骨屠夫',
-u'多故之秋',
-u'多寡不計',
-u'掇乖弄俏',
-u'多管閑事',
-u'多懷顧望',
-u'奪魂怒吼',
-u'堕溷飄茵',
-u'多計無斷',
-u'度己以繩',
-u'多見多聞',
-u'多贱寡貴',
-u'多見廣識',
-u'多見阕殆',
-u'咄嗟便辦',
-u'咄嗟叱咤',
-u'咄嗟可辦',
-u'咄嗟立辦',
-u'咄嗟之間',
-u'多金善賈',
-u'奪錦之才',
-u'奪錦之人',
-u'掇菁撷華',
-u'多可少怪',
-u'堕坑落塹',
-u'多口阿師',
-u'多口饒舌',
-u'多快好省',
-u'奪眶而出',
-u'躲了初一躲不了十五',
-u'躲了雷公遇了霹靂',
-u'多壘之秋',
-u'多力豐筋',
-u'多曆年代',
-u'多曆年稔',
-u'多曆年世',
-u'多曆年所',
-u'奪利争名',
-u'多露之嫌',
-u'多媒體個人計算機',
-u'奪門而出',
-u'奪命射擊',
-u'多謀善斷',
-u'多謀善慮',
-u'多謀少斷',
-u'多謀少決',
-u'多謀足智',
-u'多難興邦',
-u'多難之秋',
-u'多能多藝',
-u'奪泥燕口',
-u'多年母女成姐妹',
-u'奪魄冥獅',
-u'堕其計中',
-u'堕其奸計',
-u'堕其術中',
-u'奪其談經',
-u'多歧亡羊',
-u'多歧援喻',
-u'多錢善賈',
-u'多情多感',
-u'多情多義',
-u'多情善感',
-u'掇青拾紫',
-u'多情易感',
-u'多情總被無情惱',
-u'奪取礦洞',
-u'奪人所好',
-u'多如繁星',
-u'多如恒沙',
-u'多如牛毛',
-u'多少少年亡',
-u'度身而衣',
-u'堕神聖地',
-u'多事逞才',
-u'多事多患',
-u'多識君子',
-u'多士盈庭',
-u'掇拾章句',
-u'多事之秋',
-u'多收并蓄',
-u'多壽多富',
-u'多手多腳',
-u'多梳發亂',
-u'奪胎換骨',
-u'掇臀捧屁',
-u'多歪多妒',
-u'多聞博識',
-u'多聞強記',
-u'多聞阕疑',
-u'多文爲富',
-u'多務之秋',
-u'奪席談經',
-u'多心傷感',
-u'多行不義必自斃',
-u'多兇少吉',
-u'多許少與',
-u'多言多敗',
-u'多言多語',
-u'多言繁稱',
-u'多言或中',
-u'多言數窮',
-u'多言招悔',
-u'朵頤稱快',
-u'朵頤大嚼',
-u'多藝多才',
-u'多易多難',
-u'多疑少決',
-u'多一事不如少一事',
-u'多一事不如省一事',
-u'多義文法',
-u'多疑無決',
-u'躲雨跳到河裏',
-u'多魚之漏',
-u'堕雲霧中',
-u'多災多難',
-u'多則半月少則十天',
-u'堕甑不顧',
-u'堕指裂膚',
-u'多知爲雜',
-u'奪朱惡紫',
-u'多姿多采',
-u'多子多累',
-u'多嘴擦舌',
-u'多嘴多舌',
-u'多嘴饒舌',
-u'多嘴獻淺',
-u'扼肮拊背',
-u'搤臂齧指',
-u'惡必早亡',
-u'惡茶白賴',
-u'惡塵無染',
-u'鳄齒利斧',
-u'額蹙心痛',
-u'鵝存禮廢',
-u'阿黨比周',
-u'阿黨相爲',
-u'噩噩渾渾',
-u'峨峨湯湯',
-u'遏惡揚善',
-u'峨峨洋洋',
-u'谔谔以昌',
-u'谔谔之臣',
-u'谔谔之友',
-u'惡風惡雨',
-u'惡婦令夫敗',
-u'峨冠博帶',
-u'惡貫禍盈',
-u'惡貫久盈',
-u'惡貫滿盈',
-u'惡貫已盈',
-u'惡鬼前哨',
-u'餓鬼投胎',
-u'扼喉撫背',
-u'惡虎不食子',
-u'餓虎攢羊',
-u'餓虎饑鷹',
-u'餓虎見羊',
-u'餓虎撲食',
-u'餓虎撲羊',
-u'餓虎擒羊',
-u'餓虎吞羊',
-u'鵝湖之會',
-u'餓虎之蹊',
-u'惡化有餘',
-u'惡積禍盈',
-u'惡籍盈指',
-u'惡迹昭着',
-u'惡迹昭著',
-u'惡極罪大',
-u'遏漸防萌',
-u'扼襟控咽',
-u'屙金溺銀',
-u'扼亢拊背',
-u'扼吭奪食',
-u'扼吭拊背',
-u'惡口傷人',
-u'餓狼饑虎',
-u'餓狼之口',
-u'惡龍不鬥地頭蛇',
-u'鵝籠書生',
-u'鵝毛大雪',
-u'蛾眉倒豎',
-u'蛾眉皓齒',
-u'蛾眉曼睩',
-u'蛾眉螓首',
-u'噩夢醒來是早晨',
-u'遏密八音',
-u'惡名遠揚',
-u'婀娜多姿',
-u'餓殍遍地',
-u'餓莩遍野',
-u'餓殍滿道',
-u'餓莩填壑',
-u'餓莩載道',
-u'餓殍枕藉',
-u'蛾撲燈蕊',
-u'阿其所好',
-u'阿權膴仕',
-u'惡稔惡盈',
-u'惡稔貫盈',
-u'惡稔禍盈',
-u'惡人須用惡人磨',
-u'惡人自有惡人磨',
-u'惡稔罪盈',
-u'惡聲惡氣',
-u'惡聲狼籍',
-u'惡事傳千裏',
-u'阿世盜名',
-u'惡濕居下',
-u'阿世媚俗',
-u'惡事莫爲',
-u'阿世取容',
-u'阿時趨俗',
-u'惡事行千裏',
-u'額首稱慶',
-u'額手稱頌',
-u'蛾首蛾眉',
-u'額手加禮',
-u'額手慶幸',
-u'額手相慶',
-u'餓死莫做賊',
-u'餓死事大',
-u'餓死事小',
-u'餓死事小失節事大',
-u'扼腕長歎',
-u'扼腕抵掌',
-u'扼腕歎息',
-u'扼腕興嗟',
-u'鵝王擇乳',
-u'惡向膽邊生',
-u'鹗心鹂舌',
-u'惡性毒藥',
-u'惡性循環',
-u'鵝行鴨步',
-u'訛言謊語',
-u'訛言惑衆',
-u'餓眼見瓜皮',
-u'惡言詈辭',
-u'惡言厲色',
-u'惡言潑語',
-u'惡衣薄食',
-u'訛以傳訛',
-u'惡衣粗食',
-u'惡衣惡食',
-u'惡衣菲食',
-u'惡衣粝食',
-u'阿意取容',
-u'惡衣蔬食',
-u'阿意順旨',
-u'惡意中傷',
-u'訛以滋訛',
-u'惡盈釁滿',
-u'惡有惡報',
-u'阿谀谄媚',
-u'阿谀承迎',
-u'阿谀奉承',
-u'阿谀逢迎',
-u'阿谀苟合',
-u'阿谀求容',
-u'阿谀曲從',
-u'阿谀取容',
-u'惡語傷人',
-u'惡語傷人恨不消',
-u'阿谀順情',
-u'阿谀順意',
-u'阿谀順旨',
-u'惡語相加',
-u'惡語易施',
-u'惡語中傷',
-u'惡緣惡業',
-u'遏雲繞梁',
-u'惡則墜諸',
-u'惡直醜正',
-u'惡之欲其',
-u'阿尊事貴',
-u'恩愛夫妻不到頭',
-u'恩不放債',
-u'恩賜之錘',
-u'摁倒葫蘆起了瓢',
-u'恩德如山',
-u'恩斷義絕',
-u'恩多成怨',
-u'恩恩相愛',
-u'恩恩相報',
-u'恩高義厚',
-u'恩将仇報',
-u'恩将恩報',
-u'恩将恩報仇将仇還',
-u'恩絕義斷',
-u'恩禮寵異',
-u'恩禮有加',
-u'恩情似海',
-u'恩榮并濟',
-u'恩若再生',
-u'恩山義海',
-u'恩深愛重',
-u'恩深法弛',
-u'恩深似海',
-u'恩深義重',
-u'恩甚怨生',
-u'恩同父母',
-u'恩同山嶽',
-u'恩同再生',
-u'恩同再造',
-u'恩威并濟',
-u'恩威并行',
-u'恩威并用',
-u'恩威并重',
-u'恩威并著',
-u'恩威兼濟',
-u'恩有重報',
-u'恩逾慈母',
-u'恩怨分明',
-u'恩怨了了',
-u'恩重丘山',
-u'恩重如山',
-u'恩重似山',
-u'恩重泰山',
-u'迩安遠懷',
-u'迩安遠至',
-u'二八佳人',
-u'二八年華',
-u'二八女郎',
-u'二鮑糾慝',
-u'二碑紀功',
-u'耳邊清淨',
-u'耳邊之風',
-u'耳鬓厮磨',
-u'耳鬓相磨',
-u'而不見輿薪',
-u'耳不旁聽',
-u'耳不忍聞',
-u'兒不嫌母醜狗不嫌家貧',
-u'二次三番',
-u'耳聰目明',
-u'兒大不由爹',
-u'兒大不由爺',
-u'兒大三分客',
-u'二帝三王',
-u'耳朵裏冒出腳來',
-u'耳朵起繭',
-u'耳朵是棉花做的',
-u'耳而目之',
-u'爾俸爾祿',
-u'二佛涅槃',
-u'二佛升天',
-u'二缶鍾惑',
-u'耳根幹淨',
-u'耳根清靜',
-u'耳根子軟',
-u'二鼓衰氣餒如兔',
-u'耳紅面赤',
-u'耳後生風',
-u'二虎相鬥',
-u'二虎相鬥必有一傷',
-u'二話不說',
-u'二惠競爽',
-u'而今而後',
-u'珥金拖紫',
-u'二俱亡羊',
-u'二拉八當',
-u'而立之年',
-u'二龍捧珠',
-u'二龍騰飛',
-u'二龍戲珠',
-u'耳聾眼黑',
-u'耳聾眼花',
-u'耳聾眼瞎',
-u'二馬一虎',
-u'耳滿鼻滿',
-u'二滿三平',
-u'二毛潘嶽',
-u'餌名釣祿',
-u'耳鳴目眩',
-u'耳目閉塞',
-u'耳目傳情',
-u'耳目導心',
-u'耳目非是',
-u'耳目更新',
-u'耳目股肱',
-u'耳目濡染',
-u'耳目所及',
-u'耳目心腹',
-u'耳目一新',
-u'耳目昭彰',
-u'耳目之官',
-u'耳目之司',
-u'耳目之欲',
-u'耳目衆多',
-u'二難推理',
-u'兒女成行',
-u'兒女夫妻',
-u'兒女情長',
-u'兒女情長英雄氣短',
-u'兒女情多',
-u'兒女親家',
-u'兒女心腸',
-u'兒女之情',
-u'兒女之态',
-u'兒女之債',
-u'耳染目濡',
-u'耳熱酒酣',
-u'耳熱眼花',
-u'二人同心',
-u'二人同心其利斷金',
-u'耳濡目染',
-u'爾汝之交',
-u'耳軟心活',
-u'二三君子',
-u'二三其操',
-u'二三其德',
-u'二三其節',
-u'二三其心',
-u'二三其意',
-u'二三其志',
-u'二三物外友',
-u'而勝于藍',
-u'耳食不化',
-u'耳食目論',
-u'耳視目食',
-u'耳視目聽',
-u'耳食者流',
-u'耳食之見',
-u'耳食之論',
-u'耳食之談',
-u'耳食之徒',
-u'耳食之聞',
-u'耳食之學',
-u'耳食之言',
-u'耳熟能詳',
-u'二豎爲烈',
-u'二豎爲虐',
-u'二豎爲祟',
-u'二豎爲災',
-u'二豎之頑',
-u'二豎作惡',
-u'耳順之年',
-u'兒孫自有兒孫福',
-u'二桃殺三士',
-u'耳提面誨',
-u'耳提面命',
-u'耳提面訓',
-u'二天之德',
-u'耳聽八方',
-u'耳聽是虛眼見是實',
-u'耳聽爲虛眼見爲實',
-u'耳聽心受',
-u'二童一馬',
-u'耳聞不如目見',
-u'耳聞目睹',
-u'耳聞目擊',
-u'耳聞目見',
-u'耳聞是虛',
-u'耳聞是虛眼觀爲實',
-u'耳聞眼睹',
-u'耳聞則誦',
-u'耳習目染',
-u'二仙傳道',
-u'二心兩意',
-u'二心三意',
-u'二心私學',
-u'兒行千裏母擔憂',
-u'二姓之好',
-u'耳虛聞蟻',
-u'二旬九食',
-u'爾雅溫文',
-u'兒要親生田要冬耕',
-u'二意三心',
-u'二一添作五',
-u'二酉才高',
-u'爾虞我詐',
-u'爾詐我虞',
-u'二者必居其一',
-u'二者不可得兼',
-u'兒子是自己的好',
-u'二罪俱罰',
-u'發白齒落',
-u'伐冰之家',
-u'罰薄不慈',
-u'法不傳六',
-u'法不傳六耳',
-u'罰不當罪',
-u'法不阿貴',
-u'罰不及嗣',
-u'法不上衆',
-u'法不徇情',
-u'罰不責衆',
-u'法不制衆',
-u'發财緻富',
-u'發策決科',
-u'法成令修',
-u'法出多門',
-u'法出一門',
-u'發大頭昏',
-u'罰當其罪',
-u'發短心長',
-u'發凡舉例',
-u'發凡起例',
-u'發凡言例',
-u'發奮圖強',
-u'發憤忘餐',
-u'發憤忘食',
-u'發奮爲雄',
-u'發憤自雄',
-u'罰弗及嗣',
-u'發伏擿奸',
-u'發覆振蒙',
-u'伐功矜能',
-u'發瞽披聾',
-u'法貴必行',
-u'法國一八四八年革命',
-u'法海無邊',
-u'發喊連天',
-u'發号布令',
-u'發号出令',
-u'發号施令',
-u'發皇耳目',
-u'發揮光大',
-u'發昏章第十一',
-u'發迹變泰',
-u'法家弼士',
-u'發家緻富',
-u'發堿決塘',
-u'發奸擿伏',
-u'發奸擿隐',
-u'發奸摘伏',
-u'發奸摘隐',
-u'發科打诨',
-u'法蘭西第一帝國',
-u'法力無邊',
-u'發聾振聩',
-u'法輪常轉',
-u'法脈準繩',
-u'伐毛換髓',
-u'伐毛洗髓',
-u'發蒙解縛',
-u'發蒙解惑',
-u'發蒙振聩',
-u'發蒙振落',
-u'發蒙振滞',
-u'發名成業',
-u'發明耳目',
-u'發明家的聚焦劍',
-u'發怒沖冠',
-u'發怒穿冠',
-u'發潛闡幽',
-u'發人猛省',
-u'發人深思',
-u'發人深醒',
-u'發轫之始',
-u'伐善攘羭',
-u'乏善足陳',
-u'發上沖冠',
-u'發上指冠',
-u'伐樹削迹',
-u'發棠之請',
-u'發擿奸伏',
-u'發秃齒豁',
-u'法外施恩',
-u'法外施仁',
-u'法外有恩',
-u'發威動怒',
-u'法無二門',
-u'法無可貸',
-u'發屋求狸',
-u'法無三日嚴',
-u'發憲布令',
-u'發硎新試',
-u'伐性之斧',
-u'法眼如炬',
-u'法眼通天',
-u'發言盈庭',
-u'發揚褒大',
-u'發揚踔厲',
-u'發揚蹈厲',
-u'發揚光大',
-u'發揚光顯',
-u'發揚民主',
-u'發揚岩穴',
-u'發揚增大',
-u'伐異黨同',
-u'罰一勸百',
-u'發引千鈞',
-u'發隐擿伏',
-u'發隐摘伏',
-u'發踴沖冠',
-u'法正百業旺',
-u'發政施仁',
-u'發植穿冠',
-u'發指眦裂',
-u'伐罪吊民',
-u'伐罪吊人',
-u'翻把恩人當仇人',
-u'反敗爲功',
-u'反敗爲勝',
-u'凡百一新',
-u'梵呗圓音',
-u'飯飽丢箸',
-u'飯飽弄箸',
-u'返本朝元',
-u'返本還元',
-u'返本求源',
-u'反本溯源',
-u'反本修古',
-u'犯病的不吃犯法的不做',
-u'返哺報親',
-u'反哺銜食',
-u'返哺之恩',
-u'返哺之情',
-u'返哺之私',
-u'凡才淺識',
-u'反側獲安',
-u'反側未安',
-u'反側自安',
-u'翻腸攪肚',
-u'翻陳出新',
-u'反傳網絡',
-u'反唇腹非',
-u'翻唇弄舌',
-u'反唇相攻',
-u'反唇相譏',
-u'反唇之譏',
-u'反道敗德',
-u'反跌文章',
-u'犯而不校',
-u'犯而勿校',
-u'煩法細文',
-u'泛泛而談',
-u'反反覆覆',
-u'泛泛其詞',
-u'泛泛之交',
-u'泛泛之人',
-u'泛泛之談',
-u'反方向圖',
-u'反風滅火',
-u'反複不常',
-u'販夫販婦',
-u'凡夫肉眼',
-u'凡夫俗眼',
-u'販夫俗子',
-u'反複推敲',
-u'反覆無常',
-u'販夫皁隸',
-u'翻覆之水',
-u'販夫走卒',
-u'反戈相向',
-u'反戈一擊',
-u'反攻倒算',
-u'返躬内省',
-u'反躬自問',
-u'反躬自省',
-u'反躬自責',
-u'反顧無益',
-u'反骨洗髓',
-u'返觀内視',
-u'返觀内照',
-u'販官鬻爵',
-u'翻滾掃擊',
-u'飯後百步走',
-u'飯後百步走活到九十九',
-u'繁花如錦',
-u'繁華勝地',
-u'繁華世界',
-u'繁花似錦',
-u'繁華損枝',
-u'繁花一縣',
-u'翻黃倒皁',
-u'返魂無術',
-u'販贱賣貴',
-u'反間之計',
-u'翻江倒海',
-u'翻江攪海',
-u'販交買名',
-u'反驕破滿',
-u'釩金指環',
-u'釩金墜飾',
-u'反經從權',
-u'反經合道',
-u'反經合權',
-u'反經合義',
-u'反經行權',
-u'繁劇紛擾',
-u'番窠倒臼',
-u'反客爲主',
-u'飯坑酒囊',
-u'翻空出奇',
-u'返來複去',
-u'飯來開口',
-u'飯來口開',
-u'飯來張口',
-u'泛濫不止',
-u'泛濫成災',
-u'反老成童',
-u'返老歸童',
-u'返老還童',
-u'反老爲少',
-u'反勞爲逸',
-u'範蠡乘舟',
-u'繁禮多儀',
-u'範蠡扁舟',
-u'飯粝茹蔬',
-u'犯禮傷孝',
-u'蕃籬之鷃',
-u'反臉無情',
-u'凡六樂者',
-u'反目成仇',
-u'飯囊酒甕',
-u'飯囊衣架',
-u'煩惱多因強出頭',
-u'煩惱皆爲強出頭',
-u'煩惱皆因強出頭',
-u'繁鳥萃棘',
-u'飯牛屠狗',
-u'凡偶近器',
-u'返辔收帆',
-u'泛萍浮梗',
-u'返樸歸淳',
-u'返樸歸真',
-u'返樸還淳',
-u'返樸還真',
-u'反其道而行之',
-u'反裘負刍',
-u'反裘負薪',
-u'飯糗茹草',
-u'反裘傷皮',
-u'反求諸己',
-u'反求諸身',
-u'幡然變計',
-u'翻然改悔',
-u'翻然改進',
-u'幡然改途',
-u'翻然改悟',
-u'翻然悔過',
-u'幡然悔悟',
-u'繁榮昌盛',
-u'繁榮富強',
-u'繁榮護腕',
-u'繁榮興旺',
-u'翻山過嶺',
-u'翻山越嶺',
-u'犯上作亂',
-u'反身自問',
-u'翻身做主',
-u'凡聖不二',
-u'凡事忘形',
-u'凡事要好',
-u'反失一肘羊',
-u'凡事預則立',
-u'凡事預則立不預則廢',
-u'反首拔舍',
-u'反手可得',
-u'翻手爲雲',
-u'翻手爲雲覆手爲雨',
-u'翻手爲雲覆手雨',
-u'反手一擊',
-u'翻手雲覆手雨',
-u'燔書阬儒',
-u'燔書坑儒',
-u'反水不收',
-u'範水模山',
-u'繁絲急管',
-u'凡胎肉眼',
-u'凡胎俗骨',
-u'凡胎濁骨',
-u'凡胎濁體',
-u'凡桃俗李',
-u'番天覆地',
-u'煩天惱地',
-u'犯天下之大不韪',
-u'翻天作地',
-u'繁文末節',
-u'繁文缛節',
-u'煩文缛禮',
-u'煩文瑣事',
-u'繁弦急管',
-u'翻箱倒櫃',
-u'翻箱倒籠',
-u'翻箱倒箧',
-u'煩嚣喧鋇',
-u'返邪歸正',
-u'煩心倦目',
-u'反行兩登',
-u'繁刑重賦',
-u'繁刑重斂',
-u'返虛入渾',
-u'反眼不識',
-u'犯顔敢谏',
-u'犯顔極谏',
-u'犯顔進谏',
-u'犯顔苦谏',
-u'繁言吝啬',
-u'繁言蔓詞',
-u'煩言飾辭',
-u'煩言碎辭',
-u'煩言碎語',
-u'反顔相向',
-u'犯言直谏',
-u'反咬一口',
-u'犯夜的倒拿住巡更的',
-u'反掖之寇',
-u'反繹推理',
-u'反陰複陰',
-u'泛應曲當',
-u'飯玉炊桂',
-u'翻雲覆雨',
-u'泛宅浮家',
-u'範張雞黍',
-u'範張之志',
-u'返照回光',
-u'返正撥亂',
-u'繁征博引',
-u'犯之不校',
-u'反治其身',
-u'繁枝細節',
-u'反轉變形',
-u'防蔽耳目',
-u'方便之門',
-u'防不及防',
-u'防不勝防',
-u'方骖并路',
-u'方昌未艾',
-u'放長線釣大魚',
-u'紡車頭上出黃金',
-u'方寸不亂',
-u'方寸俱亂',
-u'方寸亂矣',
-u'方寸萬重',
-u'方寸已亂',
-u'方寸之地',
-u'方寸自亂',
-u'放達不羁',
-u'放誕不羁',
-u'放誕不拘',
-u'放誕風流',
-u'放誕任氣',
-u'放蕩不羁',
-u'放蕩形骸',
-u'方底圓蓋',
-u'放刁把濫',
-u'放刁撒潑',
-u'房頂開門竈坑打井',
-u'放飯流歠',
-u'放歌縱酒',
-u'妨功害能',
-u'放虎歸山',
-u'放虎歸山留後患',
-u'放虎遺患',
-u'放虎于山',
-u'放虎自衛',
-u'防患未萌',
-u'防患未然',
-u'防患于未然',
-u'仿徨失措',
-u'放火燒山',
-u'防禍未然',
-u'防禍于未然',
-u'方駕齊驅',
-u'方巾長袍',
-u'方巾闊服',
-u'防君子不防小人',
-u'方來未艾',
-u'芳蘭竟體',
-u'放浪不羁',
-u'放浪不拘',
-u'放浪江湖',
-u'放浪無羁',
-u'放浪無拘',
-u'放浪形骸',
-u'芳林新葉催陳葉',
-u'方領矩步',
-u'方領圓冠',
-u'放龍入海',
-u'放亂收死',
-u'訪論稽古',
-u'放馬後炮',
-u'放馬華陽',
-u'防萌杜漸',
-u'方面大耳',
-u'防民之口',
-u'防民之口甚于防川',
-u'放命圮族',
-u'房謀杜斷',
-u'芳年華月',
-u'放牛歸馬',
-u'放屁添風',
-u'放辟邪侈',
-u'放辟淫侈',
-u'放僻淫佚',
-u'放屁砸了腳後跟',
-u'訪貧問苦',
-u'放潑撒豪',
-u'芳氣勝蘭',
-u'訪親問友',
-u'芳卿可人',
-u'放情丘壑',
-u'放任自流',
-u'方枘圓鑿',
-u'防身大盾',
-u'方盛未艾',
-u'方是真的藥是假的',
-u'方朔之饑',
-u'方斯蔑如',
-u'方桃譬李',
-u'方頭不劣',
-u'方頭不律',
-u'方土異同',
-u'方外司馬',
-u'方外之國',
-u'方外之人',
-u'方外之士',
-u'防微杜漸',
-u'防微杜釁',
-u'防微慮遠',
-u'防微以漸',
-u'方聞之士',
-u'放下包袱',
-u'放下屠刀',
-u'放下屠刀立地成佛',
-u'妨賢病國',
-u'放枭囚鳳',
-u'放心解體',
-u'防心攝行',
-u'放心托膽',
-u'放心剚刃',
-u'方興未艾',
-u'方興未已',
-u'防芽遏萌',
-u'放言高論',
-u'方言矩行',
-u'放言遣辭',
-u'放眼世界',
-u'方以類聚',
-u'方以類聚物以群分',
-u'防意如城',
-u'放意肆志',
-u'放鷹逐犬',
-u'鲂魚赪尾',
-u'放魚入海',
-u'方員可施',
-u'方圓殊趣',
-u'方鑿圓枘',
-u'方丈盈前',
-u'方丈之馔',
-u'放着河水不洗船',
-u'方正不阿',
-u'方正不苟',
-u'方正賢良',
-u'方正之士',
-u'放之四海而皆準',
-u'方趾圓顱',
-u'放諸四海而皆準',
-u'放諸四裔',
-u'方滋未艾',
-u'放縱不羁',
-u'放縱不拘',
-u'放縱馳蕩',
-u'方足圓顱',
-u'诽謗之木',
-u'飛必沖天',
-u'非必然性',
-u'非比尋常',
-u'菲才寡學',
-u'費财勞民',
-u'飛蒼走黃',
-u'悱恻纏綿',
-u'肥腸滿腦',
-u'非常之謀',
-u'非池中物',
-u'廢除疾病',
-u'飛刍挽粒',
-u'飛刍挽糧',
-u'蜚刍挽粟',
-u'飛刍轉饷',
-u'非此即彼',
-u'非淡泊無以明志',
-u'肥的瘦的一鍋煮',
-u'肥冬瘦年',
-u'蜚短流長',
-u'飛遁離俗',
-u'肥遁鳴高',
-u'肥遁之高',
-u'飛蛾赴火',
-u'飛蛾赴焰',
-u'飛蛾赴燭',
-u'飛蛾撲火',
-u'飛蛾投火',
-u'飛蛾投火自取滅亡',
-u'飛蛾投焰',
-u'飛蛾投燭',
-u'飛耳長目',
-u'生不如死',
-u'廢耳任目',
-u'沸反連天',
-u'沸反盈天',
-u'非方之物',
-u'吠非其主',
-u'沸沸湯湯',
-u'沸沸揚揚',
-u'匪匪翼翼',
-u'非非之想',
-u'非分之财',
-u'非分之念',
-u'非分之想',
-u'肺腑之談',
-u'肺腑之言',
-u'肥甘輕暖',
-u'肺肝如見',
-u'飛閣流丹',
-u'飛觥獻斝',
-u'匪躬之操',
-u'匪躬之節',
-u'匪躬之志',
-u'飛觥走斝',
-u'廢國向己',
-u'飛鴻冥冥',
-u'飛鴻踏雪',
-u'飛鴻戲海',
-u'飛鴻雪爪',
-u'飛鴻印雪',
-u'飛鴻羽翼',
-u'飛花遁影',
-u'廢話連篇',
-u'飛黃騰達',
-u'飛黃騰踏',
-u'飛箭如蝗',
-u'飛将難封',
-u'飛将數奇',
-u'廢教棄制',
-u'費盡心計',
-u'廢居積貯',
-u'非可小觑',
-u'飛來橫禍',
-u'費力勞心',
-u'飛糧挽秣',
-u'飛流短長',
-u'飛龍乘雲',
-u'飛龍披風',
-u'飛龍騎兵',
-u'飛龍在天',
-u'飛鸾翔鳳',
-u'非驢非馬',
-u'肥馬輕裘',
-u'飛米轉刍',
-u'飛謀釣謗',
-u'飛謀薦謗',
-u'飛鳥驚蛇',
-u'飛鳥依人',
-u'飛鳥之景',
-u'非寧靜無以緻遠',
-u'肥醲甘脆',
-u'飛蓬乘風',
-u'飛蓬随風',
-u'蜚蓬之問',
-u'非罴非熊',
-u'飛牆走壁',
-u'非親非故',
-u'非親非眷',
-u'非親卻是親',
-u'廢寝忘餐',
-u'廢寝忘食',
-u'飛禽走獸',
-u'斐然成章',
-u'廢然而返',
-u'斐然可觀',
-u'廢然思返',
-u'斐然鄉風',
-u'非人不傳',
-u'非日非月',
-u'吠日之怪',
-u'肥肉大酒',
-u'肥肉厚酒',
-u'飛灑詭寄',
-u'飛沙揚礫',
-u'飛砂轉石',
-u'飛沙走礫',
-u'飛沙走石',
-u'飛觞走斝',
-u'費舌勞唇',
-u'吠聲吠影',
-u'蜚聲國際',
-u'蜚聲鵲起',
-u'飛升騰實',
-u'匪石匪席',
-u'廢食忘寝',
-u'飛石揚砂',
-u'匪石之心',
-u'飛書草檄',
-u'廢書長歎',
-u'飛書馳檄',
-u'廢書而泣',
-u'廢書而歎',
-u'廢書太息',
-u'飛書走檄',
-u'飛霜六月',
-u'肥水不過別人田',
-u'肥水不流外人田',
-u'匪兕匪虎',
-u'廢私立公',
-u'非四字成語合集',
-u'飛天冥蝠',
-u'飛天冥虎',
-u'沸天震地',
-u'非同等閑',
-u'非同兒戲',
-u'非通小可',
-u'非同尋常',
-u'非同以往',
-u'肥頭大耳',
-u'肥頭大面',
-u'肥頭胖耳',
-u'沸土峽谷',
-u'飛土逐害',
-u'飛土逐肉',
-u'蜚瓦拔木',
-u'飛文染翰',
-u'廢文任武',
-u'非我族類',
-u'非我族類其心必異',
-u'非昔是今',
-u'費心勞力',
-u'費心勞神',
-u'非刑逼拷',
-u'非刑吊拷',
-u'吠形吠聲',
-u'非刑拷打',
-u'非熊非罴',
-u'飛熊入夢',
-u'非學無以廣才',
-u'飛檐反宇',
-u'菲言厚行',
-u'飛燕依人',
-u'飛燕遊龍',
-u'飛雁展頭',
-u'飛檐走壁',
-u'飛檐走脊',
-u'飛揚跋扈',
-u'飛揚浮躁',
-u'飛殃走禍',
-u'非業之作',
-u'非議诋欺',
-u'菲衣惡食',
-u'匪夷匪惠',
-u'非異人任',
-u'非一日之寒',
-u'匪夷所思',
-u'非意相幹',
-u'匪伊朝夕',
-u'匪夷之思',
-u'飛鷹奔犬',
-u'飛蠅垂珠',
-u'吠影吠聲',
-u'蜚英騰茂',
-u'蜚英騰實',
-u'飛鷹走狗',
-u'飛鷹走馬',
-u'飛鷹走犬',
-u'肥魚大肉',
-u'蜚語惡言',
-u'非譽交争',
-u'蜚語流長',
-u'蜚語流言',
-u'诽譽在俗',
-u'非愚則誣',
-u'飛鸢堕水',
-u'飛冤駕害',
-u'飛雲掣電',
-u'飛雲五朵',
-u'飛災大禍',
-u'飛災橫禍',
-u'非戰之罪',
-u'匪朝伊夕',
-u'飛針走線',
-u'非正之号',
-u'非志無以成學',
-u'非終極符',
-u'肥豬拱門',
-u'飛珠濺玉',
-u'飛走如風',
-u'粉白黛黑',
-u'粉白黛綠',
-u'粉白墨黑',
-u'粉白珠圓',
-u'分崩蕩析',
-u'分崩離析',
-u'奮臂大呼',
-u'奮筆疾書',
-u'奮臂一呼',
-u'奮筆直書',
-u'奮不顧命',
-u'奮不顧身',
-u'奮不顧生',
-u'奮不慮身',
-u'憤不欲生',
-u'分钗劈鳳',
-u'分钗破鏡',
-u'焚巢蕩穴',
-u'焚巢搗穴',
-u'粉愁香怨',
-u'分床同夢',
-u'分寸之功',
-u'分寸之末',
-u'粉淡脂紅',
-u'分道揚镳',
-u'焚典坑儒',
-u'粉雕玉琢',
-u'分而治之',
-u'奮發踔厲',
-u'奮發淬厲',
-u'奮發蹈厲',
-u'奮發圖強',
-u'奮發向上',
-u'奮發有爲',
-u'芬芳馥郁',
-u'分房減口',
-u'奮飛橫絕',
-u'忿忿不平',
-u'紛紛不一',
-u'紛紛藉藉',
-u'紛紛嚷嚷',
-u'紛紛擾擾',
-u'紛紛揚揚',
-u'紛紛議論',
-u'紛紛翼翼',
-u'紛紛擁擁',
-u'憤風驚浪',
-u'分風劈流',
-u'焚符破玺',
-u'分甘共苦',
-u'分甘絕少',
-u'分甘同苦',
-u'糞缸越淘越臭',
-u'焚膏繼晷',
-u'奮舸商海',
-u'粉骨捐軀',
-u'粉骨糜軀',
-u'粉骨糜身',
-u'粉骨碎身',
-u'焚骨揚灰',
-u'分毫不差',
-u'分毫不錯',
-u'分毫不取',
-u'分毫不爽',
-u'分毫不值',
-u'分毫無爽',
-u'分毫無損',
-u'分毫析厘',
-u'憤恨不平',
-u'紛紅駭綠',
-u'粉紅染料',
-u'分花拂柳',
-u'紛華靡麗',
-u'分化瓦解',
-u'分花約柳',
-u'焚火餘燼',
-u'忿火中燒',
-u'分家析産',
-u'分金掰兩',
-u'分斤撥兩',
-u'分進合擊',
-u'分斤較兩',
-u'奮矜之容',
-u'分久必合合久必分',
-u'分居異爨',
-u'焚枯食淡',
-u'分勞赴功',
-u'分厘毫絲',
-u'焚林而獵',
-u'焚林而狩',
-u'焚林而田',
-u'焚林而田竭澤而漁',
-u'粉吝紅悭',
-u'焚林竭澤',
-u'焚林之求',
-u'分路揚镳',
-u'紛亂如麻',
-u'分茅賜土',
-u'分茅裂土',
-u'分茅錫土',
-u'分茅胙土',
-u'奮袂而起',
-u'奮袂攘襟',
-u'分門別戶',
-u'分門別類',
-u'憤懑不平',
-u'分門篡類',
-u'分門合類',
-u'分門類聚',
-u'分門析類',
-u'粉面含春',
-u'粉面油頭',
-u'粉面朱唇',
-u'分秒必争',
-u'粉墨登場',
-u'粉墨登台',
-u'焚木鐐铐',
-u'分内之事',
-u'粉膩黃黏',
-u'分朋樹黨',
-u'分朋引類',
-u'分貧振窮',
-u'憤氣填膺',
-u'奮起直追',
-u'分淺緣薄',
-u'分淺緣悭',
-u'粉牆朱戶',
-u'焚琴鬻鶴',
-u'焚琴煮鶴',
-u'分情破愛',
-u'忿然作色',
-u'焚日重腕',
-u'焚如之禍',
-u'焚如之刑',
-u'分三別兩',
-u'分陝之重',
-u'奮身不顧',
-u'奮身獨步',
-u'分身乏術',
-u'粉身灰骨',
-u'分身減口',
-u'粉身難報',
-u'粉身碎骨',
-u'分身無術',
-u'焚石寶珠',
-u'粉飾場面',
-u'憤世疾惡',
-u'忿世嫉俗',
-u'憤世嫉邪',
-u'粉飾門面',
-u'粉飾昇平',
-u'粉飾太平',
-u'焚屍揚灰',
-u'分守要津',
-u'焚書坑儒',
-u'分絲析縷',
-u'焚薮而田',
-u'分損謗議',
-u'分所應爲',
-u'分條析理',
-u'分庭伉禮',
-u'糞土不如',
-u'糞土之牆不可朽',
-u'分外明白',
-u'分外眼紅',
-u'分外眼明',
-u'分外眼睜',
-u'分外妖娆',
-u'分外夭夭',
-u'分外之賞',
-u'分外之物',
-u'分文不名',
-u'分文不取',
-u'分文不受',
-u'分文不值',
-u'分文未取',
-u'分我杯羹',
-u'奮武揚威',
-u'焚香頂禮',
-u'焚香禮拜',
-u'焚香列鼎',
-u'分香賣履',
-u'焚香膜拜',
-u'焚香掃地',
-u'分宵達曙',
-u'分鞋破鏡',
-u'分心挂腹',
-u'分心勞神',
-u'焚心之地',
-u'分星撥兩',
-u'分形共氣',
-u'分形連氣',
-u'分星劈兩',
-u'分形同氣',
-u'奮勇當先',
-u'奮勇直前',
-u'分憂代勞',
-u'枌榆同契',
-u'紛纭雜沓',
-u'分章析句',
-u'焚芝鋤蕙',
-u'紛至踏來',
-u'焚舟破釜',
-u'粉妝銀砌',
-u'粉妝玉砌',
-u'粉裝玉琢',
-u'粉漬脂痕',
-u'奉筆兔園',
-u'豐标不凡',
-u'風飑電激',
-u'鳳表龍姿',
-u'風兵草甲',
-u'鳳泊鸾飄',
-u'風波平地',
-u'鳳蔔歸昌',
-u'鋒不可當',
-u'風不鳴條',
-u'鳳蔔新諧',
-u'鳳采鸾章',
-u'風采堂堂',
-u'風餐露宿',
-u'風餐水栖',
-u'風餐水宿',
-u'風餐雨宿',
-u'風餐雨卧',
-u'豐草長林',
-u'鳳拆鸾零',
-u'蜂虿有毒',
-u'蜂纏蝶戀',
-u'風僝雨僽',
-u'逢場竿木',
-u'逢場遊戲',
-u'逢場作樂',
-u'逢場作趣',
-u'逢場作戲',
-u'風潮過了世界在',
-u'風掣雷行',
-u'風車雨馬',
-u'風車雲馬',
-u'風塵肮髒',
-u'風塵表物',
-u'風塵惡俗',
-u'風塵勞攘',
-u'風塵碌碌',
-u'風塵女郎',
-u'風塵女子',
-u'風塵仆仆',
-u'風塵荏苒',
-u'風塵外物',
-u'風塵物表',
-u'風塵之變',
-u'風塵之會',
-u'風塵知己',
-u'風塵之警',
-u'風塵之慕',
-u'風塵之言',
-u'風塵中人',
-u'風成化習',
-u'豐城劍氣',
-u'豐城龍劍',
-u'豐城之劍',
-u'豐城紫氣',
-u'風馳草靡',
-u'風馳電掣',
-u'風馳電騁',
-u'風馳電赴',
-u'風馳電擊',
-u'風馳電卷',
-u'風馳電邁',
-u'風馳電逝',
-u'風馳電掩',
-u'風馳霆擊',
-u'風馳雨驟',
-u'風馳雲卷',
-u'風馳雲走',
-u'風馳之翼',
-u'鳳愁鸾怨',
-u'蜂出并作',
-u'鳳雛麟子',
-u'蜂出泉流',
-u'風傳一時',
-u'風吹草低',
-u'風吹草動',
-u'風吹浪打',
-u'風吹兩邊倒',
-u'風吹馬耳',
-u'風吹日曬',
-u'風吹雨打',
-u'風吹雨灑',
-u'風吹雲散',
-u'風春雨硙',
-u'奉辭伐罪',
-u'風從那裏起雨從那裏落',
-u'風從響應',
-u'蜂攢蟻集',
-u'蜂攢蟻聚',
-u'風大浪高',
-u'封刀挂劍',
-u'風刀霜劍',
-u'奉道齋僧',
-u'諷德誦功',
-u'風燈之燭',
-u'鋒镝餘生',
-u'鋒镝之苦',
-u'蜂蝶随香',
-u'風定天晴',
-u'風動旛動',
-u'風度翩翩',
-u'諷多要寡',
-u'逢惡導非',
-u'風發泉湧',
-u'鋒發韻流',
-u'風幡不動',
-u'風範猶在',
-u'蜂房蟻穴',
-u'風飛電耀',
-u'風飛雲會',
-u'葑菲之采',
-u'瘋瘋顛顛',
-u'風風火火',
-u'風風勢勢',
-u'風風雨雨',
-u'風風韻韻',
-u'豐富多采',
-u'鳳附龍攀',
-u'蜂附雲集',
-u'豐幹饒舌',
-u'風幹物燥火易發',
-u'風幹物燥火易起',
-u'風幹物燥火易生',
-u'風高放火',
-u'風高放火月黑殺人',
-u'鳳閣龍樓',
-u'鳳歌鸾舞',
-u'風歌夜曲',
-u'逢庚則變遇甲方晴',
-u'奉公不阿',
-u'豐功厚利',
-u'奉公克己',
-u'豐功茂德',
-u'豐功懋烈',
-u'奉公如法',
-u'豐功盛烈',
-u'奉公守法',
-u'奉公守節',
-u'豐功碩德',
-u'豐功偉績',
-u'豐功偉烈',
-u'奉公行法',
-u'豐功懿德',
-u'奉公正己',
-u'奉公執法',
-u'烽鼓不息',
-u'鳳骨龍姿',
-u'風骨峭峻',
-u'風骨特出',
-u'封官賜爵',
-u'鳳管鸾笙',
-u'鳳管鸾箫',
-u'鳳冠霞帔',
-u'封官許原',
-u'風光過後财精光',
-u'風光旖旎',
-u'風光月霁',
-u'風光在險峰',
-u'風寒紗缦',
-u'風寒暑濕',
-u'風号雪舞',
-u'風鶴魂驚',
-u'風禾盡起',
-u'縫合披風',
-u'風和日麗',
-u'風和日媚',
-u'風和日暖',
-u'風和日暄',
-u'蜂合豕突',
-u'蜂合蟻聚',
-u'豐亨豫大',
-u'封侯萬裏',
-u'封胡遏末',
-u'封胡羯末',
-u'風虎雲龍',
-u'風華絕代',
-u'風花雙劍',
-u'風花雪夜',
-u'風花雪月',
-u'風華正茂',
-u'馮驩彈铗',
-u'風鬟霧鬓',
-u'風鬟雨鬓',
-u'鳳凰不落無寶之地',
-u'鳳凰短褲',
-u'鳳凰來儀',
-u'鳳凰手套',
-u'鳳凰于蜚',
-u'鳳凰娛志',
-u'鳳凰在笯',
-u'風回電激',
-u'峰回路轉',
-u'烽火連年',
-u'烽火連天',
-u'烽火四起',
-u'烽火相連',
-u'風激電飛',
-u'風激電駭',
-u'逢吉丁辰',
-u'逢機遘會',
-u'鳳集河清',
-u'風疾火更猛',
-u'風急浪高',
-u'逢機立斷',
-u'豐肌膩理',
-u'豐肌弱骨',
-u'封己守殘',
-u'豐肌秀骨',
-u'風急雨驟',
-u'豐儉由人',
-u'豐儉自便',
-u'封疆大吏',
-u'封疆畫界',
-u'風角鳥占',
-u'風嬌日暖',
-u'豐筋多力',
-u'封金挂印',
-u'風景不殊',
-u'風景不轉心境轉',
-u'風驚草動',
-u'風靜浪平',
-u'風舉雲飛',
-u'風舉雲搖',
-u'風卷殘雪',
-u'風卷殘雲',
-u'風谲雲詭',
-u'逢君之惡',
-u'鳳窠群女',
-u'蜂窠蟻穴',
-u'風口浪尖',
-u'蜂狂蝶亂',
-u'鳳狂龍躁',
-u'風狂雨暴',
-u'風狂雨橫',
-u'風來樹動',
-u'風冷門楣',
-u'風冷杏壇',
-u'風冷竹林',
-u'風裏揚花',
-u'豐烈偉績',
-u'風裂峽谷',
-u'風鱗布裙',
-u'奉令承教',
-u'奉令唯謹',
-u'風流博浪',
-u'風流不用着衣多',
-u'風流才子',
-u'風流趁年少',
-u'風流跌宕',
-u'風流笃厚',
-u'風流爾雅',
-u'風流話靶',
-u'風流佳話',
-u'風流佳事',
-u'風流家數',
-u'風流警拔',
-u'風流隽望',
-u'風流俊俏',
-u'風流可愛',
-u'風流浪子莫教貧',
-u'風流千古',
-u'風流人物',
-u'風流儒雅',
-u'風流薮澤',
-u'風流倜傥',
-u'風流婉轉',
-u'風流往事',
-u'風流潇驅',
-u'風流潇灑',
-u'風流逸宕',
-u'風流旖旎',
-u'風流猶存',
-u'風流雨散',
-u'風流冤孽',
-u'風流冤業',
-u'風流蘊藉',
-u'風流雲散',
-u'風流韻事',
-u'風流自命',
-u'風流自賞',
-u'風流罪過',
-u'鳳樓龍阙',
-u'風馬不接',
-u'風馬牛不相及',
-u'風馬無關',
-u'風馬雲車',
-u'鋒芒畢露',
-u'鋒芒逼人',
-u'鋒芒不露',
-u'鋒芒挫縮',
-u'鋒芒毛發',
-u'鋒芒所向',
-u'風矛鬥篷',
-u'鳳毛雞膽',
-u'鳳毛濟美',
-u'鳳毛麟角',
-u'鳳毛龍甲',
-u'風茅小徑',
-u'風茅小屋',
-u'蜂媒蝶使',
-u'風門水口',
-u'風猛火更烈',
-u'蜂迷蝶猜',
-u'蜂迷蝶戀',
-u'鳳靡鸾吪',
-u'鳳靡鸾阠',
-u'風靡一世',
-u'風靡雲披',
-u'風靡雲湧',
-u'風靡雲蒸',
-u'奉命承教',
-u'鳳鳴鶴唳',
-u'鳳鳴麟出',
-u'奉命唯謹',
-u'鳳鳴朝陽',
-u'風魔九伯',
-u'蜂目豺聲',
-u'風木含悲',
-u'風木銜悲',
-u'風木之悲',
-u'風木之思',
-u'豐年補敗',
-u'豐年稔歲',
-u'鳳鳥不至',
-u'風牛馬不相及',
-u'風怒圖騰',
-u'風怒武器',
-u'風暖日麗',
-u'馮諾依曼',
-u'風平波息',
-u'風萍浪迹',
-u'風平浪靜',
-u'風起潮湧',
-u'鳳栖高梧',
-u'風氣開通',
-u'風起浪湧',
-u'風起泉湧',
-u'風起水湧',
-u'風氣所囿',
-u'風氣爲之一變',
-u'風起無名草',
-u'蜂起蟻聚',
-u'封妻蔭子',
-u'風凄雨慘',
-u'風起雲布',
-u'蜂起雲湧',
-u'風起雲蒸',
-u'風前殘燭',
-u'奉倩神傷',
-u'風前月下',
-u'風前之燭',
-u'逢強不弱',
-u'豐牆墝下',
-u'豐牆峭址',
-u'風牆圖騰',
-u'風樯陣馬',
-u'蜂勤蜜多',
-u'風清弊絕',
-u'風清氣爽',
-u'風輕日栗',
-u'風輕日暖',
-u'風清月白',
-u'風清月皎',
-u'風清月朗',
-u'風清月明',
-u'風情月思',
-u'風情月意',
-u'風情月債',
-u'風輕雲淡',
-u'風輕雲淨',
-u'風驅電擊',
-u'風驅電掃',
-u'風趣橫生',
-u'豐取刻與',
-u'鳳去樓空',
-u'鳳去秦樓',
-u'鳳去台空',
-u'蜂趨蟻附',
-u'奉勸君子',
-u'逢人且說三分話',
-u'逢人說項',
-u'逢人隻說三分話',
-u'風日晴和',
-u'豐容靓飾',
-u'豐容盛鬋',
-u'奉如圭臬',
-u'奉如神明',
-u'奉若神明',
-u'奉三無私',
-u'風掃斷雲',
-u'風掃落葉',
-u'風掃停雲',
-u'風色大作',
-u'豐殺随時',
-u'風沙之王',
-u'逢山開道',
-u'逢山開路',
-u'逢山開路遇水搭橋',
-u'逢山開路遇水填橋',
-u'蜂扇蟻聚',
-u'豐上銳下',
-u'豐上殺下',
-u'豐神綽約',
-u'風神淡遠',
-u'風神秀雅',
-u'豐神異彩',
-u'馮生彈铗',
-u'鳳生鳳兒',
-u'風聲婦人',
-u'風聲鶴唳',
-u'風聲鶴唳草木皆兵',
-u'風聲目色',
-u'封豕豺狼',
-u'封豕長蛇',
-u'風蝕符文',
-u'風世勵俗',
-u'鳳食鸾栖',
-u'逢使攀梅',
-u'風蝕石闆',
-u'蜂識莺猜',
-u'逢時遇節',
-u'風樹興悲',
-u'楓樹種子',
-u'風霜雨雪',
-u'風絲不透',
-u'風俗人情',
-u'風宿水飧',
-u'鳳髓龍汴',
-u'鳳髓龍肝',
-u'風飧露宿',
-u'風飧水宿',
-u'封鎖粒度',
-u'鳳歎虎視',
-u'馮唐白首',
-u'馮唐頭白',
-u'馮唐已老',
-u'風騰波湧',
-u'奉天承運',
-u'風恬浪靜',
-u'風恬日朗',
-u'風恬日暖',
-u'風恬月朗',
-u'楓天棗地',
-u'風調雨節',
-u'風調雨順',
-u'風亭月館',
-u'奉頭鼠竄',
-u'風土人情',
-u'風土習慣',
-u'蜂屯烏合',
-u'蜂屯蟻附',
-u'蜂屯蟻結',
-u'蜂屯蟻聚',
-u'蜂屯蟻雜',
-u'逢危必棄',
-u'風味不惡',
-u'鳳尾弓弦',
-u'奉爲圭璧',
-u'奉爲圭臬',
-u'鳳尾絞絲',
-u'奉爲楷模',
-u'風微浪穩',
-u'峰位漂移',
-u'奉爲至寶',
-u'風聞言事',
-u'蜂舞并起',
-u'豐屋蔀家',
-u'風無常順兵無常勝',
-u'鳳舞來儀',
-u'鳳舞龍飛',
-u'鳳舞龍蟠',
-u'鳳舞鸾歌',
-u'豐屋生災',
-u'風物習俗',
-u'豐屋延災',
-u'豐屋之過',
-u'豐屋之禍',
-u'豐屋之戒',
-u'奉檄色喜',
-u'封豨脩蛇',
-u'風險投資公司機場',
-u'風向草偃',
-u'鳳箫龍管',
-u'鳳箫鸾管',
-u'鳳枭同巢',
-u'風潇雨晦',
-u'風消雲散',
-u'風挾斷雲',
-u'鳳協鸾和',
-u'逢新感舊',
-u'風信年華',
-u'風行草從',
-u'風行草靡',
-u'風行草偃',
-u'風行革偃',
-u'奉行故事',
-u'風行雷厲',
-u'風行露宿',
-u'風行水上',
-u'奉行唯謹',
-u'風行一世',
-u'風行雨散',
-u'風興雲蒸',
-u'逢兇化吉',
-u'風休冰解',
-u'風休浪靜',
-u'風旋電掣',
-u'馮谖有魚',
-u'風雪交加',
-u'風雪嚴寒',
-u'風雅名士',
-u'風言醋語',
-u'風檐寸晷',
-u'風言風語',
-u'風言俏語',
-u'風言霧語',
-u'風言影語',
-u'鳳眼圓睜',
-u'風飏電激',
-u'奉揚仁風',
-u'蜂腰鶴膝',
-u'蜂腰削背',
-u'蜂腰蟻臀',
-u'蜂腰猿背',
-u'鳳臆龍鬐',
-u'豐衣美食',
-u'縫衣淺帶',
-u'諷一勸百',
-u'鳳儀獸舞',
-u'風移俗變',
-u'風移俗改',
-u'風移俗易',
-u'風儀嚴峻',
-u'豐衣足食',
-u'封印大廳',
-u'鳳引九雛',
-u'鳳吟鸾吹',
-u'封印命運',
-u'風影敷衍',
-u'蜂營蟻隊',
-u'蜂擁而出',
-u'蜂擁而來',
-u'蜂擁而入',
-u'蜂擁而上',
-u'蜂擁而至',
-u'蜂擁蟻聚',
-u'蜂擁蟻屯',
-u'鳳友鸾交',
-u'鳳友鸾諧',
-u'風雨剝蝕',
-u'風雨不測',
-u'風雨不改',
-u'風語不透',
-u'風雨對床',
-u'風雨共舟',
-u'風雨晦冥',
-u'風雨交加',
-u'風雨連床',
-u'風雨飄零',
-u'風雨飄飖',
-u'風雨凄凄',
-u'風雨如晦',
-u'風雨如盤',
-u'風雨時若',
-u'風雨調順',
-u'風雨同舟',
-u'風雨無違',
-u'風雨無阻',
-u'鳳羽香囊',
-u'風雨蕭條',
-u'風雨搖擺',
-u'風月筆墨',
-u'風月常新',
-u'風月膏肓',
-u'風月清照',
-u'風月無邊',
-u'風月無涯',
-u'風雲變化',
-u'風雲變幻',
-u'風雲變色',
-u'風雲變态',
-u'風雲不測',
-u'風雲叱吒',
-u'風雲感會',
-u'風雲會合',
-u'風雲際會',
-u'風雲迹遇',
-u'風雲開阖',
-u'風雲莫測',
-u'風雲氣候',
-u'風雲人物',
-u'風雲突變',
-u'風雲萬變',
-u'風韻秀徹',
-u'風韻猶存',
-u'風雲雨鬓',
-u'風雲月露',
-u'風雲之志',
-u'蜂針刺猬',
-u'鳳振高岡',
-u'鳳止高梧',
-u'鳳隻鸾孤',
-u'豐之土精',
-u'風栉雨沐',
-u'風中秉燭',
-u'風中殘燭',
-u'風中之燭',
-u'風燭殘年',
-u'風燭草露',
-u'風燭草霜',
-u'鳳翥龍蟠',
-u'鳳翥龍骧',
-u'鳳翥鸾回',
-u'鳳翥鸾翔',
-u'鳳翥鵬翔',
-u'風燭之年',
-u'蜂準長目',
-u'風姿綽約',
-u'鳳子龍孫',
-u'風姿潇驅',
-u'風姿冶麗',
-u'蜂子鑽窗',
-u'佛高一尺魔高一丈',
-u'佛骨項鏈',
-u'佛口蛇心',
-u'佛口聖心',
-u'佛面上去刮金',
-u'佛年刮金',
-u'佛燒一炷香人争一口氣',
-u'佛是金裝人是衣裝',
-u'佛頭加穢',
-u'佛頭着屎',
-u'佛頭著糞',
-u'佛頭着糞',
-u'佛爲一炷香',
-u'佛心蛇口',
-u'佛性禅心',
-u'佛眼佛心',
-u'佛眼相看',
-u'佛眼著糞',
-u'佛旨綸音',
-u'腐敗無能',
-u'浮白載筆',
-u'腹飽萬言',
-u'撫背扼喉',
-u'拊背扼吭',
-u'腹背夾攻',
-u'腹背受敵',
-u'腹背相親',
-u'腹背之毛',
-u'撫髀長歎',
-u'浮筆浪墨',
-u'拊髀雀躍',
-u'富比陶衛',
-u'富比王侯',
-u'拊髀興歎',
-u'輔弼之勳',
-u'撫髀自歎',
-u'伏兵減竈',
-u'福薄災生',
-u'福不重至',
-u'福不重至禍必重來',
-u'黼蔀黻紀',
-u'富不過三代',
-u'福不可享盡',
-u'膚不生毛',
-u'福不雙降禍不單行',
-u'福不徒來',
-u'福不盈眦',
-u'福不至萬事難',
-u'覆瓿之用',
-u'負才傲物',
-u'負材矜地',
-u'負才任氣',
-u'負才尚氣',
-u'負才使氣',
-u'拊操踴躍',
-u'附蟬之飾',
-u'夫倡婦随',
-u'腐腸之藥',
-u'覆巢毀卵',
-u'覆巢破卵',
-u'覆巢傾卵',
-u'覆巢完卵',
-u'覆巢無完卵',
-u'覆巢遺卵',
-u'覆巢之下無完卵',
-u'輔車唇齒',
-u'覆車繼軌',
-u'輔車相将',
-u'輔車相依',
-u'覆車之軌',
-u'覆車之鑒',
-u'覆車之戒',
-u'覆車之轍',
-u'拂塵看字',
-u'負乘斯奪',
-u'負乘緻寇',
-u'伏處枥下',
-u'負刍之禍',
-u'斧錘精通',
-u'浮詞曲說',
-u'父慈子孝',
-u'富從升合起',
-u'浮翠流丹',
-u'膚寸而合',
-u'膚寸之地',
-u'複蹈其轍',
-u'複蹈前轍',
-u'赴蹈湯火',
-u'福到未必福',
-u'負德背義',
-u'負德辜恩',
-u'福地寶坊',
-u'釜底抽薪',
-u'福地洞天',
-u'覆地翻天',
-u'負地矜才',
-u'釜底枯魚',
-u'釜底遊魂',
-u'釜底遊魚',
-u'釜底之魚',
-u'伏低做小',
-u'扶顛持危',
-u'負鼎之願',
-u'浮動磁頭',
-u'扶東倒西',
-u'凫短鶴長',
-u'跗萼聯芳',
-u'跗萼連晖',
-u'跗萼載韡',
-u'負恩背義',
-u'負恩昧良',
-u'負恩忘義',
-u'浮而不實',
-u'附耳低言',
-u'附耳低語',
-u'富而好禮',
-u'俯而就之',
-u'附耳密談',
-u'附耳射聲',
-u'伏而咶天',
-u'伏法受誅',
-u'膚泛不切',
-u'浮泛江海',
-u'浮泛無根',
-u'腹诽心謗',
-u'傅粉登場',
-u'傅粉何郎',
-u'傅粉平叔',
-u'傅粉施朱',
-u'傅粉塗脂',
-u'附鳳攀龍',
-u'夫婦反目',
-u'夫婦和而後家道成',
-u'黼黻皇猷',
-u'腹負将軍',
-u'附膚落毛',
-u'夫負妻戴',
-u'服服貼貼',
-u'黼黻文章',
-u'伏閣受讀',
-u'撫躬自問',
-u'負诟忍尤',
-u'婦姑勃谿',
-u'負固不賓',
-u'負固不服',
-u'負固不悛',
-u'桴鼓相應',
-u'撫孤恤寡',
-u'附骨之疽',
-u'浮瓜沉李',
-u'浮瓜沈李',
-u'浮光幻影',
-u'浮光掠影',
-u'浮光躍金',
-u'富貴安民',
-u'富貴本無種盡從勤裏得',
-u'富貴逼人',
-u'富貴逼人來',
-u'簠簋不饬',
-u'富貴不歸鄉如錦衣夜行',
-u'富貴不能淫',
-u'簠簋不飾',
-u'富貴不淫',
-u'富貴草頭霜',
-u'富貴長命',
-u'富貴多憂',
-u'富貴浮雲',
-u'富貴功名',
-u'負貴好權',
-u'富貴吉祥',
-u'富貴驕人',
-u'富貴利達',
-u'夫貴妻榮',
-u'富貴榮華',
-u'富貴壽考',
-u'富貴似花枝',
-u'富貴危機',
-u'富貴無常',
-u'富貴顯榮',
-u'富貴在天',
-u'富貴則淫',
-u'富貴尊榮',
-u'富國安民',
-u'黼國黻家',
-u'福過禍生',
-u'富國強兵',
-u'福國利民',
-u'富國強民',
-u'負郭窮巷',
-u'福過爲災',
-u'富國裕民',
-u'福過災生',
-u'覆海移山',
-u'凫鶴從方',
-u'負衡據鼎',
-u'負壺灌區',
-u'伏虎降龍',
-u'浮花浪蕊',
-u'附會穿鑿',
-u'福惠雙修',
-u'赴火蹈刃',
-u'扶急持傾',
-u'負笈從師',
-u'負笈擔簦',
-u'浮寄孤懸',
-u'浮迹浪蹤',
-u'附骥名彰',
-u'附骥攀鴻',
-u'附骥攀鱗',
-u'負笈千裏',
-u'負笈遊學',
-u'附骥彰名',
-u'縛雞之力',
-u'負笈追師',
-u'富家大室',
-u'浮家泛宅',
-u'富家巨室',
-u'富甲一方',
-u'膚見謭識',
-u'覆醬覆醅',
-u'覆醬燒薪',
-u'覆蕉得鹿',
-u'覆蕉尋鹿',
-u'伏節死誼',
-u'撫今悼昔',
-u'撫今思昔',
-u'撫今痛昔',
-u'撫今追昔',
-u'凫胫鶴膝',
-u'富精金礦',
-u'負荊請罪',
-u'撫景傷情',
-u'負荊謝罪',
-u'複舊如初',
-u'複舊如新',
-u'凫居雁聚',
-u'覆軍殺将',
-u'富堪敵國',
-u'富可敵國',
-u'斧柯爛盡',
-u'覆窟傾巢',
-u'扶困濟危',
-u'浮來暫去',
-u'浮岚暖翠',
-u'浮浪不經',
-u'扶老将幼',
-u'扶老挈幼',
-u'負老提幼',
-u'扶老攜弱',
-u'負老攜幼',
-u'扶老挾稚',
-u'扶了油瓶倒了醋',
-u'負類反倫',
-u'腹裏地面',
-u'複禮克己',
-u'伏枥老骥',
-u'富麗堂皇',
-u'富轹萬古',
-u'釜裏之魚',
-u'撫梁易柱',
-u'伏獵侍郎',
-u'富埒陶白',
-u'富埒天子',
-u'富埒王侯',
-u'伏龍鳳雛',
-u'福祿壽喜',
-u'福祿雙全',
-u'福祿未艾',
-u'覆鹿尋蕉',
-u'覆鹿遺蕉',
-u'伏鸾隐鹄',
-u'負芒披葦',
-u'負米百裏',
-u'富面百城',
-u'服冕乘軒',
-u'浮名絆身',
-u'浮名薄利',
-u'浮名虛利',
-u'浮名虛譽',
-u'膚末支離',
-u'父母恩勤',
-u'父母恩深終有別',
-u'父母劬勞',
-u'父母遺體',
-u'父母之邦',
-u'父母之國',
-u'父母之命',
-u'父母之命媒妁之言',
-u'傅納以言',
-u'夫乃一層天',
-u'釜内生魚',
-u'福年新運',
-u'服牛乘馬',
-u'負驽前驅',
-u'覆盆難照',
-u'覆盆之冤',
-u'膚皮潦草',
-u'浮萍大海',
-u'浮萍斷梗',
-u'浮萍浪梗',
-u'扶起不抉倒',
-u'服氣餐霞',
-u'夫妻反目',
-u'夫妻沒有隔夜仇',
-u'福齊南山',
-u'服氣吞露',
-u'夫妻無隔夜之仇',
-u'夫妻相合好',
-u'夫妻義重也分離',
-u'扶起油瓶倒下醋',
-u'負氣仗義',
-u'膚淺末學',
-u'富強康樂',
-u'扶牆摸壁',
-u'扶傾濟弱',
-u'覆去番來',
-u'負屈含冤',
-u'凫趨雀躍',
-u'福衢壽車',
-u'負屈銜冤',
-u'艴然不悅',
-u'怫然作色',
-u'腹熱腸荒',
-u'腹熱心煎',
-u'婦人醇酒',
-u'附人骥尾',
-u'負任蒙勞',
-u'婦人女子',
-u'婦人孺子',
-u'富人思來年',
-u'婦人之見',
-u'婦人之仁',
-u'婦人之言不可聽',
-u'芙蓉并蒂',
-u'芙蓉出水',
-u'夫榮妻貴',
-u'夫榮妻顯',
-u'芙蓉如面',
-u'福如東海',
-u'福如海淵',
-u'婦孺皆知',
-u'膚如凝脂',
-u'福如山嶽',
-u'父辱子死',
-u'扶弱抑強',
-u'扶善懲惡',
-u'扶善遏過',
-u'福善禍淫',
-u'負山之累',
-u'附膻逐臭',
-u'附膻逐穢',
-u'附膻逐腥',
-u'鵩上承塵',
-u'富商大賈',
-u'富商巨賈',
-u'附上罔下',
-u'富商蓄賈',
-u'蝮蛇螫手',
-u'蝮蛇螫手壯士解腕',
-u'附聲吠影',
-u'浮生空白茫',
-u'浮聲切響',
-u'浮生如寄',
-u'浮生若寄',
-u'浮生若夢',
-u'浮生若水',
-u'福生于微',
-u'輔世長民',
-u'浮石沉木',
-u'撫世酬物',
-u'富室大家',
-u'俛拾地芥',
-u'撫時感事',
-u'賦食行水',
-u'俯拾即是',
-u'俯拾皆是',
-u'伏屍流血',
-u'俯拾青紫',
-u'附勢趨炎',
-u'浮石沈木',
-u'覆是爲非',
-u'俛拾仰取',
-u'俯首低眉',
-u'縛手縛腳',
-u'俯首戢耳',
-u'俯首就縛',
-u'福壽康寧',
-u'浮收勒折',
-u'浮收勒索',
-u'俯首弭耳',
-u'福壽綿長',
-u'福壽綿綿',
-u'福壽年高',
-u'福壽齊天',
-u'俯首受命',
-u'福壽雙全',
-u'福壽天成',
-u'福壽天齊',
-u'伏首貼耳',
-u'俯首聽命',
-u'覆手爲雨',
-u'福壽無疆',
-u'俯首系頸',
-u'俯首下心',
-u'膚受之愬',
-u'膚受之訴',
-u'膚受之言',
-u'覆霜秘境',
-u'覆水不收',
-u'覆水難收',
-u'俯順輿情',
-u'腹笥便便',
-u'腹笥宏富',
-u'赴死如歸',
-u'腹笥甚廣',
-u'腹笥甚儉',
-u'覆餗偾轅',
-u'膚粟股栗',
-u'覆餗折足',
-u'複蘇之風',
-u'覆餗之患',
-u'複蘇之霧',
-u'覆餗之釁',
-u'覆餗之憂',
-u'夫随婦唱',
-u'撫綏萬方',
-u'俯遂幽眇',
-u'福孫蔭子',
-u'腹坦東床',
-u'赴湯蹈火',
-u'赴湯跳火',
-u'赴湯投火',
-u'服田力穑',
-u'扶同诖誤',
-u'扶同捏合',
-u'扶同硬證',
-u'斧頭打釘釘入木',
-u'浮頭滑腦',
-u'負圖之托',
-u'覆亡無日',
-u'扶危持顛',
-u'扶危持傾',
-u'扶危定亂',
-u'扶危定傾',
-u'腹爲飯坑',
-u'福爲禍始',
-u'福爲禍先',
-u'扶危濟急',
-u'扶危濟困',
-u'扶危救困',
-u'伏維尚飨',
-u'腹爲笥箧',
-u'扶危翼傾',
-u'扶危拯溺',
-u'撫慰之沙',
-u'父爲子隐',
-u'浮文巧語',
-u'福無十全',
-u'福無雙至',
-u'福無雙至禍不單行',
-u'福無雙至鄉禍不單行',
-u'福兮禍所伏',
-u'福兮禍所伏禍兮福所倚',
-u'父析子荷',
-u'附下罔上',
-u'赴險如夷',
-u'浮想聯翩',
-u'腹心大臣',
-u'負薪構堂',
-u'腹心股肱',
-u'負薪挂角',
-u'負薪救火',
-u'腹心内爛',
-u'拊心泣血',
-u'腐心切齒',
-u'負心違願',
-u'腹心相照',
-u'腹心之病',
-u'負薪之才',
-u'腹心之臣',
-u'腹心之患',
-u'腹心之疾',
-u'負薪之言',
-u'負薪之議',
-u'腹心之友',
-u'負薪之資',
-u'撫心自問',
-u'福星高照',
-u'撫胸呼天',
-u'拂袖而歸',
-u'拂袖而起',
-u'拂袖而去',
-u'負暄思獻',
-u'負暄獻禦',
-u'負暄之獻',
-u'夫學須志也',
-u'輔牙相倚',
-u'敷衍了事',
-u'敷衍門面',
-u'附炎趨熱',
-u'敷衍塞責',
-u'婦言是行',
-u'婦言是用',
-u'敷衍搪塞',
-u'浮言虛論',
-u'複言重諾',
-u'父嚴子孝',
-u'俯仰從人',
-u'俯仰随人',
-u'俯仰随時',
-u'俯仰随俗',
-u'俯仰唯唯',
-u'俯仰無愧',
-u'俯仰無主',
-u'俯仰異觀',
-u'俯仰一世',
-u'俯仰由人',
-u'俯仰于人',
-u'俯仰之間',
-u'扶搖而上',
-u'扶搖萬裏',
-u'扶搖直上',
-u'福業相牽',
-u'父一輩子一輩',
-u'浮以大白',
-u'拂衣而起',
-u'黼衣方領',
-u'福倚禍伏',
-u'拊翼俱起',
-u'蝠翼蠻牛',
-u'父義母慈',
-u'附翼攀鱗',
-u'負義忘恩',
-u'拂衣遠去',
-u'孚尹明達',
-u'孚尹旁達',
-u'撫膺頓足',
-u'附影附聲',
-u'伏膺函丈',
-u'拊膺切齒',
-u'撫膺之痛',
-u'附庸風雅',
-u'蜉蝣測天',
-u'婦有長舌',
-u'富有成效',
-u'蜉蝣撼大樹',
-u'腹有良策',
-u'浮遊磷光',
-u'腹有鱗甲',
-u'浮遊冥光',
-u'富有四海',
-u'福由心造',
-u'浮遊熒光',
-u'蜉蝣在世',
-u'蜉蝣之命',
-u'富于春秋',
-u'付與東流',
-u'覆雨翻雲',
-u'扶餘海外',
-u'釜魚幕燕',
-u'福與天齊',
-u'負隅頑抗',
-u'浮語虛辭',
-u'付與一炬',
-u'負嵎依險',
-u'付與一笑',
-u'負隅依阻',
-u'釜魚甑塵',
-u'覆盂之安',
-u'覆盂之固',
-u'覆育子弟',
-u'複原請求',
-u'斧钺湯镬',
-u'斧钺之人',
-u'鈇钺之誅',
-u'浮雲蔽日',
-u'浮雲富貴',
-u'浮雲驚龍',
-u'浮雲世态',
-u'浮雲翳日',
-u'浮雲朝露',
-u'複雜事務',
-u'鵩在承塵',
-u'富在深山有遠親',
-u'腹載五車',
-u'覆載之下',
-u'富在知足',
-u'負債累累',
-u'父債子償',
-u'父債子還',
-u'浮湛連蹇',
-u'撫掌大笑',
-u'撫掌歡笑',
-u'撫掌擊節',
-u'敷張揚厲',
-u'覆轍重蹈',
-u'輔正除邪',
-u'複政厥辟',
-u'扶正祛邪',
-u'付之丙丁',
-u'付之東流',
-u'付之度外',
-u'扶植綱常',
-u'付之梨棗',
-u'付之流水',
-u'傅緻其罪',
-u'付之逝波',
-u'付之逝水',
-u'福至心靈',
-u'福至性靈',
-u'付之一炬',
-u'付之一哂',
-u'付之一歎',
-u'付之一笑',
-u'鈇質之誅',
-u'腹中兵甲',
-u'負重含污',
-u'腹中鱗甲',
-u'負重涉遠',
-u'釜中生塵',
-u'釜中生魚',
-u'負重吞污',
-u'釜中遊魚',
-u'釜中之魚',
-u'負重緻遠',
-u'覆舟載舟',
-u'覆舟之戒',
-u'付諸東流',
-u'付諸度外',
-u'付諸洪喬',
-u'賦芧戲狙',
-u'付諸一炬',
-u'付諸一笑',
-u'附贅縣疣',
-u'附贅懸肬',
-u'父紫兒朱',
-u'父子和而家不退',
-u'複子明辟',
-u'父子無隔宿之仇',
-u'父子一體',
-u'夫子之牆',
-u'夫子自道',
-u'覆宗絕嗣',
-u'浮蹤浪迹',
-u'覆宗滅祀',
-u'負阻不賓',
-u'負罪引慝',
-u'夫尊妻貴',
-u'改步改玉',
-u'蓋不由己',
-u'改操易節',
-u'改朝換代',
-u'改朝換姓',
-u'該吃九升不吃一鬥',
-u'蓋地而來',
-u'改地換天',
-u'改惡從善',
-u'改惡爲善',
-u'改惡向善',
-u'改惡行善',
-u'改而更張',
-u'蓋棺定論',
-u'蓋棺定谥',
-u'蓋棺論定',
-u'蓋棺事定',
-u'蓋棺事了',
-u'蓋棺事完',
-u'蓋棺事已',
-u'改過不吝',
-u'改過從善',
-u'改過從新',
-u'改過遷善',
-u'改過自新',
-u'改過作新',
-u'改換家門',
-u'改換門闾',
-u'改換門楣',
-u'改換門庭',
-u'改換頭面',
-u'改節易操',
-u'改進調頻',
-u'改柯易節',
-u'改柯易葉',
-u'改口沓舌',
-u'改梁換柱',
-u'改名換姓',
-u'改名易姓',
-u'概莫能外',
-u'改曲易調',
-u'概日淩雲',
-u'改容更貌',
-u'改容易貌',
-u'改是成非',
-u'蓋世無雙',
-u'蓋世英雄',
-u'蓋世之才',
-u'改俗遷風',
-u'改天換地',
-u'改頭換面',
-u'改頭換尾',
-u'改途易轍',
-u'改往修來',
-u'改弦更張',
-u'改弦易調',
-u'改弦易張',
-u'改弦易轍',
-u'改邪歸正',
-u'改行從善',
-u'改姓更名',
-u'改行遷善',
-u'改行爲善',
-u'改姓易代',
-u'改行自新',
-u'改玉改步',
-u'改玉改行',
-u'改轅易轍',
-u'改張易調',
-u'改轍易途',
-u'改政移風',
-u'改柱張弦',
-u'敢把皇帝拉下馬',
-u'幹巴利脆',
-u'幹巴利落',
-u'甘敗下風',
-u'敢不承命',
-u'敢布腹心',
-u'敢不如命',
-u'敢不聽命',
-u'敢不唯命',
-u'幹柴烈火',
-u'幹柴遇烈火',
-u'肝腸迸裂',
-u'肝腸寸斷',
-u'肝腸寸絕',
-u'肝腸寸裂',
-u'肝腸斷絕',
-u'肝腸欲斷',
-u'幹城之寄',
-u'幹城之将',
-u'幹愁萬斛',
-u'甘處下流',
-u'甘脆肥醲',
-u'幹脆利落',
-u'幹脆利索',
-u'幹打雷不下雨',
-u'感戴二天',
-u'感戴莫名',
-u'肝膽楚越',
-u'肝膽寸斷',
-u'肝膽過人',
-u'肝膽胡越',
-u'肝膽俱全',
-u'肝膽輪囷',
-u'肝膽披瀝',
-u'肝膽秦越',
-u'肝膽塗地',
-u'肝膽相見',
-u'肝膽向人',
-u'肝膽相向',
-u'肝膽相照',
-u'肝膽欲碎',
-u'肝膽照人',
-u'幹得好不如嫁得好',
-u'感德無涯',
-u'幹的早不如幹的巧',
-u'幹端坤倪',
-u'感恩戴德',
-u'感恩戴義',
-u'感恩荷德',
-u'感恩懷德',
-u'感恩圖報',
-u'甘分随時',
-u'甘分随緣',
-u'幹父之蠱',
-u'幹幹翼翼',
-u'幹戈不息',
-u'幹戈蠻觸',
-u'幹戈滿地',
-u'幹戈滿目',
-u'幹戈滿眼',
-u'幹戈相見',
-u'幹戈載戢',
-u'幹戈征戰',
-u'幹骨頭上榨油',
-u'甘瓜苦蒂',
-u'幹國之器',
-u'幹活不由東累死也無功',
-u'感激不盡',
-u'感激流涕',
-u'感極涕零',
-u'感激涕泗',
-u'幹将莫邪',
-u'敢叫日月換新天',
-u'感今懷昔',
-u'感今念昔',
-u'趕盡殺絕',
-u'感今思昔',
-u'感今惟昔',
-u'幹淨利落',
-u'幹淨利索',
-u'甘井先竭',
-u'甘酒嗜音',
-u'感舊之哀',
-u'甘居人後',
-u'甘居下流',
-u'幹君何事',
-u'感慨激昂',
-u'感慨殺身',
-u'感慨萬端',
-u'感慨萬千',
-u'感慨系之',
-u'甘苦與共',
-u'感喟不置',
-u'感愧無地',
-u'幹理敏捷',
-u'甘冒虎口',
-u'幹名采譽',
-u'幹名犯義',
-u'感銘肺腑',
-u'感銘心切',
-u'感慕纏懷',
-u'肝腦塗地',
-u'敢怒不敢言',
-u'敢怒而不敢言',
-u'敢怒敢言',
-u'感佩交并',
-u'甘貧苦節',
-u'甘貧樂道',
-u'甘貧守分',
-u'甘貧守節',
-u'幹卿底事',
-u'幹卿何事',
-u'幹卿甚事',
-u'感情用事',
-u'甘泉必竭',
-u'感染撕咬',
-u'感染之刺',
-u'感染之傷',
-u'趕人不可趕上',
-u'感人肺腑',
-u'感人肺肝',
-u'感人心脾',
-u'感深肺腑',
-u'感時撫事',
-u'甘食好衣',
-u'趕屍教衆',
-u'甘食美衣',
-u'旰食宵衣',
-u'旰食之勞',
-u'甘死如饴',
-u'肝髓流野',
-u'幹苔外套',
-u'甘棠遺愛',
-u'甘棠之愛',
-u'甘棠之惠',
-u'幹啼濕哭',
-u'感天動地',
-u'感同身受',
-u'竿頭進步',
-u'竿頭日進',
-u'竿頭日上',
-u'竿頭一步',
-u'竿頭直上',
-u'敢爲敢做',
-u'甘爲戎首',
-u'敢想敢說',
-u'幹霄蔽日',
-u'幹霄薄雲',
-u'幹霄拂雲',
-u'幹霄淩雲',
-u'感心動耳',
-u'甘心鈇钺',
-u'甘心樂意',
-u'甘心瞑目',
-u'甘心情原',
-u'甘心如荠',
-u'甘心若荠',
-u'肝心若裂',
-u'甘心首疾',
-u'肝心塗地',
-u'甘馨之費',
-u'趕鴨子上架',
-u'甘言好辭',
-u'甘言厚币',
-u'甘言厚禮',
-u'甘言媚詞',
-u'甘言美語',
-u'甘言密語',
-u'甘言巧辭',
-u'敢勇當先',
-u'幹魚給貓做枕頭',
-u'甘雨随車',
-u'感遇忘身',
-u'幹雲蔽日',
-u'幹燥無味',
-u'旰昃之勞',
-u'甘蔗沒有兩頭甜',
-u'趕着鴨子上架',
-u'感知惡魔',
-u'甘旨肥濃',
-u'甘之如荠',
-u'甘之如饴',
-u'甘之若素',
-u'甘之若饴',
-u'感知亡靈',
-u'感篆五中',
-u'敢作敢當',
-u'敢作敢爲',
-u'剛愎自任',
-u'剛愎自用',
-u'剛褊自用',
-u'剛腸嫉惡',
-u'綱常名教',
-u'綱常掃地',
-u'剛出狼窩又入虎口',
-u'鋼刀雖利不斬無罪之人',
-u'扛鼎拔山',
-u'綱紀廢弛',
-u'綱紀四方',
-u'鋼澆鐵鑄',
-u'鋼筋鐵骨',
-u'綱舉目疏',
-u'綱舉目張',
-u'剛克柔克',
-u'剛戾自用',
-u'剛陵嫉惡',
-u'綱目不疏',
-u'綱挈目張',
-u'剛柔相濟',
-u'綱提領挈',
-u'鋼鐵意志',
-u'鋼鐵勇氣',
-u'崗頭澤底',
-u'剛毅木讷',
-u'剛正不阿',
-u'剛正無私',
-u'剛直不阿',
-u'剛中柔外',
-u'鋼鬃營地',
-u'告哀乞憐',
-u'高岸深谷',
-u'高傲之刺',
-u'高傲自大',
-u'高壁深壘',
-u'高壁深塹',
-u'高标逸韻',
-u'高标卓識',
-u'高不成低不就',
-u'高不湊低不就',
-u'高不可登',
-u'高不可及',
-u'高不可攀',
-u'高步闊視',
-u'高步通衢',
-u'高步雲衢',
-u'高才飽學',
-u'高才博學',
-u'高才大德',
-u'高才大學',
-u'高才疾足',
-u'高才捷足',
-u'高才絕學',
-u'高材碩望',
-u'高才碩學',
-u'高才遠識',
-u'高才卓識',
-u'高唱入雲',
-u'膏場繡浍',
-u'高車大馬',
-u'膏車秣馬',
-u'高車驷馬',
-u'高城深池',
-u'高城深溝',
-u'高城深塹',
-u'高出一籌',
-u'高出雲表',
-u'高出雲霄',
-u'膏唇販舌',
-u'膏唇岐舌',
-u'膏唇試舌',
-u'告貸無門',
-u'高蹈獨善',
-u'高蹈遠舉',
-u'高蹈遠去',
-u'高蹈遠引',
-u'高德瑞克',
-u'高低不就',
-u'高遏行雲',
-u'高而不危',
-u'高飛遠遁',
-u'高飛遠集',
-u'高飛遠舉',
-u'高飛遠翔',
-u'高飛遠走',
-u'高風大節',
-u'高風勁節',
-u'高風峻節',
-u'高風苦節',
-u'高風亮節',
-u'高風偉節',
-u'高風逸韻',
-u'高鳳自穢',
-u'高高挂起',
-u'高高在上',
-u'高歌猛進',
-u'櫜弓戢戈',
-u'櫜弓戢矢',
-u'櫜弓卧鼓',
-u'槁骨腐肉',
-u'高顧遐視',
-u'高冠博帶',
-u'高官不如高薪',
-u'高官大祿',
-u'高官厚祿',
-u'高官極品',
-u'高官顯爵',
-u'高官重祿',
-u'高官尊爵',
-u'高貴胸針',
-u'膏肓泉石',
-u'膏肓之病',
-u'膏肓之疾',
-u'膏火之費',
-u'膏火自焚',
-u'膏火自煎',
-u'櫜甲束兵',
-u'高見遠識',
-u'高階督軍',
-u'高階邏輯',
-u'高節邁俗',
-u'高節清風',
-u'高階語言',
-u'高階之靴',
-u'高舉深藏',
-u'高居深拱',
-u'高居深視',
-u'高舉遠蹈',
-u'高舉遠去',
-u'高舉遠引',
-u'高爵大權',
-u'高爵豐祿',
-u'高爵厚祿',
-u'高爵顯位',
-u'高爵重祿',
-u'告老還家',
-u'告老還鄉',
-u'告老在家',
-u'高壘深壁',
-u'高壘深溝',
-u'高壘深塹',
-u'膏梁錦繡',
-u'膏梁年少',
-u'膏梁纨袴',
-u'膏梁文繡',
-u'膏梁之性',
-u'膏梁之子',
-u'膏梁子弟',
-u'高門大戶',
-u'高門大屋',
-u'高門大宅',
-u'高門大族',
-u'高門巨族',
-u'高名大姓',
-u'高明婦人',
-u'高明遠見',
-u'高明遠識',
-u'槁木寒灰',
-u'槁木死灰',
-u'高睨大談',
-u'高鳥盡良弓藏',
-u'高朋滿座',
-u'高棋輸頭盤',
-u'高情厚愛',
-u'高情厚誼',
-u'高情邁俗',
-u'高情逸态',
-u'高情逸興',
-u'高情遠意',
-u'高情遠韻',
-u'高情遠緻',
-u'高人勝士',
-u'高人雅士',
-u'高人雅緻',
-u'高人一籌',
-u'高人一等',
-u'高人逸士',
-u'高人一着',
-u'高入雲霄',
-u'高山大野',
-u'高山景行',
-u'高山峻嶺',
-u'高山流水',
-u'高山密林',
-u'高山仰之',
-u'高山野林',
-u'高山重嶂',
-u'高深莫測',
-u'搞是搞好了',
-u'高世駭俗',
-u'高視闊步',
-u'高識遠度',
-u'高識遠見',
-u'高世之才',
-u'高世之德',
-u'高世之度',
-u'锆石指環',
-u'高世之行',
-u'高世之智',
-u'高世之主',
-u'高手出招穩如山',
-u'告朔饩羊',
-u'告朔羊存',
-u'高聳入雲',
-u'槁蘇暍醒',
-u'高擡貴手',
-u'高台厚榭',
-u'高擡明鏡',
-u'高談大論',
-u'高談弘論',
-u'高談劇論',
-u'高談闊論',
-u'高譚清論',
-u'高談危論',
-u'高談雄辯',
-u'高談虛辭',
-u'高談虛論',
-u'高談雅步',
-u'高堂大廈',
-u'高堂廣廈',
-u'高天厚地',
-u'高亭大榭',
-u'高頭大馬',
-u'高頭講章',
-u'高頭駿馬',
-u'告往知來',
-u'高位厚祿',
-u'高位重祿',
-u'高文大冊',
-u'高文典冊',
-u'高文宏議',
-u'高文雅典',
-u'高卧東山',
-u'高屋建瓴',
-u'高下其手',
-u'高下任心',
-u'高下在口',
-u'高下在手',
-u'高下在心',
-u'槁項黃馘',
-u'槁項黧馘',
-u'槁項沒齒',
-u'高翔遠引',
-u'高翔遠翥',
-u'高薪不如高興',
-u'高姓大名',
-u'高興而來掃興而歸',
-u'槁形灰心',
-u'高懸明鏡',
-u'高懸秦鏡',
-u'高牙大纛',
-u'高雅閑淡',
-u'高陽公子',
-u'高陽酒徒',
-u'高陽狂客',
-u'羔羊素絲',
-u'高陽徒侶',
-u'羔羊之義',
-u'高業弟子',
-u'高義薄雲天',
-u'高義薄雲',
-u'高義溥天',
-u'膏腴貴遊',
-u'膏腴之地',
-u'膏腴之壤',
-u'膏腴子弟',
-u'高原小徑',
-u'膏澤脂香',
-u'高齋學士',
-u'高瞻遠矚',
-u'高漲士氣',
-u'高掌遠跖',
-u'高者未必賢',
-u'高枕安寝',
-u'高枕安卧',
-u'高枕不虞',
-u'高枕而卧',
-u'高枕無事',
-u'高枕勿憂',
-u'高枕無虞',
-u'高峙嶽立',
-u'高躅大年',
-u'缟纻之交',
-u'高自标表',
-u'高自标持',
-u'高自标樹',
-u'高自标譽',
-u'高自标置',
-u'高自驕大',
-u'高自期許',
-u'高足弟子',
-u'高祖紀上',
-u'割愛見遺',
-u'各安本業',
-u'隔岸觀火',
-u'各安生理',
-u'各安生業',
-u'各霸一方',
-u'各白世人',
-u'各抱一角',
-u'各奔前程',
-u'隔壁撺椽',
-u'割臂盟公',
-u'隔壁聽話',
-u'割臂同盟',
-u'隔壁有耳',
-u'割臂之盟',
-u'各別另樣',
-u'胳膊擰不過大腿',
-u'胳膊擰不過大腿去',
-u'割剝元元',
-u'胳膊折了往袖子裏藏',
-u'胳膊肘兒往外撇',
-u'胳膊肘往外扭',
-u'各不相犯',
-u'各不相顧',
-u'各不相關',
-u'各不相謀',
-u'各不相讓',
-u'格不相入',
-u'各不相下',
-u'隔層肚皮隔層山',
-u'各騁所長',
-u'各持己見',
-u'各出己見',
-u'隔窗有耳',
-u'各從其類',
-u'各從其志',
-u'各從所好',
-u'隔代教育',
-u'各得其所',
-u'各得其宜',
-u'割地稱臣',
-u'割地求和',
-u'割肚牽腸',
-u'歌遏行雲',
-u'割恩斷義',
-u'隔二偏三',
-u'革凡成聖',
-u'革凡登聖',
-u'革風易俗',
-u'革剛則裂',
-u'格高意遠',
-u'格格不納',
-u'格格不入',
-u'格格不吐',
-u'各個擊破',
-u'歌功頌德',
-u'革故鼎新',
-u'革故立新',
-u'割股療親',
-u'格古通今',
-u'歌鼓喧天',
-u'割股之心',
-u'隔行不斷',
-u'隔行如隔山',
-u'各懷一心',
-u'割雞焉用牛刀',
-u'革奸鏟暴',
-u'各竭所長',
-u'各盡其長',
-u'各盡其妙',
-u'各盡其用',
-u'各盡所能',
-u'割襟之盟',
-u'革舊從新',
-u'革舊鼎新',
-u'各就各位',
-u'革舊圖新',
-u'革舊維新',
-u'割據稱雄',
-u'葛屦履霜',
-u'割據一方',
-u'隔闊相思',
-u'割裂傷口',
-u'歌樓舞館',
-u'歌樓舞榭',
-u'葛蔓糾結',
-u'各門各戶',
-u'各門另戶',
-u'革面革心',
-u'革面斂手',
-u'革面悛心',
-u'革面洗心',
-u'革命創制',
-u'革命反正',
-u'隔年皇曆',
-u'隔皮斷貨',
-u'各辟蹊徑',
-u'各憑本事',
-u'隔牆還有耳',
-u'隔牆有耳',
-u'各取所長',
-u'各取所需',
-u'各人的夢各人圓',
-u'各人自掃門前雪',
-u'各人自掃門前雪莫管他家瓦上霜',
-u'各人自掃門前雪莫管他人瓦上霜',
-u'各人自掃門前雪休管他人瓦上霜',
-u'割肉補瘡',
-u'割肉飼虎',
-u'各如其意',
-u'各色各樣',
-u'各色名樣',
-u'各色人等',
-u'格殺不論',
-u'格殺弗論',
-u'格殺勿論',
-u'隔山打炮',
-u'隔山買老牛',
-u'各擅所長',
-u'歌扇舞衫',
-u'各什各物',
-u'各伸己見',
-u'歌聲繞梁',
-u'各師父各傳授',
-u'各式各樣',
-u'隔世之感',
-u'各守其分',
-u'各抒己見',
-u'各抒己意',
-u'各抒所見',
-u'各司其事',
-u'歌頌功德',
-u'各随其好',
-u'歌台舞榭',
-u'個體标識',
-u'革圖易慮',
-u'各爲其主',
-u'歌舞承平',
-u'隔屋撺椽',
-u'隔霧看花',
-u'格物窮理',
-u'歌舞升平',
-u'歌舞太平',
-u'格物緻知',
-u'割席斷交',
-u'割席分坐',
-u'割席絕交',
-u'各顯其能',
-u'各顯神通',
-u'革邪反正',
-u'革新變舊',
-u'革心易行',
-u'個性标記',
-u'各行其是',
-u'各行其志',
-u'割須棄袍',
-u'隔靴爬癢',
-u'隔靴搔癢',
-u'隔靴抓癢',
-u'各言其志',
-u'各以類推',
-u'各衣另飯',
-u'各異其趣',
-u'各宜守己',
-u'歌吟笑呼',
-u'歌莺舞燕',
-u'歌詠升平',
-u'各有千古',
-u'各有千秋',
-u'各有所長',
-u'各有所短',
-u'各有所好',
-u'各有所見',
-u'各有所能',
-u'各有所職',
-u'格于成例',
-u'歌于斯哭于斯',
-u'各展其長',
-u'隔着皮兒看不見穰兒',
-u'各執己見',
-u'革職留任',
-u'革職拿問',
-u'各執所見',
-u'各執一詞',
-u'個中好手',
-u'個中妙趣',
-u'個中三昧',
-u'個中消息',
-u'個中之人',
-u'個中滋味',
-u'各自東西',
-u'各自獨立',
-u'各自進行',
-u'各自爲謀',
-u'各自爲戰',
-u'各自爲政',
-u'各自一家',
-u'給個棒棰就當針',
-u'給個棒槌就當針認',
-u'給人小鞋兒穿',
-u'根椽片瓦',
-u'根柢未深',
-u'亘古不滅',
-u'亘古亘今',
-u'根孤伎薄',
-u'亘古及今',
-u'亘古奇聞',
-u'亘古示有',
-u'亘古通今',
-u'亘古未聞',
-u'亘古未有',
-u'亘古新聞',
-u'根基圖騰',
-u'根結盤固',
-u'根結盤據',
-u'根據槃互',
-u'根牢蒂固',
-u'根連株拔',
-u'根連株逮',
-u'根盤蒂結',
-u'根蟠節錯',
-u'根深本固',
-u'根深不怕風搖動',
-u'根深蒂固',
-u'根深蒂結',
-u'根深固本',
-u'根深葉蕃',
-u'根深葉茂',
-u'根深枝茂',
-u'根生土長',
-u'根牙盤錯',
-u'跟着好人學好人',
-u'根株附麗',
-u'根株結盤',
-u'根株牽連',
-u'根壯樹茂',
-u'根壯樹難老',
-u'根壯葉茂',
-u'更唱叠和',
-u'更長漏永',
-u'更長夢短',
-u'更待幹罷',
-u'更待乾罷',
-u'耕當問奴',
-u'绠短汲深',
-u'绠短絕泉',
-u'梗泛萍飄',
-u'耿耿此心',
-u'耿耿寸心',
-u'耿耿有懷',
-u'耿耿于懷',
-u'耿耿于心',
-u'耿耿在抱',
-u'耿耿在心',
-u'耿耿在臆',
-u'耿耿忠心',
-u'庚癸頻呼',
-u'庚癸之呼',
-u'梗迹蓬飄',
-u'梗迹萍蹤',
-u'耕稼陶漁',
-u'更進一竿',
-u'耕九餘三',
-u'更闌人靜',
-u'羹裏不着飯裏着',
-u'羹藜含糗',
-u'羹裏來飯裏去',
-u'更難仆數',
-u'耕牛爲主遭鞭打',
-u'更仆難盡',
-u'更仆難數',
-u'更仆難終',
-u'更仆未馨',
-u'羹牆之悲',
-u'羹牆之思',
-u'耕三餘一',
-u'更上一層樓',
-u'更深人靜',
-u'更深夜靜',
-u'梗頑不化',
-u'更無長物',
-u'更無短計消長日',
-u'更弦改轍',
-u'更弦易轍',
-u'更新換代',
-u'更姓改名',
-u'更姓改物',
-u'哽噎難鳴',
-u'哽咽難言',
-u'更有早行人',
-u'耕耘樹藝',
-u'功敗垂成',
-u'公報私雠',
-u'拱壁導能',
-u'拱壁陷阱',
-u'功标青史',
-u'功薄蟬翼',
-u'功不補患',
-u'功不成名不就',
-u'供不敷求',
-u'攻不可破',
-u'弓不虛發',
-u'供不應求',
-u'公才公望',
-u'功參造化',
-u'弓藏鳥盡',
-u'躬操井臼',
-u'宮車晚出',
-u'宮車晚駕',
-u'宮車晏駕',
-u'功臣自居',
-u'功成不居',
-u'攻城奪地',
-u'功成弗居',
-u'功成骨枯',
-u'攻城掠地',
-u'功成名就',
-u'功成名立',
-u'功成名遂',
-u'功成身退',
-u'功成事立',
-u'功成行滿',
-u'攻城徇地',
-u'功成業就',
-u'攻城野戰',
-u'功成者隳',
-u'功崇德钜',
-u'觥籌交錯',
-u'觥籌交舉',
-u'工愁善病',
-u'功垂竹帛',
-u'共存共榮',
-u'攻大磨堅',
-u'公道不公道自有天知道',
-u'公道大明',
-u'公道合理',
-u'公道難明',
-u'躬蹈矢石',
-u'公道在人心',
-u'功到自然成',
-u'功德兼隆',
-u'功德無量',
-u'功德圓滿',
-u'功堕垂成',
-u'恭而敬之',
-u'公而忘私',
-u'公而忘私國而忘家',
-u'恭而有禮',
-u'功廢垂成',
-u'躬逢其盛',
-u'躬逢盛典',
-u'躬逢勝餞',
-u'躬逢盛事',
-u'功夫之王',
-u'功蓋天地',
-u'功蓋天下',
-u'功高不賞',
-u'功高蓋世',
-u'功高望重',
-u'功高震主',
-u'躬耕樂道',
-u'功狗功人',
-u'共貫同條',
-u'公規密谏',
-u'供過于求',
-u'攻過箴阙',
-u'恭賀新禧',
-u'公候肚裏好撐船',
-u'恭候台光',
-u'公侯勳衛',
-u'躬擐甲胄',
-u'共濟世業',
-u'公雞下蛋母雞打鳴',
-u'拱肩縮背',
-u'恭敬不如從命',
-u'恭敬桑梓',
-u'功就名成',
-u'功均天地',
-u'弓開得勝',
-u'攻苦茹酸',
-u'攻苦食啖',
-u'攻苦食儉',
-u'功虧一篑',
-u'功勞汗馬',
-u'工力悉敵',
-u'功烈震主',
-u'宮鄰金虎',
-u'公買公賣',
-u'躬冒矢石',
-u'公門裏頭好修行',
-u'公門桃李',
-u'公門有公',
-u'公民長袍',
-u'功名不朽',
-u'功名蹭蹬',
-u'功名成就',
-u'功名富貴',
-u'功名蓋世',
-u'功名利祿',
-u'功名仕進',
-u'共鳴水晶',
-u'功名淹蹇',
-u'公明正大',
-u'拱默屍祿',
-u'恭默守靜',
-u'弓弩精通',
-u'公平合理',
-u'公平交易',
-u'公平無私',
-u'公平正直',
-u'攻其不備',
-u'攻其不備出其不意',
-u'功其無備',
-u'攻其一點',
-u'攻其一點不及其馀',
-u'宮牆重仞',
-u'攻人不備',
-u'功若丘山',
-u'共商國是',
-u'弓上弦刀出鞘',
-u'公事公辦',
-u'公是公非',
-u'公事稽程',
-u'弓手殘骨',
-u'拱手垂裳',
-u'拱手低眉',
-u'拱手而取',
-u'拱手而降',
-u'拱手加額',
-u'拱手讓人',
-u'拱手聽命',
-u'攻守同盟',
-u'拱手投降',
-u'拱手無措',
-u'拱手相讓',
-u'功首罪魁',
-u'公說公有理',
-u'公說公有理婆說婆有理',
-u'公私分明',
-u'公私兼顧',
-u'公私交困',
-u'公私兩便',
-u'公私兩濟',
-u'公私兩利',
-u'公私蝟集',
-u'功遂身退',
-u'公孫布被',
-u'公孫劍器',
-u'躬體力行',
-u'弓調馬服',
-u'公聽并觀',
-u'共同禁锢',
-u'功同賞異',
-u'共挽鹿車',
-u'功完行滿',
-u'共爲唇齒',
-u'攻無不克',
-u'攻無不克戰無不勝',
-u'攻無不取',
-u'攻無不取戰無不勝',
-u'攻無不勝',
-u'攻瑕蹈隙',
-u'攻瑕索垢',
-u'攻瑕指失',
-u'躬先表率',
-u'躬先士卒',
-u'共享白闆',
-u'共相标榜',
-u'共相唇齒',
-u'共襄盛舉',
-u'攻心扼吭',
-u'攻心爲上',
-u'躬行節儉',
-u'躬行實踐',
-u'龔行天罰',
-u'公行無忌',
-u'功行圓滿',
-u'公修公得婆修婆得',
-u'公羊産子',
-u'工業标準體系結構',
-u'弓冶箕裘',
-u'供一茶之用',
-u'功一美二',
-u'宮移羽換',
-u'拱挹指麾',
-u'弓影杯蛇',
-u'弓影浮杯',
-u'汞禹彈冠',
-u'工欲善其事',
-u'工欲善其事必先利其器',
-u'貢禹彈冠',
-u'功在漏刻',
-u'弓折刀盡',
-u'公正不阿',
-u'公正廉潔',
-u'公正廉明',
-u'公正審判',
-u'公正無私',
-u'公正嚴明',
-u'共枝別幹',
-u'公之同好',
-u'公直無私',
-u'公之于衆',
-u'公忠體國',
-u'公諸世人',
-u'公諸同好',
-u'功墜垂成',
-u'躬自菲薄',
-u'公子王孫',
-u'公子無腸',
-u'攻子之盾',
-u'苟安一隅',
-u'狗傍人勢',
-u'夠不夠四十六',
-u'苟存殘喘',
-u'苟存延喘',
-u'狗逮老鼠',
-u'狗黨狐朋',
-u'狗黨狐群',
-u'狗盜雞鳴',
-u'狗盜雞啼',
-u'狗盜鼠竊',
-u'狗顛屁股',
-u'狗顛屁股似的',
-u'狗窦大開',
-u'狗惡酒酸',
-u'狗吠不驚',
-u'狗吠非主',
-u'狗肺狼心',
-u'狗吠之警',
-u'狗苟蠅營',
-u'诟龜呼天',
-u'狗鬼聽提',
-u'苟合取容',
-u'勾魂攝魄',
-u'篝火狐鳴',
-u'狗急亂咬人',
-u'狗急蓦牆',
-u'狗急跳牆',
-u'鈎金輿羽',
-u'苟克祭壇',
-u'狗口裏生不出象牙',
-u'狗口裏吐不出象牙',
-u'苟留殘喘',
-u'狗馬聲色',
-u'狗馬之心',
-u'溝滿壕平',
-u'狗猛酒酸',
-u'垢面蓬頭',
-u'狗拿耗子',
-u'狗屁不通',
-u'狗皮膏藥',
-u'苟且偷安',
-u'苟且偷生',
-u'苟且因循',
-u'苟且之心',
-u'苟全性命',
-u'苟容曲從',
-u'诟如不聞',
-u'鈎深極奧',
-u'溝深壘高',
-u'鈎深索隐',
-u'鈎深圖遠',
-u'鈎深緻遠',
-u'垢谇謠诼',
-u'鈎索羅織',
-u'狗頭軍師',
-u'狗頭生角',
-u'狗頭鼠腦',
-u'狗偷鼠竊',
-u'鈎網法術',
-u'狗尾貂續',
-u'狗尾續貂',
-u'鈎心鬥角',
-u'狗心狗行',
-u'鈎心攝魄',
-u'狗行狼心',
-u'狗續貂尾',
-u'狗續侯冠',
-u'狗續金貂',
-u'鈎玄獵秘',
-u'鈎玄提要',
-u'狗血淋頭',
-u'狗血噴頭',
-u'苟延殘喘',
-u'苟延殘息',
-u'苟延喘息',
-u'狗眼看人',
-u'苟延一息',
-u'狗咬醜的',
-u'狗咬骨頭不松口',
-u'狗咬呂洞賓',
-u'狗搖尾巴讨歡心',
-u'鈎隐抉微',
-u'勾元提要',
-u'鈎元摘秘',
-u'狗仗官勢',
-u'鈎章棘句',
-u'狗仗人勢',
-u'鈎爪鋸牙',
-u'狗彘不如',
-u'狗彘不若',
-u'狗彘不食',
-u'狗彘不直',
-u'狗彘之行',
-u'溝中之瘠',
-u'鈎輈格磔',
-u'狗追耗子',
-u'狗走狐淫',
-u'狗嘴裏吐不出象牙',
-u'狗嘴裏吐不出象牙來',
-u'狗嘴吐不出象牙',
-u'孤傲不群',
-u'顧彼忌此',
-u'固壁清野',
-u'顧彼失此',
-u'孤标傲世',
-u'孤标獨步',
-u'孤标峻節',
-u'固不可徹',
-u'固不相熟習',
-u'固步自封',
-u'故步自畫',
-u'蠱虿之讒',
-u'骨顫肉驚',
-u'孤臣孽子',
-u'孤俦寡匹',
-u'孤雛腐鼠',
-u'鼓吹喧阗',
-u'鼓唇弄舌',
-u'鼓唇搖舌',
-u'鼓唇咋舌',
-u'孤雌寡鶴',
-u'顧此失彼',
-u'锢聰塞明',
-u'古道熱腸',
-u'鼓刀屠者',
-u'孤燈挑盡',
-u'古調不彈',
-u'古調單彈',
-u'古調獨彈',
-u'孤犢觸乳',
-u'孤獨鳏寡',
-u'蠱毒瘴疠',
-u'辜恩背義',
-u'孤恩負德',
-u'辜恩負義',
-u'孤兒寡婦',
-u'顧而言他',
-u'锢法寶典',
-u'孤芳自愛',
-u'孤芳自賞',
-u'古肥今瘠',
-u'谷父蠶母',
-u'鼓腹含哺',
-u'鼓腹含和',
-u'鼓腹擊壤',
-u'鼓腹讴歌',
-u'顧複之恩',
-u'骨鲠緘喉',
-u'骨骾在喉',
-u'骨鲠之臣',
-u'股肱耳目',
-u'股肱腹心',
-u'故宮禾黍',
-u'故宮離黍',
-u'股肱心腹',
-u'股肱心膂',
-u'股肱指臂',
-u'股肱之臣',
-u'股肱之力',
-u'股肱重臣',
-u'鼓鼓囊囊',
-u'孤寡鳏獨',
-u'谷貴餓農谷贱傷農',
-u'骨寒毛豎',
-u'孤鴻寡鹄',
-u'顧後瞻前',
-u'骨化風成',
-u'骨化形銷',
-u'孤魂野鬼',
-u'蠱惑人心',
-u'故伎重演',
-u'毂擊肩摩',
-u'孤家寡人',
-u'故家喬木',
-u'故家子弟',
-u'故劍情深',
-u'谷贱傷農',
-u'故劍之求',
-u'鼓角齊鳴',
-u'毂交蹄劘',
-u'鼓角相聞',
-u'故交新知',
-u'古今小說',
-u'古今一揆',
-u'古今一轍',
-u'古今中外',
-u'鼓睛暴眼',
-u'古井不波',
-u'古井無波',
-u'顧景興懷',
-u'故舊不棄',
-u'沽酒當垆',
-u'古舊釘錘',
-u'孤軍薄旅',
-u'孤軍獨戰',
-u'孤軍奮戰',
-u'孤軍深入',
-u'孤軍作戰',
-u'顧客盈門',
-u'孤苦仃俜',
-u'孤苦零丁',
-u'瞽曠之耳',
-u'古來今往',
-u'孤力奮戰',
-u'孤立寡與',
-u'孤立無援',
-u'孤立無助',
-u'骨立形銷',
-u'孤陋寡聞',
-u'孤鸾寡鳳',
-u'孤鸾寡鶴',
-u'孤鸾寡鹄',
-u'孤鸾舞鏡',
-u'孤鸾照鏡',
-u'顧慮重重',
-u'孤履危行',
-u'谷馬砺兵',
-u'古貌古心',
-u'沽名釣譽',
-u'沽名幹譽',
-u'沽名徼譽',
-u'沽名賣直',
-u'沽名市譽',
-u'顧名思義',
-u'沽名要譽',
-u'古木參天',
-u'鼓腦争頭',
-u'鼓餒旗靡',
-u'顧内之憂',
-u'淈泥揚波',
-u'姑娘十八一朵花',
-u'故弄虛玄',
-u'故弄玄虛',
-u'顧盼多姿',
-u'顧盼神飛',
-u'顧盼生輝',
-u'顧盼生姿',
-u'顧盼自得',
-u'顧盼自豪',
-u'顧盼自雄',
-u'鼓盆而歌',
-u'鼓盆之戚',
-u'孤蓬自振',
-u'鼓旗相當',
-u'顧前不顧後',
-u'顧前顧後',
-u'孤秦陋宋',
-u'顧曲周郎',
-u'顧犬補牢',
-u'顧全大局',
-u'故人之情',
-u'故人之意',
-u'骨肉分離',
-u'骨肉乖離',
-u'骨肉離散',
-u'骨肉團圞',
-u'骨肉團圓',
-u'骨肉未寒',
-u'骨肉相殘',
-u'骨肉相連',
-u'骨肉至親',
-u'骨肉之情',
-u'故入人罪',
-u'骨軟筋麻',
-u'骨軟筋酥',
-u'骨軟肉酥',
-u'固若金湯',
-u'古色古香',
-u'古色天香',
-u'鼓舌掀簧',
-u'鼓舌揚唇',
-u'鼓舌搖唇',
-u'故甚其詞',
-u'固神玉片',
-u'孤身隻影',
-u'古聖先賢',
-u'古是今非',
-u'顧首不顧尾',
-u'骨瘦如豺',
-u'骨瘦形銷',
-u'古樹天敵',
-u'鼓衰力盡',
-u'鼓衰氣竭',
-u'顧說他事',
-u'古寺青燈',
-u'瞽瞍不移',
-u'故态複還',
-u'故态複萌',
-u'故态複作',
-u'孤特獨立',
-u'孤特自立',
-u'骨騰肉飛',
-u'孤蹄棄骥',
-u'顧頭不顧腚',
-u'顧頭不顧尾',
-u'骨頭裏挑刺',
-u'故土難離',
-u'孤豚腐鼠',
-u'古往今來',
-u'姑妄聽之',
-u'姑妄言之',
-u'姑妄言之姑妄聽之',
-u'古爲今用',
-u'孤文斷句',
-u'鼓吻奮爪',
-u'鼓吻弄舌',
-u'顧問之戒',
-u'孤文隻義',
-u'故我依然',
-u'鼓舞觸角',
-u'鼓舞歡忻',
-u'鼓舞人心',
-u'姑息惠奸',
-u'姑息養奸',
-u'古稀之年',
-u'古香古貌',
-u'古香古豔',
-u'顧小失大',
-u'古心古貌',
-u'孤形單影',
-u'孤形吊影',
-u'孤行己見',
-u'孤行己意',
-u'故行首之字',
-u'孤行一意',
-u'孤懸浮寄',
-u'孤懸客寄',
-u'孤學墜緒',
-u'孤雁出群',
-u'瞽言刍議',
-u'瞽言萏議',
-u'瞽言妄舉',
-u'姑射神人',
-u'姑射仙姿',
-u'固陰冱寒',
-u'孤陰則不生獨陽則不長',
-u'顧影慚形',
-u'顧影弄姿',
-u'顧影自憐',
-u'古語常言',
-u'沽譽釣名',
-u'沽譽買直',
-u'故園松竹已陰陰',
-u'鼓樂齊鳴',
-u'鼓樂喧阗',
-u'孤雲野鶴',
-u'鼓噪而進',
-u'鼓噪而起',
-u'股戰而栗',
-u'股戰脅息',
-u'孤掌難鳴',
-u'股掌之間',
-u'股掌之上',
-u'姑置不問',
-u'固執成見',
-u'故智複萌',
-u'固執己見',
-u'姑置勿陳',
-u'姑置勿論',
-u'姑置勿問',
-u'孤舟獨槳',
-u'孤注一擲',
-u'孤子寡婦',
-u'鼓足幹勁',
-u'故作高深',
-u'故作玄虛',
-u'顧左右而言他',
-u'故做姿态',
-u'寡不敵衆',
-u'寡不勝衆',
-u'刮腸洗胃',
-u'挂腸懸膽',
-u'挂腸懸肝',
-u'挂燈結彩',
-u'刮地以去',
-u'瓜瓞綿綿',
-u'挂肚牽腸',
-u'挂肚牽心',
-u'寡恩薄義',
-u'寡恩少義',
-u'寡二少雙',
-u'瓜分鼎峙',
-u'瓜分豆剖',
-u'寡鳳孤鸾',
-u'寡凫單鹄',
-u'寡婦孤兒',
-u'刮腹湔腸',
-u'寡婦門前是非多',
-u'瓜葛相連',
-u'刮垢磨光',
-u'刮垢磨痕',
-u'刮骨抽筋',
-u'刮骨去毒',
-u'刮骨吸髓',
-u'呱呱堕地',
-u'呱呱墜地',
-u'挂冠歸去',
-u'挂冠歸隐',
-u'挂冠求去',
-u'寡鶴羁雌',
-u'挂紅結彩',
-u'寡鹄單凫',
-u'寡鹄孤鸾',
-u'寡鹄離鸾',
-u'寡見少聞',
-u'寡見鮮聞',
-u'挂角羚羊',
-u'瓜李之嫌',
-u'瓜連蔓引',
-u'寡廉鮮恥',
-u'挂免戰牌',
-u'刮膜金鎞',
-u'刮目視之',
-u'刮目相待',
-u'刮目相觀',
-u'刮目相見',
-u'刮目相看',
-u'刮目相視',
-u'瓜剖豆分',
-u'寡情薄義',
-u'寡情少義',
-u'瓜區豆分',
-u'寡人之疾',
-u'瓜熟蒂落',
-u'瓜田不納履',
-u'瓜田不納履李下不整冠',
-u'瓜甜蒂苦',
-u'瓜田李下',
-u'瓜田之嫌',
-u'寡聞陋見',
-u'寡聞少見',
-u'挂席爲門',
-u'寡信輕諾',
-u'挂羊頭賣狗肉',
-u'刮野掃地',
-u'挂一鈎子',
-u'挂一漏百',
-u'挂一漏萬',
-u'挂印懸牌',
-u'刮楹達鄉',
-u'寡欲清心',
-u'寡衆不敵',
-u'瓜字初分',
-u'乖不過唱的賊不過銀匠',
-u'乖唇蜜舌',
-u'掴打撾揉',
-u'怪誕不經',
-u'怪誕詭奇',
-u'怪怪奇奇',
-u'怪力亂神',
-u'拐米倒做了倉官',
-u'怪模怪樣',
-u'乖僻邪謬',
-u'怪腔怪調',
-u'怪聲怪氣',
-u'怪事咄咄',
-u'拐彎抹角',
-u'怪物殺手',
-u'怪形怪狀',
-u'怪異鐐铐',
-u'怪雨盲風',
-u'乖嘴蜜舌',
-u'管鮑分金',
-u'官報私仇',
-u'管鮑之好',
-u'管鮑之交',
-u'管鮑之誼',
-u'官卑職小',
-u'官逼民變',
-u'官逼民反',
-u'觀變沉機',
-u'官不大僚不小',
-u'官不易方',
-u'棺材頭邊無咒死鬼',
-u'關倉遏粜',
-u'官倉老鼠',
-u'觀察入微',
-u'官差吏差來人不差',
-u'觀場矮人',
-u'官場如戲',
-u'貫徹始終',
-u'管城毛穎',
-u'貫穿馳騁',
-u'貫穿今古',
-u'官船漏官馬瘦',
-u'貫穿融會',
-u'官從何處來',
-u'官大一級壓死人',
-u'冠帶家私',
-u'冠帶之國',
-u'冠道履仁',
-u'灌頂醍醐',
-u'關東出相',
-u'關東出相關西出将',
-u'貫鬥雙龍',
-u'官斷十條路',
-u'官兒不打送禮的',
-u'盥耳山栖',
-u'官法如爐',
-u'官匪一家親',
-u'觀風察俗',
-u'觀鳳一羽',
-u'官封原職',
-u'灌夫罵坐',
-u'冠蓋不絕',
-u'冠蓋高舉',
-u'冠蓋京華',
-u'冠蓋如市',
-u'冠蓋如雲',
-u'冠蓋往來',
-u'冠蓋相望',
-u'冠蓋相屬',
-u'冠蓋雲集',
-u'冠蓋之士',
-u'官高爵顯',
-u'官高祿厚',
-u'鳏寡孤獨',
-u'鳏寡孤茕',
-u'鳏寡茕獨',
-u'灌瓜之義',
-u'官官相護',
-u'官官相爲',
-u'觀過知仁',
-u'官虎吏狼',
-u'觀化聽風',
-u'關懷備至',
-u'觀機而動',
-u'觀機而作',
-u'冠雞佩豭',
-u'管急弦繁',
-u'貫甲提兵',
-u'管間窺豹',
-u'管見所及',
-u'觀今宜鑒古',
-u'綸巾羽扇',
-u'官久必富',
-u'官久自富',
-u'冠屦倒施',
-u'冠絕當時',
-u'冠絕古今',
-u'冠絕群芳',
-u'冠絕群倫',
-u'冠絕時輩',
-u'冠絕一時',
-u'觀看容顔便得知',
-u'管窺筐舉',
-u'管窺蠡測',
-u'管窺蛙見',
-u'觀瀾墜子',
-u'冠履不爽',
-u'冠履倒易',
-u'冠履倒置',
-u'冠履無爽',
-u'貫芒長斧',
-u'觀貌察色',
-u'觀眉說眼',
-u'關門閉戶',
-u'關門不落闩',
-u'關門打狗',
-u'關門大吉',
-u'關門合戶',
-u'關門落闩',
-u'關門養虎',
-u'關門養虎虎大傷人',
-u'冠冕堂皇',
-u'冠冕衣裳',
-u'冠冕之士',
-u'管寧割席',
-u'冠袍帶履',
-u'觀棋不語真君子',
-u'慣騎馬的慣跌交',
-u'關前垂後',
-u'冠前絕後',
-u'官清法正',
-u'關情脈脈',
-u'官情如紙薄',
-u'官輕勢微',
-u'官清書吏瘦',
-u'官清似水',
-u'官清氈冷',
-u'官情紙薄',
-u'觀色察言',
-u'管山吃山管水吃水',
-u'冠山戴粒',
-u'關山迢遞',
-u'觀山玩水',
-u'關山阻隔',
-u'冠上加冠',
-u'冠上履下',
-u'關上門過日子',
-u'官事官辦',
-u'冠世之才',
-u'貫虱之技',
-u'管誰筋疼',
-u'官俗國體',
-u'關天人命',
-u'貫通融會',
-u'觀望不前',
-u'觀望風色',
-u'觀望徘徊',
-u'觀往知來',
-u'貫微洞密',
-u'官無三日緊',
-u'關西出将',
-u'管弦繁奏',
-u'管閑事落不是',
-u'官項不清',
-u'觀釁而動',
-u'關心民瘼',
-u'觀釁伺隙',
-u'觀形察色',
-u'貫朽粟陳',
-u'貫朽粟腐',
-u'貫朽粟紅',
-u'官樣詞章',
-u'慣養嬌生',
-u'官樣文書',
-u'官樣文章',
-u'貫頤備戟',
-u'慣一不着',
-u'貫頤奮戟',
-u'貫盈惡稔',
-u'官有正條',
-u'貫魚承寵',
-u'貫魚成次',
-u'觀隅反三',
-u'鳏魚渴鳳',
-u'關羽氣球',
-u'貫魚之次',
-u'貫魚之序',
-u'關龠蕃籬',
-u'官運亨通',
-u'觀瞻所系',
-u'觀者成堵',
-u'觀者麇集',
-u'觀者如堵',
-u'觀者如垛',
-u'觀者如山',
-u'觀者如市',
-u'觀者如雲',
-u'觀者如織',
-u'觀者蝟集',
-u'觀者雲集',
-u'貫征拳套',
-u'官止神行',
-u'管中窺豹',
-u'管中窺天',
-u'管仲随馬',
-u'慣子如殺子',
-u'慣作非爲',
-u'光被四表',
-u'光采奪目',
-u'光彩陸離',
-u'光彩射目',
-u'光彩射人',
-u'光彩耀目',
-u'光彩溢目',
-u'光車駿馬',
-u'廣大神通',
-u'光風霁月',
-u'光複舊京',
-u'光複舊物',
-u'光隔離器',
-u'光怪陸離',
-u'光光蕩蕩',
-u'光棍不吃眼前虧',
-u'廣寒仙子',
-u'光華奪目',
-u'光環石錘',
-u'光環掌握',
-u'光輝燦爛',
-u'光輝盾牌',
-u'光輝奪目',
-u'廣見洽聞',
-u'廣結良緣',
-u'光景無多',
-u'廣開才路',
-u'廣開聾聩',
-u'廣開賢路',
-u'廣開言路',
-u'光可鑒人',
-u'廣客蛇影',
-u'廣樂鈞天',
-u'光麗照人',
-u'廣陵觀濤',
-u'廣陵絕響',
-u'廣陵散絕',
-u'光芒萬丈',
-u'廣袤豐殺',
-u'廣袤無垠',
-u'光門耀戶',
-u'光明不會告訴你的事情',
-u'光明磊落',
-u'光明湧動',
-u'光明正大',
-u'廣譬曲谕',
-u'光前絕後',
-u'光前啓後',
-u'光前耀後',
-u'光前裕後',
-u'光榮歲月',
-u'光色奪目',
-u'廣廈萬間',
-u'廣廈之蔭',
-u'廣師求益',
-u'光說不練假把式',
-u'廣思集益',
-u'廣搜博采',
-u'光天化日',
-u'光天之下',
-u'廣庭大衆',
-u'廣土衆民',
-u'廣文先生',
-u'廣武之歎',
-u'廣夏細旃',
-u'廣袖高髻',
-u'光許願不燒香',
-u'光焰萬丈',
-u'洸洋自恣',
-u'光耀奪目',
-u'廣益集思',
-u'光陰黃金難買',
-u'光陰荏苒',
-u'光陰如電',
-u'光陰如箭',
-u'光陰如水',
-u'光陰似箭',
-u'光陰似箭日月如梭',
-u'光陰似水',
-u'光陰似梭',
-u'光陰虛度',
-u'光陰虛過',
-u'光膺舊物',
-u'光映照人',
-u'廣征博引',
-u'廣種薄收',
-u'廣衆大庭',
-u'光宗耀祖',
-u'詭變多端',
-u'貴表尊名',
-u'貴不可言',
-u'貴不期驕',
-u'貴不召驕',
-u'規重矩疊',
-u'鬼出電入',
-u'鬼出神入',
-u'詭辭欺世',
-u'詭辭以對',
-u'詭誕不經',
-u'佹得複失',
-u'佹得佹失',
-u'貴德贱兵',
-u'桂殿蘭宮',
-u'桂蠹蘭敗',
-u'圭端臬正',
-u'貴而贱目',
-u'貴耳遺目',
-u'詭負葛藤',
-u'桂馥蘭芳',
-u'桂馥蘭香',
-u'桂馥蘭馨',
-u'桂馥蘭薰',
-u'鬼斧神工',
-u'歸根到底',
-u'歸根結蒂',
-u'歸根究柢',
-u'桂宮柏寝',
-u'鬼工雷斧',
-u'鬼功神力',
-u'貴古贱今',
-u'詭怪奇谲',
-u'貴官顯宦',
-u'鬼鬼崇崇',
-u'鬼鬼祟祟',
-u'龜鶴大椿',
-u'龜鶴夫婦',
-u'龜鶴同春',
-u'龜鶴遐齡',
-u'龜鶴遐年',
-u'龜鶴遐壽',
-u'龜鶴之年',
-u'龜鶴之壽',
-u'歸華別葉',
-u'鬼話連篇',
-u'規圜矩方',
-u'歸還軍旗',
-u'鬼魂鐮刀',
-u'鬼魂裝束',
-u'鬼火狐鳴',
-u'詭計百出',
-u'鬼計百端',
-u'貴籍大名',
-u'詭計多端',
-u'桂楫蘭桡',
-u'貴極人臣',
-u'歸忌往亡',
-u'詭計陰謀',
-u'貴贱不相逾',
-u'貴贱高下',
-u'貴贱無常',
-u'貴贱無二',
-u'圭角岸然',
-u'圭角不露',
-u'歸結原理',
-u'歸結主體',
-u'桂酒椒漿',
-u'規矩鈎繩',
-u'規矩繩墨',
-u'規矩準繩',
-u'詭谲多變',
-u'詭谲怪誕',
-u'詭谲無行',
-u'鬼瞰高明',
-u'鬼瞰其室',
-u'鬼刻神劖',
-u'鬼哭狼嗥',
-u'鬼哭神愁',
-u'鬼哭神号',
-u'鬼哭神驚',
-u'鬼哭粟飛',
-u'鬼哭天愁',
-u'鬼爛神焦',
-u'歸老林泉',
-u'歸老林下',
-u'歸老田間',
-u'歸老菟裘',
-u'歸了包堆',
-u'龜冷搘床',
-u'歸裏包堆',
-u'詭麗輻辏',
-u'桂林杏苑',
-u'桂林一枝',
-u'龜齡鶴算',
-u'鬼靈突襲',
-u'龜龍鱗鳳',
-u'龜龍之圖',
-u'規慮揣度',
-u'歸馬放牛',
-u'龜毛兔角',
-u'鬼魅攻擊',
-u'鬼魅幻影',
-u'鬼魅伎倆',
-u'鬼魅靈魂',
-u'鬼沒神施',
-u'鬼門占卦',
-u'鬼迷了張天師',
-u'詭秘莫測',
-u'鬼迷心竅',
-u'鬼冥重甲',
-u'鬼冥重盔',
-u'刿目怵心',
-u'刿目鉥心',
-u'歸納斷言',
-u'歸納泛化',
-u'歸納推理',
-u'歸納學習',
-u'龜年鶴壽',
-u'龜年鶴算',
-u'閨女要花兒要炮',
-u'鬼怕惡人',
-u'歸奇顧怪',
-u'貴戚權門',
-u'鬼泣神号',
-u'規求無度',
-u'歸去來兮',
-u'歸全反真',
-u'貴人多忘',
-u'貴人多忘事',
-u'貴人贱己',
-u'貴人善忘',
-u'貴人眼高',
-u'貴人遺骨',
-u'貴少贱老',
-u'龜蛇靜丸',
-u'桂折蘭摧',
-u'鬼設神使',
-u'桂折一枝',
-u'鬼神不測',
-u'鬼神莫測',
-u'規繩矩墨',
-u'歸十歸一',
-u'鬼使神差',
-u'鬼施神沒',
-u'歸師勿掩',
-u'歸師勿掩窮寇勿追',
-u'貴手高擡',
-u'鬼獸腰佩',
-u'規天矩地',
-u'鬼頭關竅',
-u'鬼頭鬼腦',
-u'鬼頭滑腦',
-u'鬼衛重甲',
-u'鬼紋短褲',
-u'龜文鳥迹',
-u'貴無常尊',
-u'軌物範世',
-u'規賢矩聖',
-u'詭銜竊辔',
-u'龜笑鼈無尾',
-u'歸邪反正',
-u'歸邪轉曜',
-u'刿心怵目',
-u'刿心刳肺',
-u'刿心刳腹',
-u'歸心如飛',
-u'歸心如箭',
-u'歸心如駛',
-u'刿心鉥目',
-u'歸心似箭',
-u'刿心鉥腎',
-u'桂薪玉粒',
-u'桂薪珠米',
-u'詭形怪狀',
-u'規行矩步',
-u'規行矩止',
-u'詭形奇制',
-u'詭形殊狀',
-u'詭形異态',
-u'詭形異形',
-u'佹形僪狀',
-u'刿鉥肝腎',
-u'刿鉥心腑',
-u'癸虛重靴',
-u'規旋矩折',
-u'詭雅異俗',
-u'龜厭不告',
-u'詭言浮說',
-u'規言矩步',
-u'閨閻須眉',
-u'鬼也不上門兒',
-u'瑰意奇行',
-u'皈依三寶',
-u'歸遺細君',
-u'貴陰贱璧',
-u'閨英闱秀',
-u'貴遊弟子',
-u'貴遊子弟',
-u'龜玉不毀',
-u'龜玉毀椟',
-u'鬼蜮伎倆',
-u'鬼蜮心腸',
-u'桂玉之地',
-u'貴遠鄙近',
-u'貴遠贱近',
-u'規圓矩方',
-u'貴在知心',
-u'規則推理',
-u'貴則易交',
-u'鬼吒狼嚎',
-u'歸帳路頭',
-u'圭璋特達',
-u'桂棹蘭枻',
-u'歸真反樸',
-u'歸真證果',
-u'歸正返本',
-u'歸正邱首',
-u'歸正首邱',
-u'庋之高閣',
-u'桂枝片玉',
-u'歸之如市',
-u'歸之如水',
-u'歸之若水',
-u'規重矩叠',
-u'鬼冢守衛',
-u'鬼冢行屍',
-u'鬼抓狼嚎',
-u'貴壯贱老',
-u'貴壯贱弱',
-u'詭狀異形',
-u'鬼子敢爾',
-u'桂子蘭孫',
-u'桂子飄香',
-u'滾鞍下馬',
-u'棍棒底下出孝子',
-u'滾瓜爛熟',
-u'滾瓜流水',
-u'滾瓜溜油',
-u'衮衮群公',
-u'衮衮諸公',
-u'鲧殛禹興',
-u'滾芥投針',
-u'國步多艱',
-u'國步方蹇',
-u'國步艱難',
-u'國步艱危',
-u'國不可一日無君',
-u'果不其然',
-u'國仇家恨',
-u'過從甚密',
-u'鍋大勺有準',
-u'過都曆塊',
-u'過度怯懦',
-u'過渡曲面',
-u'過渡曲線',
-u'過渡效果',
-u'果斷一擊',
-u'過耳春風',
-u'過而能改',
-u'過耳秋風',
-u'國而忘家',
-u'過耳之言',
-u'過耳之言不可聽信',
-u'國富兵強',
-u'過府沖州',
-u'國富民安',
-u'國富民豐',
-u'國富民康',
-u'國富民強',
-u'郭公夏五',
-u'過關斬将',
-u'過河拆橋',
-u'過河卒子',
-u'過化存神',
-u'郭華情罪',
-u'郭霍爾德',
-u'國計民生',
-u'過急一步',
-u'國家不幸英雄幸',
-u'國家大計',
-u'國家棟梁',
-u'國家多故',
-u'國家多艱',
-u'國家多難',
-u'國家将亡必有妖孽',
-u'國家将興必有祯祥',
-u'國家榮譽',
-u'國家閑暇',
-u'國家祥瑞',
-u'國家信息基礎設施',
-u'國家興旺',
-u'國家興亡匹夫有責',
-u'國家柱石',
-u'國将不國',
-u'過江之鲫',
-u'過街老鼠',
-u'國困民艱',
-u'國困民難',
-u'國困民窮',
-u'過了河就拆橋',
-u'過了青春無少年',
-u'過了這村兒沒這店兒',
-u'鍋裏吃鍋裏拉',
-u'國利民福',
-u'過路财神',
-u'國脈民命',
-u'過門不入',
-u'過門大嚼',
-u'虢滅虞亡',
-u'過目不忘',
-u'過目成誦',
-u'國沐春風',
-u'過目皆憶',
-u'國難當頭',
-u'國破家難保',
-u'國破家難全',
-u'國破家亡',
-u'國戚皇親',
-u'過橋拆橋',
-u'過橋抽闆',
-u'過橋拉闆',
-u'過情之聞',
-u'過情之譽',
-u'國窮民匣',
-u'果然如此',
-u'過人耐力',
-u'果如其言',
-u'國色天香',
-u'國色天姿',
-u'國色無雙',
-u'過甚其詞',
-u'過甚其實',
-u'過盛必衰',
-u'國事多艱',
-u'過時黃花',
-u'國是日非',
-u'國事蜩螗',
-u'國士無雙',
-u'過市招搖',
-u'國士之風',
-u'果熟蒂落',
-u'國泰民安',
-u'過庭無訓',
-u'過庭之訓',
-u'過屠大嚼',
-u'過屠門而大嚼',
-u'國土之風',
-u'國亡家破',
-u'國亡捐瘠',
-u'過望之喜',
-u'國亡種滅',
-u'過爲已甚',
-u'國無二君',
-u'過五關斬六将',
-u'國無捐瘠',
-u'國無寧日',
-u'國無寧歲',
-u'國無幸民',
-u'過隙白駒',
-u'果刑信賞',
-u'果行育德',
-u'裹血力戰',
-u'過眼風煙',
-u'過眼浮煙',
-u'國豔天香',
-u'過眼煙雲',
-u'過眼雲煙',
-u'過意不去',
-u'過猶不及',
-u'果于自信',
-u'國賊祿鬼',
-u'果真如此',
-u'國之幹城',
-u'國之四維',
-u'國中之國',
-u'過自标置',
-u'過自菲薄',
-u'裹足不進',
-u'裹足不前',
-u'蝦蟆貪嘴',
-u'海北天南',
-u'海波不驚',
-u'海不波溢',
-u'海不辭水故能大',
-u'海不拒水故能大',
-u'海不揚波',
-u'海潮洞窟',
-u'還吃舊鍋裏粥',
-u'海錯江瑤',
-u'海底猴兒',
-u'海底撈月',
-u'海底撈針',
-u'海底尋針',
-u'海爾諄諄聽我藐藐',
-u'海沸波翻',
-u'海沸河翻',
-u'海沸江翻',
-u'海沸山崩',
-u'海沸山裂',
-u'海沸山搖',
-u'海巿蜃樓',
-u'骸骨軍馬',
-u'骸骨戰馬',
-u'還顧之憂',
-u'海涵地負',
-u'海涸石爛',
-u'海懷霞想',
-u'海角天涯',
-u'海角天隅',
-u'海枯見底',
-u'海枯石爛',
-u'海闊從魚躍天空任鳥飛',
-u'海闊天高',
-u'海闊天空',
-u'駭浪驚濤',
-u'海立雲垂',
-u'駭龍走蛇',
-u'還沒有解決',
-u'海盟山咒',
-u'駭目驚心',
-u'駭目振心',
-u'海納百川',
-u'海内存知己',
-u'海内存知己天涯若比鄰',
-u'海内淡然',
-u'海内鼎沸',
-u'海内無雙',
-u'海鷗小譜跋',
-u'害起肘腋',
-u'害群之馬',
-u'害人不淺',
-u'駭人視聽',
-u'駭人聽聞',
-u'駭人聞見',
-u'駭人聞聽',
-u'海桑陵谷',
-u'海上釣螯',
-u'咳聲歎氣',
-u'海誓祭壇',
-u'亥豕魯魚',
-u'海誓山盟',
-u'海市蜃樓',
-u'亥豕相望',
-u'海獅墜飾',
-u'海水不可鬥量',
-u'海水難量',
-u'海水群飛',
-u'海水桑田',
-u'海水自鹹河水自淡',
-u'害死人還看出殡的',
-u'海灘巨人',
-u'海灘利爪',
-u'海灘先知',
-u'海天一線',
-u'海外東坡',
-u'海外扶餘',
-u'海外奇談',
-u'海外三十六國',
-u'海翁失鷗',
-u'海屋籌添',
-u'海屋添籌',
-u'海嘯山崩',
-u'駭心動目',
-u'海涯天角',
-u'海晏河澄',
-u'海晏河清',
-u'海焰指環',
-u'海嶽高深',
-u'海約山盟',
-u'海之平衡',
-u'海中撈月',
-u'害忠隐賢',
-u'駭狀殊形',
-u'孩子哭了抱給他娘',
-u'孩子是自己的好',
-u'海自細流來',
-u'旱魃爲崇',
-u'旱魃爲虐',
-u'旱魃爲災',
-u'含苞待放',
-u'含苞吐萼',
-u'含苞欲放',
-u'罕比而喻',
-u'含冰茹檗',
-u'汗不敢出',
-u'含哺鼓腹',
-u'寒蟬僵鳥',
-u'寒蟬凄切',
-u'寒蟬仗馬',
-u'酣暢淋漓',
-u'韓潮蘇海',
-u'含齒戴發',
-u'汗出浃背',
-u'汗出洽背',
-u'汗出如漿',
-u'汗出如渖',
-u'汗出沾背',
-u'寒從腳下起',
-u'寒從腳下生',
-u'邯鄲匍匐',
-u'邯鄲學步',
-u'邯鄲一夢',
-u'邯鄲之夢',
-u'邯鄲重步',
-u'旱地上打不得拍浮',
-u'撼地搖天',
-u'函電交馳',
-u'寒冬臘月',
-u'寒冬之力',
-u'寒冬之球',
-u'寒冬之刃',
-u'寒冬之咬',
-u'含毒噴濺',
-u'含毒之刺',
-u'寒風砭骨',
-u'寒風侵肌',
-u'寒風峽谷',
-u'寒風營地',
-u'寒腹短識',
-u'函蓋充周',
-u'函蓋乾坤',
-u'寒鋼束腰',
-u'漢臯解佩',
-u'扞格不入',
-u'扞格不通',
-u'酣歌恒舞',
-u'酣歌醉舞',
-u'寒耕熱耘',
-u'寒耕暑耘',
-u'含宮咀征',
-u'漢宮威儀',
-u'含垢包羞',
-u'含垢藏疾',
-u'含垢藏瑕',
-u'含垢納污',
-u'含垢匿瑕',
-u'含垢棄瑕',
-u'含垢忍恥',
-u'含垢忍辱',
-u'含垢忍污',
-u'寒谷回春',
-u'涵古茹今',
-u'寒骨戰錘',
-u'漢官威儀',
-u'韓海蘇潮',
-u'含毫命簡',
-u'含毫吮墨',
-u'鼾齁如雷',
-u'含糊不明',
-u'含糊其詞',
-u'含華咀英',
-u'寒花晚節',
-u'寒灰更然',
-u'寒脊山谷',
-u'漢奸勢力',
-u'含菁咀華',
-u'韓康賣藥',
-u'寒來暑往',
-u'寒冷抓握',
-u'寒戀重衾',
-u'含蓼問疾',
-u'翰林子墨',
-u'韓陵片石',
-u'汗流浃背',
-u'汗流浃膚',
-u'汗流浃體',
-u'汗流浃踵',
-u'汗流接踵',
-u'汗流滿面',
-u'韓柳歐蘇',
-u'汗流洽背',
-u'汗流洽衣',
-u'汗流至踵',
-u'寒露仙兔',
-u'韓盧逐塊',
-u'韓盧逐逡',
-u'汗馬功績',
-u'汗馬功勞',
-u'汗馬勳勞',
-u'汗馬之才',
-u'汗馬之功',
-u'汗馬之績',
-u'汗馬之勞',
-u'寒毛直豎',
-u'寒毛卓豎',
-u'寒門飲恨',
-u'旱苗得雨',
-u'漢明距離',
-u'含明隐迹',
-u'翰墨因緣',
-u'寒木春華',
-u'漢娜之刃',
-u'翰鳥纓繳',
-u'汗牛充棟',
-u'汗牛充屋',
-u'汗牛塞棟',
-u'汗牛塞屋',
-u'寒怒匕首',
-u'罕譬而喻',
-u'汗洽股栗',
-u'含情脈脈',
-u'含情山鬼',
-u'汗青頭白',
-u'喊屈叫冤',
-u'寒泉之思',
-u'悍然不顧',
-u'酣然入夢',
-u'含仁懷義',
-u'漢人煮箦',
-u'汗如雨下',
-u'含沙射影',
-u'撼山拔樹',
-u'寒山片石',
-u'含商咀征',
-u'含商咀徵',
-u'酣聲如雷',
-u'寒食爲一百五日',
-u'函矢相攻',
-u'韓壽分香',
-u'韓壽偷香',
-u'撼樹蚍蜉',
-u'函數依賴僞傳遞律',
-u'含霜履雪',
-u'寒水魂精',
-u'寒酸落魄',
-u'憨态可掬',
-u'熯天熾地',
-u'撼天搖地',
-u'撼天震地',
-u'酣痛淋漓',
-u'寒往暑來',
-u'寒微簡陋',
-u'罕聞寡見',
-u'含污忍垢',
-u'酣嬉淋漓',
-u'含瑕積垢',
-u'汗下如流',
-u'颔下之珠',
-u'含笑九泉',
-u'含笑九原',
-u'含笑入地',
-u'韓信登壇',
-u'韓信将兵',
-u'韓信将兵多多益善',
-u'含辛忍苦',
-u'含辛茹苦',
-u'含辛茹荼',
-u'寒心酸鼻',
-u'寒心銷志',
-u'韓信用兵多多益辦',
-u'含羞帶怯',
-u'含羞忍辱',
-u'含血噴人',
-u'含血吮瘡',
-u'含血噀人',
-u'汗血鹽車',
-u'含牙帶角',
-u'罕言寡語',
-u'韓嫣金丸',
-u'寒煙衰草',
-u'汗顔無地',
-u'含饴弄孫',
-u'含意未申',
-u'含一之德',
-u'含英咀華',
-u'涵泳玩索',
-u'罕有其匹',
-u'漢語語音理解系統',
-u'漢語語音信息處理',
-u'含冤抱恨',
-u'含冤抱痛',
-u'含冤負屈',
-u'喊冤叫屈',
-u'含冤莫白',
-u'含冤受屈',
-u'含冤昭雪',
-u'漢賊不兩立',
-u'含章天挺',
-u'含章挺生',
-u'含着骨頭露着肉',
-u'憨狀可掬',
-u'漢字編碼字符集',
-u'漢字草書',
-u'漢字鍵盤輸入方法',
-u'漢字噴墨印刷機',
-u'漢字信息壓縮技術',
-u'航海梯山',
-u'行行出狀元',
-u'行行蛇蚓',
-u'行家裏手',
-u'行家莫說力把話',
-u'行間字裏',
-u'夯鳥先飛',
-u'夯雀先飛',
-u'沆瀣一氣',
-u'桁楊相推',
-u'桁楊相望',
-u'毫不動搖',
-u'毫不諱言',
-u'毫不介懷',
-u'毫不介意',
-u'毫不經意',
-u'毫不利己',
-u'毫不利己專門利人',
-u'毫不遜色',
-u'蒿草之下',
-u'皓齒蛾眉',
-u'好吃懶做',
-u'皓齒明眸',
-u'皓齒星眸',
-u'皓齒朱唇',
-u'好大喜功',
-u'好大喜誇',
-u'好戴高帽',
-u'好丹非素',
-u'好得蜜裏調油',
-u'豪奪巧取',
-u'好惡不同',
-u'好兒不看春好女不看燈',
-u'好兒不用多一個頂十個',
-u'豪爾之矛',
-u'毫發不差',
-u'毫發不爽',
-u'毫發絲粟',
-u'毫發無憾',
-u'毫發無遺',
-u'豪放不羁',
-u'毫分縷析',
-u'好風好雨',
-u'豪幹暴取',
-u'好高骛廣',
-u'好高骛遠',
-u'豪管哀弦',
-u'好漢不吃悶頭虧',
-u'好漢不吃眼前虧',
-u'好漢不趕乏兔兒',
-u'好漢不怕出身低',
-u'好漢逢好漢惺惺惜惺惺',
-u'号寒啼饑',
-u'浩汗無涯',
-u'好漢隻怕病來磨',
-u'浩浩蕩蕩',
-u'浩浩湯湯',
-u'好好先生',
-u'浩浩洋洋',
-u'豪橫跋扈',
-u'号呼動地',
-u'好虎難架一群狼',
-u'好話不背人背人沒好話',
-u'好話當作耳旁風',
-u'好花還需綠葉襯',
-u'好話難勸糊塗蟲',
-u'好話一句三冬暖',
-u'好壞不分',
-u'好貨不便宜便宜沒好貨',
-u'好記性不如爛筆頭',
-u'嚎叫之塵',
-u'嚎叫之怒',
-u'豪傑并起',
-u'好借好還再借不難',
-u'好景不長',
-u'好酒好肉',
-u'好酒貪杯',
-u'好酒一口勝千杯',
-u'好酒一口勝千盅',
-u'好看不好用',
-u'嚎哭鬼屋',
-u'好了瘡疤忘了疼',
-u'好了瘡疤忘了痛',
-u'豪厘不伐将用斧柯',
-u'毫厘不爽',
-u'好離好散',
-u'豪厘千裏',
-u'毫厘絲忽',
-u'好利忘義',
-u'濠梁之上',
-u'号令如山',
-u'好亂樂禍',
-u'好馬不吃回頭草',
-u'好馬配好鞍',
-u'豪邁不羁',
-u'豪邁不群',
-u'豪氂不伐将用斧柯',
-u'毫毛不犯',
-u'毫毛斧柯',
-u'豪門敗子多',
-u'豪門多敗子',
-u'豪門多浪子',
-u'豪門貴胄',
-u'豪門巨室',
-u'豪門浪子多',
-u'豪門千金不愁嫁',
-u'豪門似海',
-u'好夢不長',
-u'好夢難成',
-u'好夢難圓',
-u'毫末必辨',
-u'豪末不掇将成斧柯',
-u'毫末不劄将尋斧柯',
-u'好模好樣',
-u'毫末之差',
-u'好謀而成',
-u'好謀能斷',
-u'好謀善斷',
-u'好謀少決',
-u'好謀無斷',
-u'好謀無決',
-u'蒿目時艱',
-u'好男當家',
-u'好弄玄虛',
-u'好女不穿嫁時衣',
-u'濠濮間想',
-u'浩氣長存',
-u'豪氣幹雲',
-u'浩氣凜然',
-u'好奇尚異',
-u'豪氣未除',
-u'浩氣英風',
-u'好騎者堕',
-u'豪情逸緻',
-u'豪情壯志',
-u'豪取智籠',
-u'浩然之氣',
-u'浩然之志',
-u'好讓不争',
-u'好人不長壽禍害活千年',
-u'好人護三村好狗護三鄰',
-u'好人難做',
-u'好人做到底',
-u'好肉剜瘡',
-u'浩如滄海',
-u'浩如煙海',
-u'浩若煙海',
-u'好色不淫',
-u'好色之徒',
-u'好善嫉惡',
-u'好善樂施',
-u'好善惡惡',
-u'好尚各異',
-u'濠上觀魚',
-u'豪商巨賈',
-u'濠上之風',
-u'濠上之樂',
-u'豪奢放逸',
-u'好聲好氣',
-u'好生惡殺',
-u'好生之德',
-u'好事不出門',
-u'好事不出門惡事行千裏',
-u'好事不出門壞事傳千裏',
-u'好事不如無',
-u'好事多妨',
-u'好事多磨',
-u'好事多磨難',
-u'好事多悭',
-u'好事多阻',
-u'好時好日',
-u'好施樂善',
-u'好事連連',
-u'好事難諧',
-u'好時是他人惡時是家人',
-u'好事貪功',
-u'好事天悭',
-u'好施小惠',
-u'好事之徒',
-u'皓首蒼顔',
-u'皓首蛾眉',
-u'皓首尨眉',
-u'皓首窮經',
-u'好手如雲',
-u'好說歹說',
-u'好死不如賴活着',
-u'号咷大哭',
-u'号啕痛哭',
-u'昊天不吊',
-u'嚎天動地',
-u'号天而哭',
-u'嚎天喊地',
-u'号天叫屈',
-u'号天叩地',
-u'好天良夜',
-u'昊天罔極',
-u'号恸崩催',
-u'好爲人師',
-u'好爲事端',
-u'好爲虛勢',
-u'好問不迷路',
-u'好問決疑',
-u'好問則裕',
-u'好惡不愆',
-u'好物不在多',
-u'毫無端倪',
-u'毫無二緻',
-u'好惡乖方',
-u'毫無忌憚',
-u'毫無機心',
-u'毫無節制',
-u'毫無眉目',
-u'毫無聲息',
-u'好惡殊方',
-u'毫無所懼',
-u'毫無所崑',
-u'毫無所知',
-u'好惡同之',
-u'毫無遜色',
-u'毫無遺憾',
-u'毫無異義',
-u'毫無章法',
-u'豪俠尚義',
-u'好鞋不踩臭狗屎',
-u'好心當成驢肝肺',
-u'好心當作驢肝肺',
-u'好心好意',
-u'好心做了驢肝肺',
-u'好行小惠',
-u'好學不倦',
-u'好學不厭',
-u'好學深思',
-u'好言好語',
-u'好言難得',
-u'好言善語',
-u'好言相勸',
-u'好言一句三冬暖',
-u'豪言壯語',
-u'好藥難治冤孽病',
-u'好衣美食',
-u'好逸惡勞',
-u'好勇鬥狠',
-u'好谀惡直',
-u'好語如珠',
-u'好語似珠',
-u'好雨下在沙灘裏',
-u'皓月千裏',
-u'好整以暇',
-u'豪竹哀絲',
-u'好自矜誇',
-u'好自爲之',
-u'和藹近人',
-u'和藹可親',
-u'鶴背揚州',
-u'河奔海聚',
-u'何必當初',
-u'合璧連珠',
-u'和璧隋珠',
-u'呵壁問天',
-u'呵筆尋詩',
-u'河伯爲患',
-u'河不出圖',
-u'何不回頭把自量',
-u'何曾食萬',
-u'鶴長凫短',
-u'河出伏流',
-u'鶴處雞群',
-u'合穿一條褲子',
-u'河帶山砺',
-u'荷擔而立',
-u'合膽同心',
-u'河東三箧',
-u'河東獅吼',
-u'河東獅子',
-u'河東獅子吼',
-u'鶴短凫長',
-u'和而不唱',
-u'和而不同',
-u'合而爲一',
-u'鶴發雞皮',
-u'鶴發松姿',
-u'鶴發童顔',
-u'河汾門下',
-u'和風拂面',
-u'和風麗日',
-u'和風細雨',
-u'诃佛诋巫',
-u'诃佛罵祖',
-u'涸鲋得水',
-u'鶴骨雞膚',
-u'鶴骨龍筋',
-u'鶴骨霜髯',
-u'鶴骨松筋',
-u'鶴骨松姿',
-u'和光同塵',
-u'鶴歸華表',
-u'鶴歸遼海',
-u'河海不擇細流',
-u'河海清宴',
-u'河漢江淮',
-u'河漢斯言',
-u'河漢無極',
-u'河漢吾言',
-u'河漢予言',
-u'河涸海幹',
-u'河涸海乾',
-u'赫赫名流',
-u'赫赫聲名',
-u'和合雙劍',
-u'和合雙全',
-u'赫赫魏魏',
-u'赫赫炎炎',
-u'赫赫揚揚',
-u'赫赫英名',
-u'赫赫有名',
-u'赫赫有聲',
-u'赫赫之功',
-u'赫赫之光',
-u'赫赫之名',
-u'赫赫之譽',
-u'合乎邏輯',
-u'何患無辭',
-u'合家歡樂',
-u'何見之晚',
-u'合金弩機',
-u'喝酒不吃菜必定醉的快',
-u'喝酒不談公事',
-u'河決魚爛',
-u'曷克臻此',
-u'鶴困雞群',
-u'何郎傅粉',
-u'何樂不爲',
-u'何樂而不爲',
-u'鶴唳風聲',
-u'河裏孩兒岸上娘',
-u'鶴唳華亭',
-u'鶴立雞群',
-u'合理可作',
-u'鶴立企伫',
-u'河裏淹死會水的',
-u'鶴唳猿聲',
-u'鶴唳猿啼',
-u'河溓海晏',
-u'河溓海夷',
-u'合兩爲一',
-u'河梁攜手',
-u'河梁之誼',
-u'喝六呼幺',
-u'河流之傲',
-u'何論魏晉',
-u'河落海幹',
-u'河落海乾',
-u'阖門百口',
-u'河門海口',
-u'阖門卻掃',
-u'喝迷魂湯',
-u'鶴鳴雞樹',
-u'鶴鳴九臯',
-u'鶴鳴之士',
-u'鶴鳴之歎',
-u'河目海口',
-u'和睦相處',
-u'合盤托出',
-u'合浦還珠',
-u'合浦珠還',
-u'何其毒也',
-u'和氣生财',
-u'何其相似乃爾',
-u'和氣緻祥',
-u'呵欠連天',
-u'荷槍實彈',
-u'河清海竭',
-u'河清海宴',
-u'合情合理',
-u'河清難俟',
-u'河清人壽',
-u'河清三日',
-u'河清社鳴',
-u'河傾月落',
-u'河清雲慶',
-u'何去何從',
-u'赫然而怒',
-u'赫然有聲',
-u'赫然震怒',
-u'合刃之急',
-u'和容悅色',
-u'何肉周妻',
-u'和如琴瑟',
-u'和如瑟琴',
-u'河潤澤及',
-u'河沙世界',
-u'河山帶砺',
-u'河山破碎',
-u'河山之德',
-u'和尚無兒孝子多',
-u'鶴勢螂形',
-u'和氏之璧',
-u'鶴壽千年',
-u'鶴壽千歲',
-u'禾黍故宮',
-u'禾黍之悲',
-u'河水不犯井水',
-u'河水不洗船',
-u'涸思幹慮',
-u'涸思乾慮',
-u'赫斯之怒',
-u'赫斯之威',
-u'鶴算龜齡',
-u'和隋之珍',
-u'何所不爲',
-u'何所不有',
-u'何所不至',
-u'河同水密',
-u'禾頭生耳',
-u'鶴頭蚊腳',
-u'喝完了那碗涼茶',
-u'喝西北風',
-u'鶴膝蜂腰',
-u'河狹水急',
-u'河斜月落',
-u'鶴行雞群',
-u'鶴行鴨步',
-u'合眼摸象',
-u'和顔說色',
-u'河陽一縣花',
-u'欱野歕山',
-u'褐衣不完',
-u'和衣而卧',
-u'荷衣蕙帶',
-u'褐衣蔬食',
-u'鶴翼之圍',
-u'何憂何懼',
-u'涸魚得水',
-u'河魚腹疾',
-u'河魚天雁',
-u'河魚之患',
-u'河魚之疾',
-u'鶴怨猿驚',
-u'涸澤而魚',
-u'涸澤而漁焚林而獵',
-u'涸轍而魚',
-u'涸轍枯魚',
-u'涸轍窮鱗',
-u'涸轍窮魚',
-u'涸轍之鲋',
-u'涸轍之枯',
-u'涸轍之魚',
-u'喝雉呼盧',
-u'鶴知夜半',
-u'合衷共濟',
-u'纥字不識',
-u'鶴子梅妻',
-u'合從連衡',
-u'合縱雙刀',
-u'何足道哉',
-u'何足挂齒',
-u'何足介意',
-u'何足爲奇',
-u'何足置齒',
-u'何罪之有',
-u'合作主體',
-u'黑白分明',
-u'黑白混淆',
-u'黑斑白貓',
-u'黑斑黃豹',
-u'黑燈下火',
-u'黑地昏天',
-u'黑貂之裘',
-u'黑更半夜',
-u'嘿嘿無言',
-u'嘿嘿無語',
-u'黑價白日',
-u'黑口魚油',
-u'黑眉烏嘴',
-u'黑木洞穴',
-u'黑漆皮燈',
-u'黑漆一團',
-u'嘿然不語',
-u'黑山白水',
-u'黑善之石',
-u'黑石小徑',
-u'黑天白日',
-u'黑天半夜',
-u'黑天墨地',
-u'黑心人倒有馬兒騎',
-u'黑眼睛見了白銀子',
-u'黑言诳語',
-u'黑雲壓城城欲摧',
-u'狠愎自用',
-u'恨鬥私字一閃念',
-u'恨海愁天',
-u'恨海難填',
-u'恨人成事盼人窮',
-u'恨入骨髓',
-u'恨如頭醋',
-u'恨入心髓',
-u'恨鐵不成鋼',
-u'恨相見晚',
-u'恨相知晚',
-u'狠心辣手',
-u'恨之次骨',
-u'恨之切骨',
-u'恨之入骨',
-u'恨之欲其死',
-u'恨紫怨紅',
-u'橫财不富命窮人',
-u'橫财多自不義來',
-u'橫财就手',
-u'橫草不拈豎草不動',
-u'橫草之功',
-u'橫沖直闖',
-u'橫沖直撞',
-u'橫從穿貫',
-u'橫打順算',
-u'橫刀揭斧',
-u'橫倒豎卧',
-u'橫刀躍馬',
-u'衡短論長',
-u'橫恩濫賞',
-u'橫峰側嶺',
-u'橫賦暴斂',
-u'橫戈盤馬',
-u'橫戈躍馬',
-u'恒河沙數',
-u'恒河一沙',
-u'恒河之沙',
-u'哼哼唧唧',
-u'橫禍飛來',
-u'橫禍非災',
-u'恒寂之印',
-u'橫見側出',
-u'恒金寶箱',
-u'橫金拖玉',
-u'恒金漁線',
-u'橫科暴斂',
-u'橫攔豎擋',
-u'衡慮困心',
-u'橫蠻無理',
-u'橫眉瞪目',
-u'橫眉瞪眼',
-u'橫眉冷對',
-u'橫眉冷目',
-u'橫眉冷眼',
-u'橫眉立目',
-u'橫眉立眼',
-u'橫眉努目',
-u'橫眉怒視',
-u'橫眉豎眼',
-u'橫眉吐氣',
-u'衡門圭窦',
-u'衡門深巷',
-u'橫逆以待',
-u'橫平豎直',
-u'橫七豎八',
-u'橫搶武奪',
-u'橫搶硬奪',
-u'橫槍躍馬',
-u'衡情酌理',
-u'橫驅別骛',
-u'橫僿不文',
-u'橫三豎四',
-u'橫三順四',
-u'橫掃打擊',
-u'橫掃攻擊',
-u'橫掃猛擊',
-u'橫掃千軍',
-u'橫掃摔絆',
-u'橫掃重錘',
-u'橫生枝節',
-u'衡石程書',
-u'衡石量書',
-u'橫槊賦詩',
-u'橫說橫有理豎說豎有理',
-u'橫說豎說',
-u'橫躺豎卧',
-u'橫挑鼻子豎挑眼',
-u'橫推倒拽',
-u'橫拖倒扯',
-u'橫拖倒拽',
-u'橫拖豎拉',
-u'恒舞酣歌',
-u'橫無忌憚',
-u'橫翔捷出',
-u'橫行逆施',
-u'橫行天下',
-u'橫行無忌',
-u'橫行直撞',
-u'橫行直走',
-u'橫殃飛禍',
-u'桁揚相望',
-u'衡陽雁斷',
-u'衡陽雁杳',
-u'衡嶽借兵',
-u'橫災飛禍',
-u'橫災梨棗',
-u'橫折強敵',
-u'橫遮豎擋',
-u'橫遮豎攔',
-u'橫針豎線',
-u'橫征暴賦',
-u'橫征暴斂',
-u'橫征苛斂',
-u'橫征苛役',
-u'橫制頹波',
-u'鴻案鹿車',
-u'鴻案相莊',
-u'紅白喜事',
-u'紅包拿來',
-u'鴻筆麗藻',
-u'宏才大略',
-u'宏才遠志',
-u'紅塵客夢',
-u'闳侈不經',
-u'鴻俦鶴侶',
-u'紅愁綠慘',
-u'鴻毳沉舟',
-u'闳大不經',
-u'紅刀子出',
-u'紅燈綠酒',
-u'轟動一時',
-u'鴻都買第',
-u'紅豆相思',
-u'鴻斷魚沉',
-u'鴻斷魚沈',
-u'紅飛翠舞',
-u'鴻飛冥冥',
-u'鴻飛霜降',
-u'鴻飛雪爪',
-u'紅粉薄命',
-u'紅粉佳人休使老',
-u'紅粉青蛾',
-u'紅粉青樓',
-u'紅腐貫朽',
-u'洪福齊天',
-u'宏觀計量經濟模型',
-u'鴻函钜椟',
-u'泓涵演迤',
-u'轟轟烈烈',
-u'鴻鹄高翔',
-u'鴻鹄将至',
-u'鴻鹄之志',
-u'紅花還須綠葉扶',
-u'紅花吐豔',
-u'轟擊火槍',
-u'轟擊軟泥',
-u'弘濟時艱',
-u'鴻漸于幹',
-u'鴻漸之儀',
-u'弘獎風流',
-u'闳覽博物',
-u'轟雷掣電',
-u'轟雷貫耳',
-u'鴻離魚網',
-u'洪爐點雪',
-u'洪爐燎發',
-u'洪爐燎毛',
-u'紅鸾天喜',
-u'鴻毛泰岱',
-u'鴻毛泰山',
-u'鴻蒙初辟',
-u'紅木長弓',
-u'紅木之環',
-u'紅男綠女',
-u'虹霓吐穎',
-u'鴻泥雪爪',
-u'鴻篇巨着',
-u'鴻篇钜制',
-u'鴻篇巨著',
-u'紅旗報捷',
-u'紅旗招展',
-u'紅鉗魚群',
-u'洪喬捎書',
-u'洪喬擲水',
-u'洪喬之誤',
-u'紅情綠意',
-u'宏任務化',
-u'紅日三竿',
-u'鴻儒碩學',
-u'鴻商富賈',
-u'紅繩系足',
-u'弘誓大願',
-u'闳識孤懷',
-u'紅瘦綠肥',
-u'紅衰翠減',
-u'紅衰綠減',
-u'洪水橫流',
-u'洪水猛獸',
-u'紅絲暗系',
-u'紅絲待選',
-u'轟堂大笑',
-u'紅桃綠柳',
-u'轟天撼地',
-u'轟天裂地',
-u'轟天震地',
-u'宏圖大略',
-u'鴻圖大展',
-u'宏圖大志',
-u'鴻圖華構',
-u'烘托渲染',
-u'紅尾鹦鹉',
-u'鴻稀鱗絕',
-u'虹吸生命',
-u'虹吸祝福',
-u'鴻鶱鳳立',
-u'鴻鶱鳳逝',
-u'鴻翔鸾起',
-u'鴻消鯉息',
-u'虹銷雨霁',
-u'紅杏出牆',
-u'紅袖當垆',
-u'紅袖添香',
-u'鴻軒鳳翥',
-u'鴻雁哀鳴',
-u'紅顔暗老',
-u'紅顔薄命',
-u'闳言崇議',
-u'闳言高論',
-u'紅顔綠鬓',
-u'紅葉傳情',
-u'紅葉題詩',
-u'紅葉爲媒',
-u'鴻業遠圖',
-u'紅葉之題',
-u'弘毅寬厚',
-u'鴻鳦滿紙',
-u'闳意妙指',
-u'鴻衣羽裳',
-u'鴻隐鳳伏',
-u'闳宇崇樓',
-u'闳遠微妙',
-u'紅暈沖口',
-u'紅運當頭',
-u'紅雲台地',
-u'烘雲讬月',
-u'鴻章钜字',
-u'鴻爪春泥',
-u'鴻爪留泥',
-u'鴻爪雪泥',
-u'泓峥蕭瑟',
-u'洪鍾大呂',
-u'闳中肆外',
-u'紅裝素裹',
-u'紅紫亂朱',
-u'後不巴店',
-u'後不僭先',
-u'後不爲例',
-u'後不着店',
-u'喉長氣短',
-u'後車之戒',
-u'後出轉精',
-u'厚此薄彼',
-u'厚德載福',
-u'厚德載物',
-u'厚棟任重',
-u'後發制人',
-u'後福無量',
-u'侯服玉食',
-u'喉幹舌敝',
-u'後恭前倨',
-u'厚古薄今',
-u'後顧前瞻',
-u'後顧之患',
-u'後顧之慮',
-u'後顧之憂',
-u'後顧之虞',
-u'後果前因',
-u'後海先河',
-u'後合前仰',
-u'後患無窮',
-u'後悔不及',
-u'後悔何及',
-u'後會可期',
-u'後悔莫及',
-u'後會難期',
-u'後悔無及',
-u'後會無期',
-u'後會有期',
-u'後繼标識',
-u'厚積薄發',
-u'後繼無人',
-u'後繼有人',
-u'喉焦唇幹',
-u'厚今薄古',
-u'後進領袖',
-u'後進之秀',
-u'厚酒肥肉',
-u'後來處上',
-u'後來佳器',
-u'後來居上',
-u'後來者居上',
-u'後來之秀',
-u'後浪催前浪',
-u'後浪推前浪',
-u'厚禮卑辭',
-u'厚祿高官',
-u'厚祿重榮',
-u'厚毛狼皮',
-u'厚貌深辭',
-u'厚貌深情',
-u'厚貌深文',
-u'後門進狼',
-u'侯門如海',
-u'侯門似海',
-u'厚膜電路',
-u'猴年馬月',
-u'後起之秀',
-u'喉清韻雅',
-u'後人把滑',
-u'後人乘涼',
-u'喉舌之官',
-u'喉舌之任',
-u'後生可畏',
-u'齁聲雷起',
-u'厚生利用',
-u'後生小子',
-u'厚施薄望',
-u'後實先聲',
-u'後事之師',
-u'後手不接',
-u'後手不上',
-u'後天下之樂而樂',
-u'猴頭猴腦',
-u'後土皇天',
-u'厚往薄來',
-u'侯王将相',
-u'厚味臘毒',
-u'後向串擾',
-u'後巷前街',
-u'厚顔無恥',
-u'後仰前合',
-u'後羿之石',
-u'後擁前呼',
-u'後擁前驅',
-u'後擁前遮',
-u'後者處上',
-u'厚重少文',
-u'厚重戰斧',
-u'虎豹豺狼',
-u'虎飽鸱咽',
-u'虎豹狼蟲',
-u'虎背熊肩',
-u'虎背熊腰',
-u'狐奔鼠竄',
-u'虎贲中郎',
-u'虎變不測',
-u'湖邊大道',
-u'虎變龍蒸',
-u'互剝痛瘡',
-u'虎不吃伏肉',
-u'狐不二雄',
-u'呼不給吸',
-u'虎步龍行',
-u'虎不食兒',
-u'怙才驕物',
-u'胡猜亂道',
-u'胡猜亂度',
-u'胡猜亂想',
-u'戶曹參軍',
-u'胡纏亂攪',
-u'狐唱枭和',
-u'護巢兵蜂',
-u'護巢工蜂',
-u'虎超龍骧',
-u'胡吹海摔',
-u'胡吹亂嗙',
-u'胡打海摔',
-u'胡打亂鑿',
-u'虎大傷人',
-u'虎黨狐侪',
-u'虎蕩羊群',
-u'胡帝胡天',
-u'蝴蝶雙刀',
-u'虎鬥龍争',
-u'虎毒不食兒',
-u'戶對門當',
-u'怙惡不改',
-u'怙惡不悛',
-u'怙惡不逡',
-u'怙恩恃寵',
-u'虎而冠者',
-u'護法善神',
-u'胡肥鍾瘦',
-u'呼風喚雨',
-u'呼風喚雨撒豆成兵',
-u'胡服騎射',
-u'戶告人曉',
-u'胡歌野調',
-u'戶給人足',
-u'呼庚呼癸',
-u'胡公去狐',
-u'胡姑姑假姨姨',
-u'瓠瓜徒懸',
-u'虎冠之吏',
-u'胡廣補阙',
-u'湖光山色',
-u'湖廣熟天下足',
-u'怙過不悛',
-u'護過飾非',
-u'護國佑民',
-u'湖海之士',
-u'沍寒之地',
-u'忽忽不樂',
-u'狐虎之威',
-u'虎脊熊腰',
-u'狐假鸱張',
-u'狐假虎威',
-u'狐假虎威狗仗人勢',
-u'胡枷亂棒',
-u'壺漿箪食',
-u'壺漿路左',
-u'壺漿滿路',
-u'壺漿塞道',
-u'壺漿盈路',
-u'虎将帳下無熊兵',
-u'胡攪蠻纏',
-u'狐藉虎威',
-u'虎頸燕颔',
-u'虎踞鲸吞',
-u'虎踞龍蟠',
-u'狐掘狐埋',
-u'虎口拔牙',
-u'虎口殘生',
-u'糊口度日',
-u'餬口四方',
-u'虎口逃生',
-u'虎口馀生',
-u'虎口之厄',
-u'餬口之計',
-u'虎窟龍潭',
-u'胡拉亂扯',
-u'呼來喝去',
-u'呼來揮去',
-u'虎狼之國',
-u'虎狼之勢',
-u'虎狼之威',
-u'虎狼之穴',
-u'虎老雄風在',
-u'忽冷忽熱',
-u'狐狸打不成倒惹一身臊',
-u'胡裏胡塗',
-u'壺裏乾坤',
-u'狐狸尾巴',
-u'瑚琏之器',
-u'瑚琏之資',
-u'戶列簪纓',
-u'呼盧喝雉',
-u'葫蘆依樣',
-u'虎略龍韬',
-u'囫囵半片',
-u'鹘侖吞棗',
-u'虎落平川',
-u'虎落平川被犬欺',
-u'虎落平陽',
-u'虎落平陽被犬欺',
-u'虎落平陽遭犬欺',
-u'呼馬呼牛',
-u'呼馬喚牛',
-u'胡馬依風',
-u'狐埋狐搰',
-u'狐埋狐揚',
-u'呼麽喝六',
-u'狐媚惑主',
-u'狐媚魔道',
-u'狐媚魇道',
-u'狐媚猿攀',
-u'鹄面鸠形',
-u'鹄面鳥形',
-u'狐鳴狗盜',
-u'狐鳴篝火',
-u'狐鳴篝中',
-u'狐鳴後圃中',
-u'狐鳴枭噪',
-u'狐鳴魚書',
-u'呼牛呼馬',
-u'呼牛喚馬',
-u'呼牛作馬',
-u'狐朋狗黨',
-u'狐朋狗友',
-u'呼朋喚友',
-u'呼朋引類',
-u'虎皮帽檐',
-u'虎皮披風',
-u'虎皮羊質',
-u'狐憑鼠伏',
-u'虎珀拾芥',
-u'祜豈鸩人',
-u'虎鉗夾口',
-u'狐潛鼠伏',
-u'狐裘羔袖',
-u'狐裘龍茸',
-u'狐裘蒙茸',
-u'狐丘之誡',
-u'狐群狗黨',
-u'呼群結黨',
-u'鹘入鴉群',
-u'虎入羊群',
-u'呼蛇容易遣蛇難',
-u'虎生豹兒',
-u'虎生三子',
-u'虎生三子必有一彪',
-u'虎生猶可近',
-u'虎視耽耽',
-u'虎視鷹瞵',
-u'虎瘦雄心在人貧志氣存',
-u'戶樞不蠧',
-u'戶樞不蝼',
-u'戶樞不朽',
-u'狐鼠之輩',
-u'狐鼠之徒',
-u'胡說八道',
-u'胡說白道',
-u'胡說亂道',
-u'虎死不倒威',
-u'虎死不落相',
-u'虎兕出柙',
-u'胡思亂量',
-u'胡思亂想',
-u'狐死首丘',
-u'狐死兔悲',
-u'狐死兔泣',
-u'觳觫伏罪',
-u'狐綏鸨合',
-u'胡孫待制',
-u'胡孫入袋',
-u'胡啼番語',
-u'虎體熊腰',
-u'虎體鴛斑',
-u'呼天不聞',
-u'呼天不應',
-u'呼天号地',
-u'胡天胡地',
-u'呼天喚地',
-u'呼天叫地',
-u'呼天叫屈',
-u'呼天叩地',
-u'呼天搶地',
-u'壺天日月',
-u'呼天鑰地',
-u'呼天籲地',
-u'呼天龠地',
-u'虎跳龍拿',
-u'狐聽之聲',
-u'互通聲氣',
-u'互通有無',
-u'虎頭虎腦',
-u'虎頭龍腦',
-u'虎頭蛇尾',
-u'虎頭鼠尾',
-u'虎頭燕颔',
-u'狐兔之悲',
-u'怙頑不悛',
-u'互爲标榜',
-u'互爲表裏',
-u'虎尾春冰',
-u'虎威狐假',
-u'胡爲亂信',
-u'胡爲亂做',
-u'互爲因果',
-u'虎紋毒蛛',
-u'虎卧龍跳',
-u'呼吸相通',
-u'呼吸之間',
-u'戶限爲穿',
-u'互相标榜',
-u'互相懷疑',
-u'互相推诿',
-u'虎嘯風生',
-u'呼嘯龍鹫',
-u'虎心豹子膽',
-u'鹄形菜色',
-u'胡行亂鬧',
-u'胡行亂爲',
-u'鹄形鳥面',
-u'虎穴狼巢',
-u'虎穴龍潭',
-u'胡言漢語',
-u'虎咽狼吞',
-u'胡言亂道',
-u'胡言亂語',
-u'胡顔之厚',
-u'呼幺喝六',
-u'狐疑不定',
-u'狐疑不斷',
-u'狐疑不決',
-u'狐疑未決',
-u'狐疑猶豫',
-u'呼應不靈',
-u'呼鷹走狗',
-u'胡越同舟',
-u'胡越一家',
-u'胡越之禍',
-u'胡支扯葉',
-u'呼之或出',
-u'呼之即來',
-u'呼之即來揮之即去',
-u'呼之竟出',
-u'虎擲龍拿',
-u'虎擲龍挈',
-u'鹄峙鸾停',
-u'鹄峙鸾翔',
-u'呼之欲出',
-u'狐雉之戲',
-u'怙終不悔',
-u'怙終不悛',
-u'壺中日月',
-u'壺中日月長',
-u'壺中天地',
-u'壺中之天',
-u'胡謅八扯',
-u'胡謅亂嗙',
-u'胡謅亂扯',
-u'胡謅亂道',
-u'胡謅亂說',
-u'胡謅硬扭',
-u'呼晝作夜',
-u'壺裝蜜酒',
-u'胡子知言',
-u'狐蹤兔穴',
-u'胡作非爲',
-u'胡作胡爲',
-u'胡作亂爲',
-u'化被萬方',
-u'化碧苌弘',
-u'花閉月羞',
-u'花邊文學',
-u'畫餅不可充饑',
-u'畫餅充饑',
-u'話不說不明',
-u'話不說不知木不鑽不透',
-u'話不投機',
-u'話不投機半句多',
-u'話不相投',
-u'話不虛傳',
-u'華不再揚',
-u'花殘月缺',
-u'畫策設謀',
-u'話長說短',
-u'花辰月夕',
-u'花成蜜就',
-u'化馳如神',
-u'化鸱爲鳳',
-u'花唇巧舌',
-u'花簇錦攢',
-u'花攢錦簇',
-u'花攢錦聚',
-u'劃代原則',
-u'話到嘴邊留一半',
-u'畫地成牢',
-u'畫地成圖',
-u'畫地而趨',
-u'畫荻和丸',
-u'畫荻教子',
-u'畫地刻木',
-u'畫荻丸熊',
-u'劃地爲牢',
-u'劃地爲王',
-u'化敵爲友',
-u'畫地爲獄',
-u'畫地自限',
-u'畫地作獄',
-u'華顛老子',
-u'畫棟雕梁',
-u'畫棟飛甍',
-u'畫棟朱簾',
-u'花堆錦簇',
-u'花多子少',
-u'花萼相輝',
-u'華而不實',
-u'華而少實',
-u'華發蒼顔',
-u'花飛蝶舞',
-u'華封三祝',
-u'花逢時發',
-u'華封之祝',
-u'化腐成奇',
-u'畫符念咒',
-u'化腐爲奇',
-u'化腐朽爲神奇',
-u'化幹戈爲玉帛',
-u'花糕員外',
-u'畫閣朱樓',
-u'花根本豔',
-u'華冠麗服',
-u'花光柳影',
-u'畫鬼容易畫人難',
-u'華衮之贈',
-u'花好還須葉來襯',
-u'花好月圓',
-u'花紅柳綠',
-u'花後施肥貴似金',
-u'畫虎不成',
-u'畫虎不成反類狗',
-u'畫虎不成反類犬',
-u'畫虎成狗',
-u'畫虎畫皮難畫骨',
-u'畫虎刻鹄',
-u'畫虎類狗',
-u'畫虎類犬',
-u'花花公子',
-u'花花轎子人擡人',
-u'花花綠綠',
-u'花花世界',
-u'花花太歲',
-u'花花型警',
-u'花花絮絮',
-u'畫戟雕弓',
-u'化及冥頑',
-u'滑稽突梯',
-u'化及豚魚',
-u'滑稽之雄',
-u'畫家算法',
-u'花甲之年',
-u'畫疆墨守',
-u'畫疆自守',
-u'花嬌柳媚',
-u'劃界而治',
-u'花街柳陌',
-u'花街柳市',
-u'花街柳巷',
-u'劃界爲疆',
-u'花錦世界',
-u'花開兩朵各表一枝',
-u'花開似錦',
-u'話裏藏阄',
-u'話裏帶刺',
-u'花裏胡哨',
-u'話裏有刺',
-u'話裏有話',
-u'畫裏真真',
-u'畫梁雕棟',
-u'花林粉陣',
-u'化零爲整',
-u'骅骝開道',
-u'畫龍不成反爲狗',
-u'畫龍點睛',
-u'畫龍點晴',
-u'畫龍點眼',
-u'畫龍刻鹄',
-u'畫卵雕薪',
-u'花馬吊嘴',
-u'花貌雪膚',
-u'畫眉舉案',
-u'畫眉張敞',
-u'畫眉之樂',
-u'花門柳戶',
-u'花苗頭飾',
-u'化民成俗',
-u'化民易俗',
-u'花明柳暗',
-u'花明柳媚',
-u'花魔酒病',
-u'花貎蓬心',
-u'滑泥揚波',
-u'滑皮鲭魚',
-u'畫瓶儲糞',
-u'畫瓶盛糞',
-u'華樸巧拙',
-u'花錢粉鈔',
-u'話淺理不淺',
-u'化錢要化在刀刃上',
-u'花前月下',
-u'劃清界線',
-u'花衢柳陌',
-u'花拳繡腿',
-u'劃然兩事',
-u'化日光天',
-u'花容玉貌',
-u'花容月貌',
-u'畫若鴻溝',
-u'化若偃草',
-u'畫沙成卦',
-u'畫沙聚米',
-u'畫沙印泥',
-u'畫蛇添足',
-u'畫蛇著足',
-u'花神之息',
-u'花生滿路',
-u'嘩世動俗',
-u'嘩世取寵',
-u'嘩世取名',
-u'華實相稱',
-u'畫水镂冰',
-u'畫水無風空作浪',
-u'畫水掀壁',
-u'花說柳說',
-u'花天錦地',
-u'花天酒地',
-u'花甜蜜就',
-u'花甜蜜嘴',
-u'滑天下之大稽',
-u'化鐵爲金',
-u'華亭鶴唳',
-u'滑頭滑腦',
-u'畫土分疆',
-u'花團錦簇',
-u'華佗妙術',
-u'畫瓦書符',
-u'化外之民',
-u'化爲泡影',
-u'化爲烏有',
-u'化爲異物',
-u'花無百日紅',
-u'華屋丘山',
-u'華屋丘墟',
-u'華屋山丘',
-u'劃下道來',
-u'華夏藍籌',
-u'花下曬裈',
-u'化險爲夷',
-u'花香鳥語',
-u'滑翔者安蒂魯斯',
-u'化枭爲鸠',
-u'花信年華',
-u'化性起僞',
-u'華星秋月',
-u'花須蝶芒',
-u'滑胥疲民',
-u'華胥之國',
-u'華胥之夢',
-u'話言話語',
-u'花言巧語',
-u'花顔月貌',
-u'花樣百出',
-u'花樣翻新',
-u'花樣新翻',
-u'畫野分疆',
-u'劃一不二',
-u'畫意詩情',
-u'畫一之法',
-u'畫蚓塗鴉',
-u'花影缤紛',
-u'畫影圖形',
-u'花有重開日人無再少年',
-u'畫苑冠冕',
-u'花月之身',
-u'花朝月夕',
-u'花朝月夜',
-u'花遮柳掩',
-u'花遮柳隐',
-u'化整爲零',
-u'畫脂镂冰',
-u'花枝招顫',
-u'花枝招颭',
-u'話中帶刺',
-u'花中君子',
-u'譁衆取寵',
-u'話中有話',
-u'畫中有詩',
-u'劃粥割齑',
-u'花燭洞房',
-u'花燭夫妻',
-u'花燭紅妝',
-u'花嘴花舌',
-u'花嘴騙舌',
-u'化作泡影',
-u'懷安敗名',
-u'懷安喪志',
-u'懷抱利器',
-u'懷寶迷邦',
-u'懷寶夜行',
-u'懷璧其罪',
-u'懷璧爲罪',
-u'懷璧緻罪',
-u'懷才抱道',
-u'懷才抱德',
-u'懷才抱器',
-u'懷才不偶',
-u'懷才不遇',
-u'懷寵屍位',
-u'懷刺不适',
-u'懷刺漫滅',
-u'懷道迷邦',
-u'懷德畏威',
-u'懷敵附遠',
-u'懷惡不悛',
-u'壞法亂紀',
-u'懷古傷今',
-u'懷觚握椠',
-u'懷恨在心',
-u'懷黃垂紫',
-u'懷黃佩紫',
-u'懷黃拖紫',
-u'懷黃握白',
-u'懷金垂紫',
-u'懷金拖紫',
-u'懷瑾握瑜',
-u'淮桔爲枳',
-u'懷祿貪勢',
-u'淮南雞犬',
-u'槐南一夢',
-u'懷鉛吮墨',
-u'懷鉛提椠',
-u'懷鉛握椠',
-u'懷鉛握素',
-u'壞人心術',
-u'懷柔天下',
-u'懷山襄陵',
-u'壞裳爲袴',
-u'懷土之情',
-u'淮王雞狗',
-u'淮王雞犬',
-u'懷鄉之情',
-u'懷刑自愛',
-u'懷銀纡紫',
-u'懷憂喪志',
-u'淮雨別風',
-u'懷冤抱屈',
-u'懷遠以德',
-u'懷詐暴憎',
-u'懷着鬼胎',
-u'懷真抱素',
-u'懷質抱真',
-u'壞植散群',
-u'懷珠抱玉',
-u'懷珠韫玉',
-u'懷磚之俗',
-u'還本付息',
-u'歡蹦亂跳',
-u'歡忭鼓舞',
-u'緩兵之計',
-u'緩步代車',
-u'緩步當車',
-u'緩不濟急',
-u'緩步徐行',
-u'幻彩炫光',
-u'歡場如戲場',
-u'宦成名立',
-u'還淳反古',
-u'還醇返樸',
-u'還淳反素',
-u'緩帶輕裘',
-u'患得患失',
-u'換鬥移星',
-u'環堵蕭然',
-u'環堵之室',
-u'渙爾冰開',
-u'渙發大号',
-u'煥發青春',
-u'環肥燕瘦',
-u'萑苻遍野',
-u'緩歌缦舞',
-u'換骨奪胎',
-u'換骨脫胎',
-u'宦海風波',
-u'宦海浮沉',
-u'宦海升沉',
-u'渙汗大号',
-u'歡呼鼓舞',
-u'歡呼雷動',
-u'歡呼雀躍',
-u'緩急輕重',
-u'緩急相濟',
-u'擐甲操戈',
-u'擐甲持戈',
-u'擐甲揮戈',
-u'擐甲披袍',
-u'擐甲執兵',
-u'擐甲執銳',
-u'環境映射',
-u'歡聚一堂',
-u'環林璧水',
-u'歡眉大眼',
-u'歡苗愛葉',
-u'患難夫妻',
-u'患難相扶',
-u'患難相共',
-u'患難相濟',
-u'患難相救',
-u'患難相死',
-u'患難相恤',
-u'患難與共',
-u'患難之交',
-u'宦囊清苦',
-u'還年卻老',
-u'還年駐色',
-u'還樸反古',
-u'渙然冰解',
-u'渙然冰釋',
-u'煥然如新',
-u'煥然一新',
-u'換日偷天',
-u'渙如冰釋',
-u'歡如平生',
-u'渙若冰釋',
-u'渙若冰消',
-u'歡若平生',
-u'歡聲雷動',
-u'歡聲如雷',
-u'患生所忽',
-u'歡聲已覺沸通衢',
-u'患生肘腋',
-u'換帥如換刀',
-u'換湯不換藥',
-u'歡天喜地',
-u'還我河山',
-u'環霧披風',
-u'歡喜若狂',
-u'歡喜冤家',
-u'還鄉晝錦',
-u'歡笑惟三五',
-u'歡忻鼓舞',
-u'歡欣若狂',
-u'歡忻踴躍',
-u'歡娛嫌夜短',
-u'換羽移宮',
-u'還元返本',
-u'患至呼天',
-u'還治其人之身',
-u'還珠返璧',
-u'還珠合浦',
-u'還珠買椟',
-u'黃白之術',
-u'慌不擇路',
-u'慌不擇路饑不擇食',
-u'黃塵清水',
-u'黃沉之石',
-u'皇城金翅',
-u'皇城銀翅',
-u'潢池盜弄',
-u'潢池弄兵',
-u'荒誕不經',
-u'荒誕無稽',
-u'黃道吉日',
-u'皇帝不急太監急',
-u'黃帝乘龍',
-u'皇帝的女兒不愁嫁',
-u'皇帝徽記',
-u'皇帝輪流做',
-u'皇帝輪流做明年到我家',
-u'黃帝子孫',
-u'黃耳傳書',
-u'黃發垂髫',
-u'黃發骀背',
-u'黃發兒齒',
-u'黃發鲐背',
-u'黃蜂尾上針',
-u'黃風霧罩',
-u'黃幹黑廋',
-u'黃公酒垆',
-u'黃耇台背',
-u'荒怪不經',
-u'黃冠草服',
-u'黃冠草履',
-u'黃冠野服',
-u'黃颔小兒',
-u'黃河防秋',
-u'黃河尚有澄清日',
-u'黃河水清',
-u'黃厚之石',
-u'黃花晚節',
-u'惶惶不安',
-u'惶惶不可終日',
-u'恍恍蕩蕩',
-u'慌慌張張',
-u'惶惑不安',
-u'惶惑無主',
-u'黃齑白飯',
-u'黃齑淡飯',
-u'荒郊曠野',
-u'荒郊野外',
-u'黃金容易得知心最難求',
-u'黃金散盡爲收書',
-u'黃金時代',
-u'黃金失色',
-u'黃金無假',
-u'黃金有價玉無價',
-u'黃金坐标',
-u'荒酒縱獵',
-u'黃卷赤軸',
-u'黃卷青燈',
-u'黃絹色絲',
-u'黃絹外孫',
-u'黃卷幼婦',
-u'惶恐不安',
-u'黃口孺子',
-u'黃口小兒',
-u'黃口小雀',
-u'黃梁美夢',
-u'黃梁一夢',
-u'黃梁一枕',
-u'黃梁之夢',
-u'潢潦可薦',
-u'黃龍痛飲',
-u'黃蘆白葦',
-u'黃垆之痛',
-u'黃麻紫泥',
-u'黃麻紫書',
-u'黃茅白葦',
-u'黃梅未落青梅落',
-u'黃綿襖子',
-u'荒渺不經',
-u'荒謬不經',
-u'荒謬絕倫',
-u'黃袍加身',
-u'黃袍加體',
-u'黃皮刮廋',
-u'荒棄鬼屋',
-u'黃耆台背',
-u'黃旗紫蓋',
-u'皇親國戚',
-u'黃青在線',
-u'黃犬傳書',
-u'黃泉地下',
-u'黃犬寄書',
-u'黃泉路上沒老少',
-u'黃泉小鬼',
-u'黃泉之下',
-u'黃雀伺蟬',
-u'黃雀銜環',
-u'黃雀在後',
-u'恍然大悟',
-u'恍然而悟',
-u'恍然若失',
-u'恍然自失',
-u'黃人捧日',
-u'黃人守日',
-u'恍如隔世',
-u'恍如夢境',
-u'恍如夢寐',
-u'恍若隔世',
-u'黃色噴漆',
-u'皇上不急太監急',
-u'荒時暴月',
-u'慌手慌腳',
-u'慌手忙腳',
-u'惶悚不安',
-u'黃台瓜辭',
-u'黃台之瓜',
-u'荒唐不經',
-u'黃湯淡水',
-u'黃湯辣水',
-u'荒唐謬悠',
-u'荒唐無稽',
-u'荒唐之辭',
-u'皇天不負苦心人',
-u'皇天不負有心人',
-u'皇天後土',
-u'黃天焦日',
-u'皇天有眼',
-u'黃童白顛',
-u'黃童白叟',
-u'黃童晧首',
-u'荒土奴隸',
-u'荒無人煙',
-u'黃霧四塞',
-u'荒蕪之地',
-u'黃屋左纛',
-u'荒煙蔓草',
-u'荒煙野蔓',
-u'黃楊厄閏',
-u'滉漾無涯',
-u'黃衣加身',
-u'黃衣廪食',
-u'荒淫無恥',
-u'荒淫無道',
-u'荒淫無度',
-u'黃雲白草',
-u'慌張失措',
-u'荒張失勢',
-u'黃鍾長棄',
-u'黃鍾大呂',
-u'黃鍾毀棄',
-u'黃鍾毀棄瓦釜雷鳴',
-u'黃中内潤',
-u'黃中通理',
-u'黃锺瓦缶',
-u'黃鍾瓦釜',
-u'慌作一團',
-u'諱敗推過',
-u'諱兵畏刑',
-u'悔不當初',
-u'毀不滅性',
-u'毀不危身',
-u'回腸百轉',
-u'回腸寸斷',
-u'回腸蕩氣',
-u'回腸結氣',
-u'回腸九轉',
-u'喙長三尺',
-u'回腸傷氣',
-u'毀車殺馬',
-u'槥車相望',
-u'灰塵力場',
-u'灰塵之雲',
-u'回嗔作喜',
-u'回嗔作笑',
-u'麾斥八極',
-u'回籌轉策',
-u'回船轉舵',
-u'回春妙手',
-u'回春藥水',
-u'回春增效',
-u'回春之術',
-u'荟萃一堂',
-u'回答模式',
-u'隳膽抽腸',
-u'回蕩不已',
-u'誨盜誨淫',
-u'會道能說',
-u'穢德垢行',
-u'穢德彰聞',
-u'悔讀南華',
-u'悔毒之歎',
-u'諱惡不悛',
-u'惠而不費',
-u'誨而不倦',
-u'誨爾諄諄聽我藐藐',
-u'彗泛畫塗',
-u'毀方投圓',
-u'毀方瓦合',
-u'灰飛煙滅',
-u'毀風敗俗',
-u'惠風和暢',
-u'會逢其适',
-u'悔改自新',
-u'隳肝嘗膽',
-u'回幹就濕',
-u'隳肝瀝膽',
-u'隳高堙庳',
-u'揮戈返日',
-u'揮戈回日',
-u'揮戈退日',
-u'毀冠裂裳',
-u'回光返照',
-u'輝光日新',
-u'恢詭谲怪',
-u'悔過自忏',
-u'悔過自新',
-u'悔過自責',
-u'揮翰成風',
-u'揮汗成漿',
-u'揮汗成雨',
-u'回寒倒冷',
-u'揮翰臨池',
-u'揮汗如雨',
-u'揮毫落紙',
-u'揮毫命楮',
-u'悔恨交加',
-u'恢宏大度',
-u'會話密鑰',
-u'輝煌奪日',
-u'輝煌光環',
-u'輝煌金碧',
-u'恛惶無措',
-u'輝煌之光',
-u'輝煌之紗',
-u'回黃轉綠',
-u'恢恢有馀',
-u'賄貨公行',
-u'揮霍談笑',
-u'揮霍無度',
-u'諱疾忌醫',
-u'晦迹韬光',
-u'會家不忙',
-u'毀家纾國',
-u'毀家纾難',
-u'揮劍成河',
-u'誨奸導淫',
-u'會叫的狗不咬人',
-u'隳節敗名',
-u'毀節求生',
-u'揮金不吝',
-u'惠浸萌生',
-u'揮金如土',
-u'回驚作喜',
-u'恢廓大度',
-u'毀廉蔑恥',
-u'賄賂并行',
-u'回爐複帳',
-u'賄賂公行',
-u'回祿之災',
-u'晦盲否塞',
-u'揮袂生風',
-u'灰滅無餘',
-u'諱莫高深',
-u'諱莫如深',
-u'回眸一笑',
-u'揮沐吐餐',
-u'恢奇多聞',
-u'悔其少作',
-u'回乾就濕',
-u'回巧獻技',
-u'繪情繪景',
-u'灰軀糜骨',
-u'揮拳擄袖',
-u'惠然肯來',
-u'惠然之顧',
-u'誨人不倦',
-u'誨人不厭',
-u'揮日陽戈',
-u'灰容土貌',
-u'誨汝諄諄',
-u'揮灑自如',
-u'回山倒海',
-u'回山轉海',
-u'卉裳罽衣',
-u'會少離多',
-u'虺蛇入夢',
-u'灰身粉骨',
-u'灰身滅智',
-u'灰身泯智',
-u'繪聲繪色',
-u'繪聲繪影',
-u'回生起死',
-u'繪聲寫影',
-u'會使不在家豪富',
-u'惠施五車',
-u'諱樹數馬',
-u'會說的不如會聽的',
-u'會說說不過理',
-u'會說說都是',
-u'彗汜畫塗',
-u'恢胎曠蕩',
-u'揮涕增河',
-u'回天倒地',
-u'回天倒日',
-u'回天乏術',
-u'毀天滅地',
-u'回天挽日',
-u'回天無力',
-u'回天運鬥',
-u'回天之力',
-u'回天之勢',
-u'回天轉地',
-u'回天轉日',
-u'灰頭草面',
-u'回頭是岸',
-u'灰頭土臉',
-u'灰頭土面',
-u'毀瓦畫墁',
-u'回味無窮',
-u'穢聞四播',
-u'回文織錦',
-u'惠鮮鳏寡',
-u'回響咆哮',
-u'诙諧取容',
-u'回邪入正',
-u'灰心短氣',
-u'回心改念',
-u'灰心槁形',
-u'蕙心蘭質',
-u'慧心靈性',
-u'慧心妙舌',
-u'慧心巧舌',
-u'慧心巧思',
-u'灰心喪氣',
-u'灰心喪意',
-u'蕙心纨質',
-u'回心向道',
-u'回心向善',
-u'惠心妍狀',
-u'回心易慮',
-u'回心轉念',
-u'回心轉意',
-u'毀形滅性',
-u'回旋進退',
-u'回旋走廊',
-u'穢言污語',
-u'灰煙瘴氣',
-u'慧業才人',
-u'慧業文人',
-u'會議大使',
-u'虺蜴爲心',
-u'回音戈壁',
-u'誨淫誨盜',
-u'回音群島',
-u'繪影繪聲',
-u'毀譽不一',
-u'毀譽參半',
-u'毀譽從來不可聽',
-u'穢語污言',
-u'虺蜮小人',
-u'毀于一旦',
-u'毀于蟻穴',
-u'會者不忙',
-u'蕙折蘭摧',
-u'惠貞書院',
-u'悔之不及',
-u'悔之何及',
-u'麾之即去',
-u'悔之莫及',
-u'悔之晚矣',
-u'悔之亡及',
-u'悔之無及',
-u'毀鍾爲铎',
-u'毀舟爲杕',
-u'惠子知我',
-u'毀宗夷族',
-u'會走走不過影',
-u'悔罪自新',
-u'魂不負體',
-u'渾不過三',
-u'葷不葷素不素',
-u'魂不守舍',
-u'魂不守宅',
-u'魂不著體',
-u'魂慚色褫',
-u'魂馳夢想',
-u'魂顛夢倒',
-u'昏墊之厄',
-u'昏定晨省',
-u'混沌不分',
-u'混沌芒昧',
-u'混沌未鑿',
-u'魂飛膽顫',
-u'魂飛膽裂',
-u'魂飛膽落',
-u'魂飛膽破',
-u'魂飛膽喪',
-u'魂飛膽戰',
-u'魂飛目斷',
-u'魂飛魄蕩',
-u'魂飛魄散',
-u'魂飛魄喪',
-u'魂飛魄飏',
-u'魂飛魄越',
-u'魂飛神喪',
-u'魂飛天外',
-u'魂耗魄喪',
-u'昏昏沉沉',
-u'渾渾沌沌',
-u'昏昏噩噩',
-u'昏昏浩浩',
-u'昏昏默默',
-u'渾渾沈沈',
-u'渾渾無涯',
-u'昏昏欲睡',
-u'混混沄沄',
-u'昏昏醉到酉',
-u'渾金白玉',
-u'渾金璞玉',
-u'昏鏡重光',
-u'昏鏡重明',
-u'昏鏡重磨',
-u'魂驚膽顫',
-u'魂驚膽落',
-u'魂驚魄落',
-u'魂驚魄惕',
-u'昏聩胡塗',
-u'昏聩無能',
-u'魂勞夢斷',
-u'混亂匕首',
-u'混亂釘刺',
-u'渾掄吞棗',
-u'昏眊重膇',
-u'魂夢爲勞',
-u'昏迷不醒',
-u'昏迷沖擊',
-u'昏迷打擊',
-u'昏迷抵抗',
-u'昏迷猛擊',
-u'昏迷炸彈',
-u'昏迷重擊',
-u'魂飄魄散',
-u'魂飄神蕩',
-u'渾樸自然',
-u'魂祈夢請',
-u'魂牽夢萦',
-u'渾然不覺',
-u'渾然天成',
-u'渾然忘我',
-u'渾然無知',
-u'渾然一體',
-u'渾然自成',
-u'魂喪神奪',
-u'魂懾色沮',
-u'渾身發軟',
-u'渾身是膽',
-u'渾身是口',
-u'渾身是口難分辨',
-u'渾身是糁',
-u'渾身是鐵打得多少釘兒',
-u'渾身銅臭',
-u'渾身無力',
-u'渾身解數',
-u'混世冥牛',
-u'混世魔王',
-u'混水撈魚',
-u'渾水摸魚',
-u'昏睡藥水',
-u'混說白道',
-u'渾俗和光',
-u'昏天暗地',
-u'昏天黑地',
-u'混同車書',
-u'昏頭打腦',
-u'昏頭昏腦',
-u'昏頭暈腦',
-u'昏頭轉向',
-u'魂亡膽落',
-u'魂亡魄喪',
-u'魂亡魄失',
-u'混爲一說',
-u'混爲一談',
-u'渾無罣礙',
-u'混洗交換',
-u'魂銷腸斷',
-u'魂消膽喪',
-u'混淆黑白',
-u'魂銷目斷',
-u'魂消魄奪',
-u'魂銷魄散',
-u'魂消魄喪',
-u'混淆是非',
-u'混淆視聽',
-u'混血腐皮',
-u'混血河爪',
-u'魂搖魄亂',
-u'混一車書',
-u'混應濫應',
-u'昏庸無道',
-u'葷油蒙了心',
-u'混造黑白',
-u'混作一談',
-u'獲保首領',
-u'活蹦活跳',
-u'活蹦亂跳',
-u'禍必重來',
-u'活剝生吞',
-u'禍不單行',
-u'禍不反踵',
-u'禍不妄至',
-u'禍不旋踵',
-u'禍成自微',
-u'禍出不測',
-u'禍從浮浪起辱因賭博招',
-u'禍從口出',
-u'禍從口出病從口入',
-u'禍從口出患從口入',
-u'禍從口生',
-u'禍從天降',
-u'豁達大度',
-u'火大傷身',
-u'活到老學到老',
-u'禍到未必禍',
-u'火到豬頭爛錢到公事辦',
-u'霍恩子句',
-u'貨而不售',
-u'禍發齒牙',
-u'禍發蕭牆',
-u'禍福得喪',
-u'禍福靡常',
-u'禍福同門',
-u'禍福惟人',
-u'禍福無常',
-u'禍福無門',
-u'禍福無偏',
-u'禍福相共',
-u'禍福相貫',
-u'禍福相生',
-u'禍福相随',
-u'禍福相依',
-u'禍福倚伏',
-u'禍福有命',
-u'禍福由人',
-u'禍福由已',
-u'禍福之門',
-u'禍福之鄉',
-u'禍福之轉',
-u'火高三丈',
-u'火耕流種',
-u'火耕水耨',
-u'火耕水種',
-u'火光沖天',
-u'火光燭天',
-u'禍國殃民',
-u'火海刀山',
-u'禍害之毒',
-u'火候不到',
-u'貨賄公行',
-u'禍機不測',
-u'禍及池魚',
-u'禍積忽微',
-u'火急火燎',
-u'火見真金',
-u'火焦火辣',
-u'禍結兵連',
-u'禍結釁深',
-u'禍近池魚',
-u'火盡灰冷',
-u'火盡薪傳',
-u'禍絕福連',
-u'獲隽公車',
-u'豁口截舌',
-u'禍來神昧',
-u'火老金柔',
-u'獲利倍蓗',
-u'火裏火發',
-u'火力集中',
-u'火力藥劑',
-u'火列星屯',
-u'活靈活現',
-u'火龍黼黻',
-u'活龍活現',
-u'獲隴望蜀',
-u'活龍鮮健',
-u'貨賂并行',
-u'貨賂大行',
-u'貨賂公行',
-u'禍亂交興',
-u'禍亂滔天',
-u'禍亂相尋',
-u'禍亂相踵',
-u'貨賣一層皮',
-u'貨賣一張皮',
-u'貨賣一張嘴',
-u'火冒三尺',
-u'火冒三丈',
-u'火滅煙消',
-u'火耨刀耕',
-u'禍迫眉睫',
-u'活潑天機',
-u'禍起飛語',
-u'火妻灰子',
-u'火齊木難',
-u'禍起細微',
-u'禍起蕭牆',
-u'禍起隐微',
-u'蠖屈不伸',
-u'蠖屈求伸',
-u'豁然大悟',
-u'豁然頓悟',
-u'霍然而愈',
-u'豁然貫通',
-u'豁然開朗',
-u'豁然開悟',
-u'豁然确斯',
-u'豁然霧解',
-u'豁然省悟',
-u'火熱水深',
-u'禍稔惡積',
-u'禍稔惡盈',
-u'豁人耳目',
-u'火刃廢墟',
-u'活人濟世',
-u'活人絕技',
-u'活人手段',
-u'活人無算',
-u'禍稔蕭牆',
-u'火傘高張',
-u'活色生香',
-u'火煞天燈',
-u'火上加油',
-u'火上澆油',
-u'火上弄冰',
-u'火上弄雪',
-u'火上燒油',
-u'火上添油',
-u'火上無冰淩',
-u'火殇怨靈',
-u'火燒火燎',
-u'火燒眉睫',
-u'火燒眉毛',
-u'火燒眉毛顧眼前',
-u'火燒屁股',
-u'火燒紙馬鋪落得做人情',
-u'活神活現',
-u'禍生不測',
-u'禍生不德',
-u'禍生纖纖',
-u'禍生蕭牆',
-u'禍生懈惰',
-u'禍生于忽',
-u'禍生肘腋',
-u'惑世盜名',
-u'火勢借風勢',
-u'惑世誣民',
-u'禍是自己作的',
-u'禍首罪魁',
-u'火樹琪花',
-u'火樹銀花',
-u'活天冤枉',
-u'獲兔烹狗',
-u'禍爲福先',
-u'禍兮福所倚',
-u'禍兮福所倚福兮禍所伏',
-u'火小不抵風',
-u'火屑彈幕',
-u'火性發作',
-u'活形活現',
-u'火星亂冒',
-u'禍興蕭牆',
-u'活眼活現',
-u'火眼金睛',
-u'禍延四海',
-u'活眼現報',
-u'獲益不淺',
-u'獲益匪淺',
-u'獲益良多',
-u'禍溢于世',
-u'禍因惡積',
-u'禍盈惡稔',
-u'或有侯王',
-u'或有蘭香',
-u'禍與福鄰',
-u'禍在朝夕',
-u'禍在旦夕',
-u'禍棗災梨',
-u'貨真價實',
-u'禍至不懼',
-u'禍至神惑',
-u'禍至神昧',
-u'禍至無日',
-u'火中取栗',
-u'禍中有福',
-u'火燭小心',
-u'火燭銀花',
-u'活捉生擒',
-u'獲罪于天',
-u'禍作福階',
-u'積案如山',
-u'積案盈箱',
-u'激昂慷慨',
-u'戢暴鋤強',
-u'饑飽勞役',
-u'冀北空群',
-u'極本窮源',
-u'積本求原',
-u'積弊如山',
-u'擊鞭錘镫',
-u'擊鞭鎚镫',
-u'機變如神',
-u'及賓有魚',
-u'急病讓夷',
-u'擊缽催詩',
-u'肌擘理分',
-u'激薄停澆',
-u'擊搏挽裂',
-u'及不得一腳指',
-u'計不返顧',
-u'饑不遑食',
-u'急不及待',
-u'雞不及鳳',
-u'急不可待',
-u'急不可耐',
-u'饑不可食',
-u'饑不可食寒不可衣',
-u'機不可失失不再來',
-u'疾不可爲',
-u'機不容發',
-u'急不如快',
-u'雞不尿泡總有一變',
-u'饑不暇食',
-u'急不暇擇',
-u'積不相能',
-u'積不相容',
-u'計不旋跬',
-u'計不旋踵',
-u'幾不欲生',
-u'急不擇路',
-u'饑不擇食',
-u'饑不擇食寒不擇衣',
-u'急不擇途',
-u'急不擇言',
-u'積财吝賞',
-u'積财千萬',
-u'積财千萬不如薄技在身',
-u'積财千萬不如薄藝在身',
-u'饑飡渴飲',
-u'積草囤糧',
-u'藉草枕塊',
-u'積讒糜骨',
-u'積讒磨骨',
-u'雞腸狗肚',
-u'饑腸雷動',
-u'饑腸雷鳴',
-u'掎裳連袂',
-u'掎裳連襼',
-u'饑腸辘辘',
-u'既成事實',
-u'繼成衣缽',
-u'急赤白臉',
-u'屐齒之折',
-u'雞蟲得喪',
-u'雞蟲得失',
-u'急處從寬',
-u'急杵搗心',
-u'計绌方匮',
-u'計出萬全',
-u'計出萬死',
-u'計出無聊',
-u'計出無奈',
-u'幾次三番',
-u'集翠成裘',
-u'雞大飛不過牆',
-u'擊打噪聲',
-u'雞蛋裏找骨頭',
-u'積德累功',
-u'積德累仁',
-u'積德累善',
-u'既得利益',
-u'記得少年騎竹馬',
-u'積德裕後',
-u'及第必争先',
-u'及第成名',
-u'棘地荊天',
-u'蹐地跼天',
-u'際地蟠天',
-u'饑凍交切',
-u'計鬥負才',
-u'幾多白屋出卿',
-u'技多不壓人',
-u'極惡不赦',
-u'積訛成蠹',
-u'嫉惡好善',
-u'濟惡斂怨',
-u'極惡窮兇',
-u'嫉惡如仇',
-u'疾惡如風',
-u'嫉惡若仇',
-u'積惡餘殃',
-u'饑餓之寒',
-u'機兒不快梭兒快',
-u'幾而不征',
-u'積而能散',
-u'饑而忘食',
-u'極而言之',
-u'計伐稱勳',
-u'積非成是',
-u'雞飛蛋打',
-u'雞飛狗竄',
-u'雞飛狗叫',
-u'雞飛狗跳',
-u'雞飛狗走',
-u'積非習貫',
-u'積憤不泯',
-u'激忿填膺',
-u'急風暴雨',
-u'箕風畢雨',
-u'疾風部落',
-u'疾風草原',
-u'及鋒而試',
-u'疾風橫雨',
-u'疾風勁草',
-u'疾風胫甲',
-u'霁風朗月',
-u'疾風掃秋葉',
-u'稷蜂社鼠',
-u'疾風甚雨',
-u'疾風迅雷',
-u'及鋒一試',
-u'跻峰造極',
-u'疾風知勁草',
-u'疾風知勁草國亂顯忠臣',
-u'急風驟雨',
-u'疾風助猛火',
-u'饑附飽飏',
-u'雞膚鶴發',
-u'雞伏鹄卵',
-u'骥伏鹽車',
-u'紀綱人論',
-u'棘根木棒',
-u'計功補過',
-u'計功程勞',
-u'急功好利',
-u'急公好施',
-u'急公好義',
-u'急公近利',
-u'急功近名',
-u'積功累行',
-u'計功量罪',
-u'計功謀利',
-u'計功受爵',
-u'計功受賞',
-u'記功忘過',
-u'記功忘失',
-u'計功行封',
-u'計功行賞',
-u'積功興業',
-u'積谷防饑',
-u'齑骨粉身',
-u'汲古閣本',
-u'繼古開今',
-u'稽古揆今',
-u'擊鼓鳴金',
-u'極古窮今',
-u'稽古振今',
-u'雞骨支床',
-u'雞骨支離',
-u'及瓜而代',
-u'急管繁弦',
-u'機關算盡',
-u'機關用盡',
-u'極光圓盾',
-u'繼晷焚膏',
-u'濟國安邦',
-u'計過自訟',
-u'饑寒交湊',
-u'饑寒交迫',
-u'饑寒交切',
-u'饑寒交至',
-u'饑寒起盜心',
-u'雞寒上距鴨寒下水',
-u'濟寒赈貧',
-u'濟河焚舟',
-u'計合謀從',
-u'積厚成器',
-u'積厚流光',
-u'饑虎撲食',
-u'寄虎丘範長老',
-u'寄花獻佛',
-u'際會風雲',
-u'積毀銷骨',
-u'積毀銷金',
-u'忌諱之禁',
-u'饑火燒腸',
-u'計獲事足',
-u'饑火中燒',
-u'濟濟彬彬',
-u'岌岌不可終日',
-u'繼繼承承',
-u'繼繼存存',
-u'濟濟多士',
-u'瘠己肥人',
-u'汲汲顧影',
-u'汲汲皇皇',
-u'己饑己溺',
-u'亟疾苛察',
-u'岌岌可危',
-u'汲汲忙忙',
-u'及笄年華',
-u'濟濟跄跄',
-u'擠擠攘攘',
-u'急急如律令',
-u'寄迹山林',
-u'繼繼繩繩',
-u'即即世世',
-u'積基樹本',
-u'寂寂無名',
-u'寂寂無人',
-u'寂寂無聲',
-u'寂寂無聞',
-u'濟濟一堂',
-u'濟濟之士',
-u'擊楫中流',
-u'汲汲孜孜',
-u'積甲如山',
-u'積甲山齊',
-u'寄豭之豬',
-u'積簡充棟',
-u'積健爲雄',
-u'既奸雄欲有立志者',
-u'計将安出',
-u'犄角戒指',
-u'掎角之勢',
-u'掎角之援',
-u'計較锱铢',
-u'擊節稱賞',
-u'擊節稱歎',
-u'擊節歎賞',
-u'擊節贊賞',
-u'急近功利',
-u'饑馑薦臻',
-u'積金累玉',
-u'計盡力窮',
-u'積金千兩',
-u'積金至鬥',
-u'急景殘年',
-u'急驚風遇着慢郎中',
-u'急驚風撞着慢郎中',
-u'急景流年',
-u'即景生情',
-u'積久弊生',
-u'繼絕存亡',
-u'繼絕扶傾',
-u'繼絕興亡',
-u'饑渴交攻',
-u'饑渴交迫',
-u'忌克少威',
-u'極口分辯',
-u'雞口牛後',
-u'濟苦憐貧',
-u'濟困扶貧',
-u'濟困扶危',
-u'急來抱佛腳',
-u'饑來吃飯',
-u'既來之則安之',
-u'雞爛嘴巴硬',
-u'積勞成病',
-u'積勞成瘁',
-u'積勞成疾',
-u'計勞納封',
-u'積勞緻疾',
-u'極樂世界',
-u'疾雷不及掩耳',
-u'疾雷迅電',
-u'肌理豐盈',
-u'急吏緩民',
-u'積裏漸裏',
-u'積理練識',
-u'肌理細膩',
-u'急斂暴征',
-u'赍糧藉寇',
-u'戢鱗潛翼',
-u'戢鱗委翼',
-u'雞零狗碎',
-u'鶺鴒在原',
-u'畸流洽客',
-u'畸流逸客',
-u'急流勇進',
-u'急流勇退',
-u'急流勇退謂之知機',
-u'積露爲波',
-u'即鹿無虞',
-u'季路一言',
-u'季倫錦障',
-u'羁旅異鄉',
-u'羁旅之臣',
-u'急脈緩灸',
-u'急脈緩受',
-u'雞毛蒜皮',
-u'擠眉溜眼',
-u'擠眉弄眼',
-u'棘沒銅駝',
-u'及門之士',
-u'季孟之間',
-u'機敏射擊',
-u'雞鳴而起',
-u'雞鳴狗盜',
-u'雞鳴狗吠',
-u'雞鳴候旦',
-u'雞鳴戒旦',
-u'雞鳴起舞',
-u'雞鳴犬吠',
-u'雞鳴馌耕',
-u'雞鳴之助',
-u'寂寞無爲',
-u'機謀巧算',
-u'極目迥望',
-u'積木世界',
-u'極目無際',
-u'極目遠眺',
-u'極目遠望',
-u'急難何曾見一人',
-u'機難輕失',
-u'及溺呼船',
-u'己溺己饑',
-u'積年累歲',
-u'積年累月',
-u'瘠牛偾豚',
-u'瘠牛羸豚',
-u'急怒欲狂',
-u'急拍繁弦',
-u'擊排冒沒',
-u'雞皮鶴發',
-u'饑疲沮喪',
-u'肌劈理解',
-u'濟貧拔苦',
-u'極品家丁',
-u'擊其不意',
-u'擊其惰歸',
-u'雞栖鳳巢',
-u'雞栖鳳食',
-u'繼其前行',
-u'掎契伺詐',
-u'急起直追',
-u'忌前之癖',
-u'機巧貴速',
-u'濟竅飄風',
-u'掎挈伺詐',
-u'畸輕畸重',
-u'極情盡緻',
-u'寄情詩酒',
-u'極情縱欲',
-u'計窮力極',
-u'計窮力竭',
-u'計窮力盡',
-u'計窮力诎',
-u'計窮慮極',
-u'計窮慮盡',
-u'計窮勢蹙',
-u'計窮勢迫',
-u'計窮途拙',
-u'計窮智短',
-u'計窮智極',
-u'箕裘不墜',
-u'箕裘弓冶',
-u'箕裘克紹',
-u'箕裘堂構',
-u'箕裘相繼',
-u'诘诎聱牙',
-u'饑駈叩門',
-u'雞犬不安',
-u'雞犬不驚',
-u'雞犬不留',
-u'雞犬不寧',
-u'雞犬不聞',
-u'雞犬登天',
-u'雞犬皆仙',
-u'雞犬桑麻',
-u'雞犬升天',
-u'雞犬無驚',
-u'雞犬無寧',
-u'雞犬相聞',
-u'雞犬之聲相聞',
-u'雞犬之聲相聞老死不相往來',
-u'擊缺唾壺',
-u'雞群一鶴',
-u'紀群之交',
-u'寂然不動',
-u'寂然無聲',
-u'計然之策',
-u'計然之術',
-u'擊壤而歌',
-u'擊壤鼓腹',
-u'瘠人肥己',
-u'濟人利物',
-u'寄人籬下',
-u'畸人俟天',
-u'吉人天相',
-u'濟人須濟急時無',
-u'寄人檐下',
-u'急人之急',
-u'急人之困',
-u'急人之難',
-u'急人之危',
-u'急人之憂',
-u'吉人自有天相',
-u'吉人自有夭相',
-u'計日程功',
-u'計日而待',
-u'計日而俟',
-u'計日可待',
-u'計日可期',
-u'積日累久',
-u'積日累勞',
-u'積日累歲',
-u'積日累月',
-u'吉日良辰',
-u'吉日良時',
-u'計日以待',
-u'計日以期',
-u'計日以俟',
-u'計日指期',
-u'計日奏功',
-u'肌肉玉雪',
-u'急如風火',
-u'疾如雷電',
-u'急如星火',
-u'疾如旋踵',
-u'濟弱鋤強',
-u'濟弱扶傾',
-u'濟弱扶危',
-u'寂若死灰',
-u'寂若無人',
-u'稽颡泣血',
-u'稽颡肉袒',
-u'積沙成塔',
-u'積沙成灘',
-u'積善成德',
-u'箕山挂瓢',
-u'積善無人見存心有天知',
-u'積善陰骘',
-u'積善餘慶',
-u'箕山之操',
-u'箕山之風',
-u'積善之家必有餘慶',
-u'積善之家有餘慶',
-u'箕山之節',
-u'箕山之志',
-u'計上心來',
-u'計上心頭',
-u'積少成多',
-u'吉少兇多',
-u'齑身粉骨',
-u'汲深绠短',
-u'計深慮遠',
-u'極深研幾',
-u'機深智遠',
-u'疾聲大呼',
-u'雞聲斷愛',
-u'雞聲鵝鬥',
-u'疾聲厲色',
-u'紀渻木雞',
-u'濟勝之具',
-u'濟世愛民',
-u'濟世安邦',
-u'濟世安民',
-u'濟世安人',
-u'機事不密',
-u'機事不密禍先行',
-u'繼世而理',
-u'疾世憤俗',
-u'濟世功深',
-u'濟世活人',
-u'濟世經邦',
-u'濟世救人',
-u'濟世匡時',
-u'積時累日',
-u'寄食門下',
-u'雞屍牛從',
-u'即事窮理',
-u'濟世人才',
-u'及時生産',
-u'擊石彈絲',
-u'虮虱相吊',
-u'濟時行道',
-u'及時行樂',
-u'饑時一粒勝似飽時一鬥',
-u'擊石原有火',
-u'濟時拯世',
-u'濟世之才',
-u'集矢之的',
-u'疾首蹙頞',
-u'疾首蹙眉',
-u'疾首攢眉',
-u'擠手捏腳',
-u'疾首痛心',
-u'極壽無疆',
-u'雞黍深盟',
-u'雞黍之膳',
-u'積衰新造',
-u'積水成淵',
-u'積水爲海',
-u'集思廣議',
-u'奇思妙想',
-u'積素累舊',
-u'計算機層析成像',
-u'計算機監控系統',
-u'積歲累月',
-u'季孫之憂',
-u'己所不欲',
-u'己所不欲勿施于人',
-u'嫉貪如雠',
-u'極天際地',
-u'蹐天跼地',
-u'繼天立極',
-u'寂天寞地',
-u'極天蟠地',
-u'極天罔地',
-u'急痛攻心',
-u'雞頭魚刺',
-u'積土成山',
-u'急兔反噬',
-u'積土爲山',
-u'積土爲山積水爲海',
-u'雞豚同社',
-u'雞豚之息',
-u'既往不咎',
-u'既往不迫',
-u'既往不追',
-u'繼往開來',
-u'極往知來',
-u'積微成著',
-u'疾味生疾',
-u'棘圍鎖院',
-u'積微至著',
-u'基穩樓固',
-u'基穩樓堅',
-u'即溫聽厲',
-u'記問之學',
-u'雞窩裏飛出金鳳凰',
-u'計無返顧',
-u'計無付之',
-u'極武窮兵',
-u'即物窮理',
-u'計無所出',
-u'計無所施',
-u'計無所之',
-u'肌無完膚',
-u'雞鹜翔舞',
-u'雞鹜相争',
-u'計無由出',
-u'雞骛争食',
-u'積習成常',
-u'積習成俗',
-u'即席賦詩',
-u'積習漸靡',
-u'積習難除',
-u'積習難改',
-u'積習生常',
-u'積習相沿',
-u'嫉賢傲士',
-u'嫉賢妒能',
-u'吉祥富貴',
-u'吉祥如意',
-u'吉祥善事',
-u'吉祥腰飾',
-u'吉祥止止',
-u'積小成大',
-u'即小見大',
-u'積小緻巨',
-u'羁绁之仆',
-u'積薪厝火',
-u'積薪候燎',
-u'機心械腸',
-u'畸形殘渣',
-u'畸形發展',
-u'吉星高照',
-u'計行慮義',
-u'急行慢行',
-u'計行言聽',
-u'寄興寓情',
-u'即興之作',
-u'雞胸龜背',
-u'吉兇悔吝',
-u'吉兇禍福',
-u'吉兇莫蔔',
-u'吉兇慶吊',
-u'吉兇未蔔',
-u'吉兇休咎',
-u'積羞成怒',
-u'積雪封霜',
-u'積雪囊螢',
-u'積雪平原',
-u'績學之士',
-u'計勳行賞',
-u'齑鹽布帛',
-u'寄雁傳書',
-u'疾言遽色',
-u'疾言厲氣',
-u'疾言厲色',
-u'疾言怒色',
-u'寄顔無所',
-u'計研心算',
-u'饑焰中燒',
-u'激揚清濁',
-u'集腋成裘',
-u'集腋爲裘',
-u'饑一頓飽一頓',
-u'瘠義肥辭',
-u'即以其人之道',
-u'即以其人之道還治其人之身',
-u'稽疑送難',
-u'積以爲常',
-u'記憶猶新',
-u'箕引裘随',
-u'汲引忘疲',
-u'急景凋年',
-u'饑鷹餓虎',
-u'集螢映雪',
-u'季友伯兄',
-u'積憂成疾',
-u'既有今日',
-u'既有今日何必當初',
-u'疾雨暴風',
-u'積羽沉舟',
-u'積玉堆金',
-u'際遇風雲',
-u'積雨湖畔',
-u'急于求成',
-u'疾語如風',
-u'急于事功',
-u'急于星火',
-u'觊觎之心',
-u'觊觎之志',
-u'集苑集枯',
-u'霁月光風',
-u'期月有成',
-u'疾雲步級',
-u'集韻增文',
-u'極則必反',
-u'急則計生',
-u'饑則來食飽則飛去',
-u'急則生智',
-u'急則有失',
-u'急張拘諸',
-u'饑者無擇',
-u'饑者易食',
-u'饑者易爲食',
-u'饑者易爲食渴者易爲飲',
-u'雞争鵝鬥',
-u'急征重斂',
-u'赍志而殁',
-u'齎志而終',
-u'極緻高深',
-u'機智果斷',
-u'戟指嚼舌',
-u'既知今日何必當初',
-u'掎摭利病',
-u'赍志沒地',
-u'戟指怒目',
-u'極智窮思',
-u'疾之如仇',
-u'疾之若仇',
-u'繼志述事',
-u'輯志協力',
-u'赍志以沒',
-u'赍志以殁',
-u'繼之以死',
-u'棘枝戰錘',
-u'極重不反',
-u'擊鍾陳鼎',
-u'擊鍾鼎食',
-u'繼踵而至',
-u'畸重畸輕',
-u'極重難返',
-u'急中生巧',
-u'急中生智',
-u'擊中要害',
-u'急中有失',
-u'箕帚之使',
-u'擊築悲歌',
-u'積貯倍息',
-u'藉箸代籌',
-u'急竹繁絲',
-u'積铢累寸',
-u'機助人譯',
-u'機杼一家',
-u'急轉直下',
-u'既墜釜甑',
-u'激濁揚清',
-u'骥子龍文',
-u'疾走先得',
-u'疾足先得',
-u'既作生人便有生理',
-u'家敗人亡',
-u'家半三軍',
-u'夾闆醫駝子',
-u'浃背汗流',
-u'佳兵不祥',
-u'甲不離身',
-u'家财萬貫',
-u'家藏戶有',
-u'家常便飯',
-u'家常菜飯',
-u'家常茶飯',
-u'家長裏短',
-u'駕塵彍風',
-u'家成業就',
-u'假癡不癫',
-u'假癡假呆',
-u'價重連城',
-u'家醜不可外談',
-u'家醜不可外揚',
-u'家傳戶誦',
-u'家傳人誦',
-u'家傳之錘',
-u'家傳之學',
-u'夾袋中人物',
-u'家道壁立',
-u'家道從容',
-u'家到戶說',
-u'夾道歡呼',
-u'假道滅虢',
-u'家道消乏',
-u'家道小康',
-u'家道中落',
-u'價等連城',
-u'價抵連城',
-u'甲第連天',
-u'甲第連雲',
-u'甲第星羅',
-u'假緞染就真紅色',
-u'佳兒佳婦',
-u'家反宅亂',
-u'家富小兒驕',
-u'葭莩之末',
-u'葭莩之親',
-u'葭莩之情',
-u'夾輔之勳',
-u'戛釜撞甕',
-u'假公濟私',
-u'假公營私',
-u'嫁狗随狗',
-u'嫁狗逐狗',
-u'加官進爵',
-u'加官進祿',
-u'加官進位',
-u'甲冠天下',
-u'架海金梁',
-u'架海擎天',
-u'駕鶴成仙',
-u'駕鶴西遊',
-u'假虎張威',
-u'假虎之威',
-u'家花不如野花香',
-u'家花沒有野花香',
-u'架謊鑿空',
-u'嫁禍于人',
-u'加急傳送',
-u'夾擊分勢',
-u'家計漸漸退',
-u'家給民足',
-u'家骥人璧',
-u'家給人足',
-u'嫁雞随雞',
-u'嫁雞随雞嫁狗随狗',
-u'家雞野骛',
-u'家雞野雉',
-u'嫁雞逐雞',
-u'戛戛獨難',
-u'戛戛獨造',
-u'家家戶戶',
-u'戛戛其難',
-u'甲堅兵利',
-u'家見戶說',
-u'駕肩接迹',
-u'駕肩接武',
-u'架肩接踵',
-u'佳節如意',
-u'家累千金',
-u'家累千金坐不垂堂',
-u'假力于人',
-u'價廉物美',
-u'浃淪肌髓',
-u'假冒攻擊',
-u'假眉三道',
-u'假門假事',
-u'假名托姓',
-u'嘉謀善政',
-u'佳偶天成',
-u'家貧不是貧路貧愁煞人',
-u'家貧出孝子',
-u'家貧出孝子國亂顯忠臣',
-u'家貧親老',
-u'家貧如洗',
-u'家貧思賢妻',
-u'家破人離',
-u'家破人亡',
-u'家破身亡',
-u'夾七帶八',
-u'家齊而後國治',
-u'夾七夾八',
-u'夾槍帶棒',
-u'夾槍帶棍',
-u'駕輕就熟',
-u'嫁犬逐犬',
-u'戛然而止',
-u'佳人薄命',
-u'佳人才子',
-u'假人辭色',
-u'家人父子',
-u'假仁假義',
-u'佳人難得',
-u'加人一等',
-u'假仁縱敵',
-u'家散人亡',
-u'稼穑艱難',
-u'頰上三毫',
-u'頰上三毛',
-u'頰上添毫',
-u'伽什廢墟',
-u'挾勢弄權',
-u'家勢中落',
-u'假手旁人',
-u'假手于人',
-u'家書抵萬金',
-u'家私萬貫',
-u'浃髓淪膚',
-u'浃髓淪肌',
-u'假天假地',
-u'家庭骨肉',
-u'家徒壁立',
-u'假途滅虢',
-u'家徒四壁',
-u'家亡國破',
-u'伽文神父',
-u'家無常禮',
-u'家無長物',
-u'家無儋石',
-u'架屋叠床',
-u'家無鬥儲',
-u'家無二主',
-u'家無隔夜糧',
-u'家無绮缟',
-u'駕霧騰雲',
-u'假物爲用',
-u'假戲成真',
-u'假戲真做',
-u'家弦戶誦',
-u'家虛儋石',
-u'家學淵源',
-u'嘉言善行',
-u'嘉言善狀',
-u'假言推理',
-u'家言邪說',
-u'家言邪學',
-u'嘉言懿行',
-u'佳肴美馔',
-u'嘉肴旨酒',
-u'假以詞色',
-u'假意撇清',
-u'家殷人足',
-u'家有弊帚',
-u'家有弊帚享之千金',
-u'家有兒女',
-u'家有患難鄰裏相助',
-u'加油加醋',
-u'家有千口主事人',
-u'加油添醋',
-u'加油添醬',
-u'家有萬貫不如日進分文',
-u'家有萬貫一時不便',
-u'家有賢妻男人不遭橫事',
-u'家有長子國有大臣',
-u'假譽馳聲',
-u'家喻戶習',
-u'家谕戶曉',
-u'戛玉铿金',
-u'假虞滅虢',
-u'戛玉鳴金',
-u'戛玉锵金',
-u'戛玉敲冰',
-u'戛玉敲金',
-u'家緣家計',
-u'假越救溺',
-u'家賊難防',
-u'價增一顧',
-u'家長理短',
-u'家長作風',
-u'夾着尾巴',
-u'家至戶察',
-u'家至戶到',
-u'家至戶曉',
-u'價值連城',
-u'家至人說',
-u'加枝添葉',
-u'家中無才子',
-u'挾主行令',
-u'加磚添瓦',
-u'架裝結構',
-u'家赀萬貫',
-u'兼愛無私',
-u'建安風骨',
-u'見鞍思馬',
-u'簡傲絕俗',
-u'劍拔弩張',
-u'兼包并畜',
-u'兼包并容',
-u'兼包并蓄',
-u'肩背難望',
-u'肩背相望',
-u'堅壁不戰',
-u'堅壁清野',
-u'踐冰履炭',
-u'儉薄不充',
-u'譾薄之材',
-u'見不得人',
-u'堅不可摧',
-u'漸不可長',
-u'肩不能擔擔手不能提籃',
-u'間不容發',
-u'間不容緩',
-u'間不容砺',
-u'間不容縷',
-u'間不容瞚',
-u'間不容穟',
-u'間不容息',
-u'健步如飛',
-u'箭不虛發',
-u'儉不中禮',
-u'見财起意',
-u'剪草除根',
-u'湔腸伐胃',
-u'兼程并進',
-u'兼程而進',
-u'兼程前進',
-u'堅城清野',
-u'堅城深池',
-u'堅持不懈',
-u'堅持不渝',
-u'兼籌并顧',
-u'見出知人',
-u'箭穿雁嘴',
-u'箭穿雁嘴鈎搭魚鰓',
-u'肩從齒序',
-u'儉存奢失',
-u'尖擔兩頭脫',
-u'劍膽琴心',
-u'見彈求鹗',
-u'見彈求鴞',
-u'見彈求鸮見骥一毛',
-u'揀到籃裏就是菜',
-u'見德思齊',
-u'鹣鲽情濃',
-u'鹣鲽情深',
-u'堅定不移',
-u'堅定信念',
-u'堅定意志',
-u'堅定之心',
-u'堅定之印',
-u'煎豆摘瓜',
-u'簡斷編殘',
-u'見多識廣',
-u'剪惡除奸',
-u'蹇谔匪躬',
-u'見惡如探湯',
-u'謇谔之操',
-u'謇谔之風',
-u'謇谔之節',
-u'謇谔自負',
-u'見而色喜',
-u'兼而有之',
-u'剪發待賓',
-u'剪發杜門',
-u'剪發留賓',
-u'剪發被褐',
-u'剪發披缁',
-u'見縫插針',
-u'見風駛船',
-u'見風使舵',
-u'見風使帆',
-u'見風是雨',
-u'見縫下蛆',
-u'見風轉舵',
-u'見風轉蓬',
-u'見佛不拜',
-u'揀佛燒香',
-u'儉腹高談',
-u'兼覆無遺',
-u'肩負重任',
-u'煎膏炊骨',
-u'鞬櫜幹戈',
-u'揀高枝兒飛',
-u'見羹見牆',
-u'建功立事',
-u'建功立業',
-u'兼功自厲',
-u'谏鼓謗木',
-u'儉故能廣',
-u'見怪不怪',
-u'見怪不怪其怪自敗',
-u'見怪非怪',
-u'見慣不驚',
-u'見官莫向前',
-u'見慣司空',
-u'奸官污吏',
-u'間關莺語',
-u'兼官重绂',
-u'見鬼說鬼話',
-u'踐規踏矩',
-u'見過世面',
-u'堅瓠無竅',
-u'檻花籠鶴',
-u'奸回不軌',
-u'見機而行',
-u'見幾而作',
-u'劍及覆及',
-u'劍及屦及',
-u'劍及履及',
-u'劍戟森森',
-u'鑒機識變',
-u'兼濟天下',
-u'見機行事',
-u'見骥一毛',
-u'堅甲利兵',
-u'堅甲利刃',
-u'兼葭秋水',
-u'蒹葭伊人',
-u'蒹葭倚玉',
-u'蒹葭倚玉樹',
-u'蒹葭玉樹',
-u'蒹葭之思',
-u'謇謇谔谔',
-u'蹇蹇匪躬',
-u'尖尖趫趫',
-u'見見聞聞',
-u'煎膠續弦',
-u'見解高超',
-u'簡截了當',
-u'揀精揀肥',
-u'見景生情',
-u'見精識精',
-u'揀精擇肥',
-u'見可而進',
-u'見可而進知難而退',
-u'儉可養廉',
-u'儉可助廉',
-u'鑒空衡平',
-u'緘口不言',
-u'緘口藏舌',
-u'緘口結舌',
-u'緘口如瓶',
-u'緘口無言',
-u'艱苦創業',
-u'艱苦奮鬥',
-u'艱苦困難的日子',
-u'艱苦樸素',
-u'艱苦澀滞',
-u'見哭興悲',
-u'艱苦卓絕',
-u'兼覽博照',
-u'劍浪壁壘',
-u'肩勞任怨',
-u'見了新人忘舊人',
-u'揀了芝麻丢了西瓜',
-u'見利棄義',
-u'見利思義',
-u'見利忘義',
-u'簡練揣摩',
-u'贱斂貴出',
-u'贱斂貴發',
-u'見獵心喜',
-u'監臨自盜',
-u'建瓴高屋',
-u'建瓴之勢',
-u'見龍卸甲',
-u'剪虜若草',
-u'奸擄燒殺',
-u'見卵求雞',
-u'踐律蹈禮',
-u'贱買貴賣',
-u'剪莽擁彗',
-u'見貌辨色',
-u'監門之養',
-u'簡明扼要',
-u'堅明約束',
-u'肩摩毂擊',
-u'肩摩毂接',
-u'肩摩袂接',
-u'肩摩踵接',
-u'贱目貴耳',
-u'艱難竭蹶',
-u'艱難困苦',
-u'艱難曲折',
-u'艱難險阻',
-u'艱難玉成',
-u'簡能而任',
-u'見溺不救',
-u'兼年之儲',
-u'劍氣箫心',
-u'見其一未見其二',
-u'見棄于人',
-u'劍氣縱橫',
-u'鑒前毖後',
-u'見錢睹羹',
-u'見錢如命',
-u'見錢眼紅',
-u'見錢眼開',
-u'見錢眼熱',
-u'堅強不屈',
-u'見牆見羹',
-u'見诮大方',
-u'剪切變換',
-u'簡切了當',
-u'奸情出人命賭博出賊性',
-u'奸渠必剪',
-u'兼權尚計',
-u'兼權熟計',
-u'見雀張羅',
-u'堅韌不拔',
-u'堅忍不撓',
-u'堅忍不懈',
-u'奸人當道賢人危',
-u'堅韌禱言',
-u'劍刃風暴',
-u'兼人好勝',
-u'見仁見智',
-u'劍刃亂舞',
-u'漸仁摩誼',
-u'劍刃扭轉',
-u'蹇人上天',
-u'蹇人升天',
-u'兼人之材',
-u'兼人之量',
-u'見人隻說三分話',
-u'奸人之雄',
-u'兼人之勇',
-u'堅忍質直',
-u'兼容并包',
-u'兼容并蓄',
-u'見肉生根',
-u'贱入貴出',
-u'漸入佳境',
-u'堅如盤石',
-u'兼弱攻昧',
-u'見色起意',
-u'見善必遷',
-u'見善若驚',
-u'見善若渴',
-u'兼善天下',
-u'見善則遷',
-u'僭賞濫刑',
-u'緘舌閉口',
-u'濺射膜盤',
-u'艱深晦澀',
-u'見神見鬼',
-u'薦紳先生',
-u'尖聲尖氣',
-u'減師半德',
-u'谏屍謗屠',
-u'見勢不妙',
-u'見事風生',
-u'見豕負塗',
-u'蹇視高步',
-u'劍師護手',
-u'監市履豨',
-u'見事莫說',
-u'見識淺短',
-u'見事生風',
-u'見世生苗',
-u'艱食鮮食',
-u'見時知幾',
-u'見始知終',
-u'兼收并采',
-u'兼收并畜',
-u'兼收并錄',
-u'兼收并容',
-u'兼收并蓄',
-u'兼收博采',
-u'堅守不渝',
-u'劍首一吷',
-u'監守自盜',
-u'劍樹刀山',
-u'煎水作冰',
-u'見死不救',
-u'見似目懼',
-u'繭絲牛毛',
-u'簡絲數米',
-u'尖酸克薄',
-u'見所不見',
-u'見所未見',
-u'見所未見聞所未聞',
-u'劍态箫心',
-u'兼聽則明',
-u'兼聽則明偏聽則暗',
-u'兼聽則明偏信則暗',
-u'兼聽者明',
-u'奸同鬼蜮',
-u'奸同鬼蜮行若狐鼠',
-u'劍頭一吷',
-u'見兔而顧犬亡羊而補牢',
-u'見兔放鷹',
-u'見兔顧犬',
-u'見兔呼狗',
-u'踐土食毛',
-u'鑒往知來',
-u'鍵位布局',
-u'見危受命',
-u'見微知萌',
-u'見危緻命',
-u'見微知著',
-u'見聞廣博',
-u'見聞習染',
-u'見物不見人',
-u'箭無空發',
-u'見物思人',
-u'箭無虛發',
-u'見賢不隐',
-u'簡賢附勢',
-u'薦賢舉能',
-u'簡賢任能',
-u'見賢思齊',
-u'見小闇大',
-u'見笑大方',
-u'見笑于人',
-u'堅信不移',
-u'見信如面',
-u'堅心守志',
-u'見性成佛',
-u'見性明心',
-u'剪須和藥',
-u'奸胥猾吏',
-u'濺血胫甲',
-u'煎鹽疊雪',
-u'尖言尖語',
-u'尖言冷語',
-u'見樣學樣',
-u'簡要不煩',
-u'簡要清通',
-u'見堯于牆',
-u'見噎廢食',
-u'見義必爲',
-u'見義當爲',
-u'見異而遷',
-u'見義敢爲',
-u'減衣節食',
-u'殲一警百',
-u'見異思遷',
-u'揀衣挑食',
-u'儉以養德',
-u'儉以養廉',
-u'見義勇爲',
-u'奸淫擄掠',
-u'鑒影度形',
-u'箭羽瀑布',
-u'檻猿籠鳥',
-u'簡約詳核',
-u'簡在帝心',
-u'箭在弦上',
-u'箭在弦上不得不發',
-u'奸詐不級',
-u'翦爪斷發',
-u'箭折不改鋼',
-u'堅貞不屈',
-u'堅貞不渝',
-u'堅貞腰帶',
-u'谏争如流',
-u'堅執不從',
-u'見之不取',
-u'見之不取思之千裏',
-u'蹇之匪躬',
-u'漸至佳境',
-u'見智見仁',
-u'剪枝竭流',
-u'兼制生死',
-u'見制于人',
-u'翦紙招魂',
-u'剪燭西窗',
-u'兼朱重紫',
-u'監主自盜',
-u'兼資文武',
-u'尖嘴薄舌',
-u'尖嘴猴腮',
-u'尖嘴縮腮',
-u'獎拔公心',
-u'降本流末',
-u'将本求财',
-u'将本求利',
-u'将本圖利',
-u'将不畏敵兵亦勇',
-u'将差就錯',
-u'強唇劣嘴',
-u'将錯就錯',
-u'江東獨步',
-u'江東父老',
-u'将奪固與',
-u'獎罰分明',
-u'江翻海倒',
-u'江翻海沸',
-u'江翻海攪',
-u'江翻海擾',
-u'将廢姑興',
-u'将飛翼伏',
-u'将奮足局',
-u'講風涼話',
-u'将高就低',
-u'降格以求',
-u'将功補過',
-u'将功抵罪',
-u'将功贖罪',
-u'将功折過',
-u'将功折罪',
-u'講古論今',
-u'将寡兵微',
-u'降貴纡尊',
-u'姜桂之性',
-u'江海不逆小流',
-u'江海同歸',
-u'江海之士',
-u'江海之學',
-u'江漢朝宗',
-u'江漢之珠',
-u'江河不引自向東',
-u'江河日下',
-u'江河行地',
-u'江湖滿地',
-u'江湖騙子',
-u'江湖日下',
-u'江湖義氣',
-u'降級恢複',
-u'将計就計',
-u'降跽謝過',
-u'降級運行',
-u'将近彼岸',
-u'講經說法',
-u'将酒藿肉',
-u'将軍不下馬各自奔前程',
-u'将軍額上能跑馬',
-u'将軍平台',
-u'将軍之帽',
-u'将來佳器',
-u'江郎才盡',
-u'江郎才掩',
-u'僵李代桃',
-u'江流日下',
-u'江流之勝',
-u'将門出将',
-u'将門虎子',
-u'匠門棄材',
-u'将門無犬子',
-u'将門有将',
-u'将明之材',
-u'江南海北',
-u'僵仆煩愦',
-u'将勤補拙',
-u'将取固予',
-u'将去溫來',
-u'講若畫一',
-u'江山半壁',
-u'江山好改',
-u'江山好改本性難移',
-u'江山好改秉性難移',
-u'江山容易改禀性最難移',
-u'江山如故',
-u'江山如畫',
-u'江山如舊',
-u'江山易得不易治',
-u'江山易改',
-u'江山易改本性難移',
-u'江山易改禀性難移',
-u'江山易改性難移',
-u'江山之恨',
-u'江山之異',
-u'江山之助',
-u'江山助人',
-u'僵屍博客',
-u'姜是老的辣',
-u'僵屍皮靴',
-u'講是說非',
-u'僵屍形态',
-u'匠石運金',
-u'将噬爪縮',
-u'匠石斫鼻',
-u'江水不犯河水',
-u'漿水不交',
-u'将順匡救',
-u'将順其美',
-u'姜太公釣魚',
-u'姜太公釣魚願者上鈎',
-u'姜太公在此',
-u'僵桃代李',
-u'将天就地',
-u'江天一色',
-u'講文張字',
-u'将無作有',
-u'将蝦釣鼈',
-u'将相侯王',
-u'将相胸前堪走馬',
-u'将相之器',
-u'将心比心',
-u'江心補漏',
-u'匠心獨出',
-u'匠心獨具',
-u'匠心獨妙',
-u'匠心獨詣',
-u'匠心獨運',
-u'匠心獨造',
-u'降心俯首',
-u'将信将疑',
-u'将心覓心',
-u'降心順俗',
-u'降心下氣',
-u'降心相從',
-u'講信修睦',
-u'降心以從',
-u'匠心之紗',
-u'将胸比肚',
-u'将熊熊一窩',
-u'江淹才盡',
-u'江淹夢筆',
-u'降顔屈體',
-u'江洋大盜',
-u'将疑将信',
-u'将勇兵強',
-u'将勇兵雄',
-u'将遇良才',
-u'将欲取之',
-u'将欲取之必先與之',
-u'匠遇作家',
-u'江雲渭樹',
-u'将在謀不在勇',
-u'降志辱身',
-u'強嘴拗舌',
-u'強嘴硬牙',
-u'降尊臨卑',
-u'降尊纡貴',
-u'江左夷吾',
-u'焦熬投石',
-u'驕傲自滿',
-u'交杯換盞',
-u'交臂曆指',
-u'交臂失之',
-u'交臂相失',
-u'驕兵必敗',
-u'驕兵悍将',
-u'驕兵之計',
-u'腳不點地',
-u'腳不沾地',
-u'嬌藏金屋',
-u'交叉搜索',
-u'較長絜短',
-u'鹪巢蚊睫',
-u'嬌嗔滿面',
-u'驕侈暴佚',
-u'嚼齒穿龈',
-u'驕侈淫虐',
-u'驕侈淫佚',
-u'驕蟲之奴',
-u'驕蟲之仆',
-u'嚼穿龈血',
-u'焦唇敝舌',
-u'焦唇幹肺',
-u'焦唇幹舌',
-u'焦唇乾肺',
-u'焦唇乾舌',
-u'澆醇散樸',
-u'交錯觥籌',
-u'交淡若水',
-u'郊島寒瘦',
-u'嚼倒泰山不謝土',
-u'教導有方',
-u'較德焯勤',
-u'較短比長',
-u'較短的時間',
-u'較短量長',
-u'較短論長',
-u'校短推長',
-u'較短絜長',
-u'皦短心長',
-u'驕兒騃女',
-u'教兒嬰孩',
-u'嚼飯喂人',
-u'嚼飯與人',
-u'椒焚桂折',
-u'澆風薄俗',
-u'教婦初來',
-u'教婦初來教兒嬰孩',
-u'教婦初來教子嬰孩',
-u'剿撫兼施',
-u'腳高步低',
-u'膠鬲之困',
-u'腳跟不着地',
-u'腳跟無線',
-u'焦骨碎塊',
-u'澆瓜之惠',
-u'矯國革俗',
-u'矯國更俗',
-u'攪海翻江',
-u'郊寒島瘦',
-u'交橫綢缪',
-u'腳後跟打着後腦勺兒',
-u'角戶分門',
-u'澆花澆根',
-u'教皇氈帽',
-u'焦火荒野',
-u'矯激奇詭',
-u'矯矯不群',
-u'嬌嬌滴滴',
-u'膠膠擾擾',
-u'皎皎者易污',
-u'角巾東第',
-u'角巾東路',
-u'焦金流石',
-u'絞盡腦汁',
-u'焦金爍石',
-u'角巾私第',
-u'交頸并頭',
-u'交口稱歎',
-u'交口稱譽',
-u'交口稱贊',
-u'交口薦譽',
-u'交口同聲',
-u'交口贊頌',
-u'交口贊譽',
-u'叫苦不叠',
-u'叫苦連聲',
-u'叫苦連天',
-u'挢抂過正',
-u'噍類靡餘',
-u'噍類無遺',
-u'交梨火棗',
-u'角立傑出',
-u'交詈聚唾',
-u'鹪鹩一枝',
-u'角鱗王蛇',
-u'焦鱗幼龍',
-u'蛟龍得水',
-u'蛟龍得雨',
-u'蛟龍失水',
-u'蛟龍戲水',
-u'蕉鹿之夢',
-u'嬌鸾雛鳳',
-u'腳忙手亂',
-u'焦眉愁眼',
-u'焦眉苦臉',
-u'焦眉之急',
-u'焦眉皺眼',
-u'焦孟不離',
-u'嚼墨噴紙',
-u'焦木魔杖',
-u'角木彎弓',
-u'教猱升木',
-u'交能易作',
-u'嬌皮嫩肉',
-u'驕氣十足',
-u'驕漆相投',
-u'膠漆之分',
-u'交洽無嫌',
-u'交淺不可言深',
-u'交淺言深',
-u'矯情幹譽',
-u'矯情飾貌',
-u'矯情飾行',
-u'矯情飾詐',
-u'矯情鎮物',
-u'矯情自飾',
-u'叫屈連天',
-u'教然後之困',
-u'斠然一概',
-u'交人交心',
-u'叫人笑掉了大牙',
-u'挢揉造作',
-u'較如畫一',
-u'皎如日星',
-u'皎如日月',
-u'較若畫一',
-u'矯若驚龍',
-u'矯若遊龍',
-u'焦沙爛石',
-u'腳上沒鞋窮半截',
-u'驕奢放逸',
-u'嚼舌頭根',
-u'驕奢淫逸',
-u'驕生慣養',
-u'嬌聲嬌氣',
-u'嬌聲浪語',
-u'矯世變俗',
-u'焦石飛镖',
-u'矯世勵俗',
-u'較時量力',
-u'矯時慢物',
-u'矯飾僞行',
-u'較瘦量肥',
-u'交疏吐誠',
-u'焦思苦慮',
-u'矯俗幹名',
-u'腳踏兩隻船',
-u'腳踏實地',
-u'腳踏虛地',
-u'驕泰淫泆',
-u'蛟騰虎嘯',
-u'腳踢拳打',
-u'叫天天不應叫地地不靈',
-u'嚼鐵咀金',
-u'腳痛醫腳',
-u'交頭互耳',
-u'交頭接耳',
-u'焦頭爛額',
-u'狡兔三窟',
-u'狡兔三穴',
-u'狡兔死良狗烹',
-u'狡兔死走狗烹',
-u'狡兔有三窟',
-u'矯枉過當',
-u'矯枉過甚',
-u'挢枉過正',
-u'矯枉過直',
-u'矯枉過中',
-u'矯尾厲角',
-u'教無常師',
-u'較武論文',
-u'交相輝映',
-u'嬌小玲珑',
-u'矯邪歸正',
-u'腳心朝天',
-u'焦心勞思',
-u'焦心熱中',
-u'矯心飾貌',
-u'繳學費的事',
-u'教學相長',
-u'狡焉思逞',
-u'狡焉思啓',
-u'狡焉思肆',
-u'矯言僞行',
-u'皎陽似火',
-u'教亦多術',
-u'交易頻道',
-u'驕佚奢淫',
-u'教一識百',
-u'驕淫奢侈',
-u'焦油獸王',
-u'教育點播',
-u'焦躁不安',
-u'狡詐護腕',
-u'校正信号',
-u'角枝魔棒',
-u'膠柱鼓瑟',
-u'膠柱調瑟',
-u'焦灼不安',
-u'驕子不孝',
-u'嚼字咬文',
-u'節哀順變',
-u'桀骜不恭',
-u'桀骜不遜',
-u'桀骜難馴',
-u'桀骜自恃',
-u'潔白無瑕',
-u'捷報頻傳',
-u'借杯澆塊',
-u'戒備森嚴',
-u'解兵釋甲',
-u'結不解緣',
-u'結彩懸燈',
-u'解骖推食',
-u'結草銜環',
-u'結草之固',
-u'截長補短',
-u'竭誠盡節',
-u'竭誠相待',
-u'竭誠以待',
-u'節齒痛恨',
-u'借詞卸責',
-u'皆大歡喜',
-u'借貸無門',
-u'結黨聚群',
-u'結黨連群',
-u'結黨營私',
-u'街道阡陌',
-u'借刀殺人',
-u'街道巷陌',
-u'截镫留鞭',
-u'揭地掀天',
-u'借端生事',
-u'截斷衆流',
-u'接耳交頭',
-u'接二連三',
-u'截發剉稾',
-u'結發夫妻',
-u'截發留賓',
-u'解發佯狂',
-u'街坊鄰裏',
-u'街坊四鄰',
-u'解放思想',
-u'解紛排難',
-u'借風使船',
-u'接風洗塵',
-u'劫富濟貧',
-u'劫富救貧',
-u'揭竿而起',
-u'揭竿四起',
-u'借公報私',
-u'借公行私',
-u'結構化程序設計',
-u'解構之言',
-u'羯鼓催花',
-u'借古諷今',
-u'借古鑒今',
-u'羯鼓解穢',
-u'借故敲詐',
-u'借故推辭',
-u'借古喻今',
-u'接貴攀高',
-u'街号巷哭',
-u'截鶴續凫',
-u'劫後馀生',
-u'借花獻佛',
-u'嗟悔無何',
-u'嗟悔無及',
-u'借機報複',
-u'潔己從公',
-u'潔己奉公',
-u'戒急用忍',
-u'解甲倒戈',
-u'解甲歸田',
-u'解甲釋兵',
-u'解甲投戈',
-u'解甲休兵',
-u'解甲休士',
-u'解劍拜仇',
-u'節儉躬行',
-u'節儉力行',
-u'借劍殺人',
-u'接見洗塵',
-u'借交報仇',
-u'戒驕戒躁',
-u'結交須勝己',
-u'結結巴巴',
-u'節節敗退',
-u'結界衛士',
-u'揭揭巍巍',
-u'孑孑爲義',
-u'解巾從仕',
-u'竭盡全力',
-u'竭盡心力',
-u'竭精殚力',
-u'借鏡觀形',
-u'捷徑窘步',
-u'截胫剖心',
-u'借景生情',
-u'诘究本末',
-u'借酒澆愁',
-u'借酒三分醉',
-u'解決不同的問題',
-u'借客報仇',
-u'借寇赍盜',
-u'疥癞之病',
-u'疥癞之患',
-u'疥癞之疾',
-u'嗟來之食',
-u'結了婚的人',
-u'竭力盡能',
-u'竭力盡意',
-u'竭力盡忠',
-u'竭力虔心',
-u'接連不斷',
-u'解鈴還得系鈴人',
-u'解鈴還是系鈴人',
-u'解鈴還需系鈴人',
-u'解鈴系鈴',
-u'解鈴須用系鈴人',
-u'劫掠之弓',
-u'劫掠之藤',
-u'孑輪不反',
-u'接袂成帷',
-u'借面吊喪',
-u'解民倒懸',
-u'誡莫如豫',
-u'解囊樂助',
-u'解囊相助',
-u'節能施法',
-u'桀逆放恣',
-u'解黏去縛',
-u'借篷使風',
-u'嗟貧歎苦',
-u'借坡下驢',
-u'階前萬裏',
-u'揭箧擔囊',
-u'揭箧探囊',
-u'潔清不洿',
-u'潔清自矢',
-u'诘屈磝碻',
-u'诘曲聱牙',
-u'桀犬吠堯',
-u'截然不同',
-u'孑然無依',
-u'孑然一身',
-u'截然有異',
-u'解人難得',
-u'節日火酒',
-u'節日酒杯',
-u'節日小道',
-u'節日祝酒',
-u'诘戎治兵',
-u'接三換九',
-u'接三連四',
-u'節上生事',
-u'節上生枝',
-u'接紹香煙',
-u'結舌瞠目',
-u'結舌杜口',
-u'戒奢寧儉',
-u'借身報仇',
-u'潔身累行',
-u'潔身守道',
-u'潔身自愛',
-u'潔身自好',
-u'潔身自守',
-u'結繩而治',
-u'借屍還魂',
-u'借屍還陽',
-u'芥拾青紫',
-u'借事生端',
-u'節食縮衣',
-u'解手背面',
-u'借書留真',
-u'劫數難逃',
-u'借水推船',
-u'借水行舟',
-u'街死街埋路死路埋',
-u'竭思枯想',
-u'結驷連騎',
-u'結驷列騎',
-u'桀貪骜詐',
-u'街談市語',
-u'街談巷說',
-u'街談巷言',
-u'街談巷議',
-u'街談巷語',
-u'借題發揮',
-u'截鐵斬釘',
-u'借聽于聾',
-u'街頭市尾',
-u'街頭巷底',
-u'街頭巷口',
-u'街頭巷尾',
-u'街頭巷議',
-u'街頭巷語',
-u'結徒聚黨',
-u'節外生枝',
-u'階下百諾',
-u'桀黠擅恣',
-u'解弦更張',
-u'借線進入',
-u'街巷阡陌',
-u'竭心盡意',
-u'疥癬之疾',
-u'潔言污行',
-u'潔已愛人',
-u'解衣般礡',
-u'解衣磅礡',
-u'解衣抱火',
-u'潔已奉公',
-u'解衣槃礡',
-u'解衣槃磅',
-u'解衣磅礴',
-u'解疑釋惑',
-u'解疑釋結',
-u'節衣縮食',
-u'解衣推食',
-u'讦以爲直',
-u'解衣卸甲',
-u'解衣衣人',
-u'接應不暇',
-u'結纓伏劍',
-u'節用愛民',
-u'節用愛人',
-u'節用厚生',
-u'節用裕民',
-u'截轅杜辔',
-u'睫在眼前常不見',
-u'竭澤不漁',
-u'竭澤而漁',
-u'竭澤焚薮',
-u'竭澤涸漁',
-u'揭債還債',
-u'竭智盡力',
-u'竭智盡忠',
-u'截趾适屦',
-u'截趾适履',
-u'劫制天下',
-u'節制之兵',
-u'節制之師',
-u'接踵比肩',
-u'接踵而來',
-u'接踵而至',
-u'竭忠盡智',
-u'戒舟慈棹',
-u'介胄之間',
-u'借莇代籌',
-u'借箸代謀',
-u'潔濁揚清',
-u'楶棁之材',
-u'芥子須彌',
-u'解組歸田',
-u'捷足先得',
-u'捷足先登',
-u'金榜挂名',
-u'金榜題名',
-u'禁暴靜亂',
-u'禁暴正亂',
-u'禁暴止亂',
-u'禁暴誅亂',
-u'金杯銀杯不如口碑',
-u'進本退末',
-u'謹本詳始',
-u'緊繃龍皮',
-u'金篦刮目',
-u'金璧輝煌',
-u'金碧輝映',
-u'金碧熒煌',
-u'金镳玉絡',
-u'金镳玉辔',
-u'金波玉液',
-u'金帛珠玉',
-u'近不逼同',
-u'今不如昔',
-u'矜才使氣',
-u'金钗換酒',
-u'金钗十二',
-u'金钗歲月',
-u'金钗細合',
-u'進讒害賢',
-u'今蟬蛻殼',
-u'金蟬脫殼',
-u'錦腸繡舌',
-u'金巢披風',
-u'斤車禦史',
-u'盡誠竭節',
-u'金城千裏',
-u'金城石室',
-u'錦城雖雲樂不如早還鄉',
-u'金城湯池',
-u'金翅擘海',
-u'矜持作态',
-u'今愁古恨',
-u'盡辭而死',
-u'錦簇花團',
-u'盡瘁事國',
-u'進寸退尺',
-u'緊打慢敲',
-u'金丹換骨',
-u'金铛大畹',
-u'進道若蜷',
-u'進道若退',
-u'進德脩業',
-u'錦地繡天',
-u'金貂換酒',
-u'金貂取酒',
-u'金貂贳酒',
-u'金頂佛光',
-u'禁鼎一脔',
-u'金釘朱戶',
-u'金度之影',
-u'金斷觿決',
-u'錦緞香囊',
-u'侭多侭少',
-u'今爾之去',
-u'今非昔比',
-u'金粉豪華',
-u'進奉門戶',
-u'金風飒飒',
-u'金風送爽',
-u'金風玉露',
-u'金峰之石',
-u'盡付東流',
-u'盡付阙如',
-u'進俯退俯',
-u'金剛努目',
-u'金剛眼睛',
-u'金戈鐵甲',
-u'金戈鐵馬',
-u'金戈鐵騎',
-u'金革之患',
-u'金革之難',
-u'金革之聲',
-u'金革之世',
-u'矜功不立',
-u'矜功伐能',
-u'矜功伐善',
-u'矜功負氣',
-u'矜功負勝',
-u'禁攻寝兵',
-u'矜功恃寵',
-u'矜功自伐',
-u'進攻姿态',
-u'金谷堕樓',
-u'勁骨豐肌',
-u'金谷舊例',
-u'金谷酒數',
-u'金鼓連天',
-u'緊鼓密鑼',
-u'金鼓齊鳴',
-u'金鼓喧阗',
-u'進關時節',
-u'津關險塞',
-u'金光蓋地',
-u'金閨國士',
-u'金龜換酒',
-u'金閨玉堂',
-u'巾帼豪傑',
-u'巾帼奇才',
-u'巾帼須眉',
-u'巾國英雄',
-u'巾帼丈夫',
-u'近海狂魚',
-u'金壺墨汁',
-u'金華殿語',
-u'錦花繡草',
-u'襟懷磊落',
-u'襟懷灑落',
-u'襟懷坦白',
-u'襟懷坦夷',
-u'盡歡而散',
-u'盡歡竭忠',
-u'晉惠聞蛙',
-u'金輝玉潔',
-u'金徽玉轸',
-u'近火的先燒焦',
-u'禁火三日',
-u'近火先焦',
-u'金雞獨立',
-u'金雞放赦',
-u'矜己任智',
-u'金雞消息',
-u'金齑玉鲙',
-u'禁忌之海',
-u'矜己自飾',
-u'金甲山貓',
-u'金枷玉鎖',
-u'禁奸除猾',
-u'襟江帶湖',
-u'金漿玉醴',
-u'金漿玉液',
-u'近交遠攻',
-u'盡節竭誠',
-u'盡節死敵',
-u'斤斤計較',
-u'斤斤較量',
-u'津津樂道',
-u'金盡裘弊',
-u'矜矜業業',
-u'津津有味',
-u'斤斤自守',
-u'金精靈劍',
-u'金精玉液',
-u'矜糾收缭',
-u'襟裾馬牛',
-u'今遽欲去之',
-u'近君子而遠小人',
-u'進可替不',
-u'進可替否',
-u'金科玉律',
-u'金科玉臬',
-u'金科玉條',
-u'噤口卷舌',
-u'金口木舌',
-u'金口玉牙',
-u'金口禦言',
-u'金口玉音',
-u'噤苦寒蟬',
-u'金塊頭飾',
-u'金匮石室',
-u'今來古往',
-u'近來學得烏龜法',
-u'金蘭契友',
-u'金蘭之好',
-u'金蘭之交',
-u'金蘭之契',
-u'金蘭之友',
-u'進利除害',
-u'盡力而爲',
-u'盡力投遞',
-u'近鄰比親',
-u'進祿加官',
-u'禁亂除暴',
-u'緊鑼密鼓',
-u'金鑼騰空',
-u'進旅退旅',
-u'金馬碧雞',
-u'金馬玉堂',
-u'謹毛失貌',
-u'盡美盡善',
-u'進門看臉色',
-u'金門繡戶',
-u'金迷紙碎',
-u'金迷紙醉',
-u'矜名妒能',
-u'矜名嫉能',
-u'浸明浸昌',
-u'金命水命走投無命',
-u'近墨者黑',
-u'金母木公',
-u'錦囊還矢',
-u'錦囊佳句',
-u'錦囊佳制',
-u'錦囊妙計',
-u'錦囊妙句',
-u'錦囊玉軸',
-u'矜能負才',
-u'金奴銀婢',
-u'金瓯無缺',
-u'盡盤将軍',
-u'金鎞刮膜',
-u'筋疲力弊',
-u'筋疲力竭',
-u'筋疲力盡',
-u'筋疲力倦',
-u'錦片前程',
-u'錦篇繡帙',
-u'矜貧救厄',
-u'矜貧恤獨',
-u'金瓶落井',
-u'金瓶素绠',
-u'矜平躁釋',
-u'金魄之石',
-u'金鋪屈曲',
-u'金漆飯桶',
-u'矜奇立異',
-u'金漆馬桶',
-u'盡其所長',
-u'矜奇炫博',
-u'近親繁殖',
-u'禁情割欲',
-u'盡情盡理',
-u'盡去陳言',
-u'近取諸己',
-u'進壤廣地',
-u'盡人豰中',
-u'金人緘口',
-u'盡人皆知',
-u'盡人力聽天命',
-u'金人三緘',
-u'金人之緘',
-u'金人之箴',
-u'今日愛東明日愛西',
-u'今日不知明日事',
-u'盡日極慮',
-u'盡日窮夜',
-u'今日有酒今日醉',
-u'進榮退辱',
-u'僅容旋馬',
-u'盡入彀中',
-u'噤如寒蟬',
-u'盡如人意',
-u'盡如所期',
-u'盡銳出戰',
-u'進銳退速',
-u'浸潤之谮',
-u'噤若寒蟬',
-u'錦瑟華年',
-u'錦瑟年華',
-u'進善懲惡',
-u'進善懲奸',
-u'進善黜惡',
-u'盡善盡美',
-u'近山識獸傍水知魚',
-u'進善退惡',
-u'錦上添花',
-u'金舌蔽口',
-u'禁舍開塞',
-u'謹身節用',
-u'搢紳先生',
-u'進身之階',
-u'搢紳之士',
-u'晉升徽記',
-u'今生今世',
-u'晉升衣飾',
-u'晉升印章',
-u'金聲玉服',
-u'金聲玉潤',
-u'金聲玉色',
-u'金聲玉振',
-u'金聲擲地',
-u'金石不渝',
-u'進食充分',
-u'進食充足',
-u'進食間隔',
-u'金石交情',
-u'金石可開',
-u'金石良言',
-u'謹始慮終',
-u'盡釋前嫌',
-u'金石絲竹',
-u'金石爲開',
-u'今是昔非',
-u'盡室以行',
-u'金石之策',
-u'金石之功',
-u'金石之計',
-u'金石之堅',
-u'金石至交',
-u'金石之盟',
-u'僅識之無',
-u'金石之言',
-u'今是昨非',
-u'金鼠報喜',
-u'金鼠開泰',
-u'金書鐵券',
-u'近水齒蠻',
-u'近水龍蛭',
-u'近水樓出',
-u'近水樓台',
-u'近水樓台先得月',
-u'近水惜水',
-u'近水鑿齒',
-u'進思盡忠',
-u'進思盡忠退思補過',
-u'盡态極妍',
-u'金台市駿',
-u'金湯戰甲',
-u'金湯之固',
-u'金淘沙揀',
-u'金題玉躞',
-u'錦天繡地',
-u'金童玉女',
-u'金頭銀面',
-u'錦團花簇',
-u'進退跋疐',
-u'進退出處',
-u'進退觸籓',
-u'進退觸籬',
-u'進退存亡',
-u'進退狐疑',
-u'進退可否',
-u'進退狼狽',
-u'進退兩端',
-u'進退兩難',
-u'進退路窮',
-u'進退履繩',
-u'進退榮辱',
-u'進退失措',
-u'進退失踞',
-u'進退失所',
-u'進退失圖',
-u'進退首鼠',
-u'進退雙難',
-u'進退損益',
-u'進退亡據',
-u'進退唯谷',
-u'進退維亟',
-u'進退維艱',
-u'進退惟咎',
-u'進退爲難',
-u'進退無措',
-u'進退無恒',
-u'進退無據',
-u'進退無路',
-u'進退無門',
-u'進退無所',
-u'進退無途',
-u'進退無依',
-u'進退消長',
-u'進退消息',
-u'進退應矩',
-u'進退有常',
-u'進退有度',
-u'進退有節',
-u'進退裕如',
-u'進褪中度',
-u'進退中繩',
-u'進退迍邅',
-u'禁網疏闊',
-u'近衛臂甲',
-u'浸微浸滅',
-u'浸微浸消',
-u'祲威盛容',
-u'金吾不禁',
-u'金屋藏嬌',
-u'金屋嬌娘',
-u'金烏玉兔',
-u'金屋之選',
-u'金屋貯嬌',
-u'金無足赤',
-u'金無足赤人無完人',
-u'今夕何夕',
-u'今昔之感',
-u'進賢拔能',
-u'進賢屏惡',
-u'進賢黜惡',
-u'進賢黜奸',
-u'進賢黜佞',
-u'進賢達能',
-u'進賢進能',
-u'進賢任能',
-u'進賢退奸',
-u'進賢退佞',
-u'進賢退愚',
-u'進賢興功',
-u'進賢用能',
-u'近鄉情怯',
-u'金鑲玉裹',
-u'金相玉式',
-u'金相玉映',
-u'金相玉振',
-u'金相玉質',
-u'謹小慎微',
-u'謹謝不敏',
-u'盡心而已',
-u'筋信骨強',
-u'盡心竭誠',
-u'盡心竭力',
-u'盡心盡力',
-u'盡信書不如無書',
-u'盡心圖報',
-u'錦心繡腸',
-u'錦心繡腹',
-u'錦心繡口',
-u'謹行儉用',
-u'緊行無好步',
-u'錦胸繡口',
-u'錦繡肝腸',
-u'錦繡河山',
-u'錦繡湖山',
-u'錦繡江山',
-u'錦繡前程',
-u'錦繡山河',
-u'錦繡心腸',
-u'金牙鐵齒',
-u'謹言慎行',
-u'晉陽之甲',
-u'金衣公子',
-u'錦衣還鄉',
-u'錦衣肉食',
-u'僅以身歸',
-u'僅以身免',
-u'錦衣纨袴',
-u'錦衣仙豹',
-u'錦衣行晝',
-u'金翼鹦鹉',
-u'錦衣玉帶',
-u'錦衣玉食',
-u'金印如鬥',
-u'金印系肘',
-u'金印紫绶',
-u'錦營花陣',
-u'晉用楚材',
-u'金友玉昆',
-u'金玉貨賂',
-u'金玉錦繡',
-u'金玉良言',
-u'金玉良緣',
-u'金玉滿堂',
-u'金玉滿堂長命富貴',
-u'瑾瑜匿瑕',
-u'金玉其外',
-u'金玉其外敗絮其中',
-u'金玉其質',
-u'矜愚飾智',
-u'今雨新知',
-u'金玉之言',
-u'今月古月',
-u'近悅遠來',
-u'近在眉睫',
-u'近在咫尺',
-u'金章玉句',
-u'金章紫绶',
-u'今朝有酒今朝醉',
-u'金昭玉粹',
-u'金針度人',
-u'錦陣花營',
-u'金針見血',
-u'金鳷擘海',
-u'矜智負能',
-u'金枝花萼',
-u'今置将不善',
-u'禁止令行',
-u'今之爲仁者',
-u'金枝小徑',
-u'金枝玉葉',
-u'盡忠報國',
-u'盡忠拂過',
-u'盡忠竭誠',
-u'盡忠竭力',
-u'禁中頗牧',
-u'謹終如始',
-u'進種善群',
-u'謹終慎始',
-u'謹終追遠',
-u'近朱近墨',
-u'近朱者赤',
-u'近朱者赤近墨者黑',
-u'金裝玉裹',
-u'錦字回文',
-u'金紫銀青',
-u'金字招牌',
-u'經邦論道',
-u'經邦緯國',
-u'荊筆楊闆',
-u'精兵簡政',
-u'精兵猛将',
-u'精兵強将',
-u'鲸波怒浪',
-u'鲸波鼍浪',
-u'敬布腹心',
-u'靜不露機',
-u'精彩逼人',
-u'驚才風逸',
-u'驚采絕豔',
-u'精采秀發',
-u'驚詫莫名',
-u'荊钗布襖',
-u'荊钗布裙',
-u'荊钗裙布',
-u'敬陳管見',
-u'精誠貫日',
-u'精誠所至',
-u'精誠所至金石爲開',
-u'精誠團結',
-u'靜處安身',
-u'荊楚歲時記',
-u'荊刺小徑',
-u'競達空函',
-u'經達權變',
-u'精打細算',
-u'胫大于股',
-u'井底蛤蟆',
-u'井底撈月',
-u'井底鳴蛙',
-u'井底蝦蟆',
-u'井底銀瓶',
-u'井底之蛙',
-u'精雕細刻',
-u'競短争長',
-u'經多見廣',
-u'驚愕失色',
-u'驚耳駭目',
-u'敬而遠之',
-u'鏡分鸾鳳',
-u'驚風駭浪',
-u'驚風絕豔',
-u'驚風怒濤',
-u'晶歌山脈',
-u'精耕細作',
-u'敬恭桑梓',
-u'驚弓之鳥',
-u'精貫白日',
-u'經官動府',
-u'井管拘墟',
-u'靜觀默察',
-u'經國大業',
-u'經國濟民',
-u'經國之才',
-u'精悍短小',
-u'荊衡杞梓',
-u'精衡戰斧',
-u'驚鴻豔影',
-u'驚鴻遊龍',
-u'鏡花水月',
-u'驚惶不安',
-u'驚惶失措',
-u'驚惶失色',
-u'驚惶萬狀',
-u'驚惶無措',
-u'驚魂不定',
-u'驚魂動魄',
-u'驚魂奪魄',
-u'驚魂落魄',
-u'驚魂喪魄',
-u'驚魂攝魄',
-u'驚魂失魄',
-u'驚魂未定',
-u'驚悸不安',
-u'經紀買賣',
-u'淨幾明窗',
-u'靜極思動',
-u'經濟之才',
-u'精甲銳兵',
-u'驚見駭聞',
-u'精簡指令',
-u'敬姜猶績',
-u'鲸膠弓弦',
-u'鲸膠絞絲',
-u'警戒崗哨',
-u'勁節清風',
-u'警戒哨崗',
-u'京解之才',
-u'精金百煉',
-u'精金闆甲',
-u'精進不休',
-u'精金良玉',
-u'精金美玉',
-u'競今疏古',
-u'精進勇猛',
-u'精金戰甲',
-u'井井不亂',
-u'兢兢幹幹',
-u'兢兢乾乾',
-u'兢兢業業',
-u'兢兢翼翼',
-u'井井有法',
-u'井井有方',
-u'井井有理',
-u'井井有條',
-u'井井有味',
-u'井井有序',
-u'兢兢戰戰',
-u'經久不息',
-u'井臼躬操',
-u'井臼親操',
-u'驚恐失色',
-u'驚恐萬狀',
-u'警愦覺聾',
-u'敬老慈少',
-u'敬老慈幼',
-u'敬老慈稚',
-u'敬老得老',
-u'敬老憐貧',
-u'敬老恤貧',
-u'敬老尊賢',
-u'精力不倦',
-u'精力不衰',
-u'鏡裏采花',
-u'精力充沛',
-u'鏡裏恩情',
-u'鏡裏觀花',
-u'精力過人',
-u'經綸濟世',
-u'經綸滿腹',
-u'精美絕倫',
-u'靜谧海岸',
-u'靜谧花園',
-u'靜谧無聲',
-u'精妙絕倫',
-u'精妙入神',
-u'精明幹練',
-u'精明老練',
-u'精明能幹',
-u'精明強幹',
-u'經明行修',
-u'經明行著',
-u'驚某大丈夫打某豬狗牛',
-u'荊南杞梓',
-u'經年累月',
-u'京辇之下',
-u'精疲力竭',
-u'精疲力盡',
-u'精疲力倦',
-u'鲸皮帽檐',
-u'鏡破不改光蘭死不留香',
-u'鏡破钗分',
-u'荊旗蔽空',
-u'旌旗蔽日',
-u'旌旗蔽天',
-u'精奇古怪',
-u'旌旗卷舒',
-u'驚起梁塵',
-u'精禽填海',
-u'徑情而行',
-u'泾清渭濁',
-u'徑情直遂',
-u'徑情直行',
-u'經丘尋壑',
-u'鲸呿鳌擲',
-u'精确瞄準',
-u'驚群動衆',
-u'井然有條',
-u'憬然有悟',
-u'井然有序',
-u'荊人涉澭',
-u'驚肉生髀',
-u'靜如處女',
-u'靜如處女動如脫兔',
-u'景入桑榆',
-u'敬如上賓',
-u'敬如神明',
-u'精銳之師',
-u'靜若處子',
-u'靜若處子動若脫兔',
-u'敬若神明',
-u'旌善懲惡',
-u'荊山之玉',
-u'敬上愛下',
-u'敬上接下',
-u'驚蛇入草',
-u'精神百倍',
-u'精神錯亂',
-u'精神抖擻',
-u'精神煥發',
-u'精神煥散',
-u'精神恍忽',
-u'精神集中',
-u'精神矍铄',
-u'精神敏銳',
-u'驚神破膽',
-u'驚神泣鬼',
-u'精神衰弱',
-u'景升豚犬',
-u'敬時愛日',
-u'經史百家',
-u'經史百子',
-u'敬事不暇',
-u'經始大業',
-u'驚師動衆',
-u'驚世駭目',
-u'驚世駭俗',
-u'敬事後食',
-u'驚世絕俗',
-u'荊室蓬戶',
-u'鏡式漂移',
-u'經世奇才',
-u'經師人師',
-u'驚世震俗',
-u'經世之才',
-u'經世之器',
-u'敬守良箴',
-u'敬授民時',
-u'敬授人時',
-u'井水不犯河水',
-u'井水流不到河裏邊兒',
-u'經歲之儲',
-u'鏡台自獻',
-u'驚歎不已',
-u'驚濤駭浪',
-u'驚濤巨浪',
-u'驚濤怒浪',
-u'鲸濤鼍浪',
-u'晶體管晶體管邏輯',
-u'敬天愛民',
-u'驚天地泣鬼神',
-u'驚天動地',
-u'荊天棘地',
-u'經天緯地',
-u'徑廷之辭',
-u'鲸吞蠶食',
-u'鲸吞虎據',
-u'鲸吞虎噬',
-u'鲸吞蛇噬',
-u'井蛙醯雞',
-u'井蛙語海',
-u'井蛙之見',
-u'泾渭不辯',
-u'泾渭不分',
-u'泾渭不雜',
-u'泾謂分明',
-u'井味複鹼',
-u'泾渭了然',
-u'經緯天地',
-u'精衛填海',
-u'經緯天下',
-u'泾渭同流',
-u'經緯萬端',
-u'精衛銜石',
-u'泾渭自分',
-u'泾渭自明',
-u'經文緯武',
-u'景物分析',
-u'經武緯文',
-u'驚喜交集',
-u'驚喜交加',
-u'鲸吸牛飲',
-u'驚喜若狂',
-u'驚喜欲狂',
-u'敬賢愛士',
-u'敬賢禮士',
-u'敬賢下士',
-u'驚弦之鳥',
-u'敬賢重士',
-u'敬小慎微',
-u'敬謝不敏',
-u'井渫不食',
-u'井渫莫食',
-u'驚心悲魄',
-u'驚心慘目',
-u'驚心褫魄',
-u'驚心怵目',
-u'驚心悼膽',
-u'警心滌慮',
-u'驚心吊膽',
-u'驚心吊魄',
-u'驚心動魄',
-u'競新鬥巧',
-u'驚心奪目',
-u'驚心駭目',
-u'驚心駭魄',
-u'驚心駭神',
-u'驚心駭矚',
-u'精心勵志',
-u'驚心裂膽',
-u'驚心破膽',
-u'驚心喪魄',
-u'精心設計',
-u'驚心眩目',
-u'景星鳳凰',
-u'景星麟鳳',
-u'景星慶雲',
-u'徑行直遂',
-u'靜言令色',
-u'靖言庸回',
-u'靖言庸違',
-u'井養不窮',
-u'敬業樂群',
-u'驚疑不定',
-u'井以甘竭',
-u'精益求精',
-u'精義入神',
-u'經一事長一智',
-u'精詣之識',
-u'經營擘劃',
-u'經營慘淡',
-u'靜影沉璧',
-u'境由心生',
-u'境由心造',
-u'驚愚駭俗',
-u'井魚之見',
-u'鏡圓璧合',
-u'驚猿脫兔',
-u'靖谮庸回',
-u'京兆畫眉',
-u'京兆眉妩',
-u'荊榛滿道',
-u'荊榛滿地',
-u'荊榛滿目',
-u'荊榛滿眼',
-u'靜止力場',
-u'敬之如賓',
-u'精忠報國',
-u'井中撈月',
-u'井中求火',
-u'敬終慎始',
-u'井中視星',
-u'靜中思動',
-u'京珠高速',
-u'靓妝炫服',
-u'靓妝豔服',
-u'泾濁渭清',
-u'敬子如敬父',
-u'迥不猶人',
-u'迥隔霄壤',
-u'迥乎不同',
-u'炯炯發光',
-u'炯炯有神',
-u'迥然不侔',
-u'迥然不群',
-u'迥然不同',
-u'灸艾分痛',
-u'舊愛宿恩',
-u'久安長治',
-u'九變十化',
-u'久別重逢',
-u'久病成醫',
-u'久病床前無孝子',
-u'舊病複發',
-u'酒病花愁',
-u'酒病酒藥醫',
-u'舊病難醫',
-u'救兵如救火',
-u'酒不解真愁',
-u'酒不醉人人自醉',
-u'九層雲外',
-u'糾纏不清',
-u'糾纏根須',
-u'救場如救火',
-u'鸠巢計拙',
-u'鸠車竹馬',
-u'舊疢複發',
-u'九尺墨影',
-u'酒池肉林',
-u'舊仇宿怨',
-u'舊仇新恨',
-u'臼杵之交',
-u'九春三秋',
-u'舊地重遊',
-u'酒地花天',
-u'就地取材',
-u'就地正法',
-u'舊調重彈',
-u'九吊六的',
-u'九鼎大呂',
-u'九鼎一絲',
-u'九鼎戰甲',
-u'久賭無勝家',
-u'鸠奪鵲巢',
-u'久而不匮',
-u'久而久之',
-u'救焚投薪',
-u'救焚益薪',
-u'救焚拯溺',
-u'酒逢知己千杯少',
-u'酒逢知己飲',
-u'久負盛名',
-u'九垓八埏',
-u'鸠工饬材',
-u'九攻九距',
-u'鸠工庀材',
-u'九故十親',
-u'久孤于世',
-u'九關虎豹',
-u'久慣老誠',
-u'久歸道山',
-u'九鬼歸命',
-u'九鬼裂風',
-u'九鬼破天',
-u'九鬼閃雷',
-u'就棍打腿',
-u'救過不給',
-u'救過不遑',
-u'救過補阙',
-u'救過不贍',
-u'救過不暇',
-u'酒海花天',
-u'酒酣耳熱',
-u'酒酣耳熟',
-u'久旱逢甘雨',
-u'救旱好救火',
-u'救寒莫如重裘',
-u'九行八業',
-u'九合一匡',
-u'糾合之衆',
-u'糾合之卒',
-u'舊恨新仇',
-u'酒後茶馀',
-u'酒後耳熱',
-u'酒後失言',
-u'酒後無德',
-u'酒虎詩龍',
-u'舊話重提',
-u'久懷慕蔺',
-u'救患分災',
-u'舊歡新寵',
-u'九回腸斷',
-u'九阍虎豹',
-u'救火投薪',
-u'救火揚沸',
-u'救火拯溺',
-u'救火追亡',
-u'救急不救窮',
-u'鸠集鳳池',
-u'救急扶傷',
-u'九棘三槐',
-u'救饑拯溺',
-u'久假不歸',
-u'久假當還',
-u'舊家行徑',
-u'九間朝殿',
-u'九間大殿',
-u'鸠僭鵲巢',
-u'九江八河',
-u'酒澆壘塊',
-u'糾結木杖',
-u'咎皆自贻',
-u'九經百家',
-u'久經風霜',
-u'九京可作',
-u'九經三史',
-u'救經引足',
-u'久久不忘',
-u'九九歸一',
-u'九九歸原',
-u'九九同心',
-u'赳赳武夫',
-u'赳赳雄斷',
-u'鸠居鵲巢',
-u'久居人下',
-u'久客思歸',
-u'救苦救難',
-u'救苦弭災',
-u'救困扶危',
-u'酒闌賓散',
-u'酒闌燈炧',
-u'酒闌客散',
-u'酒闌人散',
-u'酒闌興盡',
-u'酒闌燭跋',
-u'久曆風塵',
-u'酒醴麴蘖',
-u'久立傷骨',
-u'久煉成鋼',
-u'救燎助薪',
-u'九烈三貞',
-u'酒令如軍令',
-u'九流百家',
-u'九流賓客',
-u'九流人物',
-u'九流三教',
-u'九流十家',
-u'酒龍詩虎',
-u'救亂除暴',
-u'酒亂性色迷人',
-u'酒綠燈紅',
-u'舊夢重溫',
-u'久夢初醒',
-u'久夢乍回',
-u'救民濟世',
-u'救民水火',
-u'救民于水火',
-u'糾缪繩違',
-u'救難解危',
-u'酒囊飯包',
-u'酒囊飯袋',
-u'酒能壯膽',
-u'舊念複萌',
-u'九年之儲',
-u'九年之蓄',
-u'九牛二虎之力',
-u'九牛拉不轉',
-u'九牛身上拔根毛',
-u'九牛拖不出',
-u'九牛一毫',
-u'九牛一毛',
-u'酒濃詩冷',
-u'酒怕紅臉人',
-u'就怕貨比貨',
-u'酒朋詩侶',
-u'救偏補弊',
-u'九品中正',
-u'舊瓶新酒',
-u'舊瓶裝新酒',
-u'救黥醫劓',
-u'九曲回腸',
-u'九衢三市',
-u'九泉無恨',
-u'九泉之下',
-u'九泉之下也瞑目',
-u'救人救徹',
-u'救人救到底',
-u'九仞一篑',
-u'救人一命',
-u'救人一命勝造七級浮圖',
-u'就日瞻雲',
-u'舊榮新辱',
-u'酒肉朋友',
-u'酒肉兄弟',
-u'酒入愁腸愁更愁',
-u'酒入舌出',
-u'九儒十丐',
-u'酒色财氣',
-u'酒色之徒',
-u'酒社詩壇',
-u'就深就淺',
-u'酒聖詩豪',
-u'舊事重提',
-u'九十春光',
-u'酒食地獄',
-u'舊時風味',
-u'救世濟民',
-u'救時厲俗',
-u'就事論事',
-u'九世同居',
-u'舊識新交',
-u'酒食征逐',
-u'九世之仇',
-u'久束濕薪',
-u'九死不悔',
-u'救死扶傷',
-u'救死扶危',
-u'九死未悔',
-u'九死一生',
-u'九死餘生',
-u'酒酸不售',
-u'舊态複萌',
-u'就湯下面',
-u'九天九地',
-u'九天攬月',
-u'九天仙女',
-u'臼頭花钿',
-u'九頭牛也拽不動',
-u'臼頭深目',
-u'久拖不辦',
-u'救亡圖存',
-u'救危扶傾',
-u'九尾火狐',
-u'久違謦欬',
-u'久聞大名',
-u'久聞大名如雷灌耳',
-u'久聞盛名',
-u'酒甕飯囊',
-u'舊物青氈',
-u'九五之位',
-u'九五之尊',
-u'九錫寵臣',
-u'九霄雲路',
-u'九霄雲外',
-u'疚心疾首',
-u'鸠形鹄面',
-u'九星天牛',
-u'九朽一罷',
-u'就虛避實',
-u'久懸不決',
-u'舊雅新知',
-u'酒酽春濃',
-u'舊燕歸巢',
-u'酒酽花濃',
-u'酒言酒語',
-u'久要不忘',
-u'酒要少吃事要多知',
-u'救一車薪之火',
-u'久役之士',
-u'酒有別腸',
-u'咎有應得',
-u'咎由自取',
-u'酒馀茶後',
-u'舊雨重逢',
-u'酒餘飯飽',
-u'舊雨今雨',
-u'舊雨新知',
-u'九原可作',
-u'九原之下',
-u'救災恤患',
-u'救災恤鄰',
-u'臼竈生蛙',
-u'酒債尋常行處有',
-u'九戰九勝',
-u'鸠占鵲巢',
-u'九折成醫',
-u'久蟄思動',
-u'久蟄思啓',
-u'九蒸三熯',
-u'久症行醫',
-u'就正有道',
-u'就職視事',
-u'酒中不語真君子',
-u'臼中無釜',
-u'九州八極',
-u'九州四海',
-u'久住令人贱',
-u'久住難爲人',
-u'久住坡上不嫌陡',
-u'九轉丹成',
-u'九轉功成',
-u'九轉丸成',
-u'九字成語',
-u'九子鬼母',
-u'九宗七祖',
-u'酒足飯飽',
-u'酒醉飯飽',
-u'酒醉酒解',
-u'久坐必有一禅',
-u'久坐地厚',
-u'久坐傷肉',
-u'據鞍讀書',
-u'據鞍顧眄',
-u'居安慮危',
-u'舉案齊眉',
-u'居安思危',
-u'居安忘危',
-u'居安資深',
-u'倨骜不恭',
-u'倨傲不遜',
-u'倨傲怠慢',
-u'倨傲鮮腆',
-u'倨傲之容',
-u'舉杯消愁愁更愁',
-u'據本生利',
-u'居必擇鄰',
-u'句比字栉',
-u'居不重席',
-u'居不重茵',
-u'矩步方行',
-u'舉步艱難',
-u'舉步如飛',
-u'舉步生風',
-u'舉不勝舉',
-u'舉不失選',
-u'舉不逾等',
-u'居常之安',
-u'駒齒未落',
-u'舉翅欲飛',
-u'舉仇舉子',
-u'駒窗電逝',
-u'局促不安',
-u'局促一隅',
-u'舉錯必當',
-u'舉措不當',
-u'舉措不定',
-u'舉措動作',
-u'舉措失當',
-u'居大不易',
-u'舉大略細',
-u'局地扣天',
-u'局地鑰天',
-u'跼地龠天',
-u'舉鼎拔山',
-u'舉鼎絕膑',
-u'聚而殲之',
-u'懼法朝朝樂',
-u'遽反道山',
-u'跼高蹐厚',
-u'居高臨下',
-u'居高視下',
-u'居高虛危',
-u'鞠躬屏氣',
-u'鞠躬盡瘁',
-u'鞠躬盡瘁死而後已',
-u'鞠躬盡力',
-u'鞠躬盡力死而後已',
-u'居功厥偉',
-u'鞠躬君子',
-u'鞠躬如儀',
-u'居功自傲',
-u'居官守法',
-u'駒光過隙',
-u'舉國若狂',
-u'舉國上下',
-u'舉國一緻',
-u'舉笏擊蛇',
-u'拒虎進狼',
-u'踞虎盤龍',
-u'拒虎引狼',
-u'橘化爲枳',
-u'橘淮爲枳',
-u'聚會精神',
-u'居貨待價',
-u'跼蹐不安',
-u'屦及劍及',
-u'跼蹐無地',
-u'巨奸大滑',
-u'距谏飾非',
-u'居間調停',
-u'屦贱踴貴',
-u'據徼乘邪',
-u'拘介之士',
-u'拘禁束帶',
-u'聚精會神',
-u'居敬窮理',
-u'舉酒作樂',
-u'踽踽獨行',
-u'踽踽而行',
-u'踽踽涼涼',
-u'拘拘儒儒',
-u'拒絕服務',
-u'咀嚼英華',
-u'拒狼進虎',
-u'菊老荷枯',
-u'舉例發凡',
-u'據理力争',
-u'居利思義',
-u'距離向量',
-u'據理直争',
-u'聚斂無厭',
-u'駒留空谷',
-u'踞爐炭上',
-u'拘攣補衲',
-u'拘攣之見',
-u'鞠旅陳師',
-u'橘綠橙黃',
-u'裾馬襟牛',
-u'聚米爲谷',
-u'聚米爲山',
-u'矩描述子',
-u'舉目皆是',
-u'舉目千裏',
-u'舉目入畫',
-u'舉目無告',
-u'舉目無親',
-u'舉目無依',
-u'鉏麑之悔',
-u'舉偏補弊',
-u'局騙拐帶',
-u'舉棋不定',
-u'拘奇抉異',
-u'舉棋若定',
-u'拘牽文義',
-u'舉前曳踵',
-u'居窮守約',
-u'钜人長德',
-u'距人千裏',
-u'拒人千裏之外',
-u'聚人易散人難',
-u'居仁由義',
-u'拒人于千裏之外',
-u'舉如鴻毛',
-u'舉如鴻毛取如拾遺',
-u'巨儒碩學',
-u'钜儒宿學',
-u'拘儒之論',
-u'聚散浮生',
-u'聚沙成塔',
-u'聚沙而雨',
-u'聚沙之年',
-u'舉善薦賢',
-u'舉善任能',
-u'舉扇一撝',
-u'舉觞稱慶',
-u'聚少成多',
-u'拘神遣将',
-u'聚神玉片',
-u'舉世混濁',
-u'舉世皆知',
-u'舉世莫比',
-u'舉世聞名',
-u'舉世無比',
-u'舉世無俦',
-u'舉世無敵',
-u'舉世無倫',
-u'舉世無匹',
-u'舉世無雙',
-u'舉十知九',
-u'據事直書',
-u'舉世注目',
-u'俱收并蓄',
-u'舉手不留情',
-u'舉手加額',
-u'舉手可采',
-u'舉手可得',
-u'舉手扣額',
-u'舉手勞勞',
-u'舉手投足',
-u'舉手相慶',
-u'舉手搖足',
-u'舉手之勞',
-u'聚訟紛紛',
-u'聚訟紛然',
-u'聚訟紛纭',
-u'拘俗守常',
-u'具體而微',
-u'跼天促地',
-u'跼天蹐地',
-u'局天扣地',
-u'聚鐵鑄錯',
-u'舉頭三尺有神靈',
-u'舉頭三尺有神明',
-u'居徒四壁',
-u'據圖刎喉',
-u'據圖刎首',
-u'局外之人',
-u'舉枉錯直',
-u'據爲己有',
-u'鞠爲茂草',
-u'聚蚊成雷',
-u'聚蚊可以成雷',
-u'拘文牽古',
-u'拘文牽俗',
-u'拘文牽義',
-u'據梧而瞑',
-u'鉏铻難人',
-u'居無求安',
-u'舉無遺策',
-u'舉無遺算',
-u'钜細靡遺',
-u'巨細無遺',
-u'居下讪上',
-u'舉賢任能',
-u'舉賢使能',
-u'舉賢使能舉賢任能',
-u'居心不純',
-u'居心不淨',
-u'居心不良',
-u'居心莫測',
-u'居心叵測',
-u'居心險惡',
-u'拘墟之見',
-u'钜學鴻生',
-u'舉眼無親',
-u'舉要删蕪',
-u'舉要治繁',
-u'舉一反三',
-u'舉一廢百',
-u'據義履方',
-u'舉一明三',
-u'居移氣養移體',
-u'居逸思危',
-u'聚螢積雪',
-u'聚螢映雪',
-u'龃龉不合',
-u'舉隅反三',
-u'距躍三百',
-u'矩矱繩尺',
-u'具瞻所歸',
-u'句斟字酌',
-u'舉止不凡',
-u'居之不疑',
-u'舉直錯枉',
-u'舉止大方',
-u'拒之門外',
-u'舉止失措',
-u'舉止娴雅',
-u'舉止言談',
-u'句栉字比',
-u'舉止自若',
-u'舉重若輕',
-u'居重馭輕',
-u'聚衆滋事',
-u'居軸處中',
-u'矩周規值',
-u'居諸不息',
-u'舉足輕重',
-u'舉足爲法',
-u'涓埃之報',
-u'涓埃之功',
-u'涓埃之力',
-u'涓埃之微',
-u'捐本逐末',
-u'捐殘去殺',
-u'捐除成見',
-u'涓滴不留',
-u'涓滴不漏',
-u'涓滴不遺',
-u'涓滴成河',
-u'涓滴歸公',
-u'涓滴微利',
-u'涓滴之勞',
-u'捐忿棄瑕',
-u'捐忿與瑕',
-u'睠顧回隐',
-u'镌骨銘心',
-u'娟好靜秀',
-u'眷紅偎翠',
-u'捐華務實',
-u'卷甲倍道',
-u'卷甲束兵',
-u'卷甲韬戈',
-u'卷甲銜枚',
-u'狷介之人',
-u'狷介之士',
-u'捐金沉珠',
-u'捐金抵璧',
-u'眷眷不忘',
-u'涓涓不壅',
-u'涓涓不壅終爲江河',
-u'眷眷懷顧',
-u'惓惓之忱',
-u'眷眷之心',
-u'惓惓之意',
-u'镌空妄實',
-u'圈牢養物',
-u'倦鳥歸巢',
-u'倦鳥知返',
-u'倦鳥知還',
-u'镌脾琢腎',
-u'捐棄成見',
-u'捐棄前嫌',
-u'卷旗息鼓',
-u'捐軀報國',
-u'捐軀赴難',
-u'捐軀濟難',
-u'捐軀疆場',
-u'捐軀摩頂',
-u'捐軀殉國',
-u'捐軀殒首',
-u'捐身徇義',
-u'捐生殉國',
-u'卷土重來',
-u'倦尾赤色',
-u'卷席而居',
-u'卷席而葬',
-u'镌心銘骨',
-u'倦翼知還',
-u'隽永之論',
-u'卷帙浩繁',
-u'抉奧闡幽',
-u'決不罷休',
-u'決不待時',
-u'絕不食言',
-u'絕長補短',
-u'絕長繼短',
-u'絕長續短',
-u'絕塵拔俗',
-u'絕處逢生',
-u'絕代佳人',
-u'絕德至行',
-u'崛地而起',
-u'掘地尋天',
-u'絕頂聰明',
-u'絕渡逢舟',
-u'決斷如流',
-u'谲而不正',
-u'撧耳頓足',
-u'撧耳撓腮',
-u'撧耳揉腮',
-u'絕非易事',
-u'決腹斷頭',
-u'絕甘分少',
-u'谲怪之談',
-u'絕國殊俗',
-u'絕後光前',
-u'絕火寒食',
-u'倔強倨傲',
-u'厥角稽首',
-u'攫金不見人',
-u'掘井及泉',
-u'絕裾而去',
-u'撅坑撅塹',
-u'絕口不道',
-u'絕口不談',
-u'絕類離倫',
-u'攫戾執猛',
-u'角力中原',
-u'絕路逢生',
-u'絕倫逸群',
-u'絕妙好詞',
-u'決命争首',
-u'掘墓鞭屍',
-u'抉目東門',
-u'抉目吳門',
-u'抉目胥門',
-u'抉目懸門',
-u'絕其本根',
-u'絕情寡義',
-u'絕裙而去',
-u'覺人覺世',
-u'絕仁棄義',
-u'絕色佳人',
-u'絕少分甘',
-u'決勝廟堂',
-u'絕聖棄智',
-u'決勝千裏',
-u'決勝于千裏之外',
-u'決勝之機',
-u'絕世超倫',
-u'絕世出塵',
-u'絕世獨立',
-u'絕世佳人',
-u'絕世離世',
-u'絕世蔑俗',
-u'絕世無倫',
-u'絕世無雙',
-u'橛守成規',
-u'撅豎小人',
-u'撅天撲地',
-u'倔頭強腦',
-u'攫爲己有',
-u'絕無間有',
-u'絕無僅有',
-u'抉瑕擿釁',
-u'抉瑕掩瑜',
-u'抉瑕摘釁',
-u'絕薪止火',
-u'抉意抽華',
-u'決一雌雄',
-u'決一勝負',
-u'決一死戰',
-u'決癰潰疽',
-u'決疣潰癰',
-u'決獄斷刑',
-u'絕域殊方',
-u'絕域異方',
-u'谲詐多端',
-u'絕子絕孫',
-u'君暗臣蔽',
-u'峻阪鹽車',
-u'駿波虎浪',
-u'君不君臣不臣',
-u'軍不血刃',
-u'軍不厭詐',
-u'君側之惡',
-u'君唱臣和',
-u'君臣佐使',
-u'軍多将廣',
-u'軍法從事',
-u'峻法嚴刑',
-u'駿骨牽鹽',
-u'麇駭雉伏',
-u'君火之位',
-u'俊傑廉悍',
-u'軍鄰城下',
-u'峻嶺崇山',
-u'軍令如山',
-u'駿命不易',
-u'君命無二',
-u'君平賣蔔',
-u'君前無戲言',
-u'君仁臣直',
-u'軍容風紀',
-u'君辱臣死',
-u'君射臣決',
-u'君聖臣賢',
-u'皲手繭足',
-u'鈞天廣樂',
-u'鈞天之樂',
-u'軍團前線',
-u'軍團要塞',
-u'君王闆甲',
-u'軍務倥偬',
-u'軍無戲言',
-u'軍銜徽章',
-u'軍心一散百師潰',
-u'峻宇雕牆',
-u'君子愛财取之以道',
-u'君子安平',
-u'君子不奪人所好',
-u'君子不念舊惡',
-u'君子動口小人動手',
-u'君子固窮',
-u'君子好逑',
-u'君子絕交不出惡聲',
-u'君子樂得爲君子',
-u'君子弱白丁良馬畏黃鼠',
-u'君子三戒',
-u'君子問禍不問福',
-u'君子無戲言',
-u'君子協定',
-u'君子一言',
-u'君子一言快馬一鞭',
-u'君子之過',
-u'君子之交',
-u'君子之交淡淡如水',
-u'君子之交淡如水',
-u'君子之接如水',
-u'開誠布公',
-u'開誠布信',
-u'開誠相見',
-u'慨當以慷',
-u'豈弟君子',
-u'開頂風船',
-u'開放體系結構框架',
-u'開弓不放箭',
-u'開弓不射箭',
-u'開弓沒有回頭箭',
-u'開國承家',
-u'開國功臣',
-u'開國濟民',
-u'開國元老',
-u'開國元勳',
-u'開合自如',
-u'慨乎言之',
-u'開花結果',
-u'開花結實',
-u'開懷暢飲',
-u'開基創業',
-u'開基立業',
-u'開疆辟土',
-u'開疆拓境',
-u'開疆拓土',
-u'開疆拓宇',
-u'開疆展土',
-u'開階立極',
-u'開卷有得',
-u'開卷有益',
-u'開科取士',
-u'開口見膽',
-u'開口見喉嚨',
-u'開口見心',
-u'開口三分利',
-u'開闊思維',
-u'開闊眼界',
-u'開來繼往',
-u'開利除害',
-u'開籠放雀',
-u'開聾啓聩',
-u'開路先鋒',
-u'開鑼喝道',
-u'開眉笑眼',
-u'開眉展眼',
-u'開門見山',
-u'開門納寇',
-u'開門納狼',
-u'開門納賊',
-u'開門七件事',
-u'開門受徒',
-u'開門延盜',
-u'開門揖盜',
-u'開啓符文',
-u'慨然領諾',
-u'慨然應允',
-u'慨然允諾',
-u'開山鼻祖',
-u'開山老祖',
-u'開山始祖',
-u'開山之祖',
-u'開山祖師',
-u'開山作師',
-u'開台鑼鼓',
-u'恺悌君子',
-u'開天辟地',
-u'欬唾成珠',
-u'開脫罪責',
-u'開物成務',
-u'開霧賭天',
-u'開柙出虎',
-u'開心見腸',
-u'開心見誠',
-u'開心見膽',
-u'開心明目',
-u'開心如意',
-u'開心寫意',
-u'開源節流',
-u'開雲見日',
-u'開雲見天',
-u'開宗明義',
-u'看碧成朱',
-u'看菜吃飯',
-u'看菜吃飯量體裁衣',
-u'看風駛船',
-u'看風使舵',
-u'看風使帆',
-u'看風駛蓬',
-u'看風行船',
-u'看風行事',
-u'看風轉舵',
-u'砍瓜切菜',
-u'看家本領',
-u'看家本事',
-u'看景不如聽景',
-u'看景生情',
-u'坎井之蛙',
-u'侃侃谔谔',
-u'侃侃而談',
-u'侃侃而言',
-u'侃侃訚訚',
-u'看看又是白頭翁',
-u'侃侃正論',
-u'侃侃直談',
-u'坎坷不平',
-u'看破紅塵',
-u'看人眉睫',
-u'看人眉眼',
-u'看人挑擔不吃力',
-u'看人下菜碟兒',
-u'看人行事',
-u'看殺衛玠',
-u'看事容易做事難',
-u'看守傀儡',
-u'看天遠入地近',
-u'砍鐵如泥',
-u'堪托死生',
-u'瞰亡往拜',
-u'看文巨眼',
-u'看文老眼',
-u'瞰瑕伺隙',
-u'堪以告慰',
-u'砍一枝損百株',
-u'看朱成碧',
-u'糠菜半年糧',
-u'抗塵走俗',
-u'扛鼎抃牛',
-u'扛鼎之作',
-u'糠豆不贍',
-u'抗寒圖騰',
-u'抗懷物外',
-u'抗火圖騰',
-u'亢極之悔',
-u'慷慨悲歌',
-u'慷慨陳詞',
-u'慷慨赴義',
-u'慷慨激昂',
-u'慷慨激烈',
-u'慷慨激揚',
-u'慷慨解囊',
-u'慷慨就義',
-u'慷慨捐生',
-u'慷慨淋漓',
-u'慷慨輸将',
-u'慷慨仗義',
-u'伉麗情笃',
-u'伉麗情深',
-u'亢厲之悔',
-u'康了之中',
-u'亢龍有悔',
-u'康強逢吉',
-u'康衢之謠',
-u'慷人之慨',
-u'抗日民族統一戰線',
-u'抗日遊擊戰争',
-u'慷他人之慨',
-u'亢心憍氣',
-u'抗顔高議',
-u'亢音高唱',
-u'康哉之歌',
-u'康莊大道',
-u'康莊大逵',
-u'康莊之衢',
-u'亢宗之子',
-u'考績黜陟',
-u'考績幽明',
-u'尻輪神馬',
-u'尻馬尻神',
-u'考名責實',
-u'靠人不如靠己',
-u'靠山吃山',
-u'靠山吃山靠水吃水',
-u'犒賞三軍',
-u'靠水吃水',
-u'靠天吃飯',
-u'靠胸貼肉',
-u'尻輿神馬',
-u'靠着米囤餓死',
-u'克愛克威',
-u'科班出身',
-u'刻薄成家',
-u'刻薄寡恩',
-u'刻薄寡思',
-u'刻不待時',
-u'刻不容遲',
-u'刻不容緩',
-u'刻不容松',
-u'客不送客',
-u'渴不擇飲',
-u'渴塵萬斛',
-u'可趁之機',
-u'可乘之機',
-u'可乘之隙',
-u'可乘之釁',
-u'可恥下場',
-u'刻楮功巧',
-u'克傳弓冶',
-u'刻船求劍',
-u'刻翠裁紅',
-u'克逮克容',
-u'克敵制勝',
-u'克丁克卯',
-u'渴而穿井',
-u'渴而掘井',
-u'克伐怨欲',
-u'可歌可泣',
-u'可歌可涕',
-u'可共患難不可共安樂',
-u'克恭克順',
-u'刻骨崩心',
-u'刻骨仇恨',
-u'刻骨镂心',
-u'刻骨銘肌',
-u'刻骨銘心',
-u'刻骨相思',
-u'刻鹄成鹜',
-u'刻鹄類鹜',
-u'刻畫入微',
-u'刻畫無鹽',
-u'渴骥奔泉',
-u'克己奉公',
-u'克己複禮',
-u'刻肌刻骨',
-u'渴骥怒猊',
-u'克己慎行',
-u'刻己自責',
-u'克儉克勤',
-u'可見一斑',
-u'克肩一心',
-u'克盡厥職',
-u'可驚可愕',
-u'苛捐雜稅',
-u'可科之機',
-u'刻苦耐勞',
-u'客來主不顧',
-u'顆粒無存',
-u'顆粒無收',
-u'可憐天下父母心',
-u'刻镂心骨',
-u'渴鹿奔泉',
-u'刻木爲鹄',
-u'刻木爲吏',
-u'客囊羞澀',
-u'可能發生的',
-u'可泣可歌',
-u'恪勤匪懈',
-u'克勤克儉',
-u'溘然長逝',
-u'溘然長往',
-u'溘然而逝',
-u'可人風味',
-u'可設雀羅',
-u'渴時一滴如甘露',
-u'恪守不渝',
-u'恪守成式',
-u'恪守成憲',
-u'克嗣良裘',
-u'客死他鄉',
-u'客随主便',
-u'可談怪論',
-u'客聽主便',
-u'科頭箕裾',
-u'磕頭禮拜',
-u'磕頭碰腦',
-u'磕頭如搗',
-u'磕頭如搗蒜',
-u'科頭跣足',
-u'磕頭撞腦',
-u'咳唾成珠',
-u'咳唾凝珠',
-u'咳唾珠玉',
-u'可望不可即',
-u'可望而不可即',
-u'刻霧裁風',
-u'可喜可愕',
-u'溘先朝露',
-u'可想而知',
-u'可心如意',
-u'磕牙嗑嘴',
-u'嗑牙料嘴',
-u'可要急壞了',
-u'可意會不可言傳',
-u'刻意求工',
-u'可以無饑矣',
-u'可有可無',
-u'課語訛言',
-u'可與人言無一二',
-u'刻章琢句',
-u'渴者易飲',
-u'苛政猛與虎',
-u'刻舟求劍',
-u'刻燭成詩',
-u'咳珠唾玉',
-u'克奏膚功',
-u'刻足适屦',
-u'課嘴撩牙',
-u'肯構肯堂',
-u'肯堂肯構',
-u'啃硬骨頭',
-u'坑繃拐騙',
-u'坑道蠍毒',
-u'坑灰未冷',
-u'坑家敗業',
-u'铿金霏玉',
-u'铿金戛玉',
-u'硁硁之見',
-u'硁硁之信',
-u'硁硁之愚',
-u'坑蒙拐騙',
-u'铿锵頓挫',
-u'铿锵有力',
-u'硜然自首',
-u'坑儒焚典',
-u'坑儒焚書',
-u'孔壁古文',
-u'空車走阪',
-u'空大老脬',
-u'空洞無物',
-u'空費詞說',
-u'恐逢年老不多時',
-u'空腹高心',
-u'空腹便便',
-u'空谷白駒',
-u'空谷傳聲',
-u'空古絕今',
-u'空谷跫然',
-u'空谷跫音',
-u'空谷幽蘭',
-u'空谷之音',
-u'空谷足音',
-u'恐吓嚎叫',
-u'恐吓尖嘯',
-u'恐吓咆哮',
-u'恐後争先',
-u'空話連篇',
-u'孔懷兄弟',
-u'孔懷之親',
-u'孔懷之重',
-u'恐慌萬狀',
-u'空空道人',
-u'空空如也',
-u'空口說白話',
-u'空口無憑',
-u'空曠無人',
-u'孔鯉過娣',
-u'孔孟之道',
-u'空名告身',
-u'孔明揮淚斬馬谡',
-u'控名責實',
-u'空前絕後',
-u'空前團結',
-u'孔情周思',
-u'空舍清野',
-u'空室蓬戶',
-u'空室清野',
-u'空手奪白刃',
-u'孔思周情',
-u'空談快意',
-u'空頭冤家',
-u'空頭支票',
-u'孔武有力',
-u'孔席不栗',
-u'孔席不暖',
-u'孔席不适',
-u'孔席墨突',
-u'空心架子',
-u'空心老官',
-u'空心湯團',
-u'空心湯圓',
-u'空心翼骨',
-u'空穴來風',
-u'空牙之刃',
-u'空言無補',
-u'空言虛辭',
-u'空言虛語',
-u'恐一變未息',
-u'空臆盡言',
-u'恐遭物議',
-u'孔章望鬥',
-u'空中枷鎖',
-u'空中樓閣',
-u'口碑載道',
-u'口辯戶說',
-u'口不二價',
-u'口不絕吟',
-u'寇不可玩',
-u'口不言錢',
-u'口不應心',
-u'口不擇言',
-u'口才辨給',
-u'口稱三味',
-u'口齒便給',
-u'口齒伶俐',
-u'口齒清晰',
-u'口齒生香',
-u'口出不遜',
-u'口出大言',
-u'口出穢言',
-u'口出狂言',
-u'口傳耳受',
-u'口傳家書',
-u'口傳心授',
-u'口大喉嚨小',
-u'口呆目瞪',
-u'口呆目鈍',
-u'寇德加茲',
-u'口多食寡',
-u'口耳并重',
-u'口耳講說',
-u'口耳相承',
-u'口耳相傳',
-u'口耳之學',
-u'口沸目赤',
-u'口福不淺',
-u'口服心服',
-u'口腹之累',
-u'口腹之養',
-u'口腹之慾',
-u'口腹自役',
-u'口幹舌焦',
-u'口幹舌燥',
-u'口隔心慌',
-u'口乖心歪',
-u'口含天憲',
-u'扣壺長吟',
-u'口黃未退',
-u'口惠而實不至',
-u'叩阍無計',
-u'叩阍無路',
-u'口禍之門',
-u'扣楫中流',
-u'口頰留芳',
-u'口講指畫',
-u'口角春風',
-u'口角風情',
-u'口角流涎',
-u'叩角商歌',
-u'口角生風',
-u'口就月将',
-u'口舉手畫',
-u'口角垂涎',
-u'口角鋒芒',
-u'口絕行語',
-u'口角流沫',
-u'口口聲聲',
-u'口口相傳',
-u'口枯眼澀',
-u'口快如刀',
-u'口快心直',
-u'口令攻擊',
-u'叩馬而谏',
-u'口蜜腹劍',
-u'口能舌便',
-u'扣盤扪鑰',
-u'扣槃扪龠',
-u'扣槃扪燭',
-u'口乾舌燥',
-u'口輕舌薄',
-u'口呿目瞪',
-u'扣人心弦',
-u'口如懸河',
-u'口若河懸',
-u'口若懸河',
-u'口尚乳臭',
-u'口舌成瘡',
-u'口舌呆鈍',
-u'口舌俱香',
-u'口舌之便',
-u'口舌之間',
-u'口舌之快',
-u'口舌之勞',
-u'口舌之争',
-u'叩石墾壤',
-u'口是心非',
-u'口是心苗',
-u'口授心傳',
-u'口說不如身逢',
-u'口說無憑',
-u'口似懸河',
-u'口誦心惟',
-u'口體之奉',
-u'口體之養',
-u'口甜如蜜',
-u'叩天無路',
-u'口頭诽謗',
-u'口頭之交',
-u'口吐珠玑',
-u'口吻生花',
-u'口無煩言',
-u'口無擇言',
-u'口銜天憲',
-u'口諧辭給',
-u'叩心泣血',
-u'摳心挖膽',
-u'摳心挖肚',
-u'摳心挖血',
-u'口血未幹',
-u'口血未乾',
-u'摳衣趨隅',
-u'口吟舌言',
-u'口壅若川',
-u'口有同嗜',
-u'口有餘香',
-u'口語籍籍',
-u'叩源推委',
-u'口燥唇幹',
-u'口燥唇乾',
-u'口燥喉幹',
-u'口者關也',
-u'口直心快',
-u'口中雌黃',
-u'口中荊棘',
-u'口中蚤虱',
-u'口誅筆伐',
-u'口墜天花',
-u'枯本竭源',
-u'苦繃苦拽',
-u'哭不得笑不得',
-u'苦不堪言',
-u'苦不可言',
-u'苦不聊生',
-u'枯茶淡飯',
-u'枯腸渴肺',
-u'苦打成招',
-u'苦大仇深',
-u'刳肝瀝膽',
-u'枯槁之士',
-u'楛耕傷稼',
-u'枯骨生肉',
-u'枯骨之馀',
-u'苦海茫茫',
-u'苦海無邊',
-u'苦海無邊回頭是岸',
-u'苦海無涯',
-u'苦盡甘來',
-u'苦盡甜來',
-u'刳精嘔血',
-u'刳精鉥心',
-u'枯井頹巢',
-u'枯莖朽骨',
-u'苦口良藥',
-u'苦口逆耳',
-u'苦口婆心',
-u'哭哭啼啼',
-u'矻矻終日',
-u'苦樂不均',
-u'苦樂之境',
-u'苦眉愁臉',
-u'枯苗望雨',
-u'枯木發榮',
-u'枯木逢春',
-u'枯木逢春猶再發',
-u'枯木生花',
-u'枯木生葉',
-u'枯木死灰',
-u'枯木朽株',
-u'枯木再生',
-u'苦難深重',
-u'枯腦焦心',
-u'枯枿朽株',
-u'枯蓬斷草',
-u'枯歧泣練',
-u'苦身焦思',
-u'哭聲哭得來',
-u'枯瘦如柴',
-u'枯樹逢春',
-u'枯樹開花',
-u'枯樹生花',
-u'枯樹生枝',
-u'枯樹重花',
-u'苦思惡想',
-u'苦思冥想',
-u'刳胎焚夭',
-u'刳胎殺夭',
-u'枯體灰心',
-u'哭天喊地',
-u'哭天抹淚',
-u'苦痛堡壘',
-u'苦痛之路',
-u'哭笑不得',
-u'刳心雕腎',
-u'苦心孤詣',
-u'苦心極力',
-u'苦心積慮',
-u'苦心焦思',
-u'苦心竭力',
-u'苦心經營',
-u'苦心人無不負',
-u'枯形灰心',
-u'刳形去皮',
-u'枯朽之馀',
-u'苦學力文',
-u'哭眼擦淚',
-u'哭眼抹淚',
-u'枯楊生華',
-u'枯楊生稊',
-u'枯魚病鶴',
-u'枯雨得水',
-u'枯魚涸轍',
-u'苦雨凄風',
-u'苦語軟言',
-u'枯魚銜索',
-u'枯魚之肆',
-u'枯耘傷歲',
-u'枯燥無味',
-u'苦争惡戰',
-u'枯枝敗葉',
-u'刳脂剔膏',
-u'枯枝再春',
-u'苦中作樂',
-u'枯竹空言',
-u'枯株朽木',
-u'誇辯之徒',
-u'跨步而過',
-u'誇大其詞',
-u'誇誕大言',
-u'誇誕生感',
-u'誇誕之語',
-u'誇多鬥靡',
-u'跨鳳乘龍',
-u'跨鳳乘鸾',
-u'誇父逐日',
-u'誇父追日',
-u'誇誇而談',
-u'誇誇其談',
-u'誇毗以求',
-u'誇強道會',
-u'誇強說會',
-u'姱容修态',
-u'跨山壓海',
-u'胯下蒲伏',
-u'胯下之辱',
-u'誇州兼郡',
-u'快步流星',
-u'脍不厭細',
-u'快刀不削自己的柄',
-u'快刀熱水幹手巾',
-u'快刀斬亂麻',
-u'快刀斬亂絲',
-u'快刀斬麻',
-u'快犢破車',
-u'塊阜之山',
-u'快捷箭袋',
-u'快橹駛急船',
-u'快馬加鞭',
-u'快馬一鞭',
-u'快馬一鞭快人一言',
-u'塊然獨處',
-u'快人快事',
-u'快人快性',
-u'快人快語',
-u'快人一言快馬一鞭',
-u'郐下無譏',
-u'快心滿意',
-u'快心滿志',
-u'快心事過恐生殃',
-u'快心遂意',
-u'快行無好步',
-u'快意當前',
-u'脍炙海内',
-u'脍炙人口',
-u'脍炙天下',
-u'脍炙一時',
-u'寬大爲懷',
-u'寬打窄用',
-u'寬宏大度',
-u'寬宏大量',
-u'寬洪海量',
-u'寬懷大度',
-u'寬豁大度',
-u'款款而談',
-u'款款深深',
-u'款款之愚',
-u'寬廉平正',
-u'寬猛并濟',
-u'寬猛相濟',
-u'寬猛相資',
-u'款啓寡聞',
-u'款曲周至',
-u'寬仁大度',
-u'寬衫大袖',
-u'款學寡聞',
-u'寬嚴得體',
-u'寬以待人',
-u'款語溫言',
-u'寬中有嚴',
-u'狂白虎變',
-u'狂悖無道',
-u'匡床蒻席',
-u'曠達不羁',
-u'曠大之度',
-u'礦道地鐵',
-u'礦道老鼠',
-u'匡鼎解頤',
-u'狂斷岩斬',
-u'狂吠狴犴',
-u'狂風暴雨',
-u'狂風惡浪',
-u'狂蜂浪蝶',
-u'狂風怒号',
-u'狂風怒吼',
-u'狂風峭壁',
-u'狂風小徑',
-u'狂風驟雨',
-u'曠夫怨女',
-u'曠古絕倫',
-u'曠古奇聞',
-u'曠古未聞',
-u'曠古未有',
-u'曠古無兩',
-u'曠古一人',
-u'狂瞽之說',
-u'狂瞽之言',
-u'匡國濟時',
-u'匡合之功',
-u'匡衡鑿壁',
-u'狂轟濫炸',
-u'匡劑時艱',
-u'匡濟之才',
-u'匡救扶正',
-u'匡救彌縫',
-u'曠絕一世',
-u'匡君救主',
-u'狂龍卷風',
-u'匡亂反正',
-u'曠邈無家',
-u'匡謬正俗',
-u'狂朋怪侶',
-u'狂朋怪友',
-u'狂嫖濫賭',
-u'匡其不逮',
-u'狂千斤錘',
-u'恇怯不前',
-u'筐箧中物',
-u'狂犬吠日',
-u'曠日長久',
-u'曠日持久',
-u'曠日積晷',
-u'曠日經久',
-u'曠日經年',
-u'曠日累時',
-u'曠日離久',
-u'曠日彌久',
-u'曠日引久',
-u'曠日引月',
-u'曠若發蒙',
-u'狂三詐四',
-u'礦山瀑布',
-u'曠世不羁',
-u'诳時惑衆',
-u'匡時濟世',
-u'匡時濟俗',
-u'匡時救世',
-u'曠世奇才',
-u'曠世無匹',
-u'曠世逸才',
-u'匡俗濟時',
-u'曠歲持久',
-u'匡所不逮',
-u'狂濤駭浪',
-u'狂濤巨浪',
-u'狂妄自大',
-u'狂爲亂道',
-u'匡我不逮',
-u'曠心怡神',
-u'曠性怡情',
-u'狂言瞽說',
-u'诓言詐語',
-u'狂咬亂抓',
-u'狂易筋經',
-u'狂吟老監',
-u'曠職偾事',
-u'狂抓亂咬',
-u'窺豹一斑',
-u'潰兵遊勇',
-u'跬步不離',
-u'跬步不休',
-u'潰不成軍',
-u'潰不成陣',
-u'愧不敢當',
-u'跬步千裏',
-u'窺測一斑',
-u'愧汗無地',
-u'葵花向日',
-u'愧悔無地',
-u'葵藿傾陽',
-u'葵藿之心',
-u'窺間伺隙',
-u'窺見一斑',
-u'窺見一斑半點',
-u'傀儡登場',
-u'魁壘擠摧',
-u'揆理度情',
-u'揆理度勢',
-u'夔龍禮樂',
-u'虧名損實',
-u'饋貧之糧',
-u'窺其全豹',
-u'窺竊神器',
-u'揆情度理',
-u'揆情審勢',
-u'葵傾向日',
-u'巋然不動',
-u'喟然長歎',
-u'巋然獨存',
-u'喟然太息',
-u'喟然歎息',
-u'窺涉百家',
-u'揆時度勢',
-u'揆事度理',
-u'窺伺間隙',
-u'窺伺效慕',
-u'愧天怍人',
-u'揆文奮武',
-u'魁梧奇偉',
-u'窺閑伺隙',
-u'虧心短行',
-u'窺牖小兒',
-u'窺觎非望',
-u'虧于一篑',
-u'潰于蟻穴',
-u'悃愊無華',
-u'昆弟之好',
-u'困而不學',
-u'困而學之',
-u'昆岡之火',
-u'壸漿箪食',
-u'困勉下學',
-u'困難問題',
-u'鹍鵬得志',
-u'崑山片玉',
-u'昆山之玉',
-u'困獸思鬥',
-u'困獸猶鬥',
-u'困心衡慮',
-u'琨玉秋霜',
-u'捆載而歸',
-u'困知勉行',
-u'悃質無華',
-u'闊步高談',
-u'廓達大度',
-u'廓開大計',
-u'闊論高談',
-u'括目相待',
-u'括囊避咎',
-u'括囊不言',
-u'括囊拱手',
-u'括囊守祿',
-u'括囊四海',
-u'拉捭摧藏',
-u'拉幫結派',
-u'拉大旗作虎皮',
-u'拉個口子要見血',
-u'拉弓不放箭',
-u'拉弓不射箭',
-u'臘鼓頻催',
-u'臘盡春回',
-u'臘盡春來',
-u'臘盡冬殘',
-u'拉枯折朽',
-u'拉拉扯扯',
-u'拉拉雜雜',
-u'拉三扯四',
-u'拉閑散悶',
-u'拉朽摧枯',
-u'拉雜摧燒',
-u'來遲罰三杯',
-u'來處不易',
-u'來得去不得',
-u'來得早不如來得巧',
-u'來而不距',
-u'來而不往非禮也',
-u'癞狗扶不上牆',
-u'癞蛤蟆想吃天鵝肉',
-u'賴漢娶好妻',
-u'來鴻去燕',
-u'來回來去',
-u'來曆不明',
-u'來龍結脈',
-u'來龍去脈',
-u'來情去意',
-u'來去分明',
-u'來去無蹤',
-u'來去自由',
-u'來日大難',
-u'來日方長',
-u'來日應長',
-u'來日正長',
-u'來如風雨',
-u'來世不可待',
-u'來是是非人去是是非者',
-u'來勢兇猛',
-u'來勢洶洶',
-u'來說是非者',
-u'來說是非者便是是非人',
-u'來蘇之望',
-u'來往如梭',
-u'來因去果',
-u'來迎去送',
-u'賴有此耳',
-u'來者不拒',
-u'來者不懼懼者不來',
-u'來者不善',
-u'來者不善善者不來',
-u'來者居上',
-u'來者可追',
-u'來者勿拒',
-u'來轸方遒',
-u'來之不易',
-u'來之坎坎',
-u'來蹤去迹',
-u'來蹤去路',
-u'蘭艾不分',
-u'蘭艾俱焚',
-u'蘭艾難分',
-u'蘭艾同焚',
-u'蘭艾同燼',
-u'蘭艾同生',
-u'懶不自惜',
-u'濫廁其間',
-u'蘭摧玉折',
-u'瀾倒波随',
-u'蘭德瑞亞',
-u'懶惰結界',
-u'爛額焦頭',
-u'闌風伏雨',
-u'闌風長雨',
-u'濫官污吏',
-u'蘭桂齊芳',
-u'蘭桂騰芳',
-u'攔截昏迷',
-u'濫吏髒官',
-u'褴褛筚路',
-u'褴褛皮帽',
-u'爛漫天真',
-u'攬名責實',
-u'攬辔澄清',
-u'攬辔登車',
-u'攬辔中原',
-u'濫情亂性',
-u'攬權怙勢',
-u'攬權納賄',
-u'爛如指掌',
-u'爛若披錦',
-u'爛若披掌',
-u'爛若舒錦',
-u'濫觞所出',
-u'爛熟于心',
-u'蘭斯利德',
-u'藍田出玉',
-u'藍田生玉',
-u'藍田種玉',
-u'覽聞辯見',
-u'蘭心蕙性',
-u'蘭形棘心',
-u'蘭秀菊芳',
-u'蘭薰桂馥',
-u'蘭言斷金',
-u'蘭因絮果',
-u'濫用職權',
-u'蘭友瓜戚',
-u'濫芋充數',
-u'濫竽自恥',
-u'蘭怨桂親',
-u'蘭蒸椒漿',
-u'蘭芝常生',
-u'蘭質蕙心',
-u'蘭芷漸滫',
-u'蘭芷蕭艾',
-u'蘭質薰心',
-u'蘭芷之室',
-u'蘭姿蕙質',
-u'爛醉如泥',
-u'狼狽不堪',
-u'狼狽逃竄',
-u'狼狽萬狀',
-u'狼狽爲奸',
-u'狼狽周章',
-u'狼奔豕突',
-u'狼奔鼠竄',
-u'狼奔鼠偷',
-u'狼奔鼠走',
-u'狼奔兔脫',
-u'郎不郎秀不秀',
-u'郎才女貌',
-u'郎才女姿',
-u'狼飡虎食',
-u'狼飡虎咽',
-u'狼吃幞頭',
-u'狼蟲虎豹',
-u'锒铛入獄',
-u'锒铛下獄',
-u'狼顧鸱張',
-u'狼顧鸱跱',
-u'狼顧虎視',
-u'狼顧狐疑',
-u'狼顧麕驚',
-u'狼顧鸢視',
-u'狼嗥狗叫',
-u'狼嗥鬼叫',
-u'狼号鬼哭',
-u'琅嬛福地',
-u'浪迹浮蹤',
-u'浪迹江湖',
-u'浪迹萍蹤',
-u'浪迹天下',
-u'浪迹天涯',
-u'狼艱狽蹶',
-u'浪靜風平',
-u'浪靜風恬',
-u'浪酒閑茶',
-u'浪瀾壯闊',
-u'朗朗乾坤',
-u'朗朗上口',
-u'狼戾不仁',
-u'浪漫詩語',
-u'狼猛蜂毒',
-u'朗目疏眉',
-u'郎潛白發',
-u'狼前虎後',
-u'浪蕊浮花',
-u'朗若列眉',
-u'浪聲浪氣',
-u'浪聲颡氣',
-u'狼飧虎咽',
-u'狼貪虎視',
-u'狼貪鼠竊',
-u'浪濤澎湃',
-u'狼突鸱張',
-u'狼突豕竄',
-u'狼圖騰谷',
-u'狼吞虎餐',
-u'狼吞虎噬',
-u'狼吞虎咽',
-u'狼王鬥篷',
-u'狼窩虎穴',
-u'狼心狗肺',
-u'狼心狗行',
-u'狼心樣本',
-u'狼煙大話',
-u'狼眼鼠眉',
-u'狼煙四起',
-u'狼羊同飼',
-u'浪怡波靜',
-u'稂莠不齊',
-u'阆苑瓊樓',
-u'阆苑瑤台',
-u'朗月清風',
-u'狼子不可養',
-u'浪子回頭',
-u'浪子回頭金不換',
-u'狼子獸心',
-u'狼子野心',
-u'浪子宰相',
-u'老蚌出明珠',
-u'老蚌出珠',
-u'老蚌生珠',
-u'老蚌珠胎',
-u'老病龍鍾',
-u'老不讀西遊',
-u'老不看西遊',
-u'牢不可拔',
-u'牢不可解',
-u'牢不可破',
-u'老不曉事',
-u'老菜娛親',
-u'老蠶作繭',
-u'老巢難舍',
-u'老成持重',
-u'老成典型',
-u'老成凋謝',
-u'老成見到',
-u'老成練達',
-u'老成穩練',
-u'老成之見',
-u'老大徒悲傷',
-u'老大徒傷',
-u'老大徒傷悲',
-u'老大無成',
-u'老大自居',
-u'老當益壯',
-u'老調重談',
-u'老掉了牙',
-u'勞而不獲',
-u'老而不死',
-u'老而不死是爲賊',
-u'老而彌笃',
-u'老而彌壯',
-u'勞而少功',
-u'勞而無功',
-u'勞而無益',
-u'老而益壯',
-u'老房子起火',
-u'老鸹窩裏出鳳凰',
-u'老龜刳腸',
-u'老鶴乘軒',
-u'老虎吃雞不是山中王',
-u'老虎吊了山澗裏',
-u'老虎頭上拍蒼蠅',
-u'老虎頭上撲蒼蠅',
-u'老虎頭上搔癢',
-u'老虎嘴裏拔牙',
-u'老骥伏枥',
-u'牢甲利兵',
-u'老奸大猾',
-u'老奸大偷',
-u'老奸巨盜',
-u'老奸巨滑',
-u'老奸少猾',
-u'老奸宿贓',
-u'勞筋苦骨',
-u'勞精苦形',
-u'勞苦功高',
-u'老萊娛親',
-u'勞勞塵夢',
-u'老老大大',
-u'唠唠叨叨',
-u'勞勞碌碌',
-u'老淚縱橫',
-u'老吏斷獄',
-u'勞力費心',
-u'老練通達',
-u'老林多毒蟲',
-u'牢落陸離',
-u'老馬戀棧',
-u'老馬識途',
-u'老馬嘶風',
-u'老馬爲駒',
-u'老馬知道',
-u'老馬知路',
-u'老馬之智',
-u'老邁龍鍾',
-u'老邁年高',
-u'老貓溜房檐輩輩往下傳',
-u'勞民動衆',
-u'勞民費财',
-u'勞民傷财',
-u'老謀深算',
-u'老牛啃嫩草',
-u'老牛破車',
-u'老牛箝嘴',
-u'老牛舐犢',
-u'老女歸宗',
-u'老罴當道',
-u'老罴高卧',
-u'老婆舌頭',
-u'老氣橫秋',
-u'老去一杯足',
-u'勞人傷财',
-u'老儒常語',
-u'老弱殘兵',
-u'唠三叨四',
-u'牢騷滿腹',
-u'牢騷太盛防腸斷',
-u'老僧入定',
-u'老少羸弱',
-u'勞神費思',
-u'勞身焦思',
-u'勞神苦思',
-u'老身長子',
-u'老生常談',
-u'老實巴交',
-u'老實的終須在',
-u'勞師動衆',
-u'牢什古子',
-u'勞師糜饷',
-u'勞師襲遠',
-u'老師宿儒',
-u'勞師遠襲',
-u'老手宿儒',
-u'老鼠搬姜',
-u'老鼠過街',
-u'老鼠過街人人喊打',
-u'老鼠見貓',
-u'老鼠燒尾',
-u'老鼠生來會打洞',
-u'老死不相往來',
-u'老死溝壑',
-u'勞思逸淫',
-u'老死牖下',
-u'老态龍鍾',
-u'老天拔地',
-u'老天隔不了一層紙',
-u'老王賣瓜',
-u'勞問不絕',
-u'老翁失馬',
-u'老物可憎',
-u'老無所依',
-u'勞心焦思',
-u'勞心苦力',
-u'勞心苦思',
-u'勞形苦神',
-u'勞形苦心',
-u'老熊當道',
-u'老羞變怒',
-u'老羞成怒',
-u'老朽無能',
-u'勞燕分飛',
-u'勞燕西東',
-u'勞逸不均',
-u'勞逸結合',
-u'老醫少蔔',
-u'烙印魔棒',
-u'老有所終',
-u'老幼無欺',
-u'老妪能解',
-u'老于世故',
-u'老魚跳波',
-u'潦原浸天',
-u'老賊出手不落空',
-u'老張的哲學',
-u'老着面皮',
-u'老之将至',
-u'老子孬種兒混蛋',
-u'老子英雄兒好漢',
-u'樂不極盤',
-u'樂不可極',
-u'樂不可言',
-u'樂不可支',
-u'樂不思蜀',
-u'了不相幹',
-u'了不相關',
-u'了不相屬',
-u'樂昌分鏡',
-u'樂昌破鏡',
-u'樂昌之鏡',
-u'樂成人美',
-u'樂此不倦',
-u'樂此不疲',
-u'樂道安命',
-u'樂道安貧',
-u'樂道好古',
-u'樂道忘饑',
-u'樂道遺榮',
-u'樂而不荒',
-u'樂而不厭',
-u'樂而不淫',
-u'樂而忘返',
-u'樂而忘歸',
-u'樂而忘疲',
-u'樂而忘死',
-u'樂而忘憂',
-u'樂禍幸災',
-u'樂極哀來',
-u'樂極哀生',
-u'樂極悲來',
-u'樂極悲生',
-u'樂極還悲',
-u'樂極生哀',
-u'樂極生悲',
-u'樂極生悲否極泰來',
-u'樂極生悲甜中生苦',
-u'樂極災生',
-u'樂極則悲',
-u'樂極則憂',
-u'樂嗟苦咄',
-u'樂盡哀生',
-u'樂盡悲來',
-u'樂樂不殆',
-u'樂樂醄醄',
-u'勒馬懸崖',
-u'樂貧甘贱',
-u'了然無聞',
-u'樂山愛水',
-u'樂善不倦',
-u'樂善好施',
-u'樂善好義',
-u'樂山樂水',
-u'了身脫命',
-u'樂事勸功',
-u'勒索敲詐',
-u'樂天安命',
-u'樂天任命',
-u'樂天知命',
-u'樂退安貧',
-u'樂往哀來',
-u'樂爲用命',
-u'樂新厭舊',
-u'樂行憂違',
-u'樂業安居',
-u'樂以忘憂',
-u'樂育人材',
-u'樂在其中',
-u'樂終而悲',
-u'淚迸腸絕',
-u'雷嗔電怒',
-u'淚出痛腸',
-u'雷打不動',
-u'雷電交加',
-u'雷動風行',
-u'累牍連篇',
-u'淚幹腸斷',
-u'擂鼓鳴金',
-u'擂鼓篩鑼',
-u'磊瑰不羁',
-u'淚河東注',
-u'雷轟電掣',
-u'雷轟電轉',
-u'雷擊牆壓',
-u'累及無辜',
-u'累教不改',
-u'累誡不戒',
-u'雷驚電繞',
-u'累塊積蘇',
-u'磊浪不羁',
-u'累累皆是',
-u'磊磊落落',
-u'累累如珠',
-u'雷厲風飛',
-u'雷厲風行',
-u'雷令風行',
-u'淚流滿面',
-u'累卵之危',
-u'磊落不凡',
-u'磊落不羁',
-u'磊落跌蕩',
-u'磊落光明',
-u'磊落豪橫',
-u'磊落奇偉',
-u'磊落飒爽',
-u'磊落轶蕩',
-u'累棋之危',
-u'淚如泉滴',
-u'淚如泉湧',
-u'傫如喪狗',
-u'淚如雨下',
-u'雷聲大雨點兒小',
-u'雷聲大雨點小',
-u'累世通好',
-u'淚水之池',
-u'類似而非',
-u'累蘇積塊',
-u'雷騰雲奔',
-u'擂天倒地',
-u'雷霆萬鈞',
-u'雷霆一擊',
-u'雷霆之心聖服',
-u'雷同一律',
-u'累土聚沙',
-u'累土至山',
-u'累瓦結繩',
-u'累屋重架',
-u'淚下如雨',
-u'缧绁之苦',
-u'缧绁之憂',
-u'羸形垢面',
-u'淚眼愁眉',
-u'淚眼汪汪',
-u'累月經年',
-u'累珠妙唱',
-u'累珠妙曲',
-u'累足成步',
-u'冷嘲熱諷',
-u'冷嘲熱罵',
-u'冷嘲熱谑',
-u'冷窗凍壁',
-u'冷風淘熱氣',
-u'冷鍋裏爆豆',
-u'冷譏熱嘲',
-u'楞眉橫眼',
-u'冷面寒鐵',
-u'冷暖自量',
-u'冷暖自知',
-u'冷鋪中舍冰',
-u'冷敲熱罵',
-u'冷熱自明',
-u'冷熱自知',
-u'冷如霜雪',
-u'冷若冰霜',
-u'冷若冰雪',
-u'楞手楞腳',
-u'冷手抓不着熱饅頭',
-u'冷水澆背',
-u'冷水澆面',
-u'冷水澆頭',
-u'冷似冰霜',
-u'楞頭呆腦',
-u'楞頭磕腦',
-u'愣頭愣腦',
-u'冷心冷面',
-u'冷血動物',
-u'冷眼靜看',
-u'冷言冷語',
-u'冷眼旁觀',
-u'冷言熱語',
-u'冷言酸語',
-u'冷眼相待',
-u'冷語冰人',
-u'冷在三九熱在中伏',
-u'立愛惟親',
-u'籬笆不牢犬兒入',
-u'李白桃紅',
-u'利傍倚刀',
-u'力倍功半',
-u'離本徼末',
-u'離本趣末',
-u'離本依末',
-u'禮崩樂壞',
-u'籬壁間物',
-u'厲兵栗馬',
-u'勵兵秣馬',
-u'曆兵粟馬',
-u'力薄才疏',
-u'力不從心',
-u'力不從願',
-u'力不逮心',
-u'力不副心',
-u'力不及心',
-u'利不虧義',
-u'力不能及',
-u'力不能支',
-u'禮不親授',
-u'裏不勝辭',
-u'力不勝任',
-u'力不同科',
-u'理不忘亂',
-u'禮不嫌菲',
-u'嫠不恤緯',
-u'力不自勝',
-u'蠡測管窺',
-u'力場崩潰',
-u'立吃地陷',
-u'俐齒伶牙',
-u'利齒能牙',
-u'利齒之矢',
-u'裏醜捧心',
-u'裏出外進',
-u'利出一孔',
-u'立春日有懷',
-u'立此存照',
-u'力蹙勢窮',
-u'曆代不一',
-u'砺帶河山',
-u'李代桃僵',
-u'力殚财竭',
-u'瀝膽抽腸',
-u'瀝膽堕肝',
-u'瀝膽隳肝',
-u'瀝膽披肝',
-u'瀝膽濯肝',
-u'利刀割體痕易合',
-u'立德立言',
-u'離得遠如一步也',
-u'立地成佛',
-u'立地頂天',
-u'立地金剛',
-u'力砥狂瀾',
-u'力敵千鈞',
-u'立地擎天',
-u'力敵勢均',
-u'立地書櫥',
-u'力敵萬夫',
-u'立定腳跟',
-u'立盹行眠',
-u'禮多必詐',
-u'理多不饒人',
-u'離多會少',
-u'禮多人見外',
-u'禮煩則亂',
-u'禮廢樂崩',
-u'理紛解結',
-u'力分勢弱',
-u'轹釜待炊',
-u'利斧亂舞',
-u'立竿見影',
-u'砺戈秣馬',
-u'立功立德',
-u'立功立事',
-u'立功贖罪',
-u'立功自贖',
-u'立功自效',
-u'裏鈎外連',
-u'理固當然',
-u'力孤勢危',
-u'李廣不侯',
-u'李廣難封',
-u'李廣未封',
-u'利歸衆人何事不成',
-u'立國安邦',
-u'理過其辭',
-u'李郭同船',
-u'李郭同舟',
-u'李郭仙舟',
-u'利害得失',
-u'利害相關',
-u'利害攸關',
-u'李好義傳',
-u'離合悲歡',
-u'裏合外應',
-u'離合憂歡',
-u'梨花帶雨',
-u'禮壞樂缺',
-u'禮壞樂崩',
-u'骊黃牝牡',
-u'利喙贍辭',
-u'離魂倩女',
-u'藜藿不采',
-u'力疾奔走',
-u'力疾從公',
-u'力疾從事',
-u'力濟九區',
-u'郦寄賣友',
-u'利己損人',
-u'離家三裏地別是一鄉風',
-u'梨頰微渦',
-u'厘奸剔弊',
-u'利缰名鎖',
-u'曆階而上',
-u'禮節徽記',
-u'力竭聲嘶',
-u'曆盡滄桑',
-u'利盡交疏',
-u'力盡筋疲',
-u'力盡神危',
-u'禮禁未然',
-u'離經背訓',
-u'離經辨志',
-u'勵精更始',
-u'曆井扪天',
-u'離經叛道',
-u'勵精求治',
-u'勵精圖進',
-u'勵精圖治',
-u'曆精爲治',
-u'醴酒不設',
-u'曆久彌堅',
-u'麗句清詞',
-u'力鈞勢敵',
-u'力扛九鼎',
-u'力可拔山',
-u'栗殼襯肩',
-u'利口辯辭',
-u'利口辯給',
-u'利口便舌',
-u'利口捷給',
-u'利口巧辭',
-u'理虧詞遁',
-u'理虧心虛',
-u'力困筋乏',
-u'澧蘭沅芷',
-u'籬牢犬不入',
-u'栗栗不安',
-u'離離草原',
-u'離離矗矗',
-u'曆曆可辨',
-u'曆曆可見',
-u'曆曆可考',
-u'曆曆可數',
-u'力力碌碌',
-u'曆曆落落',
-u'曆曆如畫',
-u'曆曆如繪',
-u'曆曆如見',
-u'栗栗危懼',
-u'離離蔚蔚',
-u'曆曆在耳',
-u'曆曆在目',
-u'曆曆在眼',
-u'栗栗自危',
-u'曆練老成',
-u'栗烈觱發',
-u'厲鱗先知',
-u'厲鱗魚人',
-u'厲鱗智者',
-u'利令志惛',
-u'骊龍之珠',
-u'利路名揚',
-u'離鸾別鳳',
-u'離鸾別鶴',
-u'離鸾別鹄',
-u'曆亂無章',
-u'梨眉艾發',
-u'禮門義路',
-u'粒米狼戾',
-u'粒米束薪',
-u'立命安身',
-u'力能扛鼎',
-u'力能勝貧',
-u'力能所及',
-u'力排群議',
-u'力排衆議',
-u'力破我執',
-u'離奇古怪',
-u'離情別恨',
-u'離情別苦',
-u'離情別緒',
-u'俪青妃白',
-u'禮輕情義重',
-u'禮輕人意重',
-u'力窮勢孤',
-u'理趣不凡',
-u'理屈詞不窮',
-u'理屈詞窮',
-u'力屈道窮',
-u'力屈計窮',
-u'力屈勢窮',
-u'理勸不如利勸',
-u'離群索處',
-u'離群索居',
-u'禮讓爲國',
-u'利惹名牽',
-u'利刃漩渦',
-u'曆日曠久',
-u'麗日抒懷',
-u'利如刀割',
-u'立掃千言',
-u'砺山帶河',
-u'離山調虎',
-u'禮尚往來',
-u'蠡勺測海',
-u'禮奢寧儉',
-u'立身處世',
-u'立身行道',
-u'立身行己',
-u'立身行事',
-u'立身揚名',
-u'理勝其辭',
-u'裏生外熟',
-u'犁生骍角',
-u'禮勝則離',
-u'粝食粗餐',
-u'粝食粗衣',
-u'理勢當然',
-u'離世遁上',
-u'利時及物',
-u'離世絕俗',
-u'曆世摩鈍',
-u'禮士親賢',
-u'立時三刻',
-u'離世異俗',
-u'礫石營地',
-u'禮失則昏',
-u'力士捉蠅',
-u'離蔬釋蹻',
-u'黎庶塗炭',
-u'禮順人情',
-u'曆歲久遠',
-u'理所必然',
-u'力所不逮',
-u'力所不及',
-u'力所不任',
-u'理所不容',
-u'理所當然',
-u'利鎖名枷',
-u'利鎖名缰',
-u'利鎖名牽',
-u'力所能及',
-u'力所能堪',
-u'力所能任',
-u'力所能緻',
-u'理所宜然',
-u'裏談巷議',
-u'立談之間',
-u'離題萬裏',
-u'犁庭掃闾',
-u'犁庭掃穴',
-u'裏通外國',
-u'力透紙背',
-u'裏外夾攻',
-u'力挽狂瀾',
-u'利绾名牽',
-u'力挽頹波',
-u'力挽頹風',
-u'力挽頹瀾',
-u'理枉雪滞',
-u'禮爲情貌',
-u'力違群議',
-u'力微任重',
-u'力微休負重',
-u'立桅揚帆',
-u'嫠緯之憂',
-u'禮無不答',
-u'戾喜北戚',
-u'離析分崩',
-u'離析渙奔',
-u'利析秋毫',
-u'李下不整冠',
-u'李下瓜田',
-u'禮下于人必有所求',
-u'禮賢接士',
-u'禮賢下士',
-u'禮先壹飯',
-u'禮賢遠佞',
-u'離弦走闆',
-u'離鄉背井',
-u'離鄉背土',
-u'離鄉別井',
-u'離鄉別土',
-u'裏巷之談',
-u'力小任重',
-u'離心離德',
-u'例行差事',
-u'例行公事',
-u'厲行節約',
-u'力學不倦',
-u'立雪程門',
-u'力學笃行',
-u'瀝血叩心',
-u'瀝血披肝',
-u'瀝血披心',
-u'瀝血剖肝',
-u'立雪求道',
-u'離削自守',
-u'李娅空翻',
-u'立言不朽',
-u'栎陽雨金',
-u'立業安邦',
-u'立業成家',
-u'利以昏智',
-u'利益均沾',
-u'禮義廉恥',
-u'利以平民',
-u'禮義生于富足',
-u'詈夷爲跖',
-u'禮儀之邦',
-u'利以智昏',
-u'裏應外合',
-u'利用厚生',
-u'理有固然',
-u'曆有年所',
-u'禮有往來',
-u'力有未逮',
-u'利誘威脅',
-u'力誘紙背',
-u'立于不敗',
-u'立于不敗之地',
-u'鯉魚打挺',
-u'利欲昏心',
-u'立于勝地',
-u'鯉魚跳龍門',
-u'利慾薰心',
-u'利欲熏心心漸黑',
-u'梨園弟子',
-u'理冤釋滞',
-u'理冤摘伏',
-u'梨園子弟',
-u'禮樂崩壞',
-u'砺嶽盟河',
-u'禮樂刑政',
-u'利災樂禍',
-u'麗藻春葩',
-u'力障狂瀾',
-u'立仗之馬',
-u'戾者墓碑',
-u'理正詞直',
-u'力征經營',
-u'力争上流',
-u'力争上遊',
-u'勵志冰檗',
-u'力之不及',
-u'理之當然',
-u'勵志竭精',
-u'例直禁簡',
-u'理直氣壯',
-u'勵志如冰',
-u'禮之用和爲貴',
-u'厲志貞亮',
-u'力壯身強',
-u'立錐之地',
-u'立錐之土',
-u'蠡酌管窺',
-u'麗姿秀色',
-u'粝粢之食',
-u'理足氣壯',
-u'立足之地',
-u'連鳌跨鲸',
-u'連壁贲臨',
-u'連編累牍',
-u'連镳并駕',
-u'連镳并轸',
-u'練兵秣馬',
-u'臉不改色心不跳',
-u'臉不紅心不跳',
-u'連朝接夕',
-u'連車平鬥',
-u'連城之璧',
-u'連城之價',
-u'連城之珍',
-u'連疇接隴',
-u'聯床風雨',
-u'練達老成',
-u'斂锷韬光',
-u'連二并三',
-u'廉而不刿',
-u'連二趕三',
-u'斂發謹饬',
-u'廉風正氣',
-u'連根帶梢',
-u'連根共樹',
-u'連更徹夜',
-u'連更曉夜',
-u'連更星夜',
-u'斂骨吹魂',
-u'憐孤惜寡',
-u'斂憨皮厚',
-u'連恨帶氣',
-u'連哄帶勸',
-u'臉紅耳赤',
-u'臉紅耳熱',
-u'臉紅筋暴',
-u'臉紅筋漲',
-u'斂後疏前',
-u'蓮花步步',
-u'臉黃肌瘦',
-u'連昏達曙',
-u'連昏接晨',
-u'連雞之勢',
-u'連街倒巷',
-u'廉潔奉公',
-u'連階累任',
-u'煉金術士',
-u'廉靜寡欲',
-u'戀酒迷花',
-u'戀酒貪杯',
-u'戀酒貪花',
-u'戀酒貪色',
-u'廉可寄财',
-u'簾窺壁聽',
-u'連類比事',
-u'連類比物',
-u'連類龍鸾',
-u'連理分枝',
-u'連裏竟街',
-u'連理之木',
-u'戀戀不舍',
-u'戀戀難舍',
-u'聯袂而至',
-u'連甍接棟',
-u'連綿不斷',
-u'連綿不絕',
-u'連綿起伏',
-u'連明徹夜',
-u'連明達夜',
-u'廉明公正',
-u'連明連夜',
-u'廉能清正',
-u'連年有餘',
-u'蓮藕同根',
-u'聯翩而至',
-u'連篇累冊',
-u'聯篇累牍',
-u'連篇累幅',
-u'連篇累幀',
-u'連篇累帙',
-u'憐貧敬老',
-u'憐貧惜贱',
-u'憐貧惜老',
-u'憐貧恤苦',
-u'憐貧恤老',
-u'廉平公正',
-u'連氣帶恨',
-u'連阡累陌',
-u'連牆接棟',
-u'臉青鼻腫',
-u'連勸帶哄',
-u'廉泉讓水',
-u'連衽成帏',
-u'連日帶夜',
-u'連日繼夜',
-u'連日連夜',
-u'斂容屏氣',
-u'斂容息氣',
-u'臉軟心慈',
-u'連三并四',
-u'連三接二',
-u'連三接四',
-u'連三接五',
-u'連三跨五',
-u'斂色屏氣',
-u'連山排海',
-u'臉上挂了招牌',
-u'臉上開果子鋪',
-u'臉上貼金',
-u'臉上有狗毛',
-u'斂聲屏氣',
-u'斂聲匿迹',
-u'斂聲屏息',
-u'戀生惡死',
-u'煉石補天',
-u'斂手待斃',
-u'斂手屏足',
-u'斂手束腳',
-u'連鎖反應',
-u'廉貪立懦',
-u'連湯帶水',
-u'連天烽火',
-u'連天匝地',
-u'連通分支',
-u'戀土難移',
-u'廉頑立懦',
-u'憐我憐卿',
-u'戀物成癖',
-u'臉無人色',
-u'憐香惜玉',
-u'連宵徹曙',
-u'連宵達旦',
-u'憐新棄舊',
-u'戀新忘舊',
-u'憐新厭舊',
-u'連一不二',
-u'斂翼待時',
-u'斂影逃形',
-u'連輿并席',
-u'連輿接席',
-u'廉隅細謹',
-u'斂怨求媚',
-u'廉遠堂高',
-u'連雲疊嶂',
-u'戀棧不去',
-u'連戰皆捷',
-u'連章累牍',
-u'連枝比翼',
-u'連枝并頭',
-u'連枝帶葉',
-u'連枝分葉',
-u'連枝共冢',
-u'連帙累牍',
-u'連枝同氣',
-u'連中三元',
-u'連珠合璧',
-u'兩敗俱傷',
-u'兩般皆不毒',
-u'兩般三樣',
-u'兩鬓如霜',
-u'量兵相地',
-u'量才稱職',
-u'量才而爲',
-u'量才錄用',
-u'量才器使',
-u'量才叙用',
-u'量才擢用',
-u'糧草先行',
-u'糧草一空兵心亂',
-u'糧草一空軍心亂',
-u'糧草欲空兵心亂',
-u'量柴禾數米粒',
-u'良辰吉日',
-u'良辰媚景',
-u'量出制入',
-u'兩次三番',
-u'涼從腳下生',
-u'量大福也大',
-u'兩道三科',
-u'兩得其便',
-u'兩得其所',
-u'兩得其中',
-u'兩豆塞耳',
-u'糧多草廣',
-u'兩惡相權取其輕',
-u'兩耳不聞窗外事',
-u'兩耳塞豆',
-u'量腹而食',
-u'兩個肩膀扛着一張嘴',
-u'兩個面孔',
-u'良工苦心',
-u'良工巧匠',
-u'良工無改',
-u'良工心苦',
-u'兩瞽相扶',
-u'兩姑之間難爲婦',
-u'兩國交兵不斬來使',
-u'兩害從輕',
-u'兩好并一好',
-u'兩好合一好',
-u'兩虎共鬥',
-u'兩虎相搏',
-u'兩虎相鬥',
-u'兩虎相鬥必有一傷',
-u'兩虎相争',
-u'兩火一刀',
-u'量己審分',
-u'良賈深藏',
-u'兩肩荷口',
-u'兩腳間的距離',
-u'兩腳居間',
-u'兩腳書櫥',
-u'兩腳踏住平川路',
-u'兩腳野狐',
-u'量金買賦',
-u'良金美玉',
-u'糧盡援絕',
-u'兩可之言',
-u'兩口兒眉頭暫開放',
-u'兩肋插刀',
-u'兩淚汪汪',
-u'量力度德',
-u'量力而動',
-u'量力而爲',
-u'量力而行',
-u'踉踉跄跄',
-u'兩兩三三',
-u'梁孟相敬',
-u'兩面二舌',
-u'兩面夾攻',
-u'兩面三刀',
-u'良苗懷新',
-u'量能授官',
-u'量能授器',
-u'良朋益友',
-u'兩岐遂分',
-u'良禽相木',
-u'良禽擇木',
-u'良禽擇木而栖',
-u'兩情缱绻',
-u'兩全其美',
-u'兩全其适',
-u'兩全之美',
-u'兩人合穿一條褲子',
-u'兩人一般心',
-u'兩日曬網',
-u'量入計出',
-u'量如江海',
-u'量入爲出',
-u'量入爲用',
-u'量入以爲出',
-u'量入制出',
-u'量枘制鑿',
-u'梁上君子',
-u'量時度力',
-u'良時吉日',
-u'良時美景',
-u'兩世爲人',
-u'良師益友',
-u'良師诤友',
-u'良史之才',
-u'兩手空空',
-u'兩鼠鬥穴',
-u'量體裁衣',
-u'良田萬傾',
-u'兩頭不見影',
-u'兩頭和番',
-u'兩頭三面',
-u'兩頭三緒',
-u'兩賢相厄',
-u'良相良醫',
-u'兩廂情願',
-u'量小非君子無毒不丈夫',
-u'良宵好景',
-u'量小力微',
-u'良宵美景',
-u'兩小無猜',
-u'兩小無嫌',
-u'兩心相悅',
-u'兩心一體',
-u'兩雄不并立',
-u'兩袖清風',
-u'兩袖秋風',
-u'涼血動物',
-u'兩言可決',
-u'良藥苦口',
-u'兩腋清風',
-u'兩葉掩目',
-u'兩意三心',
-u'良莠不分',
-u'良莠不齊',
-u'良莠不一',
-u'良莠淆雜',
-u'良有以也',
-u'良玉不雕',
-u'良玉不琢',
-u'梁園雖好非久戀之鄉',
-u'量鑿正枘',
-u'兩隻腳趕不上一張嘴',
-u'良知良能',
-u'良質美手',
-u'聊報涓埃',
-u'聊備一格',
-u'聊表寸心',
-u'聊博一笑',
-u'了不可見',
-u'了不長進',
-u'蓼菜成行',
-u'潦草塞責',
-u'蓼蟲忘辛',
-u'療瘡剜肉',
-u'聊當一茶',
-u'潦倒粗疏',
-u'潦倒龍鍾',
-u'料敵如神',
-u'料敵若神',
-u'料敵制勝',
-u'遼東白豕',
-u'撩東撾西',
-u'撩東劄西',
-u'遼東之豕',
-u'撩兒敲兒',
-u'燎發摧枯',
-u'撩蜂撥刺',
-u'撩蜂吃螫',
-u'撩蜂剔蠍',
-u'聊複爾耳',
-u'廖化作先鋒',
-u'撩火加油',
-u'料戾徹鑒',
-u'了了可見',
-u'寥寥可數',
-u'寥寥無多',
-u'寥寥無幾',
-u'寥落不偶',
-u'料峭春風',
-u'料峭春寒',
-u'了然不惑',
-u'了然可見',
-u'了然于懷',
-u'了然于胸',
-u'了然于中',
-u'寥如晨星',
-u'燎如觀火',
-u'瞭如指幾',
-u'了如指掌',
-u'寥若晨星',
-u'燎若觀火',
-u'了若指掌',
-u'了身達命',
-u'聊勝一籌',
-u'聊勝于無',
-u'料事如神',
-u'了無遽容',
-u'了無懼色',
-u'了無所見',
-u'撂下耙子就是掃帚',
-u'撩衣奮臂',
-u'聊以解嘲',
-u'撩衣破步',
-u'聊以塞命',
-u'聊以塞責',
-u'聊以自況',
-u'聊以自遣',
-u'聊以自慰',
-u'聊以自娛',
-u'聊以卒歲',
-u'燎原烈火',
-u'料遠若近',
-u'燎原之火',
-u'撩雲撥雨',
-u'埒材角妙',
-u'埒才角妙',
-u'列鼎重裀',
-u'列鼎而食',
-u'烈風峽谷',
-u'列風淫雨',
-u'列功覆過',
-u'裂冠毀冕',
-u'裂冠毀冕拔本塞源',
-u'烈火辨日',
-u'烈火辨玉',
-u'烈火熾翼',
-u'烈火幹柴',
-u'烈火轟雷',
-u'烈火見真金',
-u'烈火烹油',
-u'烈火乾柴',
-u'烈火識真金',
-u'烈火真金',
-u'烈火知真金',
-u'劣迹昭昭',
-u'劣迹昭着',
-u'劣迹昭著',
-u'劣倦罷極',
-u'烈烈轟轟',
-u'獵人高地',
-u'獵人意志',
-u'烈日石居',
-u'烈士暮年',
-u'烈士暮年壯心不已',
-u'烈士徇名',
-u'獵手殘骨',
-u'捩手覆羹',
-u'列土分疆',
-u'裂土分茅',
-u'列土封疆',
-u'裂眦嚼齒',
-u'列祖列宗',
-u'臨別秋波',
-u'臨別贈言',
-u'臨別贈語',
-u'凜不可犯',
-u'臨财不苟',
-u'臨财苟得',
-u'臨财毋苟',
-u'臨池學書',
-u'臨川羨魚',
-u'鱗次相比',
-u'鱗次栉比',
-u'鱗萃比栉',
-u'林大百鳥栖',
-u'林大不過風',
-u'林大風不過',
-u'林大風漸弱',
-u'林大風如堵',
-u'林大風自悄',
-u'林大風自弱',
-u'林大風自微',
-u'林大風自息',
-u'林大好擋風',
-u'林大好抵風',
-u'林大鳥易栖',
-u'林大栖百鳥',
-u'林大養百獸',
-u'臨敵代将',
-u'臨敵賣陣',
-u'臨敵易将',
-u'賃耳傭目',
-u'臨風對月',
-u'麟鳳龜龍',
-u'麟鳳一毛',
-u'麟鳳芝蘭',
-u'鄰父之疑',
-u'麟肝鳳髓',
-u'林寒洞肅',
-u'林寒澗肅',
-u'臨河羨魚',
-u'鱗鴻杳絕',
-u'林喉哨崗',
-u'臨機處置',
-u'鱗集麇至',
-u'鱗集毛萃',
-u'臨機設變',
-u'鱗集仰流',
-u'臨機應變',
-u'臨機辄斷',
-u'臨機制變',
-u'臨機制勝',
-u'麟角鳳距',
-u'麟角鳳毛',
-u'麟角鳳趾',
-u'麟角鳳觜',
-u'麟角虎翅',
-u'臨軍對壘',
-u'臨軍對陣',
-u'臨渇穿井',
-u'臨渇掘井',
-u'臨渇之掘',
-u'林籁泉韻',
-u'琳琅觸目',
-u'琳琅珪璧',
-u'琳琅滿目',
-u'臨老始看經',
-u'淋漓酣暢',
-u'淋漓盡緻',
-u'淋漓痛快',
-u'淋漓透徹',
-u'鄰裏鄉黨',
-u'林林總總',
-u'臨難不避',
-u'臨難不苟',
-u'臨難不顧',
-u'臨難不懼',
-u'臨難不恐',
-u'臨難不屈',
-u'臨難不懾',
-u'臨難苟免',
-u'臨難無苟',
-u'臨難無懾',
-u'臨難鑄兵',
-u'鄰女窺牆',
-u'鄰女詈人',
-u'林栖谷隐',
-u'臨期失誤',
-u'臨去秋波',
-u'凜如霜雪',
-u'凜若冰霜',
-u'凜若秋霜',
-u'林深藏珍禽',
-u'林深伏猛獸',
-u'臨深履冰',
-u'臨深履薄',
-u'臨時抱佛腳',
-u'臨事不苟',
-u'臨事而懼',
-u'臨食廢箸',
-u'臨事屢斷',
-u'臨時磨槍',
-u'臨時施宜',
-u'臨水登山',
-u'臨死不恐',
-u'臨死不怯',
-u'臨潼鬥寶',
-u'麟吐玉書',
-u'臨危不顧',
-u'臨危不懼',
-u'臨危不撓',
-u'臨危蹈難',
-u'臨危履冰',
-u'臨危受命',
-u'臨危下石',
-u'臨危效命',
-u'臨危制變',
-u'臨危緻命',
-u'臨危自悔',
-u'臨危自計',
-u'臨危自省',
-u'臨文不諱',
-u'林下風度',
-u'林下風範',
-u'林下風氣',
-u'林下風韻',
-u'林下風緻',
-u'林下高風',
-u'林下清風',
-u'林下之風',
-u'鱗須洞穴',
-u'鱗須海龜',
-u'臨崖勒馬',
-u'臨崖失馬',
-u'臨噎掘井',
-u'臨噎之掘',
-u'鱗翼風蛇',
-u'鱗翼岩床',
-u'林蔭小徑',
-u'凜有生氣',
-u'臨淵結網',
-u'臨淵履冰',
-u'臨淵羨魚',
-u'臨淵之羨',
-u'臨陣代将',
-u'臨陣磨刀',
-u'臨陣磨槍',
-u'臨陣退縮',
-u'臨陣脫逃',
-u'麟趾呈祥',
-u'林中樹居',
-u'麟子鳳雛',
-u'淩波微步',
-u'令不虛行',
-u'淩遲重辟',
-u'令出必行',
-u'另楚寒巫',
-u'令出如山',
-u'令出惟行',
-u'零打碎敲',
-u'靈丹妙藥',
-u'靈丹聖藥',
-u'零丁孤苦',
-u'陵谷變遷',
-u'陵谷滄桑',
-u'陵谷遷變',
-u'陵谷之變',
-u'零光片羽',
-u'零圭斷璧',
-u'令輝星際',
-u'令骥捕鼠',
-u'靈機一動',
-u'菱角磨作雞頭',
-u'陵勁淬砺',
-u'另開生面',
-u'靈利不過光棍',
-u'伶俐乖巧',
-u'陵厲雄健',
-u'泠泠不絕',
-u'零零星星',
-u'玲珑剔透',
-u'玲珑透漏',
-u'玲珑小巧',
-u'零亂不堪',
-u'淩亂無章',
-u'绫羅綢緞',
-u'零落山丘',
-u'令名不終',
-u'另謀高就',
-u'另辟蹊徑',
-u'零七八碎',
-u'另起樓台',
-u'另起爐竈',
-u'陵遷谷變',
-u'零敲碎打',
-u'零敲碎受',
-u'另請高明',
-u'令人齒冷',
-u'令人發豎',
-u'令人發指',
-u'令人費解',
-u'令人滿意',
-u'令人莫測',
-u'令人難忘',
-u'令人噴飯',
-u'令人捧腹',
-u'令人起敬',
-u'令人切齒',
-u'令人深思',
-u'令人神往',
-u'令人咋舌',
-u'令人注目',
-u'令人作哎',
-u'令人作嘔',
-u'陵弱暴寡',
-u'陵上虐下',
-u'另生枝節',
-u'陵土未幹',
-u'令聞廣譽',
-u'令聞嘉譽',
-u'令聞令望',
-u'陵宵之志',
-u'靈心慧齒',
-u'靈心慧性',
-u'另行高就',
-u'令行禁止',
-u'令行如流',
-u'伶牙俐齒',
-u'伶牙利爪',
-u'伶牙利嘴',
-u'另眼看承',
-u'另眼看待',
-u'另眼看戲',
-u'另眼相待',
-u'另眼相看',
-u'羚羊挂角',
-u'領異标新',
-u'另一個問題',
-u'陵移谷變',
-u'陵移谷遷',
-u'令儀令色',
-u'聆音察理',
-u'另有洞天',
-u'囹圄充積',
-u'囹圄空虛',
-u'囹圄生草',
-u'令原之戚',
-u'鴒原之情',
-u'令月吉日',
-u'淩雲意氣',
-u'淩雲之氣',
-u'淩雲之志',
-u'淩雲壯志',
-u'淩雜米鹽',
-u'零珠斷璧',
-u'零珠片玉',
-u'零珠碎玉',
-u'柳暗花明',
-u'柳暗花明又一村',
-u'柳暗花遮',
-u'留白墜子',
-u'瘤背複仇',
-u'流杯曲水',
-u'劉備失箸',
-u'六臂三頭',
-u'流波送盼',
-u'六朝金粉',
-u'六朝脂粉',
-u'六塵不染',
-u'六尺之孤',
-u'六尺之讬',
-u'柳寵花迷',
-u'六出冰花',
-u'六畜不安',
-u'六出紛飛',
-u'六出奇計',
-u'六畜興旺',
-u'柳鹑莺嬌',
-u'流蕩忘反',
-u'流宕忘歸',
-u'六道輪回',
-u'留得青山在',
-u'留得青山在不愁沒柴燒',
-u'留得青山在不怕沒柴燒',
-u'留得五湖明月在',
-u'六丁長錘',
-u'留犢淮南',
-u'流遁忘返',
-u'柳亸花嬌',
-u'柳亸莺嬌',
-u'六耳不傳',
-u'流芳百世',
-u'流芳後世',
-u'流芳千古',
-u'流芳千載',
-u'流芳萬古',
-u'流芳遺臭',
-u'流風回雪',
-u'流風遺迹',
-u'流風遺烈',
-u'流風遺俗',
-u'流風遺韻',
-u'流風遺澤',
-u'流風遺躅',
-u'流風馀俗',
-u'流風馀韻',
-u'留輔太子監國',
-u'六根皆淨',
-u'六根清靜',
-u'六宮粉黛',
-u'柳骨顔筋',
-u'流光如箭',
-u'流光如駛',
-u'流光瞬息',
-u'流汗浃背',
-u'六合之内',
-u'柳戶花門',
-u'柳昏花螟',
-u'六甲長錘',
-u'柳嬌花媚',
-u'柳街花巷',
-u'六街九陌',
-u'柳街柳陌',
-u'六街三陌',
-u'六街三市',
-u'流金铄石',
-u'六經三史',
-u'流景揚輝',
-u'六經注我',
-u'流口常談',
-u'流寇棍棒',
-u'流脍人口',
-u'流浪狙鼠',
-u'劉郎前度',
-u'流離播遷',
-u'流離播越',
-u'流離顛頓',
-u'流離顛沛',
-u'流離顛疐',
-u'流離失所',
-u'流離瑣尾',
-u'流離轉徙',
-u'留連不舍',
-u'流連光景',
-u'流連難舍',
-u'流連忘返',
-u'六六大順',
-u'流落不偶',
-u'留落不遇',
-u'流落風塵',
-u'流落江湖',
-u'流落失所',
-u'流落他鄉',
-u'流落天涯',
-u'流落異鄉',
-u'柳綠花紅',
-u'柳綠桃紅',
-u'六馬仰秣',
-u'六脈調和',
-u'柳眉倒豎',
-u'柳媚花明',
-u'柳眉踢豎',
-u'柳眉星眼',
-u'柳門竹巷',
-u'柳陌花叢',
-u'柳陌花街',
-u'柳陌花衢',
-u'柳陌花巷',
-u'柳南續筆',
-u'流溺忘反',
-u'流年不利',
-u'流年似水',
-u'柳暖花春',
-u'柳泣花啼',
-u'六親不認',
-u'六親同運',
-u'六親無靠',
-u'流慶百世',
-u'柳衢花市',
-u'六趣輪回',
-u'柳弱花嬌',
-u'六神不安',
-u'六神無主',
-u'柳聖花神',
-u'柳市花街',
-u'六十年的變遷',
-u'六十騎爲一輩',
-u'柳樹上着刀桑樹上出血',
-u'流水不腐',
-u'流水不腐戶樞不蠹',
-u'流水不腐戶樞不蝼',
-u'流水朝宗',
-u'流水朝宗流血成河',
-u'流水高山',
-u'流水落花',
-u'流水前波讓後波',
-u'流水淘沙',
-u'流水淘沙不暫停',
-u'流水無情',
-u'流水下灘非有意',
-u'流水行雲',
-u'流水遊龍',
-u'六韬三略',
-u'柳啼花怨',
-u'流涕痛哭',
-u'流天澈地',
-u'六通四達',
-u'六通四辟',
-u'六微旨大論',
-u'六問三推',
-u'柳下借陰',
-u'流涎咽唾',
-u'柳巷花街',
-u'流星掣電',
-u'流星飛電',
-u'流星趕月',
-u'流行坎止',
-u'流星碎片',
-u'柳絮才高',
-u'溜須拍馬',
-u'流血成渠',
-u'流血浮丘',
-u'流血浮屍',
-u'流血漂杵',
-u'流血漂鹵',
-u'流血千裏',
-u'流言飛文',
-u'流言蜚語',
-u'流言風語',
-u'柳煙花霧',
-u'流言混話',
-u'流言混語',
-u'流言惑衆',
-u'流言流說',
-u'流言止于智者',
-u'六陽會首',
-u'六陽魁首',
-u'六陽首級',
-u'柳腰花态',
-u'柳腰蓮臉',
-u'柳夭桃豔',
-u'柳葉雙刀',
-u'劉毅答诏',
-u'流移失所',
-u'柳營花市',
-u'柳莺花燕',
-u'柳影花陰',
-u'柳營花陣',
-u'留有餘地',
-u'流寓失所',
-u'留與子孫耕',
-u'六月飛霜',
-u'六月連陰',
-u'六月債還得快',
-u'柳折花殘',
-u'溜之大吉',
-u'溜之乎也',
-u'留中不出',
-u'留中不發',
-u'留中不下',
-u'龍标奪歸',
-u'龍泊釣鳌',
-u'龍馳虎驟',
-u'龍雛鳳種',
-u'龍刺裹布',
-u'龍德在田',
-u'龍雕鳳咀',
-u'龍鬥虎傷苦了小獐',
-u'龍斷可登',
-u'龍斷之登',
-u'龍蹲虎踞',
-u'龍多乃旱',
-u'隆恩曠典',
-u'龍幡虎纛',
-u'龍飛鳳起',
-u'龍飛鳳舞',
-u'龍飛鳳翔',
-u'龍飛鳳翥',
-u'龍飛虎跳',
-u'龍鳳呈祥',
-u'龍肝豹胎',
-u'龍肝鳳膽',
-u'龍肝鳳腦',
-u'龍肝鳳髓',
-u'隆古贱今',
-u'龍歸大海',
-u'龍鬼蛇神',
-u'龍歸晚洞雲猶濕',
-u'龍過鼠年',
-u'龍翰鳳雛',
-u'龍翰鳳翼',
-u'龍虎風雲',
-u'龍胡之痛',
-u'龍化虎變',
-u'龍荒蠻甸',
-u'龍荒朔漠',
-u'龍魂墜飾',
-u'龍基特陶',
-u'龍江虎浪',
-u'龍傑鍍飾',
-u'籠街喝道',
-u'龍筋弓弦',
-u'龍筋箭袋',
-u'龍筋絞絲',
-u'龍精虎猛',
-u'龍駒鳳雛',
-u'龍舉雲興',
-u'龍舉雲屬',
-u'龍樓鳳城',
-u'龍樓鳳池',
-u'龍樓鳳閣',
-u'龍樓鳳阙',
-u'龍顱小徑',
-u'龍顱之橋',
-u'籠絡人心',
-u'龍馬精神',
-u'龍眉豹頸',
-u'龍眉鳳目',
-u'龍眉皓發',
-u'龍門點額',
-u'龍鳴獅吼',
-u'壟畝之臣',
-u'龍拏虎攫',
-u'龍拏虎跳',
-u'龍拏虎躍',
-u'龍拏虎擲',
-u'籠鳥池魚',
-u'籠鳥檻猿',
-u'龍女有十八變',
-u'龍攀鳳附',
-u'龍蟠鳳舞',
-u'龍蟠鳳逸',
-u'龍蟠鳳翥',
-u'龍蟠虎伏',
-u'龍蟠虎踞',
-u'龍盤虎拏',
-u'龍蟠虎繞',
-u'龍蟠虬結',
-u'龍皮帽檐',
-u'龍皮罩帽',
-u'龍潛鳳采',
-u'聾情盛意',
-u'龍去鼎湖',
-u'龍屈蛇伸',
-u'龍跧虎卧',
-u'龍人之槌',
-u'龍人之盾',
-u'龍山落帽',
-u'龍蛇不辨',
-u'龍蛇飛動',
-u'龍蛇飛舞',
-u'龍蛇混合',
-u'龍蛇混雜',
-u'龍蛇雜處',
-u'龍伸蠖屈',
-u'龍神馬壯',
-u'龍生九種',
-u'龍生九子',
-u'龍生九子各有所好',
-u'龍生龍鳳生鳳',
-u'龍生龍子',
-u'龍首豕足',
-u'龍潭虎窟',
-u'龍潭虎穴',
-u'龍韬豹略',
-u'龍韬虎略',
-u'龍騰豹變',
-u'龍騰鳳飛',
-u'龍騰鳳集',
-u'龍騰虎蹴',
-u'龍騰虎踞',
-u'龍騰虎嘯',
-u'龍騰虎躍',
-u'龍騰虎踯',
-u'龍騰戰盔',
-u'龍跳虎伏',
-u'龍跳虎卧',
-u'龍統天下',
-u'龍頭鋸角',
-u'龍頭蛇尾',
-u'隴頭音信',
-u'龍威虎震',
-u'龍威燕颔',
-u'龍骧豹變',
-u'龍骧鳳矯',
-u'龍翔鳳舞',
-u'龍翔鳳躍',
-u'龍翔鳳翥',
-u'龍骧虎步',
-u'龍骧虎視',
-u'龍骧虎嘯',
-u'龍翔虎躍',
-u'龍骧虎跱',
-u'龍骧蠖屈',
-u'龍骧麟振',
-u'龍心鳳肝',
-u'龍心項鏈',
-u'龍興鳳舉',
-u'龍行虎變',
-u'龍行虎步',
-u'隆刑峻法',
-u'龍性難馴',
-u'龍興雲屬',
-u'龍須香囊',
-u'龍言鳳語',
-u'龍顔鳳姿',
-u'龍炎之石',
-u'龍陽泣魚',
-u'龍隐弓墜',
-u'龍吟虎嘯',
-u'龍鷹雛鳥',
-u'龍遊淺水遭蝦戲',
-u'龍遊曲沼',
-u'龍馭賓天',
-u'龍馭上賓',
-u'龍淵虎穴',
-u'龍躍鳳鳴',
-u'龍躍鴻矯',
-u'龍躍虎踞',
-u'龍躍虎卧',
-u'龍躍雲津',
-u'龍戰虎争',
-u'龍戰玄黃',
-u'龍戰魚駭',
-u'龍戰之野',
-u'龍章鳳彩',
-u'龍章鳳函',
-u'龍章鳳姿',
-u'龍章麟角',
-u'龍章秀骨',
-u'籠罩陰影',
-u'龍蟄蠖屈',
-u'聾者之歌',
-u'龍争虎鬥',
-u'龍睜虎眼',
-u'龍争虎戰',
-u'龍鍾老态',
-u'龍鍾潦倒',
-u'籠中窮鳥',
-u'籠中之鳥',
-u'聾子耳朵',
-u'龍姿鳳采',
-u'龍子之鱗',
-u'镂冰炊礫',
-u'镂冰雕瓊',
-u'镂冰雕朽',
-u'镂冰雕脂',
-u'镂冰劚雪',
-u'镂彩摛文',
-u'镂塵吹影',
-u'露出馬腳',
-u'露出破綻',
-u'樓船箫鼓',
-u'漏洞百出',
-u'漏脯充饑',
-u'镂肝鉥腎',
-u'樓高仗基深',
-u'樓閣台榭',
-u'樓閣亭台',
-u'镂骨銘肌',
-u'镂骨銘心',
-u'镂簋朱紘',
-u'漏虀搭菜',
-u'镂金錯采',
-u'漏盡更闌',
-u'镂金鋪翠',
-u'漏盡鍾鳴',
-u'蝼孔崩城',
-u'露面抛頭',
-u'陋室空堂',
-u'樓台殿閣',
-u'樓台亭閣',
-u'漏網遊魚',
-u'漏網之魚',
-u'漏翁沃焦釜',
-u'陋巷菜羹',
-u'陋巷箪瓢',
-u'陋巷蓬門',
-u'漏泄春光',
-u'漏泄天機',
-u'镂心刻骨',
-u'镂心嘔血',
-u'镂心鉥肝',
-u'漏眼不藏絲',
-u'蝼蟻得志',
-u'蝼蟻尚且貪生',
-u'蝼蟻貪生',
-u'蝼蟻之誠',
-u'镂玉裁冰',
-u'镂月裁雲',
-u'镂脂翦楮',
-u'漏卮難滿',
-u'盧安荒野',
-u'盧安鴉巢',
-u'路不拾遺',
-u'露才揚己',
-u'露餐風宿',
-u'路長日暮',
-u'露鈔雪纂',
-u'鹿車共挽',
-u'露出了狐狸尾巴',
-u'露膽披誠',
-u'露膽披肝',
-u'路斷人稀',
-u'路逢俠客須呈劍',
-u'路逢險處難回避',
-u'路逢窄道',
-u'陸海潘江',
-u'六合時邕',
-u'六合同風',
-u'露紅煙綠',
-u'露紅煙紫',
-u'露華腰飾',
-u'爐火純青',
-u'露己揚才',
-u'路見不平',
-u'路見不平拔刀相救',
-u'路見不平拔刀相助',
-u'路見不平拔刀助',
-u'路見不平拔劍相助',
-u'魯斤燕削',
-u'路絕人稀',
-u'盧卡中尉',
-u'鲈脍蓴羹',
-u'鹿盔崗哨',
-u'陸離斑駁',
-u'陸離光怪',
-u'戮力齊心',
-u'戮力同德',
-u'戮力同心',
-u'戮力一心',
-u'戮力一意',
-u'魯連蹈海',
-u'陸梁放肆',
-u'綠林大盜',
-u'綠林大學',
-u'綠林好漢',
-u'綠林豪傑',
-u'綠林豪客',
-u'綠林豪士',
-u'綠林強盜',
-u'路柳牆花',
-u'碌碌波波',
-u'碌碌寡合',
-u'碌碌無才',
-u'碌碌無能',
-u'碌碌無奇',
-u'碌碌無爲',
-u'碌碌無聞',
-u'碌碌庸才',
-u'碌碌庸流',
-u'碌碌之輩',
-u'碌碌終身',
-u'擄掠奸淫',
-u'魯莽從事',
-u'鹵莽滅裂',
-u'魯難未已',
-u'魯女泣荊',
-u'路旁行李',
-u'鹭朋鷗侶',
-u'盧前王後',
-u'鹿裘不完',
-u'魯人回日',
-u'路人皆知',
-u'路人睚眦',
-u'露人眼目',
-u'廬山面目',
-u'廬山真面',
-u'廬山真面目',
-u'廬山正面目',
-u'廬山之真',
-u'路上說話草裏有人',
-u'路上行人口似碑',
-u'盧生之夢',
-u'露水夫妻',
-u'露水夫妻也是前緣分定',
-u'鹿死不擇蔭',
-u'鹿死誰手',
-u'路叟之憂',
-u'露宿風餐',
-u'魯肅指囷',
-u'露往霜來',
-u'露尾藏頭',
-u'蘆葦海灘',
-u'蘆葦哨崗',
-u'魯衛之政',
-u'祿無常家福無定門',
-u'路無拾遺',
-u'爐賢嫉能',
-u'擄袖揎拳',
-u'鹭序鴛行',
-u'鹿馴豕暴',
-u'魯陽麾戈',
-u'魯陽回日',
-u'魯陽指日',
-u'路遙知馬力',
-u'路遙知馬力日久見人心',
-u'路遙知馬力事久見人心',
-u'露影藏形',
-u'露營小刀',
-u'路有凍死骨',
-u'魯魚帝虎',
-u'魯魚亥豕',
-u'魯魚陶陰',
-u'路遠迢迢',
-u'鹭約鷗盟',
-u'陸詟水栗',
-u'鹿走蘇台',
-u'露纂雪鈔',
-u'鸾翺鳳翥',
-u'亂棒胡枷',
-u'亂棒胡敲',
-u'亂草敗莊稼',
-u'亂臣逆子',
-u'鸾臣賊子',
-u'亂臣賊子人人得而誅之',
-u'亂齒土狼',
-u'鸾俦鳳侶',
-u'鸾顛鳳倒',
-u'亂點鴛鴦',
-u'亂蝶狂蜂',
-u'鸾飛鳳舞',
-u'鸾飛鳳翥',
-u'鸾分鳳離',
-u'鸾鳳分飛',
-u'鸾鳳和鳴',
-u'鸾鳳齊鳴',
-u'卵覆鳥飛',
-u'鸾歌鳳吹',
-u'鸾歌鳳舞',
-u'鸾孤鳳寡',
-u'鸾孤鳳隻',
-u'鸾鹄停峙',
-u'鸾鹄在庭',
-u'鸾回鳳翥',
-u'亂極思治',
-u'亂極則平',
-u'亂加幹涉',
-u'亂箭穿心',
-u'亂箭攢心',
-u'鸾交鳳俦',
-u'鸾膠鳳絲',
-u'鸾交鳳友',
-u'亂嚼舌頭',
-u'鸾膠再續',
-u'亂離多阻',
-u'亂倫敗德',
-u'鸾鳴鳳奏',
-u'鸾飄鳳泊',
-u'亂七八遭',
-u'鸾跂鴻驚',
-u'亂瓊碎玉',
-u'亂拳打死老師傅',
-u'卵石不敵',
-u'亂世生英雄',
-u'亂世兇年',
-u'亂世英雄',
-u'亂世賊子',
-u'亂世之秋',
-u'亂世之音',
-u'亂首垢面',
-u'亂俗傷風',
-u'鸾停鹄峙',
-u'亂頭粗服',
-u'鸾翔鳳集',
-u'鸾翔鳳翥',
-u'鸾枭并栖',
-u'卵翼之恩',
-u'鸾吟鳳唱',
-u'鸾音鶴信',
-u'鸾輿鳳駕',
-u'亂羽高地',
-u'亂語胡言',
-u'卵與石鬥',
-u'鸾隻鳳單',
-u'亂墜天花',
-u'鸾姿鳳态',
-u'亂作胡爲',
-u'亂作蕭牆',
-u'亂作一團',
-u'掠地攻城',
-u'略地侵城',
-u'略高一籌',
-u'略迹論心',
-u'略迹原情',
-u'略迹原心',
-u'略見一斑',
-u'掠盡風光',
-u'略窺一斑',
-u'掠美市恩',
-u'掠人之美',
-u'略勝一籌',
-u'掠是搬非',
-u'略識之無',
-u'掠天翼龍',
-u'略無參商',
-u'略無忌憚',
-u'略遜一籌',
-u'掠影浮光',
-u'略知皮毛',
-u'掠脂斡肉',
-u'略知一二',
-u'論辯風生',
-u'輪扁斫輪',
-u'論長道短',
-u'論長說短',
-u'論道經邦',
-u'論德酬功',
-u'倫德瑪克',
-u'論德使能',
-u'論短道長',
-u'論甘忌辛',
-u'論高寡合',
-u'論功封賞',
-u'論功受賞',
-u'論功行封',
-u'論功行賞',
-u'論古比今',
-u'論顧陸張吳用筆',
-u'論古商今',
-u'論黃數白',
-u'論黃數黑',
-u'淪肌浃骨',
-u'淪肌浃随',
-u'淪浃肌髓',
-u'論斤估兩',
-u'論今說古',
-u'論列是非',
-u'輪流做莊',
-u'淪落不偶',
-u'淪落風塵',
-u'掄眉豎目',
-u'論千論萬',
-u'論世知人',
-u'論心定罪',
-u'輪焉奂焉',
-u'論議風生',
-u'論一增十',
-u'綸音佛語',
-u'論資排輩',
-u'落筆點蠅',
-u'落筆千言',
-u'裸臂揎拳',
-u'捋臂張拳',
-u'落草爲盜',
-u'落草爲寇',
-u'裸裎袒裼',
-u'落地生根',
-u'落發爲僧',
-u'羅敷有夫',
-u'落個值過兒',
-u'落戶安家',
-u'落花流水',
-u'落花媒人',
-u'落花時節',
-u'落花頭意',
-u'落花無言',
-u'落花有意',
-u'落花有意流水無情',
-u'落荒而逃',
-u'落荒而走',
-u'落井投石',
-u'落阱下石',
-u'羅掘俱窮',
-u'羅掘一空',
-u'落雷之雲',
-u'落落不偶',
-u'落落晨星',
-u'荦荦大端',
-u'落落大方',
-u'荦荦大者',
-u'落落寡合',
-u'落落寡歡',
-u'落落寡交',
-u'落落穆穆',
-u'落落難合',
-u'荦荦确确',
-u'落落之譽',
-u'落帽孟嘉',
-u'落寞寡歡',
-u'落魄不羁',
-u'落魄江湖',
-u'羅鉗吉網',
-u'羅雀掘鼠',
-u'落人窠臼',
-u'落人口實',
-u'落人笑柄',
-u'落日高原',
-u'落日餘晖',
-u'落蓐之身',
-u'落湯螃蟹',
-u'羅天大醮',
-u'落拓不羁',
-u'落魄不偶',
-u'落霞殘照',
-u'裸袖揎拳',
-u'裸袖揎衣',
-u'落雁沉魚',
-u'洛陽才子',
-u'洛陽紙貴',
-u'落葉歸根',
-u'落葉知秋',
-u'駱驿不絕',
-u'落英缤紛',
-u'落月屋梁',
-u'羅織構陷',
-u'落紙如飛',
-u'落紙煙雲',
-u'羅之一目',
-u'落紙雲煙',
-u'羅織罪名',
-u'洛鍾東應',
-u'綠暗紅稀',
-u'呂安題風',
-u'驢背成詩',
-u'屢變星霜',
-u'綠鬓紅顔',
-u'綠鬓朱顔',
-u'履薄臨深',
-u'慮不及遠',
-u'綠慘紅愁',
-u'綠慘紅銷',
-u'綠草如茵',
-u'履穿踵決',
-u'驢唇不對馬嘴',
-u'驢唇馬觜',
-u'驢唇馬嘴',
-u'屢次三番',
-u'綠帶草地',
-u'呂端大事不糊塗',
-u'綠肥紅瘦',
-u'驢糞球兒外面光',
-u'綠光飛鷹',
-u'履機乘變',
-u'屢見不鮮',
-u'屢見疊出',
-u'屢建奇功',
-u'屢教不改',
-u'屢戒不悛',
-u'旅進旅退',
-u'綠酒紅燈',
-u'褛褴箪瓢',
-u'綠瘤束帶',
-u'綠馬仰秣',
-u'驢蒙虎皮',
-u'驢蒙獅皮',
-u'驢鳴狗吠',
-u'驢鳴狗叫',
-u'驢鳴牛吠',
-u'驢鳴犬吠',
-u'驢年馬月',
-u'綠女紅男',
-u'驢前馬後',
-u'履仁蹈義',
-u'驢生戟角',
-u'屢試不爽',
-u'履石渡水',
-u'屢試屢驗',
-u'履霜堅冰',
-u'履霜知冰',
-u'履霜之漸',
-u'履霜之戒',
-u'綠水青山',
-u'履絲曳缟',
-u'綠松墜子',
-u'綠蓑青笠',
-u'履湯蹈火',
-u'驢頭不對馬嘴',
-u'慮無不周',
-u'呂武操莽',
-u'履舄交錯',
-u'縷析條分',
-u'履險蹈難',
-u'履險蹈危',
-u'履險犯難',
-u'履險如夷',
-u'履險若夷',
-u'闾巷草野',
-u'驢心狗肺',
-u'履信思順',
-u'闾閻安堵',
-u'闾閻撲地',
-u'綠葉成蔭',
-u'綠葉裹手',
-u'律義雖遠人情可推',
-u'履盈蹈滿',
-u'屢戰屢敗',
-u'屢戰屢北',
-u'屢戰屢捷',
-u'慮周行果',
-u'慮周藻密',
-u'履足差肩',
-u'麻痹不仁',
-u'麻痹大意',
-u'麻痹毒藥',
-u'麻痹之毒',
-u'馬勃牛溲',
-u'馬不解鞍',
-u'罵不絕口',
-u'馬不停蹄',
-u'馬塵不及',
-u'馬遲枚疾',
-u'馬遲枚速',
-u'馬到成功',
-u'馬到功成',
-u'馬道是瞻',
-u'馬耳春風',
-u'馬耳東風',
-u'馬耳秋風',
-u'馬耳射東',
-u'馬兒往西行',
-u'馬煩人怠',
-u'馬翻人仰',
-u'馬放南山',
-u'馬肥人壯',
-u'麻風侏儒',
-u'馬腹逃鞭',
-u'馬革裹屍',
-u'馬革裏屍',
-u'馬革盛屍',
-u'麻姑獻壽',
-u'麻姑擲豆',
-u'麻姑擲米',
-u'馬後車前',
-u'螞蝗見血',
-u'馬迹蛛絲',
-u'馬角烏白',
-u'馬角烏頭',
-u'馬困人乏',
-u'麻林不仁',
-u'馬龍車水',
-u'馬鹿異形',
-u'馬馬虎虎',
-u'馬毛蝟磔',
-u'馬面牛頭',
-u'罵名千古',
-u'麻木不仁',
-u'麻木之痛',
-u'麻木重擊',
-u'馬牛襟裾',
-u'馬牛裾襟',
-u'馬牛其風',
-u'馬牛如襟裾',
-u'螞蚍叮腿',
-u'馬屁拍在馬腿上',
-u'馬疲人倦',
-u'馬前潑水',
-u'馬去馬歸',
-u'麻雀雖小',
-u'麻雀雖小肝膽俱全',
-u'麻雀雖小五髒俱全',
-u'麻雀雖小五髒全',
-u'罵人不揭短',
-u'罵人三日羞',
-u'馬入華山',
-u'馬如流水',
-u'馬如遊龍',
-u'馬如遊魚',
-u'摩挲賞鑒',
-u'馬善被人騎',
-u'馬上得天下',
-u'馬上功成',
-u'馬上看花',
-u'馬上牆頭',
-u'馬瘦毛長',
-u'馬首靡托',
-u'馬首前瞻',
-u'馬首是瞻',
-u'馬首欲東',
-u'馬水車龍',
-u'馬嘶人語',
-u'罵天扯地',
-u'罵天咒地',
-u'馬頭覓角',
-u'馬王堆一号漢墓帛畫',
-u'馬無野草不肥',
-u'馬舞之災',
-u'麻屣鹑衣',
-u'馬行無力皆因瘦',
-u'馬咽車阗',
-u'馬仰人翻',
-u'螞蟻緣槐',
-u'麻油拌韭菜個人心裏愛',
-u'馬中關五',
-u'麻中之蓬',
-u'馬壯兵強',
-u'馬壯人強',
-u'馬足車塵',
-u'馬足龍沙',
-u'麻醉毒藥',
-u'賣蔔測字',
-u'賣菜求益',
-u'賣茶賣酒',
-u'買車容易養車難',
-u'買臣覆水',
-u'賣刀買犢',
-u'賣刀買牛',
-u'買東買西',
-u'買椟還珠',
-u'買犢賣刀',
-u'買椟之見',
-u'賣惡于人',
-u'埋而掘之',
-u'賣兒賣女',
-u'賣兒貼婦',
-u'賣兒鬻女',
-u'賣法市恩',
-u'麥飯豆羹',
-u'賣富差貧',
-u'埋杆豎柱',
-u'賣功邀賞',
-u'賣公營私',
-u'賣狗懸羊',
-u'邁古超今',
-u'埋骨之地',
-u'賣瓜的不說瓜苦',
-u'賣乖弄俏',
-u'賣官販爵',
-u'賣官賣爵',
-u'買官鬻爵',
-u'賣官鬻獄',
-u'賣國求利',
-u'賣國求榮',
-u'賣國賊臣',
-u'買歡追笑',
-u'賣劍買犢',
-u'買贱賣貴',
-u'賣劍買牛',
-u'賣劍買琴',
-u'賣漿屠狗',
-u'賣漿屠沽',
-u'買金偏撞不着賣金的',
-u'買靜求安',
-u'買爵販官',
-u'賣爵鬻官',
-u'賣爵鬻子',
-u'賣爵贅子',
-u'買空賣空',
-u'買犁賣劍',
-u'賣李鑽核',
-u'買鄰千萬',
-u'埋輪破柱',
-u'脈絡分明',
-u'脈絡貫通',
-u'賣履分香',
-u'脈碼調制',
-u'買馬招兵',
-u'買馬招軍',
-u'買賣不成仁義在',
-u'買賣公平',
-u'買賣行貨',
-u'買賣好做夥計難搭',
-u'脈脈相通',
-u'買米下鍋',
-u'埋名更姓',
-u'埋名隐姓',
-u'賣男鬻女',
-u'買牛賣劍',
-u'買牛息戈',
-u'賣弄風騷',
-u'賣弄國恩',
-u'賣弄俊悄',
-u'賣弄口舌',
-u'賣弄玄虛',
-u'賣妻鬻子',
-u'賣俏行奸',
-u'賣俏倚門',
-u'賣俏營奸',
-u'買上告下',
-u'買上囑下',
-u'賣身求榮',
-u'賣身投靠',
-u'埋聲晦迹',
-u'麥穗兩岐',
-u'買田不買糧嫁女不嫁娘',
-u'買田陽羨',
-u'買鐵思金',
-u'埋頭财主',
-u'埋頭顧影',
-u'埋頭苦幹',
-u'賣頭賣腳',
-u'埋頭埋腦',
-u'買王得羊',
-u'賣文爲活',
-u'賣文爲生',
-u'買鹹魚放生',
-u'賣笑生涯',
-u'賣笑爲生',
-u'買笑尋歡',
-u'買笑迎歡',
-u'買笑追歡',
-u'麥秀兩岐',
-u'麥秀黍離',
-u'麥秀之悲',
-u'麥秀之歎',
-u'買一個饒一個',
-u'賣友求榮',
-u'賣獄鬻官',
-u'賣杖搖鈴',
-u'賣陣之計',
-u'麥舟之惠',
-u'麥舟之贈',
-u'賣主求榮',
-u'賣嘴料舌',
-u'漫不加意',
-u'蠻不講理',
-u'漫不經心',
-u'謾不經意',
-u'滿不在乎',
-u'滿不在意',
-u'謾藏誨盜',
-u'慢藏冶容',
-u'蔓草寒煙',
-u'蔓草荒煙',
-u'蔓草難除',
-u'漫長歲月',
-u'滿車而歸',
-u'漫塵盆地',
-u'滿城風雨',
-u'滿城桃李',
-u'蠻觸紛挐',
-u'蠻觸幹戈',
-u'蠻觸相争',
-u'蠻觸之争',
-u'滿床疊笏',
-u'蠻錘部族',
-u'蠻錘要塞',
-u'謾辭譁說',
-u'滿打滿算',
-u'漫誕不稽',
-u'滿地揀芝麻整簍灑油',
-u'漫地漫天',
-u'滿肚疑團',
-u'滿而不溢',
-u'漫反射光',
-u'蠻風瘴雨',
-u'滿腹長才',
-u'滿腹狐疑',
-u'滿腹經籍',
-u'滿腹經綸',
-u'滿腹牢騷',
-u'滿腹明玑',
-u'滿腹詩書',
-u'滿腹文章',
-u'滿腹疑團',
-u'滿腹珠玑',
-u'蠻幹攻擊',
-u'滿谷滿坑',
-u'蠻橫無理',
-u'滿懷心腹事盡在不言中',
-u'蠻荒海岸',
-u'蠻荒瘴疠',
-u'蠻荒之葉',
-u'蠻箋象管',
-u'滿坑滿谷',
-u'滿口答應',
-u'蠻來生作',
-u'颟裏颟顸',
-u'滿臉春風',
-u'滿臉春色',
-u'滿臉堆笑',
-u'慢橹搖船捉醉魚',
-u'謾罵叫嚣',
-u'蔓蔓日茂',
-u'滿門喜慶',
-u'滿門英烈',
-u'滿面春風',
-u'滿面含春',
-u'滿面紅光',
-u'滿面怒容',
-u'滿面生春',
-u'滿面生花',
-u'滿面笑容',
-u'滿面羞慚',
-u'滿面羞愧',
-u'滿面征塵',
-u'滿目創痍',
-u'滿目荊榛',
-u'滿目琳琅',
-u'滿目凄怆',
-u'滿目凄涼',
-u'滿目青山',
-u'滿目秋色',
-u'滿目蕭然',
-u'滿盤皆輸',
-u'滿盤托出',
-u'滿腔熱忱',
-u'滿腔熱血',
-u'滿腔熱枕',
-u'漫山遍嶺',
-u'滿山遍野',
-u'滿山滿谷',
-u'漫山塞野',
-u'謾上不謾下',
-u'瞞上欺下',
-u'滿舌生花',
-u'瞞神弄鬼',
-u'滿身是膽',
-u'滿身是口',
-u'瞞神吓鬼',
-u'慢聲細語',
-u'慢速郵遞',
-u'滿堂金玉',
-u'慢騰斯禮',
-u'漫天蔽日',
-u'漫天蔽野',
-u'漫天遍地',
-u'漫天遍野',
-u'漫天徹地',
-u'漫天大謊',
-u'漫天烽火',
-u'漫天蓋地',
-u'漫天過海',
-u'漫天叫價',
-u'漫天開價',
-u'謾天謾地',
-u'謾天昧地',
-u'漫天塞地',
-u'漫天讨價',
-u'瞞天席地',
-u'滿天星鬥',
-u'漫天掩地',
-u'漫天要價',
-u'漫天要價就地還錢',
-u'埋天怨地',
-u'漫天匝地',
-u'慢條絲禮',
-u'慢條細理',
-u'漫無邊際',
-u'漫無頭緒',
-u'曼舞妖歌',
-u'漫無止境',
-u'滿心歡喜',
-u'謾心昧己',
-u'慢性毒菌',
-u'慢性毒藥',
-u'滿袖春風',
-u'滿眼凄涼',
-u'滿眼韶華',
-u'曼衍魚龍',
-u'蠻煙瘴霧',
-u'蠻煙瘴雨',
-u'蠻夷戎狄',
-u'慢易生憂',
-u'蔓引株求',
-u'滿園春色',
-u'滿載而歸',
-u'瞞在鼓裏',
-u'滿招損謙受益',
-u'蠻珍海錯',
-u'蠻針瞎灸',
-u'蠻争觸鬥',
-u'蠻争觸戰',
-u'滿志躊躇',
-u'滿紙空言',
-u'蠻鬃水井',
-u'滿坐風生',
-u'忙不擇價',
-u'忙不擇路',
-u'芒刺骨斧',
-u'芒刺在背',
-u'芒刺在身',
-u'盲風暴雨',
-u'盲風妒雨',
-u'盲風怪雨',
-u'盲風怪雲',
-u'盲風晦雨',
-u'盲風澀雨',
-u'盲瞽之言',
-u'盲光先知',
-u'芒寒色正',
-u'忙家不會會家不忙',
-u'芒屩布衣',
-u'忙裏偷閑',
-u'氓獠戶歌',
-u'莽鹵滅裂',
-u'茫茫大士',
-u'茫茫蕩蕩',
-u'莽莽廣廣',
-u'芒芒苦海',
-u'忙忙碌碌',
-u'茫茫四海人無數',
-u'茫茫宇宙',
-u'尨眉皓發',
-u'莽眇之鳥',
-u'茫然不解',
-u'茫然不知',
-u'茫然費解',
-u'茫然若迷',
-u'茫然若失',
-u'茫然無知',
-u'芒然自失',
-u'盲人把燭',
-u'盲人得鏡',
-u'盲人扪燭',
-u'盲人摸象',
-u'盲人騎瞎馬',
-u'盲人說象',
-u'盲人瞎馬',
-u'茫如隔世',
-u'忙投急趁',
-u'盲翁扪鑰',
-u'盲翁扪龠',
-u'茫無邊際',
-u'茫無定見',
-u'茫無定向',
-u'茫無端緒',
-u'茫無所知',
-u'茫無頭緒',
-u'茫無涯際',
-u'芒鞋草履',
-u'芒鞋竹笠',
-u'芒鞋竹杖',
-u'盲眼無珠',
-u'盲眼先知',
-u'盲者得鏡',
-u'盲者失杖',
-u'盲者束帶',
-u'忙中出錯',
-u'忙中拾閑',
-u'忙中有錯',
-u'忙中有失',
-u'忙中有序',
-u'茅拔茹連',
-u'毛寶放龜',
-u'貌比潘安',
-u'貌不驚人言不壓衆',
-u'茅椽蓬牖',
-u'茅茨不翦',
-u'茅茨土階',
-u'茅茨之屋',
-u'冒大不韪',
-u'冒镝當鋒',
-u'毛地自容',
-u'耄耋之齡',
-u'矛盾重重',
-u'矛盾相向',
-u'貓兒哭鼠',
-u'毛發不爽',
-u'毛發倒豎',
-u'毛發皆豎',
-u'毛發盡豎',
-u'毛發俱豎',
-u'毛發森豎',
-u'毛發絲粟',
-u'毛發悚立',
-u'毛發聳然',
-u'毛發爲豎',
-u'毛發之功',
-u'毛發直立',
-u'毛紡鬥篷',
-u'茅封草長',
-u'毛風血雨',
-u'冒功邀賞',
-u'毛骨俱竦',
-u'毛骨森豎',
-u'毛骨森竦',
-u'毛骨聳然',
-u'貌合情離',
-u'貌合情遠',
-u'貌合神離',
-u'貌合心離',
-u'貌合行離',
-u'毛将焉附',
-u'毛舉瘢求',
-u'毛舉疵求',
-u'毛舉縷析',
-u'毛舉庶務',
-u'毛舉細故',
-u'毛舉細事',
-u'毛舉細務',
-u'貓哭老鼠',
-u'毛了毛腳',
-u'貌離神合',
-u'毛裏拖氈',
-u'茂林深篁',
-u'茂林修竹',
-u'茅廬三顧',
-u'冒冒勢勢',
-u'毛毛手腳',
-u'冒名頂替',
-u'冒名頂姓',
-u'貿遷有無',
-u'毛熱火辣',
-u'茅塞頓開',
-u'茅塞頓啓',
-u'毛森骨立',
-u'茅室蓬戶',
-u'貌是情非',
-u'毛施淑姿',
-u'茅室土階',
-u'貌是心非',
-u'茂實英聲',
-u'貓噬鹦鹉',
-u'毛手毛腳',
-u'貿首之雠',
-u'貓鼠不可同穴',
-u'貓鼠同處',
-u'貓鼠同床',
-u'貓鼠同眠',
-u'貓鼠同乳',
-u'貌似心非',
-u'毛遂堕井',
-u'毛遂自薦',
-u'酕醄大醉',
-u'冒天下之大不韪',
-u'貌同心異',
-u'貓尾拌貓飯',
-u'茅屋采椽',
-u'茅屋草舍',
-u'冒險犯難',
-u'茅檐草舍',
-u'茅檐蓬戶',
-u'毛鼬之咬',
-u'卯酉子午',
-u'毛羽零落',
-u'冒雨湯風',
-u'毛羽未豐',
-u'貓嘴裏挖泥鳅',
-u'麽魔小醜',
-u'沒巴沒鼻',
-u'每變愈下',
-u'美不勝錄',
-u'美不勝收',
-u'美不勝書',
-u'沒查沒利',
-u'每朝每日',
-u'每朝逐日',
-u'美疢藥石',
-u'眉蹙春山',
-u'沒大沒小',
-u'眉黛青颦',
-u'昧旦晨興',
-u'昧旦丕顯',
-u'美德善行',
-u'昧地謾天',
-u'眉低眼慢',
-u'沒顛沒倒',
-u'沒法沒天',
-u'每飯不忘',
-u'眉飛目舞',
-u'眉飛色舞',
-u'眉飛眼笑',
-u'眉高眼低',
-u'枚臯詣阙',
-u'媚骨花妖',
-u'美觀大方',
-u'玫瑰凋零',
-u'玫瑰人生',
-u'每行拮據',
-u'眉花眼笑',
-u'美奂美輪',
-u'眉歡眼笑',
-u'沒魂少智',
-u'昧己瞞心',
-u'沒計奈何',
-u'眉尖眼角',
-u'眉睫之禍',
-u'眉睫之間',
-u'眉睫之利',
-u'眉睫之内',
-u'美錦學制',
-u'沒精打采',
-u'美景良辰',
-u'沒精沒彩',
-u'沒精塌彩',
-u'眉開眼笑',
-u'沒可奈何',
-u'每況愈下',
-u'眉來眼去',
-u'眉來語去',
-u'沒狼攆狼',
-u'沒裏沒外',
-u'昧利忘義',
-u'沒撩沒亂',
-u'沒留沒亂',
-u'美輪美奂',
-u'昧昧芒芒',
-u'沒眉沒眼',
-u'沒沒求活',
-u'眊眊稍稍',
-u'昧昧無聞',
-u'眉目不清',
-u'眉目傳情',
-u'眉目明秀',
-u'眉目清明',
-u'眉目如畫',
-u'眉南面北',
-u'美男破老',
-u'美女破舌',
-u'美女簪花',
-u'沒皮沒臉',
-u'梅妻鶴子',
-u'美其名曰',
-u'美芹之獻',
-u'沒情沒緒',
-u'沒輕沒重',
-u'眉清目秀',
-u'美人遲暮',
-u'美人燈兒',
-u'沒人腳處',
-u'沒仁沒義',
-u'沒日沒夜',
-u'沒日沒月',
-u'每日逐期',
-u'美如冠玉',
-u'美如珠玉',
-u'沒三沒四',
-u'眉梢眼底',
-u'眉梢眼角',
-u'眉梢眼尾',
-u'美食不如飽人餐',
-u'美食不如美器',
-u'沒世不渝',
-u'美事多磨',
-u'美食方丈',
-u'美食甘寝',
-u'沒時沒運',
-u'沒世窮年',
-u'沒世無聞',
-u'沒石飲羽',
-u'媒妁之言',
-u'昧死以聞',
-u'枚速馬工',
-u'眉頭不伸',
-u'眉頭不展',
-u'沒頭蒼蠅',
-u'沒頭公案',
-u'沒頭官司',
-u'沒頭沒臉',
-u'沒頭沒腦',
-u'沒頭脫柄',
-u'眉頭眼尾',
-u'眉頭一展',
-u'眉頭一皺',
-u'眉頭一皺計上心來',
-u'眉頭暫開放',
-u'媚外求榮',
-u'沒完沒了',
-u'眉彎目秀',
-u'沒衛飲羽',
-u'沒屋架梁',
-u'眉舞色飛',
-u'每下愈笃',
-u'每下愈況',
-u'眉笑顔開',
-u'沒心沒想',
-u'昧心蒙面',
-u'美行加人',
-u'美須豪眉',
-u'美言不文',
-u'美言不信',
-u'眉眼傳情',
-u'沒顔落色',
-u'眉眼如畫',
-u'美言市尊',
-u'媚眼做給瞎子看',
-u'眉揚氣吐',
-u'美意延年',
-u'美衣玉食',
-u'梅英初綻',
-u'沒有家賊引不出外鬼來',
-u'眉語目笑',
-u'美雨歐風',
-u'美語甜言',
-u'美玉無瑕',
-u'美玉之玷',
-u'袂雲汗雨',
-u'美中不足',
-u'美馔佳肴',
-u'沒嘴葫蘆',
-u'門不停賓',
-u'門不夜關',
-u'門不夜扃',
-u'門單戶薄',
-u'門殚戶盡',
-u'門當戶對',
-u'門到戶說',
-u'扪躬自劾',
-u'悶海愁山',
-u'門戶洞開',
-u'門戶開放',
-u'門戶匹敵',
-u'門戶人家',
-u'門戶相當',
-u'門戶之見',
-u'門戶之争',
-u'門階戶席',
-u'門禁森嚴',
-u'門堪羅雀',
-u'門可羅雀',
-u'門可張羅',
-u'門闾之望',
-u'門楣倒塌',
-u'悶悶不樂',
-u'門門都好',
-u'門内之口',
-u'門前冷落',
-u'門前如市',
-u'門千萬戶',
-u'門牆桃李',
-u'悶燒餘燼',
-u'扪參曆井',
-u'門生故舊',
-u'門生故吏',
-u'扪虱而談',
-u'扪虱而言',
-u'扪虱傾談',
-u'門衰祚薄',
-u'門庭赫奕',
-u'門庭如市',
-u'門庭若巿',
-u'門庭若市',
-u'門外萬裏',
-u'門外之治',
-u'門無停客',
-u'門無雜賓',
-u'門無雜客',
-u'扪隙發罅',
-u'門下之士',
-u'扪心清夜',
-u'扪心無愧',
-u'扪心自問',
-u'扪龠扣槃',
-u'悶在鼓裏',
-u'夢筆花生',
-u'夢筆生花',
-u'孟不離焦',
-u'懵懂癡呆',
-u'夢斷魂勞',
-u'夢斷魂消',
-u'孟公投轄',
-u'孟光舉案',
-u'猛虎插翅',
-u'猛虎出山',
-u'猛虎歸山蛟龍入海',
-u'猛虎離山',
-u'猛虎撲食',
-u'猛虎深山',
-u'猛虎添翼',
-u'夢幻泡影',
-u'夢魂顛倒',
-u'蒙混過關',
-u'孟嘉落帽',
-u'夢見周公',
-u'猛将出列陣勢威',
-u'猛将當關關自險',
-u'猛将當先三軍勇',
-u'夢覺黃梁',
-u'夢勞魂想',
-u'夢裏蝴蝶',
-u'夢裏南轲',
-u'蒙昧不清',
-u'夢寐不忘',
-u'夢寐顛倒',
-u'夢寐魂求',
-u'蒙袂輯屦',
-u'蒙袂輯履',
-u'夢寐爲勞',
-u'蒙昧無知',
-u'夢寐以求',
-u'夢夢查查',
-u'懵懵懂懂',
-u'夢夢統統',
-u'夢夢乍乍',
-u'懵懵作公卿',
-u'蒙面昧心',
-u'蒙面喪心',
-u'孟母三遷',
-u'孟母三徒',
-u'孟母三移',
-u'孟母擇鄰',
-u'猛禽一擊',
-u'懵然無知',
-u'蒙然坐霧',
-u'夢撒寮丁',
-u'盟山誓海',
-u'蒙上欺下',
-u'夢屍得官',
-u'孟詩韓筆',
-u'猛士如雲',
-u'夢是心頭想',
-u'夢熟黃梁',
-u'夢随心生',
-u'蒙頭衲被',
-u'夢往神遊',
-u'夢喜三刀',
-u'夢想還勞',
-u'夢想神交',
-u'夢想爲勞',
-u'黾穴鸲巢',
-u'蒙以養正',
-u'夢應三刀',
-u'蒙在鼓裏',
-u'夢兆熊罴',
-u'猛志常在',
-u'夢中說夢',
-u'夢中占夢',
-u'覓愛追歡',
-u'密不通風',
-u'靡不有初',
-u'靡不有初鮮克有終',
-u'迷不知歸',
-u'秘傳金匮',
-u'弭盜民安',
-u'迷而不返',
-u'秘而不露',
-u'秘而不泄',
-u'秘而不宣',
-u'秘而不言',
-u'弭耳俯伏',
-u'弭耳受教',
-u'迷而知返',
-u'麋沸蟻動',
-u'麋沸蟻聚',
-u'麋沸之亂',
-u'彌縫其阙',
-u'覓縫鑽頭',
-u'米貴如珠',
-u'米貴增錢買無錢餓死人',
-u'迷花戀柳',
-u'迷花眼笑',
-u'迷花沾草',
-u'弭患無形',
-u'迷魂奪魄',
-u'迷魂淫魄',
-u'迷惑不解',
-u'迷惑視聽',
-u'覓迹尋蹤',
-u'靡堅不摧',
-u'蜜餞砒霜',
-u'蜜餞餡餅',
-u'迷金醉紙',
-u'迷空步障',
-u'蜜口劍腹',
-u'弭口無言',
-u'糜爛不堪',
-u'米爛成倉',
-u'迷離徜仿',
-u'迷離徜恍',
-u'迷離恍忽',
-u'迷離撲朔',
-u'蜜裏調油',
-u'迷戀骸骨',
-u'迷溜沒亂',
-u'迷留悶亂',
-u'迷留摸亂',
-u'覓柳尋花',
-u'彌留之際',
-u'迷路羔羊',
-u'麋鹿姑蘇',
-u'密鑼緊鼓',
-u'密縷細針',
-u'迷茫之羽',
-u'靡靡不振',
-u'密密層層',
-u'迷迷蕩蕩',
-u'迷迷惑惑',
-u'靡靡之聲',
-u'靡靡之響',
-u'靡靡之音',
-u'靡靡之樂',
-u'靡旗亂轍',
-u'糜軀碎首',
-u'靡然成風',
-u'靡然從風',
-u'靡然順風',
-u'靡然鄉風',
-u'迷人瞑目',
-u'迷人眼目',
-u'彌日亘時',
-u'彌日累夜',
-u'彌山遍野',
-u'彌山布野',
-u'彌山亘野',
-u'彌山跨谷',
-u'彌山滿谷',
-u'彌山盈谷',
-u'覓生覓死',
-u'靡識大體',
-u'秘書異笈',
-u'靡所不爲',
-u'靡所不有',
-u'靡所底止',
-u'靡所适從',
-u'蜜糖火酒',
-u'蜜糖天使',
-u'迷天大謊',
-u'彌天大禍',
-u'迷天大罪',
-u'彌天亘地',
-u'彌天之罪',
-u'迷頭認影',
-u'迷途失偶',
-u'迷途知返',
-u'靡微不周',
-u'密勿從事',
-u'迷霧行者',
-u'密勿之地',
-u'糜饷勞師',
-u'米鹽博辯',
-u'米鹽淩雜',
-u'謎言謎語',
-u'靡顔膩理',
-u'米已成炊',
-u'米已成飯',
-u'覓衣求食',
-u'密意深情',
-u'靡衣偷食',
-u'密意幽悰',
-u'靡衣玉食',
-u'靡有孑遺',
-u'密語甜言',
-u'密約偷期',
-u'彌月之喜',
-u'密雲不雨',
-u'密雲無雨',
-u'迷在當局',
-u'米紮廢墟',
-u'靡哲不愚',
-u'密針細縷',
-u'密針細線',
-u'靡知所措',
-u'米珠薪桂',
-u'迷蹤失路',
-u'面北眉南',
-u'面壁功深',
-u'面不改容',
-u'面不改色',
-u'面不改色心不跳',
-u'面長面短',
-u'面赤耳熱',
-u'面從背違',
-u'面從背言',
-u'面從腹诽',
-u'面從後言',
-u'面從心違',
-u'免得百日之憂',
-u'面額焦爛',
-u'面方如田',
-u'面縛歸命',
-u'面縛銜璧',
-u'面縛輿榇',
-u'面垢頭蓬',
-u'偭規錯矩',
-u'偭規越矩',
-u'綿裹秤錘',
-u'面紅耳赤',
-u'面紅耳熱',
-u'面紅過耳',
-u'面紅頸赤',
-u'面紅面赤',
-u'面紅面綠',
-u'面鹄形鸠',
-u'眠花藉柳',
-u'眠花宿柳',
-u'眠花卧柳',
-u'眠花醉柳',
-u'免懷之歲',
-u'面黃肌瘦',
-u'面皆菜色',
-u'免開尊口',
-u'綿裏薄材',
-u'綿裏藏針',
-u'綿裏鋼針',
-u'綿裏裹鐵',
-u'綿裏裹針',
-u'綿裏之針',
-u'面謾腹诽',
-u'面貌猙獰',
-u'綿綿不斷',
-u'綿綿不絕',
-u'綿綿不息',
-u'綿綿此恨',
-u'綿綿瓜瓞',
-u'面面皆到',
-u'面面俱到',
-u'面面俱全',
-u'面面俱圓',
-u'面面厮觑',
-u'面面相睹',
-u'面面相看',
-u'面面相窺',
-u'面面相觑',
-u'面面圓到',
-u'面命耳提',
-u'面命提耳',
-u'面目可憎',
-u'面目黎黑',
-u'面目全非',
-u'面目一新',
-u'面目猙獰',
-u'面南稱尊',
-u'面能幹唾',
-u'面朋口友',
-u'面朋面友',
-u'面牆而立',
-u'勉求多福',
-u'面如方田',
-u'面如傅粉',
-u'面如槁木',
-u'面如冠玉',
-u'面如灰土',
-u'面如滿月',
-u'面如凝脂',
-u'面如死灰',
-u'面如土色',
-u'面若死灰',
-u'面色如生',
-u'面色如土',
-u'面善心惡',
-u'面折庭争',
-u'面是背非',
-u'面是心非',
-u'面市鹽車',
-u'眄視指使',
-u'面授方略',
-u'面授機宜',
-u'面署第一',
-u'眠霜卧雪',
-u'眠思夢想',
-u'面似靴皮',
-u'免俗未能',
-u'眠同貓鼠',
-u'勉爲其難',
-u'面無慚色',
-u'面無人色',
-u'綿延不斷',
-u'腼顔人世',
-u'腼顔事仇',
-u'腼顔事敵',
-u'腼顔天壤',
-u'綿言細語',
-u'面引廷争',
-u'面有菜色',
-u'面有饑色',
-u'面有愧色',
-u'面有難色',
-u'面譽背非',
-u'面譽背毀',
-u'面譽不忠',
-u'面折人過',
-u'面折廷争',
-u'面争庭論',
-u'妙筆丹青',
-u'妙筆生花',
-u'妙不可述',
-u'妙不可言',
-u'渺不足道',
-u'妙策如神',
-u'妙策神機',
-u'妙處不傳',
-u'邈處欿視',
-u'苗從地發',
-u'妙奪化工',
-u'苗而不實',
-u'苗而不穗',
-u'苗而不秀',
-u'苗而未秀',
-u'妙冠一時',
-u'渺乎其小',
-u'妙絕人寰',
-u'妙絕時人',
-u'妙絕一時',
-u'妙絕于時',
-u'妙齡馳譽',
-u'描龍刺鳳',
-u'描龍繡鳳',
-u'描鸾刺鳳',
-u'妙論粲花',
-u'描眉畫鬓',
-u'描眉畫角',
-u'眇眇忽忽',
-u'渺渺茫茫',
-u'渺渺真人',
-u'眇眇之身',
-u'妙能曲盡',
-u'妙趣橫生',
-u'渺然一身',
-u'渺如黃鶴',
-u'邈如曠世',
-u'邈若河漢',
-u'邈若河山',
-u'邈若山河',
-u'渺若煙雲',
-u'描神畫鬼',
-u'廟勝之策',
-u'廟勝之算',
-u'妙手成春',
-u'妙手丹青',
-u'妙手回春',
-u'妙手空空',
-u'妙手盧醫',
-u'妙手偶得',
-u'妙手天成',
-u'廟算如神',
-u'妙算神機',
-u'妙算神謀',
-u'廟堂偉器',
-u'廟堂之量',
-u'廟堂之器',
-u'苗條淑女',
-u'描頭畫角',
-u'渺無邊際',
-u'妙舞清歌',
-u'渺無人迹',
-u'渺無人煙',
-u'渺無人蹤',
-u'渺無音信',
-u'渺無音訊',
-u'渺無影蹤',
-u'渺無蹤影',
-u'妙想天開',
-u'廟小妖風大',
-u'眇小丈夫',
-u'描寫畫角',
-u'妙言要道',
-u'邈以山河',
-u'妙語解煩',
-u'妙語解頤',
-u'妙語驚人',
-u'妙語連珠',
-u'妙喻取譬',
-u'妙語如珠',
-u'廟垣之鼠',
-u'妙在心手',
-u'瞄準射擊',
-u'藐茲一身',
-u'滅此朝食',
-u'滅德立違',
-u'滅頂水精',
-u'滅頂之災',
-u'滅法金鱗',
-u'滅虢取虞',
-u'滅絕人性',
-u'蔑倫悖理',
-u'滅門絕戶',
-u'乜乜屑屑',
-u'乜乜踅踅',
-u'滅卻心頭火',
-u'滅私奉公',
-u'滅影銷聲',
-u'滅景追風',
-u'民安國泰',
-u'民安物阜',
-u'民辦公助',
-u'民胞物與',
-u'民保于信',
-u'民變蜂起',
-u'民不安枕',
-u'民不堪命',
-u'民不聊生',
-u'民不畏死',
-u'民不畏死何以死懼之',
-u'民不畏威',
-u'民淳俗厚',
-u'敏而好學',
-u'民繁财阜',
-u'民富國強',
-u'民富國自強',
-u'民膏民脂',
-u'民給家足',
-u'民貴君輕',
-u'民和年豐',
-u'民和年稔',
-u'民和時豐',
-u'敏捷靈巧',
-u'民康物阜',
-u'民困國貧',
-u'民困國窮',
-u'民力雕弊',
-u'民力凋盡',
-u'闵亂思治',
-u'僶勉從事',
-u'泯滅無聞',
-u'泯沒無稱',
-u'民疲财殚',
-u'民情土俗',
-u'民情物理',
-u'民窮财盡',
-u'民窮财匮',
-u'民窮國困',
-u'民生雕弊',
-u'民生國計',
-u'民生塗炭',
-u'民生在勤',
-u'憫時病俗',
-u'民望所歸',
-u'民爲邦本',
-u'民無常心',
-u'民物凋敝',
-u'民無噍類',
-u'民熙物阜',
-u'民心不壹',
-u'民心無常',
-u'民以食爲天',
-u'民殷财阜',
-u'民殷國富',
-u'民用凋敝',
-u'民有菜色',
-u'民有和約',
-u'敏于事慎于言',
-u'民怨沸騰',
-u'民怨盈塗',
-u'民賊獨夫',
-u'民脂民膏',
-u'明暗處理',
-u'明白了當',
-u'明白如話',
-u'名敗身誅',
-u'明白曉暢',
-u'明白易曉',
-u'名邦勝會',
-u'命薄緣悭',
-u'明辨是非',
-u'名标青史',
-u'名标彤史',
-u'明并日月',
-u'命薄如花',
-u'命薄如紙',
-u'名播天聽',
-u'名播天下',
-u'命薄相窮',
-u'名不常存',
-u'名不副實',
-u'名不徒顯',
-u'名不虛傳',
-u'名不虛得',
-u'名不虛立',
-u'名不虛謂',
-u'名不虛行',
-u'名不虛言',
-u'名不正言不順',
-u'明參日月',
-u'明察暗訪',
-u'明察秋毫',
-u'名臣碩老',
-u'名成功就',
-u'名成身退',
-u'明恥教戰',
-u'名重當時',
-u'名重天下',
-u'命俦嘯侶',
-u'名傳海内',
-u'命舛數奇',
-u'明窗幾淨',
-u'明窗淨幾',
-u'名垂百世',
-u'名垂不朽',
-u'名垂後世',
-u'名垂千古',
-u'名垂青史',
-u'名垂萬古',
-u'名垂罔極',
-u'名垂宇宙',
-u'名垂竹帛',
-u'名詞短語',
-u'命詞遣意',
-u'名從主人',
-u'名存實除',
-u'名存實廢',
-u'名存實爽',
-u'名存實亡',
-u'命大福大',
-u'明道指钗',
-u'明德君子',
-u'明德慎罰',
-u'名得實亡',
-u'明德惟馨',
-u'名德重望',
-u'名登鬼錄',
-u'名定不虛',
-u'酩酊大醉',
-u'酩酊爛醉',
-u'名動金瓯',
-u'明發不寐',
-u'明罰敕法',
-u'明法審令',
-u'鳴鳳朝陽',
-u'名覆金瓯',
-u'銘膚镂骨',
-u'名副其實',
-u'銘感不忘',
-u'銘感五内',
-u'銘感五衷',
-u'名高難副',
-u'名高天下',
-u'名公大筆',
-u'名公钜卿',
-u'名公钜人',
-u'命工庀材',
-u'銘功頌德',
-u'明公正道',
-u'明公正氣',
-u'明公正義',
-u'鳴鼓而攻',
-u'鳴鼓攻之',
-u'鳴鼓之攻',
-u'命乖運蹇',
-u'命乖運拙',
-u'明光爍亮',
-u'明光下铠',
-u'明光锃亮',
-u'明光戰铠',
-u'明光铮亮',
-u'名過其實',
-u'命好不怕運來磨',
-u'鳴鶴之應',
-u'名花解語',
-u'名花無主',
-u'明婚正配',
-u'明婚正娶',
-u'明火持刀',
-u'明火持杖',
-u'明火執械',
-u'明火執仗',
-u'銘記不忘',
-u'銘肌刻骨',
-u'名鞿利鞚',
-u'銘肌镂骨',
-u'名價日重',
-u'鳴劍抵掌',
-u'明鑒高懸',
-u'明監秋毫',
-u'命蹇時乖',
-u'明見萬裏',
-u'名缰利鎖',
-u'明教不變',
-u'鳴金收兵',
-u'鳴金收軍',
-u'明鏡不疲',
-u'明鏡高懸',
-u'明鏡鑒形',
-u'明鏡照形',
-u'鳴珂锵玉',
-u'銘刻五中',
-u'明來暗去',
-u'明來暗往',
-u'明理見道',
-u'名利兼收',
-u'名利雙收',
-u'命裏無時莫強求',
-u'名利薰心',
-u'命裏有時終須有',
-u'名利之境',
-u'命裏注定',
-u'明廉暗察',
-u'明廉暗訪',
-u'明亮篝火',
-u'名列前茅',
-u'螟蛉之子',
-u'名流巨子',
-u'名流轶事',
-u'鳴鑼喝道',
-u'鳴鑼開道',
-u'名落孫山',
-u'名滿天下',
-u'名滿一時',
-u'名貿實易',
-u'明眉大眼',
-u'明媒正禮',
-u'明媒正配',
-u'明媒正娶',
-u'名門大族',
-u'名門閨秀',
-u'名門舊族',
-u'名門世族',
-u'名門豔女',
-u'名門右族',
-u'命面提耳',
-u'明滅可見',
-u'冥僶亡見',
-u'明明白白',
-u'明明赫赫',
-u'明明廟谟',
-u'命名約定',
-u'明眸皓齒',
-u'明眸善睐',
-u'明目達聰',
-u'名目繁多',
-u'明目張膽',
-u'明目張糁',
-u'名葩異卉',
-u'明棄暗取',
-u'明齊日月',
-u'明其深旨',
-u'鳴謙接下',
-u'明槍暗奪',
-u'明槍暗箭',
-u'明搶暗偷',
-u'明槍易躲',
-u'明槍易躲暗箭難防',
-u'鳴琴而治',
-u'命輕鴻毛',
-u'名卿钜公',
-u'名傾一時',
-u'命染黃沙',
-u'明人不說暗話',
-u'明人不作暗事',
-u'明日愁來明日憂',
-u'明日黃花',
-u'命如絲發',
-u'命如紙薄',
-u'明如指掌',
-u'明若觀火',
-u'命若懸絲',
-u'明若指掌',
-u'命喪黃泉',
-u'名山大川',
-u'名山大澤',
-u'名山勝川',
-u'名山勝水',
-u'名山事業',
-u'名山之藏',
-u'名山之席',
-u'明賞不費',
-u'明尚夙達',
-u'明升暗降',
-u'名勝古迹',
-u'名聲過實',
-u'名聲赫赫',
-u'名聲藉甚',
-u'名聲狼藉',
-u'名聲掃地',
-u'名聲在外',
-u'名實不副',
-u'名實不違',
-u'名師出高徒',
-u'名士風流',
-u'名實難副',
-u'名士夙儒',
-u'名實相稱',
-u'名實相副',
-u'明是一盆火暗是一把刀',
-u'名師益友',
-u'命世之才',
-u'命世之雄',
-u'名書錦軸',
-u'名書竹帛',
-u'冥思精索',
-u'冥思苦索',
-u'冥思苦想',
-u'命似懸絲',
-u'冥搜苦思',
-u'名遂功成',
-u'明堂正道',
-u'名題金榜',
-u'名題雁塔',
-u'名同實異',
-u'命途多舛',
-u'命途坎坷',
-u'明推暗就',
-u'冥頑不靈',
-u'名微衆寡',
-u'名聞海内',
-u'名聞四海',
-u'名聞天下',
-u'名聞遐迩',
-u'名我固當',
-u'名靰利鞚',
-u'名下不虛',
-u'名下無虛',
-u'名賢啓事',
-u'名顯天下',
-u'命嘯俦侶',
-u'明效大驗',
-u'明信公子',
-u'明心見性',
-u'銘心刻骨',
-u'銘心镂骨',
-u'冥心危坐',
-u'銘心在骨',
-u'明刑弼教',
-u'明刑不戮',
-u'冥行盲索',
-u'冥行擿埴',
-u'明修暗度',
-u'明修棧道',
-u'明修棧道暗度陳倉',
-u'命懸絲發',
-u'明驗大效',
-u'鳴雁直木',
-u'明揚側陋',
-u'名揚四海',
-u'名揚天下',
-u'明揚仄陋',
-u'鳴野食蘋',
-u'名以正體',
-u'命與仇謀',
-u'鳴于喬木',
-u'名與實違',
-u'鳴玉曳履',
-u'鳴玉曳組',
-u'鳴冤叫屈',
-u'命緣義輕',
-u'明月暗投',
-u'明月蘆花',
-u'明月清風',
-u'明月入抱',
-u'明月入懷',
-u'明月之詩',
-u'命運多蹇',
-u'命運兩濟',
-u'命在旦夕',
-u'命在朝夕',
-u'名噪天下',
-u'名噪一時',
-u'明昭昏蒙',
-u'冥昭瞢闇',
-u'明哲保身',
-u'明哲防身',
-u'名震一時',
-u'明争暗鬥',
-u'明正典刑',
-u'名正理順',
-u'名正言順',
-u'銘之肺腑',
-u'明知故犯',
-u'明知故問',
-u'明知明犯',
-u'明知千裏',
-u'明知山有虎偏向虎山行',
-u'名紙生毛',
-u'名至實歸',
-u'明知灼見',
-u'命中等級',
-u'鳴鍾列鼎',
-u'名重識暗',
-u'鳴鍾食鼎',
-u'名重一世',
-u'命中注定',
-u'明珠按劍',
-u'明珠暗投',
-u'明珠彈肉',
-u'銘諸肺腑',
-u'明珠入幾',
-u'明珠生蚌',
-u'明珠彈雀',
-u'明珠投暗',
-u'銘諸五内',
-u'銘諸心腑',
-u'明珠薏苡',
-u'明珠掌上',
-u'明珠之纇',
-u'名狀不可',
-u'謬采虛聲',
-u'謬采虛譽',
-u'謬妄無稽',
-u'謬誤百出',
-u'謬想天開',
-u'謬以千裏',
-u'謬種流傳',
-u'缪種相承',
-u'莫把無時當有時',
-u'莫把真心空計較',
-u'墨悲染絲',
-u'莫辨楮葉',
-u'莫不關情',
-u'漠不關心',
-u'磨不開臉',
-u'漠不相關',
-u'默不作聲',
-u'摩擦輸紙',
-u'莫測高深',
-u'莫測機關',
-u'莫測深淺',
-u'墨池筆丘',
-u'沒齒不二',
-u'沒齒不忘',
-u'沒齒難泯',
-u'沒齒難忘',
-u'沒齒無怨',
-u'沒齒之恨',
-u'磨杵成針',
-u'磨杵作鍼',
-u'磨穿枯硯',
-u'磨穿鐵琪',
-u'磨穿鐵鞋',
-u'磨穿鐵硯',
-u'磨穿硯鐵',
-u'莫此爲甚',
-u'莫此之甚',
-u'莫措手足',
-u'末大必折',
-u'末大不掉',
-u'莫大之恩',
-u'莫待是非來入耳',
-u'磨刀擦槍',
-u'磨刀恨不利',
-u'磨刀霍霍',
-u'莫得而詳',
-u'磨砥刻厲',
-u'墨絰從戎',
-u'摩頂放踵',
-u'摩頂受記',
-u'摩頂受戒',
-u'摩頂至踵',
-u'摩頂至足',
-u'莫讀書若也',
-u'磨盾之暇',
-u'磨而不磷',
-u'殁而不朽',
-u'摩爾定律',
-u'默爾而息',
-u'默而識之',
-u'殁而無朽',
-u'模範山水',
-u'抹粉施脂',
-u'摩弗拉斯',
-u'莫敢誰何',
-u'莫敢仰視',
-u'魔鋼盾刺',
-u'魔高一尺',
-u'魔高一丈',
-u'摩根墓場',
-u'莫管他人瓦上霜',
-u'默化潛移',
-u'默換潛移',
-u'磨昬抉聩',
-u'莫或餘毒',
-u'摸雞偷狗',
-u'墨迹未幹',
-u'摩肩挨背',
-u'摩肩擦背',
-u'摩肩擦踵',
-u'摩肩擊毂',
-u'摩肩繼踵',
-u'摩肩接毂',
-u'摩肩接踵',
-u'摩肩如雲',
-u'磨攪訛繃',
-u'抹角轉彎',
-u'末節不終',
-u'末節繁文',
-u'末節細故',
-u'末節細行',
-u'摩卡斯基',
-u'莫可端倪',
-u'莫可究诘',
-u'莫可救藥',
-u'莫可理喻',
-u'莫可名狀',
-u'莫可奈何',
-u'莫可企及',
-u'墨客騷人',
-u'莫可收拾',
-u'莫可言狀',
-u'磨空鐵琪',
-u'摩口膏舌',
-u'抹淚揉眵',
-u'模棱兩端',
-u'摸棱兩可',
-u'磨棱刓角',
-u'摩厲以需',
-u'磨砺自強',
-u'末路窮途',
-u'末路途窮',
-u'陌路相逢',
-u'末路之難',
-u'秣馬利兵',
-u'秣馬蓐食',
-u'摸門不着',
-u'墨妙筆精',
-u'漠缗勢力',
-u'莫名其故',
-u'莫名其妙',
-u'莫名其器',
-u'默默不語',
-u'脈脈含情',
-u'默默無聲',
-u'默默無聞',
-u'脈脈無言',
-u'默默無語',
-u'莫能爲力',
-u'莫能軒轾',
-u'莫能自拔',
-u'莫逆于心',
-u'莫逆之交',
-u'莫逆之契',
-u'莫逆之友',
-u'默契神會',
-u'摩旗相助',
-u'磨鉛策蹇',
-u'摩乾軋坤',
-u'摩拳擦幾',
-u'摩拳擦掌',
-u'默然無聲',
-u'默然無言',
-u'漠然置之',
-u'莫忍釋手',
-u'默認推理',
-u'磨揉遷革',
-u'模山範水',
-u'模山寫水',
-u'沒身不忘',
-u'墨渖未幹',
-u'沒世不忘',
-u'沒世難忘',
-u'沒世無稱',
-u'莫識一丁',
-u'默識之無',
-u'墨守成法',
-u'墨守成規',
-u'墨守舊法',
-u'墨绶銅章',
-u'莫贖百身',
-u'末俗流弊',
-u'摩天礙日',
-u'莫添一口',
-u'磨鐵成針',
-u'磨鐵作針',
-u'默同寒蟬',
-u'摸頭不着',
-u'墨突不黔',
-u'抹土搽灰',
-u'膜外概置',
-u'莫爲已甚',
-u'莫向虎山行',
-u'貊鄉鼠壤',
-u'摸象衆盲',
-u'莫信直中直',
-u'摹形繪色',
-u'磨形煉性',
-u'末學膚受',
-u'末學後進',
-u'末學陋識',
-u'磨牙費嘴',
-u'磨牙吮血',
-u'磨牙鑿齒',
-u'莫予毒也',
-u'莫與爲比',
-u'墨魚自蔽',
-u'抹月秕風',
-u'抹月批風',
-u'墨債山積',
-u'莫展一籌',
-u'墨丈尋常',
-u'莫知适從',
-u'莫之誰何',
-u'莫知所謂',
-u'莫知所之',
-u'莫知所終',
-u'抹脂塗粉',
-u'莫之與京',
-u'磨踵滅頂',
-u'莫衷一是',
-u'磨磚成鏡',
-u'默轉潛移',
-u'磨磚作鏡',
-u'墨子悲染',
-u'墨子悲絲',
-u'墨子泣絲',
-u'莫茲爲甚',
-u'磨嘴皮子',
-u'末作之民',
-u'謀财害命',
-u'謀臣猛将',
-u'謀臣如雨',
-u'謀臣武将',
-u'謀道作舍',
-u'謀定後戰',
-u'謀夫孔多',
-u'謀及婦人',
-u'謀及庶人',
-u'謀慮深遠',
-u'謀谟帷幄',
-u'謀逆不軌',
-u'謀取私利',
-u'謀權篡位',
-u'謀如泉湧',
-u'謀如湧泉',
-u'侔色揣稱',
-u'謀深慮遠',
-u'謀事在人成事在天',
-u'謀聽計行',
-u'謀圖不軌',
-u'謀爲不軌',
-u'謀無遺策',
-u'謀無遺谞',
-u'某一地步',
-u'暮霭蒼茫',
-u'木本水源',
-u'木本之誼',
-u'目別彙分',
-u'暮不保朝',
-u'目不別視',
-u'目不定睫',
-u'目不給賞',
-u'目不給視',
-u'目不苟視',
-u'目不見睫',
-u'目不交睫',
-u'目不窺園',
-u'目不旁視',
-u'目不忍睹',
-u'目不忍見',
-u'目不忍視',
-u'目不勝接',
-u'目不識丁',
-u'目不識書',
-u'目不識字',
-u'目不妄視',
-u'目不暇給',
-u'目不暇接',
-u'目不暇賞',
-u'目不邪視',
-u'目不暫瞬',
-u'目不知書',
-u'目不轉睛',
-u'目不轉視',
-u'木巢林地',
-u'目瞠口哆',
-u'目成眉語',
-u'目成心授',
-u'目成心許',
-u'暮豉晨鍾',
-u'暮楚朝秦',
-u'母慈子孝',
-u'暮爨朝舂',
-u'暮翠朝紅',
-u'目達耳通',
-u'目呆口咂',
-u'牡丹花好空入目',
-u'牡丹雖好',
-u'牡丹雖好終須綠葉扶持',
-u'目瞪口呆',
-u'目瞪口僵',
-u'目瞪口結',
-u'目瞪口噤',
-u'目瞪口歪',
-u'目噔口張',
-u'目瞪舌僵',
-u'目瞪舌挢',
-u'目瞪神呆',
-u'目瞪心駭',
-u'目的地址',
-u'木雕泥捏',
-u'木雕泥塑',
-u'目定口呆',
-u'目動言肆',
-u'目睹耳聞',
-u'目斷飛鴻',
-u'目斷魂銷',
-u'目斷鱗鴻',
-u'目短自見',
-u'木幹鳥栖',
-u'木槁灰寒',
-u'慕古薄今',
-u'暮鼓朝鍾',
-u'暮鼓晨鍾',
-u'目光短淺',
-u'暮光崗哨',
-u'暮光海岸',
-u'目光炯炯',
-u'目光如電',
-u'目光如豆',
-u'目光如鏡',
-u'目光如炬',
-u'目光如鼠',
-u'暮光套裝',
-u'暮光小徑',
-u'暮光營地',
-u'暮光之塔',
-u'暮虢朝虞',
-u'目酣神醉',
-u'沐猴而冠',
-u'沐猴冠冕',
-u'沐猴衣冠',
-u'木壞山頹',
-u'目即成誦',
-u'目擊道存',
-u'目擊耳聞',
-u'目見耳聞',
-u'木強敦厚',
-u'木強少文',
-u'木強則折',
-u'目交心通',
-u'目睫之論',
-u'暮景殘光',
-u'暮景桑榆',
-u'目可瞻馬',
-u'目空天下',
-u'目空一切',
-u'目空一世',
-u'目空馀子',
-u'暮禮晨參',
-u'幕裏紅絲',
-u'目量意營',
-u'沐露梳風',
-u'沐露沾霜',
-u'目亂睛迷',
-u'木落歸本',
-u'木魅山鬼',
-u'目迷五色',
-u'慕名而來',
-u'木木樗樗',
-u'墓木拱矣',
-u'墓木己拱',
-u'目目相觑',
-u'墓木已拱',
-u'暮暮朝朝',
-u'母難之日',
-u'木讷寡言',
-u'目逆而送',
-u'木牛流馬',
-u'目牛無全',
-u'目牛遊刃',
-u'目盼心思',
-u'目披手抄',
-u'暮期沉沉',
-u'暮氣沈沈',
-u'木乾鳥栖',
-u'暮去朝來',
-u'目染耳濡',
-u'木人石心',
-u'沐仁浴義',
-u'沐日浴月',
-u'目擩耳染',
-u'穆如清風',
-u'目如懸珠',
-u'目若懸珠',
-u'暮色蒼茫',
-u'暮色森林',
-u'幕上燕巢',
-u'幕上之巢',
-u'暮史朝經',
-u'目食耳視',
-u'木石鹿豕',
-u'木食山栖',
-u'牧豕聽經',
-u'木石爲徒',
-u'木石心腸',
-u'目使頤令',
-u'墓石戰斧',
-u'牧豎之焚',
-u'暮四朝三',
-u'目送飛鴻',
-u'目送手揮',
-u'目所履曆',
-u'目所未睹',
-u'幕天席地',
-u'目挑眉語',
-u'目挑心與',
-u'目挑心悅',
-u'目挑心招',
-u'木頭木腦',
-u'目兔顧犬',
-u'目往神受',
-u'牧文人體',
-u'目無法紀',
-u'目無流視',
-u'目無全牛',
-u'目無三尺',
-u'目無王法',
-u'目無下塵',
-u'目無馀子',
-u'目無尊長',
-u'目下十行',
-u'目想心存',
-u'暮想朝思',
-u'木屑竹頭',
-u'木心石腹',
-u'木形灰心',
-u'木朽不雕',
-u'目秀眉清',
-u'木朽形穢',
-u'木秀于林',
-u'木朽蛀生',
-u'目眩魂搖',
-u'目眩神奪',
-u'目眩神搖',
-u'目眩頭昏',
-u'目眩頭暈',
-u'目眩心花',
-u'幕燕鼎魚',
-u'幕燕釜魚',
-u'木雁之間',
-u'暮夜懷金',
-u'暮夜無知',
-u'暮夜先容',
-u'暮夜之金',
-u'木已成舟',
-u'母儀之德',
-u'母以子貴',
-u'目營心匠',
-u'暮雨朝雲',
-u'目語額瞬',
-u'沐欲膏澤',
-u'沐雨經霜',
-u'沐雨梳風',
-u'目語心計',
-u'沐雨栉風',
-u'目眢心忳',
-u'暮雲朝雨',
-u'暮雲春樹',
-u'暮雲親舍',
-u'木爪巢穴',
-u'木爪洞穴',
-u'目怔口呆',
-u'目睜口開',
-u'目眐心駭',
-u'目指氣使',
-u'目治手營',
-u'目知眼見',
-u'木直自寇',
-u'目中無人',
-u'牧豬奴戲',
-u'目注心凝',
-u'目注心營',
-u'目眦盡裂',
-u'拏班作勢',
-u'拿不穩砣',
-u'拿粗夾細',
-u'拿粗挾細',
-u'拿刀動杖',
-u'拿刀弄仗',
-u'納貢稱臣',
-u'納垢藏污',
-u'呐喊搖旗',
-u'納賄招權',
-u'拿雞毛當令箭',
-u'拿奸拿奴',
-u'納谏如流',
-u'拿酒蓋了臉',
-u'納屦踵決',
-u'納履決踵',
-u'納履踵決',
-u'納民軌物',
-u'納叛招亡',
-u'納奇錄異',
-u'拿錢墊人',
-u'拿腔作調',
-u'拿腔作勢',
-u'拿腔作樣',
-u'拿三搬四',
-u'納善如流',
-u'納士招賢',
-u'拿手好戲',
-u'拿糖捏醋',
-u'拿糖作醋',
-u'納污藏垢',
-u'拿下馬來',
-u'納新吐故',
-u'拿雲攫石',
-u'拿雲握石',
-u'拿雲握霧',
-u'拿雲捉月',
-u'拿賊見贓',
-u'拿賊拿贓',
-u'納之以禮',
-u'納忠效信',
-u'褦襶觸熱',
-u'褦襶髑熱',
-u'耐人咀嚼',
-u'耐人頑味',
-u'耐人尋味',
-u'耐霜熬寒',
-u'乃文乃武',
-u'乃我困汝',
-u'乃武乃文',
-u'乃心公家',
-u'乃心王室',
-u'乃玉乃金',
-u'乃祖乃父',
-u'男扮女妝',
-u'男唱女随',
-u'難償所願',
-u'難出手心',
-u'南船北車',
-u'南船北馬',
-u'南槌哨塔',
-u'男大當婚',
-u'男大當娶',
-u'男大須婚',
-u'男盜女娼',
-u'難得糊塗',
-u'難登大雅之堂',
-u'難弟難兄',
-u'男兒膝下有黃金',
-u'男兒有淚不輕彈',
-u'男兒志兮天下事',
-u'男兒志在四方',
-u'南販北賈',
-u'難分難解',
-u'難分難舍',
-u'南風不競',
-u'難逢難遇',
-u'難割難分',
-u'男耕女織',
-u'難更仆數',
-u'南宮大典',
-u'南冠楚囚',
-u'南郭處士',
-u'南郭先生',
-u'南航北騎',
-u'難乎其繼',
-u'難乎其難',
-u'難乎爲繼',
-u'難乎爲情',
-u'男歡女愛',
-u'男婚女嫁',
-u'男婚女聘',
-u'男婚女妁',
-u'男婚女姻',
-u'南貨齋果',
-u'南箕北鬥',
-u'難解難分',
-u'南金東箭',
-u'難進易退',
-u'難竟全功',
-u'南橘北枳',
-u'南柯一夢',
-u'南來北去',
-u'南來北往',
-u'男來女往',
-u'南流海岸',
-u'難買難賣',
-u'男媒女妁',
-u'南面百城',
-u'南面稱孤',
-u'南面稱王',
-u'南面稱尊',
-u'南面王樂',
-u'南面之尊',
-u'難鳴孤掌',
-u'喃喃細語',
-u'喃喃自語',
-u'難能可貴',
-u'男女別途',
-u'男女老少',
-u'男女老小',
-u'男女老幼',
-u'男女平權',
-u'男女蒲典',
-u'男女先兒',
-u'男女有別',
-u'男女之別',
-u'難起蕭牆',
-u'南腔北調',
-u'南去北來',
-u'難如登天',
-u'南阮北阮',
-u'難若登天',
-u'南山可移判不可搖',
-u'難上加難',
-u'難舍難分',
-u'難伸之隐',
-u'難施面目',
-u'男室女家',
-u'難說難言',
-u'難素之學',
-u'男貪女愛',
-u'難逃法網',
-u'難填欲壑',
-u'難調衆口',
-u'男爲女服',
-u'南息海岸',
-u'難兄難弟',
-u'赧顔抱慚',
-u'赧顔苟活',
-u'赧顔汗下',
-u'難言蘭臭',
-u'難言之隐',
-u'南陽三葛',
-u'南鹞北鷹',
-u'南舣北駕',
-u'難以估計',
-u'難以理喻',
-u'難以枚舉',
-u'難以名狀',
-u'難以逆料',
-u'難以企及',
-u'難以挽回',
-u'難以爲繼',
-u'難以爲情',
-u'難以爲顔',
-u'難以想像',
-u'難以馴服',
-u'難以預料',
-u'難以招架',
-u'難以至信',
-u'難以捉摸',
-u'難于出口',
-u'難與抗衡',
-u'難于上青天',
-u'難于上天',
-u'南轅北轍',
-u'南月廢墟',
-u'難越雷池',
-u'南棹北轅',
-u'南征北伐',
-u'南征北剿',
-u'南征北讨',
-u'南征北戰',
-u'南枝北枝',
-u'男治外女安内',
-u'南州高士',
-u'南州冠冕',
-u'南州望士',
-u'男尊女卑',
-u'難作于易',
-u'囊空如洗',
-u'囊空羞澀',
-u'囊括四海',
-u'囊括無遺',
-u'囊裏盛錐',
-u'囊漏儲中',
-u'囊漏貯中',
-u'囊囊咄咄',
-u'囊囊突突',
-u'囊箧蕭然',
-u'囊箧蕭條',
-u'囊箧增輝',
-u'囊槖充盈',
-u'囊橐豐盈',
-u'囊槖累累',
-u'囊槖如洗',
-u'囊槖蕭然',
-u'囊槖蕭瑟',
-u'囊槖中物',
-u'囊溫郎當',
-u'囊無一物',
-u'囊匣如洗',
-u'囊螢讀書',
-u'囊螢積雪',
-u'囊螢映雪',
-u'囊螢照讀',
-u'囊螢照書',
-u'囊中取物',
-u'囊中之錐',
-u'囊錐露穎',
-u'腦部損傷',
-u'撓喉捩嗓',
-u'腦滿腸肥',
-u'呶呶不休',
-u'鬧鬧穰穰',
-u'鬧鬧熱熱',
-u'撓曲枉直',
-u'撓腮撧耳',
-u'惱羞變怒',
-u'惱羞成怒',
-u'撓直爲曲',
-u'讷口少言',
-u'讷言敏行',
-u'讷直守信',
-u'内安外攘',
-u'内查外調',
-u'内重外輕',
-u'内顧之憂',
-u'内行看門道',
-u'内患外禍',
-u'内疚神明',
-u'内峻外和',
-u'餒殍相望',
-u'内親外戚',
-u'内清外濁',
-u'内荏外剛',
-u'内仁外義',
-u'内柔外剛',
-u'内聖外王',
-u'内視反聽',
-u'内疏外親',
-u'内外感佩',
-u'内外夾攻',
-u'内外交困',
-u'内外完好',
-u'内外之分',
-u'内無糧草外無救兵',
-u'内省不疚',
-u'内省無愧',
-u'内修外攘',
-u'内應外合',
-u'内憂外患',
-u'内憂外侮',
-u'内造點心',
-u'内助之賢',
-u'嫩鳄魚肉',
-u'嫩狼肉排',
-u'能不兩工',
-u'能得罪遠親不得罪近鄰',
-u'能剛能柔',
-u'能工巧匠',
-u'能近取譬',
-u'能謀善斷',
-u'能漂一邑',
-u'能掐會算',
-u'能屈能伸',
-u'能人背後有能人',
-u'能人巧匠',
-u'能忍自安',
-u'能上能下',
-u'能舌利齒',
-u'能伸能屈',
-u'能事畢矣',
-u'能詩會賦',
-u'能士匿謀',
-u'能說慣道',
-u'能說會道',
-u'能說善道',
-u'能文能武',
-u'能文善武',
-u'能寫會算',
-u'能寫能算',
-u'能牙利齒',
-u'能言會道',
-u'能言快說',
-u'能言快語',
-u'能言巧辯',
-u'能言善辯',
-u'能言舌辯',
-u'能者多勞',
-u'能者爲師',
-u'能争慣戰',
-u'溺愛不明',
-u'逆阪走丸',
-u'匿病不醫',
-u'儗不于倫',
-u'你唱我和',
-u'你倡我随',
-u'泥車瓦狗',
-u'泥車瓦馬',
-u'逆臣賊子',
-u'泥船渡河',
-u'逆道亂常',
-u'你東我西',
-u'泥多佛大',
-u'你奪我争',
-u'你恩我愛',
-u'泥而不滓',
-u'逆耳利行',
-u'逆耳良言',
-u'逆耳之言',
-u'儗非其倫',
-u'逆風撐船',
-u'逆風惡浪',
-u'泥封函谷',
-u'逆風小徑',
-u'逆風行舟',
-u'泥古不化',
-u'泥古非今',
-u'泥古拘方',
-u'泥古守舊',
-u'泥古違今',
-u'泥古執今',
-u'拟規畫圓',
-u'匿迹潛形',
-u'匿迹銷聲',
-u'匿迹隐形',
-u'泥金萬點',
-u'你敬我愛',
-u'匿空旁出',
-u'逆來順受',
-u'你來我去',
-u'逆理違天',
-u'你憐我愛',
-u'逆旅主人',
-u'泥名失實',
-u'呢喃細語',
-u'泥牛入海',
-u'泥蟠不滓',
-u'泥菩薩過江',
-u'你謙我讓',
-u'逆取順守',
-u'泥沙俱下',
-u'逆施倒行',
-u'泥首銜玉',
-u'泥首謝罪',
-u'逆水撐篙',
-u'逆水行舟',
-u'你死我活',
-u'你死我生',
-u'泥塑巨人',
-u'泥塑木雕',
-u'你貪我愛',
-u'泥潭沼澤',
-u'逆天暗翼',
-u'逆天暴物',
-u'逆天背理',
-u'逆天大罪',
-u'逆天犯順',
-u'逆天違理',
-u'逆天違衆',
-u'逆天無道',
-u'逆天行事',
-u'泥腿光棍',
-u'逆我者亡',
-u'泥烏苔滑',
-u'匿瑕含垢',
-u'溺心滅質',
-u'逆行倒施',
-u'你兄我弟',
-u'泥雪鴻迹',
-u'你言我語',
-u'匿影藏形',
-u'匿影披風',
-u'匿影小徑',
-u'拟于不倫',
-u'溺于酒色',
-u'溺于舊聞',
-u'你争我鬥',
-u'逆知所始',
-u'泥中隐刺',
-u'泥豬疥狗',
-u'泥豬癞狗',
-u'泥豬瓦狗',
-u'你追我趕',
-u'逆子賊臣',
-u'辇車骊駕',
-u'粘稠瀝青',
-u'年登花甲',
-u'拈斷髭須',
-u'年方弱冠',
-u'年方舞勺',
-u'年豐時稔',
-u'年豐歲熟',
-u'年豐物阜',
-u'年富春秋',
-u'年富力強',
-u'年複一年',
-u'年高德厚',
-u'年高德邵',
-u'年高德勳',
-u'年高望重',
-u'年高有德',
-u'拈弓搭箭',
-u'拈弓取箭',
-u'年谷不登',
-u'辇毂之下',
-u'年光如駛',
-u'年過耳順',
-u'拈毫弄管',
-u'年華垂暮',
-u'拈花弄柳',
-u'拈花弄月',
-u'拈花惹草',
-u'拈花微笑',
-u'年華虛度',
-u'拈花一笑',
-u'拈花摘草',
-u'拈花摘豔',
-u'拈花摘葉',
-u'撚腳撚手',
-u'拈斤播兩',
-u'年近古稀',
-u'年近花甲',
-u'年近昏眊',
-u'年近歲逼',
-u'年近歲除',
-u'年近歲迫',
-u'年經國緯',
-u'念舊憐才',
-u'年久日深',
-u'年久失修',
-u'年老力衰',
-u'年老色衰',
-u'黏吝繳繞',
-u'年邁昏愦',
-u'年邁龍鍾',
-u'念念不舍',
-u'念念不釋',
-u'念念不忘',
-u'年年防火夜夜防賊',
-u'年年防饑',
-u'廿年劍化',
-u'念念心心',
-u'念念有詞',
-u'念念在茲',
-u'黏皮帶骨',
-u'黏皮着骨',
-u'年迫桑榆',
-u'拈輕掇重',
-u'年輕力壯',
-u'拈輕怕重',
-u'年少氣銳',
-u'年少無知',
-u'年少業偉',
-u'撚神撚鬼',
-u'年深日久',
-u'年深歲改',
-u'年深歲久',
-u'年深月久',
-u'年盛氣強',
-u'年事已高',
-u'撚手撚腳',
-u'年衰歲暮',
-u'拈酸吃醋',
-u'拈酸潑醋',
-u'年提出的',
-u'年頭月尾',
-u'撚土焚香',
-u'撚土爲香',
-u'年下進鮮',
-u'年湮代遠',
-u'年淹日久',
-u'年湮世遠',
-u'年已及艾',
-u'年已及笄',
-u'年誼世好',
-u'年幼無知',
-u'年逾不惑',
-u'年逾從心',
-u'年逾耳順',
-u'年逾古稀',
-u'年逾花甲',
-u'鲇魚上竿',
-u'鲇魚上竹',
-u'年在桑榆',
-u'年災月厄',
-u'年災月晦',
-u'撚着鼻子',
-u'年壯氣銳',
-u'年壯氣盛',
-u'念茲在茲',
-u'釀成大患',
-u'釀成大禍',
-u'鳥道羊腸',
-u'鳥得弓藏',
-u'鳥焚其巢',
-u'鳥焚魚爛',
-u'鳥伏獸窮',
-u'鳥覆危巢',
-u'鳥革翚飛',
-u'鳥駭鼠竄',
-u'鳥呼歸去',
-u'鳥迹蟲絲',
-u'鳥集鱗萃',
-u'鳥盡弓藏',
-u'鳥驚曲木',
-u'鳥驚獸駭',
-u'鳥驚鼠竄',
-u'鳥驚魚駭',
-u'鳥驚魚潰',
-u'鳥驚魚散',
-u'鳥哭猿啼',
-u'鳥裏鳥氣',
-u'尿流屁滾',
-u'茑蘿之附',
-u'鳥面鹄形',
-u'鳥娜風流',
-u'鳥能擇木',
-u'袅袅不絕',
-u'嫋嫋娜娜',
-u'袅袅娜娜',
-u'袅袅娉娉',
-u'袅袅亭亭',
-u'袅袅悠悠',
-u'袅袅餘音',
-u'袅娜娉婷',
-u'鳥栖烈火',
-u'鳥槍換炮',
-u'鳥窮則啄',
-u'鳥雀哀鳴',
-u'鳥人樊籠',
-u'鳥入樊籠',
-u'鳥散魚潰',
-u'鳥聲獸心',
-u'鳥獸率舞',
-u'鳥啼花落',
-u'鳥啼花怨',
-u'鳥爲食亡',
-u'鳥惜羽毛虎惜皮',
-u'鳥語花香',
-u'齧臂爲盟',
-u'齧臂之好',
-u'齧臂之交',
-u'齧臂之盟',
-u'齧檗吞針',
-u'涅而不渝',
-u'涅而不淄',
-u'孽根禍胎',
-u'捏怪排科',
-u'齧甲冥鼠',
-u'蹑腳蹑手',
-u'蹑景追飛',
-u'蹑蹻擔簦',
-u'蹑蹻檐簦',
-u'捏捏扭扭',
-u'嗫嗫嚅嚅',
-u'齧蘖吞針',
-u'苶然沮喪',
-u'嗫嚅小兒',
-u'捏軟面團',
-u'蹑手蹑腳',
-u'蹑手蹑足',
-u'捏絲戗金',
-u'乜斜纏帳',
-u'齧雪餐氈',
-u'齧血沁骨',
-u'齧雪吞氈',
-u'齧血爲盟',
-u'捏一把汗',
-u'蹑影藏形',
-u'蹑影潛蹤',
-u'蹑影追風',
-u'孽由自取',
-u'孽障種子',
-u'孽重罪深',
-u'孽子孤臣',
-u'孽子墜心',
-u'蹑足屏息',
-u'蹑足附耳',
-u'蹑足其間',
-u'蹑足潛蹤',
-u'擰成一股',
-u'寧靜以緻遠',
-u'寧靜緻遠',
-u'寧可清貧不作濁富',
-u'寧可人負我',
-u'寧可折本休要饑損',
-u'寧可信其有不可信其無',
-u'寧可玉碎不能瓦全',
-u'寧可正而不足',
-u'寧濫毋遺',
-u'擰眉立目',
-u'寧媚于竈',
-u'寧貧不堕志',
-u'寧戚飯牛',
-u'寧欺山莫欺水',
-u'寧缺勿濫',
-u'獰髯張目',
-u'寧死不屈',
-u'寧死不辱',
-u'寧死不彎腰',
-u'寧體便人',
-u'寧添一鬥',
-u'寧添一鬥莫添一口',
-u'佞徒損友',
-u'寧爲雞口',
-u'寧爲雞口不爲牛後',
-u'寧爲雞口無爲牛後',
-u'寧爲玉碎',
-u'寧爲玉碎不爲瓦全',
-u'寧向直中取',
-u'寧養逆子不養癡兒',
-u'寧移白首之心',
-u'寧越之辜',
-u'寧折不彎',
-u'寧折十年壽不受老來貧',
-u'凝脂點漆',
-u'凝矚不轉',
-u'寧走十步遠不走一步險',
-u'牛不出頭',
-u'牛不喝水強按頭',
-u'牛刀割雞',
-u'牛刀小試',
-u'牛鼎烹雞',
-u'牛耳之盟',
-u'牛高馬大',
-u'牛鬼蛇神',
-u'牛黃狗寶',
-u'牛骥共牢',
-u'牛骥同槽',
-u'牛骥同堂',
-u'牛骥同皁',
-u'牛角挂書',
-u'牛角書生',
-u'牛角之歌',
-u'牛口之下',
-u'扭虧增盈',
-u'牛郎織女',
-u'牛馬百姓',
-u'牛馬不若',
-u'牛馬風塵',
-u'牛馬襟裾',
-u'牛馬裾襟',
-u'牛馬生活',
-u'牛馬易頭',
-u'牛馬之衣',
-u'牛毛繭絲',
-u'牛毛細雨',
-u'牛眠吉地',
-u'牛眠龍繞',
-u'扭木孢子',
-u'扭木廣場',
-u'忸怩不安',
-u'忸怩作态',
-u'扭扭捏捏',
-u'牛農對泣',
-u'牛皮大王',
-u'牛皮弓弦',
-u'牛皮絞絲',
-u'扭曲虛空',
-u'扭曲作直',
-u'牛山下涕',
-u'牛山濯濯',
-u'扭是爲非',
-u'牛首馬面',
-u'扭手扭腳',
-u'牛首之涔',
-u'牛溲馬勃',
-u'牛蹄之涔',
-u'牛蹄之魚',
-u'牛蹄中魚',
-u'牛聽彈琴',
-u'牛童馬走',
-u'牛頭阿旁',
-u'扭頭暴筋',
-u'扭頭別項',
-u'牛頭不對馬嘴',
-u'牛頭馬面',
-u'牛頭馬肉',
-u'牛頭人語',
-u'牛王之皮',
-u'牛膝雞爪',
-u'牛饩退敵',
-u'牛心古怪',
-u'牛心左性',
-u'牛星織女',
-u'牛羊勿踐',
-u'牛衣病卧',
-u'牛衣對泣',
-u'牛衣歲月',
-u'牛衣夜哭',
-u'牛衣夜泣',
-u'狃于故轍',
-u'牛之一毛',
-u'扭直作曲',
-u'牛渚泛月',
-u'扭轉幹坤',
-u'扭轉局面',
-u'扭轉乾坤',
-u'扭轉頹勢',
-u'牛躜之涔',
-u'弄兵潢池',
-u'膿瘡撕咬',
-u'膿瘡之疹',
-u'濃翠蔽日',
-u'弄法舞文',
-u'弄粉調脂',
-u'弄粉調朱',
-u'弄斧班門',
-u'農夫難民',
-u'弄管調弦',
-u'弄鬼吊猴',
-u'弄鬼弄神',
-u'弄鬼妝幺',
-u'濃厚興趣',
-u'弄假成真',
-u'弄斤操斧',
-u'弄口鳴舌',
-u'弄柳拈花',
-u'濃眉大眼',
-u'弄眉擠眼',
-u'濃抹淡妝',
-u'濃墨重彩',
-u'弄巧呈乖',
-u'弄巧成拙',
-u'弄巧反拙',
-u'弄沙成塔',
-u'弄神弄鬼',
-u'濃縮軍糧',
-u'濃桃豔李',
-u'弄瓦之慶',
-u'弄瓦之喜',
-u'弄文輕武',
-u'弄性尚氣',
-u'弄虛作假',
-u'弄喧搗鬼',
-u'濃蔭蔽日',
-u'弄影團風',
-u'弄玉吹箫',
-u'弄玉偷香',
-u'弄月嘲風',
-u'弄月抟風',
-u'弄月吟風',
-u'弄盞傳杯',
-u'弄璋之慶',
-u'弄璋之喜',
-u'弄脂調粉',
-u'弄竹彈絲',
-u'濃妝淡抹',
-u'濃妝豔服',
-u'濃妝豔裹',
-u'濃裝豔抹',
-u'濃妝豔飾',
-u'濃妝豔質',
-u'弄嘴弄舌',
-u'怒臂當車',
-u'怒臂當轍',
-u'怒不可遏',
-u'弩不虛舉',
-u'努唇脹嘴',
-u'怒從心生',
-u'怒從心頭起惡向膽邊生',
-u'怒發沖冠',
-u'怒火沖天',
-u'怒火攻心',
-u'怒火面甲',
-u'怒火中燒',
-u'驽骥同槽',
-u'驽骥同轅',
-u'驽箭離弦',
-u'驽蹇之乘',
-u'努筋拔力',
-u'驽馬戀棧',
-u'驽馬鉛刀',
-u'驽馬十駕',
-u'驽馬十舍',
-u'怒罵嘻笑',
-u'怒眉睜目',
-u'努目撐眉',
-u'怒目而視',
-u'怒目橫眉',
-u'怒目戟指',
-u'怒目切齒',
-u'怒目睜眉',
-u'怒猊抉石',
-u'怒猊渴骥',
-u'怒牛沖擊',
-u'怒氣爆發',
-u'怒氣沖沖',
-u'怒氣沖天',
-u'怒氣沖霄',
-u'怒氣沖雲',
-u'怒氣集中',
-u'怒氣填胸',
-u'怒容可掬',
-u'怒容滿面',
-u'怒蛙可式',
-u'弩下逃箭',
-u'怒形于色',
-u'努牙突嘴',
-u'奴顔婢睐',
-u'奴顔婢色',
-u'奴顔婢舌',
-u'奴顔婢膝',
-u'奴顔媚骨',
-u'弩張劍拔',
-u'暖巢管家',
-u'暖日當喧',
-u'暖日和風',
-u'暖衣飽食',
-u'暖衣餘食',
-u'虐老獸心',
-u'虐人害物',
-u'懦詞怪說',
-u'搦管操觚',
-u'搦管摛章',
-u'諾諾連聲',
-u'搦朽磨鈍',
-u'女扮男身',
-u'女扮男裝',
-u'女娼男盜',
-u'女大不中留',
-u'女大當嫁',
-u'女大難留',
-u'女大十八變',
-u'女大須嫁',
-u'女兒意态',
-u'女嫁男婚',
-u'女流之輩',
-u'女蘿無托',
-u'女貌郎才',
-u'女人變壞就有錢',
-u'女人二十一朵花',
-u'女人三十豆腐渣',
-u'女娲補天',
-u'女娲之石',
-u'女婿有半子之勞',
-u'女長當嫁',
-u'女長須嫁',
-u'女織男耕',
-u'女中豪傑',
-u'女中堯舜',
-u'女中英豪',
-u'女中丈夫',
-u'女宗安仰',
-u'女宗宛在',
-u'鷗波萍迹',
-u'嘔出心肝',
-u'藕斷絲聯',
-u'瓯飯瓢飲',
-u'偶逢其适',
-u'漚浮泡影',
-u'毆公罵婆',
-u'讴功頌德',
-u'瓯窭滿篝',
-u'耦俱無猜',
-u'鷗鹭忘機',
-u'漚沫槿豔',
-u'鷗鳥不下',
-u'鷗鳥忘機',
-u'鷗水相依',
-u'藕絲難殺',
-u'嘔心抽腸',
-u'嘔心滴血',
-u'嘔心瀝血',
-u'嘔心镂骨',
-u'嘔心吐膽',
-u'嘔啞嘲哳',
-u'偶一爲之',
-u'偶影獨遊',
-u'偶語棄市',
-u'歐虞顔柳',
-u'漚珠槿豔',
-u'偶燭施明',
-u'扒耳搔腮',
-u'怕風怯雨',
-u'怕鬼有鬼',
-u'杷羅剔抉',
-u'怕三怕四',
-u'爬山涉水',
-u'爬梳剔抉',
-u'爬梳洗剔',
-u'怕死貪生',
-u'爬藤頭盔',
-u'怕痛怕癢',
-u'怕硬欺軟',
-u'拍案稱奇',
-u'拍案而起',
-u'拍案叫絕',
-u'拍案驚奇',
-u'排奡縱橫',
-u'拍闆成交',
-u'拍闆定案',
-u'排斥異己',
-u'排愁破涕',
-u'排除萬難',
-u'排除異己',
-u'徘徊不前',
-u'徘徊觀望',
-u'徘徊流連',
-u'徘徊歧路',
-u'排患解紛',
-u'排糠障風',
-u'拍馬溜須',
-u'排難解紛',
-u'排沙見金',
-u'排山倒海',
-u'排山倒峽',
-u'拍手稱快',
-u'拍手拍腳',
-u'排闼直入',
-u'俳優畜之',
-u'排憂解難',
-u'拍掌稱快',
-u'潘安再世',
-u'潘鬓成霜',
-u'潘鬓沈腰',
-u'攀蟾折桂',
-u'攀車卧轍',
-u'攀高接貴',
-u'攀高谒貴',
-u'攀葛附藤',
-u'槃根錯節',
-u'盤根究底',
-u'盤根問底',
-u'盤互交錯',
-u'攀花接柳',
-u'攀花折柳',
-u'攀花問柳',
-u'潘江陸海',
-u'攀今比昔',
-u'攀今吊古',
-u'攀今覽古',
-u'盤踞要津',
-u'攀鱗附翼',
-u'泮林革音',
-u'攀龍附鳳',
-u'攀龍附骥',
-u'攀龍附麟',
-u'攀龍讬鳳',
-u'盤龍卧虎',
-u'潘陸江海',
-u'攀蘿附木',
-u'盤馬彎弓',
-u'槃木朽株',
-u'攀木緣崖',
-u'判妻入子',
-u'攀親道故',
-u'攀親托熟',
-u'判然不合',
-u'判然不同',
-u'判然兩途',
-u'判如天壤',
-u'判若黑白',
-u'判若鴻溝',
-u'判若江湖',
-u'判若兩人',
-u'判若兩途',
-u'判若水火',
-u'判若天淵',
-u'判若霄壤',
-u'判若雲泥',
-u'判若雲淵',
-u'盤山涉澗',
-u'磐石護甲',
-u'磐石巨錘',
-u'盤石犬牙',
-u'盤石桑苞',
-u'盤石之安',
-u'盤石之固',
-u'攀藤附葛',
-u'攀藤攬葛',
-u'叛徒之心',
-u'潘文樂旨',
-u'攀炎附熱',
-u'潘楊之睦',
-u'盤遊無度',
-u'攀援桂技',
-u'判冤決獄',
-u'攀轅扣馬',
-u'攀轅卧轍',
-u'攀轅遮道',
-u'攀雲追月',
-u'滂渤怫郁',
-u'旁得香氣',
-u'旁觀袖手',
-u'旁觀者清',
-u'旁觀者審',
-u'旁徨岐路',
-u'旁徨歧途',
-u'旁徨失措',
-u'彷徨四顧',
-u'旁見側出',
-u'龐眉白發',
-u'龐眉皓發',
-u'龐眉皓首',
-u'龐眉鶴發',
-u'龐眉黃發',
-u'旁門外道',
-u'旁門小道',
-u'旁門邪道',
-u'旁門左道',
-u'旁敲側擊',
-u'旁求博考',
-u'旁求俊彥',
-u'龐然大物',
-u'旁若無人',
-u'旁收博采',
-u'旁搜博采',
-u'旁蒐遠紹',
-u'旁通曲鬯',
-u'旁推側引',
-u'滂沱大雨',
-u'旁文賸義',
-u'旁午構扇',
-u'旁午走急',
-u'旁蹊曲徑',
-u'旁行邪上',
-u'旁搖陰煽',
-u'旁逸橫出',
-u'旁逸斜出',
-u'旁引曲喻',
-u'旁引曲證',
-u'旁征博引',
-u'旁枝末節',
-u'旁指曲谕',
-u'炰鼈脍鯉',
-u'庖丁解牛',
-u'炮鳳烹龍',
-u'刨根究底',
-u'刨根問底',
-u'匏瓜空懸',
-u'匏瓜徒懸',
-u'袍笏登場',
-u'炮火連天',
-u'抛金棄鼓',
-u'跑了和尚跑不了廟',
-u'炮龍烹鳳',
-u'抛鸾拆鳳',
-u'跑馬觀花',
-u'抛媚眼給瞎子看',
-u'抛妻別子',
-u'抛妻棄孩',
-u'抛聲衒俏',
-u'刨樹搜根',
-u'抛頭露面',
-u'抛頭顱灑熱血',
-u'抛鄉離井',
-u'咆哮如雷',
-u'咆哮之牙',
-u'袍澤之誼',
-u'抛珠滾玉',
-u'抛磚引玉',
-u'佩緊帶紫',
-u'賠了夫人又折兵',
-u'賠身下氣',
-u'賠聲下氣',
-u'佩韋佩弦',
-u'佩韋自緩',
-u'佩弦自急',
-u'配享從汜',
-u'沛雨甘霖',
-u'沛雨某霖',
-u'佩紫懷黃',
-u'噴薄欲出',
-u'盆傾甕倒',
-u'盆傾甕瀽',
-u'噴唾成珠',
-u'濆旋傾側',
-u'噴血自污',
-u'噴雨噓雲',
-u'噴雲吐霧',
-u'噴雲泄霧',
-u'喯珠吐玉',
-u'蓬荜生光',
-u'蓬荜生輝',
-u'朋比爲奸',
-u'蓬荜有輝',
-u'蓬筚增輝',
-u'朋比作奸',
-u'棚車鼓笛',
-u'鵬程九萬',
-u'鵬程客棧',
-u'鵬程萬裏',
-u'朋黨比周',
-u'朋黨執虎',
-u'朋黨之争',
-u'蓬島歸真',
-u'鵬鴳齊緻',
-u'蓬發垢衣',
-u'朋分花用',
-u'捧腹大喜',
-u'捧腹大笑',
-u'捧腹絕倒',
-u'捧腹軒渠',
-u'烹狗藏弓',
-u'捧毂推輪',
-u'蓬蒿滿徑',
-u'蓬蒿滿宅',
-u'蓬蒿沒人',
-u'蓬戶柴門',
-u'蓬戶空室',
-u'蓬戶桑樞',
-u'蓬戶甕牖',
-u'蓬賴麻直',
-u'蓬萊弱水',
-u'蓬萊仙島',
-u'烹龍庖鳳',
-u'烹龍煮鳳',
-u'鵬路翺翔',
-u'蓬闾生輝',
-u'蓬門荜戶',
-u'蓬門荊布',
-u'澎湃洶湧',
-u'蓬蓬孛孛',
-u'蓬蓬勃勃',
-u'蓬飄萍轉',
-u'烹犬藏弓',
-u'怦然心動',
-u'烹饪鼎鼐',
-u'蓬生麻中',
-u'蓬生麻中不扶自直',
-u'蓬首垢面',
-u'蓬首散帶',
-u'蓬頭赤腳',
-u'蓬頭垢面',
-u'蓬頭曆齒',
-u'蓬頭散發',
-u'捧頭鼠竄',
-u'蓬頭跣足',
-u'捧土濡涕',
-u'鵬抟九天',
-u'鵬抟鹢退',
-u'蓬屋生輝',
-u'捧檄色喜',
-u'鵬霄萬裏',
-u'蓬心蒿目',
-u'朋心和力',
-u'蓬心回蕩',
-u'捧心西子',
-u'蓬瀛仙境',
-u'鵬遊蝶夢',
-u'蓬牖茅椽',
-u'朋友妻不可欺',
-u'弸中彪外',
-u'蓬轉萍飄',
-u'朋坐族誅',
-u'疲憊不堪',
-u'皮弁素績',
-u'辟地開天',
-u'辟惡除患',
-u'疲乏不堪',
-u'被發拊膺',
-u'被發入山',
-u'被發徒跣',
-u'被發文身',
-u'被發詳狂',
-u'被發佯狂',
-u'被發纓冠',
-u'被發左衽',
-u'皮菲瑞多',
-u'批風抹月',
-u'劈風斬浪',
-u'蚍蜉戴盆',
-u'匹夫溝渎',
-u'蚍蜉撼樹',
-u'匹夫懷璧',
-u'匹夫匹婦',
-u'匹夫無罪懷璧其罪',
-u'匹夫小諒',
-u'匹夫有責',
-u'皮膚之見',
-u'匹夫之諒',
-u'匹夫之勇',
-u'披肝抽腸',
-u'披肝挂膽',
-u'披肝瀝膽',
-u'披肝瀝糁',
-u'披肝瀝血',
-u'披肝露膽',
-u'披肝糜胃',
-u'披根搜株',
-u'鼙鼓雷鳴',
-u'披古通今',
-u'屁滾尿流',
-u'批吭搗虛',
-u'披褐懷金',
-u'被褐懷玉',
-u'被褐懷珠',
-u'披紅插花',
-u'披紅戴花',
-u'批紅判白',
-u'批砉導窾',
-u'披懷虛己',
-u'否極而泰',
-u'否極生泰',
-u'否極泰回',
-u'否極泰來',
-u'否極泰至',
-u'否極陽回',
-u'被甲持兵',
-u'披枷帶鎖',
-u'被甲據鞍',
-u'皮甲碎片',
-u'被甲枕戈',
-u'被甲執兵',
-u'被堅執銳',
-u'披襟解帶',
-u'披襟散發',
-u'劈荊斬棘',
-u'皮開肉破',
-u'皮開肉綻',
-u'批亢搗虛',
-u'批亢抵巇',
-u'劈空扳害',
-u'疲勞詛咒',
-u'披瀝赤忱',
-u'皮裏抽肉',
-u'皮裏春秋',
-u'披瀝肝膽',
-u'披瀝肝膈',
-u'皮裏晉書',
-u'霹靂雷魂',
-u'霹靂列缺',
-u'皮裏膜外',
-u'皮裏陽秋',
-u'匹練飛空',
-u'批鱗請劍',
-u'披林撷秀',
-u'披露腹心',
-u'披露肝膽',
-u'披羅戴翠',
-u'披麻帶索',
-u'披麻帶孝',
-u'匹馬單槍',
-u'匹馬當先',
-u'披麻救火',
-u'匹馬觭輪',
-u'匹馬一麾',
-u'匹馬隻輪',
-u'披蟒腰玉',
-u'披毛帶角',
-u'批毛求疵',
-u'披毛求瑕',
-u'皮毛碎片',
-u'披毛索黡',
-u'披毛索靥',
-u'批逆龍鱗',
-u'睥睨一切',
-u'睥睨一世',
-u'琵琶別抱',
-u'琵琶別弄',
-u'琵琶胡語',
-u'琵琶舊語',
-u'枇杷門巷',
-u'披袍擐甲',
-u'批其逆鱗',
-u'披裘帶索',
-u'披裘負薪',
-u'否去生泰',
-u'否去泰來',
-u'脾肉之歎',
-u'披沙揀金',
-u'披沙剖璞',
-u'被山帶河',
-u'披霜冒露',
-u'皮松骨癢',
-u'皮松肉緊',
-u'劈頭蓋臉',
-u'披頭蓋腦',
-u'劈頭利斧',
-u'劈頭劈臉',
-u'劈頭劈腦',
-u'披頭散發',
-u'披頭跣足',
-u'否往泰來',
-u'披文握武',
-u'批郤導窾',
-u'皮相之見',
-u'皮相之士',
-u'皮相之談',
-u'披霄決漢',
-u'皮笑肉不笑',
-u'披心瀝血',
-u'披心輸膽',
-u'披心相付',
-u'披星帶月',
-u'蚍蟻之援',
-u'擗踴哀号',
-u'擗踴拊心',
-u'擗踴号呼',
-u'擗踴号叫',
-u'辟踴哭泣',
-u'疲于奔命',
-u'批月抹風',
-u'披雲見日',
-u'披榛采蘭',
-u'皮之不存',
-u'否終而泰',
-u'否終複泰',
-u'否終則泰',
-u'僻字澀句',
-u'披缁削發',
-u'偏安一隅',
-u'片長薄技',
-u'片長末技',
-u'片辭折獄',
-u'片詞隻句',
-u'片光零羽',
-u'偏懷淺戆',
-u'片甲不存',
-u'片甲不歸',
-u'片甲不還',
-u'片甲不回',
-u'片甲不留',
-u'片甲無存',
-u'片甲無回',
-u'骈肩叠迹',
-u'骈肩接迹',
-u'骈肩累迹',
-u'骈肩累踵',
-u'骈肩累足',
-u'片箋片玉',
-u'骈肩雜遝',
-u'片接寸附',
-u'片刻之歡',
-u'片鱗半爪',
-u'片鱗殘甲',
-u'片鱗碎甲',
-u'片鱗隻甲',
-u'骈門連室',
-u'骈拇枝指',
-u'翩翩風度',
-u'翩翩公子',
-u'翩翩年少',
-u'翩翩起舞',
-u'翩翩少年',
-u'翩翩自樂',
-u'翩若驚鴻',
-u'偏三向四',
-u'片善小才',
-u'片石韓陵',
-u'骈首就逮',
-u'骈首就僇',
-u'骈首就死',
-u'骈首就系',
-u'胼手胝足',
-u'骈四俪六',
-u'偏聽偏信',
-u'偏聽偏言',
-u'偏聽則蔽',
-u'片瓦不存',
-u'片瓦不留',
-u'片瓦無存',
-u'片文隻事',
-u'片文隻字',
-u'片席之地',
-u'翩跹而舞',
-u'偏鄉僻壤',
-u'偏斜雕文',
-u'偏信則暗',
-u'偏信者暗',
-u'骈興錯出',
-u'片言居要',
-u'片言一字',
-u'片言折獄',
-u'片言折之',
-u'片言隻辭',
-u'片言隻句',
-u'片言隻語',
-u'片言隻字',
-u'便宜沒好貨好貨不便宜',
-u'片羽吉光',
-u'片語隻辭',
-u'片雲遮頂',
-u'骈枝俪葉',
-u'胼胝手足',
-u'胼胝之勞',
-u'片紙隻字',
-u'飄泊羁旅',
-u'飄泊無定',
-u'飄樊落溷',
-u'飄籓墜溷',
-u'飄風暴雨',
-u'飄風過耳',
-u'飄風急雨',
-u'飄風苦雨',
-u'飄風戲月',
-u'飄風驟雨',
-u'飄忽不定',
-u'漂零蓬斷',
-u'飄零書劍',
-u'漂流燈妖',
-u'飄渺光翼',
-u'飄渺仙子',
-u'漂母進飯',
-u'漂母進食',
-u'漂母之恩',
-u'漂母之惠',
-u'飄蓬斷梗',
-u'飄飄欲仙',
-u'飄萍斷梗',
-u'飄萍浪迹',
-u'瓢潑大雨',
-u'飄然出塵',
-u'飄然出世',
-u'飄然欲仙',
-u'飄然遠翥',
-u'飄若神仙',
-u'飄瓦虛舟',
-u'飄香十裏',
-u'飄洋過海',
-u'飄洋航海',
-u'飄茵堕溷',
-u'飄茵落溷',
-u'飄茵随溷',
-u'撇呆打堕',
-u'撇在腦後',
-u'貧病交攻',
-u'貧病交加',
-u'貧病交迫',
-u'貧病交侵',
-u'貧不失志',
-u'貧不學儉',
-u'貧不與富敵贱不與貴争',
-u'貧不擇妻',
-u'貧兒曝富',
-u'品而第之',
-u'貧而樂道',
-u'貧而無谄',
-u'牝雞晨鳴',
-u'牝雞牡鳴',
-u'牝雞司晨',
-u'牝雞司旦',
-u'牝雞無晨',
-u'貧瘠之地',
-u'貧贱不能移',
-u'貧贱不移',
-u'貧贱夫妻',
-u'貧贱見交情',
-u'貧贱驕人',
-u'貧贱糟糠',
-u'貧贱之交',
-u'貧贱之交不可忘',
-u'貧贱之知',
-u'貧居鬧市無人問',
-u'貧困潦倒',
-u'頻來親也疏',
-u'品貌非凡',
-u'颦眉蹙頞',
-u'貧莫與富争富莫與官鬥',
-u'牝牡骊黃',
-u'貧乃士之常',
-u'貧女分光',
-u'貧窮自在',
-u'拼死拼活',
-u'品頭論足',
-u'品頭評足',
-u'品頭題足',
-u'貧無立錐',
-u'貧無置錐',
-u'品學兼優',
-u'貧于一字',
-u'牝咮鳴辰',
-u'品竹調弦',
-u'品竹彈絲',
-u'品竹調絲',
-u'貧嘴薄舌',
-u'貧嘴惡舌',
-u'貧嘴寡舌',
-u'貧嘴滑舌',
-u'貧嘴贱舌',
-u'平安家書',
-u'平安無事',
-u'平白無端',
-u'憑白無故',
-u'平波緩進',
-u'平步登天',
-u'平步公卿',
-u'平步青霄',
-u'平步青雲',
-u'瓶沉簪折',
-u'憑城借一',
-u'平川曠野',
-u'平淡無奇',
-u'平旦之氣',
-u'平等待人',
-u'平等互惠',
-u'平等競争',
-u'平地波瀾',
-u'平地成天',
-u'平地登雲',
-u'平地風波',
-u'平地風雷',
-u'平地樓台',
-u'平地起家',
-u'平地起雷',
-u'平地青雲',
-u'平地生波',
-u'平地一聲雷',
-u'平分秋色',
-u'平風靜浪',
-u'瓶風九疊',
-u'萍浮南北',
-u'平複如故',
-u'平複如舊',
-u'憑高望遠',
-u'萍梗無定',
-u'馮河暴虎',
-u'憑幾據杖',
-u'憑幾之诏',
-u'平靜無事',
-u'平靜有思',
-u'平靜自身',
-u'平居無事',
-u'憑君傳語',
-u'平康正直',
-u'憑空杜撰',
-u'憑空捏造',
-u'憑空臆造',
-u'憑良心說',
-u'平流緩進',
-u'憑媒說合',
-u'平面八位',
-u'平民百姓',
-u'萍飄梗逐',
-u'萍飄蓬轉',
-u'娉娉袅袅',
-u'平鋪直叙',
-u'平起平坐',
-u'屏氣吞聲',
-u'瓶罄杯空',
-u'瓶罄罍恥',
-u'憑山負海',
-u'屏聲斂息',
-u'平生之好',
-u'平生志氣高',
-u'平生之志',
-u'平時不燒香',
-u'平時不燒香急來抱佛腳',
-u'憑轼結轍',
-u'憑轼旁觀',
-u'萍水偶逢',
-u'萍水相逢',
-u'萍水相交',
-u'萍水相遇',
-u'萍水相遭',
-u'帡天極地',
-u'娉婷婀娜',
-u'娉婷袅娜',
-u'評頭論腳',
-u'評頭論足',
-u'評頭品足',
-u'平頭正臉',
-u'平頭正面',
-u'平心持論',
-u'平心定氣',
-u'平心而論',
-u'平心靜氣',
-u'平心易氣',
-u'平行投影',
-u'憑虛公子',
-u'憑虛構象',
-u'憑虛禦風',
-u'平衍曠蕩',
-u'平易近民',
-u'平易近人',
-u'平易遜順',
-u'平易易知',
-u'平原曠野',
-u'平原十日',
-u'平原易野',
-u'平治天下',
-u'瓶墜簪折',
-u'萍蹤不定',
-u'萍蹤梗迹',
-u'萍蹤浪迹',
-u'萍蹤浪影',
-u'萍蹤靡定',
-u'迫不得已',
-u'迫不及待',
-u'迫不可待',
-u'破産蕩業',
-u'破巢完卵',
-u'破巢馀卵',
-u'破愁爲笑',
-u'破除迷信',
-u'魄蕩魂飛',
-u'魄蕩魂搖',
-u'頗費周折',
-u'破釜沉船',
-u'破釜沉舟',
-u'破釜焚舟',
-u'潑婦罵街',
-u'破斧缺斨',
-u'破釜沈舟',
-u'破肝糜胃',
-u'頗感興趣',
-u'破格錄用',
-u'破格任用',
-u'破格用人',
-u'破觚爲圓',
-u'破觚斫雕',
-u'破瓜年紀',
-u'破瓜之年',
-u'破罐破摔',
-u'破國亡家',
-u'破國亡宗',
-u'破家敗産',
-u'破家蕩産',
-u'破家蕩業',
-u'破家竭産',
-u'破家散業',
-u'破家喪産',
-u'破家亡國',
-u'破家爲國',
-u'破家縣令',
-u'破家鬻子',
-u'破堅摧剛',
-u'破奸發伏',
-u'破鏡重歸',
-u'破鏡重圓',
-u'破鏡分钗',
-u'破鏡重合',
-u'破舊不堪',
-u'破舊渡口',
-u'破舊立新',
-u'破矩爲圓',
-u'破軍殺将',
-u'破空輕铠',
-u'破空之魂',
-u'破口大罵',
-u'破口怒罵',
-u'破爛不堪',
-u'破爛流丢',
-u'破浪乘風',
-u'破浪海灘',
-u'破浪束帶',
-u'破卵傾巢',
-u'破門而出',
-u'破門而入',
-u'破衲疏羹',
-u'破腦刳心',
-u'破盆破摔',
-u'婆婆媽媽',
-u'迫切陳辭',
-u'破琴絕弦',
-u'破人生意如殺人父母',
-u'魄散魂飛',
-u'魄散魂飄',
-u'魄散魂消',
-u'潑聲浪氣',
-u'潑水難收',
-u'婆說婆有理',
-u'破死忘生',
-u'破碎殘陽',
-u'破碎一擊',
-u'破碎支離',
-u'婆娑起舞',
-u'破涕成笑',
-u'破涕爲歡',
-u'破涕爲笑',
-u'潑天大禍',
-u'潑天冤枉',
-u'破銅爛鐵',
-u'破頭爛額',
-u'破瓦頹垣',
-u'破玩意兒',
-u'破甕救兒',
-u'破屋又遭連夜雨',
-u'魄消魂散',
-u'破崖絕角',
-u'破顔微笑',
-u'破顔一笑',
-u'破窯出好瓦',
-u'破業失産',
-u'潑油救火',
-u'迫于眉睫',
-u'迫在眉睫',
-u'破甑不顧',
-u'破甑生塵',
-u'破綻百出',
-u'破竹建瓴',
-u'破竹之勢',
-u'剖蚌得珠',
-u'剖蚌見珠',
-u'剖蚌求珍',
-u'剖蚌求珠',
-u'剖膽傾心',
-u'掊鬥折衡',
-u'裒多益寡',
-u'剖煩析滞',
-u'剖腹藏珠',
-u'剖腹明心',
-u'剖肝瀝膽',
-u'剖肝泣血',
-u'剖毫析芒',
-u'剖決如流',
-u'裒斂無厭',
-u'抔土巨壑',
-u'抔土未幹',
-u'剖析肝膽',
-u'剖析入微',
-u'剖心坼肝',
-u'剖心泣血',
-u'剖心析膽',
-u'剖心析肝',
-u'裒兇鞠頑',
-u'剖玄析微',
-u'剖幽析微',
-u'曝背食芹',
-u'撲鼻而來',
-u'蒲鞭示辱',
-u'蒲鞭之罰',
-u'蒲鞭之政',
-u'溥博如天',
-u'鋪采摛文',
-u'撲地掀天',
-u'蒲牒寫書',
-u'普度群生',
-u'普度衆生',
-u'匍匐之救',
-u'撲擊遏奪',
-u'普濟群生',
-u'普濟衆生',
-u'普降瑞雪',
-u'普降喜雨',
-u'鋪錦列繡',
-u'蒲柳之質',
-u'蒲柳之姿',
-u'撲滿之敗',
-u'鋪眉蒙眼',
-u'鋪眉苫眼',
-u'鋪謀定計',
-u'鋪謀設計',
-u'樸讷誠笃',
-u'鋪平道路',
-u'仆仆道途',
-u'仆仆風塵',
-u'仆仆亟拜',
-u'仆旗息鼓',
-u'菩薩低眉',
-u'菩薩面強盜心',
-u'暴腮龍門',
-u'撲殺此獠',
-u'蒲扇價增',
-u'濮上桑間',
-u'濮上之音',
-u'樸實無華',
-u'曝書見竹',
-u'撲朔迷離',
-u'樸素大方',
-u'樸素無華',
-u'樸素之戒',
-u'鋪天蓋地',
-u'溥天率土',
-u'普天率土',
-u'普天同慶',
-u'普天匝地',
-u'普天之下',
-u'普通平台',
-u'鋪胸納地',
-u'暴衣露蓋',
-u'暴衣露冠',
-u'蒲邑三善',
-u'璞玉渾金',
-u'璞玉爲石',
-u'鋪張浪費',
-u'鋪張揚厲',
-u'樸斫之材',
-u'蒲姿柳質',
-u'撲作教刑',
-u'乞哀告憐',
-u'棄暗從明',
-u'棄暗投明',
-u'氣傲心高',
-u'七八下裏',
-u'棄本求末',
-u'棄本逐末',
-u'棄筆從戎',
-u'齊镳并驅',
-u'七病八倒',
-u'七病八痛',
-u'起兵動衆',
-u'七步八叉',
-u'泣不成聲',
-u'七步成詩',
-u'七步成章',
-u'棋布錯峙',
-u'泣不可仰',
-u'七步奇才',
-u'其不善者而改之',
-u'棋布星陳',
-u'棋布星羅',
-u'旗布星峙',
-u'七步之才',
-u'七彩缤紛',
-u'奇才異能',
-u'七長八短',
-u'棄車走林',
-u'起承轉合',
-u'起承轉結',
-u'奇恥大辱',
-u'旗豉相當',
-u'七尺之軀',
-u'氣沖鬥牛',
-u'啓寵納侮',
-u'氣沖牛鬥',
-u'乞寵求榮',
-u'氣沖霄漢',
-u'栖沖業簡',
-u'氣充志定',
-u'氣充志驕',
-u'岐出岐入',
-u'七穿八洞',
-u'七穿八爛',
-u'氣喘汗流',
-u'契船求劍',
-u'氣喘如牛',
-u'氣喘籲籲',
-u'七瘡八孔',
-u'凄怆流涕',
-u'奇辭奧旨',
-u'砌詞捏控',
-u'氣粗膽壯',
-u'棋錯一着',
-u'棋錯一着滿盤皆輸',
-u'七搭八扯',
-u'七搭八搭',
-u'七大八小',
-u'齊大非耦',
-u'齊打夥兒',
-u'欺大壓小',
-u'七擔八挪',
-u'七倒八歪',
-u'棄道任術',
-u'其道亡繇',
-u'其道無由',
-u'祈禱之珠',
-u'棄德從賊',
-u'耆德碩老',
-u'氣得志滿',
-u'七顛八倒',
-u'七跌八撞',
-u'氣定神閑',
-u'七洞八孔',
-u'齊東野人',
-u'齊東野語',
-u'氣度雄遠',
-u'七斷八續',
-u'棄短就長',
-u'棄短取長',
-u'氣斷聲吞',
-u'棄短用長',
-u'棄惡從德',
-u'棄惡從善',
-u'乞兒暴富',
-u'器二不匮',
-u'乞兒乘車',
-u'妻兒老少',
-u'妻兒老小',
-u'乞兒馬醫',
-u'企而望歸',
-u'七返還丹',
-u'七返九還',
-u'萋菲貝錦',
-u'萋菲成錦',
-u'氣憤填膺',
-u'凄風楚雨',
-u'棋逢敵手',
-u'棋逢對手',
-u'棋逢對手将遇良才',
-u'凄風寒雨',
-u'凄風苦雨',
-u'凄風冷雨',
-u'起鳳騰蛟',
-u'栖風宿雨',
-u'奇風異俗',
-u'齊傅楚咻',
-u'乞丐鬼屋',
-u'氣蓋山河',
-u'乞丐身皇帝嘴',
-u'乞丐之徒',
-u'七高八低',
-u'氣高膽壯',
-u'棋高一着',
-u'氣高志大',
-u'起根發由',
-u'七拱八翹',
-u'欺公日日憂',
-u'欺公罔法',
-u'棄公營私',
-u'棄故攬新',
-u'棄觚投筆',
-u'旗鼓相當',
-u'旗鼓相望',
-u'七拐八彎',
-u'氣貫長虹',
-u'氣貫鬥牛',
-u'氣貫虹霓',
-u'氣冠三軍',
-u'奇光異彩',
-u'齊軌連辔',
-u'啓瞶振聾',
-u'棄過圖新',
-u'杞國憂天',
-u'杞國之憂',
-u'祁寒溽暑',
-u'祁寒暑雨',
-u'七行俱下',
-u'氣夯胸脯',
-u'棄好背盟',
-u'契合金蘭',
-u'騎鶴上揚',
-u'騎鶴維揚',
-u'騎鶴揚州',
-u'漆黑一團',
-u'七橫八豎',
-u'七橫八縱',
-u'砌紅堆綠',
-u'齊後破環',
-u'騎虎難下',
-u'奇花名卉',
-u'琪花瑤草',
-u'奇花異草',
-u'奇花異卉',
-u'琪花玉樹',
-u'七慌八亂',
-u'奇貨可居',
-u'奇貨自居',
-u'氣急敗壞',
-u'氣急敗喪',
-u'骐骥過隙',
-u'欺己欺人',
-u'棨戟遙臨',
-u'骐骥一毛',
-u'奇伎淫巧',
-u'棄家蕩産',
-u'棄甲倒戈',
-u'棄甲丢盔',
-u'棄甲負弩',
-u'棄甲投戈',
-u'棄甲曳兵',
-u'齊家治國',
-u'乞漿得酒',
-u'七腳八手',
-u'氣驕志滿',
-u'氣竭聲嘶',
-u'氣竭形枯',
-u'泣荊之情',
-u'棄舊換新',
-u'棄舊開新',
-u'棄舊憐新',
-u'棄舊圖新',
-u'棄舊迎新',
-u'起居萬福',
-u'起居無時',
-u'氣決泉達',
-u'欺君害民',
-u'欺君罔上',
-u'欺君誤國',
-u'七開八得',
-u'旗開得勝',
-u'旗開馬到',
-u'旗開取勝',
-u'氣克鬥牛',
-u'七孔流血',
-u'七孔生煙',
-u'七口八嘴',
-u'七拉八扯',
-u'其拉之怒',
-u'其拉準将',
-u'七老八倒',
-u'七老八老',
-u'七撈八攘',
-u'七老八十',
-u'耆老久次',
-u'欺老莫欺小',
-u'七了八當',
-u'其樂不窮',
-u'其樂無窮',
-u'其樂無涯',
-u'七棱八瓣',
-u'其利斷金',
-u'起例發凡',
-u'奇離古怪',
-u'妻離子散',
-u'乞憐搖尾',
-u'齊量等觀',
-u'齊梁世界',
-u'欺良壓善',
-u'凄涼之地',
-u'泣麟悲鳳',
-u'七零八落',
-u'七零八散',
-u'七零八碎',
-u'氣淩霄漢',
-u'乞留玎琅',
-u'騎龍弄鳳',
-u'歧路徘徊',
-u'歧路亡羊',
-u'七亂八糟',
-u'绮落粉黛',
-u'騎驢倒堕',
-u'騎驢覓驢',
-u'騎驢索句',
-u'騎馬尋馬',
-u'騎馬找馬',
-u'氣脈通連',
-u'七滿八平',
-u'欺瞞夾帳',
-u'器滿将覆',
-u'器滿意得',
-u'器滿則覆',
-u'器滿則傾',
-u'氣滿志得',
-u'氣滿志驕',
-u'其貌不揚',
-u'齊眉舉案',
-u'妻梅子鶴',
-u'齊門鼓瑟',
-u'旗靡轍亂',
-u'齊名并價',
-u'欺名盜世',
-u'棄明投暗',
-u'棄末返本',
-u'起模畫樣',
-u'七魔之主',
-u'其奈我何',
-u'七男八婿',
-u'其難其慎',
-u'棄逆歸順',
-u'耆年碩德',
-u'绮年玉貌',
-u'七年之病',
-u'栖鳥徚泉',
-u'七扭八歪',
-u'騎牛覓牛',
-u'漆女憂魯',
-u'奇葩異卉',
-u'氣派護臂',
-u'奇龐福艾',
-u'旗旆成陰',
-u'欺貧愛富',
-u'七拼八湊',
-u'七貧八富',
-u'欺貧重富',
-u'七破八補',
-u'七魄三魂',
-u'七魄悠悠',
-u'期期艾艾',
-u'七七八八',
-u'泣歧悲染',
-u'期期不可',
-u'嘁嘁喳喳',
-u'栖栖遑遑',
-u'戚戚具爾',
-u'棄其馀魚',
-u'齊齊整整',
-u'騎牆兩下',
-u'七竅玲珑',
-u'七竅流血',
-u'七竅冒火',
-u'七竅生煙',
-u'崎嵚曆落',
-u'七擒七縱',
-u'七青八黃',
-u'奇請比它',
-u'祈晴禱雨',
-u'訖情盡意',
-u'七情六慾',
-u'棄情遺世',
-u'奇情異緻',
-u'乞窮儉相',
-u'棄瓊拾礫',
-u'栖丘飲谷',
-u'乞求之靴',
-u'齊趨并駕',
-u'齊驅并進',
-u'齊驅并驟',
-u'崎岖不平',
-u'凄然淚下',
-u'齊人攫金',
-u'氣忍聲吞',
-u'欺人是禍',
-u'欺人太甚',
-u'欺人忒甚',
-u'欺人以方',
-u'杞人憂天',
-u'氣人有笑人無',
-u'齊人之樂',
-u'欺人之論',
-u'欺人之談',
-u'杞人之憂',
-u'欺人自欺',
-u'妻榮夫貴',
-u'棄如敝屣',
-u'棄如弁髦',
-u'凄入肝脾',
-u'耆儒碩德',
-u'耆儒碩老',
-u'耆儒碩望',
-u'绮襦纨褲',
-u'欺軟怕硬',
-u'棄若敝屣',
-u'契若金蘭',
-u'氣弱聲嘶',
-u'欺三瞞四',
-u'氣殺鍾馗',
-u'欺善怕惡',
-u'七上八落',
-u'七上八下',
-u'欺上瞞下',
-u'欺上罔下',
-u'七舌八嘴',
-u'其誰與歸',
-u'漆身吞炭',
-u'七生七死',
-u'氣盛言宜',
-u'七事八事',
-u'欺市盜利',
-u'欺世盜名',
-u'欺世釣譽',
-u'起師動衆',
-u'七十二行',
-u'欺世惑俗',
-u'欺世亂俗',
-u'其實難副',
-u'氣勢磅礴',
-u'欺世罔俗',
-u'其勢洶洶',
-u'氣勢熏灼',
-u'齊世庸人',
-u'七首八腳',
-u'稽首再拜',
-u'泣數行下',
-u'棄書捐劍',
-u'器鼠難投',
-u'棋輸先着',
-u'棋輸先著',
-u'奇樹異草',
-u'氣數已盡',
-u'棋輸一着',
-u'欺霜傲雪',
-u'七死八活',
-u'起死回生',
-u'氣死莫告狀',
-u'七死七生',
-u'起死人肉白骨',
-u'起死肉骨',
-u'杞宋無征',
-u'耆宿大賢',
-u'七損八傷',
-u'七損八益',
-u'奇談怪論',
-u'泣涕如雨',
-u'齊天大聖',
-u'齊天洪福',
-u'欺天诳地',
-u'欺天罔地',
-u'欺天罔人',
-u'杞天之慮',
-u'七停八當',
-u'七通八達',
-u'漆桶底脫',
-u'棄同即異',
-u'齊頭并進',
-u'氣吐虹霓',
-u'氣吐眉揚',
-u'七推八扭',
-u'七推八阻',
-u'氣吞河山',
-u'氣吞虹蜺',
-u'氣吞湖海',
-u'氣吞寰宇',
-u'氣吞牛鬥',
-u'氣吞千裏',
-u'氣吞山河',
-u'氣吞萬裏',
-u'氣吞宇宙',
-u'氣吞雲夢',
-u'七拖八欠',
-u'七歪八倒',
-u'七歪八扭',
-u'七彎八拐',
-u'七灣八扭',
-u'齊纨魯缟',
-u'绮纨之歲',
-u'齊王舍牛',
-u'欺罔視聽',
-u'迄未成功',
-u'棄僞從真',
-u'其味無窮',
-u'氣味相得',
-u'氣味相投',
-u'棄文存質',
-u'奇文共賞',
-u'奇文瑰句',
-u'棄文就武',
-u'七窩八代',
-u'棄武修文',
-u'七郤八手',
-u'祁奚薦仇',
-u'祁奚舉午',
-u'祁奚舉子',
-u'七夕禮盒',
-u'綦谿利跂',
-u'七夕乞巧',
-u'氣息奄奄',
-u'祁奚之薦',
-u'祁奚之舉',
-u'棄瑕錄用',
-u'棄瑕取用',
-u'泣下如雨',
-u'棄瑕忘過',
-u'泣下沾襟',
-u'妻賢夫禍少',
-u'七賢之墓',
-u'七賢之箱',
-u'奇想天開',
-u'氣象萬千',
-u'七相五公',
-u'氣消膽奪',
-u'器小易盈',
-u'棄邪從正',
-u'棄邪歸正',
-u'齊心并力',
-u'齊心滌慮',
-u'齊心合力',
-u'欺心诳上',
-u'齊心戮力',
-u'齊心同力',
-u'棄信忘義',
-u'齊心協力',
-u'齊心一力',
-u'七星高照',
-u'奇形怪蟒',
-u'奇形怪相',
-u'奇形怪狀',
-u'跂行喙息',
-u'七星天牛',
-u'奇形異狀',
-u'泣血椎心',
-u'泣血捶膺',
-u'氣血方剛',
-u'泣血稽颡',
-u'泣血漣如',
-u'泣血枕戈',
-u'泣血錐心',
-u'氣壓山河',
-u'七言八語',
-u'奇言怪語',
-u'齊煙九點',
-u'其驗如響',
-u'氣咽聲絲',
-u'氣焰萬丈',
-u'起偃爲豎',
-u'氣焰嚣張',
-u'氣焰熏天',
-u'其言也善',
-u'騎揚州鶴',
-u'氣噎喉堵',
-u'棄義倍信',
-u'棄易求難',
-u'氣誼相投',
-u'歧義消解',
-u'奇異之塵',
-u'期頤之壽',
-u'其義自見',
-u'欺硬怕軟',
-u'其應如響',
-u'其應若響',
-u'氣湧如山',
-u'豈有此理',
-u'豈有是理',
-u'氣宇昂昂',
-u'器宇不凡',
-u'企予望之',
-u'氣逾霄漢',
-u'器宇軒昂',
-u'奇冤極枉',
-u'凄雲慘霧',
-u'起早搭黑',
-u'起早貪黑',
-u'欺詐高手',
-u'氣炸了肺',
-u'七張八嘴',
-u'七折八扣',
-u'騎者善堕',
-u'七貞九烈',
-u'奇珍異寶',
-u'奇珍異玩',
-u'齊整如一',
-u'七支八搭',
-u'棄之敝屣',
-u'棄之度外',
-u'棄之可惜',
-u'旗幟鮮明',
-u'棄智遺身',
-u'企踵可待',
-u'棄重取輕',
-u'齊州九點',
-u'欺主罔上',
-u'企伫之心',
-u'氣壯膽粗',
-u'氣壯河山',
-u'氣壯理直',
-u'氣壯如牛',
-u'氣壯山河',
-u'奇裝異服',
-u'七子八婿',
-u'七字成語',
-u'杞梓連抱',
-u'杞梓之才',
-u'杞梓之林',
-u'棄子逐妻',
-u'七縱八橫',
-u'七縱七擒',
-u'七足八手',
-u'齊足并馳',
-u'齊足并驅',
-u'企足矯首',
-u'七嘴八舌',
-u'七嘴八張',
-u'洽博多聞',
-u'恰到好處',
-u'恰逢其會',
-u'恰逢其機',
-u'恰好相反',
-u'掐尖落鈔',
-u'恰如其分',
-u'掐頭去尾',
-u'洽聞博見',
-u'洽聞強記',
-u'前跋後疐',
-u'乾巴利脆',
-u'乾巴利落',
-u'千百爲群',
-u'謙卑自牧',
-u'千變萬化',
-u'千變萬轸',
-u'千變萬狀',
-u'遣兵調将',
-u'千兵萬馬',
-u'前波未滅',
-u'千補百衲',
-u'千不該萬不該',
-u'前不見古人後不見來者',
-u'千不是萬不是',
-u'千部一腔',
-u'前不着村後不着店',
-u'千倉萬箱',
-u'千差萬別',
-u'千差萬錯',
-u'牽腸割肚',
-u'牽腸挂肚',
-u'牽腸萦心',
-u'淺嚐辄止',
-u'前朝後代',
-u'前車可鑒',
-u'前車之鑒',
-u'前塵影事',
-u'遷臣逐客',
-u'前程暗似漆',
-u'前程萬裏',
-u'前程遠大',
-u'謙沖有禮',
-u'謙沖自牧',
-u'遣愁索笑',
-u'千仇萬恨',
-u'乾愁萬斛',
-u'千愁萬緒',
-u'淺出深入',
-u'牽船作屋',
-u'千瘡百孔',
-u'千瘡百痍',
-u'千錘百鏈',
-u'千錘打鑼一錘定音',
-u'遣詞措意',
-u'遣詞立意',
-u'遣詞造意',
-u'千湊萬挪',
-u'乾脆利落',
-u'乾脆利索',
-u'千村萬落',
-u'鉛刀驽馬',
-u'千刀萬剁',
-u'千刀萬剮',
-u'鉛刀爲铦',
-u'鉛刀一割',
-u'愆德隳好',
-u'潛德秘行',
-u'潛德隐行',
-u'遷地爲良',
-u'千叮萬囑',
-u'前堵後絆',
-u'前堵後追',
-u'前度劉郎',
-u'乾端坤倪',
-u'千端萬緒',
-u'潛遁幽仰',
-u'千恩萬謝',
-u'千帆竟發',
-u'千方百計',
-u'千方萬計',
-u'千峰百嶂',
-u'千峰萬壑',
-u'遷風移俗',
-u'前鋒之靴',
-u'千佛一面',
-u'前腐後繼',
-u'前覆後戒',
-u'前俯後仰',
-u'千夫諾諾不如一士谔谔',
-u'潛伏時間',
-u'千夫所指',
-u'乾綱不振',
-u'前個後繼',
-u'前歌後舞',
-u'前功皆棄',
-u'前功盡廢',
-u'前功盡滅',
-u'前功盡棄',
-u'謙躬下士',
-u'謙恭虛己',
-u'千溝萬壑',
-u'千古不磨',
-u'千古不朽',
-u'千古傳誦',
-u'千古獨步',
-u'千古絕唱',
-u'千古絕調',
-u'千古流傳',
-u'千古美談',
-u'千古奇聞',
-u'千古同慨',
-u'前古未聞',
-u'前古未有',
-u'千古笑端',
-u'千古一律',
-u'千古一時',
-u'千古一轍',
-u'千古卓識',
-u'千古罪人',
-u'潛光匿曜',
-u'潛光隐德',
-u'潛光隐耀',
-u'謙光自抑',
-u'牽鬼上劍',
-u'錢過北鬥',
-u'潛骸竄影',
-u'牽合附會',
-u'前合後偃',
-u'前合後仰',
-u'千紅萬紫',
-u'前後相悖',
-u'前虎後狼',
-u'前呼後擁',
-u'千呼萬喚',
-u'千喚萬喚',
-u'千歡萬喜',
-u'牽黃臂蒼',
-u'千回百折',
-u'千回百轉',
-u'千回萬轉',
-u'千彙萬狀',
-u'千家萬戶',
-u'淺見薄識',
-u'淺見寡識',
-u'淺見寡聞',
-u'遣将調兵',
-u'遣将征兵',
-u'千嬌百媚',
-u'千嬌百态',
-u'潛蛟困鳳',
-u'千金弊帚',
-u'千金不換',
-u'千金不移',
-u'千金貴體',
-u'前襟後裾',
-u'千金買賦',
-u'千金買骨',
-u'千金買笑',
-u'千金市骨',
-u'千金一瓠',
-u'千金一刻',
-u'千金一壸',
-u'千金一諾',
-u'千金一笑',
-u'千金一擲',
-u'千金之家',
-u'千金之裘非一狐之腋',
-u'千金之軀',
-u'千金之子',
-u'千斤重擔',
-u'潛精積思',
-u'乾淨俐落',
-u'乾淨利索',
-u'千經萬典',
-u'潛精研思',
-u'牽經引禮',
-u'前倨後卑',
-u'前倨後恭',
-u'千軍萬馬',
-u'千鈞爲輕',
-u'千軍易得一将難求',
-u'千鈞一發',
-u'千鈞重負',
-u'千看不如一練',
-u'遷客騷人',
-u'錢可使鬼',
-u'錢可通神',
-u'千孔百瘡',
-u'鉗口不言',
-u'鉗口挢舌',
-u'鉗口結舌',
-u'拑口禁語',
-u'鉗口韬筆',
-u'鉗口吞舌',
-u'乾坤互移',
-u'乾坤無極',
-u'乾坤一擲',
-u'乾坤再造',
-u'遷蘭變鮑',
-u'千了萬當',
-u'千裏不絕',
-u'千裏不同風',
-u'千裏不同風百裏不同俗',
-u'千裏莼羹',
-u'千裏鵝毛',
-u'千裏寄鵝毛',
-u'千裏結言',
-u'千裏駿骨',
-u'千裏饋糧士有饑色',
-u'千裏命駕',
-u'愆戾山積',
-u'千裏神交',
-u'千裏送鵝毛',
-u'千裏送鵝毛禮輕人意重',
-u'千裏送毫毛',
-u'千裏迢迢',
-u'千裏迢遙',
-u'千裏同風',
-u'千裏無煙',
-u'千裏一曲',
-u'千裏移檄',
-u'千裏姻緣一線牽',
-u'千裏猶面',
-u'千裏之堤',
-u'千裏之駒',
-u'千裏之任',
-u'千裏之行',
-u'千裏之行始于足下',
-u'千裏之志',
-u'千裏之足',
-u'千裏做官爲的吃穿',
-u'千了百當',
-u'千了百了',
-u'潛鱗戢羽',
-u'千伶百俐',
-u'乾陵怪圈',
-u'千靈輕铠',
-u'千齡萬代',
-u'潛龍伏虎',
-u'牽蘿補屋',
-u'牽蘿莫補',
-u'黔驢技孤',
-u'黔驢技窮',
-u'千慮一得',
-u'千慮一行',
-u'千慮一失',
-u'黔驢之計',
-u'鉗馬銜枚',
-u'千賣萬賣虧本兒不賣',
-u'前慢後恭',
-u'前門拒虎',
-u'前門拒虎後門進狼',
-u'揵門退掃',
-u'千門萬戶',
-u'前冥後明',
-u'千磨百折',
-u'前目後凡',
-u'千難萬苦',
-u'千難萬難',
-u'千難萬險',
-u'潛能頭盔',
-u'千年萬載',
-u'千年王八萬年龜',
-u'千年修來共枕眠',
-u'千年一律',
-u'牽牛下井',
-u'牽牛織女',
-u'千奴共一膽',
-u'遷怒及人',
-u'遷怒于人',
-u'遷怒于衆',
-u'倩女離魂',
-u'倩女幽魂',
-u'前怕狼後怕虎',
-u'千篇一律',
-u'前仆後踣',
-u'前仆後繼',
-u'前仆後起',
-u'千奇百怪',
-u'搴旗虎将',
-u'搴旗虜将',
-u'潛氣内轉',
-u'搴旗取将',
-u'搴旗斬馘',
-u'搴旗斬将',
-u'謙謙君子',
-u'千千萬萬',
-u'謙謙下士',
-u'乾乾翼翼',
-u'牽強附合',
-u'牽強附會',
-u'遷喬出谷',
-u'遷喬之望',
-u'潛竊陽剽',
-u'千秋人物',
-u'千秋萬代',
-u'千秋萬古',
-u'千秋萬世',
-u'千秋萬歲',
-u'缱绻難舍',
-u'缱绻羨愛',
-u'牽瘸驢上窟窿橋',
-u'謙讓未遑',
-u'千人傳實',
-u'千人諾諾不如一士谔谔',
-u'前人撒土迷了後人的眼',
-u'前人失腳後人把滑',
-u'千人所指',
-u'千人所指無病而死',
-u'千仞無枝',
-u'千人嫌萬人恨',
-u'千人一面',
-u'千人一狀',
-u'前人載樹',
-u'前人種樹後人乘涼',
-u'倩人捉刀',
-u'千日砍柴一日燒',
-u'潛濡默被',
-u'潛濡默化',
-u'遷善黜惡',
-u'遷善改過',
-u'遷善去惡',
-u'遷善塞違',
-u'千山萬壑',
-u'千山萬水',
-u'塹山堙谷',
-u'潛山隐市',
-u'遷善遠罪',
-u'搴裳躩步',
-u'潛深伏隩',
-u'潛神嘿規',
-u'潛神默記',
-u'潛神默思',
-u'潛身縮首',
-u'潛身遠禍',
-u'潛身遠迹',
-u'千勝将軍',
-u'千生萬劫',
-u'千乘萬騎',
-u'千生萬死',
-u'前事不忘',
-u'前事不忘後事之師',
-u'千事吉祥',
-u'錢是人之膽',
-u'潛師襲遠',
-u'謙受益滿招損',
-u'潛水頭盔',
-u'千水萬山',
-u'淺水旋龜',
-u'牽絲扳騰',
-u'牽四挂五',
-u'前思後想',
-u'遷思回慮',
-u'牽絲攀藤',
-u'千絲萬縷',
-u'千思萬想',
-u'千随百順',
-u'千歲鶴歸',
-u'千歲流方',
-u'千歲一時',
-u'前所未見',
-u'前所未聞',
-u'前所未有',
-u'千态萬狀',
-u'乾啼濕哭',
-u'千條萬端',
-u'千條萬縷',
-u'千條萬緒',
-u'前庭懸魚',
-u'謙聽則明',
-u'前同步碼',
-u'千頭橘奴',
-u'千頭木奴',
-u'千頭萬序',
-u'前徒倒戈',
-u'黔突暖席',
-u'潛圖問鼎',
-u'前途無量',
-u'千推萬阻',
-u'千妥萬當',
-u'千妥萬妥',
-u'前挽後推',
-u'千萬買鄰',
-u'前危後則',
-u'淺聞小見',
-u'前無古人',
-u'前無古人後無來者',
-u'牽五挂四',
-u'錢物輕微',
-u'前無去路',
-u'牽物引類',
-u'淺希近求',
-u'前向串擾',
-u'潛消默化',
-u'千辛百苦',
-u'潛心滌慮',
-u'潛心笃志',
-u'潛心積慮',
-u'千辛萬苦',
-u'潛形谲迹',
-u'潛形匿迹',
-u'潛形匿影',
-u'遣興陶情',
-u'千形萬态',
-u'千形萬狀',
-u'潛行偵測',
-u'潛休隐德',
-u'謙虛謹慎',
-u'謙虛敬慎',
-u'千緒萬端',
-u'謙遜下士',
-u'千崖萬壑',
-u'前言不搭後語',
-u'遣言措意',
-u'遷延顧望',
-u'遷延觀望',
-u'遷延過時',
-u'遷延稽留',
-u'千岩競秀',
-u'錢眼裏頭翻筋鬥',
-u'遷延日月',
-u'前沿哨所',
-u'遷延時日',
-u'遷延歲月',
-u'千岩萬谷',
-u'千岩萬壑',
-u'千言萬說',
-u'千言萬語',
-u'前言往行',
-u'牽羊擔酒',
-u'前仰後合',
-u'千羊之皮不如一狐之腋',
-u'千葉石林',
-u'潛移暗化',
-u'千依百順',
-u'牽衣頓足',
-u'牽一發而動全身',
-u'潛移嘿奪',
-u'遷移開銷',
-u'潛移默奪',
-u'潛移默化',
-u'潛移默運',
-u'潛移默轉',
-u'牽衣投轄',
-u'千依萬順',
-u'謙以下士',
-u'牽衣肘見',
-u'牽引附會',
-u'前因後果',
-u'牽引射線',
-u'遷莺出谷',
-u'前有車後有轍',
-u'遷于喬木',
-u'千語萬言',
-u'前園後圃',
-u'遷躍扭木',
-u'遷躍平原',
-u'遷躍獸肉',
-u'千災百病',
-u'千災百難',
-u'千載獨步',
-u'千載流芳',
-u'千載難逢',
-u'千載難遇',
-u'千載奇遇',
-u'千載一彈',
-u'千載一逢',
-u'千載一合',
-u'千載一會',
-u'千載一日',
-u'千載一聖',
-u'千載一時',
-u'千載一遇',
-u'譴責之盾',
-u'前瞻後顧',
-u'千章萬句',
-u'牽着不走打着倒退',
-u'前遮後擁',
-u'前轍可鑒',
-u'淺斟低倡',
-u'淺斟低漚',
-u'淺斟低酌',
-u'千針石林',
-u'千真萬确',
-u'千真萬真',
-u'千枝萬葉',
-u'千狀萬端',
-u'千狀萬态',
-u'錢莊掌櫃',
-u'前綴性質',
-u'千姿百态',
-u'千姿萬态',
-u'潛蹤匿影',
-u'潛蹤蹑迹',
-u'潛蹤隐迹',
-u'鉗嘴鳄魚',
-u'謙尊而光',
-u'強本節用',
-u'強本弱末',
-u'強本弱支',
-u'強兵富國',
-u'強兵足食',
-u'将伯之呼',
-u'将伯之助',
-u'強不犯弱',
-u'強不淩弱',
-u'強不知以爲知',
-u'強詞奪理',
-u'強詞奪正',
-u'強打精神',
-u'槍刀劍戟',
-u'強盜邏輯',
-u'牆倒衆人推',
-u'強得易貧',
-u'搶地呼天',
-u'強而後可',
-u'強而示弱',
-u'強飯廉頗',
-u'強飯自愛',
-u'牆風壁耳',
-u'強風之拳',
-u'強凫變鶴',
-u'強幹弱枝',
-u'牆高基下',
-u'強弓勁孥',
-u'強弓勁弩',
-u'強弓射遠箭',
-u'強弓硬弩',
-u'強聒不舍',
-u'強國富民',
-u'戕害不辜',
-u'牆花路草',
-u'牆花路柳',
-u'強記博聞',
-u'強記洽聞',
-u'強加于人',
-u'強健靈魂',
-u'強奸民意',
-u'強将手下無弱兵',
-u'搶劫一空',
-u'锵金铿玉',
-u'锵金鳴玉',
-u'搶救無效',
-u'強客不壓主',
-u'強連通圖',
-u'槍林彈雨',
-u'槍林刀樹',
-u'強龍不壓地頭蛇',
-u'強媒硬保',
-u'牆面而立',
-u'牆内開花牆外香',
-u'強弩末矢',
-u'強弩之末',
-u'強人剪徑',
-u'強人所難',
-u'強弱異勢',
-u'牆上泥皮',
-u'戕身伐命',
-u'槍聲刀影',
-u'強識博聞',
-u'強食靡角',
-u'強食弱肉',
-u'強仕之年',
-u'強食自愛',
-u'強死賴活',
-u'強死強活',
-u'牆頭馬上',
-u'牆頭一棵草風吹兩邊倒',
-u'強爲歡笑',
-u'羌無故實',
-u'強顔歡笑',
-u'槍煙炮雨',
-u'強顔爲笑',
-u'強毅果敢',
-u'牆有風壁有耳',
-u'強枝弱本',
-u'強直自遂',
-u'強中自有強中手',
-u'強自取折',
-u'強自取柱',
-u'強宗右姓',
-u'強作解人',
-u'峭壁之泉',
-u'敲冰戛玉',
-u'敲冰求火',
-u'敲冰索火',
-u'敲冰玉屑',
-u'巧不可階',
-u'巧不若拙',
-u'巧不勝拙',
-u'俏成俏敗',
-u'樵村漁浦',
-u'巧奪天工',
-u'巧發奇中',
-u'巧婦難爲無米之炊',
-u'敲膏吸髓',
-u'敲骨剝髓',
-u'敲骨取髓',
-u'敲骨吸髓',
-u'敲骨榨髓',
-u'橋歸橋路歸路',
-u'巧捷萬端',
-u'敲金擊石',
-u'敲金擊玉',
-u'敲金戛玉',
-u'鞘裏藏刀',
-u'巧立名目',
-u'巧立名色',
-u'俏臉做給瞎子看',
-u'翹領企踵',
-u'喬龍畫虎',
-u'峭論鲠議',
-u'敲鑼打鼓',
-u'敲鑼放炮',
-u'喬模喬樣',
-u'巧能成事',
-u'敲牛宰馬',
-u'跷蹊作怪',
-u'喬遷之喜',
-u'喬喬畫畫',
-u'悄悄冥冥',
-u'巧取豪奪',
-u'愀然變色',
-u'愀然不樂',
-u'愀然無樂',
-u'悄然無聲',
-u'敲山震虎',
-u'巧舌如簧',
-u'憔神悴力',
-u'橋是橋路是路',
-u'翹首企足',
-u'翹首引領',
-u'巧思成文',
-u'喬松之壽',
-u'樵蘇不爨',
-u'樵蘇後爨',
-u'樵蘇失爨',
-u'敲髓灑膏',
-u'巧同造化',
-u'敲頭大棒',
-u'巧偷豪奪',
-u'巧僞趨利',
-u'喬文假醋',
-u'悄無人聲',
-u'巧言利口',
-u'巧言令色',
-u'巧言偏辭',
-u'巧言如簧',
-u'俏眼做給瞎子看',
-u'巧語花言',
-u'樵語牧唱',
-u'敲詐勒索',
-u'僑終蹇謝',
-u'谯周獨笑',
-u'喬裝打扮',
-u'喬裝改扮',
-u'喬裝假扮',
-u'巧拙有素',
-u'跷足而待',
-u'跷足抗首',
-u'翹足可期',
-u'翹足企首',
-u'跷足以待',
-u'翹足引領',
-u'巧作名目',
-u'切齒腐心',
-u'切齒痛恨',
-u'切齒痛心',
-u'切齒咬牙',
-u'切齒之仇',
-u'切瑳琢磨',
-u'惬當之論',
-u'锲而不舍',
-u'怯防勇戰',
-u'挈婦将雛',
-u'竊斧生疑',
-u'妾婦之道',
-u'切膚之痛',
-u'竊鈇之疑',
-u'切割靈魂',
-u'竊鈎竊國',
-u'竊鈎者誅',
-u'切骨之仇',
-u'切骨之寒',
-u'切骨之恨',
-u'竊國者侯',
-u'切近的當',
-u'竊據要津',
-u'挈榼提壺',
-u'切理會心',
-u'切理餍心',
-u'挈領提綱',
-u'切磨箴規',
-u'竊齧鬥暴',
-u'竊弄威權',
-u'挈瓶小智',
-u'挈瓶之智',
-u'切切此布',
-u'竊竊偶語',
-u'竊竊私議',
-u'切切私語',
-u'切切細語',
-u'切切于心',
-u'切切在心',
-u'切肉匕首',
-u'切身體會',
-u'怯聲怯氣',
-u'且食蛤蜊',
-u'切樹倒根',
-u'竊鐵之疑',
-u'竊位素餐',
-u'切問近思',
-u'惬心貴當',
-u'竊幸乘寵',
-u'切要關頭',
-u'惬意小火',
-u'竊玉偷香',
-u'竊簪之臣',
-u'切中時弊',
-u'切中時病',
-u'竊鍾掩耳',
-u'切中要害',
-u'且住爲佳',
-u'禽奔獸遁',
-u'寝不安席',
-u'寝不成寐',
-u'親不敵貴',
-u'親不隔疏',
-u'寝不遑安',
-u'寝不聊寐',
-u'親操井臼',
-u'噙齒戴發',
-u'親當矢石',
-u'琴斷朱弦',
-u'琴高乘鯉',
-u'琴歌酒賦',
-u'勤工儉學',
-u'秦關百二',
-u'寝關曝纩',
-u'衾寒枕冷',
-u'擒虎拿蛟',
-u'秦歡晉愛',
-u'親極反疏',
-u'琴劍飄零',
-u'勤儉樸實',
-u'擒奸讨暴',
-u'擒奸摘伏',
-u'擒奸擿伏',
-u'勤儉治家',
-u'秦晉之好',
-u'秦晉之匹',
-u'秦晉之緣',
-u'秦鏡高懸',
-u'寝饋不安',
-u'寝饋難安',
-u'寝饋其中',
-u'禽困覆車',
-u'親力親爲',
-u'親離衆叛',
-u'親臨其境',
-u'秦陵将軍',
-u'擒龍縛虎',
-u'擒龍捉虎',
-u'秦樓楚館',
-u'秦樓謝館',
-u'親冒矢石',
-u'寝寐求賢',
-u'親密無間',
-u'勤能補拙',
-u'親昵無間',
-u'寝皮食肉',
-u'沁脾香氣',
-u'嵚崎磊落',
-u'嵚崎曆落',
-u'琴棋詩酒',
-u'琴棋書畫',
-u'勤勤懇懇',
-u'寝丘之志',
-u'沁人肺腑',
-u'親仁善鄰',
-u'沁人心肺',
-u'沁人心腑',
-u'沁人心脾',
-u'親如把臂',
-u'親如骨肉',
-u'親如手足',
-u'沁入心脾',
-u'親若手足',
-u'琴瑟不和',
-u'琴瑟不調',
-u'琴瑟和好',
-u'琴瑟和鳴',
-u'琴瑟和調',
-u'琴瑟和同',
-u'琴瑟和諧',
-u'琴瑟靜好',
-u'琴瑟失調',
-u'琴瑟調和',
-u'琴瑟同調',
-u'琴瑟相調',
-u'琴瑟相諧',
-u'琴瑟與笙簧',
-u'琴瑟之好',
-u'寝苫枕草',
-u'寝苫枕幹',
-u'寝苫枕戈',
-u'寝苫枕塊',
-u'寝苫枕土',
-u'親上成親',
-u'親上做親',
-u'勤慎肅恭',
-u'寝食不安',
-u'寝食俱廢',
-u'秦失其鹿',
-u'螓首蛾眉',
-u'親疏貴贱',
-u'琴挑文君',
-u'秦庭朗鏡',
-u'秦庭之哭',
-u'親痛仇快',
-u'勤王之師',
-u'親無怨心',
-u'禽息鳥視',
-u'欽賢好士',
-u'親賢遠佞',
-u'琴心劍膽',
-u'琴心劍糁',
-u'琴心相挑',
-u'勤學好問',
-u'勤學苦練',
-u'衾影無慚',
-u'衾影無愧',
-u'衾影無怍',
-u'勤有功戲無益',
-u'禽有禽言獸有獸語',
-u'秦越肥瘠',
-u'秦約晉盟',
-u'勤則不匮',
-u'親則不謝謝則不親',
-u'擒賊先擒王',
-u'親者痛仇者快',
-u'親自出馬',
-u'擒縱自如',
-u'清白之人',
-u'傾抱寫誠',
-u'清跸傳道',
-u'磬筆難書',
-u'青弁使者',
-u'輕薄少年',
-u'輕薄無禮',
-u'輕薄無行',
-u'輕薄無知',
-u'情不可卻',
-u'情不自禁',
-u'情不自堪',
-u'情不自勝',
-u'情不自已',
-u'輕财貴義',
-u'輕财好士',
-u'輕财好義',
-u'輕财敬士',
-u'輕财任俠',
-u'輕财尚義',
-u'輕财仗義',
-u'輕财重士',
-u'輕财重土',
-u'輕财重義',
-u'擎蒼牽黃',
-u'清曹峻府',
-u'青草平原',
-u'清茶淡話',
-u'傾腸倒肚',
-u'傾腸倒腹',
-u'情長紙短',
-u'傾巢出動',
-u'傾巢而出',
-u'傾巢來犯',
-u'輕車減從',
-u'輕車介士',
-u'輕車快馬',
-u'輕車熟道',
-u'輕車熟路',
-u'清塵濁水',
-u'傾城而出',
-u'傾城傾國',
-u'情癡情種',
-u'晴初霜旦',
-u'青出于藍',
-u'青出于藍勝于藍',
-u'青春兩敵',
-u'青春難再',
-u'情詞悱恻',
-u'清詞麗句',
-u'清辭麗曲',
-u'清詞妙句',
-u'情淡愛馳',
-u'清淡霸業',
-u'輕刀脔割',
-u'青燈古佛',
-u'青燈黃卷',
-u'慶吊不通',
-u'慶吊不行',
-u'慶吊之禮',
-u'輕動幹戈',
-u'輕動遠舉',
-u'情窦初開',
-u'情窦漸開',
-u'清都绛阙',
-u'清都紫府',
-u'清都紫微',
-u'清毒圖騰',
-u'傾耳側目',
-u'傾耳戴目',
-u'傾耳而聽',
-u'傾耳拭目',
-u'傾耳細聽',
-u'輕而易舉',
-u'清耳悅心',
-u'傾耳注目',
-u'情非得已',
-u'青峰獨秀',
-u'清風高節',
-u'清風高誼',
-u'清風勁節',
-u'清風峻節',
-u'清風朗月',
-u'清風亮節',
-u'清風兩袖',
-u'清風明月',
-u'輕賦薄斂',
-u'情孚意合',
-u'傾蓋論交',
-u'傾蓋如故',
-u'傾蓋之交',
-u'青肝碧血',
-u'傾肝瀝膽',
-u'輕歌慢舞',
-u'輕歌妙舞',
-u'清歌雅舞',
-u'情根愛胎',
-u'情根欲種',
-u'清宮除道',
-u'請功受賞',
-u'清規戒律',
-u'清鍋冷竈',
-u'傾國傾城',
-u'青過于藍',
-u'傾國之士',
-u'傾海爲酒',
-u'情好日密',
-u'清和平允',
-u'青和之石',
-u'青紅皁白',
-u'清華東門',
-u'青華雷祖',
-u'青黃不交',
-u'青黃不接',
-u'青黃溝木',
-u'青黃未接',
-u'青黃無主',
-u'清灰冷火',
-u'清灰冷竈',
-u'清輝項鏈',
-u'清渾皁白',
-u'輕雞愛骛',
-u'輕騎簡從',
-u'情急欲淚',
-u'情急智生',
-u'傾家敗産',
-u'傾家蕩産',
-u'傾家竭産',
-u'傾家盡産',
-u'傾家破産',
-u'清簡寡欲',
-u'情見乎詞',
-u'情見乎言',
-u'情堅金石',
-u'情見勢竭',
-u'情見勢屈',
-u'情見埶竭',
-u'情見于詞',
-u'情見于色',
-u'請将不如激将',
-u'輕腳輕手',
-u'清交素友',
-u'清潔軟盤',
-u'清介有守',
-u'清靜寡欲',
-u'清淨寂滅',
-u'情景交融',
-u'清靜無爲',
-u'清酒紅人面财帛動人心',
-u'輕舉絕俗',
-u'輕舉妄動',
-u'輕舉遠遊',
-u'請君入甕',
-u'傾柯衛足',
-u'頃刻之間',
-u'清空目标的仇恨值',
-u'清恐人知',
-u'磬控縱送',
-u'青口白舌',
-u'輕口薄舌',
-u'輕口輕舌',
-u'清曠超俗',
-u'傾筐倒庋',
-u'傾筐倒箧',
-u'青藍冰水',
-u'輕浪浮薄',
-u'情禮兼到',
-u'清麗俊逸',
-u'情理難容',
-u'青藜學士',
-u'青臉獠牙',
-u'輕憐疼惜',
-u'輕憐痛惜',
-u'清廉正直',
-u'輕憐重惜',
-u'清洌可鑒',
-u'青龍金匮',
-u'青樓楚館',
-u'輕祿傲貴',
-u'輕慮淺謀',
-u'青梅竹馬',
-u'青面獠牙',
-u'情面難卻',
-u'輕描淡寫',
-u'清廟之器',
-u'輕蔑之戒',
-u'清明在躬',
-u'傾囊倒箧',
-u'青囊秘學',
-u'傾囊相付',
-u'傾囊相贈',
-u'傾囊相助',
-u'傾囊以助',
-u'青鳥傳信',
-u'青鳥傳音',
-u'青鳥殷勤',
-u'輕諾寡信',
-u'青女素娥',
-u'傾盆大雨',
-u'清貧寡欲',
-u'清貧如洗',
-u'清品猶蘭虛懷若竹',
-u'輕騎減從',
-u'罄其所有',
-u'情凄意切',
-u'青錢萬選',
-u'青錢學士',
-u'輕敲緩擊',
-u'情巧萬端',
-u'清清楚楚',
-u'情情如意',
-u'卿卿我我',
-u'清清之水',
-u'輕裘大帶',
-u'輕裘肥馬',
-u'輕裘緩帶',
-u'輕裘緩辔',
-u'輕裘朱履',
-u'情趣相得',
-u'清泉平原',
-u'青裙缟袂',
-u'輕饒素放',
-u'情人眼裏出西施',
-u'清如冰壺',
-u'輕如鴻毛',
-u'輕若鴻毛',
-u'情若手足',
-u'青山不老',
-u'青山常在柴不空',
-u'情善迹非',
-u'輕衫涼笠',
-u'青山綠水',
-u'青衫司馬',
-u'青山一發',
-u'青山依舊',
-u'慶賞無厭',
-u'情深骨肉',
-u'清身潔己',
-u'情深伉俪',
-u'情深如海',
-u'情深似海',
-u'情深潭水',
-u'輕身下氣',
-u'輕身徇義',
-u'情深義厚',
-u'情深一往',
-u'情深義重',
-u'傾身營救',
-u'情深友于',
-u'輕身重義',
-u'青勝于蘭',
-u'輕生重義',
-u'清聖濁賢',
-u'輕視傲物',
-u'青史标名',
-u'青史不泯',
-u'輕事重報',
-u'青史傳名',
-u'青史垂名',
-u'青史流芳',
-u'青史留名',
-u'青史名留',
-u'輕世肆志',
-u'磬石之固',
-u'輕手蹑腳',
-u'輕手輕腳',
-u'輕手軟腳',
-u'情恕理遣',
-u'青絲白馬',
-u'情絲纏綿',
-u'輕死得生',
-u'情絲割斷',
-u'輕死重氣',
-u'輕死重義',
-u'青松落色',
-u'清算聖印',
-u'清算之戒',
-u'情随境變',
-u'情随事遷',
-u'情态公理',
-u'青苔黃葉',
-u'青苔之瘤',
-u'清談高論',
-u'清湯寡水',
-u'青堂瓦舍',
-u'情天愛海',
-u'青天白日',
-u'擎天駕海',
-u'情天孽海',
-u'青天霹靂',
-u'晴天炸雷',
-u'擎天之柱',
-u'清天濁地',
-u'輕挑漫剔',
-u'蜻蜓點水',
-u'蜻蜓撼石柱',
-u'情同骨肉',
-u'情同手足',
-u'情同一家',
-u'情同魚水',
-u'情投契合',
-u'情投誼合',
-u'情投意洽',
-u'情投意忺',
-u'輕吞慢吐',
-u'清微淡遠',
-u'輕偎低傍',
-u'傾危之士',
-u'清渭濁泾',
-u'情文并茂',
-u'情文相生',
-u'輕徙鳥舉',
-u'清晰預兆',
-u'情見乎辭',
-u'情見力屈',
-u'輕賢慢士',
-u'請先入甕',
-u'清閑自在',
-u'傾箱倒箧',
-u'青霄白日',
-u'青霄直上',
-u'青鞋布襪',
-u'清心寡欲',
-u'傾心竭力',
-u'傾心結納',
-u'清新隽永',
-u'清新俊逸',
-u'清信男女',
-u'清心少欲',
-u'清心省事',
-u'傾心吐膽',
-u'傾心吐糁',
-u'清虛洞府',
-u'輕迅猛絕',
-u'清雅絕塵',
-u'輕言寡信',
-u'輕言輕語',
-u'輕言軟語',
-u'輕言肆口',
-u'輕言細語',
-u'青眼相待',
-u'青眼相看',
-u'輕傜薄賦',
-u'輕徭薄稅',
-u'輕徭薄賦',
-u'傾搖懈弛',
-u'清夜扪心',
-u'清議不容',
-u'情意綿綿',
-u'傾以身免',
-u'情義之戒',
-u'傾銀潑乳',
-u'清音幽韻',
-u'清瑩透徹',
-u'清瑩秀澈',
-u'情有可原',
-u'情逾骨肉',
-u'情欲寡淺',
-u'輕于鴻毛',
-u'輕于去就',
-u'青玉之石',
-u'清原正本',
-u'傾月法冠',
-u'青雲得路',
-u'青雲得意',
-u'青雲獨步',
-u'青雲幹呂',
-u'晴雲秋月',
-u'青雲萬裏',
-u'青雲之上',
-u'青雲之志',
-u'情真意切',
-u'情真罪當',
-u'情知故犯',
-u'青枝綠葉',
-u'清之水精',
-u'情至意盡',
-u'輕重倒置',
-u'輕重緩急',
-u'輕重疾徐',
-u'情重姜肱',
-u'輕重失宜',
-u'情鍾我輩',
-u'情鍾意笃',
-u'輕重之短',
-u'輕舟便楫',
-u'青州從事',
-u'青竹丹楓',
-u'磬竹難書',
-u'傾注全力',
-u'情逐事遷',
-u'輕妝薄粉',
-u'輕裝簡從',
-u'輕裝前進',
-u'輕裝上陣',
-u'清濁難澄',
-u'清酌庶羞',
-u'清濁同流',
-u'青紫拾芥',
-u'請自隗始',
-u'輕卒銳兵',
-u'輕嘴薄舌',
-u'窮本極源',
-u'窮兵黩武',
-u'窮兵極武',
-u'窮波讨源',
-u'窮不失義',
-u'窮唱渭城',
-u'窮池之魚',
-u'窮愁潦倒',
-u'窮愁著書',
-u'瓊廚金穴',
-u'窮處之士',
-u'窮村僻壤',
-u'窮大失居',
-u'窮達有命',
-u'窮當益堅',
-u'瓊島春雲',
-u'惸獨無依',
-u'瓊堆玉砌',
-u'窮而後工',
-u'窮富極貴',
-u'瓊府金穴',
-u'窮根尋底',
-u'窮根尋葉',
-u'窮工極巧',
-u'窮貴極富',
-u'瓊閨秀玉',
-u'瓊花片片',
-u'窮極其妙',
-u'窮急生瘋',
-u'窮極思變',
-u'窮極無聊',
-u'窮極兇惡',
-u'窮極要妙',
-u'窮極則變',
-u'窮家富路',
-u'瓊漿金液',
-u'瓊漿玉液',
-u'窮舉測試',
-u'窮舉攻擊',
-u'窮舉搜索',
-u'窮居野處',
-u'窮坑難滿',
-u'窮寇莫追',
-u'窮寇勿追',
-u'窮困潦倒',
-u'窮老盡氣',
-u'窮理盡妙',
-u'窮理盡微',
-u'窮理盡性',
-u'窮裏空舍',
-u'瓊林滿眼',
-u'瓊林玉樹',
-u'瓊林玉質',
-u'瓊樓金阙',
-u'瓊樓玉宇',
-u'窮妙極巧',
-u'窮乃益堅',
-u'窮年累世',
-u'窮年累歲',
-u'窮年累月',
-u'窮鳥入懷',
-u'窮且益堅',
-u'茕茕孤立',
-u'茕茕孑立',
-u'茕茕無依',
-u'窮泉朽壤',
-u'跫然足音',
-u'窮人不攀富親',
-u'窮人多苦命',
-u'窮人思眼前',
-u'窮日落月',
-u'窮日之力',
-u'窮腮乞臉',
-u'窮山惡水',
-u'窮山惡水多刁民',
-u'窮山僻壤',
-u'窮奢極侈',
-u'窮奢極慾',
-u'窮神觀化',
-u'窮神知化',
-u'窮鼠齧狸',
-u'窮鼠齧貓',
-u'瓊樹生花',
-u'窮思畢精',
-u'窮思極想',
-u'窮斯濫矣',
-u'窮酸餓醋',
-u'窮态極妍',
-u'瓊台玉閣',
-u'瓊台玉宇',
-u'窮天極地',
-u'窮通得失',
-u'窮通皆命',
-u'窮通榮辱',
-u'窮通有命',
-u'窮途潦倒',
-u'窮途落魄',
-u'窮途末路',
-u'窮途之哭',
-u'窮纖入微',
-u'窮相骨頭',
-u'窮巷掘門',
-u'跫響空谷',
-u'窮巷陋室',
-u'窮鄉僻壤',
-u'窮心劇力',
-u'窮形極相',
-u'窮形極狀',
-u'窮形盡相',
-u'窮形盡緻',
-u'窮形盡狀',
-u'窮兇極惡',
-u'窮兇極虐',
-u'窮閻漏屋',
-u'窮幽極微',
-u'窮猿奔林',
-u'窮原竟委',
-u'窮原究委',
-u'窮猿失木',
-u'窮源朔流',
-u'窮源溯流',
-u'窮猿投林',
-u'窮猿投樹',
-u'窮源推本',
-u'窮在鬧市無人問',
-u'窮則變變則通',
-u'窮則獨善其身',
-u'窮則思變',
-u'瓊枝玉樹',
-u'瓊枝玉葉',
-u'窮追苦克',
-u'裘敝金殘',
-u'裘弊金盡',
-u'秋波送情',
-u'秋波微轉',
-u'秋波盈盈',
-u'求不厭寡',
-u'求才若渴',
-u'秋草人情',
-u'求大同存小異',
-u'求道于盲',
-u'求端訊末',
-u'求端于盲',
-u'秋風過耳',
-u'秋風落葉',
-u'秋風掃落葉',
-u'秋風掃葉',
-u'秋風團扇',
-u'秋風纨扇',
-u'求福禳災',
-u'秋高馬肥',
-u'秋高氣和',
-u'秋高氣爽',
-u'秋高氣肅',
-u'裘葛之遺',
-u'求過于供',
-u'秋毫不犯',
-u'秋毫見捐',
-u'秋毫勿犯',
-u'求好心切',
-u'秋豪之末',
-u'丘壑泾渭',
-u'秋後算賬',
-u'求劍刻舟',
-u'求漿得酒',
-u'秋菊春蘭',
-u'丘裏之言',
-u'丘陵洞穴',
-u'求馬買骨',
-u'裘馬輕肥',
-u'裘馬輕狂',
-u'裘馬聲色',
-u'求馬唐肆',
-u'求民病利',
-u'求名奪利',
-u'求名求利',
-u'求名責實',
-u'囚牛好音',
-u'丘奇論題',
-u'求其友聲',
-u'求簽問蔔',
-u'求親告友',
-u'求親靠友',
-u'求全責備',
-u'求全之毀',
-u'求人不如求己',
-u'求仁得仁',
-u'求人須求大丈夫',
-u'求榮反辱',
-u'求榮賣國',
-u'求容取媚',
-u'求三拜四',
-u'秋色平分',
-u'求善不厭',
-u'秋扇見捐',
-u'丘山之功',
-u'求神拜鬼',
-u'求神問蔔',
-u'求生本能',
-u'求生不得',
-u'求生不得求死不能',
-u'求生害仁',
-u'求生害義',
-u'秋實春華',
-u'秋收東藏',
-u'囚首垢面',
-u'囚首喪面',
-u'秋水芙蓉',
-u'秋水伊人',
-u'秋水盈盈',
-u'求死不得',
-u'求索不止',
-u'求索無厭',
-u'求田問舍',
-u'求同存異',
-u'秋荼密網',
-u'遒文壯節',
-u'秋狝春苗',
-u'求賢如渴',
-u'求賢若渴',
-u'求賢下士',
-u'求賢用士',
-u'求新立異',
-u'秋行夏令',
-u'求益反辱',
-u'求益反損',
-u'求魚緣木',
-u'秋月春風',
-u'秋月春花',
-u'秋月寒江',
-u'虬躍龍騰',
-u'秋月如珪',
-u'求之不得',
-u'求志達道',
-u'求之過急',
-u'秋至滿山多秀色',
-u'求知若渴',
-u'求知心切',
-u'求之有道',
-u'求忠出孝',
-u'去暗投明',
-u'去本就末',
-u'去本趨末',
-u'屈鄙行鮮',
-u'祛病延年',
-u'曲不離口',
-u'取長補短',
-u'取長棄短',
-u'驅除鞑虜',
-u'去粗取精',
-u'诎寸伸尺',
-u'诎寸信尺',
-u'屈打成招',
-u'祛蠹除奸',
-u'去惡務盡',
-u'曲而不屈',
-u'取而不貪',
-u'取而代之',
-u'去而之他',
-u'取法乎上',
-u'取法乎上僅得乎中',
-u'屈服之鞭',
-u'曲高和寡',
-u'屈高就下',
-u'曲肱而枕',
-u'曲肱之樂',
-u'去故就新',
-u'屈谷巨瓠',
-u'去故納新',
-u'去官留犢',
-u'去害興利',
-u'屈蠖求伸',
-u'趨吉避兇',
-u'屈己存道',
-u'屈己待人',
-u'曲極其妙',
-u'趨吉逃兇',
-u'阒寂無人',
-u'阒寂無聲',
-u'屈己下人',
-u'屈節卑體',
-u'屈節辱命',
-u'屈節辱志',
-u'曲盡其妙',
-u'曲盡其巧',
-u'曲盡情僞',
-u'曲盡人情',
-u'曲徑通幽',
-u'取精用宏',
-u'去就之分',
-u'去就之際',
-u'取快一時',
-u'劬勞顧複',
-u'劬勞之恩',
-u'驅雷策電',
-u'驅雷掣電',
-u'趨利避害',
-u'曲裏拐彎',
-u'趨利若骛',
-u'去留兩便',
-u'取亂存亡',
-u'取亂侮亡',
-u'曲眉豐頰',
-u'取名緻官',
-u'趨名逐利',
-u'去末歸本',
-u'去逆效順',
-u'驅奴藤條',
-u'取譬引喻',
-u'取其精華去其糟粕',
-u'娶妻容易養妻難',
-u'阒其無人',
-u'阒其無聲',
-u'趨前退後',
-u'取巧圖便',
-u'取青妃白',
-u'取青配白',
-u'取青媲白',
-u'區區此心',
-u'區區小事',
-u'區區之見',
-u'區區之數',
-u'區區之心',
-u'區區之衆',
-u'趨權附勢',
-u'阒然無聲',
-u'趣熱之士',
-u'趨人之急',
-u'取容當世',
-u'去如黃鶴',
-u'取如拾遺',
-u'阒若無人',
-u'去殺勝殘',
-u'趨舍異路',
-u'趨舍有時',
-u'趨舍指湊',
-u'去甚去泰',
-u'屈身守分',
-u'曲身小子',
-u'去食存信',
-u'趨時奉勢',
-u'趨勢附熱',
-u'趨時附勢',
-u'去時終須去',
-u'趨數煩志',
-u'去順效逆',
-u'去似微塵',
-u'去太去甚',
-u'去題萬裏',
-u'去梯之言',
-u'去天尺五',
-u'驅霆策電',
-u'趨庭之教',
-u'去頭去尾',
-u'曲突徒新',
-u'曲突徙薪',
-u'曲突移薪',
-u'去僞從真',
-u'去僞存真',
-u'取威定霸',
-u'取威定功',
-u'去危就安',
-u'曲爲之防',
-u'區聞陬見',
-u'去蕪存精',
-u'阒無人聲',
-u'阒無一人',
-u'屈膝請和',
-u'屈膝求和',
-u'取轄投井',
-u'趨翔閑雅',
-u'去邪歸正',
-u'屈心抑志',
-u'取信于民',
-u'取信于人',
-u'曲學阿世',
-u'曲學詖行',
-u'曲學多辨',
-u'屈豔班香',
-u'趨炎奉勢',
-u'趨炎附熱',
-u'趨炎附勢',
-u'阒焉無人',
-u'驅羊鬥虎',
-u'驅羊攻虎',
-u'驅羊拒狼',
-u'驅羊戰狼',
-u'诎要桡腘',
-u'曲意承奉',
-u'屈意承歡',
-u'取義成仁',
-u'曲意承迎',
-u'曲意奉承',
-u'曲意逢迎',
-u'祛衣請業',
-u'屈一伸萬',
-u'取易守難',
-u'祛衣受業',
-u'曲意迎合',
-u'蛆蠅糞穢',
-u'取友必端',
-u'取與不和',
-u'區宇一清',
-u'取予有節',
-u'蘧瑗知非',
-u'曲折滑坡',
-u'曲折萦纡',
-u'取之不竭',
-u'取之不盡',
-u'取之不盡用之不竭',
-u'屈指而數',
-u'屈指可數',
-u'趨之如骛',
-u'趨之若骛',
-u'趨之若蟻',
-u'曲直項鏈',
-u'曲終人散',
-u'曲終奏雅',
-u'取諸宮中',
-u'曲渚回灣',
-u'去住兩難',
-u'屈尊駕臨',
-u'屈尊降貴',
-u'屈尊敬賢',
-u'屈尊就卑',
-u'勸百諷一',
-u'全璧歸趙',
-u'權變鋒出',
-u'全秉公心',
-u'拳不離手',
-u'拳不離手曲不離口',
-u'犬不夜吠',
-u'诠才末學',
-u'辁才小慧',
-u'拳打腳踢',
-u'犬吠之盜',
-u'犬吠之警',
-u'全福遠禍',
-u'全功盡棄',
-u'全國一盤棋',
-u'權豪勢要',
-u'犬迹狐蹤',
-u'全軍覆滅',
-u'全軍覆沒',
-u'權均力敵',
-u'權鈞力齊',
-u'全力赴之',
-u'全力以赴',
-u'全力一擊',
-u'犬馬齒窮',
-u'犬馬齒索',
-u'犬馬戀主',
-u'犬馬之報',
-u'犬馬之誠',
-u'犬馬之齒',
-u'犬馬之疾',
-u'犬馬之決',
-u'犬馬之勞',
-u'犬馬之力',
-u'犬馬之戀',
-u'犬馬之命',
-u'犬馬之年',
-u'犬馬之心',
-u'犬馬之養',
-u'全民皆兵',
-u'畎畝下才',
-u'畎畝之中',
-u'全能全智',
-u'全盤托出',
-u'全其首領',
-u'權傾天下',
-u'權傾中外',
-u'拳拳服膺',
-u'拳拳盛意',
-u'拳拳在念',
-u'拳拳之忱',
-u'拳拳之枕',
-u'拳拳之忠',
-u'全然不顧',
-u'全然不同',
-u'全然不知',
-u'勸人架屋',
-u'勸人莫作',
-u'勸人養鵝',
-u'勸善懲惡',
-u'勸善黜惡',
-u'勸善規過',
-u'勸善戒惡',
-u'勸善片惡',
-u'全身而退',
-u'全神貫注',
-u'全神傾注',
-u'全身遠害',
-u'全身遠禍',
-u'全獅搏兔',
-u'泉石膏肓',
-u'權時救急',
-u'全始全終',
-u'泉石之樂',
-u'權時制宜',
-u'全受全歸',
-u'拳術精通',
-u'拳套專精',
-u'筌蹏一悟',
-u'拳頭腳尖',
-u'犬兔俱斃',
-u'犬兔之争',
-u'全無忌憚',
-u'全無心肝',
-u'全心濟世',
-u'全心全力',
-u'全心全意',
-u'全須全尾',
-u'犬牙差互',
-u'犬牙錯互',
-u'犬牙交錯',
-u'犬牙盤石',
-u'犬牙相錯',
-u'犬牙相接',
-u'犬牙相臨',
-u'犬牙相制',
-u'犬牙鷹爪',
-u'權移馬鹿',
-u'權宜之策',
-u'權宜之計',
-u'權宜狀态',
-u'犬彘之食',
-u'拳中掿沙',
-u'權重望崇',
-u'權重秩卑',
-u'拳撞腳踢',
-u'權尊勢重',
-u'卻病延年',
-u'卻步圖前',
-u'鵲巢鸠踞',
-u'鵲巢鸠占',
-u'鵲巢鸠主',
-u'鵲巢知風',
-u'缺吃短穿',
-u'缺吃少穿',
-u'雀兒參政',
-u'雀兒腸肚',
-u'鵲返鸾回',
-u'鵲反鸾驚',
-u'确非易事',
-u'确固不拔',
-u'确乎不拔',
-u'雀角鼠牙',
-u'雀角之忿',
-u'卻金暮夜',
-u'榷酒征茶',
-u'卻客疏士',
-u'缺口鑷子',
-u'卻老還童',
-u'鵲壘巢鸠',
-u'雀馬魚龍',
-u'雀目鼠步',
-u'雀屏中選',
-u'确然不群',
-u'雀入雕群羊投虎口',
-u'卻扇之夕',
-u'缺失損失',
-u'缺食無衣',
-u'雀鼠之争',
-u'缺頭少尾',
-u'鵲笑鸠舞',
-u'雀小髒全',
-u'确信無疑',
-u'卻行求前',
-u'雀喧鸠聚',
-u'雀牙鼠角',
-u'阙一不可',
-u'缺衣乏食',
-u'缺衣少食',
-u'确有其事',
-u'缺月重圓',
-u'雀躍歡呼',
-u'缺月再圓',
-u'确鑿不移',
-u'卻之不恭',
-u'卻之不恭受之有愧',
-u'裙布钗荊',
-u'裙布荊钗',
-u'群策群力',
-u'群雌粥粥',
-u'裙帶關系',
-u'群而不黨',
-u'群芳競豔',
-u'群方鹹遂',
-u'群分類聚',
-u'群鴻戲海',
-u'群集分析',
-u'麇集蜂萃',
-u'裙屐少年',
-u'群居和一',
-u'群居穴處',
-u'群居終日言不及義',
-u'群空冀北',
-u'群口啾唧',
-u'群口铄金',
-u'群龍無首',
-u'群盲摸象',
-u'群魔亂舞',
-u'群起而攻之',
-u'群起效尤',
-u'群情鼎沸',
-u'群情歡洽',
-u'群輕折軸',
-u'群山四應',
-u'群山萬壑',
-u'群石點頭',
-u'群枉之門',
-u'群威群膽',
-u'群賢畢集',
-u'群星聖殿',
-u'群雄逐鹿',
-u'群蟻附膻',
-u'群蟻潰堤',
-u'群疑滿腹',
-u'群英荟萃',
-u'麇至沓來',
-u'染蒼染黃',
-u'然荻讀書',
-u'染風習俗',
-u'燃膏繼晷',
-u'染翰操紙',
-u'染翰成章',
-u'染化而遷',
-u'燃魂之顱',
-u'染舊作新',
-u'然糠照薪',
-u'然糠自照',
-u'染藍涅皁',
-u'燃眉之急',
-u'燃萁煎豆',
-u'燃萁之敏',
-u'燃萁煮豆',
-u'冉冉不絕',
-u'然然可可',
-u'燃松讀書',
-u'燃犀溫峤',
-u'燃犀照怪',
-u'染須種齒',
-u'染指垂涎',
-u'染指于鼎',
-u'攘臂瞋目',
-u'攘臂而起',
-u'攘臂疾言',
-u'攘臂切齒',
-u'攘臂一呼',
-u'攘肌及骨',
-u'攘來熙往',
-u'讓禮一寸得禮一尺',
-u'攘袂扼腕',
-u'攘袂切齒',
-u'攘袂引領',
-u'攘權奪利',
-u'攘攘滿家',
-u'攘攘熙熙',
-u'攘人之美',
-u'讓三讓再',
-u'攘外安内',
-u'攘往熙來',
-u'讓逸競勞',
-u'讓再讓三',
-u'讓棗推梨',
-u'繞道而行',
-u'饒口謀衣',
-u'繞梁遏雲',
-u'繞梁三日',
-u'繞梁餘韻',
-u'繞梁韻永',
-u'繞梁之音',
-u'擾擾攘攘',
-u'擾人清夢',
-u'饒人是福',
-u'饒舌調唇',
-u'饒有風趣',
-u'饒有興趣',
-u'饒有興味',
-u'繞指柔腸',
-u'熱鏊翻餅',
-u'惹草拈花',
-u'惹草沾風',
-u'惹草沾花',
-u'惹草招風',
-u'熱腸古道',
-u'熱腸冷面',
-u'熱導模塊',
-u'熱地蚰蜒',
-u'熱腹冷腸',
-u'熱汗涔涔',
-u'惹花拈草',
-u'熱火朝天',
-u'惹火燒身',
-u'惹禍招愆',
-u'惹禍招殃',
-u'惹禍招災',
-u'熱可炙手',
-u'熱淚盈眶',
-u'熱氣騰騰',
-u'熱情洋溢',
-u'惹人注目',
-u'惹事生非',
-u'惹事招非',
-u'惹虱子頭上搔',
-u'熱心苦口',
-u'熱心快腸',
-u'熱血沸騰',
-u'熱疫疲憊',
-u'熱疫疲倦',
-u'熱影廢墟',
-u'惹災招禍',
-u'熱蒸現賣',
-u'惹罪招愆',
-u'人百其身',
-u'人不得外财不富',
-u'人不犯我',
-u'人不犯我我不犯人',
-u'人不風流隻爲貧',
-u'人不解甲馬不停蹄',
-u'人不可貌相',
-u'人不可無勢',
-u'人不聊生',
-u'人不勸不善',
-u'人不人鬼不鬼',
-u'人不說不知木不鑽不透',
-u'人不通今古',
-u'人不爲己天地誅',
-u'人不爲己天誅地滅',
-u'人不厭故',
-u'人不知鬼不覺',
-u'人不自安',
-u'人才輩出',
-u'人才輩生',
-u'人才出衆',
-u'人才濟濟',
-u'人财兩空',
-u'人财兩失',
-u'人才難得',
-u'忍恥苟活',
-u'忍恥含垢',
-u'忍恥含羞',
-u'忍恥偷生',
-u'人稠物穰',
-u'認仇作父',
-u'人處福中不知福',
-u'任從風浪起穩坐釣魚船',
-u'人存政舉',
-u'任達不拘',
-u'人大心大',
-u'人單勢孤',
-u'人到難處就如虎落深坑',
-u'人到無求品自高',
-u'人到中年萬事休',
-u'人的名兒樹的影兒',
-u'忍得一時之氣',
-u'人地兩生',
-u'人地生疏',
-u'認敵爲友',
-u'認賊作父',
-u'人定勝天',
-u'人丁興旺',
-u'人多成王',
-u'人多口雜',
-u'人多阙少',
-u'人多勢衆',
-u'人多手亂',
-u'人多手雜',
-u'人多眼雜',
-u'人多語亂',
-u'人多則成勢',
-u'人多智廣',
-u'人多嘴雜',
-u'稔惡不俊',
-u'稔惡不悛',
-u'稔惡藏奸',
-u'人惡人怕天不怕',
-u'稔惡盈貫',
-u'人煩馬殆',
-u'人非草木',
-u'人非草木孰能無情',
-u'人非木石',
-u'人非聖賢',
-u'人非聖賢孰能無過',
-u'人非土木',
-u'人非土石',
-u'人非物是',
-u'認憤填膺',
-u'人逢喜事精神爽',
-u'人扶人興',
-u'人浮于食',
-u'人各有偶',
-u'人各有心',
-u'人各有志',
-u'衽革枕戈',
-u'人給家足',
-u'人功道理',
-u'忍垢貪生',
-u'忍垢偷生',
-u'人孤勢單',
-u'人貴有恒',
-u'人貴有志',
-u'人貴知心',
-u'人貴自立',
-u'人海茫茫',
-u'人害人不死天害人才死',
-u'人海人山',
-u'人喊馬叫',
-u'人喊馬嘶',
-u'人歡馬叫',
-u'人荒馬亂',
-u'人活一張臉',
-u'人迹罕通',
-u'人迹罕至',
-u'人急計生',
-u'人急了懸梁狗急了跳牆',
-u'忍饑受餓',
-u'忍饑受渴',
-u'人迹所至',
-u'人急投親',
-u'人急偎親',
-u'人迹杳然',
-u'人己一視',
-u'人急智生',
-u'認雞作鳳',
-u'人家吃肉我喝湯',
-u'人見白頭嗔',
-u'人間第一黃',
-u'人間地獄',
-u'人見人愛十七八',
-u'人間私語',
-u'人間天上',
-u'人間天堂',
-u'人間正道是滄桑',
-u'人間重晚晴',
-u'人間自有真情在',
-u'仁漿義粟',
-u'人傑地靈',
-u'人皆掩鼻',
-u'人皆有恻隐之心',
-u'人盡其才',
-u'人禁我行',
-u'人鏡芙蓉',
-u'人敬有的',
-u'人居福中不知福',
-u'忍隽不禁',
-u'忍俊不禁',
-u'忍俊不住',
-u'人君猶盂',
-u'人靠衣裳馬靠鞍',
-u'人靠一身衣',
-u'人口快過風',
-u'人苦不知足',
-u'忍苦耐勞',
-u'人困馬乏',
-u'人來客去',
-u'人來客往',
-u'人來人往',
-u'人狼弓手',
-u'任勞任怨',
-u'人老偷閑且是閑',
-u'人老腿先老',
-u'人老心未老',
-u'人老珠黃',
-u'忍淚含悲',
-u'人離家散',
-u'人離鄉贱',
-u'人倫并處',
-u'人馬平安',
-u'人滿爲患',
-u'人滿之患',
-u'人美不在貌',
-u'刃沒利存',
-u'人面狗心',
-u'人面鳥咮',
-u'人面上人',
-u'人面獸心',
-u'人面桃花',
-u'仁民愛物',
-u'人命關天',
-u'人命危淺',
-u'人莫若故',
-u'人莫予毒',
-u'人謀不臧',
-u'人模狗樣',
-u'認奴作郎',
-u'人怕出名豬怕肥',
-u'人怕見錢魚怕餌',
-u'人怕老來貧',
-u'人怕貪心魚怕餌',
-u'人貧不語',
-u'人貧志短',
-u'人平不語',
-u'人平不語水平不流',
-u'任憑風浪起',
-u'忍氣吞聲',
-u'人棄我取',
-u'人棄我拾',
-u'任其自便',
-u'任其自流',
-u'任其自然',
-u'人前背後',
-u'人前不讨兩面光',
-u'人前莫說人長短',
-u'人千人萬',
-u'人強馬壯',
-u'人強勝天',
-u'人勤地不懶',
-u'人琴俱逝',
-u'人琴俱亡',
-u'人琴俱杳',
-u'人琴兩亡',
-u'人情薄似紙',
-u'人情大似聖旨',
-u'人情冷栗',
-u'人情冷暖',
-u'人情冷暖世态炎涼',
-u'人輕權重',
-u'人情世故',
-u'人情世态',
-u'人情似水分高下',
-u'人情似紙張張薄',
-u'人情物理',
-u'人情忷忷',
-u'人情紙薄',
-u'人情之常',
-u'任情恣性',
-u'人窮反本',
-u'人窮命多苦',
-u'人窮志短',
-u'人窮志短馬瘦毛長',
-u'人窮志莫窮',
-u'人去樓空',
-u'人取我與',
-u'荏苒代謝',
-u'荏苒日月',
-u'人人得而誅之',
-u'人人喊打',
-u'人人皆知',
-u'仁人君子',
-u'任人唯親',
-u'任人唯賢',
-u'仁人義士',
-u'人人有份',
-u'仁人志士',
-u'人人自危',
-u'仁柔寡斷',
-u'忍辱負重',
-u'忍辱含垢',
-u'忍辱含羞',
-u'忍辱偷生',
-u'荏弱難持',
-u'荏弱無能',
-u'人殺鬼殺',
-u'人山人海',
-u'人善人欺天不欺',
-u'人涉卬否',
-u'人神供憤',
-u'人神共嫉',
-u'人神同憤',
-u'人神同嫉',
-u'人生不滿百常懷千歲憂',
-u'人聲鼎沸',
-u'人生何處不相逢',
-u'人生開口笑難逢',
-u'人生路不熟',
-u'人生面不熟',
-u'人生難得老來安',
-u'人生七十古來稀',
-u'人生如寄',
-u'人生如夢',
-u'人生如萍',
-u'人生如寓',
-u'人生如朝露',
-u'人生若寄',
-u'人生若夢',
-u'人生似鳥同林宿',
-u'人生無常',
-u'人生一世草生一秋',
-u'人生在勤',
-u'人生在世',
-u'人生朝露',
-u'人生知足何時足',
-u'人生自古誰無死',
-u'人生最苦是別離',
-u'人事不醒',
-u'人事不知',
-u'人世滄桑',
-u'人事代謝',
-u'人師難遇',
-u'人事無常',
-u'人是衣裳馬是鞍',
-u'人是衣裝',
-u'人壽幾何',
-u'人壽年豐',
-u'人手一冊',
-u'仁術超群',
-u'人殊意異',
-u'認死扣兒',
-u'認死理兒',
-u'人死留名',
-u'人死辄爲鬼',
-u'人俗不可醫',
-u'人所共知',
-u'任所欲爲',
-u'人天永隔',
-u'人同此心',
-u'人同此心心同此理',
-u'仁同一視',
-u'人頭畜鳴',
-u'人頭羅刹',
-u'任土作貢',
-u'人亡邦瘁',
-u'人往高處走水往低處流',
-u'人亡家破',
-u'人望所歸',
-u'認妄爲真',
-u'人亡物存',
-u'人亡物在',
-u'人亡政息',
-u'人爲财死',
-u'人爲财死鳥爲食亡',
-u'人爲刀俎',
-u'人爲刀俎我爲魚肉',
-u'人爲故障',
-u'人微權輕',
-u'人微望輕',
-u'人微言贱',
-u'人微言輕',
-u'人爲一口氣',
-u'人文荟萃',
-u'人我是非',
-u'人無剛強安身不長',
-u'人無根本水食爲命',
-u'人無害虎心虎有傷人意',
-u'人無橫财不富',
-u'忍無可忍',
-u'人無兩度再少年',
-u'人無千日好花無百日紅',
-u'人無外财不富',
-u'人無完人',
-u'人無笑臉休開店',
-u'人無一世窮',
-u'人無遠慮必有近憂',
-u'衽扱囊括',
-u'人遐室迩',
-u'任賢使能',
-u'任賢受谏',
-u'人閑心不閑',
-u'人閑心生魔',
-u'任賢用能',
-u'任賢杖能',
-u'任賢恣情',
-u'人小鬼大',
-u'人小志氣大',
-u'人心不古',
-u'人心不足蛇吞象',
-u'人心大快',
-u'人心都是肉長的',
-u'人心隔肚皮',
-u'人心歸向',
-u'忍心害理',
-u'人心渙散',
-u'人心惶惶',
-u'人心莫測',
-u'人心難測',
-u'人心難測海水難量',
-u'人心叵測',
-u'人心齊泰山移',
-u'仁心仁術',
-u'仁心仁聞',
-u'人心如秤',
-u'人心如鏡',
-u'人心如面',
-u'人心喪盡',
-u'人心世道',
-u'人心思漢',
-u'人心似鐵',
-u'人心似鐵官法如爐',
-u'人心所歸',
-u'人心所向',
-u'人心惟危',
-u'人心向背',
-u'人心向背定成敗',
-u'人心讻讻',
-u'人心要實火心要虛',
-u'人心搖搖',
-u'人心猶未足',
-u'任性妄爲',
-u'任性恣情',
-u'人須立志',
-u'人煙稠密',
-u'人煙辏集',
-u'人煙輻辏',
-u'人煙阜盛',
-u'人煙浩穰',
-u'人言藉藉',
-u'人言可畏',
-u'仁言利博',
-u'仁言利溥',
-u'人眼難哄',
-u'人眼是秤',
-u'人焉廋哉',
-u'人煙稀少',
-u'人言鑿鑿',
-u'人言啧啧',
-u'人仰馬翻',
-u'人樣蝦蛆',
-u'人妖顛倒',
-u'仁義道德',
-u'人一己百',
-u'仁義君子',
-u'人以群分',
-u'人以群分物以類聚',
-u'忍一時風平浪靜',
-u'人一已百',
-u'仁義之兵',
-u'仁義值千金',
-u'仁義之師',
-u'刃迎縷解',
-u'認影迷頭',
-u'認影爲頭',
-u'人有旦夕禍福',
-u'忍尤含垢',
-u'忍尤攘诟',
-u'人有善願',
-u'人有善願天必從之',
-u'人有十可富',
-u'人欲橫流',
-u'人語馬嘶',
-u'任怨任勞',
-u'人怨神怒',
-u'人怨天怒',
-u'人約黃昏',
-u'人雲亦雲',
-u'人在福中不知福',
-u'人在畫中遊',
-u'人在人情在',
-u'人贓俱獲',
-u'認賊作父',
-u'仁者必壽',
-u'仁者不殺',
-u'仁者見仁',
-u'仁者見仁智者見智',
-u'仁者樂山',
-u'仁者能仁',
-u'忍者裝束',
-u'任真自得',
-u'人正不怕影子斜',
-u'人争一口氣佛受一柱香',
-u'人直不富港直不深',
-u'人之常情',
-u'人之初性本善',
-u'人之恒情',
-u'人之将死',
-u'人之将死其言也善',
-u'仁之勝不仁也',
-u'人之水鏡',
-u'仁至義盡',
-u'人之雲亡',
-u'任重才輕',
-u'任重道悠',
-u'任重道遠',
-u'人中龍虎',
-u'人中骐骥',
-u'人衆勝天',
-u'人中獅子',
-u'人衆則成勢',
-u'人中之龍',
-u'任重至遠',
-u'忍字頭上一把刀',
-u'人自爲鬥',
-u'人自爲戰',
-u'人自爲政',
-u'認祖歸宗',
-u'人足家給',
-u'仍陋襲簡',
-u'日薄桑榆',
-u'日薄虞淵',
-u'日薄西山',
-u'日薄崦嵫',
-u'日薄之年',
-u'日不我與',
-u'日不暇給',
-u'日不移晷',
-u'日不移影',
-u'日長似歲',
-u'日長一線',
-u'日程月課',
-u'日出冰消',
-u'日出不窮',
-u'日出而作',
-u'日出而作日入而息',
-u'日出三竿',
-u'日出萬言必有一傷',
-u'日出遇貴',
-u'日出之光',
-u'日蹙百裏',
-u'日東月西',
-u'日短心長',
-u'日短夜修',
-u'日鍛月煉',
-u'日複一日',
-u'日富月昌',
-u'日旰不食',
-u'日旰忘餐',
-u'日旰忘食',
-u'日高三丈',
-u'日和風暖',
-u'日計不足',
-u'日計不足歲計有餘',
-u'日積月聚',
-u'日積月累',
-u'日居月諸',
-u'日見沉重',
-u'日漸月染',
-u'日角龍庭',
-u'日角龍顔',
-u'日角偃月',
-u'日角珠庭',
-u'日進不衰',
-u'日近長安遠',
-u'日進鬥金',
-u'日進有功',
-u'日久弊生',
-u'日久見人心',
-u'日久見天理',
-u'日久彌新',
-u'日久年深',
-u'日久情深',
-u'日久歲長',
-u'日久歲深',
-u'日久天長',
-u'日久玩生',
-u'日久忘懷',
-u'日就月将',
-u'日久月深',
-u'日居衡茅',
-u'日朘月減',
-u'日朘月削',
-u'日來月往',
-u'日累月積',
-u'日麗風和',
-u'日麗風清',
-u'日理萬機',
-u'日陵月替',
-u'日落風生',
-u'日落見财',
-u'日落千丈',
-u'日落西山',
-u'日落沼澤',
-u'日邁月征',
-u'日莫途遠',
-u'日暮道遠',
-u'日暮路遠',
-u'日暮窮途',
-u'日暮途窮',
-u'日暮途遠',
-u'日怒徽記',
-u'日暖風和',
-u'日暖風恬',
-u'日乾夕惕',
-u'日親日近',
-u'日親以察',
-u'日日夜夜',
-u'日入胭脂紅無雨也有風',
-u'日濡月染',
-u'日上三竿',
-u'日涉成趣',
-u'日慎一日',
-u'日升月恒',
-u'日升月轉',
-u'日食萬貫',
-u'日食萬錢',
-u'日試萬言',
-u'日食一升',
-u'日疏日遠',
-u'日思夜盼',
-u'日誦五車',
-u'日添一線',
-u'日頭常晌午',
-u'日完其朔',
-u'日往月來',
-u'日五色賦',
-u'日無私照',
-u'日無暇晷',
-u'日夕相處',
-u'日下無雙',
-u'日消月割',
-u'日銷月靡',
-u'日銷月铄',
-u'日新月盛',
-u'日新月異',
-u'日新月著',
-u'日行千裏',
-u'日省月課',
-u'日省月試',
-u'日省月修',
-u'日修夜短',
-u'日許多時',
-u'日許時間',
-u'日削月割',
-u'日削月朘',
-u'日炎披風',
-u'日夜兼程',
-u'日夜趱行',
-u'日以繼夜',
-u'日益頻繁',
-u'日已三竿',
-u'日益完善',
-u'日以爲常',
-u'日異月更',
-u'日異月殊',
-u'日異月新',
-u'日益月滋',
-u'日飲亡何',
-u'日飲無何',
-u'日引月長',
-u'日堙月塞',
-u'日有所思夜有所夢',
-u'日有萬機',
-u'日與月與',
-u'日遠日疏',
-u'日月蔽虧',
-u'日月不居',
-u'日月重光',
-u'日月蹉跎',
-u'日月合壁',
-u'日月交食',
-u'日月經天',
-u'日月經天江河行地',
-u'日月麗天',
-u'日月連璧',
-u'日月其除',
-u'日月入懷',
-u'日月如箭',
-u'日月如流',
-u'日月如梭',
-u'日月參辰',
-u'日月無光',
-u'日月相推',
-u'日月逾邁',
-u'日昃不食',
-u'日昃旰食',
-u'日昃忘食',
-u'日仄之勞',
-u'日昃之離',
-u'日增月盛',
-u'日增月益',
-u'日長神倦',
-u'日長歲久',
-u'日征月邁',
-u'日炙風吹',
-u'日炙風篩',
-u'日至月至',
-u'日中必彗',
-u'日中必熭',
-u'日中必移',
-u'日中必湲',
-u'日中必昃',
-u'日中将昃',
-u'日中爲市',
-u'日中則移',
-u'日中則昃',
-u'日中則昃月滿則虧',
-u'日轉千街',
-u'日滋月益',
-u'日坐愁城',
-u'日坐針氈',
-u'冗不見治',
-u'冗詞贅句',
-u'容當後議',
-u'榮古陋今',
-u'榮古虐今',
-u'镕古鑄今',
-u'容光煥發',
-u'融合爲一',
-u'榮華富貴',
-u'融會貫通',
-u'融會通浃',
-u'容或有之',
-u'镕今鑄古',
-u'溶經鑄史',
-u'榮枯得喪',
-u'榮枯得失',
-u'榮枯休咎',
-u'戎馬倉皇',
-u'戎馬關山',
-u'戎馬倥偬',
-u'戎馬劻勷',
-u'戎馬生郊',
-u'戎馬生涯',
-u'戎馬之地',
-u'戎馬之間',
-u'容民畜衆',
-u'榮名及親',
-u'融洽無間',
-u'溶溶蕩蕩',
-u'融融泄泄',
-u'溶溶漾漾',
-u'榮辱得失',
-u'榮辱與共',
-u'容身無地',
-u'融釋貫通',
-u'戎事倥偬',
-u'戎首元兇',
-u'容頭過身',
-u'融爲一體',
-u'戎務倥偬',
-u'容膝之安',
-u'容膝之安一肉之味',
-u'容膝之地',
-u'融液貫通',
-u'榮膺鹗薦',
-u'榮膺鹗選',
-u'榮膺鴞薦',
-u'冗餘檢驗',
-u'熔于一爐',
-u'容齋四筆',
-u'榮宗耀祖',
-u'容足之地',
-u'肉薄骨并',
-u'肉搏精通',
-u'柔腸百結',
-u'柔腸百轉',
-u'柔腸寸斷',
-u'柔腸粉淚',
-u'揉眵抹淚',
-u'柔而不犯',
-u'柔風甘雨',
-u'肉腐出蟲',
-u'柔膚弱體',
-u'柔剛弱強',
-u'肉骨生死',
-u'柔筋脆骨',
-u'肉可共啖',
-u'肉林酒池',
-u'柔媚姣俏',
-u'柔能克剛',
-u'柔能制剛',
-u'柔懦寡斷',
-u'肉朋酒友',
-u'肉圃酒池',
-u'柔情綽态',
-u'柔情媚态',
-u'柔情蜜意',
-u'柔情曲意',
-u'柔情俠骨',
-u'柔茹剛吐',
-u'柔茹寡斷',
-u'揉腮撧耳',
-u'肉山脯林',
-u'肉山酒海',
-u'柔勝剛克',
-u'柔聲下氣',
-u'肉食者鄙',
-u'肉袒負荊',
-u'肉袒面縛',
-u'肉袒牽羊',
-u'肉跳神驚',
-u'肉跳心驚',
-u'柔心弱骨',
-u'肉眼凡夫',
-u'肉眼凡胎',
-u'肉眼惠眉',
-u'肉眼看天',
-u'肉眼無珠',
-u'肉眼愚眉',
-u'柔遠懷迩',
-u'柔遠懷來',
-u'柔遠能迩',
-u'柔遠綏懷',
-u'柔遠鎮迩',
-u'肉綻皮開',
-u'肉顫心驚',
-u'柔枝嫩條',
-u'柔枝嫩葉',
-u'肉竹嘈雜',
-u'如白染皂',
-u'入邦問俗',
-u'入寶山而空回',
-u'入鮑忘臭',
-u'乳波臀浪',
-u'如撥雲霧',
-u'入不敷出',
-u'如不勝衣',
-u'入不支出',
-u'如蠶作繭',
-u'茹草飲水',
-u'如操左劵',
-u'如操左券',
-u'汝成人耶',
-u'如癡如狂',
-u'如癡如夢',
-u'如癡如迷',
-u'如癡如醉',
-u'如癡似醉',
-u'如持左劵',
-u'如持左券',
-u'乳臭未除',
-u'如出一軌',
-u'如出一口',
-u'如出一轍',
-u'如椽大筆',
-u'如椽健筆',
-u'如椽之筆',
-u'如此而已',
-u'如此如此',
-u'如蹈水火',
-u'如蹈湯火',
-u'如登春台',
-u'入地無門',
-u'乳犢不怕虎',
-u'如堕五裏霧中',
-u'如堕煙海',
-u'如堕煙霧',
-u'如蛾赴火',
-u'如法泡制',
-u'如風過耳',
-u'如奉綸音',
-u'如赴湯火',
-u'如臯射雉',
-u'入閣登壇',
-u'如隔三秋',
-u'如骾在喉',
-u'乳狗噬虎',
-u'茹古涵今',
-u'如鼓琴瑟',
-u'入骨相思',
-u'如珪如璋',
-u'辱國喪師',
-u'辱國殄民',
-u'入國問俗',
-u'辱國殃民',
-u'入海算沙',
-u'如虎得翼',
-u'如虎傅翼',
-u'如虎負嵎',
-u'如虎加翼',
-u'如虎如狼',
-u'如虎生翼',
-u'如虎添翼',
-u'乳虎嘯谷百獸懼',
-u'如花如錦',
-u'如花似朵',
-u'如花似錦',
-u'如花似玉',
-u'如花似月',
-u'如幻如夢',
-u'如幻似真',
-u'如簧之舌',
-u'入火赴湯',
-u'如獲拱璧',
-u'如火燎原',
-u'如獲球璧',
-u'如火如荼',
-u'如獲石田',
-u'如獲異寶',
-u'如獲珍寶',
-u'如獲至寶',
-u'如獲至珍',
-u'如獲重寶',
-u'如雞就埘',
-u'如饑如渴',
-u'如饑似渴',
-u'如繼一臂',
-u'如見肺肝',
-u'乳間股腳',
-u'如箭離弦',
-u'如見其人',
-u'如箭在弦',
-u'如江如海',
-u'如嚼雞肋',
-u'如膠如漆',
-u'如膠似漆',
-u'如膠投漆',
-u'如解倒懸',
-u'入境随俗',
-u'入井望天',
-u'入境問禁',
-u'入境問俗',
-u'如開茅塞',
-u'如渴如饑',
-u'如恐不及',
-u'入口套牌',
-u'茹苦含辛',
-u'茹苦食酸',
-u'茹苦食辛',
-u'茹苦吞酸',
-u'如狼牧羊',
-u'如狼如虎',
-u'如狼似虎',
-u'如雷貫耳',
-u'如雷在耳',
-u'缛禮煩儀',
-u'入理切情',
-u'入理入情',
-u'如臨大敵',
-u'如臨深谷',
-u'如臨深淵',
-u'如臨深淵如履薄冰',
-u'如臨淵谷',
-u'如龍似虎',
-u'如履薄冰',
-u'如履春冰',
-u'如履平地',
-u'如履如臨',
-u'如履淵冰',
-u'如芒刺背',
-u'如芒在背',
-u'茹毛飲血',
-u'辱門敗戶',
-u'入門問諱',
-u'入門休問榮枯事',
-u'如夢初覺',
-u'如夢初醒',
-u'如夢而覺',
-u'如夢方覺',
-u'如夢方醒',
-u'如夢忽醒',
-u'如夢如癡',
-u'如夢如醉',
-u'濡沫涸轍',
-u'入木三分',
-u'入幕之賓',
-u'孺慕之思',
-u'汝南晨雞',
-u'汝南月旦',
-u'如鳥獸散',
-u'如鳥翔空',
-u'如牛負重',
-u'如烹小鮮',
-u'入品用蔭',
-u'如棄敝屣',
-u'如其不然',
-u'如泣草芥',
-u'入其彀中',
-u'如漆如膠',
-u'如泣如訴',
-u'茹泣吞悲',
-u'如切如磋',
-u'如切如磋如琢如磨',
-u'入情合理',
-u'入情入理',
-u'如丘而止',
-u'如泉赴壑',
-u'如燃犀燭',
-u'如人飲水',
-u'如人飲水冷暖自知',
-u'如日方升',
-u'如日方中',
-u'如日中天',
-u'茹柔吐剛',
-u'如入寶山空手回',
-u'蠕蠕而動',
-u'如入無人之境',
-u'如入雲端',
-u'如喪考妣',
-u'入山不怕傷人虎',
-u'如山似海',
-u'如山壓卵',
-u'入少出多',
-u'入舍女婿',
-u'辱身敗名',
-u'入神之作',
-u'入聖超凡',
-u'乳聲乳氣',
-u'如食哀梨',
-u'入世不深',
-u'入室操戈',
-u'儒士成林',
-u'如拾地芥',
-u'入室弟子',
-u'如釋負擔',
-u'入室升堂',
-u'如石投水',
-u'如是我聞',
-u'如矢在弦',
-u'如釋重負',
-u'如手如足',
-u'如數家珍',
-u'如熟羊胛',
-u'如水滴石',
-u'如水赴壑',
-u'乳水交融',
-u'如水投石',
-u'入水問魚',
-u'入死出生',
-u'如斯而已',
-u'如訴如泣',
-u'如所周知',
-u'如湯灌雪',
-u'如湯化雪',
-u'如湯澆雪',
-u'如湯潑雪',
-u'如湯沃雪',
-u'如天之福',
-u'入鐵主薄',
-u'入鐵主簿',
-u'茹痛含辛',
-u'茹荼攻蓼',
-u'如荼如火',
-u'茹荼吞檗',
-u'入土爲安',
-u'入文出武',
-u'如蚊負山',
-u'如聞其聲',
-u'如聞其聲如見其人',
-u'入吾彀中',
-u'如無其事',
-u'如響而應',
-u'入鄉随俗',
-u'入鄉問俗',
-u'如響應聲',
-u'入孝出弟',
-u'入孝出悌',
-u'如兄如弟',
-u'乳臭未幹',
-u'乳臭未乾',
-u'如雪逢湯',
-u'如埙如箎',
-u'如埙應篪',
-u'儒雅風流',
-u'如蟻赴羶',
-u'如蟻慕膻',
-u'如意算盤',
-u'如飲醍醐',
-u'如影從形',
-u'如蠅附膻',
-u'如蠅聚膻',
-u'如應斯響',
-u'如影随形',
-u'如蠅襲膻',
-u'如影相随',
-u'如蠅逐臭',
-u'如蠅逐膻',
-u'如有所失',
-u'如禦大敵',
-u'如魚得水',
-u'茹魚去蠅',
-u'如魚似水',
-u'如魚飲水冷暖自知',
-u'如願以償',
-u'如運諸掌',
-u'如在股幾',
-u'如振落葉',
-u'如之奈何',
-u'如脂如韋',
-u'如指諸掌',
-u'入主出奴',
-u'如錐畫沙',
-u'如墜五裏雲霧',
-u'孺子可教',
-u'如足如手',
-u'如醉初醒',
-u'如醉方醒',
-u'如醉如癡',
-u'如醉如狂',
-u'如醉如夢',
-u'如坐春風',
-u'如坐雲霧',
-u'如坐鍼氈',
-u'軟飽黑甜',
-u'軟刀子割頭不覺死',
-u'軟刀子殺人不見血',
-u'軟的欺負硬的怕',
-u'軟紅塵土',
-u'軟紅十丈',
-u'軟紅香土',
-u'軟來軟磨',
-u'軟磨硬抗',
-u'阮囊羞澀',
-u'軟裘快馬',
-u'軟軟濃濃',
-u'軟弱渙散',
-u'軟弱無力',
-u'軟弱無能',
-u'軟繩子綁得住硬柴禾',
-u'軟繩子捆得住硬柴禾',
-u'軟繩子系得住硬柴禾',
-u'軟談麗語',
-u'軟猬刺球',
-u'阮鹹之縱',
-u'軟香溫玉',
-u'軟硬兼施',
-u'軟玉嬌香',
-u'軟玉溫香',
-u'軟語溫言',
-u'蕤賓鐵響',
-u'銳兵精甲',
-u'銳不可當',
-u'瑞彩祥雲',
-u'銳挫氣索',
-u'銳挫望絕',
-u'銳利之石',
-u'瑞氣祥雲',
-u'銳氣益壯',
-u'瑞獸祥禽',
-u'瑞獸異禽',
-u'瑞獸珍禽',
-u'銳未可當',
-u'瑞文戴爾',
-u'瑞雪迎春',
-u'瑞雪兆豐年',
-u'瑞以和降',
-u'瑞應災異',
-u'枘圓鑿方',
-u'枘鑿冰炭',
-u'枘鑿不入',
-u'枘鑿方圓',
-u'瑞卒勿攻',
-u'潤屋潤身',
-u'潤之土精',
-u'若敖鬼餒',
-u'若敖之鬼',
-u'若傍無人',
-u'弱本強末',
-u'若崩厥角',
-u'若臂使指',
-u'弱不好弄',
-u'弱不禁風',
-u'若不勝衣',
-u'若出一吻',
-u'若出一轍',
-u'若存若亡',
-u'若大若小',
-u'若登高必自卑',
-u'弱冠之年',
-u'若合符節',
-u'若合符契',
-u'若火燎原',
-u'若即若離',
-u'若離若即',
-u'弱連通圖',
-u'若卵投石',
-u'若履平地',
-u'若昧平生',
-u'若明若暗',
-u'若明若昧',
-u'若烹小鮮',
-u'若前若後',
-u'弱肉強食',
-u'弱如扶病',
-u'若喪考妣',
-u'若涉遠必自迩',
-u'若涉淵冰',
-u'若涉淵水',
-u'若釋重負',
-u'若數家珍',
-u'弱水之隔',
-u'弱水之源',
-u'若無其事',
-u'若無若有',
-u'若無天地',
-u'若響應聲',
-u'弱效毒藥',
-u'若信蔔賣了屋',
-u'若要斷酒法',
-u'若要好大做小',
-u'若要俏常帶三分孝',
-u'若要人不知',
-u'若要人不知除非己莫爲',
-u'若要小兒安常帶三分寒',
-u'若隐若顯',
-u'若有若無',
-u'若有所喪',
-u'若有所失',
-u'若有所思',
-u'若有所亡',
-u'若有所悟',
-u'若遠若近',
-u'若争小可',
-u'若醉初醒',
-u'若做非理必受其殃',
-u'撒癡撒嬌',
-u'撒村罵街',
-u'撒豆成兵',
-u'撒嬌賣俏',
-u'撒嬌撒癡',
-u'撒嬌使性',
-u'撒科打诨',
-u'撒賴放潑',
-u'灑淚而別',
-u'撒泡尿自己照照',
-u'撒潑打滾',
-u'撒潑放刁',
-u'撒潑行兇',
-u'灑灑潇潇',
-u'撒騷放屁',
-u'灑掃應對',
-u'撒手閉眼',
-u'撒手不爲奸',
-u'撒手長逝',
-u'撒手塵寰',
-u'飒爽英姿',
-u'撒水拿魚',
-u'灑心更始',
-u'撒詐搗虛',
-u'塞北江南',
-u'塞北交南',
-u'塞耳盜鍾',
-u'塞耳偷鈴',
-u'賽過諸葛亮',
-u'塞井焚舍',
-u'塞井夷竈',
-u'賽洛塔姆',
-u'塞上江南',
-u'塞翁得馬',
-u'塞翁失馬',
-u'塞翁失馬安知非福',
-u'塞翁失馬焉知非福',
-u'塞翁之馬',
-u'賽雪欺霜',
-u'三拜九叩',
-u'三百六十行',
-u'三百六十行行行出狀元',
-u'三百甕齑',
-u'三般兩樣',
-u'三班六房',
-u'三榜定案',
-u'三杯和萬事',
-u'三杯兩盞',
-u'三病四痛',
-u'散兵遊勇',
-u'散兵遊卒',
-u'三波六折',
-u'三步并兩步',
-u'三步兩腳',
-u'三不拗六',
-u'三曹對案',
-u'三層大兩層小',
-u'三差兩錯',
-u'三茶六飯',
-u'三茶六禮',
-u'三差五錯',
-u'三長兩短',
-u'三長四短',
-u'三朝元老',
-u'三尺焦桐',
-u'三尺枯桐',
-u'三尺門裏',
-u'三尺青鋒',
-u'三尺青蛇',
-u'三尺秋霜',
-u'三尺童兒',
-u'三尺童蒙',
-u'三尺之孤',
-u'三尺之木',
-u'三春獻瑞',
-u'三從四德',
-u'三寸不爛之舌',
-u'三寸雞毛',
-u'三寸金蓮',
-u'三寸弱管',
-u'三寸弱翰',
-u'三寸之舌',
-u'三寸之轄',
-u'散帶衡門',
-u'三島十洲',
-u'三刀之夢',
-u'三等九般',
-u'三等九格',
-u'三點透視',
-u'三叠陽關',
-u'三冬二夏',
-u'三冬文史',
-u'三鬥朝天',
-u'三都作序',
-u'三對六面',
-u'三耳秀才',
-u'散發抽簪',
-u'三番兩次',
-u'三番兩複',
-u'三反四覆',
-u'三番五次',
-u'三分不象人七分倒象鬼',
-u'三分鼎立',
-u'三分鼎足',
-u'三分匠人七分主人',
-u'三分詩七分讀',
-u'三分似人七分似鬼',
-u'三墳五典',
-u'三分武藝七分勇',
-u'三分像人七分似鬼',
-u'三分像人七分像鬼',
-u'三風十愆',
-u'三風五氣',
-u'三父八母',
-u'三複白圭',
-u'三夫成虎',
-u'三夫成市虎',
-u'三複其言',
-u'三複斯言',
-u'三夫之對',
-u'三夫之言',
-u'三竿日出',
-u'三竿日上',
-u'三綱五常',
-u'三告投杼',
-u'三個臭皮匠',
-u'三個臭皮匠合成一個諸葛亮',
-u'三個臭皮匠賽過諸葛亮',
-u'三個官唱兩個喏',
-u'三個和尚沒水吃',
-u'三個女人一台戲',
-u'三更半夜',
-u'三更聽雨',
-u'三宮六院',
-u'三顧草廬',
-u'三姑六婆',
-u'三顧茅廬',
-u'三瓜兩棗',
-u'三跪九叩',
-u'三過其門而不入',
-u'三國志平話',
-u'三好二怯',
-u'三好兩歹',
-u'三好兩惡',
-u'三好兩歉',
-u'三戶亡秦',
-u'散花天女',
-u'三槐九棘',
-u'三環五扣',
-u'三皇五帝',
-u'三荒五月',
-u'散灰扃戶',
-u'三回九轉',
-u'三回兩次',
-u'三回五次',
-u'三回五解',
-u'三魂出竅',
-u'三魂七魄',
-u'三葷五厭',
-u'三饑兩飽',
-u'三緘其口',
-u'三谏之義',
-u'三江七澤',
-u'三江五湖',
-u'三教九流',
-u'三腳兩步',
-u'三節兩壽',
-u'三荊同株',
-u'三徑之資',
-u'三九補一冬',
-u'三九無雪休種麥',
-u'三九之位',
-u'三句不離本行',
-u'三句話不離本行',
-u'三絕韋編',
-u'三爵之罰',
-u'三軍暴骨',
-u'三軍未動糧草先行',
-u'三軍易得一将難求',
-u'三口兩口',
-u'三窟狡兔',
-u'三跨兩步',
-u'三老四少',
-u'三老五更',
-u'三良殉秦',
-u'三鄰四舍',
-u'三令五督',
-u'三令五申',
-u'三六九等',
-u'三鹿郡公',
-u'三馬同槽',
-u'散馬休牛',
-u'三毛七孔',
-u'三媒六證',
-u'散悶消愁',
-u'三面網開',
-u'三命而俯',
-u'三模冗餘',
-u'散木不材',
-u'三沐三薰',
-u'三男兩女',
-u'三男四女',
-u'三臡八菹',
-u'三年不蜚',
-u'三年不窺園',
-u'三年不上門當親也不親',
-u'三年化碧',
-u'三年兩頭',
-u'三年兩載',
-u'三年清知府十萬雪花銀',
-u'三年五載',
-u'三年之艾',
-u'三年之畜',
-u'三朋四友',
-u'三平二滿',
-u'三婆兩嫂',
-u'三妻四妾',
-u'三期賢佞',
-u'三千九萬',
-u'三千裏江山',
-u'三錢之府',
-u'三遷之教',
-u'三千珠履',
-u'三親六故',
-u'三親六眷',
-u'三親四眷',
-u'三親四友',
-u'三清四白',
-u'三求四告',
-u'三拳不敵四手',
-u'三拳兩腳',
-u'三人成虎',
-u'三人市虎',
-u'三人同行',
-u'三人爲衆',
-u'三人行必有我師',
-u'三人一龍',
-u'三人一條心黃土變成金',
-u'三日打魚',
-u'三日打魚兩日曬網',
-u'三日耳聾',
-u'三日兩頭',
-u'三日仆射',
-u'三日繞梁',
-u'三日入廚',
-u'三日新婦',
-u'三日一小宴五日一大宴',
-u'三三兩兩',
-u'三三四四',
-u'三三五五',
-u'三殺三宥',
-u'三山二水',
-u'三山五嶽',
-u'散傷醜害',
-u'三上五落',
-u'三蛇九鼠',
-u'三蛇七鼠',
-u'三申五令',
-u'三生石上',
-u'三牲五鼎',
-u'三生有幸',
-u'三生有緣',
-u'三生之幸',
-u'三屍暴跳',
-u'三屍暴跳七竊生煙',
-u'三十不豪',
-u'三豕渡河',
-u'三十而立',
-u'三豕金根',
-u'三十六策',
-u'三十六策走爲上策',
-u'三十六行',
-u'三十六計',
-u'三十六計走爲上',
-u'三十六計走爲上計',
-u'三十六雨',
-u'三十年河東',
-u'三十年河東三十年河西',
-u'三十年河西',
-u'三矢平虜',
-u'三十騎爲一屯',
-u'三仕三已',
-u'三豕涉河',
-u'三世同财',
-u'三世同爨',
-u'三世爲宦方解穿衣吃飯',
-u'三屍五鬼',
-u'三世一爨',
-u'三十有室',
-u'三世有緣',
-u'三豕之疑',
-u'三獸渡河',
-u'三首六臂',
-u'三鼠開泰',
-u'三書六禮',
-u'三思而後行',
-u'三思而行',
-u'三思後行',
-u'三四調狙',
-u'三台八座',
-u'三台五馬',
-u'三湯兩割',
-u'三湯五割',
-u'三天打魚',
-u'三天打魚兩天曬網',
-u'三田分荊',
-u'叁天兩地',
-u'三天兩頭',
-u'三條九陌',
-u'三頭八臂',
-u'三頭不辨兩',
-u'三頭對案',
-u'三頭二面',
-u'三頭兩面',
-u'三頭兩日',
-u'三頭兩緒',
-u'三頭六臂',
-u'三頭六面',
-u'三頭六證',
-u'三吐三握',
-u'三推六問',
-u'三推五問',
-u'三瓦兩舍',
-u'三瓦兩巷',
-u'三瓦四舍',
-u'三位一體',
-u'三窩兩塊',
-u'三握再吐',
-u'三五蟾光',
-u'三五成群',
-u'三五成衆',
-u'三五之隆',
-u'三無坐處',
-u'三徙成都',
-u'三徙成國',
-u'三下五除二',
-u'三寫成烏',
-u'三寫易字',
-u'三心二意',
-u'三心兩意',
-u'三釁三沐',
-u'三釁三浴',
-u'三星高照',
-u'三省吾身',
-u'三星在戶',
-u'三星在天',
-u'三旬九食',
-u'三薰三沐',
-u'三熏三浴',
-u'三言訛虎',
-u'三言兩句',
-u'三言兩語',
-u'散言碎語',
-u'三言五語',
-u'三陽交泰',
-u'三陽開泰',
-u'三陽啓泰',
-u'三一回五一回',
-u'三盈三虛',
-u'三浴三釁',
-u'三浴三熏',
-u'三怨成府',
-u'三元及第',
-u'三月不違者',
-u'三月不知肉味',
-u'三月三日',
-u'三月忘味',
-u'三災八難',
-u'三災六難',
-u'三占從二',
-u'三戰三北',
-u'三朝五日',
-u'三折肱爲良醫',
-u'三折之肱',
-u'三貞九烈',
-u'三真六草',
-u'散陣投巢',
-u'三貞五烈',
-u'三征七辟',
-u'三智五猜',
-u'三紙無驢',
-u'三旨相公',
-u'三支一扶',
-u'三至之讒',
-u'三至之言',
-u'三字成語',
-u'三字爲椽',
-u'三足鼎立',
-u'三足網絡',
-u'喪膽落膽',
-u'喪膽失魂',
-u'喪膽失魄',
-u'喪膽亡魂',
-u'喪膽銷魂',
-u'喪膽遊魂',
-u'桑弧蒿矢',
-u'桑戶桊樞',
-u'桑弧蓬矢',
-u'桑戶蓬樞',
-u'桑弧矢志',
-u'桑弧之志',
-u'喪魂落魄',
-u'喪魂失魄',
-u'喪家之狗',
-u'喪家之犬',
-u'桑間濮上',
-u'桑間之音',
-u'桑間之詠',
-u'桑間之約',
-u'喪盡天良',
-u'喪倫敗行',
-u'桑落瓦解',
-u'喪明之痛',
-u'桑蓬之志',
-u'喪氣垂頭',
-u'喪權辱國',
-u'喪身失節',
-u'喪師辱國',
-u'桑樹上出血',
-u'桑樹上脫枝柳樹上報',
-u'桑樞韋帶',
-u'桑樞甕牖',
-u'桑田碧海',
-u'桑田變海',
-u'桑田滄海',
-u'桑田成海',
-u'桑田東海',
-u'喪天害理',
-u'桑土綢缪',
-u'喪心病狂',
-u'喪言不文',
-u'桑蔭不徙',
-u'桑蔭未移',
-u'桑榆非晚',
-u'桑榆末景',
-u'桑榆暮景',
-u'桑榆暮影',
-u'桑榆晚景',
-u'桑榆之景',
-u'桑榆之禮',
-u'桑榆之年',
-u'喪鍾護腕',
-u'桑中之歡',
-u'桑中之譏',
-u'桑中之喜',
-u'桑中之約',
-u'桑梓之地',
-u'桑梓之念',
-u'掃除天下',
-u'搔到癢處',
-u'掃地出門',
-u'掃地而盡',
-u'掃地焚香',
-u'掃地皆盡',
-u'掃地盡矣',
-u'掃地俱盡',
-u'掃地無遺',
-u'掃地無餘',
-u'掃地以盡',
-u'搔耳捶胸',
-u'掃鍋刮竈',
-u'瘙豜禡廠',
-u'掃徑相遲',
-u'掃徑以待',
-u'掃眉才子',
-u'掃墓望喪',
-u'嫂溺叔援',
-u'騷情賦骨',
-u'掃清嗓子裏的痰',
-u'騷人詞客',
-u'騷人墨客',
-u'騷人墨士',
-u'騷人雅士',
-u'騷人逸客',
-u'搔首踟蹰',
-u'搔首賣俏',
-u'搔首弄姿',
-u'掃榻相迎',
-u'掃榻以待',
-u'掃榻以迎',
-u'掃田刮地',
-u'搔頭摸耳',
-u'搔頭弄姿',
-u'搔頭抓耳',
-u'騷翁墨客',
-u'掃穴犁庭',
-u'掃穴擒渠',
-u'搔着癢處',
-u'瑟安豎井',
-u'色飽和度',
-u'色膽包天',
-u'色膽大如天',
-u'色膽迷天',
-u'色膽如天',
-u'色飛眉舞',
-u'啬己奉公',
-u'色即是空空即是色',
-u'色厲膽薄',
-u'色厲内荏',
-u'瑟弄琴調',
-u'色仁行違',
-u'色如死灰',
-u'色若死灰',
-u'色色俱全',
-u'瑟瑟縮縮',
-u'色授魂與',
-u'色衰愛弛',
-u'色衰愛寝',
-u'瑟調琴弄',
-u'色爲禍媒',
-u'色藝絕倫',
-u'色藝兩絕',
-u'色藝雙絕',
-u'色藝無雙',
-u'澀于言論',
-u'森羅寶殿',
-u'森羅萬象',
-u'森森芊芊',
-u'森嚴壁壘',
-u'僧多粥薄',
-u'僧多粥少',
-u'殺得窮漢做得富戶',
-u'殺敵緻果',
-u'殺伐決斷',
-u'煞費唇舌',
-u'煞費經營',
-u'煞費苦心',
-u'煞費心機',
-u'煞費周章',
-u'殺父之仇',
-u'殺父之仇不共戴天',
-u'殺雞扯脖',
-u'殺雞哧猴',
-u'殺雞炊黍',
-u'殺雞駭猴',
-u'殺雞警猴',
-u'殺雞抹脖',
-u'殺雞取蛋',
-u'殺雞取卵',
-u'殺雞爲黍',
-u'殺雞吓猴',
-u'殺雞焉用牛刀',
-u'殺家纾難',
-u'殺盡斬絕',
-u'殺了頭還要問充軍',
-u'殺戮本能',
-u'殺戮命令',
-u'殺馬毀車',
-u'傻眉楞眼',
-u'殺妻求将',
-u'殺氣騰騰',
-u'殺青甫就',
-u'殺人兵蟻',
-u'殺人不過頭點地',
-u'殺人不見血',
-u'殺人不怕血腥氣',
-u'殺人不眨眼',
-u'殺人償命欠債還錢',
-u'殺人放火',
-u'殺人劫财',
-u'殺人劫貨',
-u'殺人可恕',
-u'殺人可恕情理難容',
-u'殺人滅口',
-u'殺人如藨',
-u'殺人如草',
-u'殺人如草不聞聲',
-u'殺人如蒿',
-u'殺人如芥',
-u'殺人如麻',
-u'殺人如蓺',
-u'殺人須見血救人須救徹',
-u'殺人一萬',
-u'殺人一萬自損三千',
-u'殺人盈野',
-u'殺人越貨',
-u'沙上建塔',
-u'殺身報國',
-u'殺身成名',
-u'殺身成仁',
-u'殺身成義',
-u'殺身出生',
-u'殺身救國',
-u'殺身之禍',
-u'殺生不如放生',
-u'殺生害命',
-u'殺生與奪',
-u'殺生之權',
-u'傻頭傻腦',
-u'歃血而盟',
-u'歃血爲盟',
-u'歃血爲誓',
-u'歃血之盟',
-u'殺一警百',
-u'殺一利百',
-u'殺衣縮食',
-u'煞有介事',
-u'铩羽暴鱗',
-u'铩羽而歸',
-u'铩羽而逃',
-u'铩羽涸鱗',
-u'殺彘教子',
-u'曬腹中書',
-u'篩鑼擂鼓',
-u'篩選主體',
-u'善罷幹休',
-u'善敗由己',
-u'山包海彙',
-u'山包海容',
-u'山奔海立',
-u'山崩川竭',
-u'山崩地坼',
-u'山崩地裂',
-u'山崩地塌',
-u'山崩地陷',
-u'山崩海嘯',
-u'山崩水竭',
-u'山崩瓦解',
-u'山崩鍾應',
-u'善必壽老',
-u'山壁之拳',
-u'山不辭石故能高',
-u'山不拒石故能高',
-u'善财難舍',
-u'善藏者善生存',
-u'山長水闊',
-u'山長水遠',
-u'山成九仞功虧一篑',
-u'山程水驿',
-u'扇翅欲飛',
-u'山重水複',
-u'山重水闊',
-u'山川表裏',
-u'山川米聚',
-u'山川修阻',
-u'山川震眩',
-u'山從塵土起',
-u'善刀而藏',
-u'山巅之塔',
-u'單丁之身',
-u'煽動烈焰',
-u'山鬥之望',
-u'善惡到頭終有報',
-u'善惡昭彰',
-u'芟繁從簡',
-u'芟繁就簡',
-u'扇風點火',
-u'山膚水豢',
-u'山複整妝',
-u'善感多愁',
-u'山高海深',
-u'山高皇帝遠',
-u'山高水長',
-u'山高水低',
-u'山高水險',
-u'山高水遠',
-u'山高遮不住太陽',
-u'山公倒載',
-u'山公酩酊',
-u'山公啓事',
-u'山狗肉排',
-u'山谷小徑',
-u'山谷之士',
-u'山光水色',
-u'山海珍錯',
-u'山海之味',
-u'山寒水冷',
-u'山河百二',
-u'山河表裏',
-u'山河帶砺',
-u'山河襟帶',
-u'山河破碎',
-u'山河容易改禀性最難移',
-u'山河易改本性難移',
-u'山河之固',
-u'山河之險',
-u'擅壑專丘',
-u'山呼海嘯',
-u'善化不足',
-u'删華就素',
-u'山環水抱',
-u'山輝川媚',
-u'扇惑人心',
-u'扇火止沸',
-u'山積波委',
-u'山脊雌豹',
-u'山雞舞鏡',
-u'山脊雄豹',
-u'山雞映水',
-u'山雞照影',
-u'善賈而沽',
-u'善價而賈',
-u'繕甲厲兵',
-u'繕甲治兵',
-u'山間林下',
-u'山節藻棁',
-u'山靜日長',
-u'山砠水厓',
-u'山枯石死',
-u'山虧一蒉',
-u'山虧一篑',
-u'山岚瘴氣',
-u'山厲河帶',
-u'擅離職守',
-u'山梁之秋',
-u'山林隐逸',
-u'山林幼蜂',
-u'山林之士',
-u'山林鍾鼎',
-u'山嶺巨人',
-u'山嶺雪人',
-u'山溜穿石',
-u'善馬熟人',
-u'善眉善眼',
-u'善門難開',
-u'山盟海誓',
-u'山鳴谷應',
-u'山明水秀',
-u'山木自寇',
-u'山南海北',
-u'善男善女',
-u'善男信女',
-u'讪皮讪臉',
-u'山栖谷隐',
-u'善氣迎人',
-u'善騎者堕',
-u'山清水秀',
-u'山情水意',
-u'山窮水斷',
-u'山窮水盡',
-u'山窮水絕',
-u'山丘之王',
-u'潸然淚下',
-u'善人好欺負',
-u'山容海納',
-u'山容水态',
-u'山銳則不高',
-u'善善從長',
-u'善善惡惡',
-u'姗姗來遲',
-u'山上無老虎猴子稱大王',
-u'山上有山',
-u'善始克終',
-u'善事可作',
-u'善始令終',
-u'善始善終',
-u'山水相連',
-u'閃爍其詞',
-u'善頌善禱',
-u'山薮藏疾',
-u'山塌地崩',
-u'善體下情',
-u'山停嶽峙',
-u'山童石爛',
-u'善爲曲辭',
-u'善爲說辭',
-u'善爲我辭',
-u'善文能武',
-u'删蕪就簡',
-u'扇席溫枕',
-u'山鄉巨變',
-u'擅行不顧',
-u'山行海宿',
-u'山崖尖盾',
-u'讪牙閑嗑',
-u'山崖圓盾',
-u'苫眼鋪眉',
-u'山陽笛聲',
-u'山陽舊曲',
-u'山陽鄰笛',
-u'山陽聞笛',
-u'山陽夜笛',
-u'山搖地動',
-u'山遙路遠',
-u'山遙水遠',
-u'山肴野蔬',
-u'山肴野蔌',
-u'山殽野湋',
-u'芟夷大難',
-u'善以爲寶',
-u'山陰道上應接不暇',
-u'山吟澤唱',
-u'善有善報',
-u'善有善報惡有惡報',
-u'善遊者溺',
-u'善與人交',
-u'山雨欲來風滿樓',
-u'山猿老妖',
-u'山淵之精',
-u'山嶽崩頹',
-u'掞藻飛聲',
-u'善者不來',
-u'善者不來來者不善',
-u'山珍海錯',
-u'山珍海味',
-u'山珍海胥',
-u'扇枕溫被',
-u'扇枕溫衾',
-u'扇枕溫席',
-u'山止川行',
-u'善治善能',
-u'山峙淵渟',
-u'山指重皮',
-u'山中白雲',
-u'山中無好漢猢狲稱霸王',
-u'山中無甲子寒盡不知年',
-u'山中無老虎猴子稱大王',
-u'山中也有千年樹',
-u'山中宰相',
-u'善終正寝',
-u'善自處置',
-u'善自爲地',
-u'善自爲謀',
-u'善自珍重',
-u'山陬海噬',
-u'山走石泣',
-u'擅作威福',
-u'上兵伐謀',
-u'賞不當功',
-u'上不得台盤兒',
-u'上不上下不下',
-u'賞不遺贱',
-u'賞不逾日',
-u'賞不逾時',
-u'上不沾天下不着地',
-u'上不着天',
-u'上不着天下不着地',
-u'上蔡蒼鷹',
-u'傷财受累',
-u'上蔡逐獵',
-u'上谄下渎',
-u'上谄下驕',
-u'上場當念下場時',
-u'上傳下達',
-u'賞賜無度',
-u'上慈下孝',
-u'上竄下跳',
-u'上當學乖',
-u'尚德緩刑',
-u'賞罰不當',
-u'賞罰不明',
-u'賞罰不明百事不成',
-u'賞罰不信',
-u'賞罰黜陟',
-u'賞罰分明',
-u'賞罰無章',
-u'賞罰信明',
-u'賞罰嚴明',
-u'上方寶劍',
-u'上方不足',
-u'上方不足下比有餘',
-u'傷風敗化',
-u'傷風敗俗',
-u'上風官司',
-u'上竿掇梯',
-u'賞高罰下',
-u'上根大器',
-u'賞功罰罪',
-u'商賈輻辏',
-u'上古之書',
-u'上挂下聯',
-u'上海社保基金案',
-u'上好下甚',
-u'上和下睦',
-u'傷痕累累',
-u'傷化敗俗',
-u'傷化虐民',
-u'商鑒不遠',
-u'傷教敗俗',
-u'上交不谄',
-u'傷筋動骨',
-u'賞金風暴',
-u'觞酒豆肉',
-u'尚堪一行',
-u'賞勞罰罪',
-u'上了樓就撤梯',
-u'賞立誅必',
-u'傷廉愆義',
-u'上梁不下下梁歪',
-u'上梁不正下梁歪',
-u'上林鴻雁',
-u'傷鱗入夢',
-u'上陵下替',
-u'上漏下濕',
-u'商旅不行',
-u'商旅海岸',
-u'上馬一提金下馬一提銀',
-u'上嫚下暴',
-u'上門兒的買賣好做',
-u'上門買賣',
-u'上南落北',
-u'上篇上論',
-u'傷麒森林',
-u'賞奇析疑',
-u'上勤下順',
-u'上清燈仙',
-u'上清童子',
-u'上情下達',
-u'上求下告',
-u'上人不好下人不要',
-u'傷人一語',
-u'賞善罰惡',
-u'賞善罰否',
-u'賞善罰淫',
-u'商山四皓',
-u'尚慎旃哉',
-u'傷時感事',
-u'上樹拔梯',
-u'上數頭下數腳',
-u'上書言事',
-u'上司差遣身不由己',
-u'上驷之才',
-u'上替下陵',
-u'上天不從人願',
-u'傷天害理',
-u'上天入地',
-u'上天無路',
-u'上天無路入地無門',
-u'上天有好生之德',
-u'上廳行卸',
-u'賞同罰異',
-u'上頭上臉的',
-u'上頭笑着底下就使絆子',
-u'傷亡枕藉',
-u'晌午不動鍋晚上吃得多',
-u'上無片瓦',
-u'上無片瓦下無插針之地',
-u'上無片瓦下無立錐之地',
-u'上無片瓦下無卓錐',
-u'上下和合',
-u'上下交困',
-u'上下交征',
-u'上下結合',
-u'上下其手',
-u'上下同門',
-u'上下同心',
-u'上下同欲',
-u'上下無常',
-u'上下相安',
-u'上下一心',
-u'上下一緻',
-u'上下有等',
-u'上下有服',
-u'上下之手',
-u'賞賢罰暴',
-u'賞賢使能',
-u'賞信必罰',
-u'傷心慘目',
-u'賞信罰必',
-u'賞信罰明',
-u'傷心蒿目',
-u'傷心疾首',
-u'賞心樂事',
-u'賞心惬目',
-u'賞心悅目',
-u'上行下效',
-u'傷胸扪足',
-u'尚虛中饋',
-u'傷言紮語',
-u'商羊鼓舞',
-u'賞一勸百',
-u'賞一勸衆',
-u'商彜夏鼎',
-u'上溢下漏',
-u'上醫醫國',
-u'傷夷折衄',
-u'商彜周鼎',
-u'尚有可爲',
-u'上有天堂下有蘇杭',
-u'上雨旁風',
-u'上援下推',
-u'上運行的操作系統',
-u'上蒸下報',
-u'上知天文下知地理',
-u'上智下愚',
-u'少安勿躁',
-u'少不讀三國',
-u'少不更事',
-u'少不經事',
-u'少不看三國',
-u'少成若性',
-u'少吃儉用',
-u'少吃無穿',
-u'少吃一口香甜一宿',
-u'少達多窮',
-u'少裆無系',
-u'召父杜母',
-u'捎關打節',
-u'韶光荏苒',
-u'韶光似箭',
-u'韶光虛擲',
-u'燒桂煮玉',
-u'韶華如駛',
-u'韶華虛度',
-u'燒火的養了當家的',
-u'燒火棍一頭熱',
-u'少見多怪',
-u'少講空話',
-u'燒眉之急',
-u'少年夫妻老來伴',
-u'少年老誠',
-u'少年情懷盡是詩',
-u'少年心事當拿雲',
-u'少女嫩婦',
-u'邵平瓜圃',
-u'少氣無力',
-u'燒琴煮鶴',
-u'邵生瓜田',
-u'稍勝一籌',
-u'勺水一脔',
-u'少私寡欲',
-u'少所見多所怪',
-u'少所推讓',
-u'少所許可',
-u'少調失教',
-u'少頭沒尾',
-u'少頭缺尾',
-u'少頭無尾',
-u'燒犀觀火',
-u'少小無猜',
-u'少校戰甲',
-u'紹休聖緒',
-u'稍遜一籌',
-u'少言寡語',
-u'韶顔稚齒',
-u'少者百餘人',
-u'少壯不努力',
-u'少壯不努力老大徒傷悲',
-u'燒灼之棒',
-u'少縱即逝',
-u'舍安就危',
-u'蛇杯弓影',
-u'舍本即末',
-u'舍本理末',
-u'折本買賣',
-u'舍本求末',
-u'舍本事末',
-u'舍本問末',
-u'舍本務末',
-u'舍本逐末',
-u'涉筆成趣',
-u'舌敝唇焦',
-u'舌敝耳聾',
-u'赦不妄下',
-u'舌粲蓮花',
-u'舌長事多',
-u'舍得一身剮',
-u'舍得一身剮敢把皇帝拉下馬',
-u'舌底瀾翻',
-u'舍短從長',
-u'舍短錄長',
-u'舍短取長',
-u'舍短用長',
-u'舌端月旦',
-u'舌鋒如火',
-u'舌幹唇焦',
-u'攝官承乏',
-u'設官分職',
-u'麝過春山草木香',
-u'赦過宥罪',
-u'涉海登山',
-u'涉海鑿河',
-u'射虎南山',
-u'設弧之辰',
-u'蛇化爲龍',
-u'蛇化爲龍不變其文',
-u'蛇虺魍魉',
-u'社會賢達',
-u'舍己成人',
-u'舍己從人',
-u'舍己就人',
-u'社稷生民',
-u'舍己爲公',
-u'舍己爲人',
-u'社稷爲墟',
-u'舍己芸人',
-u'社稷之臣',
-u'社稷之器',
-u'社稷之役',
-u'舌劍唇槍',
-u'舌尖口快',
-u'涉艱履危',
-u'折箭爲誓',
-u'舌挢不下',
-u'舍近即遠',
-u'舍近謀遠',
-u'舍近求遠',
-u'舍近圖遠',
-u'舍近務遠',
-u'舍近治遠',
-u'蛇頸龍肉',
-u'舍舊謀新',
-u'舌卷齊城',
-u'蛇口蜂針',
-u'射利沽名',
-u'舌芒于劍',
-u'蛇眉鼠眼',
-u'涉密範疇',
-u'赦免法衣',
-u'赦免聖裝',
-u'赦免之觸',
-u'舍命不舍财',
-u'舍命救人',
-u'舍命陪君子',
-u'舍牛相齊',
-u'攝魄鈎魂',
-u'歙漆阿膠',
-u'舌槍唇劍',
-u'舌橋不下',
-u'賒去物件莫取錢',
-u'蛇雀之報',
-u'舍然大喜',
-u'射人先射馬',
-u'賒三千不如現八百',
-u'舍身成仁',
-u'設身處地',
-u'蛇神牛鬼',
-u'舍身求法',
-u'蛇身人面',
-u'蛇身人首',
-u'舍身圖報',
-u'舍身爲國',
-u'舍生存義',
-u'舍生取誼',
-u'舍生忘死',
-u'蛇食鲸吞',
-u'舍實求虛',
-u'赦事誅意',
-u'射手殘骨',
-u'攝手攝腳',
-u'社鼠城狐',
-u'涉水登山',
-u'設帨良辰',
-u'設帨之辰',
-u'舍死忘生',
-u'舌頭底下壓死人',
-u'舌頭伸出尺二長',
-u'蛇頭鼠眼',
-u'蛇兔聯盟',
-u'涉危履險',
-u'攝威擅勢',
-u'舍文求質',
-u'舍我複誰',
-u'舍我其誰',
-u'蛇無頭不行',
-u'涉想猶存',
-u'舍小取大',
-u'舍邪歸正',
-u'蛇蠍美人',
-u'蛇蠍心腸',
-u'設心處慮',
-u'蛇心佛口',
-u'設心積慮',
-u'蛇行鬥折',
-u'蛇行匍伏',
-u'社燕秋鴻',
-u'設言托意',
-u'折腰五鬥',
-u'設疑破敵',
-u'蛇蚓蟠結',
-u'蛇影杯弓',
-u'射影含沙',
-u'蛇欲吞象',
-u'舌戰群儒',
-u'舌戰群雄',
-u'設張舉措',
-u'舌者兵也',
-u'舍正從邪',
-u'蛇之迅捷',
-u'蛇鑽的窟窿蛇知道',
-u'誰人背後無人說',
-u'誰人不愛千鍾粟',
-u'誰人不愛子孫賢',
-u'誰人制下的',
-u'神安氣集',
-u'神安則寐',
-u'深奧莫測',
-u'身敗名隳',
-u'身敗名裂',
-u'深閉固距',
-u'深壁固壘',
-u'神兵利器',
-u'神兵天将',
-u'神不附體',
-u'神不歸舍',
-u'深不可測',
-u'神不守舍',
-u'身不同己',
-u'身不由己',
-u'身不由主',
-u'身不遇時',
-u'神不知鬼不覺',
-u'神不知鬼不曉',
-u'神不主體',
-u'神采飛揚',
-u'神采煥發',
-u'神采煥然',
-u'神采奕然',
-u'神采奕奕',
-u'神采英拔',
-u'神藏鬼伏',
-u'深藏若虛',
-u'身操井臼',
-u'神差鬼遣',
-u'神差鬼使',
-u'神超形越',
-u'參辰卯酉',
-u'參辰日月',
-u'神馳力困',
-u'深雠大恨',
-u'神愁鬼哭',
-u'深仇宿怨',
-u'深仇重怨',
-u'身處福中不知福',
-u'神出鬼沒',
-u'神出鬼入',
-u'神出鬼行',
-u'深刺腧髓',
-u'身單力薄',
-u'身當其境',
-u'身當矢石',
-u'神道設教',
-u'神到之筆',
-u'深得人心',
-u'深冬之寒',
-u'神短氣浮',
-u'神而明之',
-u'神而明之存乎其人',
-u'身廢名裂',
-u'身非木石',
-u'神飛氣揚',
-u'神飛色舞',
-u'身膏鼎镬',
-u'深根固本',
-u'深根固蒂',
-u'深根寧極',
-u'深根蟠結',
-u'深更半夜',
-u'深耕易耨',
-u'神工鬼斧',
-u'神工鬼力',
-u'神工妙力',
-u'神工天巧',
-u'神工意匠',
-u'深溝壁壘',
-u'深溝高壘',
-u'深溝固壘',
-u'深谷爲陵',
-u'神鬼不測',
-u'神鬼不知',
-u'神鬼莫測',
-u'神鬼難測',
-u'神鬼怕惡人',
-u'神号鬼哭',
-u'神号鬼泣',
-u'深核燈籠',
-u'參橫鬥轉',
-u'身後識方幹',
-u'身後蕭條',
-u'神乎其技',
-u'神乎其神',
-u'神譁鬼叫',
-u'身懷六甲',
-u'參回鬥轉',
-u'神魂蕩飏',
-u'神魂顛倒',
-u'神魂飛越',
-u'神魂恍惚',
-u'神魂撩亂',
-u'神魂飄蕩',
-u'神魂失據',
-u'神魂搖蕩',
-u'申禍無良',
-u'深稽博考',
-u'審幾度勢',
-u'審己度人',
-u'神機鬼械',
-u'身寄虎吻',
-u'神機妙策',
-u'神機妙術',
-u'神機妙算',
-u'神機妙用',
-u'深計遠慮',
-u'身價百倍',
-u'身家性命',
-u'神奸巨蠹',
-u'深奸巨猾',
-u'深見遠慮',
-u'神焦鬼爛',
-u'身教重于言教',
-u'身經百戰',
-u'神經錯亂',
-u'蜃景之槌',
-u'深扃固鑰',
-u'身居福中不知福',
-u'深居簡出',
-u'身寬不如心寬',
-u'神來氣旺',
-u'神來之筆',
-u'身曆其境',
-u'深厲淺揭',
-u'身臨其境',
-u'神靈廟祝肥',
-u'神領意得',
-u'神領意造',
-u'神流氣鬯',
-u'神龍見首',
-u'神龍見首不見尾',
-u'神龍馬壯',
-u'神龍失埶',
-u'蜃樓海巿',
-u'蜃樓海市',
-u'神眉鬼道',
-u'神眉鬼眼',
-u'神迷意奪',
-u'神妙莫測',
-u'神滅形消',
-u'深明大義',
-u'深銘肺腑',
-u'身名俱敗',
-u'身名俱滅',
-u'身名俱泰',
-u'身名兩泰',
-u'神谟廟算',
-u'神谟遠算',
-u'神謀妙策',
-u'神謀妙算',
-u'深謀遠略',
-u'深謀遠慮',
-u'神目如電',
-u'神怒民痛',
-u'神怒民怨',
-u'神怒人棄',
-u'神怒人怨',
-u'神奇臭腐',
-u'神奇腐朽',
-u'神奇荒怪',
-u'神氣恍惚',
-u'神氣活現',
-u'身騎兩頭馬',
-u'神奇莫測',
-u'神氣十足',
-u'神氣閑定',
-u'神氣揚揚',
-u'神氣自如',
-u'神氣自若',
-u'神牽鬼制',
-u'身強力壯',
-u'深切着白',
-u'深切著白',
-u'深切著明',
-u'神欽鬼伏',
-u'神情不屬',
-u'深情底理',
-u'深情故劍',
-u'神清骨爽',
-u'神清骨秀',
-u'深情厚誼',
-u'神情恍惚',
-u'神清氣和',
-u'神清氣朗',
-u'神清氣茂',
-u'神清氣全',
-u'神清氣爽',
-u'神清氣正',
-u'身輕言微',
-u'神情自若',
-u'神區鬼奧',
-u'審曲面勢',
-u'審曲面埶',
-u'神人共憤',
-u'神人共悅',
-u'深仁厚澤',
-u'神人鑒知',
-u'神融氣泰',
-u'深入膏肓',
-u'深入骨髓',
-u'深入迷宮',
-u'身如逆流船',
-u'深入淺出',
-u'深入人心',
-u'深入顯出',
-u'神入之石',
-u'神喪膽落',
-u'神色不變',
-u'神色不動',
-u'神色不驚',
-u'神色不撓',
-u'神色倉皇',
-u'神色怡然',
-u'神色張皇',
-u'神色自得',
-u'神色自如',
-u'神色自若',
-u'深沙平原',
-u'深山畢竟藏猛虎',
-u'深山長谷',
-u'深山老林',
-u'深山密林',
-u'深山窮谷',
-u'深山窮林',
-u'深山野墺',
-u'深山幽谷',
-u'身上無衣肚中無食',
-u'參商之虞',
-u'慎身修永',
-u'審時度勢',
-u'神使鬼差',
-u'神施鬼設',
-u'慎始敬終',
-u'伸手不打笑面人',
-u'伸手不見五指',
-u'伸手就是一巴掌',
-u'身首異處',
-u'身首異地',
-u'神輸鬼運',
-u'神術妙策',
-u'神術妙法',
-u'神術妙計',
-u'深水披風',
-u'神思恍惚',
-u'深思苦索',
-u'深思熟慮',
-u'深思遠慮',
-u'神竦心惕',
-u'伸縮自如',
-u'身體發膚',
-u'身體力行',
-u'深天淚海',
-u'神通廣大',
-u'神頭鬼臉',
-u'神頭鬼面',
-u'神頭鬼腦',
-u'伸頭縮頸',
-u'伸頭探腦',
-u'深圖遠算',
-u'身退功成',
-u'身外之物',
-u'神完氣足',
-u'神往神來',
-u'身微力薄',
-u'身微言輕',
-u'深惟重慮',
-u'深文大義',
-u'深文附會',
-u'深文峻法',
-u'深文巧诋',
-u'深文曲折',
-u'深文周納',
-u'深文周内',
-u'身無長處',
-u'身無長物',
-u'身無寸縷',
-u'身無寸鐵',
-u'身無分文',
-u'神武挂冠',
-u'身無立錐',
-u'深惡痛诋',
-u'深惡痛恨',
-u'深惡痛嫉',
-u'深惡痛絕',
-u'身無完膚',
-u'身無擇行',
-u'身先朝露',
-u'身顯名揚',
-u'神閑氣定',
-u'神閑氣靜',
-u'身先士衆',
-u'身先士卒',
-u'神仙中人',
-u'甚嚣塵上',
-u'神霄绛阙',
-u'慎小謹微',
-u'慎小事微',
-u'甚嚣畏尾',
-u'深信不疑',
-u'身心交病',
-u'身心交瘁',
-u'神搖目奪',
-u'神搖目眩',
-u'身遙心迩',
-u'神搖意奪',
-u'神怿氣愉',
-u'神怡心曠',
-u'神意自若',
-u'神鷹翼揚',
-u'深猷遠計',
-u'甚于防川',
-u'神郁氣悴',
-u'伸冤理枉',
-u'申冤吐氣',
-u'身遠心近',
-u'神運鬼輸',
-u'身在曹營心在漢',
-u'身在福中不知福',
-u'身在江湖',
-u'身在江湖心存魏阙',
-u'身在江湖心懸魏阙',
-u'身在林泉心懷魏阙',
-u'深宅大院',
-u'神湛骨寒',
-u'身正不怕影兒斜',
-u'身正不怕影斜',
-u'身正不怕影子歪',
-u'身正不怕影子斜',
-u'神至之筆',
-u'深知灼見',
-u'慎終承始',
-u'深中笃行',
-u'深中肯綮',
-u'慎重其事',
-u'慎終如始',
-u'深中隐厚',
-u'慎終于始',
-u'慎終追遠',
-u'神醉心往',
-u'身做身當',
-u'勝敗及兵家常事',
-u'勝敗乃兵家常事',
-u'生搬硬套',
-u'盛必慮衰',
-u'生不逢辰',
-u'生不逢時',
-u'勝不驕敗不餒',
-u'生不論魂',
-u'生不能養死不能葬',
-u'生不遇時',
-u'剩菜殘羹',
-u'生财有道',
-u'生财之道',
-u'勝殘去殺',
-u'聲徹霄漢',
-u'聲徹雲霄',
-u'聲稱籍甚',
-u'省吃儉用',
-u'生齒日繁',
-u'繩床瓦竈',
-u'生存本能',
-u'生存技能',
-u'聖帝明王',
-u'聖殿騎士',
-u'生棟覆屋',
-u'聲東擊西',
-u'聲動梁塵',
-u'升鬥之祿',
-u'勝讀十年書',
-u'生而知之',
-u'生發未燥',
-u'省煩從簡',
-u'賸馥殘膏',
-u'升高望遠',
-u'升高自卑',
-u'升高自下',
-u'笙歌徹夜',
-u'聲歌鼎沸',
-u'笙歌匝地',
-u'生公說法頑石點頭',
-u'升官發财',
-u'生關死劫',
-u'生孩容易養孩難',
-u'生花妙筆',
-u'生花之筆',
-u'生活美滿',
-u'生機勃勃',
-u'生寄死歸',
-u'盛極一時',
-u'聲迹彰露',
-u'聲價十倍',
-u'聲叫聲應',
-u'聖經賢傳',
-u'生聚教訓',
-u'繩鋸木斷',
-u'繩厥祖武',
-u'聖君賢相',
-u'聲口不凡',
-u'盛況空前',
-u'生拉硬扯',
-u'生老病死',
-u'聲淚俱下',
-u'生離死別',
-u'生靈塗地',
-u'生靈塗炭',
-u'生龍活虎',
-u'生米煮成熟飯',
-u'生米做成熟飯',
-u'生民塗炭',
-u'聲名狼藉',
-u'盛名難副',
-u'聲名洋溢',
-u'盛名之下',
-u'盛名之下其實難副',
-u'盛名之下無虛士',
-u'繩墨之言',
-u'生怕一個不留神',
-u'生氣勃勃',
-u'盛氣淩人',
-u'聲氣相求',
-u'聲氣相通',
-u'聲氣相投',
-u'繩其祖武',
-u'生前何必久睡',
-u'繩愆糾謬',
-u'聲情并茂',
-u'盛情難卻',
-u'笙磬同音',
-u'聲求氣應',
-u'繩趨尺步',
-u'勝券在握',
-u'聖人出黃河清',
-u'聖人雲吾從衆',
-u'生榮死哀',
-u'生榮死衰',
-u'聲容宛在',
-u'聲如洪鍾',
-u'聲色不動',
-u'聲色場所',
-u'聲色狗馬',
-u'聲色貨利',
-u'聲色俱厲',
-u'聲色犬馬',
-u'生殺予奪',
-u'升山采珠',
-u'剩山殘水',
-u'生生不息',
-u'生生不已',
-u'生生世世',
-u'生生死死',
-u'盛時常作衰時想',
-u'省是費贱是貴',
-u'聲勢浩大',
-u'聲勢赫赫',
-u'盛食厲兵',
-u'聲勢烜赫',
-u'聖手仁心',
-u'繩樞甕牖',
-u'盛衰利害',
-u'盛衰榮枯',
-u'盛衰榮辱',
-u'盛衰相乘',
-u'盛衰興廢',
-u'剩水殘山',
-u'聲說聲聽',
-u'生死不渝',
-u'生死存亡',
-u'生死關頭',
-u'聲嘶力竭',
-u'聲絲氣咽',
-u'生死肉骨',
-u'生死未蔔',
-u'生死相依',
-u'生死攸關',
-u'生死由命成敗在天',
-u'生死有命富貴在天',
-u'生死予奪',
-u'生死與共',
-u'生死之交',
-u'升堂拜母',
-u'升堂入室',
-u'聲圖會議',
-u'生吞活剝',
-u'聲吞氣忍',
-u'生拖死拽',
-u'聲望卓著',
-u'聲威大震',
-u'聲聞過情',
-u'鼪鼯之徑',
-u'聲希味淡',
-u'盛喜之言多失信',
-u'聖賢言語',
-u'聲雄力猛',
-u'盛筵必散',
-u'盛宴難再',
-u'生意不成情意在',
-u'生意不成仁義在',
-u'繩一戒百',
-u'生意興隆',
-u'聖音天簌',
-u'聲應氣求',
-u'生有地死有處',
-u'勝友如雲',
-u'鼪鼬之迳',
-u'乘輿播遷',
-u'聖域夫諸',
-u'聲譽鵲起',
-u'生于憂患死于安樂',
-u'聲譽卓著',
-u'聲援他人',
-u'勝造七級浮圖',
-u'生則同衾死則同穴',
-u'生張熟魏',
-u'省者全無',
-u'聲振寰宇',
-u'聲振林木',
-u'聲振屋瓦',
-u'繩之以法',
-u'生衆食寡',
-u'生子容易養子難',
-u'聲罪緻讨',
-u'食案方丈',
-u'十八般兵器',
-u'十八般武藝',
-u'十八層地獄',
-u'十八無醜女',
-u'石壩小徑',
-u'事敗垂成',
-u'失敗是成功之母',
-u'失敗爲成功之母',
-u'事半功百',
-u'事半功倍',
-u'士飽馬騰',
-u'事倍功半',
-u'實逼處此',
-u'勢必登天還難',
-u'食必方丈',
-u'事必躬親',
-u'使臂使指',
-u'識變從宜',
-u'食辨勞薪',
-u'十變五化',
-u'示貶于褒',
-u'士別三日',
-u'士別三日當刮目相待',
-u'士別三日刮目相待',
-u'十病九痛',
-u'勢不并立',
-u'食不充腸',
-u'食不充饑',
-u'食不充口',
-u'十不當一',
-u'十不得一',
-u'市不二價',
-u'食不二味',
-u'十步芳草',
-u'食不甘味',
-u'事不關己',
-u'事不關己高高挂起',
-u'事不關己高挂起',
-u'事不關心關心者亂',
-u'食不果腹',
-u'事不過三',
-u'食不餬口',
-u'食不遑味',
-u'食不兼肉',
-u'食不兼味',
-u'史不絕書',
-u'勢不可當',
-u'勢不可遏',
-u'時不可失',
-u'食不累味',
-u'勢不兩存',
-u'誓不兩立',
-u'食不念飽',
-u'食不求飽',
-u'食不求甘',
-u'事不三思終有後悔',
-u'事不師古',
-u'時不我待',
-u'時不我與',
-u'食不暇飽',
-u'食不下咽',
-u'十步香草',
-u'十步香車',
-u'實不相瞞',
-u'勢不相容',
-u'矢不虛發',
-u'食不厭精',
-u'食不厭精脍不厭細',
-u'食不言寝不語',
-u'事不宜遲',
-u'食不異肉',
-u'事不有餘',
-u'失不再來',
-u'十步之内必有芳草',
-u'食不知味',
-u'食不重肉',
-u'食不重味',
-u'恃才傲物',
-u'視财如命',
-u'适材适所',
-u'識才尊賢',
-u'視差梯度',
-u'詩腸鼓吹',
-u'石沉大海',
-u'拾陳蹈故',
-u'詩成不厭百回改',
-u'詩成不厭千回改',
-u'十成九穩',
-u'勢成騎虎',
-u'石城湯池',
-u'石赤不奪',
-u'時绌舉赢',
-u'虱處裈中',
-u'師出無名',
-u'事出無奈',
-u'師出有名',
-u'事出有因',
-u'侍從之弓',
-u'豕竄狼逋',
-u'拾帶重還',
-u'世代書香',
-u'勢單力孤',
-u'視丹如綠',
-u'适當其沖',
-u'适當其時',
-u'失道寡助',
-u'事到臨頭懊悔遲',
-u'世道人情',
-u'世道人心',
-u'事到頭來不自由',
-u'市道之交',
-u'師道尊言',
-u'适得其反',
-u'十冬臘月',
-u'舐犢情深',
-u'舐犢之愛',
-u'事多必雜',
-u'虱多不癢',
-u'虱多了不咬債多了不愁',
-u'拾掇無遺',
-u'十惡不赦',
-u'十惡五逆',
-u'施而不費',
-u'食而不化',
-u'視而不見',
-u'視而不見聽而不聞',
-u'是兒不死是财不散',
-u'食而不知其味',
-u'十二金钗',
-u'室迩人遐',
-u'室迩人遙',
-u'室迩人遠',
-u'十二萬分',
-u'識二五而不知十',
-u'十二字成語',
-u'十發十中',
-u'施法速率',
-u'食飯皇帝大',
-u'實蕃有徒',
-u'食方于前',
-u'是非得失',
-u'事非得已',
-u'是非顛倒',
-u'是非分明',
-u'是非皆因多開口',
-u'飾非拒谏',
-u'是非口舌',
-u'是非曲直',
-u'飾非遂過',
-u'施绯拖綠',
-u'飾非文過',
-u'飾非掩過',
-u'飾非養過',
-u'是非之地不久處',
-u'是非之地不久留',
-u'是非隻爲多開口',
-u'是非之心',
-u'是非隻因多開口',
-u'是非自有公論',
-u'十分悲慘',
-u'豕分蛇斷',
-u'适逢其會',
-u'适逢其時',
-u'世風日下',
-u'十風五雨',
-u'釋縛焚榇',
-u'師父領進門修行在個人',
-u'十夫桡椎',
-u'十夫楺椎',
-u'食甘寝安',
-u'食甘寝寧',
-u'勢高益危',
-u'十個明星當不的月',
-u'十個男人九個花',
-u'使功不如使過',
-u'飾垢掩疵',
-u'事故變遷',
-u'食古不化',
-u'是古非今',
-u'勢孤力薄',
-u'食古如鲠',
-u'時乖命蹇',
-u'使乖弄巧',
-u'時乖運舛',
-u'時乖運乖',
-u'時乖運蹇',
-u'時乖運拙',
-u'飾怪裝奇',
-u'是官比民強',
-u'是罐子也有兩隻耳朵',
-u'屍光胫甲',
-u'時光似箭日月如梭',
-u'十光五色',
-u'時光之穴',
-u'屎滾尿流',
-u'事過境遷',
-u'事過情遷',
-u'事過心清涼',
-u'誓海盟山',
-u'豕亥魚魯',
-u'十寒一暴',
-u'十行俱下',
-u'施号發令',
-u'時和年豐',
-u'時和歲豐',
-u'時和歲稔',
-u'勢合形離',
-u'事核言直',
-u'屍橫遍野',
-u'時亨運泰',
-u'獅吼重甲',
-u'事後諸葛亮',
-u'豕虎傳譌',
-u'事緩則圓',
-u'釋回增美',
-u'失魂蕩魄',
-u'失魂落魄',
-u'失魂喪膽',
-u'失魂喪魄',
-u'實獲我心',
-u'食藿懸鹑',
-u'事火咒龍',
-u'世濟其美',
-u'事急無君子',
-u'食饑息勞',
-u'嗜痂成癖',
-u'詩家三昧',
-u'嗜痂之癖',
-u'世間好語書說盡',
-u'石緘金匮',
-u'世間深淵莫比心',
-u'世間無水不朝東',
-u'世間最難得者兄弟',
-u'逝将去汝',
-u'十漿五饋',
-u'豕交獸畜',
-u'事捷功倍',
-u'失節事大',
-u'是疖子就要出膿',
-u'拾金不昧',
-u'施衿結褵',
-u'試進一步看',
-u'失驚打怪',
-u'失驚倒怪',
-u'虱胫虮肝',
-u'失精落彩',
-u'市井鬧熱',
-u'市井無賴',
-u'市井小人',
-u'市井之臣',
-u'市井之徒',
-u'詩酒風流',
-u'事久見人心',
-u'使酒罵坐',
-u'詩酒朋侪',
-u'屍鸠之平',
-u'屍鸠之仁',
-u'屍居龍見',
-u'适居其反',
-u'屍居餘氣',
-u'勢鈞力敵',
-u'使君有婦',
-u'舐糠及米',
-u'十拷九棒',
-u'适可而止',
-u'是可忍孰不可忍',
-u'士可殺不可辱',
-u'士可殺而不可辱',
-u'事可一而不可再',
-u'矢口抵賴',
-u'矢口否認',
-u'矢口狡賴',
-u'十口相傳',
-u'事寬即圓',
-u'事寬則圓',
-u'時來風送騰王閣',
-u'時來福湊',
-u'時來誰不來時不來誰來',
-u'時來鐵似金',
-u'時來運來',
-u'時來運旋',
-u'時來運轉',
-u'石爛海枯',
-u'石爛江枯',
-u'十郎八當',
-u'師老兵疲',
-u'師老兵破',
-u'石泐海枯',
-u'十裏長亭',
-u'詩禮傳家',
-u'詩禮人家',
-u'十裏相送',
-u'十裏洋場',
-u'詩禮之家',
-u'識禮知書',
-u'詩禮之訓',
-u'使料所及',
-u'十六進制',
-u'屎流屁滾',
-u'屍祿害政',
-u'屍祿素飡',
-u'始亂終棄',
-u'失落之書',
-u'食馬留肝',
-u'失馬塞翁',
-u'食毛踐土',
-u'師門守衛',
-u'十米九糠',
-u'十眠九坐',
-u'十面埋伏',
-u'拭面容言',
-u'視民如傷',
-u'視民如子',
-u'市民文學',
-u'施命發号',
-u'識明智審',
-u'始末原由',
-u'拭目而待',
-u'十目十手',
-u'十目十指',
-u'十目所視',
-u'十目所視十手所指',
-u'拭目以待',
-u'十目一行',
-u'拭目以俟',
-u'十拏九穩',
-u'事能知足心常泰',
-u'十年窗下',
-u'十年窗下無人問',
-u'十年讀書',
-u'十年高下一般平',
-u'十年寒窗',
-u'十年河東十年河西',
-u'十年教訓',
-u'十年九不遇',
-u'十年磨劍',
-u'十年怕井繩',
-u'十年身到風凰池',
-u'十年生聚',
-u'十年生聚十年教訓',
-u'十年樹木',
-u'十年樹木百年樹人',
-u'士農工商',
-u'室怒市色',
-u'十女九痔',
-u'屎盆子往腦袋上扣',
-u'詩朋酒侶',
-u'詩朋酒友',
-u'舐皮論骨',
-u'屎屁直流',
-u'識破人情便是仙',
-u'十七的養了十八的',
-u'噬臍何及',
-u'噬臍莫及',
-u'事齊事楚',
-u'噬臍無及',
-u'十騎一吏',
-u'食前方丈',
-u'嗜錢如命',
-u'恃強淩弱',
-u'是親不是親',
-u'食親财黑',
-u'十親九故',
-u'十親九眷',
-u'事情波折多',
-u'勢傾朝野',
-u'時清海宴',
-u'詩情畫意',
-u'飾情矯行',
-u'适情任欲',
-u'适情率意',
-u'勢傾天下',
-u'勢窮力蹙',
-u'勢窮力竭',
-u'勢窮力屈',
-u'時诎舉赢',
-u'十全十美',
-u'失卻半年糧',
-u'世擾俗亂',
-u'施仁布德',
-u'識人多處是非多',
-u'十人九慕',
-u'視人如傷',
-u'視人如子',
-u'拾人涕唾',
-u'拾人唾涕',
-u'拾人唾餘',
-u'拾人牙慧',
-u'使人昭昭',
-u'失人者亡',
-u'十日并出',
-u'時日曷喪',
-u'視日如年',
-u'食日萬錢',
-u'十日一水',
-u'十日一水五日一石',
-u'誓日指天',
-u'十日之飲',
-u'視如敝屐',
-u'視如敝屣',
-u'視如草芥',
-u'視如糞土',
-u'視如寇仇',
-u'視如陌路',
-u'勢如劈竹',
-u'勢如破竹',
-u'适如其分',
-u'勢如水火',
-u'視如土芥',
-u'室如縣罄',
-u'室如懸磬',
-u'視如珍寶',
-u'視若兒戲',
-u'視若路人',
-u'勢若脫兔',
-u'視若無睹',
-u'嗜殺成性',
-u'誓山盟海',
-u'屍山血海',
-u'世上沒有不透風的牆',
-u'世上難逢百歲人',
-u'世上若要人情好',
-u'世上萬般皆下品',
-u'世上謂之一筆書',
-u'世上無難事',
-u'世上無難事隻怕有心人',
-u'世上新人趕舊人',
-u'世上應無切齒人',
-u'食少事煩',
-u'食生不化',
-u'十生九死',
-u'釋生取義',
-u'事生肘腋',
-u'識時達變',
-u'識時達務',
-u'十世單傳',
-u'施施而行',
-u'是是非非',
-u'豕食丐衣',
-u'時時吉祥',
-u'十室九空',
-u'十室九匮',
-u'失時落勢',
-u'世事明如鏡',
-u'實事求是',
-u'十室容賢',
-u'世事如棋局局新',
-u'世事如雲任卷舒',
-u'事實勝于雄辯',
-u'時勢使然',
-u'識時通變',
-u'十十五五',
-u'識時務者爲俊傑',
-u'實時系統執行程序',
-u'适時應務',
-u'時勢造英雄',
-u'矢石之難',
-u'十室之邑必有忠信',
-u'十手所指',
-u'十手争指',
-u'詩書發冢',
-u'時殊風異',
-u'十鼠同穴',
-u'十鼠争穴',
-u'誓死不貳',
-u'誓死不屈',
-u'十死不問',
-u'誓死不渝',
-u'十死九活',
-u'十死九生',
-u'視死如歸',
-u'視死如生',
-u'視死如饴',
-u'視死若歸',
-u'視死若生',
-u'十死一生',
-u'視死猶歸',
-u'士死知己',
-u'十四字成語',
-u'适俗随時',
-u'食宿相兼',
-u'世俗之見',
-u'世态人情',
-u'世态物情',
-u'世态炎涼',
-u'使貪使愚',
-u'誓天斷發',
-u'誓天指日',
-u'詩庭之訓',
-u'視同兒戲',
-u'視同拱璧',
-u'視同路人',
-u'視同陌路',
-u'視同秦越',
-u'誓同生死',
-u'視同一律',
-u'時通運泰',
-u'豕突狼奔',
-u'識途老馬',
-u'室徒四壁',
-u'食荼卧棘',
-u'世外桃源',
-u'十萬八千裏',
-u'十萬火急',
-u'十萬火速',
-u'事往日遷',
-u'時望所歸',
-u'視爲兒戲',
-u'食味方丈',
-u'識微見幾',
-u'識微見遠',
-u'視爲寇雠',
-u'事危累卵',
-u'食爲民天',
-u'屍位素餐',
-u'視爲畏途',
-u'什圍伍攻',
-u'視爲知己',
-u'士爲知己者死',
-u'世僞知賢',
-u'視微知著',
-u'識微知著',
-u'識文斷字',
-u'使蚊負山',
-u'識文談字',
-u'事無常師',
-u'事無大小',
-u'事務的某一段',
-u'什伍東西',
-u'事無二成',
-u'市無二價',
-u'十五個吊桶七上八下',
-u'事無巨細',
-u'史無前例',
-u'事無三不成',
-u'十五細則',
-u'時無再來',
-u'什襲而藏',
-u'什襲以藏',
-u'什襲珍藏',
-u'視下如傷',
-u'使賢任能',
-u'視險如夷',
-u'視險若夷',
-u'獅象搏兔皆用全力',
-u'十相具足',
-u'使心別氣',
-u'實心實意',
-u'使心用腹',
-u'使心用幸',
-u'适心娛目',
-u'師心自是',
-u'師心自用',
-u'使心作幸',
-u'使性謗氣',
-u'使性掼氣',
-u'适性任情',
-u'适性忘慮',
-u'師嚴道尊',
-u'食言而肥',
-u'勢焰熏天',
-u'食洋不化',
-u'使羊将狼',
-u'十羊九牧',
-u'事業有成',
-u'拾遺補阙',
-u'誓以皦日',
-u'事以密成',
-u'事已如此無可奈何',
-u'時易世變',
-u'時移勢遷',
-u'時異事殊',
-u'世異時移',
-u'時移俗易',
-u'适以相成',
-u'詩以言志',
-u'什一之利',
-u'十一字成語',
-u'時隐時見',
-u'恃勇輕敵',
-u'舐癰吮痔',
-u'十有八九',
-u'事有必至理有固然',
-u'世有伯樂然後有千裏馬',
-u'食慾不振',
-u'食玉炊桂',
-u'使愚使過',
-u'十雨五風',
-u'事與心違',
-u'食魚遇鲭',
-u'事與原違',
-u'事預則立',
-u'始于足下',
-u'視遠步高',
-u'時運不濟',
-u'時運不齊',
-u'時運不通',
-u'時運亨通',
-u'詩雲子曰',
-u'事在必行',
-u'十載寒窗',
-u'事在人爲',
-u'矢在弦上',
-u'事在蕭牆',
-u'蓍簪不忘',
-u'十戰十勝',
-u'失張冒勢',
-u'失張失緻',
-u'世掌絲綸',
-u'士者國之寶',
-u'逝者如斯',
-u'适者生存',
-u'使者腕輪',
-u'十之八九',
-u'視之不見聽之不聞',
-u'矢志不移',
-u'矢志不渝',
-u'失之東隅',
-u'失之東隅收之桑榆',
-u'失之毫厘',
-u'失之毫厘差以千裏',
-u'失之毫厘差之千裏',
-u'失之毫厘謬以千裏',
-u'失之交臂',
-u'侍執巾節',
-u'飾智矜愚',
-u'十指連心',
-u'十指連心哪個都疼',
-u'實至名歸',
-u'失之千裏',
-u'失之千裏差若毫厘',
-u'使智使勇',
-u'師直爲壯',
-u'釋知遺形',
-u'十指有長短',
-u'時至運來',
-u'矢忠不二',
-u'始終不懈',
-u'始終不易',
-u'始終不渝',
-u'飾終令典',
-u'始終如一',
-u'始終若一',
-u'詩中有畫',
-u'詩中有畫畫中有詩',
-u'屍祝代庖',
-u'失諸交臂',
-u'十轉九空',
-u'十捉九着',
-u'十字匕首',
-u'獅子搏兔亦用全力',
-u'十字成語',
-u'獅子大開口',
-u'獅子大張口',
-u'十字街口',
-u'十字街頭',
-u'十字路口',
-u'十字路頭',
-u'食子徇君',
-u'識字知書',
-u'始祖徽記',
-u'食租衣稅',
-u'使嘴使舌',
-u'始作俑者',
-u'壽比南山',
-u'授柄于人',
-u'手不釋卷',
-u'手不釋書',
-u'手不釋鄭',
-u'手不停毫',
-u'手不停揮',
-u'壽不壓職',
-u'手不應心',
-u'收殘綴轶',
-u'收成棄敗',
-u'瘦成一把骨頭',
-u'受寵若驚',
-u'首當其沖',
-u'守道安貧',
-u'手到病除',
-u'手到回春',
-u'收刀檢卦',
-u'手到拿來',
-u'手到拈來',
-u'手到擒來',
-u'受恩深處宜先退',
-u'守分安常',
-u'手高手低',
-u'手高眼低',
-u'瘦骨嶙嶙',
-u'瘦骨嶙峋',
-u'瘦骨伶仃',
-u'瘦骨如柴',
-u'瘦骨梭棱',
-u'收回成命',
-u'手揮目送',
-u'手急眼快',
-u'手腳兒不穩',
-u'手腳兒有毛病',
-u'手腳幹淨',
-u'手腳乾淨',
-u'手腳輕快',
-u'手腳無措',
-u'守節不移',
-u'守節一世失節一時',
-u'守經達權',
-u'獸聚鳥散',
-u'守口如瓶',
-u'獸困則噬',
-u'受了些風霜',
-u'收離糾散',
-u'收離聚散',
-u'手零腳碎',
-u'壽陵失步',
-u'收鑼罷鼓',
-u'壽滿天年',
-u'手忙腳亂',
-u'手面賺吃',
-u'手腦并用',
-u'手胼足胝',
-u'守瓶緘口',
-u'收旗卷傘',
-u'獸窮則齧',
-u'首丘夙願',
-u'首丘之情',
-u'首屈一指',
-u'守阙抱殘',
-u'授人口實',
-u'壽人壽世',
-u'授人以柄',
-u'受人之托忠人之事',
-u'守如處女',
-u'守如處女出如脫兔',
-u'壽山福海',
-u'首善之地',
-u'首善之區',
-u'首身分離',
-u'守身如玉',
-u'收視反聽',
-u'收拾局面',
-u'首施兩端',
-u'手勢識別',
-u'手勢消息',
-u'收拾行李',
-u'授受不親',
-u'首鼠兩端',
-u'瘦死的駱駝比馬大',
-u'守土有責',
-u'守望平台',
-u'守望相助',
-u'首尾共濟',
-u'首尾兩端',
-u'首尾相繼',
-u'首尾相連',
-u'首尾相衛',
-u'首尾相應',
-u'首尾相援',
-u'手無寸刃',
-u'手無寸鐵',
-u'手無縛雞之力',
-u'手舞足蹈',
-u'首下尻高',
-u'手下留情',
-u'守先待後',
-u'獸心人面',
-u'手眼通天',
-u'授業解惑',
-u'受益匪淺',
-u'收因結果',
-u'收因種果',
-u'收園結果',
-u'壽元無量',
-u'守約施搏',
-u'狩嶽巡方',
-u'手澤之遺',
-u'守着鼻子抹着腮',
-u'守着多大碗吃多大的飯',
-u'守着米囤餓死',
-u'守正不阿',
-u'守正不回',
-u'守正不撓',
-u'守正不桡',
-u'手之仆從',
-u'收之桑榆',
-u'收之實難',
-u'受制于人',
-u'壽終正寝',
-u'守株待兔',
-u'手足重繭',
-u'手足胼胝',
-u'手足失措',
-u'手足無措',
-u'首足異處',
-u'手足之情',
-u'數白論黃',
-u'束貝含犀',
-u'樹碑立傳',
-u'鼠臂虮肝',
-u'束兵秣馬',
-u'疏不間親',
-u'書不盡言',
-u'書不盡言言不盡意',
-u'書不盡意',
-u'孰不可忍',
-u'數不勝數',
-u'書不釋手',
-u'恕不一一',
-u'疏财仗義',
-u'疏财重義',
-u'輸财助邊',
-u'束椽爲柱',
-u'鼠竄蜂逝',
-u'鼠竄狗盜',
-u'鼠竄狼奔',
-u'鼠竄逃生',
-u'樹大風難摧',
-u'樹大風難撼',
-u'樹大根深',
-u'樹大了招風',
-u'樹大易招風',
-u'樹大招風',
-u'束帶結發',
-u'屬當戎行',
-u'樹倒根摧',
-u'鼠盜狗竊',
-u'樹倒猢孫散',
-u'蜀道難難于上青天',
-u'書到用時方恨少',
-u'樹德務滋',
-u'數典忘祖',
-u'叔度陂湖',
-u'鼠肚雞腸',
-u'熟讀可記',
-u'熟讀深思',
-u'書讀五車',
-u'數短論長',
-u'樹多成林',
-u'疏而不漏',
-u'述而不作',
-u'屬耳垣牆',
-u'束發封帛',
-u'殊方絕域',
-u'殊方同緻',
-u'殊方異域',
-u'書非借不能讀也',
-u'鼠腹雞腸',
-u'鼠腹蝸腸',
-u'鼠肝蟲臂',
-u'鉥肝刿腎',
-u'輸肝瀝膽',
-u'輸肝剖膽',
-u'輸肝寫膽',
-u'樹高千丈葉落歸根',
-u'樹高招風',
-u'束戈卷甲',
-u'束廣就狹',
-u'數黑論白',
-u'數黑論黃',
-u'曙後星孤',
-u'倏忽之間',
-u'熟化毛皮',
-u'書畫卯酉',
-u'數黃道白',
-u'數黃道黑',
-u'鼠迹狐蹤',
-u'庶幾無愧',
-u'恕己之心恕人',
-u'束肩斂息',
-u'束教管聞',
-u'蜀錦吳绫',
-u'書空咄咄',
-u'術愧長房',
-u'暑來寒往',
-u'倏來忽往',
-u'黍離麥秀',
-u'黍離之悲',
-u'漱流枕石',
-u'蜀龍吳虎',
-u'熟路輕車',
-u'熟路輕轍',
-u'殊路同歸',
-u'束馬縣車',
-u'束馬懸車',
-u'舒眉展眼',
-u'暑門大嚼',
-u'熟門熟路',
-u'數米而炊',
-u'數米量柴',
-u'術妙軒岐',
-u'署名用戶',
-u'鼠目寸光',
-u'鼠目麞頭',
-u'書囊無底',
-u'熟能生巧',
-u'孰能無過',
-u'鼠年大吉',
-u'鼠年賀辭',
-u'鼠年話鼠',
-u'鼠年吉祥',
-u'熟年離婚',
-u'鼠年說鼠',
-u'鼠年運程',
-u'鼠年運氣',
-u'鼠年運勢',
-u'鼠齧蟲穿',
-u'鼠齧蠹蝕',
-u'束蒲爲脯',
-u'數奇命蹇',
-u'鼠竊狗盜',
-u'鼠竊狗偷',
-u'蜀犬吠日',
-u'書缺有間',
-u'鼠雀之輩',
-u'鼠雀之牙',
-u'淑人君子',
-u'輸人算人之機',
-u'鼠入牛角',
-u'輸入輸出設備指派',
-u'樹上開花',
-u'束上起下',
-u'束身就縛',
-u'束身受命',
-u'殊深轸念',
-u'束身自愛',
-u'束身自好',
-u'束身自修',
-u'書聲朗朗',
-u'書生之見',
-u'熟視無睹',
-u'鼠屎污羹',
-u'漱石枕流',
-u'束手待斃',
-u'束手待死',
-u'鼠首偾事',
-u'束手縛腳',
-u'束手就斃',
-u'束手就縛',
-u'束手就困',
-u'束手就擒',
-u'束手就殪',
-u'束手旁觀',
-u'束手束腳',
-u'束手束足',
-u'束手聽命',
-u'束手無策',
-u'束手無措',
-u'束手無計',
-u'束手無術',
-u'束手自斃',
-u'束手坐視',
-u'鼠鼠得意',
-u'啜菽飲水',
-u'菽水承歡',
-u'熟思審處',
-u'書堂隐相儒',
-u'鼠蹄奮進',
-u'樹同拔異',
-u'書通二酉',
-u'書同文車同軌',
-u'鼠偷狗盜',
-u'舒頭探腦',
-u'殊途同歸',
-u'殊塗同會',
-u'殊塗同緻',
-u'暑往寒來',
-u'數往知來',
-u'熟魏生張',
-u'梳文栉字',
-u'書無百日功',
-u'殊無二緻',
-u'書香門第',
-u'書香門戶',
-u'書香人家',
-u'書香世家',
-u'樹向枝分',
-u'輸心服意',
-u'鉥心刿目',
-u'鉥心刿腎',
-u'鼠心狼肺',
-u'殊形詭狀',
-u'殊形妙狀',
-u'黍秀宮庭',
-u'束修自好',
-u'鼠穴尋羊',
-u'殊勳異績',
-u'鼠牙雀角',
-u'殊言別語',
-u'數一數二',
-u'數以萬計',
-u'輸赢無定報應分明',
-u'黍油麥秀',
-u'樹猶如此人何以堪',
-u'術有專精',
-u'樹欲靜而風不寧',
-u'樹欲靜而風不停',
-u'樹欲靜而風不止',
-u'暑雨祁寒',
-u'樹欲息而風不停',
-u'樹元立嫡',
-u'束缊還婦',
-u'束缊舉火',
-u'梳雲掠月',
-u'束蘊乞火',
-u'束蘊請火',
-u'束在高閣',
-u'束戰速決',
-u'束杖理民',
-u'樹正無愁月影斜',
-u'束之高閣',
-u'束之高屋',
-u'書之體勢',
-u'書之體勢一筆而成',
-u'殊緻同歸',
-u'淑質英才',
-u'蜀中無大将',
-u'蜀中無大将廖化作先鋒',
-u'書中有女顔如玉',
-u'梳妝打扮',
-u'束裝盜金',
-u'束裝就道',
-u'樹壯全仗根',
-u'豎子成名',
-u'耍嘴皮子',
-u'衰當益壯',
-u'率爾操觚',
-u'率爾成章',
-u'率馬以骥',
-u'帥旗一倒千軍潰',
-u'帥旗一倒萬兵潰',
-u'帥旗一倒萬兵逃',
-u'帥旗一倒陣腳亂',
-u'帥旗一倒衆兵逃',
-u'率獸食人',
-u'率土歸心',
-u'率土同慶',
-u'率土宅心',
-u'率土之濱',
-u'率先垂範',
-u'率先遁逃',
-u'率性任情',
-u'率以爲常',
-u'率由舊則',
-u'率由舊章',
-u'闩門閉戶',
-u'霜刀小徑',
-u'霜凋夏綠',
-u'雙飛雙宿',
-u'雙斧伐孤木',
-u'雙斧伐孤樹',
-u'雙斧伐枯',
-u'雙凫一雁',
-u'雙柑鬥酒',
-u'雙管獵槍',
-u'雙管齊下',
-u'雙桂聯芳',
-u'雙虎之功',
-u'爽口食多偏作藥',
-u'霜露之悲',
-u'霜露之病',
-u'霜露之辰',
-u'霜露之感',
-u'霜露之思',
-u'雙眉緊鎖',
-u'雙眉直豎',
-u'雙目成像',
-u'霜氣橫秋',
-u'孀妻弱子',
-u'雙栖雙宿',
-u'雙拳不敵四手',
-u'爽然若失',
-u'爽然自失',
-u'雙日不着單日着',
-u'雙手合成喇叭',
-u'雙手難遮衆人眼',
-u'雙宿雙飛',
-u'雙瞳剪水',
-u'雙喜臨門',
-u'爽心豁目',
-u'爽心悅目',
-u'雙星并耀',
-u'霜行草宿',
-u'雙株競秀',
-u'霜鬃之力',
-u'水碧山青',
-u'水菜不交',
-u'水蕩舟行風揚帆動',
-u'水到渠成',
-u'水到魚行',
-u'誰的舌頭不磨牙',
-u'水底撈月',
-u'水底澇月亮',
-u'水底撈針',
-u'水底摸月',
-u'水底納瓜',
-u'水滴石穿',
-u'水調歌頭',
-u'水蠱哨塔',
-u'水蠱守護',
-u'水光山色',
-u'水光莊園',
-u'水過地皮濕',
-u'水果芳香',
-u'水過鴨背',
-u'水火兵蟲',
-u'水火不避',
-u'水火不辭',
-u'水火不留情',
-u'水火不容情',
-u'水火不通',
-u'水火不兼容',
-u'水火不相容',
-u'水火無交',
-u'水火無情',
-u'水火相濟鹽梅相成',
-u'水火之中',
-u'水激則旱矢激則遠',
-u'誰家竈裏無煙',
-u'水潔冰清',
-u'水盡鵝飛',
-u'水盡山窮',
-u'水淨鵝飛',
-u'水可載舟',
-u'水可載舟亦可覆舟',
-u'水枯石爛',
-u'水寬養得魚活',
-u'水闊山高',
-u'水來伸手飯來張口',
-u'水來土堰',
-u'水裏來火裏去',
-u'誰憐屢舞長',
-u'水流花落',
-u'水流花謝',
-u'水流雲散',
-u'水陸畢陳',
-u'水陸雜陳',
-u'水落歸槽',
-u'水落石出',
-u'水滿金山',
-u'水米不打牙',
-u'水米無幹',
-u'水米無交',
-u'水明山秀',
-u'水磨工夫',
-u'水母目蝦',
-u'水木清華',
-u'水能載舟',
-u'水能載舟亦能覆舟',
-u'水佩風裳',
-u'水瓶殘餘',
-u'水清方見兩般魚',
-u'水清無大魚',
-u'水清無魚',
-u'水窮山盡',
-u'水乳交融',
-u'水軟山溫',
-u'水色山光',
-u'水殇怨靈',
-u'水深火熱',
-u'水深難見底',
-u'水剩山殘',
-u'誰是你肚子裏的蛔蟲',
-u'水石清華',
-u'誰是誰非',
-u'水宿風餐',
-u'水天一色',
-u'水土不服',
-u'誰謂朝來一拆雨',
-u'睡卧不寧',
-u'水泄不漏',
-u'水楔不通',
-u'水泄不透',
-u'誰信東流海洋深',
-u'水性精通',
-u'水性楊花',
-u'水秀山明',
-u'水宿山行',
-u'水炎不相容擲地有聲',
-u'睡眼惺忪',
-u'水遠山長',
-u'水遠山遙',
-u'水月觀音',
-u'水月鏡花',
-u'水則載舟水則覆舟',
-u'水長船高',
-u'誰知盤中餐粒粒皆辛苦',
-u'水至清而無魚',
-u'水至清則無魚',
-u'水中撈月',
-u'水中著鹽',
-u'水中捉月',
-u'水煮蚌肉',
-u'順道者昌逆德者亡',
-u'順德者昌逆德者亡',
-u'順非而澤',
-u'順風扯帆',
-u'順風吹火',
-u'順風而呼',
-u'順風而呼聞着彰',
-u'順風駛船',
-u'順風使舵',
-u'順風使帆',
-u'順風行船',
-u'順風張帆',
-u'順風轉舵',
-u'順過飾非',
-u'吮疽舐痔',
-u'順口開河',
-u'順理成章',
-u'順美匡惡',
-u'順人應天',
-u'舜日堯年',
-u'舜日堯天',
-u'順時而動',
-u'順時随俗',
-u'順手牽羊',
-u'順手牽羊将計就計',
-u'順水放船',
-u'順水人情',
-u'順水順風',
-u'順水推船',
-u'順水推舟',
-u'順水行舟',
-u'順藤摸瓜',
-u'順天從人',
-u'順天得一',
-u'順天應人',
-u'順天應時',
-u'順天者昌逆天者亡',
-u'順天者存逆天者亡',
-u'順蔓摸瓜',
-u'順我者昌',
-u'順我者昌逆我者亡',
-u'順我者生逆我者死',
-u'瞬息萬變',
-u'瞬息之間',
-u'吮癰舐痔',
-u'吮癰舔痔',
-u'順之者昌逆之者亡',
-u'順之者興逆之者亡',
-u'說白道黑',
-u'說白道綠',
-u'搠筆巡街',
-u'說曹操曹操到',
-u'說曹操曹操就到',
-u'說長道短',
-u'說長話短',
-u'說長論短',
-u'說長說短',
-u'碩大無比',
-u'碩大無朋',
-u'說到曹操曹操就到',
-u'說得天花亂墜',
-u'說地談天',
-u'說東道西',
-u'說東談西',
-u'說短道長',
-u'說短論長',
-u'說風涼話',
-u'說風說水',
-u'朔風野大',
-u'說高說低',
-u'說古道今',
-u'铄古切今',
-u'說古談今',
-u'碩果僅存',
-u'說好說歹',
-u'說好嫌歹',
-u'說黑道白',
-u'說黃道黑',
-u'說家克計',
-u'數見不鮮',
-u'說今道古',
-u'铄金點玉',
-u'铄金毀骨',
-u'說來話長',
-u'說來說去',
-u'說溜了嘴',
-u'說梅止渴',
-u'說千道萬',
-u'說千說萬',
-u'說親道熱',
-u'說清道白',
-u'說三道四',
-u'說三說四',
-u'說食不飽',
-u'說時遲那時快',
-u'說是道非',
-u'說事過錢',
-u'铄石流金',
-u'說是弄非',
-u'說是說聽是聽',
-u'說是談非',
-u'說說道道',
-u'說天說地',
-u'碩望宿德',
-u'碩學鴻儒',
-u'槊血滿袖',
-u'碩學通儒',
-u'說也奇怪',
-u'說一不二',
-u'說一是一',
-u'說一是一說二是二',
-u'铄懿淵積',
-u'爍玉流金',
-u'說雨談雲',
-u'說真方賣假藥',
-u'說嘴巴巴兒的',
-u'說嘴打嘴',
-u'說嘴郎中',
-u'說嘴郎中沒好藥',
-u'死敗塗地',
-u'死标白纏',
-u'死別生離',
-u'死病無良醫',
-u'思不出位',
-u'死不改悔',
-u'死不悔改',
-u'驷不及舌',
-u'死不瞑目',
-u'四不拗六',
-u'死不認屍',
-u'死不死活不活',
-u'死不旋踵',
-u'死不足惜',
-u'似曾相識',
-u'思潮起伏',
-u'四沖八達',
-u'四沖六達',
-u'私仇不及公',
-u'私仇不如公門',
-u'絲綢香囊',
-u'四大皆空',
-u'食箪漿壺',
-u'死得其所',
-u'似懂非懂',
-u'思斷義絕',
-u'絲恩發怨',
-u'死而不僵',
-u'死而不朽',
-u'死而複生',
-u'死而複蘇',
-u'死而後已',
-u'死而無憾',
-u'死而無悔',
-u'死而無怨',
-u'絲發之功',
-u'四方八面',
-u'四方輻辏',
-u'四方之志',
-u'四分五裂',
-u'四分五落',
-u'四分五剖',
-u'思婦病母',
-u'死告活央',
-u'死骨更肉',
-u'思歸其雌',
-u'四海波靜',
-u'四海承風',
-u'四海鼎沸',
-u'四海皆兄弟',
-u'四海九州',
-u'四海飄零',
-u'四海升平',
-u'四海他人',
-u'四海爲家',
-u'四海一家',
-u'四海之内皆兄弟',
-u'俟河之清',
-u'死後自會長眠',
-u'思患預防',
-u'四荒八極',
-u'死灰複燎',
-u'死灰複然',
-u'死灰槁木',
-u'伺機待發',
-u'伺機而動',
-u'四季平安',
-u'死記硬背',
-u'似箭在弦',
-u'四腳朝天',
-u'四郊多壘',
-u'四角俱全',
-u'司空見慣',
-u'絲來線去',
-u'飼老鼠咬布袋',
-u'死了王屠夫不吃帶毛豬',
-u'死了也不閉眼',
-u'死裏求生',
-u'死裏逃生',
-u'思量唯有讀書高',
-u'驷馬不追',
-u'司馬稱好',
-u'四馬攢蹄',
-u'死馬當活馬醫',
-u'驷馬高車',
-u'驷馬高蓋',
-u'驷馬高門',
-u'驷馬莫追',
-u'驷馬難追',
-u'司馬牛之歎',
-u'司馬青衫',
-u'驷馬軒車',
-u'驷馬仰秣',
-u'司馬昭之心',
-u'司馬昭之心路人皆知',
-u'死眉瞪眼',
-u'四面八方',
-u'四面楚歌',
-u'四面出擊',
-u'四面受敵',
-u'死模活樣',
-u'司農仰屋',
-u'肆虐橫行',
-u'死皮賴臉',
-u'四平八穩',
-u'死乞白賴',
-u'死氣沉沉',
-u'似漆如膠',
-u'死氣沈沈',
-u'思前想後',
-u'死且不朽',
-u'四清六活',
-u'死求白賴',
-u'四衢八街',
-u'死去活來',
-u'死人臭一裏活人臭千裏',
-u'死人頭上無對證',
-u'思如湧泉',
-u'四山五嶽',
-u'思深憂遠',
-u'死生存亡',
-u'死聲活氣',
-u'死生榮辱',
-u'死聲咷氣',
-u'死生有命富貴在天',
-u'四時八節',
-u'四十不富',
-u'似是而非',
-u'死屍昏迷',
-u'斯事體大',
-u'四時之氣',
-u'私淑弟子',
-u'四書五經',
-u'似水流年',
-u'似水如魚',
-u'絲絲入扣',
-u'斯斯文文',
-u'思所逐之',
-u'四體百骸',
-u'四體不勤',
-u'四體不勤五谷不分',
-u'四亭八當',
-u'四通八達',
-u'四通五達',
-u'思維敏捷',
-u'思維迅捷',
-u'斯文掃地',
-u'似我不如無',
-u'死無對證',
-u'肆無忌憚',
-u'死無葬身之地',
-u'伺瑕導蠙',
-u'伺瑕導隙',
-u'伺瑕抵蠙',
-u'伺瑕抵隙',
-u'思賢如渴',
-u'私相授受',
-u'似笑非笑',
-u'死心搭地',
-u'死心落地',
-u'死心踏地',
-u'私心雜念',
-u'四星天牛',
-u'肆行無忌',
-u'思緒萬千',
-u'死眼海岸',
-u'肆言詈辱',
-u'死樣活氣',
-u'四野春風',
-u'肆意橫行',
-u'死易立孤難',
-u'肆意妄爲',
-u'四姻九戚',
-u'似有如無',
-u'死有餘辜',
-u'死有餘僇',
-u'死有餘責',
-u'死有餘誅',
-u'死有餘罪',
-u'死于非命',
-u'似玉如花',
-u'死欲速朽',
-u'四戰之地',
-u'四戰之國',
-u'死者不能複活',
-u'似真推理',
-u'四至八道',
-u'四肢百骸',
-u'四肢百體',
-u'四肢不勤五谷不分',
-u'死知府不如活老鼠',
-u'驷之過蠙',
-u'驷之過隙',
-u'思之千裏',
-u'死中求活',
-u'死中求生',
-u'死重泰山',
-u'絲竹并奏',
-u'死諸葛哧走生仲達',
-u'死諸葛能走生仲達',
-u'死諸葛吓走了生仲達',
-u'死諸葛吓走生仲達',
-u'絲竹管弦',
-u'似醉如癡',
-u'松柏長青',
-u'松柏寒盟',
-u'松柏後凋',
-u'松柏之茂',
-u'松柏之壽',
-u'松柏之志',
-u'送抱推襟',
-u'送別崔寅亮下第',
-u'聳膊成山',
-u'宋才潘面',
-u'松弛算法',
-u'頌德歌功',
-u'送佛送到西',
-u'送佛送到西天',
-u'頌古非今',
-u'送故迎新',
-u'聳壑昂霄',
-u'聳壑淩霄',
-u'松鶴遐齡',
-u'松鶴延年',
-u'宋畫吳冶',
-u'聳肩曲背',
-u'聳肩縮背',
-u'宋斤魯削',
-u'送舊迎新',
-u'送君行裏',
-u'送君千裏',
-u'送君千裏終須別',
-u'送君千裏終須一別',
-u'送君千裏終有一別',
-u'送魯郡劉長史',
-u'松蘿共倚',
-u'松茂竹苞',
-u'送暖偷寒',
-u'送暖偎寒',
-u'松喬之壽',
-u'送去迎來',
-u'送人送上岸送佛送到殿',
-u'聳人聽聞',
-u'聳入雲霄',
-u'崧生嶽降',
-u'頌聲載道',
-u'送往勞來',
-u'送往視居',
-u'送往迎來',
-u'松形鶴骨',
-u'送眼流眉',
-u'宋玉東牆',
-u'松筠之節',
-u'松枝挂劍',
-u'搜腸刮肚',
-u'搜腸潤吻',
-u'搜根剔齒',
-u'搜狗拼音輸入法',
-u'搜奇抉怪',
-u'搜岩采幹',
-u'搜揚側陋',
-u'搜章擿句',
-u'搜章摘句',
-u'薮中荊曲',
-u'宿弊一清',
-u'俗不可耐',
-u'俗不可醫',
-u'素不相能',
-u'素不相識',
-u'素餐屍位',
-u'宿草已生',
-u'素車白馬',
-u'粟陳貫朽',
-u'夙負盛名',
-u'蘇海韓潮',
-u'粟紅貫朽',
-u'素口罵人',
-u'溯流從源',
-u'溯流徂源',
-u'溯流窮源',
-u'溯流求源',
-u'溯流追源',
-u'素昧平生',
-u'素昧生平',
-u'肅然起敬',
-u'肅然生敬',
-u'夙世因緣',
-u'夙世冤家',
-u'夙世冤業',
-u'溯水行舟',
-u'素絲羔羊',
-u'素絲良馬',
-u'素未謀面',
-u'俗下文字',
-u'夙心往志',
-u'夙興昧旦',
-u'夙興夜處',
-u'夙興夜寐',
-u'宿學舊儒',
-u'俗諺口碑',
-u'夙夜不怠',
-u'夙夜不解',
-u'夙夜不懈',
-u'夙夜匪解',
-u'夙夜匪懈',
-u'夙夜夢寐',
-u'夙夜爲謀',
-u'夙夜在公',
-u'素隐行怪',
-u'俗語有本',
-u'溯源窮流',
-u'夙願以償',
-u'訴諸輿論',
-u'酸甜苦辣',
-u'酸文假醋',
-u'酸鹹苦辣',
-u'歲比不登',
-u'随波逐塵',
-u'随波逐浪',
-u'随波逐流',
-u'随才器使',
-u'随車甘雨',
-u'随車夏雨',
-u'随車緻雨',
-u'随得方就得圓',
-u'随地随時',
-u'随方就圓',
-u'随方逐圓',
-u'遂非文過',
-u'随分耕鋤收地利',
-u'随風倒舵',
-u'随風而靡',
-u'歲豐年稔',
-u'随風逐浪',
-u'随風轉舵',
-u'雖覆能複',
-u'随高就低',
-u'随高逐低',
-u'碎骨粉身',
-u'碎骨粉屍',
-u'歲寒三友',
-u'歲寒松柏',
-u'歲寒知松柏',
-u'随行就市',
-u'隋侯之珠',
-u'雖疾無聲',
-u'歲計有餘',
-u'歲老根彌壯',
-u'碎裂廢土',
-u'遂迷不寤',
-u'遂迷忘反',
-u'睟面盎背',
-u'歲暮天寒',
-u'随人俯仰',
-u'歲稔年豐',
-u'随人說短長',
-u'随人作計',
-u'碎身粉骨',
-u'碎身糜軀',
-u'随聲吠影',
-u'随聲附和',
-u'随聲趨和',
-u'随聲是非',
-u'随世沉浮',
-u'歲時伏臘',
-u'随時施宜',
-u'随時随地',
-u'碎屍萬段',
-u'随事制宜',
-u'碎首糜軀',
-u'雖死猶生',
-u'雖死之日',
-u'雖死之日猶生之年',
-u'随俗沉浮',
-u'随俗浮沉',
-u'随俗浮沈',
-u'随俗沈浮',
-u'歲歲平安',
-u'碎瓦頹垣',
-u'随物賦形',
-u'随物應機',
-u'随鄉入俗',
-u'随鄉入鄉',
-u'遂心快意',
-u'碎心裂膽',
-u'遂心滿意',
-u'遂心如意',
-u'随心所欲',
-u'遂心應手',
-u'随行逐隊',
-u'随遇而安',
-u'碎玉零玑',
-u'歲聿其莫',
-u'随寓随安',
-u'歲聿雲暮',
-u'碎玉之心',
-u'雖怨不忘親',
-u'随圓就方',
-u'随緣樂助',
-u'歲月不居',
-u'歲月蹉跎',
-u'歲月如流',
-u'歲月峥嵘',
-u'歲在龍虵',
-u'随踵而至',
-u'谇帚德耡',
-u'隋珠和璧',
-u'隋珠和玉',
-u'隋珠荊璧',
-u'随珠荊玉',
-u'隋珠彈雀',
-u'損本逐末',
-u'損兵折将',
-u'損公肥私',
-u'損公利私',
-u'損己利人',
-u'損軍折将',
-u'孫康映雪',
-u'筍裏不知卯裏',
-u'孫龐鬥智',
-u'損人不利己',
-u'損人肥己',
-u'損人害己',
-u'損人利己',
-u'損人益己',
-u'損上益下',
-u'筍因落箨方成竹',
-u'損有餘補不足',
-u'損之又損',
-u'所答非所問',
-u'所當無敵',
-u'縮地補天',
-u'所費不赀',
-u'索垢吹瘢',
-u'索垢尋疵',
-u'所嫁非人',
-u'所見即所得',
-u'所見略同',
-u'所見所聞',
-u'縮頸股栗',
-u'索命梵音',
-u'所謀辄左',
-u'索然寡味',
-u'索然無味',
-u'所剩無幾',
-u'縮手縮腳',
-u'瑣談不休',
-u'梭天摸地',
-u'縮頭縮頸',
-u'縮頭縮腦',
-u'瑣尾流離',
-u'所問非所答',
-u'所向皆靡',
-u'所向克捷',
-u'所向披靡',
-u'所向無敵',
-u'所向無前',
-u'所學非所用',
-u'縮衣節口',
-u'縮衣節食',
-u'縮衣啬食',
-u'索隐行怪',
-u'所在皆是',
-u'所作所爲',
-u'沓岡複嶺',
-u'踏故習常',
-u'塔尖上功德',
-u'沓來麕至',
-u'沓來踵至',
-u'踏破鐵鞋',
-u'踏破鐵鞋無覓處',
-u'踏破鐵鞋無覓處得來全不費功夫',
-u'嗒然若喪',
-u'他人觀花',
-u'他人碌碌',
-u'他人未知忙',
-u'踏人一腳須防一拳',
-u'他山攻錯',
-u'他山之石',
-u'他山之石可以攻玉',
-u'他時飽滿謝蒼天',
-u'他鄉故知',
-u'他鄉異縣',
-u'他鄉遇故知',
-u'太倉稊米',
-u'太倉一粟',
-u'太阿倒持',
-u'太阿在握',
-u'太阿之柄',
-u'台閣生風',
-u'太公釣魚',
-u'太公釣魚願者上鈎',
-u'太公鼓刀',
-u'擡腳動手',
-u'泰來否極',
-u'泰來否往',
-u'汰劣留良',
-u'太平盛世',
-u'太平時務',
-u'太平無事',
-u'太平無象',
-u'太丘道廣',
-u'泰然處之',
-u'泰然自若',
-u'太山北鬥',
-u'泰山不讓土壤',
-u'泰山鴻毛',
-u'泰山梁木',
-u'泰山盤石',
-u'泰山其頹',
-u'泰山壓頂',
-u'泰山壓頂不彎腰',
-u'泰山壓卵',
-u'太歲頭上動土',
-u'擡頭挺胸',
-u'擡頭望明月低頭思故鄉',
-u'太陽打西邊出來',
-u'太陽曬肚皮',
-u'太一餘糧',
-u'袒臂揮拳',
-u'談不容口',
-u'貪财好色',
-u'貪吃懶做',
-u'貪得無厭',
-u'貪多嚼不爛',
-u'貪多務得',
-u'貪多無厭',
-u'貪而無信',
-u'談霏玉屑',
-u'袒腹東床',
-u'貪夫徇财',
-u'貪夫殉利',
-u'探竿影草',
-u'貪功起釁',
-u'談古論今',
-u'談古說今',
-u'貪官蠹役',
-u'貪官污吏',
-u'彈冠相慶',
-u'彈冠振衿',
-u'彈冠振衣',
-u'歎觀止矣',
-u'談何容易',
-u'談虎色變',
-u'昙花一現',
-u'貪賄無藝',
-u'彈劍作歌',
-u'彈斤估兩',
-u'談今論古',
-u'談空說幻',
-u'談空說有',
-u'彈空說嘴',
-u'探口而出',
-u'貪婪聖契',
-u'貪婪無厭',
-u'檀郎謝女',
-u'癱痨蠱疾百無一生',
-u'歎老嗟卑',
-u'探骊得珠',
-u'探骊獲珠',
-u'貪利忘義',
-u'貪惏無餍',
-u'談論風生',
-u'痰迷心竅',
-u'貪名逐利',
-u'貪墨成風',
-u'探囊胠箧',
-u'探囊取物',
-u'探囊拾芥',
-u'貪便宜就是上當',
-u'探奇訪勝',
-u'探奇窮異',
-u'談情說愛',
-u'貪求無厭',
-u'貪求無已',
-u'坦然自若',
-u'談若懸河',
-u'忐上忑下',
-u'貪蛇忘尾',
-u'貪生惡死',
-u'貪生怕死',
-u'貪生畏死',
-u'貪聲逐色',
-u'攤書擁百城',
-u'彈絲品竹',
-u'貪他一鬥米',
-u'忐忐忑忑',
-u'探湯蹈火',
-u'探湯手爛',
-u'忐忑不安',
-u'忐忑不定',
-u'談天論地',
-u'談天說地',
-u'貪天之功',
-u'探頭舒腦',
-u'探頭縮腦',
-u'探頭探腦',
-u'談吐風生',
-u'談吐生風',
-u'貪圖享樂',
-u'探丸借客',
-u'彈丸脫手',
-u'歎爲觀止',
-u'貪位慕祿',
-u'貪猥無厭',
-u'貪污腐化',
-u'貪污狼藉',
-u'袒裼裸裎',
-u'談笑封侯',
-u'談笑風生',
-u'貪小利而吃大虧',
-u'貪小便宜吃大虧',
-u'貪小失大',
-u'談笑有鴻儒',
-u'談笑自如',
-u'談笑自若',
-u'貪心不足',
-u'彈性陷阱',
-u'袒胸露背',
-u'談玄說理',
-u'談玄說妙',
-u'探尋勝迹',
-u'談言微中',
-u'談議風生',
-u'探異玩奇',
-u'探幽窮赜',
-u'探幽索隐',
-u'貪欲無厭',
-u'貪欲無藝',
-u'談圓說通',
-u'探淵索珠',
-u'貪贓壞法',
-u'貪髒枉法',
-u'探赜鈎深',
-u'探赜索微',
-u'探赜索隐',
-u'彈指之間',
-u'螳臂當車',
-u'螳臂當轅',
-u'螳臂當轍',
-u'湯池鐵城',
-u'棠棣競秀',
-u'堂而皇之',
-u'糖瓜祭竈新年來到',
-u'堂皇富麗',
-u'堂皇冠冕',
-u'堂皇正大',
-u'倘來之物',
-u'螳螂搏蟬',
-u'螳螂捕蟬',
-u'螳螂捕蟬黃雀在後',
-u'螳螂奮臂',
-u'螳螂黃雀',
-u'螳螂拒轍',
-u'湯裏來水裏去',
-u'唐臨晉帖',
-u'湯去三面',
-u'堂上一呼',
-u'堂上一呼階下百諾',
-u'湯燒火熱',
-u'糖舌蜜口',
-u'燙手的山芋',
-u'燙手山芋',
-u'湯湯水水防秋燥',
-u'堂堂一表',
-u'堂堂正氣',
-u'堂堂正正',
-u'唐突西施',
-u'唐突西子',
-u'糖衣炮彈',
-u'唐虞之治',
-u'唐哉皇哉',
-u'逃出重圍',
-u'讨惡翦暴',
-u'饕風虐雪',
-u'韬戈卷甲',
-u'韬戈偃武',
-u'韬光晦迹',
-u'韬光晦影',
-u'韬光斂彩',
-u'韬光斂迹',
-u'韬光滅迹',
-u'韬光俟奮',
-u'韬光養晦',
-u'韬光隐晦',
-u'韬光隐迹',
-u'韬光用晦',
-u'韬光韫玉',
-u'桃紅柳綠',
-u'桃弧棘矢',
-u'桃花流水',
-u'桃花人面',
-u'桃花潭水',
-u'韬晦待時',
-u'韬晦之計',
-u'弢迹匿光',
-u'韬迹隐智',
-u'讨價還價',
-u'桃僵李代',
-u'淘盡黃沙始得金',
-u'饕口饞舌',
-u'桃來李答',
-u'讨類知原',
-u'桃李遍天下',
-u'桃李不言',
-u'桃李不言下自成行',
-u'桃李不言下自成蹊',
-u'桃李成蹊',
-u'桃李春風',
-u'桃李精神',
-u'桃李滿天下',
-u'桃李門牆',
-u'桃李無言下自成蹊',
-u'桃李争妍',
-u'桃李之教',
-u'桃李之饋',
-u'讨流溯源',
-u'叨陪末座',
-u'桃蹊柳陌',
-u'陶情适性',
-u'陶犬瓦雞',
-u'陶然自得',
-u'陶熔鼓鑄',
-u'桃腮粉臉',
-u'桃腮柳眼',
-u'淘沙得金',
-u'淘沙取金',
-u'韬神晦迹',
-u'韬聲匿迹',
-u'讨是尋非',
-u'滔滔不斷',
-u'滔滔不竭',
-u'滔滔不盡',
-u'滔滔不絕',
-u'滔滔汩汩',
-u'滔滔滾滾',
-u'陶陶兀兀',
-u'滔天大罪',
-u'滔天之罪',
-u'滔天罪行',
-u'饕餮之徒',
-u'桃蹊柳曲',
-u'韬形滅影',
-u'桃羞杏讓',
-u'桃夭迨吉',
-u'韬曜含光',
-u'桃夭李豔',
-u'桃夭柳媚',
-u'叨在知己',
-u'逃之夭夭',
-u'特定應用服務要素',
-u'特立獨行',
-u'忑忑忐忐',
-u'騰達飛黃',
-u'騰蛟起鳳',
-u'騰空而起',
-u'騰聲飛實',
-u'騰騰兀兀',
-u'疼心泣血',
-u'騰焰飛芒',
-u'騰雲駕霧',
-u'剔抽秃揣',
-u'剔抽秃刷',
-u'提爾之手',
-u'擿伏發奸',
-u'擿伏發隐',
-u'提綱舉領',
-u'提綱挈領',
-u'提綱振領',
-u'替古人耽憂',
-u'體國經野',
-u'醍醐灌頂',
-u'啼饑号寒',
-u'擿奸發伏',
-u'蹄閑三尋',
-u'鶗鴂雕卉',
-u'涕淚交垂',
-u'涕淚交集',
-u'涕淚交加',
-u'涕淚交零',
-u'涕淚交流',
-u'涕淚交下',
-u'涕零如雨',
-u'題名道姓',
-u'绨袍之義',
-u'剔起佛前燈',
-u'梯山航海',
-u'梯山架壑',
-u'梯山棧谷',
-u'涕泗橫流',
-u'涕泗交流',
-u'涕泗交下',
-u'涕泗交頤',
-u'涕泗流漣',
-u'涕泗滂沱',
-u'涕泗縱橫',
-u'倜傥不羁',
-u'倜傥不群',
-u'啼啼哭哭',
-u'啼天哭地',
-u'踢天弄井',
-u'替天行道',
-u'體貼入妙',
-u'體貼入微',
-u'逖聽遐視',
-u'逖聽遠聞',
-u'剔透玲珑',
-u'剃頭挑子一頭熱',
-u'體無完膚',
-u'體無完皮',
-u'摘瑕指瑜',
-u'啼笑皆非',
-u'剔蠍撩蜂',
-u'提心吊膽',
-u'提心吊糁',
-u'提心在口',
-u'體恤入微',
-u'梯愚入聖',
-u'殢雨尤雲',
-u'殢雲尤雨',
-u'體質聖契',
-u'擿埴索塗',
-u'天寶當年',
-u'天保九如',
-u'天崩地坼',
-u'天崩地解',
-u'天崩地裂',
-u'天崩地塌',
-u'天崩地坍',
-u'天崩地陷',
-u'天必佑之',
-u'添兵減竈',
-u'天兵天将',
-u'天不假年',
-u'天不絕人',
-u'天不怕地不怕',
-u'恬不爲怪',
-u'恬不爲意',
-u'天不言自高地不言自厚',
-u'天不憖遺',
-u'恬不知恥',
-u'恬不知怪',
-u'恬不知愧',
-u'恬不知羞',
-u'天不作美',
-u'天差地遠',
-u'天長地久',
-u'天長地闊',
-u'天長地老',
-u'天長地遠',
-u'天長日久',
-u'天成地平',
-u'天愁地慘',
-u'天從人原',
-u'添醋加油',
-u'天摧地塌',
-u'天錯地暗',
-u'天大地大',
-u'天打雷劈',
-u'恬淡寡欲',
-u'恬淡無爲',
-u'恬淡無欲',
-u'恬淡自甘',
-u'天道好還',
-u'天道經論',
-u'天道寧論',
-u'天道人事',
-u'天道無常',
-u'天道無親',
-u'添得言添不得錢',
-u'天地不容',
-u'天地長久',
-u'天地經緯',
-u'天地剖判',
-u'田地勤耕足養家',
-u'天地雙鬼',
-u'天地稊米',
-u'天地無常',
-u'天低吳楚',
-u'天低吳楚眼空無物',
-u'天地無極',
-u'天地之別',
-u'天地誅戮',
-u'天地誅滅',
-u'天奪其魄',
-u'天奪之年',
-u'天奪之魄',
-u'天翻地覆',
-u'天方夜譚',
-u'天覆地載',
-u'天付良緣',
-u'田父獻曝',
-u'田夫野老',
-u'田父之功',
-u'天府之國',
-u'天高不爲高人心最爲高',
-u'天高地厚',
-u'天高地迥',
-u'天高地下',
-u'天高皇帝遠',
-u'天高日遠',
-u'天高聽卑',
-u'天高聽下',
-u'天各一方',
-u'天公地道',
-u'天工人代',
-u'天冠地屦',
-u'填海造地',
-u'天寒地凍',
-u'天花亂墜',
-u'天花墜地',
-u'天荒地老',
-u'天潢貴胄',
-u'天昏地暗',
-u'天昏地黑',
-u'天機不可泄露',
-u'天機雲錦',
-u'天假良緣',
-u'天假其年',
-u'天假因緣',
-u'天假之年',
-u'填街塞巷',
-u'天荊地棘',
-u'天經地緯',
-u'天經地義',
-u'恬靜寡欲',
-u'天驚石破',
-u'天開地辟',
-u'添客不殺雞',
-u'填坑滿谷',
-u'天空海闊',
-u'天朗氣清',
-u'天老地荒',
-u'天理不容',
-u'天理良心',
-u'天理難容',
-u'天理人情',
-u'天理昭彰',
-u'天理昭昭',
-u'田連阡陌',
-u'天倫之樂',
-u'天羅地網',
-u'天馬行空',
-u'甜蜜驚喜',
-u'天命攸歸',
-u'天末涼風',
-u'天南地北',
-u'天南海北',
-u'天年不測',
-u'天年不齊',
-u'天年不遂',
-u'天凝地閉',
-u'天女散花',
-u'天清氣朗',
-u'天清日白',
-u'恬然不恥',
-u'恬然自足',
-u'天壤王郎',
-u'天壤懸隔',
-u'天壤之別',
-u'天壤之隔',
-u'天壤之判',
-u'天人共鑒',
-u'天人之際',
-u'天若有情天亦老',
-u'天上麒麟',
-u'天上人間',
-u'天上石麟',
-u'天上星多月不明',
-u'天上衆星皆拱北',
-u'天神碎片',
-u'天神下凡',
-u'天生地設',
-u'天生麗質',
-u'天生天化',
-u'天生天殺',
-u'天生尤物',
-u'天時不如地利',
-u'天時地利人和',
-u'天師借法',
-u'天授地設',
-u'甜水綠洲',
-u'天粟馬角',
-u'甜酸苦辣',
-u'天随人原',
-u'天塌地陷',
-u'天塌了砸大家',
-u'天塌了自有高的頂住',
-u'天塌自有高人頂',
-u'天台路迷',
-u'天堂地獄',
-u'恬恬吃三碗公',
-u'天庭飽滿地閣方圓',
-u'天外飛來',
-u'天外有天',
-u'天網恢恢',
-u'天網恢恢疏而不漏',
-u'天王老子',
-u'天聞若雷',
-u'天無二日',
-u'天無二日民無二主',
-u'天無絕人之路',
-u'天下本無事',
-u'天下本無事庸人自擾之',
-u'天下大亂',
-u'天下第一',
-u'天下第一号',
-u'天下鼎沸',
-u'天下獨步',
-u'天下方擾',
-u'天下風雲出我輩',
-u'天下歸心',
-u'天下老鸹一般黑',
-u'天下沒有不散的筵席',
-u'天下名山僧占多',
-u'天下莫敵',
-u'天下太平',
-u'天下未嘗無對',
-u'天下爲公',
-u'天下爲家',
-u'天下爲籠',
-u'天下文章一大抄',
-u'天下無不可化之人',
-u'天下無不可爲之事',
-u'天下無不是的父母',
-u'天下無敵',
-u'天下無難事',
-u'天下無難事隻怕有心人',
-u'天下無雙',
-u'天下烏鴉一般黑',
-u'天下無易事',
-u'天下興亡',
-u'天下興亡匹夫有責',
-u'天下洶洶',
-u'天下一家',
-u'天香國色',
-u'天性就是命',
-u'天行時氣',
-u'天懸地隔',
-u'天旋地轉',
-u'天選印記',
-u'天涯比鄰',
-u'天涯地角',
-u'天涯海角',
-u'天涯海灘',
-u'天涯若比鄰',
-u'天涯咫尺',
-u'恬顔叨宴',
-u'天眼恢恢',
-u'靦顔借命',
-u'甜言媚語',
-u'甜言蜜語',
-u'靦顔人世',
-u'恬言柔舌',
-u'甜言軟語',
-u'靦顔事仇',
-u'添鹽着醋',
-u'天搖地動',
-u'天要下雨娘要嫁人',
-u'天衣無縫',
-u'天有不測風雲',
-u'天有不測風雲人有旦夕禍福',
-u'添油熾薪',
-u'添油加醋',
-u'天誘其衷',
-u'天與人歸',
-u'天遠地隔',
-u'天淵人隔',
-u'天淵之別',
-u'天淵之隔',
-u'田月桑時',
-u'天造草昧',
-u'天造地設',
-u'天震地駭',
-u'天真爛漫',
-u'天知地知',
-u'天知地知你知我知',
-u'添枝加葉',
-u'天之驕子',
-u'添枝接葉',
-u'天之僇民',
-u'添枝增葉',
-u'天誅地滅',
-u'天助自助者',
-u'添磚加瓦',
-u'天字第一号',
-u'天姿國色',
-u'甜嘴蜜舌',
-u'天作之合',
-u'挑撥離間',
-u'挑茶斡刺',
-u'條陳所聞',
-u'跳出三界外不在五行中',
-u'挑唇料嘴',
-u'調唇弄舌',
-u'調詞架訟',
-u'跳到黃河洗不清',
-u'挑得籃裏便是菜',
-u'挑肥揀瘦',
-u'條分節解',
-u'條分縷晰',
-u'調風變俗',
-u'粜風賣雨',
-u'調風弄月',
-u'調高和寡',
-u'條貫部分',
-u'調和鼎鼐',
-u'調和陰陽',
-u'條解支劈',
-u'跳進黃河洗不清',
-u'跳進黃河也洗不清',
-u'挑精揀肥',
-u'條理不清',
-u'條理井然',
-u'調理陰陽',
-u'條理秩然',
-u'調良穩泛',
-u'跳梁小醜',
-u'挑毛揀刺',
-u'調墨弄筆',
-u'條入葉貫',
-u'挑三撥四',
-u'調三惑四',
-u'挑三揀四',
-u'調三斡四',
-u'挑三嫌四',
-u'調舌弄唇',
-u'調神暢情',
-u'佻身飛镞',
-u'調絲品竹',
-u'蜩螗沸羹',
-u'跳天撅地',
-u'條條大道通羅馬',
-u'條條框框',
-u'調停兩用',
-u'跳丸日月',
-u'調弦弄管',
-u'挑釁之旗',
-u'條修葉貫',
-u'挑雪填井',
-u'挑牙料唇',
-u'挑麽挑六',
-u'跳在黃河洗不清',
-u'調脂弄粉',
-u'調朱傅粉',
-u'調朱弄粉',
-u'調嘴調舌',
-u'調嘴弄舌',
-u'調嘴學舌',
-u'鐵案如山',
-u'鐵闆釘釘',
-u'鐵棒磨成針',
-u'鐵壁銅牆',
-u'鐵壁銅山',
-u'鐵腸石心',
-u'鐵杵成針',
-u'鐵杵磨成針',
-u'鐵船渡海',
-u'鐵綽銅琶',
-u'鐵打的營盤流水的兵',
-u'鐵打銅鑄',
-u'鐵打心腸',
-u'鐵膽銅心',
-u'鐵郭銅關',
-u'鐵畫銀鈎',
-u'鐵環營地',
-u'鐵欄監獄',
-u'鐵馬橫行',
-u'鐵馬金戈',
-u'鐵門坎兒難過',
-u'鐵面判坩',
-u'鐵面槍牙',
-u'鐵面無情',
-u'鐵面無私',
-u'鐵面禦史',
-u'鐵怕落爐人怕落套',
-u'鐵石高原',
-u'鐵石人也心酸',
-u'鐵石心腸',
-u'鐵石心肝',
-u'鐵樹花開',
-u'鐵樹開花',
-u'鐵樹開花水倒流',
-u'鐵死冤家',
-u'鐵心木腸',
-u'鐵心石腸',
-u'鐵心銅糁',
-u'鐵血主義',
-u'鐵硯磨穿',
-u'鐵證如山',
-u'鐵中铮铮',
-u'鐵嘴鋼牙',
-u'鐵嘴直斷',
-u'聽不得一面之詞',
-u'聽而不聞',
-u'铤而走險',
-u'聽風便是雨',
-u'聽風聽水',
-u'聽見風就是雨',
-u'挺撅挺橫',
-u'聽覺震蕩',
-u'廷克維斯',
-u'挺鹿走險',
-u'聽某嘴大富貴',
-u'聽其言而觀其行',
-u'停妻再娶',
-u'聽其自流',
-u'聽其自然',
-u'庭前生瑞草',
-u'聽人穿鼻',
-u'挺身而出',
-u'亭台樓閣',
-u'聽天由命',
-u'婷婷嫋嫋',
-u'亭亭玉立',
-u'停辛貯苦',
-u'挺胸疊肚',
-u'挺胸凸肚',
-u'停雲落月',
-u'庭栽栖鳳竹',
-u'聽者藐藐',
-u'廷争面折',
-u'聽之藐藐',
-u'聽之任之',
-u'停止信号',
-u'同胞共氣',
-u'同敝相濟',
-u'通變達權',
-u'同病相聯',
-u'痛不欲生',
-u'通材達識',
-u'通才練識',
-u'通才碩學',
-u'痛徹心腑',
-u'痛澈心脾',
-u'同塵合污',
-u'同塵與灰',
-u'銅城鐵壁',
-u'同仇敵忾',
-u'統籌兼顧',
-u'銅臭熏天',
-u'同出一轍',
-u'同船合命',
-u'同床各夢',
-u'同窗共琪',
-u'同床共枕',
-u'同窗契友',
-u'同窗夜語',
-u'同床異夢',
-u'同垂不朽',
-u'銅唇鐵舌',
-u'通達谙練',
-u'銅打鐵鑄',
-u'通道命令',
-u'同德同心',
-u'同德協力',
-u'同德一心',
-u'痛滌前非',
-u'痛定思痛',
-u'通都大埠',
-u'銅鬥家計',
-u'銅鬥家私',
-u'通都巨邑',
-u'通都大邑',
-u'同惡共濟',
-u'同惡相黨',
-u'同惡相濟',
-u'同惡相求',
-u'同符合契',
-u'痛改前非',
-u'同甘共苦',
-u'同工異曲',
-u'同功一體',
-u'通共有無',
-u'通古博今',
-u'通古達變',
-u'痛貫心膂',
-u'痌瘝一體',
-u'痌瘝在抱',
-u'同歸殊途',
-u'同歸于盡',
-u'銅壺滴漏',
-u'痛悔前非',
-u'通計熟籌',
-u'痛擊之刃',
-u'通家之好',
-u'痛湔宿垢',
-u'痛剿窮迫',
-u'銅澆鐵鑄',
-u'通今博古',
-u'通今達古',
-u'銅筋鐵骨',
-u'銅筋鐵肋',
-u'同君一席話',
-u'痛哭流涕',
-u'痛快淋漓',
-u'通力合作',
-u'同利相死',
-u'同力協契',
-u'同流合污',
-u'通路敏化',
-u'同美相妒',
-u'同門異戶',
-u'同明相照',
-u'通南徹北',
-u'同年而校',
-u'同年而語',
-u'童牛角馬',
-u'銅琶鐵闆',
-u'同盤而食',
-u'銅盤重肉',
-u'同袍同澤',
-u'同氣連枝',
-u'同氣相求',
-u'通前徹後',
-u'通前至後',
-u'銅牆鐵壁',
-u'痛切心骨',
-u'通情達理',
-u'通衢大邑',
-u'通衢廣陌',
-u'通權達變',
-u'通權達理',
-u'同然一辭',
-u'同日而道',
-u'同日而論',
-u'同日而言',
-u'同日而語',
-u'通儒達識',
-u'痛入骨髓',
-u'通儒碩學',
-u'痛入心脾',
-u'銅山金穴',
-u'銅山鐵壁',
-u'銅山西崩',
-u'銅山西崩洛鍾東應',
-u'童山濯濯',
-u'通上徹下',
-u'通商惠工',
-u'痛深惡絕',
-u'同聲共氣',
-u'同生共死',
-u'同生死共存亡',
-u'同聲同氣',
-u'同聲相求',
-u'同聲相應',
-u'同聲相應同氣相求',
-u'同聲一辭',
-u'同室操戈',
-u'通時達變',
-u'通時達務',
-u'通時合變',
-u'通首至尾',
-u'通書達禮',
-u'童叟無欺',
-u'通俗易懂',
-u'同堂兄弟',
-u'通天徹地',
-u'通天達地',
-u'同條共貫',
-u'通同一氣',
-u'銅頭鐵臂',
-u'銅頭鐵額',
-u'銅駝草莽',
-u'銅駝荊棘',
-u'銅圍鐵馬',
-u'通文達理',
-u'通文達藝',
-u'同文共規',
-u'通文調武',
-u'痛誣醜诋',
-u'通無共有',
-u'同惡相恤',
-u'同惡相助',
-u'痛下針砭',
-u'通險暢機',
-u'通宵徹旦',
-u'通宵徹夜',
-u'通宵徹晝',
-u'通宵達旦',
-u'痛心拔腦',
-u'同心畢力',
-u'同心并力',
-u'痛心病首',
-u'同心敵忾',
-u'同心斷金',
-u'同心共膽',
-u'同心共濟',
-u'同心合膽',
-u'同心合德',
-u'同心合力',
-u'同心合意',
-u'痛心疾首',
-u'同心竭力',
-u'痛心絕氣',
-u'痛心刻骨',
-u'同心僇力',
-u'痛心泣血',
-u'痛心切齒',
-u'痛心切骨',
-u'痛心入骨',
-u'痛心傷臆',
-u'銅心鐵膽',
-u'同心同德',
-u'童心未泯',
-u'同心協德',
-u'同心協濟',
-u'同心協力',
-u'同心葉力',
-u'同心一德',
-u'同心一力',
-u'同心一意',
-u'同休等戚',
-u'同休共戚',
-u'銅須營地',
-u'童顔鶴發',
-u'痛癢相關',
-u'同業相仇',
-u'同音共律',
-u'痛飲黃龍',
-u'通幽洞靈',
-u'通幽洞冥',
-u'通幽動微',
-u'通憂共患',
-u'同憂相救',
-u'同遊張園',
-u'同浴譏裸',
-u'同源共流',
-u'同源異流',
-u'同源異派',
-u'彤雲密布',
-u'通真達靈',
-u'同舟敵國',
-u'同軸電纜',
-u'同舟共濟',
-u'同舟共命',
-u'同舟遇風',
-u'銅鑄鐵澆',
-u'痛自創艾',
-u'偷安旦夕',
-u'投畀豺虎',
-u'投筆從戎',
-u'投鞭斷流',
-u'頭不梳臉不洗',
-u'頭出頭沒',
-u'頭醋不酸二醋不辣',
-u'偷得爺錢無使處',
-u'投遞證實',
-u'偷東摸西',
-u'頭發胡子一把抓',
-u'偷風不偷月偷雨不偷雪',
-u'頭高頭低',
-u'投膏止火',
-u'投戈講藝',
-u'偷工減料',
-u'偷狗戲雞',
-u'透骨酸心',
-u'偷寒送暖',
-u'投河奔井',
-u'偷合苟從',
-u'偷合苟容',
-u'投河覓井',
-u'偷合取容',
-u'投壺電笑',
-u'頭會箕斂',
-u'頭昏目眩',
-u'頭昏目暈',
-u'頭昏腦悶',
-u'頭昏腦眩',
-u'頭昏腦脹',
-u'頭昏眼暗',
-u'頭昏眼花',
-u'頭昏眼暈',
-u'偷雞不着蝕把米',
-u'投機倒把',
-u'偷雞盜狗',
-u'偷雞摸狗',
-u'投機取巧',
-u'投機鑽營',
-u'投間抵隙',
-u'頭焦額爛',
-u'頭角峥嵘',
-u'投阱下石',
-u'頭會箕賦',
-u'偷來的鑼鼓打不得',
-u'偷梁換柱',
-u'投卵擊石',
-u'投袂而起',
-u'投袂荷戈',
-u'偷媚取容',
-u'投袂援戈',
-u'頭沒杯案',
-u'投木報瓊',
-u'偷女隔層山偷男隔層單',
-u'頭盤界面',
-u'頭蓬眼腫',
-u'頭破血出',
-u'頭破血淋',
-u'頭破血流',
-u'投其所好',
-u'投刃皆虛',
-u'頭三腳難踢',
-u'投山竄海',
-u'頭上安頭',
-u'頭上打一下腳底闆響',
-u'頭上末下',
-u'頭上著頭',
-u'頭梢自領',
-u'偷聲細氣',
-u'投石拔距',
-u'投石超距',
-u'投石問路',
-u'投石下井',
-u'投鼠忌器',
-u'投鼠者當忌其器',
-u'投鼠之忌',
-u'投梭折齒',
-u'投梭之拒',
-u'投桃報李',
-u'投桃之報',
-u'頭疼腦熱',
-u'頭疼醫頭腳疼醫腳',
-u'偷天換日',
-u'頭童齒豁',
-u'頭痛額熱',
-u'頭痛灸頭腳痛灸腳',
-u'頭痛腦熱',
-u'頭痛醫頭',
-u'頭痛醫頭腳痛醫腳',
-u'頭痛治頭足痛治足',
-u'偷偷摸摸',
-u'頭頭是道',
-u'投隙抵巇',
-u'投隙抵罅',
-u'偷閑躲靜',
-u'投閑置散',
-u'偷香竊玉',
-u'頭懸梁錐刺股',
-u'頭眩目昏',
-u'頭懸目眩',
-u'頭眩眼花',
-u'頭癢搔跟',
-u'頭一無二',
-u'偷營劫寨',
-u'頭暈目眩',
-u'頭暈眼黑',
-u'頭暈眼花',
-u'頭暈眼昏',
-u'頭暈眼暈',
-u'頭重腳輕',
-u'投諸四裔',
-u'投傳而去',
-u'頭足倒置',
-u'頭足異處',
-u'頭足異所',
-u'偷嘴的貓兒性不改',
-u'土崩瓦解',
-u'土崩魚爛',
-u'土撥鼠洞',
-u'吐哺辍洗',
-u'吐哺待賢',
-u'吐哺握發',
-u'吐哺捉發',
-u'圖财害命',
-u'吐膽傾心',
-u'徒讀父書',
-u'荼毒生靈',
-u'徒多則成勢',
-u'兔兒沿山跑還來歸舊窩',
-u'徒費唇舌',
-u'土扶成牆',
-u'徒負虛名',
-u'吐肝露膽',
-u'吐剛茹柔',
-u'塗歌裏抃',
-u'塗歌裏詠',
-u'塗歌巷舞',
-u'塗歌邑誦',
-u'吐故納新',
-u'土豪劣紳',
-u'兔毫竹管',
-u'兔迹狐蹤',
-u'土雞瓦狗',
-u'土雞瓦犬',
-u'兔角龜毛',
-u'兔角牛翼',
-u'土階茅茨',
-u'土階茅屋',
-u'兔盡狗烹',
-u'瘏口哓音',
-u'兔葵燕麥',
-u'徒勞往返',
-u'徒勞無功',
-u'徒勞無益',
-u'徒亂人意',
-u'兔羅雉離',
-u'兔毛大伯',
-u'圖謀不軌',
-u'土木形骸',
-u'土牛木馬',
-u'兔起凫舉',
-u'兔起鹘落',
-u'吐氣如蘭',
-u'兔起烏沉',
-u'吐氣揚眉',
-u'圖窮匕首見',
-u'圖窮匕見',
-u'途窮日暮',
-u'兔缺烏沉',
-u'土壤細流',
-u'土殇怨靈',
-u'土生土長',
-u'吐食握發',
-u'徒手戰鬥',
-u'吐屬不凡',
-u'兔死凫舉',
-u'兔死狗烹',
-u'兔死狐悲',
-u'兔死狐悲物傷其類',
-u'兔死犬饑',
-u'吐絲自縛',
-u'屠所牛羊',
-u'塗炭生靈',
-u'塗炭生民',
-u'兔頭麞腦',
-u'途途是道',
-u'徒讬空言',
-u'圖文并茂',
-u'圖小利而吃大虧',
-u'吐心吐膽',
-u'土洋結合',
-u'途遙日暮',
-u'徒擁虛名',
-u'徒有其名',
-u'徒有虛名',
-u'土雨紛紛',
-u'塗脂抹粉',
-u'土之微粒',
-u'徒衆則成勢',
-u'兔子不吃窩邊草',
-u'兔子會駕轅誰買騾子馬',
-u'徒子徒孫',
-u'兔子鑽山追攆難',
-u'兔走鹘落',
-u'兔走烏飛',
-u'圖作不軌',
-u'團花簇錦',
-u'抟擊掀發',
-u'抟空捕影',
-u'抟沙嚼蠟',
-u'抟砂煉汞',
-u'抟砂弄汞',
-u'抟沙作飯',
-u'團頭聚面',
-u'抟香弄粉',
-u'抟心壹志',
-u'抟柱乘梁',
-u'推杯把盞',
-u'推本窮源',
-u'推本溯源',
-u'退避三舍',
-u'推波助瀾',
-u'退步抽身',
-u'退步思量事事難',
-u'退藏于密',
-u'推陳出新',
-u'推陳緻新',
-u'推誠布公',
-u'推誠接物',
-u'推誠相見',
-u'推誠置腹',
-u'推崇備至',
-u'推倒了油瓶不扶',
-u'推東主西',
-u'推而廣之',
-u'推幹就濕',
-u'褪後趨前',
-u'蛻化變質',
-u'推己及人',
-u'推己及物',
-u'推襟送抱',
-u'推枯折腐',
-u'推梨讓棗',
-u'推聾妝啞',
-u'推聾作啞',
-u'推輪捧毂',
-u'退旅進旅',
-u'退讓賢路',
-u'退如山移',
-u'推三推四',
-u'推三阻四',
-u'退食從容',
-u'推食解衣',
-u'退食自公',
-u'退思補過',
-u'推濤作浪',
-u'推天搶地',
-u'推亡固存',
-u'推賢進善',
-u'推賢讓能',
-u'推心緻腹',
-u'退一步海闊天空',
-u'退有後言',
-u'頹垣敗壁',
-u'頹垣敗井',
-u'頹垣斷塹',
-u'頹垣廢井',
-u'頹垣廢址',
-u'推燥居濕',
-u'推舟于陸',
-u'吞刀刮腸',
-u'吞刀吐火',
-u'豚兒犬子',
-u'囤房捂盤',
-u'吞風飲雨',
-u'吞符翕景',
-u'囤積居奇',
-u'屯街塞巷',
-u'屯蹶否塞',
-u'屯糧積草',
-u'屯毛不辨',
-u'吞聲忍淚',
-u'吞聲忍氣',
-u'吞聲飲恨',
-u'吞聲飲氣',
-u'吞食獵物',
-u'吞食屍體',
-u'吞炭漆身',
-u'豚蹄穰田',
-u'吞吞吐吐',
-u'吞煙吐霧',
-u'吞言咽理',
-u'吞雲吐霧',
-u'吞氈齧雪',
-u'吞紙抱犬',
-u'吞舟漏網',
-u'吞舟是漏',
-u'吞舟之魚',
-u'脫白挂綠',
-u'跅弛不羁',
-u'唾地成文',
-u'托鳳攀龍',
-u'托公報私',
-u'橐弓卧鼓',
-u'托公行私',
-u'讬孤寄命',
-u'托骥之蠅',
-u'橐甲束兵',
-u'脫缰之馬',
-u'拖金委紫',
-u'脫殼金蟬',
-u'脫口成章',
-u'脫口而出',
-u'脫了褲子放屁',
-u'脫離苦海',
-u'托梁換柱',
-u'拖麻拽布',
-u'跅幪不羁',
-u'唾面自幹',
-u'唾面自乾',
-u'拖男帶女',
-u'拖泥帶水',
-u'脫袍退位',
-u'拖青纡紫',
-u'拖人落水',
-u'拖人下水',
-u'脫手彈丸',
-u'唾手可得',
-u'唾手可決',
-u'唾手可取',
-u'妥首帖耳',
-u'脫胎換骨',
-u'跅弢不羁',
-u'脫天漏網',
-u'拖天掃地',
-u'橐駝之技',
-u'托物陳喻',
-u'托物感懷',
-u'托物連類',
-u'托物引類',
-u'托物寓感',
-u'托物寓興',
-u'托物喻志',
-u'脫穎而出',
-u'脫穎囊錐',
-u'托于空言',
-u'唾掌可得',
-u'托之空言',
-u'托諸空言',
-u'駝子壓直了人吃虧',
-u'挖耳當招',
-u'蛙兒要命蛇要飽',
-u'瓦釜雷鳴',
-u'蛙鼓蟲吟',
-u'瓦罐不離井口破',
-u'瓦合之卒',
-u'挖空心思',
-u'蛙鳴蟬噪',
-u'瓦器蚌盤',
-u'挖肉補瘡',
-u'娃子不哭奶不脹',
-u'歪八豎八',
-u'歪不橫楞',
-u'歪打正着',
-u'外方内圓',
-u'歪風邪氣',
-u'外感内傷',
-u'外剛内柔',
-u'外行看熱鬧',
-u'外合裏差',
-u'外合裏應',
-u'外簡内明',
-u'外寬内忌',
-u'外寬内明',
-u'外寬内深',
-u'外來的和尚會念經',
-u'外厲内荏',
-u'歪門邪道',
-u'外明不知黑暗',
-u'外明不知裏暗',
-u'歪七八鈕',
-u'外強中幹',
-u'外強中瘠',
-u'外強中乾',
-u'外巧内嫉',
-u'外柔内剛',
-u'外甥不出舅家門',
-u'外甥多像舅',
-u'外甥見舅如見娘',
-u'歪心邪意',
-u'外禦其侮',
-u'外圓内方',
-u'萬般皆是命',
-u'萬般皆下品惟有讀書高',
-u'完璧歸趙',
-u'萬變不離其宗',
-u'萬別千差',
-u'玩兵黩武',
-u'萬不得已',
-u'萬不失一',
-u'萬代千秋',
-u'萬朵桃花一樹生',
-u'萬惡淫爲首百善孝爲先',
-u'莞爾而笑',
-u'刓方爲圓',
-u'萬夫不當',
-u'萬夫不當之勇',
-u'萬夫莫當',
-u'萬夫莫開',
-u'頑父嚚母',
-u'頑梗不化',
-u'彎弓飲羽',
-u'頑固不化',
-u'萬古長春',
-u'萬古長存',
-u'萬古長青',
-u'萬古流芳',
-u'萬古千秋',
-u'萬蠱食天',
-u'玩故習常',
-u'萬貫家财',
-u'萬貫家私',
-u'完好無缺',
-u'萬壑千岩',
-u'萬壑争流',
-u'萬恨千愁',
-u'萬戶千門',
-u'玩忽職守',
-u'玩火自焚',
-u'萬家燈火',
-u'萬家生佛',
-u'萬箭穿心',
-u'萬箭攢心',
-u'萬箭填弦待令發',
-u'晚節不保',
-u'萬劫不複',
-u'晚節不終',
-u'晚節黃花',
-u'玩具骨頭',
-u'萬口一詞',
-u'萬口一談',
-u'纨袴膏粱',
-u'萬苦千辛',
-u'纨袴子弟',
-u'萬賴俱寂',
-u'萬籁無情風自吟',
-u'萬賴無聲',
-u'剜了心頭肉',
-u'萬裏長城',
-u'萬裏長征',
-u'萬裏鵬程',
-u'萬裏鵬翼',
-u'萬裏迢迢',
-u'萬裏無雲',
-u'頑廉懦立',
-u'萬流景仰',
-u'萬綠從中一點紅',
-u'萬縷千絲',
-u'萬馬奔騰',
-u'萬馬齊喑',
-u'完美無疵',
-u'完美無缺',
-u'萬民塗炭',
-u'完名全節',
-u'萬目睽睽',
-u'萬目睚眦',
-u'萬念俱灰',
-u'萬念俱寂',
-u'萬年無疆',
-u'頑皮賴骨',
-u'頑皮賴肉',
-u'頑皮賊骨',
-u'頑妻逆子無藥可醫',
-u'完全出乎意料',
-u'萬全之策',
-u'萬全之計',
-u'萬人傳實',
-u'萬人空巷',
-u'萬人之敵',
-u'萬人之上',
-u'玩日愒時',
-u'玩日愒歲',
-u'剜肉補瘡',
-u'剜肉成瘡',
-u'剜肉生瘡',
-u'剜肉醫瘡',
-u'剜肉做瘡',
-u'晚生後學',
-u'玩世不恭',
-u'萬世不易',
-u'萬事不由人計較',
-u'萬事大吉',
-u'頑石點頭',
-u'萬事亨通',
-u'萬事皆已定',
-u'萬事俱備',
-u'萬事俱備隻欠東風',
-u'玩時愒日',
-u'萬世流芳',
-u'萬事留人情後來好相見',
-u'萬事勝意',
-u'萬世師表',
-u'玩時貪日',
-u'萬世無疆',
-u'萬世一時',
-u'萬壽無疆',
-u'萬水千山',
-u'萬死不辭',
-u'萬死一生',
-u'萬死猶輕',
-u'玩歲愒日',
-u'玩歲愒時',
-u'玩歲愒月',
-u'萬歲千秋',
-u'萬頭攢動',
-u'萬萬千千',
-u'玩物喪志',
-u'萬無一失',
-u'萬物之靈',
-u'萬象更新',
-u'萬象森羅',
-u'萬緒千端',
-u'萬緒千頭',
-u'蜿蜒骨杖',
-u'彎腰捧腹',
-u'彎腰駝背',
-u'萬應靈丹',
-u'萬應靈藥',
-u'萬語千言',
-u'萬載千秋',
-u'萬丈高樓平地起',
-u'萬衆一心',
-u'宛轉蛾眉',
-u'宛轉悠揚',
-u'宛轉周折',
-u'萬紫千紅',
-u'望表知裏',
-u'亡不待夕',
-u'亡不旋跬',
-u'亡不旋踵',
-u'忘餐廢寝',
-u'望塵拜伏',
-u'望塵奔北',
-u'望塵奔潰',
-u'望塵不及',
-u'妄塵而拜',
-u'望塵靡及',
-u'望塵莫及',
-u'望塵僄聲',
-u'望塵追迹',
-u'枉尺直尋',
-u'望穿秋水',
-u'忘啜廢枕',
-u'枉道事人',
-u'望帝啼鵑',
-u'望斷白雲',
-u'忘恩背義',
-u'忘恩負義',
-u'忘恩失義',
-u'望而卻步',
-u'望而生畏',
-u'王法本乎人情',
-u'枉法徇私',
-u'往返徒勞',
-u'枉費唇舌',
-u'枉費工夫',
-u'枉費日月',
-u'枉費心計',
-u'枉費心力',
-u'枉費心思',
-u'望風捕影',
-u'望風承旨',
-u'望風而遁',
-u'望風而潰',
-u'望風而靡',
-u'望風而逃',
-u'望風而降',
-u'望風而走',
-u'望風披靡',
-u'望風撲影',
-u'望峰息心',
-u'望風希旨',
-u'望風響應',
-u'望父全兒志',
-u'往複尋道',
-u'王公大人',
-u'王貢彈冠',
-u'王公貴戚',
-u'王顧左右而言他',
-u'亡國大夫',
-u'亡國滅種',
-u'亡國破家',
-u'亡國之器',
-u'亡國之社',
-u'亡國之聲',
-u'亡國之音',
-u'望衡對宇',
-u'王侯将相',
-u'王後盧前',
-u'忘乎其形',
-u'忘乎所以',
-u'亡魂喪膽',
-u'亡魂喪魄',
-u'亡魂喪糁',
-u'亡魂失魄',
-u'亡戟得矛',
-u'枉己正人',
-u'罔極之恩',
-u'往蹇來連',
-u'枉矯過激',
-u'網開三面',
-u'網開一面',
-u'枉勘虛招',
-u'亡可奈何',
-u'望空捉影',
-u'妄口巴舌',
-u'枉口嚼舌',
-u'枉口诳舌',
-u'望隆盧扁',
-u'網漏吞舟',
-u'望梅閣老',
-u'望梅止渴',
-u'望梅止渴畫餅充饑',
-u'望門投止',
-u'枉墨矯繩',
-u'網目不疏',
-u'忘年之好',
-u'忘年之交',
-u'忘年之契',
-u'枉辔學步',
-u'望其肩項',
-u'忘其所以',
-u'望其項背',
-u'忘寝廢食',
-u'亡秦三戶',
-u'忘情負義',
-u'望秋先零',
-u'枉曲直湊',
-u'惘然若失',
-u'往日無仇近日無冤',
-u'往日無冤近日無仇',
-u'妄生穿鑿',
-u'忘生舍死',
-u'枉矢哨壺',
-u'王孫公子',
-u'王孫貴戚',
-u'妄談禍福',
-u'枉突徙薪',
-u'望文生訓',
-u'望文生義',
-u'望聞問切',
-u'望屋而食',
-u'枉物難消',
-u'望屋以食',
-u'妄下雌黃',
-u'忘象得意',
-u'望鄉海岸',
-u'王祥卧冰',
-u'忘形之交',
-u'忘形之契',
-u'望岫息心',
-u'望眼将穿',
-u'妄言輕動',
-u'妄言妄聽',
-u'望眼欲穿',
-u'亡羊補牢',
-u'汪洋大海',
-u'汪洋大肆',
-u'亡羊得牛',
-u'汪洋度量',
-u'望洋而歎',
-u'汪洋浩博',
-u'汪洋浩瀚',
-u'汪洋闳肆',
-u'王陽明禮贊',
-u'望洋興歎',
-u'亡羊之歎',
-u'汪洋自肆',
-u'汪洋自恣',
-u'望影揣情',
-u'枉用心機',
-u'亡猿禍木',
-u'亡猿災木',
-u'望雲之情',
-u'忘戰必危',
-u'忘戰者危',
-u'往者不可谏來者猶可追',
-u'枉直随形',
-u'罔知所措',
-u'枉直同貫',
-u'往渚還汀',
-u'望子成龍',
-u'王子犯法庶民同罪',
-u'王子犯法與民同罪',
-u'妄自菲薄',
-u'妄自尊大',
-u'王佐之才',
-u'未艾方興',
-u'帏薄不修',
-u'位卑言高',
-u'韋編三絕',
-u'帏箔不修',
-u'位不期驕',
-u'未蔔先知',
-u'微不足道',
-u'微察秋毫',
-u'委差委缺',
-u'爲臣要忠爲人要孝',
-u'圍城打援',
-u'蔚成風氣',
-u'未成一篑',
-u'渭川千畝',
-u'爲叢驅雀',
-u'尾大不掉',
-u'尾大難掉',
-u'未達一間',
-u'爲德不終',
-u'爲德不卒',
-u'未登錄詞',
-u'帷燈箧劍',
-u'帷燈匣劍',
-u'畏敵如虎',
-u'未定之天',
-u'維度虹吸',
-u'爲惡不悛',
-u'爲惡難逃',
-u'危而不懼',
-u'違法亂紀',
-u'爲法自弊',
-u'爲非作歹',
-u'爲非作惡',
-u'未焚徙薪',
-u'威風八面',
-u'威風凜凜',
-u'威風掃地',
-u'微風細雨',
-u'未風先雨',
-u'威風祥麟',
-u'威鳳一羽',
-u'微風引弱火',
-u'爲富不仁',
-u'微服私行',
-u'煨幹避濕',
-u'未敢苟同',
-u'偎幹就濕',
-u'爲官須作相',
-u'微光草籃',
-u'爲鬼爲蜮',
-u'爲國捐軀',
-u'爲國爲民',
-u'微過細故',
-u'委過于人',
-u'違害就利',
-u'爲好成歉',
-u'威吓低吼',
-u'偎紅倚翠',
-u'爲虎傅翼',
-u'微乎其微',
-u'爲虎添翼',
-u'爲虎作伥',
-u'爲虺弗摧',
-u'爲虺弗摧爲蛇若何',
-u'危急存亡',
-u'危急存亡之秋',
-u'偉績豐功',
-u'位極人臣',
-u'危機四伏',
-u'未見全體',
-u'惟精惟一',
-u'未竟之志',
-u'爲酒所傷',
-u'未可厚非',
-u'魏顆結草',
-u'未可全抛一片心',
-u'未可同日而語',
-u'惟口起羞',
-u'韋褲布被',
-u'未來休指望過去莫思量',
-u'未老先衰',
-u'違利赴名',
-u'惟利是命',
-u'唯利是求',
-u'惟利是趨',
-u'唯利是視',
-u'唯利是圖',
-u'惟利是營',
-u'惟利是逐',
-u'未了公案',
-u'唯鄰是蔔',
-u'萎靡不振',
-u'唯妙唯肖',
-u'爲民除害',
-u'爲民父母',
-u'爲民喉舌',
-u'爲民請命',
-u'未明求衣',
-u'唯命是從',
-u'唯命是聽',
-u'帷幕不修',
-u'嵬目鴻耳',
-u'未能免俗',
-u'危迫利誘',
-u'爲期不遠',
-u'煨乾避濕',
-u'偎乾就濕',
-u'違強陵弱',
-u'慰情勝無',
-u'爲裘爲箕',
-u'未去朝天子先來谒相公',
-u'委曲成全',
-u'委曲求全',
-u'魏鵲無枝',
-u'嵬然不動',
-u'蔚然成風',
-u'巍然屹立',
-u'爲仁不富',
-u'爲仁不富爲富不仁',
-u'爲人師表',
-u'爲人說項',
-u'爲人須要始終如一',
-u'爲人作嫁',
-u'惟日不足',
-u'惟日爲歲',
-u'委肉虎蹊',
-u'味如雞肋',
-u'味如嚼蠟',
-u'危如累卵',
-u'危如朝露',
-u'危若朝露',
-u'爲山九仞功虧一篑',
-u'爲山止篑',
-u'爲善最樂',
-u'爲蛇畫足',
-u'威懾凝視',
-u'爲蛇若何',
-u'爲蛇添足',
-u'尾生抱柱',
-u'尾生之信',
-u'違世乖俗',
-u'違世絕俗',
-u'未識一丁',
-u'違世異俗',
-u'畏首畏尾',
-u'畏縮不前',
-u'微縮殘渣',
-u'畏縮咆哮',
-u'爲所欲爲',
-u'爲他人做嫁衣裳',
-u'微談巷議',
-u'違天悖理',
-u'違天悖人',
-u'違天害理',
-u'違天逆理',
-u'違條犯法',
-u'違條舞法',
-u'味同嚼蠟',
-u'爲土所防',
-u'未晚先投宿',
-u'威望素着',
-u'威望素著',
-u'亹亹不倦',
-u'未爲不可',
-u'蔚爲大觀',
-u'巍巍蕩蕩',
-u'娓娓動聽',
-u'娓娓而談',
-u'唯唯否否',
-u'畏威懷德',
-u'危微精一一對',
-u'圍魏救趙',
-u'唯唯連聲',
-u'唯唯諾諾',
-u'蔚爲奇觀',
-u'委委佗佗',
-u'爲文輕薄',
-u'微文深诋',
-u'唯我獨尊',
-u'威武不能屈',
-u'威武不屈',
-u'爲五鬥米折腰',
-u'唯吾獨尊',
-u'緯武經文',
-u'畏葸不前',
-u'微顯闡幽',
-u'韋弦之佩',
-u'違鄉負俗',
-u'爲小失大',
-u'惟肖惟妙',
-u'威脅利誘',
-u'威信掃地',
-u'違心之論',
-u'威刑肅物',
-u'未形之患',
-u'爲學始知道',
-u'微言大誼',
-u'危言高論',
-u'危言核論',
-u'嵬眼澒耳',
-u'危言逆耳',
-u'危言竦論',
-u'危言聳聽',
-u'危言危行',
-u'危言正色',
-u'渭陽之情',
-u'惟一臂之弗瘳',
-u'逶迤退食',
-u'畏影避迹',
-u'畏影惡迹',
-u'畏影而走',
-u'偎慵堕懶',
-u'惟有讀書高',
-u'未有無志而建功',
-u'惟有志不立',
-u'謂予不信',
-u'未雨綢缪',
-u'危于累卵',
-u'爲淵驅魚',
-u'爲淵驅魚爲叢驅爵',
-u'爲淵驅魚爲叢驅雀',
-u'危在旦夕',
-u'威震天下',
-u'未知萬一',
-u'威重令行',
-u'委重投艱',
-u'渭濁泾清',
-u'魏紫姚黃',
-u'未足輕重',
-u'畏罪潛逃',
-u'委罪于人',
-u'問安視寝',
-u'問安視膳',
-u'文不加點',
-u'文不文武不武',
-u'文采風流',
-u'穩操勝券',
-u'穩操勝算',
-u'穩操左券',
-u'問長問短',
-u'穩吃三注',
-u'文弛武玩',
-u'聞寵若驚',
-u'問道于盲',
-u'文觌武匿',
-u'問鼎輕重',
-u'問鼎中原',
-u'蚊動牛鬥',
-u'文房四寶',
-u'文房四侯',
-u'文房四士',
-u'文房四物',
-u'文房四藝',
-u'文風不動',
-u'聞風而動',
-u'聞風而起',
-u'聞風而逃',
-u'聞風而興',
-u'聞風而至',
-u'聞風破膽',
-u'聞風喪膽',
-u'聞風響應',
-u'聞風遠遁',
-u'聞風遠揚',
-u'蚊負蟻運',
-u'溫故知新',
-u'文官不愛錢武官不怕死',
-u'問官答花',
-u'文過其實',
-u'文過飾非',
-u'文過遂非',
-u'聞過則喜',
-u'問寒問暖',
-u'聞雞起舞',
-u'文奸濟惡',
-u'文江學海',
-u'蚊睫之蟲',
-u'刎勁之交',
-u'文經武略',
-u'文經武緯',
-u'刎胫之交',
-u'文君司馬',
-u'文君新寡',
-u'文君新醮',
-u'文婪武嬉',
-u'聞雷失箸',
-u'文理不通',
-u'蚊力負山',
-u'文理俱惬',
-u'溫良恭儉讓',
-u'問柳評花',
-u'問柳尋花',
-u'問碌碌地時如何',
-u'蚊虻之勞',
-u'聞名不如見面',
-u'聞名喪膽',
-u'聞名遐迩',
-u'問牛知馬',
-u'文期酒會',
-u'文齊武不齊',
-u'溫衾扇枕',
-u'問寝視膳',
-u'文情并茂',
-u'溫凊定省',
-u'溫情蜜意',
-u'溫情脈脈',
-u'文人墨客',
-u'文人墨士',
-u'文人無行',
-u'文人相輕',
-u'文人學士',
-u'聞融敦厚',
-u'溫柔敦厚',
-u'文如其人',
-u'穩如泰山',
-u'蚊蚋負山',
-u'溫潤而澤',
-u'文弱書生',
-u'文山會海',
-u'問舍求田',
-u'文身斷發',
-u'文身剪發',
-u'文深網密',
-u'溫生絕裾',
-u'聞聲相思',
-u'問事不知',
-u'問十道百',
-u'溫水煮青蛙',
-u'溫水煮蛙',
-u'文絲不動',
-u'文似看山不喜平',
-u'文似其人',
-u'文思泉湧',
-u'聞所不聞',
-u'聞所未聞',
-u'文韬武略',
-u'文韬武韬',
-u'問天買卦',
-u'文恬武嬉',
-u'文通殘錦',
-u'溫文爾雅',
-u'溫文儒雅',
-u'文武差事',
-u'文無加點',
-u'文武兼備',
-u'文武全才',
-u'文武雙全',
-u'文武之道',
-u'文武之道一張一弛',
-u'溫席扇枕',
-u'聞弦歌而知雅意',
-u'溫香豔玉',
-u'問心無愧',
-u'文行出處',
-u'文星高照',
-u'文修武備',
-u'文修武偃',
-u'汶陽田反',
-u'問羊知馬',
-u'聞噎廢食',
-u'問一答十',
-u'文以載道',
-u'聞一知二',
-u'聞一知十',
-u'文語轉換',
-u'文圓質方',
-u'穩紮穩打',
-u'文昭武穆',
-u'聞者足戒',
-u'溫枕扇席',
-u'文質彬彬',
-u'文治武功',
-u'文治武力',
-u'問諸水濱',
-u'文子同升',
-u'文子文孫',
-u'蚊子遭扇打隻爲嘴傷人',
-u'文宗學府',
-u'問罪之師',
-u'穩坐釣魚船',
-u'甕間吏部',
-u'甕盡杯幹',
-u'甕盡杯乾',
-u'甕裏醯雞',
-u'甕聲甕氣',
-u'甕天蠡海',
-u'甕天之見',
-u'甕牖桑樞',
-u'甕牖繩樞',
-u'甕中之鼈',
-u'甕中捉鼈',
-u'甕中捉鼈手到擒來',
-u'卧不安席',
-u'蝸步龜移',
-u'蝸步難移',
-u'卧床不起',
-u'握發吐哺',
-u'握發吐餐',
-u'握發吐飧',
-u'握風捕影',
-u'我負子戴',
-u'我黼子佩',
-u'握綱提領',
-u'卧虎藏龍',
-u'窩火憋氣',
-u'我見白頭喜',
-u'我見猶憐',
-u'蝸角虛名',
-u'蝸角蠅頭',
-u'蝸角之論',
-u'蝸角之争',
-u'蝸居蟻蛭',
-u'蝸利蠅名',
-u'渦流旋龜',
-u'蝸名微利',
-u'蝸名蠅利',
-u'握鉛抱椠',
-u'握拳透掌',
-u'握拳透爪',
-u'蝸舍荊扉',
-u'握蛇騎虎',
-u'握石護手',
-u'握手言歡',
-u'握粟出蔔',
-u'握素懷鉛',
-u'握素披黃',
-u'卧榻鼾睡',
-u'卧榻之側豈容他人鼾睡',
-u'卧榻之旁',
-u'卧榻之旁豈容他人鼾睡',
-u'卧榻之上',
-u'卧榻之上豈容他人鼾睡',
-u'握炭流湯',
-u'窩停主人',
-u'我爲魚肉',
-u'握霧拏雲',
-u'我武惟揚',
-u'卧薪嘗膽',
-u'卧薪嘗糁',
-u'我心如秤',
-u'蝸行牛步',
-u'我行我素',
-u'卧雪眠霜',
-u'卧雪吞氈',
-u'沃野千裏',
-u'喔咿嚅唲',
-u'我有筆和刀',
-u'握瑜懷瑾',
-u'握瑜懷玉',
-u'握雨攜雲',
-u'握雲拿霧',
-u'我醉欲眠',
-u'霧暗雲深',
-u'烏白馬角',
-u'五百年前是一家',
-u'無般不識',
-u'無背無側',
-u'務本抑末',
-u'無本之木',
-u'無崩地裂',
-u'無比惡臭',
-u'舞筆弄文',
-u'舞弊營私',
-u'無邊風月',
-u'無邊無際',
-u'無邊無沿',
-u'無邊無垠',
-u'霧鬓風鬟',
-u'霧鬓雲鬟',
-u'無病呻吟',
-u'無病一身輕',
-u'無病自灸',
-u'無病自炙',
-u'五步成詩',
-u'物不平則鳴',
-u'惡不去善',
-u'武不善作',
-u'無補于事',
-u'五彩缤紛',
-u'霧慘雲愁',
-u'五藏六府',
-u'無腸公子',
-u'無腸可斷',
-u'武昌剩竹',
-u'五車腹笥',
-u'五車之書',
-u'五尺豎子',
-u'五尺童子',
-u'五尺之僮',
-u'無恥之尤',
-u'無出其右',
-u'舞詞弄劄',
-u'無從置喙',
-u'烏踆兔走',
-u'無大不大',
-u'五大三粗',
-u'無大無小',
-u'誤打誤撞',
-u'吳帶當風',
-u'無待蓍龜',
-u'勿怠勿忘',
-u'無黨無偏',
-u'舞刀躍馬',
-u'無德而稱',
-u'無的放矢',
-u'無地可容',
-u'五帝三王',
-u'無敵天下',
-u'無适無莫',
-u'無敵于天下',
-u'無地自處',
-u'無地自厝',
-u'無地自容',
-u'五典三墳',
-u'無顛無倒',
-u'五鼎萬鍾',
-u'五鼎一肴',
-u'無冬曆夏',
-u'五冬六夏',
-u'無動爲大',
-u'無冬無夏',
-u'無動于衷',
-u'舞動之藤',
-u'五鬥解酲',
-u'五都望重',
-u'五鬥折腰',
-u'無毒不丈',
-u'無毒不丈夫',
-u'五毒俱全',
-u'無獨有偶',
-u'五短身材',
-u'無端生事',
-u'武斷鄉曲',
-u'武斷專橫',
-u'無惡不爲',
-u'無惡不造',
-u'無惡不作',
-u'無法無天',
-u'五方雜處',
-u'五方雜厝',
-u'無方之民',
-u'烏飛兔走',
-u'五分明兒',
-u'無風不起浪',
-u'舞鳳飛龍',
-u'無風起浪',
-u'無風三尺浪',
-u'無風生浪',
-u'五風十雨',
-u'無風樹不響',
-u'無縫天衣',
-u'無風揚波',
-u'梧鳳之鳴',
-u'無風作浪',
-u'物腐蟲生',
-u'誤付洪喬',
-u'碔砆混玉',
-u'五福臨門',
-u'物阜民安',
-u'物阜民豐',
-u'物阜民康',
-u'五福骈臻',
-u'無福傷己',
-u'無父無君',
-u'無服之喪',
-u'無服之殇',
-u'物幹風燥火易發',
-u'物幹風燥火易起',
-u'物幹風燥火易生',
-u'誣告加三等',
-u'霧閣雲窗',
-u'無根而固',
-u'無根無蒂',
-u'無根之木無源之水',
-u'五更侵早起更有早行人',
-u'五更三點',
-u'無功而祿',
-u'無功受祿',
-u'無功受祿寝食不安',
-u'無古不成今',
-u'五谷不分',
-u'五谷不升',
-u'五羖大夫',
-u'五谷豐登',
-u'五谷豐稔',
-u'五谷豐熟',
-u'無故呻吟',
-u'巫蠱之獄',
-u'無挂無礙',
-u'無關大局',
-u'無關大體',
-u'無關宏旨',
-u'無關緊要',
-u'無關痛癢',
-u'無官一身輕',
-u'五光十色',
-u'五鬼鬧判',
-u'物歸原主',
-u'誤國殃民',
-u'五行八作',
-u'五行并下',
-u'五合六聚',
-u'無何有鄉',
-u'無何有之鄉',
-u'烏合之衆',
-u'烏黑骨棒',
-u'烏黑面具',
-u'五侯七貴',
-u'嗚呼哀哉',
-u'無乎不可',
-u'五湖四海',
-u'嗚呼噫嘻',
-u'五花八門',
-u'五花繃裂',
-u'五花爨弄',
-u'五花大綁',
-u'五花度牒',
-u'五花官诰',
-u'五花殺馬',
-u'物華天寶',
-u'物換星移',
-u'無謊不成媒',
-u'五黃六月',
-u'無毀無譽',
-u'物極必返',
-u'物極将返',
-u'無機可乘',
-u'無計可奈',
-u'無迹可求',
-u'無計可施',
-u'無迹可尋',
-u'五脊六獸',
-u'無計奈何',
-u'無忌披風',
-u'無計所奈',
-u'無濟于事',
-u'霧集雲合',
-u'霧集雲散',
-u'物極則反',
-u'烏集之交',
-u'無稽之談',
-u'無籍之徒',
-u'無稽之言',
-u'烏集之衆',
-u'無假不成真',
-u'無家可奔',
-u'無家可歸',
-u'無家無室',
-u'無價之寶',
-u'無堅不摧',
-u'無堅不陷',
-u'無間冬夏',
-u'無間可乘',
-u'無間可伺',
-u'無間是非',
-u'無疆之休',
-u'烏焦巴弓',
-u'無噍類矣',
-u'五角六張',
-u'物盡其用',
-u'無盡無窮',
-u'無盡無休',
-u'無盡之杯',
-u'無盡之海',
-u'無精打采',
-u'無胫而來',
-u'無胫而行',
-u'無胫而至',
-u'無胫而走',
-u'五經鼓吹',
-u'五經刻石',
-u'五經魁首',
-u'五經掃地',
-u'五經四書',
-u'物競天擇',
-u'五經無雙',
-u'無酒不成歡',
-u'無酒不成宴',
-u'無舊無新',
-u'無咎無譽',
-u'無拘無礙',
-u'無拘無縛',
-u'無拘無束',
-u'惡居下流',
-u'武爵武任',
-u'無可比倫',
-u'無可比拟',
-u'無可比象',
-u'無可不可',
-u'無可非議',
-u'無可奉告',
-u'無可估量',
-u'無可厚非',
-u'無可諱言',
-u'無可救藥',
-u'無可名狀',
-u'無可奈何',
-u'無可奈何花落去',
-u'無可匹敵',
-u'無可無不可',
-u'無可争辯',
-u'無可置辯',
-u'無可置喙',
-u'無可置疑',
-u'無孔不入',
-u'無孔不鑽',
-u'無寇暴死',
-u'無愧衾影',
-u'五勞七傷',
-u'無了無休',
-u'五雷轟頂',
-u'無理辯三分',
-u'無理不可争',
-u'無力沖鋒',
-u'無理而妙',
-u'霧裏看花',
-u'霧裏看花終隔一層',
-u'無理取鬧',
-u'五裏霧中',
-u'物離鄉貴',
-u'無立錐之地',
-u'無立足之地',
-u'無力詛咒',
-u'誣良爲盜',
-u'無了根蒂',
-u'霧鱗雲爪',
-u'五陵豪氣',
-u'五陵年少',
-u'五陵少年',
-u'五陵英少',
-u'屋漏更遭連年雨',
-u'屋漏偏逢雨',
-u'無慮無思',
-u'無慮無憂',
-u'五馬分屍',
-u'無毛大蟲',
-u'物美價廉',
-u'寤寐求之',
-u'吾麋何在',
-u'無米之炊',
-u'烏面鹄形',
-u'無面目見江東父老',
-u'無眠之骨',
-u'無名火氣',
-u'無冥冥之志者',
-u'無名孽火',
-u'無明無夜',
-u'無名小輩',
-u'無名小卒',
-u'無明業火',
-u'無明業火三千丈',
-u'五男二女',
-u'五内皆崩',
-u'五内俱崩',
-u'五内如焚',
-u'無能爲力',
-u'無能爲役',
-u'烏鳥私情',
-u'吳牛喘月',
-u'舞弄文墨',
-u'捂盤惜售',
-u'無偏無陂',
-u'無偏無黨',
-u'無偏無頗',
-u'無偏無倚',
-u'無平不頗',
-u'烏七八糟',
-u'無奇不有',
-u'五氣朝元',
-u'霧氣海岸',
-u'霧氣湖岸',
-u'無其倫比',
-u'無其奈何',
-u'霧氣平原',
-u'霧起雲湧',
-u'無千待萬',
-u'無錢方斷酒',
-u'無錢堪買金',
-u'無牽無挂',
-u'無千無萬',
-u'無錢休入衆',
-u'無錢語不真',
-u'五搶六奪',
-u'無巧不成話',
-u'無巧不成書',
-u'五親六眷',
-u'無親無故',
-u'無窮無盡',
-u'無求到處人情好',
-u'無拳無勇',
-u'五雀六燕',
-u'舞裙歌扇',
-u'無人問津',
-u'誤認顔标',
-u'無人之地',
-u'無人之境',
-u'無任之祿',
-u'誤人子弟',
-u'無日不歌',
-u'五日京兆',
-u'五日一石',
-u'無容身之地',
-u'無如奈何',
-u'誤入歧途',
-u'屋如七星',
-u'無如之何',
-u'無如之奈',
-u'烏睿之石',
-u'霧散雲披',
-u'五色缤紛',
-u'無色不歡',
-u'五色亂目',
-u'五色無主',
-u'五色相宣',
-u'五色祥雲',
-u'舞衫歌扇',
-u'巫山雲雨',
-u'無傷大體',
-u'無傷大雅',
-u'屋上建瓴',
-u'物傷其類',
-u'無傷無臭',
-u'屋舍俨然',
-u'五申三令',
-u'無聲無色',
-u'無聲無息',
-u'無聲無臭',
-u'無聲消退',
-u'霧釋冰融',
-u'無事不登三寶殿',
-u'無施不可',
-u'無施不效',
-u'五十步笑百步',
-u'吳市吹箫',
-u'五十将來尋死路',
-u'無勢可乘',
-u'五石六鹢',
-u'五世其昌',
-u'舞獅氣球',
-u'物是人非',
-u'無事生非',
-u'無事生風',
-u'無事生事',
-u'無時無刻',
-u'無始無終',
-u'五十衣帛',
-u'勿施于人',
-u'無事早歸',
-u'吳市之箫',
-u'無師自通',
-u'污手垢面',
-u'梧鼠技窮',
-u'梧鼠五技',
-u'無束無拘',
-u'梧鼠之技',
-u'吾誰與歸',
-u'無死鎖性',
-u'無思無慮',
-u'無私有弊',
-u'無絲有線',
-u'無私有意',
-u'無私之光',
-u'無損分解',
-u'無損聯結',
-u'無損壓縮',
-u'無所不包',
-u'無所不備',
-u'無所不到',
-u'無所不及',
-u'無所不盡其極',
-u'無所不可',
-u'無所不能',
-u'無所不容',
-u'無所不通',
-u'無所不爲',
-u'無所不曉',
-u'無所不諧',
-u'無所不用其極',
-u'無所不有',
-u'無所不悅',
-u'無所不在',
-u'無所不至',
-u'無所不作',
-u'無所成名',
-u'無所措手',
-u'無所措手足',
-u'無所顧憚',
-u'無所顧忌',
-u'無所回避',
-u'無所忌憚',
-u'無所忌諱',
-u'無所可否',
-u'無所牽挂',
-u'無所容心',
-u'無所适從',
-u'無所施其技',
-u'無所事事',
-u'無所畏憚',
-u'無所畏忌',
-u'無所畏懼',
-u'霧鎖煙迷',
-u'無所依歸',
-u'無所用心',
-u'無所用之',
-u'無所重輕',
-u'無所作爲',
-u'五體投誠',
-u'五體投地',
-u'烏天黑地',
-u'無忝所生',
-u'無天無日',
-u'無天于上無地于下',
-u'梧桐斷角',
-u'梧桐一葉落',
-u'烏頭白馬生角',
-u'吳頭楚尾',
-u'無頭告示',
-u'烏頭馬角',
-u'無頭無尾',
-u'無萬大千',
-u'無往不複',
-u'無往不克',
-u'無往不利',
-u'無往不勝',
-u'勿忘在莒',
-u'無妄之福',
-u'無妄之禍',
-u'無妄之憂',
-u'無妄之災',
-u'無微不至',
-u'無爲而成',
-u'無爲而治',
-u'五味俱全',
-u'五位君臣',
-u'物位開關',
-u'無爲牛後',
-u'無威望者',
-u'勿謂言之不預也',
-u'無爲之治',
-u'無爲自成',
-u'無爲自化',
-u'舞文弄法',
-u'舞文弄墨',
-u'舞文巧诋',
-u'舞文飾智',
-u'舞文玩法',
-u'惡惡從短',
-u'屋烏推愛',
-u'物物相克',
-u'屋烏之愛',
-u'無隙可乘',
-u'吾膝如鐵',
-u'物稀爲貴',
-u'無息指環',
-u'吳下阿蒙',
-u'無下筆處',
-u'屋下架屋',
-u'無下箸處',
-u'屋下作屋',
-u'無限的忿激',
-u'無限朱門生餓殍',
-u'無相無作',
-u'無效信元',
-u'舞榭歌樓',
-u'舞榭歌台',
-u'無懈可擊',
-u'無心插柳柳成蔭',
-u'五心六意',
-u'五行不是這題目',
-u'五行俱下',
-u'五行四柱',
-u'無形無影',
-u'五行有救',
-u'霧興雲湧',
-u'無形之罪',
-u'無兄盜嫂',
-u'無休無了',
-u'五虛六耗',
-u'無鹽不解淡',
-u'五言長城',
-u'烏焉成馬',
-u'五言金城',
-u'無言可對',
-u'五顔六色',
-u'屋檐水滴三分雨',
-u'武偃文修',
-u'無言以對',
-u'烏煙瘴氣',
-u'勿藥而愈',
-u'午夜釘錘',
-u'午夜之霧',
-u'無一不備',
-u'無一不精',
-u'無一不知',
-u'武藝超群',
-u'勿以惡小而爲之',
-u'無翼而飛',
-u'物議沸騰',
-u'無以複加',
-u'五一國際勞動節',
-u'無一可取',
-u'無衣懶出門',
-u'物以類聚',
-u'物以類聚人以群分',
-u'五一六通知',
-u'物以群分',
-u'無以塞責',
-u'勿以善小而不爲',
-u'無依無靠',
-u'物以希爲貴',
-u'無衣之賦',
-u'無義之人不可交',
-u'五音六律',
-u'物殷俗阜',
-u'無影無形',
-u'無影無蹤',
-u'無庸諱言',
-u'無用武之地',
-u'霧湧雲蒸',
-u'無庸置辯',
-u'無庸置疑',
-u'無庸贅述',
-u'無幽不燭',
-u'無憂愁太平時務',
-u'無憂寒潭',
-u'無有倫比',
-u'無憂無慮',
-u'無尤無怨',
-u'烏有先生',
-u'無憂小道',
-u'無與比倫',
-u'無與倫比',
-u'無與爲比',
-u'無魚蝦也好',
-u'污淤之池',
-u'無欲之地',
-u'無遠不屆',
-u'無源底闆',
-u'無遠弗屆',
-u'無怨無德',
-u'無緣無故',
-u'無源之水',
-u'無源之水無本之末',
-u'無源之水無本之木',
-u'無月不登樓',
-u'五月飛霜',
-u'五月披裘',
-u'五嶽四渎',
-u'五月粜新谷',
-u'吳越同舟',
-u'巫雲楚雨',
-u'五蘊皆空',
-u'物在人亡',
-u'五髒俱全',
-u'五髒六腑',
-u'無則加勉',
-u'惡則墜諸淵',
-u'無債一身輕',
-u'舞爪張牙',
-u'無遮大會',
-u'無針不引線',
-u'無征不信',
-u'無知必無能',
-u'五指費瑪',
-u'無知妄說',
-u'無知妄作',
-u'五知先生',
-u'惡之欲其死',
-u'物至則反',
-u'無置錐地',
-u'無中生有',
-u'五洲四海',
-u'無晝無夜',
-u'污濁嚎叫',
-u'污濁之魂',
-u'五字成語',
-u'五字成語大全',
-u'五子登科',
-u'惡紫奪朱',
-u'吾自有處',
-u'無蹤無影',
-u'無宗下铠',
-u'無足輕重',
-u'無足重輕',
-u'惡醉強酒',
-u'誤作非爲',
-u'析辨詭詞',
-u'洗兵牧馬',
-u'席不暇栗',
-u'席不暇暖',
-u'喜不自勝',
-u'戲彩娛親',
-u'西疇堕淚',
-u'西除東蕩',
-u'喜出望外',
-u'西出陽關無故人',
-u'西窗話雨',
-u'西窗剪燭',
-u'喜從天降',
-u'細大不捐',
-u'隙大牆壞',
-u'席地而坐',
-u'席地幕天',
-u'戲蝶遊蜂',
-u'犀頂龜文',
-u'洗耳恭聽',
-u'西方淨國',
-u'西方淨土',
-u'西方聖人',
-u'習非成是',
-u'系風捕景',
-u'系風捕影',
-u'西風殘照',
-u'西風落葉',
-u'席豐履厚',
-u'吸風飲露',
-u'鼷腹鹪枝',
-u'析肝刿膽',
-u'析肝瀝悃',
-u'析肝吐膽',
-u'洗垢匿瑕',
-u'洗垢求瘢',
-u'洗垢求瑕',
-u'洗垢索瘢',
-u'習故安常',
-u'襲故蹈常',
-u'析骨而炊',
-u'析骨以爨',
-u'西瓜偎大邊',
-u'習慣成自然',
-u'析圭儋爵',
-u'析圭分土',
-u'析圭分組',
-u'析珪判野',
-u'析珪胙土',
-u'析骸以爨',
-u'析骸易子',
-u'析毫剖厘',
-u'析毫剖芒',
-u'羲和馭日',
-u'西河之痛',
-u'惜花須檢點',
-u'羲皇上人',
-u'喜獲麟兒',
-u'息迹靜處',
-u'醯雞甕裏',
-u'喜見于色',
-u'析疆增吏',
-u'息交絕遊',
-u'析交離親',
-u'洗腳怕丢财',
-u'西赆南琛',
-u'洗盡鉛華呈素姿',
-u'洗頸就戮',
-u'析精剖微',
-u'洗淨鉛華',
-u'系頸阙娣',
-u'席卷八荒',
-u'席卷而逃',
-u'席卷天下',
-u'戲靠故事奇',
-u'戲靠故事新',
-u'戲靠一身衣',
-u'惜客好義',
-u'熙來攘往',
-u'惜老憐貧',
-u'西鄰責言',
-u'溪流護甲',
-u'犀顱玉頰',
-u'析律貳端',
-u'析縷分條',
-u'席履豐厚',
-u'析律舞文',
-u'系馬埋輪',
-u'晰毛辨發',
-u'西眉南臉',
-u'洗眉刷目',
-u'夕寐宵興',
-u'喜眉笑眼',
-u'西門吹水',
-u'席門蓬巷',
-u'席門窮巷',
-u'惜墨如金',
-u'徙木之信',
-u'犀牛望月',
-u'喜怒哀樂',
-u'喜怒不形于色',
-u'喜怒人之常情',
-u'息怒停瞋',
-u'喜怒無常',
-u'西諾鴉巢',
-u'嘻皮涎臉',
-u'嘻皮笑臉',
-u'西颦東效',
-u'希奇古怪',
-u'喜氣鼠鼠',
-u'喜氣洋洋',
-u'阋牆谇帚',
-u'阋牆禦侮',
-u'阋牆之禍',
-u'阋牆之争',
-u'息黥補劓',
-u'戲曲中的節拍',
-u'西泉要塞',
-u'息卻雷霆之怒',
-u'犀燃燭照',
-u'襲人故智',
-u'西山餓夫',
-u'西山日薄',
-u'西山日迫',
-u'西山外經',
-u'西山語錄',
-u'徙善遠罪',
-u'喜上眉梢',
-u'席上之珍',
-u'郤诜丹桂',
-u'郤诜高第',
-u'西食東眠',
-u'息事寧人',
-u'西施捧心',
-u'西施颦眉',
-u'昔時賢文',
-u'希世之寶',
-u'希世之才',
-u'希世之珍',
-u'洗手不幹',
-u'洗手奉公',
-u'洗手奉職',
-u'稀疏數據',
-u'鼷鼠飲河',
-u'悉帥敝賦',
-u'細水長流',
-u'細思可精',
-u'習俗移性',
-u'洗髓伐毛',
-u'悉索敝賦',
-u'悉索薄賦',
-u'西台痛哭',
-u'夕惕若厲',
-u'夕惕朝乾',
-u'蹊田奪牛',
-u'西天取經',
-u'系統命令解釋程序',
-u'系統資源管理程序',
-u'西歪東倒',
-u'析微察異',
-u'細微末節',
-u'戲文好歹',
-u'喜聞樂見',
-u'舄烏虎帝',
-u'栖栖皇皇',
-u'熙熙壤壤',
-u'熙熙融融',
-u'息息相關',
-u'息息相通',
-u'惜香憐玉',
-u'嘻笑怒罵',
-u'嬉笑怒罵皆成文章',
-u'喜笑顔開',
-u'洗心滌慮',
-u'洗心革面',
-u'洗心換骨',
-u'洗心回面',
-u'徙薪曲突',
-u'吸新吐故',
-u'喜新厭故',
-u'喜新厭舊',
-u'析薪養馬',
-u'席薪枕塊',
-u'膝行而前',
-u'膝行蒲伏',
-u'喜行于色',
-u'膝行肘步',
-u'洗雪逋負',
-u'隙穴之窺',
-u'習焉不察',
-u'析言破律',
-u'膝癢搔背',
-u'夕陽西下',
-u'夕陽餘晖',
-u'習以成俗',
-u'析疑匡謬',
-u'喜溢眉梢',
-u'習以爲常',
-u'西幽蘭谷',
-u'惜玉憐香',
-u'膝語蛇行',
-u'細雨微風',
-u'習與性成',
-u'喜躍抃舞',
-u'徙宅忘妻',
-u'犀照牛渚',
-u'席珍待聘',
-u'細針密縷',
-u'希旨承顔',
-u'細枝末節',
-u'惜指失掌',
-u'西州之痛',
-u'喜逐顔開',
-u'西裝革履',
-u'洗濯磨淬',
-u'西子捧心',
-u'惜字如金',
-u'下阪走丸',
-u'下筆成篇',
-u'下筆成文',
-u'下筆成章',
-u'下筆千言',
-u'下筆千言離題萬裏',
-u'下筆如神',
-u'下筆如有神',
-u'下筆有神',
-u'下比有餘',
-u'蝦兵蟹将',
-u'下不爲例',
-u'瑕不掩瑜',
-u'下不着地',
-u'瑕不自掩',
-u'下車泣罪',
-u'下車伊始',
-u'下車之始',
-u'下車作威',
-u'下乘之才',
-u'夏蟲不可以語冰',
-u'夏蟲不可語冰',
-u'呷醋節帥',
-u'吓得三魂掉了二魂',
-u'夏鼎商彜',
-u'下毒高手',
-u'遐迩聞名',
-u'遐迩一體',
-u'遐迩著聞',
-u'遐方絕壤',
-u'遐方絕域',
-u'俠肝義膽',
-u'霞光萬道',
-u'柙虎樊熊',
-u'蝦荒蟹亂',
-u'下回分解',
-u'匣劍帷燈',
-u'下降時間',
-u'呷緊弄破碗',
-u'下井投石',
-u'下裏巴人',
-u'匣裏龍吟',
-u'下陵上替',
-u'夏爐冬扇',
-u'狹路相逢',
-u'狹路相逢勇者勝',
-u'下落不明',
-u'下馬馮婦',
-u'下馬看花',
-u'瞎馬臨池',
-u'瞎貓碰見了死耗子',
-u'霞明玉映',
-u'下氣怡色',
-u'下氣怡聲',
-u'下喬木入幽谷',
-u'下喬遷谷',
-u'下喬入幽',
-u'下情不能上達',
-u'下情上達',
-u'霞裙月帔',
-u'夏熱握火',
-u'夏日可畏',
-u'夏日炎炎',
-u'下塞上聾',
-u'霞思天想',
-u'霞思雲想',
-u'霞天樂團',
-u'霞蔚雲蒸',
-u'下無插針之地',
-u'夏五郭公',
-u'下無立錐之地',
-u'下無卓錐',
-u'蝦蟹荒亂',
-u'下行鏈路',
-u'下學上達',
-u'霞友雲朋',
-u'下愚不移',
-u'瑕瑜互見',
-u'夏雨雨人',
-u'下者未必愚',
-u'狎雉馴童',
-u'遐州僻壤',
-u'下逐客令',
-u'下自成蹊',
-u'瞎子點燈白費蠟',
-u'瞎字兒也不識',
-u'瞎子摸象',
-u'瞎子摸魚',
-u'霞姿月韻',
-u'銜悲茹恨',
-u'鮮蹦活跳',
-u'閑曹冷局',
-u'嫌長道短',
-u'現場可編程門陣列',
-u'鮮車健馬',
-u'鮮車怒馬',
-u'纖塵不染',
-u'閑愁萬種',
-u'先從隗始',
-u'銜膽栖冰',
-u'先得我心',
-u'先睹爲快',
-u'先斷後聞',
-u'弦斷有餘音',
-u'顯而易見',
-u'先發制人',
-u'閑非閑是',
-u'鹹風蛋雨',
-u'仙風道格',
-u'仙風道骨',
-u'仙風道氣',
-u'掀風鼓浪',
-u'賢婦令夫貴',
-u'先公後私',
-u'縣官不如現管',
-u'嫌好道歹',
-u'嫌好道惡',
-u'嫌好道歉',
-u'先号後慶',
-u'先号後笑',
-u'先河後海',
-u'先花後果',
-u'銜華佩實',
-u'閑花野草',
-u'銜環結草',
-u'先嫁由爹娘後嫁由自己',
-u'閑見層出',
-u'先見之明',
-u'纖芥之疾',
-u'銜橛之變',
-u'銜橛之虞',
-u'獻可替否',
-u'鮮克有終',
-u'先禮後兵',
-u'鮮廉寡恥',
-u'涎臉饧眼',
-u'涎臉涎皮',
-u'賢良方正',
-u'仙露明珠',
-u'顯露頭角',
-u'陷落計中',
-u'挦毛搗鬓',
-u'涎眉鄧眼',
-u'銜枚疾走',
-u'鮮眉亮眼',
-u'挦綿扯絮',
-u'賢母良妻',
-u'先難後獲',
-u'賢女敬夫',
-u'閑鷗野鹭',
-u'涎皮賴臉',
-u'涎皮涎臉',
-u'藓皮沼澤',
-u'嫌貧愛富',
-u'獻曝之忱',
-u'賢妻良母',
-u'現錢買現貨',
-u'先親後不改',
-u'顯親揚名',
-u'閑情別緻',
-u'閑情逸趣',
-u'閑情逸緻',
-u'先驅蝼蟻',
-u'掀拳裸袖',
-u'掀髯一粲',
-u'先人後己',
-u'陷入僵局',
-u'先入爲主',
-u'先入者爲主',
-u'先入之見',
-u'銜沙填海',
-u'仙山樓閣',
-u'顯山露水',
-u'仙山瓊閣',
-u'賢身貴體',
-u'陷身囹圄',
-u'現身說法',
-u'閑神野鬼',
-u'先聲奪人',
-u'先聲後實',
-u'閑時不燒香',
-u'閑時不燒香急來抱佛腳',
-u'銜石填海',
-u'現世現報',
-u'閑是閑非',
-u'閑事休管',
-u'閑時做下忙時用',
-u'先說斷後不亂',
-u'見素抱樸',
-u'獻替可否',
-u'先天不足',
-u'掀天動地',
-u'掀天揭地',
-u'掀天斡地',
-u'先天下之憂而憂',
-u'弦外有音',
-u'弦外之響',
-u'弦外之意',
-u'弦外之音',
-u'顯微闡幽',
-u'鮮爲人知',
-u'銜尾相随',
-u'鹹五登三',
-u'弦無虛發',
-u'先悉必具',
-u'纖悉無遺',
-u'先下米先吃飯',
-u'先下手爲強',
-u'賢賢易色',
-u'險象環生',
-u'先笑後号',
-u'先小人後君子',
-u'閑邪存誠',
-u'顯姓揚名',
-u'閑言長語',
-u'閑言淡語',
-u'鮮豔奪目',
-u'閑言冷語',
-u'閑言亂語',
-u'閑言潑語',
-u'閑言碎語',
-u'閑言閑事',
-u'閑言閑語',
-u'閑言贅語',
-u'鹹陽一炬',
-u'仙液瓊漿',
-u'先意承顔',
-u'先意承志',
-u'鮮衣良馬',
-u'鮮衣美食',
-u'鮮衣怒馬',
-u'先意希旨',
-u'先憂後樂',
-u'鹹有一德',
-u'鹹魚淡肉',
-u'銜玉賈石',
-u'陷于缧绁',
-u'涎玉沫珠',
-u'鹹與惟新',
-u'銜冤負屈',
-u'閑雲孤鶴',
-u'閑雲野鶴',
-u'閑雜人等',
-u'險遭不測',
-u'先斬後奏',
-u'挦章撦句',
-u'憲章文武',
-u'賢者墓碑',
-u'先知先覺',
-u'現鍾不打',
-u'現鍾不打去打鑄鍾',
-u'現鍾弗打',
-u'先自隗始',
-u'仙姿佚貌',
-u'仙姿玉貌',
-u'仙姿玉色',
-u'仙姿玉質',
-u'險阻艱難',
-u'跣足科頭',
-u'顯祖榮宗',
-u'顯祖揚名',
-u'顯祖揚宗',
-u'鹹嘴淡舌',
-u'纖嘴奇足',
-u'相安無事',
-u'相安相受',
-u'項背相望',
-u'向壁虛構',
-u'向壁虛造',
-u'香草美人',
-u'相差無幾',
-u'香車寶馬',
-u'響徹雲表',
-u'響徹雲際',
-u'響徹雲霄',
-u'相持不下',
-u'象齒焚身',
-u'響答影随',
-u'相待如賓',
-u'相得甚歡',
-u'相得益彰',
-u'相對無言',
-u'像剁了尾巴的猴兒',
-u'響遏行雲',
-u'香餌之下必有死魚',
-u'香餌之下死魚多',
-u'橡飯菁羹',
-u'相反相成',
-u'相逢不飲空歸去',
-u'相逢除非夢中見',
-u'相逢好似初相識',
-u'相逢恨晚',
-u'向風慕義',
-u'祥風慶雲',
-u'祥風時雨',
-u'相逢狹路',
-u'相輔而行',
-u'相輔相成',
-u'象耕鳥耘',
-u'相顧失色',
-u'相關分析獨立生成',
-u'香閨繡閣',
-u'響和景從',
-u'香花供養',
-u'香火不絕',
-u'香火鼎盛',
-u'向火乞兒',
-u'香火因緣',
-u'相火治之',
-u'相機而動',
-u'相機行事',
-u'相見不如初',
-u'相煎何急',
-u'相見恨晚',
-u'相見時難別亦難',
-u'相煎太急',
-u'象簡烏紗',
-u'相見易得好',
-u'相驚伯有',
-u'相敬如賓',
-u'相克相濟',
-u'鄉利倍義',
-u'鄉裏媽媽拜千佛',
-u'鄉裏之情',
-u'相了一回',
-u'祥麟瑞鳳',
-u'祥麟威鳳',
-u'降龍伏虎',
-u'相論逞英雄',
-u'相貌堂堂',
-u'相門有相',
-u'相門有相将門有将',
-u'像模像樣',
-u'相女配夫',
-u'向平之原',
-u'想前顧後',
-u'相切相磋',
-u'相親相愛',
-u'相去幾何',
-u'相去無幾',
-u'相去懸殊',
-u'像人不像人',
-u'相忍爲國',
-u'相容收斂',
-u'想入非非',
-u'橡茹藿歠',
-u'相濡以沫',
-u'祥瑞輻辏',
-u'向若而歎',
-u'像煞有介事',
-u'向上一路',
-u'向聲背實',
-u'相生相成',
-u'相生相克',
-u'相時而動',
-u'相視而笑',
-u'相視而笑莫逆于心',
-u'相失交臂',
-u'相視莫逆',
-u'鄉書難寄',
-u'相鼠有皮',
-u'相帥成風',
-u'向死而生',
-u'相思入骨',
-u'相提并論',
-u'向天而唾',
-u'想望風采',
-u'想望風褱',
-u'相忘江湖',
-u'相忘形骸',
-u'巷尾街頭',
-u'相習成風',
-u'鄉下夫妻寸步不離',
-u'香象渡河',
-u'香象絕流',
-u'香消玉減',
-u'香消玉碎',
-u'香消玉損',
-u'香消玉殒',
-u'像心稱意',
-u'像心如意',
-u'像心适意',
-u'像心像意',
-u'詳星拜鬥',
-u'像形奪名',
-u'相形見绌',
-u'相形見拙',
-u'相形失色',
-u'相呴相濟',
-u'相呴以濕',
-u'相沿成俗',
-u'相沿成習',
-u'向陽花木易逢春',
-u'向陽花木易爲春',
-u'向陽花木早逢春',
-u'香藥脆梅',
-u'降妖捉怪',
-u'巷議街談',
-u'饷以老拳',
-u'相依爲命',
-u'相因相生',
-u'相映成趣',
-u'向隅而泣',
-u'相與爲一',
-u'祥雲瑞彩',
-u'祥雲瑞氣',
-u'祥徵鳳蔔',
-u'祥徵鳳律',
-u'相知恨晚',
-u'相知有素',
-u'享帚自珍',
-u'象箸玉杯',
-u'相莊如賓',
-u'項莊舞劍',
-u'項莊舞劍意在沛公',
-u'項莊舞劍志在沛公',
-u'項莊之劍志在沛公',
-u'嘯傲風月',
-u'嘯傲湖山',
-u'笑比河清',
-u'笑不可仰',
-u'小不忍則亂大謀',
-u'小材大用',
-u'蕭曹避席',
-u'小懲大誡',
-u'消愁解悶',
-u'消愁釋愦',
-u'小醜跳梁',
-u'小大由之',
-u'小道消息',
-u'小德出入',
-u'小肚雞腸',
-u'小賭怡情',
-u'小恩小惠',
-u'笑而不答',
-u'小二管大王',
-u'小兒之見',
-u'小兒之态',
-u'曉風殘月',
-u'枵腹重趼',
-u'枵腹從公',
-u'枵腹辘辘',
-u'枵腹終朝',
-u'宵旰焦勞',
-u'宵旰圖治',
-u'宵旰憂勞',
-u'宵旰憂勤',
-u'蕭規曹随',
-u'效果疊加',
-u'小國寡民',
-u'崤函之固',
-u'小河有水大河滿',
-u'小戶人家',
-u'小花不結老花兒結',
-u'銷毀骨立',
-u'銷魂蕩魄',
-u'銷魂奪魄',
-u'小火慢炖',
-u'消極怠工',
-u'小己得失',
-u'小雞之怒',
-u'小家碧玉',
-u'小家罕氣',
-u'小家子氣',
-u'小腳女人',
-u'小姐身子丫鬟命',
-u'嘯聚山林',
-u'枭俊禽敵',
-u'小康之家',
-u'笑口常開',
-u'蕭郎陌路',
-u'笑裏藏刀',
-u'小利莫争',
-u'小廉大法',
-u'小廉曲謹',
-u'小臉一拉三尺二',
-u'小鹿觸心頭',
-u'小橹渡大洋',
-u'小亂避城大亂避鄉',
-u'淆亂視聽',
-u'嘯侶命俦',
-u'笑罵由他笑罵',
-u'笑面夜叉',
-u'鸮鳴鼠暴',
-u'鸮鳥生翼',
-u'小鳥依人',
-u'效颦學步',
-u'小器易盈',
-u'小錢不去大錢不來',
-u'蕭牆禍起',
-u'蕭牆之禍',
-u'小巧玲珑',
-u'小怯大勇',
-u'小屈大伸',
-u'效犬馬力',
-u'蕭然物外',
-u'霄壤之別',
-u'霄壤之殊',
-u'小人得勢君子危',
-u'小人得志',
-u'小人窮斯濫也',
-u'小人日親君子日遠',
-u'笑容可掬',
-u'笑容滿面',
-u'潇灑風流',
-u'箫韶九成',
-u'枭蛇鬼怪',
-u'銷神流志',
-u'銷聲避影',
-u'銷聲斂迹',
-u'消聲滅迹',
-u'銷聲匿迹',
-u'銷聲匿影',
-u'小事成大',
-u'消失殆盡',
-u'小試鋒芒',
-u'小事胡塗大事不胡塗',
-u'硝石加速',
-u'消失淨化',
-u'枭視狼顧',
-u'小時了了',
-u'小時是兄弟',
-u'小受大走',
-u'枭獸光環',
-u'枭首示衆',
-u'小手小腳',
-u'枭獸形态',
-u'小樹要砍小孩要管',
-u'孝順官司忤逆道場',
-u'孝思不匮',
-u'效死疆場',
-u'效死輸忠',
-u'效死勿去',
-u'小題大作',
-u'鸮啼鬼嘯',
-u'孝悌力田',
-u'孝悌忠信',
-u'嘯亭續錄',
-u'小往大來',
-u'小枉大直',
-u'小巫見大巫',
-u'小隙沉舟',
-u'消息盈沖',
-u'消息盈虛',
-u'小黠大癡',
-u'哓哓不休',
-u'小小不言',
-u'小小雪兒',
-u'枭心鶴貌',
-u'小心謹慎',
-u'鴞心鹂舌',
-u'小心駛得萬年船',
-u'小心翼翼',
-u'曉行夜宿',
-u'曉行夜住',
-u'敩學相長',
-u'小眼薄皮',
-u'笑顔逐開',
-u'逍遙法外',
-u'逍遙事外',
-u'逍遙物外',
-u'逍遙自得',
-u'逍遙自娛',
-u'逍遙自在',
-u'小異大同',
-u'曉以大義',
-u'宵衣旰食',
-u'曉以利害',
-u'小翼手龍',
-u'枭翼樹叢',
-u'孝義爲先',
-u'笑一笑少一少',
-u'哓音瘏口',
-u'小隐隐于山',
-u'小隐隐于野',
-u'骁勇善戰',
-u'小有小難大有大難',
-u'霄魚垂化',
-u'硝雲彈雨',
-u'嘯吒風雲',
-u'嚣張一時',
-u'笑中藏刀',
-u'孝重千斤日減一斤',
-u'笑逐顔開',
-u'孝子愛日',
-u'孝子慈孫',
-u'小子後生',
-u'孝子順孫',
-u'孝子賢孫',
-u'邪不敵正',
-u'邪不伐正',
-u'邪不犯正',
-u'邪不幹正',
-u'邪不能壓正',
-u'邪不勝正',
-u'邪不壓正',
-u'脅不沾席',
-u'泄底就怕老鄉親',
-u'斜風細雨',
-u'鞋弓襪淺',
-u'鞋弓襪小',
-u'謝館秦樓',
-u'颉颃之行',
-u'邂逅不偶',
-u'邂逅相逢',
-u'邂逅相遇',
-u'謝家寶樹',
-u'謝家活計',
-u'脅肩谄笑',
-u'脅肩低眉',
-u'脅肩低首',
-u'脅肩累足',
-u'絜矩之道',
-u'蟹匡蟬緌',
-u'謝蘭燕桂',
-u'攜老扶弱',
-u'協力齊心',
-u'協力同心',
-u'燮理陰陽',
-u'泄露天機',
-u'邪門歪道',
-u'邪魔怪道',
-u'邪魔外道',
-u'邪魔外祟',
-u'斜目妖蛛',
-u'攜男挈女',
-u'斜飄細濕春郊衣',
-u'脅迫打擊',
-u'脅迫低吼',
-u'斜坡函數',
-u'挾人捉将',
-u'蠍肉大餐',
-u'蟹肉蛋糕',
-u'挾山超海',
-u'偕生之疾',
-u'血石墜子',
-u'攜手合作',
-u'協私罔上',
-u'謝天謝地',
-u'挾天子以令天下',
-u'挾天子以令諸侯',
-u'謝庭蘭玉',
-u'斜頭歪腦',
-u'蠍尾刺猬',
-u'挾細拿粗',
-u'蠍蠍螫螫',
-u'蠍蠍螫螫',
-u'協心戮力',
-u'協心同力',
-u'斜行橫陣',
-u'蟹行文字',
-u'挾翼靈狐',
-u'攜幼扶老',
-u'攜雲握雨',
-u'蠍子屎毒一份',
-u'心安理得',
-u'心謗腹非',
-u'心比天高',
-u'心比鐵石堅',
-u'信筆塗鴉',
-u'心病還得心藥治',
-u'心病還須心藥醫',
-u'心病還需心藥治',
-u'信步而行',
-u'心不兩用',
-u'心不應口',
-u'心不由意',
-u'心不由主',
-u'心不在焉',
-u'心長發短',
-u'心長绠短',
-u'心長力短',
-u'心潮澎湃',
-u'心潮逐浪高',
-u'新陳代謝',
-u'心馳神往',
-u'心馳魏阙',
-u'新仇舊恨',
-u'新春進喜',
-u'心慈面軟',
-u'心慈手軟',
-u'心粗膽大',
-u'心粗氣浮',
-u'心存不軌',
-u'心存濟世',
-u'心存芥蒂',
-u'心存目想',
-u'心存魏阙',
-u'心膽俱裂',
-u'心膽俱碎',
-u'心蕩神迷',
-u'心蕩神搖',
-u'心蕩神怡',
-u'心到神知',
-u'心低意沮',
-u'心動不如行動',
-u'信而好古',
-u'信而有證',
-u'釁發蕭牆',
-u'新發于硎',
-u'心煩技癢',
-u'心煩慮亂',
-u'心煩意亂',
-u'心煩意冗',
-u'心非巷議',
-u'心腹大患',
-u'心服口服',
-u'心浮氣粗',
-u'心浮氣盛',
-u'心浮氣躁',
-u'心服首肯',
-u'心腹之病',
-u'心腹之患',
-u'心腹之疾',
-u'心腹之交',
-u'心腹之憂',
-u'心腹重患',
-u'心甘情原',
-u'心高氣傲',
-u'心各有見',
-u'新故代謝',
-u'新箍馬桶三日香',
-u'新股速遞',
-u'心孤意怯',
-u'心貫白日',
-u'心廣體胖',
-u'薪桂米珠',
-u'心寒膽落',
-u'心寒膽戰',
-u'心狠手毒',
-u'心狠手辣',
-u'心花怒發',
-u'心花怒放',
-u'心懷鬼胎',
-u'心懷叵測',
-u'心懷忐忑',
-u'心慌撩亂',
-u'心慌意急',
-u'心慌意亂',
-u'心灰意敗',
-u'心灰意懶',
-u'心灰意冷',
-u'心回意轉',
-u'新婚不如久別',
-u'新婚宴爾',
-u'心活面軟',
-u'心急吃不了熱包子',
-u'心急吃不了熱豆腐',
-u'心急火燎',
-u'心急如焚',
-u'心急如火',
-u'信及豚魚',
-u'心堅石穿',
-u'心焦火燎',
-u'心焦如焚',
-u'心焦如火',
-u'新近包紮',
-u'薪盡火傳',
-u'薪盡火滅',
-u'心驚膽寒',
-u'心驚膽裂',
-u'心驚膽落',
-u'心驚膽顫',
-u'心驚肉跳',
-u'心驚肉戰',
-u'心旌搖搖',
-u'心旌搖曳',
-u'心境之戒',
-u'心開目明',
-u'心口不一',
-u'信口雌黃',
-u'信口胡言',
-u'信口胡謅',
-u'信口開合',
-u'心口如一',
-u'心口相應',
-u'心寬出少年',
-u'心寬體胖',
-u'心曠神飛',
-u'心曠神恬',
-u'心曠神怡',
-u'心曠神愉',
-u'心辣手狠',
-u'新來乍到',
-u'心勞日拙',
-u'心勞意攘',
-u'心勞意冗',
-u'心力交瘁',
-u'心力衰竭',
-u'心理主體',
-u'心靈長靴',
-u'心靈腐蝕',
-u'心靈集中',
-u'心靈尖嘯',
-u'心靈疲憊',
-u'心靈疲倦',
-u'心領神會',
-u'心領神悟',
-u'心靈視界',
-u'心靈手巧',
-u'心靈撕裂',
-u'心靈碎裂',
-u'心靈探針',
-u'心靈體弱',
-u'心靈性巧',
-u'心領意會',
-u'心靈炸彈',
-u'心靈占蔔',
-u'心靈掌握',
-u'心靈震爆',
-u'心靈震顫',
-u'信令終端',
-u'心靈專注',
-u'心亂如麻',
-u'心膂股肱',
-u'心膂爪牙',
-u'信馬由缰',
-u'心滿意得',
-u'心滿意足',
-u'心滿原足',
-u'心忙意急',
-u'心忙意亂',
-u'心明眼亮',
-u'心摹手追',
-u'心慕手追',
-u'新年進步',
-u'新年幸福',
-u'心凝形釋',
-u'心平氣定',
-u'心平氣和',
-u'釁起蕭牆',
-u'心虔志誠',
-u'心強命不強',
-u'心喬意怯',
-u'心巧嘴乖',
-u'心去難留',
-u'心去意難留',
-u'欣然自得',
-u'釁稔惡盈',
-u'辛壬癸甲',
-u'信人調丢了瓢',
-u'新人新事',
-u'新認知機',
-u'心如刀锉',
-u'心如刀割',
-u'心如刀攪',
-u'心如刀鋸',
-u'心如膏火',
-u'心如槁木',
-u'心如古井',
-u'心如寒灰',
-u'心如火焚',
-u'心如堅石',
-u'心如金石',
-u'心如木石',
-u'心如死灰',
-u'心如鐵石',
-u'心如懸旌',
-u'心如止水',
-u'心若死灰',
-u'信賞必罰',
-u'心上心下',
-u'心神不定',
-u'心神不寧',
-u'心神恍惚',
-u'心事重重',
-u'信誓旦旦',
-u'信守不渝',
-u'信手拈來',
-u'心手相忘',
-u'心手相應',
-u'心術不端',
-u'心術不正',
-u'焮天铄地',
-u'新亭對泣',
-u'心同此理',
-u'心同止水',
-u'心頭鹿撞',
-u'心頭撞鹿',
-u'心頭撞小鹿',
-u'心往神馳',
-u'心問口口問心',
-u'信巫不信醫',
-u'心無二用',
-u'心無挂礙',
-u'心無旁骛',
-u'心細如發',
-u'欣喜若狂',
-u'心細于發',
-u'心閑手敏',
-u'馨香禱祝',
-u'心想事成',
-u'心鄉往之',
-u'心小志大',
-u'心心常似過橋時',
-u'心心念念',
-u'伈伈睍睍',
-u'欣欣向榮',
-u'心心相通',
-u'心心相印',
-u'欣欣自得',
-u'新硎初試',
-u'心雄萬夫',
-u'心胸狹窄',
-u'心緒恍惚',
-u'心緒如麻',
-u'心懸兩地',
-u'心血來潮',
-u'新學小生',
-u'信言不美',
-u'心眼之環',
-u'心癢難撓',
-u'心癢難揉',
-u'心癢難抓',
-u'新益求新',
-u'心逸日休',
-u'心怡神曠',
-u'信以爲真',
-u'心慵意懶',
-u'心有鴻鹄',
-u'心有靈犀一點通',
-u'心有餘而力不足',
-u'心有餘悸',
-u'心餘力绌',
-u'心欲專鑿石穿',
-u'心猿意馬',
-u'心悅誠服',
-u'心悅神怡',
-u'心殒膽落',
-u'心殒膽破',
-u'心在魏阙',
-u'心奓體忕',
-u'心瞻魏阙',
-u'心照不宣',
-u'心照情交',
-u'心照神交',
-u'心正不怕影兒斜',
-u'心織筆耕',
-u'心知肚曉',
-u'心之官則思',
-u'心直口快',
-u'心知其意',
-u'心直嘴快',
-u'心中無數',
-u'心中有數',
-u'心拙口夯',
-u'心醉魂迷',
-u'心醉神迷',
-u'行百裏者半九十',
-u'行百裏者半于九十',
-u'興邦立國',
-u'行兵布陣',
-u'興兵動衆',
-u'行不從徑',
-u'行不得也哥哥',
-u'行不貳過',
-u'行不副言',
-u'行不更名',
-u'行不更名坐不改姓',
-u'行不苟合',
-u'行不履危',
-u'行步如飛',
-u'行不勝衣',
-u'行不由徑',
-u'行不逾方',
-u'行藏用舍',
-u'行成于思',
-u'星馳電掣',
-u'星馳電發',
-u'星馳電走',
-u'行船又遇打頭風',
-u'行船走馬三分命',
-u'興詞構訟',
-u'刑措不用',
-u'形單影單',
-u'形單影雙',
-u'形單影隻',
-u'行動坐卧',
-u'興訛造讪',
-u'行而不遠',
-u'星飛電急',
-u'興廢繼絕',
-u'星飛雲散',
-u'腥風醎雨',
-u'腥風血雨',
-u'興風作浪',
-u'興高采烈',
-u'形槁心灰',
-u'形格勢禁',
-u'形孤影寡',
-u'形孤影隻',
-u'行古志今',
-u'興觀群怨',
-u'興國安邦',
-u'行合趨同',
-u'杏花春雨',
-u'興會淋漓',
-u'星火昏迷',
-u'星火燎原',
-u'幸獲識荊',
-u'星火頭冠',
-u'形迹可疑',
-u'性急口快',
-u'行己有恥',
-u'興家立業',
-u'行奸賣俏',
-u'行将就木',
-u'形劫勢禁',
-u'興盡悲來',
-u'形禁勢格',
-u'形具神生',
-u'醒聩震聾',
-u'興利除弊',
-u'興利除害',
-u'星離雨散',
-u'星離月會',
-u'杏臉桃腮',
-u'性烈如火',
-u'杏林春栗',
-u'杏林春滿',
-u'杏林之光',
-u'星流霆擊',
-u'星羅棋布',
-u'星羅雲布',
-u'星落雲散',
-u'行眠立盹',
-u'興滅繼絕',
-u'性命關天',
-u'性命交關',
-u'刑期無刑',
-u'星前月下',
-u'興趣盎然',
-u'形容枯槁',
-u'形容憔悴',
-u'興如嚼蠟',
-u'行若狗彘',
-u'行若狐鼠',
-u'行若無事',
-u'杏腮桃臉',
-u'形散神聚',
-u'形色倉皇',
-u'行色匆匆',
-u'省身克己',
-u'姓甚名誰',
-u'幸生太平無事日',
-u'形勢逼人',
-u'行屍襯肩',
-u'行師動衆',
-u'興師問罪',
-u'行屍下铠',
-u'行屍走骨',
-u'行屍走肉',
-u'形輸色授',
-u'星霜屢移',
-u'行思坐籌',
-u'行思坐想',
-u'行思坐憶',
-u'行同狗豨',
-u'行同狗彘',
-u'行同能偶',
-u'行同枭獍',
-u'興旺發達',
-u'興亡禍福',
-u'興亡繼絕',
-u'形枉影曲',
-u'興微繼絕',
-u'興味索然',
-u'興文匽武',
-u'腥聞在上',
-u'行五出身',
-u'行俠好義',
-u'行險徼幸',
-u'行香挂牌',
-u'形銷骨立',
-u'惺惺常不足',
-u'星星點點',
-u'星星落落',
-u'形形色色',
-u'惺惺惜惺惺',
-u'惺惺惜惺惺好漢惜好漢',
-u'惺惺相惜',
-u'星星之火',
-u'星星之火可以燎原',
-u'惺惺作态',
-u'醒眼看醉人',
-u'杏眼圓睜',
-u'興妖作怪',
-u'興妖作亂',
-u'興妖作孽',
-u'星移鬥轉',
-u'星移漏轉',
-u'形意雙刀',
-u'星移物換',
-u'行易知難',
-u'形影不離',
-u'行影相吊',
-u'形影相對',
-u'形影相附',
-u'形影相顧',
-u'形影相随',
-u'形影相依',
-u'形影相追',
-u'形影自吊',
-u'形影自守',
-u'行有餘力',
-u'杏雨梨雲',
-u'刑于之化',
-u'刑餘之人',
-u'行遠升高',
-u'行遠自迩',
-u'星月交輝',
-u'幸運鬥篷',
-u'行雲流水',
-u'興雲緻雨',
-u'幸災樂禍',
-u'行者讓路',
-u'行鍼布線',
-u'行鍼走線',
-u'興緻勃勃',
-u'興緻淋漓',
-u'興緻索然',
-u'形隻影單',
-u'行之有效',
-u'形諸筆墨',
-u'行住坐卧',
-u'形狀分割',
-u'形狀描述',
-u'形狀曲線',
-u'形狀特征',
-u'形狀推理',
-u'形狀因子',
-u'行濁言清',
-u'行蹤無定',
-u'雄霸一方',
-u'雄辯高談',
-u'雄辯滔滔',
-u'雄才大略',
-u'雄材偉略',
-u'雄唱雌和',
-u'兇喘膚汗',
-u'兄弟和而家不分',
-u'兄弟阋牆',
-u'兄弟阋于牆',
-u'兄弟阋于牆外禦其侮',
-u'兄弟相害',
-u'兄弟怡怡',
-u'兄弟芝嬌',
-u'兇多吉少',
-u'雄飛雌伏',
-u'兄肥弟瘦',
-u'雄飛突進',
-u'胸懷大志',
-u'胸懷磊落',
-u'胸懷灑落',
-u'雄雞斷尾',
-u'雄雞生卵',
-u'雄雞夜鳴',
-u'雄雞一唱天下白',
-u'熊經鸱顧',
-u'熊經鳥伸',
-u'熊經鳥曳',
-u'熊經鳥引',
-u'雄赳赳氣昂昂',
-u'熊據虎跱',
-u'雄鹿沼澤',
-u'兄妹契約',
-u'熊夢徵祥',
-u'兇年饑歲',
-u'熊罴百萬',
-u'熊罴入夢',
-u'熊罴之士',
-u'兇神惡煞',
-u'雄深雅健',
-u'兇事藏心鬼敲門',
-u'雄視一世',
-u'兄死弟及',
-u'熊韬豹略',
-u'雄偉壯觀',
-u'雄偉壯麗',
-u'雄文大手',
-u'胸無城府',
-u'胸無成竹',
-u'胸無大志',
-u'胸無點墨',
-u'胸無宿物',
-u'兇相畢露',
-u'熊心豹膽',
-u'熊心豹糁',
-u'雄心勃勃',
-u'雄心萬丈',
-u'雄心壯志',
-u'雄雄赫赫',
-u'熊腰虎背',
-u'雄鷹不立垂枝',
-u'雄鷹守護',
-u'洶湧彭湃',
-u'胸有城府',
-u'胸有成略',
-u'胸有成算',
-u'胸有成竹',
-u'兄友弟恭',
-u'胸有邱壑',
-u'胸有懸鏡',
-u'熊之擁抱',
-u'胸中甲兵',
-u'胸中塊壘',
-u'胸中壘塊',
-u'胸中鱗甲',
-u'胸中萬卷',
-u'胸中無半點墨水',
-u'胸中無數',
-u'兇終隙末',
-u'兇終隙未',
-u'胸中有數',
-u'胸中自有雄兵百萬',
-u'雄姿英發',
-u'休別有魚處',
-u'休兵罷戰',
-u'秀才不出門',
-u'秀才不出門全知天下事',
-u'秀才餓死不賣書',
-u'秀才人情',
-u'秀才人情紙半張',
-u'秀才無假漆無真',
-u'秀才造反',
-u'秀才造反三年不成',
-u'秀出班行',
-u'脩辭立誠',
-u'休道黃金貴安樂值錢多',
-u'秀而不實',
-u'朽戈鈍甲',
-u'朽骨重肉',
-u'休官莫問子',
-u'繡虎雕龍',
-u'羞花閉月',
-u'繡花雖好不聞香',
-u'繡花枕頭',
-u'朽棘不雕',
-u'修舊利廢',
-u'修舊起廢',
-u'繡口錦心',
-u'袖裏來袖裏去',
-u'修鱗養爪',
-u'修羅下铠',
-u'羞面見人',
-u'休明盛世',
-u'朽木不雕',
-u'朽木不可雕',
-u'朽木糞牆',
-u'朽木糞土',
-u'朽木枯株',
-u'朽木難雕',
-u'朽木生花',
-u'朽木死灰',
-u'羞惱變成怒',
-u'休牛歸馬',
-u'休牛散馬',
-u'休戚相關',
-u'休戚與共',
-u'修齊治平',
-u'修橋補路',
-u'羞人答答',
-u'秀色可餐',
-u'脩身潔行',
-u'休聲美譽',
-u'修飾邊幅',
-u'袖手旁觀',
-u'宿水飡風',
-u'秀水明山',
-u'朽索馭馬',
-u'朽條腐索',
-u'秀外慧中',
-u'修文偃武',
-u'修心養性',
-u'休休有容',
-u'休養生息',
-u'羞以牛後',
-u'宿雨餐風',
-u'羞與哙伍',
-u'羞與爲伍',
-u'修真級別',
-u'修真養性',
-u'朽竹篙舟',
-u'朽株枯木',
-u'虛詞詭說',
-u'虛度年華',
-u'須發皆白',
-u'須發怒張',
-u'須防仁不仁',
-u'虛廢詞說',
-u'虛風高原',
-u'魆風驟雨',
-u'續凫斷鶴',
-u'續凫截鶴',
-u'絮果蘭因',
-u'噓寒問栗',
-u'噓寒問暖',
-u'盱衡厲色',
-u'虛懷若谷',
-u'虛晃一槍',
-u'虛己受人',
-u'虛己以聽',
-u'須将有日思無日',
-u'虛驕恃氣',
-u'蓄精養銳',
-u'酗酒滋事',
-u'噓枯吹生',
-u'恤老憐貧',
-u'虛論高議',
-u'須眉皓然',
-u'須眉交白',
-u'須眉男子',
-u'須彌芥子',
-u'徐娘半老',
-u'徐娘半老風韻猶存',
-u'畜妻養子',
-u'虛情假意',
-u'須髯如戟',
-u'許人一物',
-u'旭日初升',
-u'旭日東升',
-u'蓄銳養威',
-u'煦色韶光',
-u'需沙出穴',
-u'呴濕濡沫',
-u'虛室生白',
-u'需索無厭',
-u'虛堂懸鏡',
-u'虛往實歸',
-u'虛位以待',
-u'虛文浮禮',
-u'須問三老',
-u'續鹜短鶴',
-u'虛無飄渺',
-u'虛無行者',
-u'須下死工夫',
-u'虛心求進',
-u'絮絮叨叨',
-u'煦煦孑孑',
-u'栩栩如生',
-u'虛虛實實',
-u'栩栩欲活',
-u'诩诩自得',
-u'續夷堅志',
-u'虛應故事',
-u'虛有其表',
-u'虛與委蛇',
-u'虛張聲勢',
-u'虛之土精',
-u'虛舟飄瓦',
-u'虛嘴掠舌',
-u'虛左以待',
-u'軒昂氣宇',
-u'眩碧成朱',
-u'喧賓奪主',
-u'選兵秣馬',
-u'懸兵束馬',
-u'懸腸挂肚',
-u'懸車告老',
-u'懸車束馬',
-u'懸車之年',
-u'懸車緻仕',
-u'懸車之歲',
-u'懸鹑百結',
-u'玄辭冷語',
-u'懸石程書',
-u'镟的不圓砍的圓',
-u'玄德雙劍',
-u'旋得旋失',
-u'懸燈結彩',
-u'懸而未決',
-u'軒蓋如雲',
-u'旋幹轉坤',
-u'懸鼓待椎',
-u'眩光之石',
-u'懸龜系魚',
-u'軒鶴冠猴',
-u'懸河瀉火',
-u'懸河瀉水',
-u'宣和遺事',
-u'懸河注火',
-u'懸河注水',
-u'懸壺令旦',
-u'懸壺問世',
-u'懸壺行醫',
-u'宣花長斧',
-u'宣化承流',
-u'萱花椿樹',
-u'懸狟素飡',
-u'選妓征歌',
-u'懸劍空壟',
-u'癬疥之疾',
-u'懸旌萬裏',
-u'玄酒瓠脯',
-u'諠客奪主',
-u'絢麗多彩',
-u'懸梁刺股',
-u'懸門抉目',
-u'玄妙莫測',
-u'玄妙入神',
-u'眩目驚心',
-u'玄圃積玉',
-u'炫奇争勝',
-u'旋乾轉坤',
-u'炫巧鬥妍',
-u'揎拳攏袖',
-u'揎拳擄袖',
-u'揎拳裸臂',
-u'揎拳裸手',
-u'揎拳裸袖',
-u'揎拳舞袖',
-u'軒然大波',
-u'軒然霞舉',
-u'懸若日月',
-u'選色征歌',
-u'旋生旋滅',
-u'眩視惑聽',
-u'炫石爲玉',
-u'懸首吳阙',
-u'懸榻留賓',
-u'懸鞀建铎',
-u'懸頭刺股',
-u'懸駝就石',
-u'揎腕攘臂',
-u'玄武附體',
-u'選舞征歌',
-u'選賢舉能',
-u'選賢任能',
-u'選賢與能',
-u'璇霄丹阙',
-u'璇霄丹台',
-u'懸心吊膽',
-u'懸懸而望',
-u'軒軒甚得',
-u'懸崖絕壁',
-u'懸崖勒馬',
-u'懸崕峭壁',
-u'懸崖撒手',
-u'懸崖轉石',
-u'懸羊頭賣狗肉',
-u'炫異争奇',
-u'懸疣附贅',
-u'炫玉賈石',
-u'衒玉賈石',
-u'衒玉求售',
-u'衒玉自售',
-u'軒轅戰甲',
-u'軒轅之石',
-u'眩暈射擊',
-u'軒轾不分',
-u'玄之又玄',
-u'炫晝缟夜',
-u'旋轉變換',
-u'玄錐之履',
-u'雪案螢窗',
-u'雪案螢燈',
-u'雪北香南',
-u'雪鬓霜鬟',
-u'雪鬓霜毛',
-u'學步邯鄲',
-u'雪操冰心',
-u'削草除根',
-u'雪恥報仇',
-u'學吃虧多忍辱',
-u'雪窗螢火',
-u'雪窗螢幾',
-u'薛道衡傳',
-u'學到老不會到老',
-u'靴刀誓死',
-u'谑而不虐',
-u'學而不厭',
-u'學而時習之',
-u'學而優則仕',
-u'削發披缁',
-u'學非所用',
-u'學富才高',
-u'學富五車',
-u'學貫中西',
-u'血光之災',
-u'血海深仇',
-u'學海無涯',
-u'雪鴻指爪',
-u'血迹斑斑',
-u'學劍不成',
-u'雪窖冰天',
-u'學究天人',
-u'鷽鸠笑鵬',
-u'穴居野處',
-u'血口噴人',
-u'谑浪笑傲',
-u'學老于年',
-u'血淚斑斑',
-u'血淚盈襟',
-u'雪裏送炭',
-u'血流成河',
-u'血流成渠',
-u'血流漂杵',
-u'血流如注',
-u'血脈貫通',
-u'血木獵弓',
-u'削木爲吏',
-u'雪泥鴻迹',
-u'雪泥鴻爪',
-u'雪虐風饕',
-u'血盆大口',
-u'血氣方剛',
-u'血氣之勇',
-u'學淺才疏',
-u'學然後知不足',
-u'學然後知不足教然後之困',
-u'血染沙場',
-u'血肉腐爛',
-u'血肉橫飛',
-u'血肉淋漓',
-u'血肉模糊',
-u'血肉相連',
-u'學如不及',
-u'學如不及猶恐失之',
-u'學如穿井',
-u'學如登山',
-u'雪上加霜',
-u'血蝕之刃',
-u'學書不成',
-u'學書不成學劍不成',
-u'學疏才淺',
-u'學書學劍',
-u'雪胎梅骨',
-u'雪天螢席',
-u'削鐵如泥',
-u'削鐵無聲',
-u'噱頭十足',
-u'學徒索林',
-u'雪碗冰瓯',
-u'學無常師',
-u'學巫騎帚',
-u'學無止境',
-u'血性男兒',
-u'雪窯冰天',
-u'學以緻用',
-u'血雨腥風',
-u'雪玉之石',
-u'雪月風花',
-u'血月披風',
-u'雪月雙刀',
-u'學在苦中求',
-u'血債累累',
-u'血戰到底',
-u'雪兆豐年',
-u'學者如禾如稻',
-u'削趾适屦',
-u'削職爲民',
-u'雪中鴻爪',
-u'雪中送炭',
-u'削株掘根',
-u'削足适屦',
-u'削足适履',
-u'尋瘢索綻',
-u'尋弊索瑕',
-u'循常習故',
-u'埙篪相和',
-u'循次而進',
-u'迅電流光',
-u'尋芳問柳',
-u'熏風解愠',
-u'薰風習習',
-u'尋風捉影',
-u'訓格之言',
-u'尋根拔樹',
-u'尋根究底',
-u'詢根問底',
-u'尋根追底',
-u'循規蹈矩',
-u'循規蹈狷',
-u'徇國忘身',
-u'尋行數墨',
-u'尋行逐隊',
-u'尋壑經丘',
-u'尋花覓柳',
-u'尋花問柳',
-u'尋歡作樂',
-u'迅雷不及掩耳',
-u'迅雷風烈',
-u'尋流逐末',
-u'循名核實',
-u'循名考實',
-u'循名課實',
-u'循名責實',
-u'詢謀佥同',
-u'詢謀谘度',
-u'詢遷詢謀',
-u'徇情枉法',
-u'詢事考言',
-u'尋事生非',
-u'旬輸月送',
-u'尋死覓活',
-u'徇私枉法',
-u'徇私舞弊',
-u'徇私作弊',
-u'循誦習傳',
-u'熏陶成性',
-u'薰天赫地',
-u'循途守轍',
-u'尋瑕伺隙',
-u'尋瑕索瘢',
-u'循序漸進',
-u'循循善誘',
-u'薰莸不同器',
-u'尋幽入微',
-u'尋幽探勝',
-u'薰莸同器',
-u'詢于刍荛',
-u'噀玉噴珠',
-u'尋源讨本',
-u'尋章摘句',
-u'遜志時敏',
-u'尋枝摘葉',
-u'尋蹤覓迹',
-u'牙白口清',
-u'鴨步鵝行',
-u'鴉巢生鳳',
-u'壓倒群雄',
-u'壓倒元白',
-u'揠苖助長',
-u'鴉飛雀亂',
-u'鴉風廢墟',
-u'衙官屈宋',
-u'壓肩叠背',
-u'壓卷之作',
-u'啞口無聲',
-u'啞口無言',
-u'雅量高緻',
-u'壓良爲贱',
-u'鴉沒鵲靜',
-u'衙門八字開',
-u'揠苗助長',
-u'鴉默雀靜',
-u'雅雀無聲',
-u'鴉雀無聞',
-u'呀然驚恐',
-u'啞然失笑',
-u'雅人清緻',
-u'雅人深緻',
-u'雅人韻士',
-u'鴉舌先知',
-u'雅俗共賞',
-u'鴨行鵝步',
-u'壓雪求油',
-u'牙牙學語',
-u'雅緻節杖',
-u'睚眦必報',
-u'啞子吃黃連',
-u'啞子托夢',
-u'啞子尋夢',
-u'睚眦之私',
-u'睚眦之隙',
-u'睚眦之嫌',
-u'睚眦之怨',
-u'啞子做夢',
-u'宴安酖毒',
-u'宴安鸠毒',
-u'宴安鸩毒',
-u'眼飽不覺肚饑',
-u'眼飽肚中饑',
-u'掩鼻蹙頞',
-u'掩鼻而過',
-u'掩鼻偷香',
-u'言必信行必果',
-u'言必有據',
-u'言必有物',
-u'言必有中',
-u'偃兵息甲',
-u'偃兵脩文',
-u'眼柄腰帶',
-u'煙波釣徒',
-u'煙波浩渺',
-u'雁泊人戶',
-u'沿波讨源',
-u'言不谙典',
-u'煙不出火不進',
-u'言不達意',
-u'言不逮意',
-u'言不的語不的',
-u'言不二價',
-u'言不顧行',
-u'言不及行',
-u'言不及義',
-u'眼不見爲淨',
-u'眼不見心不煩',
-u'言不盡意',
-u'言不亵不笑',
-u'言不由衷',
-u'沿才受職',
-u'眼饞肚飽',
-u'燕巢飛幕',
-u'燕巢幕上',
-u'燕巢衛幕',
-u'燕巢于幕',
-u'嚴陳以待',
-u'嚴懲不貸',
-u'妍蚩好惡',
-u'燕俦莺侶',
-u'言出法随',
-u'燕處焚巢',
-u'言出禍從',
-u'言出禍随',
-u'燕處危巢',
-u'煙出文章酒出詩',
-u'眼穿腸斷',
-u'言傳身教',
-u'眼穿心死',
-u'言從計納',
-u'言從計聽',
-u'言從計行',
-u'鹽打怎麽鹹醋打怎麽酸',
-u'燕岱之石',
-u'顔丹鬓綠',
-u'焉得虎子',
-u'言顛語倒',
-u'燕妒莺慚',
-u'煙斷火絕',
-u'雁斷魚沉',
-u'雁斷魚沈',
-u'言多必失',
-u'言多必有失',
-u'言多定有失',
-u'言多傷行',
-u'言多語失',
-u'燕額虎頭',
-u'掩惡揚美',
-u'掩惡揚善',
-u'掩耳不聞',
-u'言而不信',
-u'掩耳盜鈴',
-u'掩耳盜鍾',
-u'掩耳偷鈴',
-u'言而無文行之不遠',
-u'言而無信',
-u'宴爾新婚',
-u'言而有信',
-u'言發禍随',
-u'言芳行潔',
-u'言方行圓',
-u'煙霏霧集',
-u'煙飛星散',
-u'煙霏雨散',
-u'雁封魚素',
-u'炎附寒棄',
-u'眼高手低',
-u'眼高手生',
-u'言高語低',
-u'偃革倒戈',
-u'掩骼埋窆',
-u'掩骼埋胔',
-u'偃革尚文',
-u'偃革爲軒',
-u'燕歌趙舞',
-u'顔骨柳筋',
-u'厭故喜新',
-u'言寡尤行寡悔',
-u'眼觀六路',
-u'眼觀六路耳聽八方',
-u'眼觀四處',
-u'眼觀四處耳聽八方',
-u'眼觀四路',
-u'眼觀四路耳聽八方',
-u'眼觀爲實',
-u'眼光短淺',
-u'眼光放遠萬事悲',
-u'言歸和好',
-u'言歸于好',
-u'言歸正傳',
-u'雁過拔毛',
-u'雁過撥毛',
-u'雁過留聲',
-u'言過其實',
-u'言過其實不可大用',
-u'掩過飾非',
-u'掩過揚善',
-u'燕颔虎頸',
-u'燕颔虎頭',
-u'燕颔虎須',
-u'嚴寒酷署',
-u'燕颔虬須',
-u'燕颔儒生',
-u'燕颔書生',
-u'雁行失序',
-u'雁行折翼',
-u'言和意順',
-u'嫣紅姹紫',
-u'俨乎其然',
-u'掩護束帶',
-u'眼花耳熱',
-u'煙花風月',
-u'眼花撩亂',
-u'眼花雀亂',
-u'眼花心亂',
-u'炎黃子孫',
-u'淹會貫通',
-u'眼急手快',
-u'嚴家餓隸',
-u'偃甲息兵',
-u'燕駕越毂',
-u'偃蹇困窮',
-u'眼見是實耳聞是虛',
-u'眼尖手快',
-u'眼見爲實耳聽爲虛',
-u'言簡義豐',
-u'言簡意該',
-u'言簡意少',
-u'言簡意深',
-u'延津劍合',
-u'顔筋柳骨',
-u'燕金募秀',
-u'言近意遠',
-u'延津之合',
-u'言近指遠',
-u'延頸鶴望',
-u'延頸舉踵',
-u'眼睛裏插棒槌',
-u'顔精柳骨',
-u'延頸跂踵',
-u'眼睛長在腦門兒上',
-u'腌韭菜入不得畦',
-u'厭舊貪新',
-u'厭舊喜新',
-u'煙聚波屬',
-u'燕駿千金',
-u'眼開眉展',
-u'晏開之警',
-u'眼空四海',
-u'眼空無物',
-u'眼空一世',
-u'掩口而笑',
-u'掩口胡盧',
-u'掩口失聲',
-u'咽苦吐甘',
-u'咽苦吞甘',
-u'言來語去',
-u'延攬人才',
-u'眼淚往肚裏咽',
-u'言類懸河',
-u'腌裏巴臢',
-u'言利不言情',
-u'眼裏出大口内垂涎',
-u'眼裏揉不進砂子去',
-u'眼裏着不得',
-u'炎涼世态',
-u'沿流溯源',
-u'沿流讨源',
-u'言論風生',
-u'言論行事',
-u'閻羅王也不過是鬼做的',
-u'燕侶莺俦',
-u'沿門持缽',
-u'沿門讬缽',
-u'顔面掃地',
-u'湮滅寶珠',
-u'湮滅不彰',
-u'眼明手快',
-u'眼明心亮',
-u'湮沒無聞',
-u'雁默先烹',
-u'掩目捕雀',
-u'燕幕自安',
-u'雁南燕北',
-u'厭難折沖',
-u'眼内無珠',
-u'延年益壽',
-u'眼皮子太淺',
-u'言氣卑弱',
-u'掩其不備',
-u'延期處理',
-u'偃旗仆鼓',
-u'偃旗卧鼓',
-u'掩其無備',
-u'偃旗息鼓',
-u'焉耆一龜茲語',
-u'嚴氣正性',
-u'眼前幻出',
-u'眼前形勢胸中策',
-u'言情不言利',
-u'言輕莫勸人',
-u'言清行濁',
-u'雁去魚來',
-u'燕雀安知鴻鹄志',
-u'燕雀安知鴻鹄之志',
-u'燕雀處堂',
-u'燕雀處屋',
-u'燕雀豈知雕鹗志',
-u'燕雀相賀',
-u'燕雀之見',
-u'燕雀之居',
-u'閹然媚世',
-u'嫣然一笑',
-u'晏然自若',
-u'掩人耳目',
-u'言人人殊',
-u'掩日斷水',
-u'豔如桃李',
-u'豔如桃李冷若冰霜',
-u'言若懸河',
-u'言三語四',
-u'研桑心計',
-u'豔色絕世',
-u'顔色系統',
-u'言善不難行善難',
-u'研深覃精',
-u'燕市悲歌',
-u'煙視媚行',
-u'言是人非',
-u'言十妄九',
-u'燕石妄珍',
-u'雁逝魚沉',
-u'燕石墜子',
-u'燕瘦環肥',
-u'偃鼠飲河',
-u'嚴霜單打獨根兒草',
-u'嚴霜烈日',
-u'嚴絲合縫',
-u'淹死會水的',
-u'雁素魚箋',
-u'煙蓑雨笠',
-u'雁塔題名',
-u'雁塔新題',
-u'言談舉止',
-u'言談林薮',
-u'言提其耳',
-u'言聽計從',
-u'言聽計行',
-u'言聽計用',
-u'言聽謀決',
-u'言聽事行',
-u'言聽行從',
-u'言外之味',
-u'言外之意',
-u'閻王好見小鬼難搪',
-u'言爲心聲',
-u'言文行遠',
-u'厭聞饫聽',
-u'言無不盡',
-u'偃武崇文',
-u'偃武觌文',
-u'言無二價',
-u'偃武櫜兵',
-u'筵無好筵會無好會',
-u'煙霧缭繞',
-u'言無倫次',
-u'偃武息戈',
-u'偃武行文',
-u'偃武休兵',
-u'偃武修文',
-u'燕舞莺歌',
-u'燕舞莺啼',
-u'掩瑕藏疾',
-u'言笑不苟',
-u'煙銷灰滅',
-u'煙消火滅',
-u'眼笑眉飛',
-u'煙消霧散',
-u'言笑晏晏',
-u'煙消雲散',
-u'言笑自如',
-u'言笑自若',
-u'言信行果',
-u'言行抱一',
-u'言行不貳',
-u'言行不符',
-u'言行不一',
-u'眼饧耳熱',
-u'言行計從',
-u'嚴刑峻法',
-u'嚴刑峻制',
-u'言行謦欬',
-u'言行若一',
-u'言行相悖',
-u'言行相副',
-u'言行相顧',
-u'言行相詭',
-u'言行信果',
-u'言行一緻',
-u'言行足式',
-u'雁序分行',
-u'雁序之情',
-u'淹旬曠月',
-u'掩眼捕雀',
-u'燕雁代飛',
-u'揜揜縮縮',
-u'奄奄一息',
-u'燕燕莺莺',
-u'燕燕于歸',
-u'恹恹欲睡',
-u'煙炎張天',
-u'言揚行舉',
-u'雁杳魚沉',
-u'嚴以律己',
-u'嚴以律己寬以待人',
-u'燕翼诒謀',
-u'雁影分飛',
-u'言有盡而意無窮',
-u'奄有四方',
-u'言猶在耳',
-u'言語道斷',
-u'言語路絕',
-u'嚴于律己',
-u'嚴于律已',
-u'言語妙天下',
-u'言與心違',
-u'言語行爲有條理',
-u'燕語莺聲',
-u'燕語莺啼',
-u'燕躍鹄踴',
-u'燕約莺期',
-u'言約旨遠',
-u'煙雲過眼',
-u'燕昭好馬',
-u'燕昭市駿',
-u'言者不知',
-u'言者弗知',
-u'言者無罪',
-u'言者無罪聞者足戒',
-u'言者諄諄',
-u'言者諄諄聽者藐藐',
-u'嚴陣以待',
-u'言之不文行之不遠',
-u'言之不預',
-u'言之成理',
-u'言之過甚',
-u'眼之結界',
-u'言之無文',
-u'言之無文行而不遠',
-u'言之無文行之不遠',
-u'言之無物',
-u'言之無信',
-u'言志已酬便無志',
-u'言之有故',
-u'言之有理',
-u'言之有物',
-u'言之有序',
-u'言之鑿鑿',
-u'言之諄諄',
-u'言之諄諄聽之藐藐',
-u'眼之詛咒',
-u'眼中拔釘',
-u'嚴重錯誤',
-u'眼中釘肉中刺',
-u'言重九鼎',
-u'言中事隐',
-u'眼中有鐵',
-u'嚴重緻傷',
-u'閹豬的攬馬骟',
-u'眼珠子裏頭沒有人',
-u'燕子銜食',
-u'妍姿豔質',
-u'豔紫妖紅',
-u'雁字魚書',
-u'雁足傳書',
-u'餍足之道',
-u'研鑽勿替',
-u'掩罪飾非',
-u'養兵千日',
-u'養兵千日用兵一時',
-u'養兵千日用在一時',
-u'養兵千日用在一朝',
-u'養病如養虎',
-u'養不教父之過',
-u'仰不愧天',
-u'揚長避短',
-u'揚長而去',
-u'羊腸九曲',
-u'羊腸鳥道',
-u'羊腸小道',
-u'羊腸小徑',
-u'羊觸藩籬',
-u'楊穿三葉',
-u'陽春白雪',
-u'陽春有腳',
-u'陽錯陰差',
-u'養兒備老',
-u'養而不教',
-u'養兒不如我要錢做什麽',
-u'養兒代老積谷防饑',
-u'養兒防備老',
-u'養兒防老',
-u'養兒防老積谷防饑',
-u'養兒方知父母恩',
-u'養兒莫養倆養倆輪官馬',
-u'養兒強過我要錢做什麽',
-u'養兒像叔養女像姑',
-u'揚幡招魂',
-u'楊妃一撚紅',
-u'揚風扢雅',
-u'陽奉陰違',
-u'佯風詐冒',
-u'羊羔美酒',
-u'陽溝裏翻船',
-u'陽關大道',
-u'仰觀俯察',
-u'陽關三叠',
-u'陽光樹林',
-u'羊狠狼貪',
-u'養虎成患',
-u'養虎留患',
-u'養虎傷身',
-u'楊花水性',
-u'養虎爲患',
-u'楊虎圍匡',
-u'養虎贻患',
-u'養虎自斃',
-u'養虎自殘',
-u'養虎自齧',
-u'養虎自遺患',
-u'楊花心性',
-u'養虺成蛇',
-u'養晦待時',
-u'養晦韬光',
-u'殃及池魚',
-u'揚己露才',
-u'養家肥己',
-u'養家糊口',
-u'養家活口',
-u'養家經紀',
-u'陽解陰毒',
-u'養精畜銳',
-u'養精蓄銳',
-u'養軍千日',
-u'養軍千日用軍一時',
-u'養軍千日用在一時',
-u'養軍千日用在一朝',
-u'養老送死',
-u'養老送終',
-u'揚厲鋪張',
-u'揚鈴打鼓',
-u'楊柳宮眉',
-u'楊柳依依',
-u'佯輪詐敗',
-u'羊落虎口',
-u'羊毛襯肩',
-u'羊毛出在羊身上',
-u'揚眉奮髯',
-u'揚眉眴目',
-u'揚眉吐氣',
-u'仰面朝天',
-u'仰面唾天',
-u'揚名四海',
-u'揚名顯親',
-u'養女不教如養豬',
-u'揚葩振藻',
-u'揚清激濁',
-u'揚清厲俗',
-u'揚清抑濁',
-u'仰取俯拾',
-u'楊雀銜環',
-u'羊群裏跑出個駱駝來',
-u'仰人鼻息',
-u'仰人眉睫',
-u'羊肉吃不着空惹一身臊',
-u'羊肉落在狗嘴裏',
-u'羊入虎群',
-u'養銳蓄威',
-u'養身父母',
-u'養生不如放生',
-u'楊生黃雀',
-u'養生喪死',
-u'養生送死',
-u'養生送終',
-u'養生之道',
-u'仰事俛畜',
-u'仰拾俯取',
-u'仰事俯畜',
-u'仰事俯育',
-u'仰首伸眉',
-u'佯輸詐敗',
-u'揚湯止沸',
-u'陽灣港口',
-u'陽灣聖壇',
-u'養威蓄銳',
-u'揚威耀武',
-u'洋爲中用',
-u'仰屋竊歎',
-u'揚武耀威',
-u'仰屋着書',
-u'仰屋著書',
-u'養蝦蟆得水蠱兒病',
-u'養賢納士',
-u'養心安神',
-u'養性存身',
-u'養性修真',
-u'陽煦山立',
-u'羊續懸魚',
-u'陽焰鬥篷',
-u'陽炎崗哨',
-u'養顔有術',
-u'鞅鞅不樂',
-u'怏怏不悅',
-u'泱泱大風',
-u'洋洋大觀',
-u'揚揚得意',
-u'養羊剪毛',
-u'洋洋灑驅',
-u'洋洋灑灑',
-u'洋洋纚纚',
-u'洋洋盈耳',
-u'揚揚自得',
-u'養音九臯',
-u'養鷹飏去',
-u'養癰長疽',
-u'養癰成患',
-u'養癰贻害',
-u'養癰贻患',
-u'養癰緻患',
-u'養癰自患',
-u'養癰自禍',
-u'羊質虎皮',
-u'仰之彌高',
-u'揚州雖好不是久戀之家',
-u'楊朱泣岐',
-u'羊撞籬笆',
-u'養子不教如養驢',
-u'養子防老積谷防饑',
-u'仰足并馳',
-u'養尊處優',
-u'搖擺意志',
-u'搖筆即來',
-u'藥補不如食補',
-u'杳不可聞',
-u'妖不勝德',
-u'瑤草奇花',
-u'瑤草琪葩',
-u'腰纏萬貫',
-u'要吃爛肉別惱着火頭',
-u'瑤池女使',
-u'瑤池玉液',
-u'搖唇鼓喙',
-u'搖唇鼓舌',
-u'要打沒好手厮罵沒好口',
-u'藥到病除',
-u'藥到回春',
-u'咬得菜根',
-u'咬釘嚼鐵',
-u'咬定牙根',
-u'咬定牙關',
-u'要東就東要西就西',
-u'搖鵝毛扇',
-u'要而論之',
-u'要而言之',
-u'邀功求賞',
-u'邀功希寵',
-u'腰鼓兄弟',
-u'咬骨之斧',
-u'要害之地',
-u'要好不能夠要歹登時就',
-u'妖狐附體',
-u'遙呼相應',
-u'瑤環瑜珥',
-u'姚黃魏品',
-u'姚黃魏紫',
-u'要價還價',
-u'咬姜呷醋',
-u'夭矯不群',
-u'腰金拖紫',
-u'咬緊牙關',
-u'腰金衣紫',
-u'瑤林瓊樹',
-u'瑤林玉樹',
-u'妖魅之符',
-u'邀名射利',
-u'妖魔鬼怪',
-u'幺麽小醜',
-u'堯年舜日',
-u'妖牛腳夫',
-u'妖牛奴仆',
-u'妖牛樵夫',
-u'妖牛漁夫',
-u'夭牌壓地牌',
-u'搖旗呐喊',
-u'堯趨舜步',
-u'咬人的狗兒不露齒',
-u'咬人狗兒不露齒',
-u'杳如黃鶴',
-u'吆三喝四',
-u'搖身一變',
-u'妖生慣養',
-u'鑰匙法杖',
-u'藥石罔效',
-u'藥石之言',
-u'搖手觸禁',
-u'要死要活',
-u'瑤台瓊室',
-u'瑤台銀阙',
-u'夭桃襛李',
-u'堯天舜日',
-u'窈窕淑女',
-u'搖頭擺腦',
-u'搖頭擺尾',
-u'搖頭不摔腦',
-u'搖頭稾腦',
-u'搖頭幌腦',
-u'搖頭麰尾',
-u'搖頭歎息',
-u'幺豚暮鹨',
-u'搖尾乞憐',
-u'搖尾求食',
-u'搖尾塗中',
-u'咬文嚼字',
-u'咬文齧字',
-u'吆五喝六',
-u'杳無人迹',
-u'杳無人煙',
-u'杳無消息',
-u'杳無信息',
-u'耀武揚威',
-u'杳無音耗',
-u'杳無音信',
-u'杳無音訊',
-u'杳無影響',
-u'杳無蹤迹',
-u'杳無蹤影',
-u'搖席破坐',
-u'幺弦孤韻',
-u'妖形怪狀',
-u'咬血爲盟',
-u'咬牙恨齒',
-u'咬牙切齒',
-u'要言不煩',
-u'謠言紛飛',
-u'妖言惑衆',
-u'要言妙道',
-u'搖搖擺擺',
-u'遙遙華胄',
-u'遙遙領先',
-u'遙遙無期',
-u'遙遙相對',
-u'幺幺小醜',
-u'峣峣易缺',
-u'搖搖欲墜',
-u'遙遙在望',
-u'峣峣者易折',
-u'藥醫不死病',
-u'咬音咂字',
-u'妖由人心',
-u'妖由人興',
-u'搖羽毛扇',
-u'邀月墜子',
-u'要知山下事請問過來人',
-u'要知心腹事盡在不言中',
-u'謠诼紛傳',
-u'謠诼紛纭',
-u'耀祖榮宗',
-u'搖嘴掉舌',
-u'要做到這一步',
-u'也被旁人說是非',
-u'曳兵棄甲',
-u'曳兵之計',
-u'夜不閉戶',
-u'夜不閉戶路不拾遺',
-u'夜不成寐',
-u'野草閑花',
-u'夜長夢多',
-u'爺飯娘羹',
-u'夜飯少一口活到九十九',
-u'爺羹娘飯',
-u'葉公好龍',
-u'野鶴孤雲',
-u'野鶴閑雲',
-u'野火燒不盡',
-u'邺架之藏',
-u'夜靜更闌',
-u'夜靜更深',
-u'業精于勤',
-u'業精于勤荒于嬉',
-u'曳裾王門',
-u'業峻鴻績',
-u'夜闌人靜',
-u'夜郎自大',
-u'葉落糞本',
-u'葉落歸根',
-u'葉落歸秋',
-u'葉落知秋',
-u'野馬無缰',
-u'野馬之鬃',
-u'野沒遺賢',
-u'夜眠八尺',
-u'冶容誨淫',
-u'夜入民宅非奸即盜',
-u'夜深人靜',
-u'夜視步槍',
-u'葉瘦花殘',
-u'野蔌山肴',
-u'曳尾泥塗',
-u'曳尾塗中',
-u'野無遺才',
-u'野無遺賢',
-u'野心勃勃',
-u'野性暴怒',
-u'冶葉倡條',
-u'業業矜矜',
-u'業業兢兢',
-u'夜以繼日',
-u'夜以繼晝',
-u'葉影妖刀',
-u'以八尺爲一步',
-u'一巴掌人',
-u'以白诋青',
-u'一百二十行',
-u'一敗如水',
-u'一敗塗地',
-u'以白爲黑',
-u'一百五日',
-u'一百五日風雨急',
-u'一敗再敗',
-u'一百杖頭錢',
-u'一白遮九醜',
-u'一斑半點',
-u'一半兒推辭一半兒肯',
-u'以半擊倍',
-u'一斑窺豹',
-u'一闆三眼',
-u'一瓣心香',
-u'一班一輩',
-u'一班一級',
-u'一闆一眼',
-u'一瓣子心',
-u'一棒打着兩個人',
-u'一棒打着兩個鴛鴦',
-u'倚傍門戶',
-u'一棒子酒',
-u'一報還一報',
-u'異寶奇珍',
-u'以暴易暴',
-u'一暴一寒',
-u'一杯的容量',
-u'一杯羹在此冷了',
-u'衣被群生',
-u'逸輩殊倫',
-u'一輩衣冠方事事',
-u'一悲一喜',
-u'一輩做官十輩擂磚',
-u'一本萬利',
-u'一本正經',
-u'一筆不苟',
-u'一筆而成',
-u'一筆勾斷',
-u'一筆勾銷',
-u'一鼻孔出氣',
-u'一筆抹倒',
-u'一筆抹摋',
-u'一筆抹殺',
-u'一碧萬頃',
-u'一筆寫成',
-u'一臂之力',
-u'挹彼注此',
-u'挹彼注茲',
-u'一鼻子灰',
-u'遺編斷簡',
-u'一邊兒高',
-u'一變而緻羽物',
-u'一變複生',
-u'遺編絕簡',
-u'一鞭先著',
-u'一鞭一條痕',
-u'遺編墜簡',
-u'一表非凡',
-u'一表非俗',
-u'一表人才',
-u'一表人物',
-u'儀表堂皇',
-u'一表堂堂',
-u'一病不起',
-u'一秉大公',
-u'一秉虔誠',
-u'一秉至公',
-u'一波不動月空照',
-u'一波才動萬波随',
-u'一波才退',
-u'一波才退一波來',
-u'一波三折',
-u'一波萬波',
-u'一波未平',
-u'一波未平一波又起',
-u'衣缽相傳',
-u'一波已作',
-u'一波又起',
-u'義薄雲天',
-u'一步八個謊',
-u'衣不蔽體',
-u'衣不蔽體食不果腹',
-u'衣不大寸鞋不大分',
-u'一步登天',
-u'一步地都行上',
-u'議不反顧',
-u'誼不敢辭',
-u'一步高一步',
-u'一步好一步',
-u'以不濟可',
-u'衣不解帶',
-u'一不可待',
-u'一部廿四史從何說起',
-u'一不扭衆',
-u'義不取容',
-u'誼不容辭',
-u'衣不如新人不如故',
-u'義不生财',
-u'衣不完采',
-u'藝不壓身',
-u'一不壓衆',
-u'一不壓衆百不随一',
-u'一步一個腳印',
-u'一步一鬼',
-u'一步一趨',
-u'一不意人君如此也',
-u'一步有六尺四寸',
-u'一不做二不休',
-u'倚财仗勢',
-u'依草附木',
-u'異草奇花',
-u'一草一木',
-u'一層窗戶紙捅破',
-u'一層秋雨一層涼',
-u'一差半錯',
-u'一差二錯',
-u'一差二誤',
-u'一差兩訛',
-u'一刹那頃',
-u'遺産之心',
-u'一倡百和',
-u'一長半短',
-u'一場春夢',
-u'一長二短',
-u'一場官司一場火',
-u'一長兩短',
-u'一場秋雨一場寒',
-u'一倡三歎',
-u'一長一短',
-u'一倡一和',
-u'一朝天子一朝臣',
-u'一車兩馬',
-u'一徹萬融',
-u'一塵不到',
-u'一塵不染',
-u'一塵不缁',
-u'逸塵斷鞅',
-u'宜嗔宜喜',
-u'一成不變',
-u'一成不易',
-u'以成今草',
-u'一成一旅',
-u'一尺還他十寸',
-u'一尺水翻成十丈波',
-u'一尺水翻騰做百丈波',
-u'一尺水翻騰做一丈波',
-u'一馳一張',
-u'一重一掩',
-u'一籌莫展',
-u'遺臭千年',
-u'遺臭千秋',
-u'遺臭萬代',
-u'贻臭萬年',
-u'遺臭萬世',
-u'遺臭萬載',
-u'遺臭無窮',
-u'一觸即發',
-u'一觸即潰',
-u'溢出檢查',
-u'一鋤頭也是動土',
-u'意出望外',
-u'移船就岸',
-u'一串骊珠',
-u'一傳十十傳百',
-u'一床錦被遮蓋',
-u'一床兩好',
-u'一錘定音',
-u'一吹一唱',
-u'一錘子買賣',
-u'一次變故',
-u'以詞害意',
-u'一賜樂業教',
-u'以此類推',
-u'一辭莫贊',
-u'以辭取人',
-u'一辭同軌',
-u'以此爲輕重',
-u'一次污染物',
-u'譯詞選擇',
-u'一蹴而成',
-u'一蹴而得',
-u'一蹴而幾',
-u'一蹴而就',
-u'一蹴可幾',
-u'依翠偎紅',
-u'蟻萃螽集',
-u'一寸赤心',
-u'一寸丹心',
-u'一寸光陰一寸金',
-u'依存結構',
-u'一寸秋波',
-u'依存語法',
-u'以大惡細',
-u'一大會兒',
-u'一大郎當',
-u'一搭兩用',
-u'一大三大',
-u'一打三分低',
-u'遺大投艱',
-u'一搭一唱',
-u'一搭一檔',
-u'一代不如一代',
-u'一代鼎臣',
-u'一代風流',
-u'一代紅妝',
-u'一代巨擘',
-u'一代楷模',
-u'一代談宗',
-u'一代文宗',
-u'一代宗臣',
-u'一旦敗之有餘',
-u'一旦被蛇咬十年怕草繩',
-u'衣單食薄',
-u'一旦無常',
-u'一箪一瓢',
-u'一旦一夕',
-u'義膽忠肝',
-u'一旦珠還',
-u'以黨舉官',
-u'揖盜開門',
-u'一刀兩斷',
-u'一刀兩斷一了百了',
-u'一刀一槍',
-u'以德報德',
-u'以德報怨',
-u'以德服人',
-u'醫德堪欽',
-u'醫德可風',
-u'醫德可欽',
-u'遺德休烈',
-u'醫得眼前瘡剜卻心頭肉',
-u'一德一心',
-u'遺德馀烈',
-u'一得之功',
-u'一得之見',
-u'一得之愚',
-u'以德追禍',
-u'一登龍門聲價十倍',
-u'易地而處',
-u'一滴汗珠萬粒糧',
-u'一地胡拿',
-u'易地皆然',
-u'移的就箭',
-u'異地相逢',
-u'一遞一個',
-u'一底一面',
-u'一點半點',
-u'以點帶面',
-u'一點靈犀',
-u'一點一滴',
-u'一雕雙兔',
-u'一跌不振',
-u'一叠連聲',
-u'一丁不識',
-u'一定不易',
-u'一頂二拖',
-u'彜鼎圭璋',
-u'意定情堅',
-u'一定之規',
-u'一動不如一靜',
-u'移東補西',
-u'移東就西',
-u'蟻鬥蝸争',
-u'挹鬥揚箕',
-u'一度變化',
-u'一睹風采',
-u'以毒攻毒',
-u'意笃情鍾',
-u'一度著蛇咬怕見斷井索',
-u'一肚子不合時宜',
-u'一肚子鬼胎',
-u'義斷恩絕',
-u'以碫投卵',
-u'以惡報惡',
-u'以訛傳訛',
-u'依阿取容',
-u'遺恩馀烈',
-u'一二八事變',
-u'已而不登',
-u'以耳代目',
-u'遺珥堕簪',
-u'一而二二而一',
-u'以耳爲目',
-u'一而再再而三',
-u'遺珥墜簪',
-u'一發而不可收拾',
-u'易發難收',
-u'易發難制',
-u'依法炮制',
-u'一發破的',
-u'一發千鈞',
-u'以法爲教',
-u'一番拆洗一番新',
-u'一反常态',
-u'一飯鬥米',
-u'一帆風順',
-u'贻範古今',
-u'一反既往',
-u'一反其道',
-u'一飯千金',
-u'一飯三吐哺',
-u'一帆順風',
-u'易反易覆小人心',
-u'一飯之德',
-u'以防不測',
-u'義方垂範',
-u'易放難收',
-u'義方是訓',
-u'以防萬一',
-u'遺芳馀烈',
-u'義方之教',
-u'一方之任',
-u'義方之訓',
-u'一吠百聲',
-u'一飛沖天',
-u'一分耕耘一分收獲',
-u'一分行情一分貨',
-u'一分錢難倒英雄漢',
-u'遺芬賸馥',
-u'義憤填胸',
-u'義憤填膺',
-u'一分爲二',
-u'一分辛勞一分才',
-u'一分一毫',
-u'遺芬馀榮',
-u'以豐補歉',
-u'移風崇教',
-u'移風改俗',
-u'移風革俗',
-u'遺風古道',
-u'遺風舊俗',
-u'移風平俗',
-u'蟻封穴雨',
-u'遺風逸塵',
-u'移風易尚',
-u'易風移俗',
-u'遺風馀采',
-u'遺風馀教',
-u'遺風馀烈',
-u'遺風馀思',
-u'遺風馀俗',
-u'遺風馀習',
-u'遺風馀象',
-u'遺風馀韻',
-u'遺風馀澤',
-u'移風振俗',
-u'一佛出世',
-u'一佛出世二佛涅槃',
-u'一佛出世二佛升天',
-u'一夫出死萬乘不輕',
-u'一夫當關',
-u'一夫當關萬夫莫摧',
-u'一夫當關萬夫莫開',
-u'蟻附蜂屯',
-u'一福能壓百禍',
-u'亦複如是',
-u'蟻附蠅集',
-u'一夫之勇',
-u'一傅衆咻',
-u'一概而論',
-u'一改故轍',
-u'一幹二淨',
-u'一竿風月',
-u'一幹人犯',
-u'一杆子插到底',
-u'藝高膽大',
-u'藝高膽自大',
-u'一高二低',
-u'藝高人膽大',
-u'一個巴掌拍不響',
-u'一個半個',
-u'一個半斤一個八兩',
-u'一個不留神',
-u'以戈舂黍',
-u'一個跟鬥十萬八千裏',
-u'一個好漢三個幫',
-u'一個紅臉兒一個白臉兒',
-u'一個君子待了十個小人',
-u'一個老鼠害一鍋湯',
-u'一個籬笆三個樁',
-u'一個蘿蔔一個坑',
-u'一個女婿半個兒',
-u'一個霹靂天下響',
-u'一個錢手裏攥出汗來',
-u'一個去百個來',
-u'一個賽一個',
-u'一個星保夜晴',
-u'移根換葉',
-u'移根接葉',
-u'一根線兒拴倆螞蚱',
-u'一根一闆',
-u'以功補過',
-u'移宮換羽',
-u'以公滅私',
-u'以攻爲守',
-u'以宮笑角',
-u'一谷不登',
-u'一谷不升',
-u'以古方今',
-u'以古非今',
-u'一股腦兒',
-u'一顧千金',
-u'一顧傾城',
-u'一顧傾人',
-u'以骨去蟻',
-u'以古爲鑒',
-u'以古爲鏡',
-u'一鼓一闆',
-u'以瞽引瞽',
-u'以古喻今',
-u'以古制今',
-u'一顧之榮',
-u'一鼓作氣',
-u'一鼓作氣勢如虎',
-u'衣冠敗類',
-u'一官半職',
-u'以冠補履',
-u'衣冠不正',
-u'衣冠楚楚',
-u'衣冠輻湊',
-u'依丱附木',
-u'一棺附身',
-u'衣冠赫奕',
-u'以觀後效',
-u'衣冠濟楚',
-u'衣冠濟濟',
-u'以管窺豹',
-u'以筦窺天',
-u'衣冠藍縷',
-u'衣冠禮樂',
-u'衣冠沐猴',
-u'衣冠齊楚',
-u'衣冠禽獸',
-u'衣冠掃地',
-u'衣冠甚偉',
-u'衣冠盛事',
-u'衣冠土枭',
-u'衣冠文物',
-u'衣冠枭獍',
-u'倚官挾勢',
-u'衣冠緒餘',
-u'衣冠優孟',
-u'衣冠雲集',
-u'倚官仗勢',
-u'衣冠中人',
-u'衣冠子女',
-u'意廣才疏',
-u'一軌同風',
-u'以規爲瑱',
-u'一貴一贱交情乃見',
-u'疑鬼疑神',
-u'一棍打一船',
-u'一棍子打死',
-u'移國動衆',
-u'益國利民',
-u'一國三公',
-u'醫國醫民',
-u'義海恩山',
-u'贻害無窮',
-u'饴含抱孫',
-u'一寒如此',
-u'一寒至此',
-u'一毫不差',
-u'一毫不苟',
-u'一毫不染',
-u'一毫千裏',
-u'一毫之惡',
-u'一毫之善',
-u'一呵而就',
-u'一禾九穗',
-u'意合情投',
-u'以荷析薪',
-u'一合再離',
-u'以黑爲白',
-u'一狠百狠',
-u'一狠二狠',
-u'遺恨千古',
-u'遺恨終天',
-u'一哄而起',
-u'一轟而散',
-u'一哄而上',
-u'一呼百諾',
-u'一呼百應',
-u'一虎不河',
-u'一斛涼州',
-u'依葫蘆畫瓢',
-u'一壺千金',
-u'異乎尋常',
-u'一呼再諾',
-u'一狐之腋',
-u'一花獨放',
-u'遺華反質',
-u'移花接木',
-u'一畫開天',
-u'一花五葉',
-u'一褱而論',
-u'移緩就急',
-u'遺患無窮',
-u'一還一報',
-u'一簧兩舌',
-u'一麾出守',
-u'一揮而成',
-u'一揮而就',
-u'一揮九制',
-u'一回生二回熟',
-u'一回生兩回熟',
-u'以毀爲罰',
-u'一晦一明',
-u'遺惠馀澤',
-u'遺魂亡魄',
-u'以火救火',
-u'以火去蛾',
-u'遺禍無窮',
-u'以火止沸',
-u'以計代戰',
-u'以己度人',
-u'蟻集蜂攢',
-u'儀祭海袍',
-u'一饑兩飽',
-u'驿寄梅花',
-u'遺迹談虛',
-u'藝伎遺骨',
-u'一技之長',
-u'一己之見',
-u'一己之私',
-u'一家飽暖千家怨',
-u'衣架飯囊',
-u'一家骨肉',
-u'一家眷屬',
-u'一家老小',
-u'以假亂真',
-u'一家無二',
-u'一家一火',
-u'一家一計',
-u'一甲一名',
-u'宜家宜室',
-u'一家有女百家求',
-u'一家有事百家忙',
-u'一家之辭',
-u'一家之計',
-u'一家之計在于和',
-u'一家之學',
-u'一家之言',
-u'一家之作',
-u'一箭就上垛',
-u'一見了然',
-u'一肩兩鋤',
-u'一見破敗',
-u'一見傾心',
-u'一見如故',
-u'一見如舊',
-u'一箭上垛',
-u'一箭雙雕',
-u'遺艱投大',
-u'以簡馭繁',
-u'一箭之地',
-u'以煎止燔',
-u'一劍之任',
-u'一箭之遙',
-u'一見鍾情',
-u'義漿仁粟',
-u'一漿十餅',
-u'一腳不移',
-u'一腳高一腳低',
-u'以膠投漆',
-u'倚姣作媚',
-u'一介不苟',
-u'一介不取',
-u'義結金蘭',
-u'一街兩巷',
-u'一接如舊',
-u'一介書生',
-u'一介行人',
-u'一介之才',
-u'一介之善',
-u'一介之士',
-u'一緊二慢三罷休',
-u'衣錦過鄉',
-u'衣錦還鄉',
-u'衣錦褧衣',
-u'衣錦榮歸',
-u'衣錦食肉',
-u'衣錦夜行',
-u'衣錦夜遊',
-u'衣錦晝行',
-u'衣錦晝遊',
-u'依經傍注',
-u'一莖九穗',
-u'一莖六穗',
-u'儀靜體閑',
-u'以儆效尤',
-u'頤精養神',
-u'一經召喚',
-u'以酒解酲',
-u'一九三六年春在太原',
-u'一舉成功',
-u'一舉成名',
-u'蟻聚蜂攢',
-u'蟻聚蜂屯',
-u'一句話也藏不住',
-u'一舉兩得',
-u'一舉兩全',
-u'一舉千裏',
-u'一舉三反',
-u'一舉首登龍虎榜',
-u'一舉手一投足',
-u'一舉手之勞',
-u'一句說不得',
-u'一舉萬裏',
-u'一舉一動',
-u'蟻聚之兵',
-u'一蹶不興',
-u'一蹶不振',
-u'一決雌雄',
-u'以絕後患',
-u'一決勝負',
-u'诒厥孫謀',
-u'诒厥之謀',
-u'贻厥子孫',
-u'異軍特起',
-u'異軍突起',
-u'一看就明白',
-u'依靠民衆的力量',
-u'一客不煩二主',
-u'一客不煩兩家',
-u'以渴服馬',
-u'亦可覆舟',
-u'一刻千金',
-u'一棵樹上吊死人',
-u'一刻值千金',
-u'一孔不達',
-u'一孔出氣',
-u'一空依傍',
-u'一孔之見',
-u'一口不能着兩匙',
-u'一口長齋',
-u'一口吃個胖子',
-u'一口兩舌',
-u'一口三舌',
-u'一口同聲',
-u'一口同音',
-u'異口同韻',
-u'以口問心',
-u'一口吸盡西江水',
-u'一口吸盡西江水一壁',
-u'一口咬定',
-u'一口一聲',
-u'易口以食',
-u'一口應允',
-u'一哭二鬧三上吊',
-u'憶苦思甜',
-u'一塊石頭落地',
-u'一塊石頭落了地',
-u'以快先睹',
-u'衣寬帶松',
-u'一匡九合',
-u'一匡天下',
-u'一潰如泄',
-u'一饋十起',
-u'蟻潰鼠駭',
-u'一夔一契',
-u'一夔已足',
-u'一篑之功',
-u'一壸千金',
-u'一臘一鬥珠',
-u'一來二去',
-u'衣來伸手',
-u'衣來伸手飯來張口',
-u'一來一往',
-u'一攬包收',
-u'一覽無遺',
-u'一覽無馀',
-u'意懶心灰',
-u'意懶心慵',
-u'一浪更比一浪高',
-u'遺老孤臣',
-u'一勞久逸',
-u'以老賣老',
-u'遺老遺少',
-u'一老一實',
-u'一勞永逸',
-u'轶類超群',
-u'一雷二閃',
-u'以類相從',
-u'屹立不搖',
-u'以蠡測海',
-u'一力承當',
-u'以狸餌鼠',
-u'以力服人',
-u'遺黎故老',
-u'一力降十會',
-u'以利累形',
-u'一例相待',
-u'以狸至鼠',
-u'以狸緻鼠以冰緻繩',
-u'一廉如水',
-u'一了百當',
-u'一了百了',
-u'意料之外',
-u'一鱗半甲',
-u'一鱗半爪',
-u'一鱗片甲',
-u'一鱗片爪',
-u'以鄰爲壑',
-u'一鱗一爪',
-u'一靈真性',
-u'以六尺爲一步',
-u'依流平進',
-u'一龍一蛇',
-u'一龍一豬',
-u'一路風塵',
-u'一路風清',
-u'一路福星',
-u'一路貨色',
-u'驿路梅花',
-u'一路平安',
-u'一路神祇',
-u'一路順風',
-u'異路同歸',
-u'以鹿爲馬',
-u'以卵敵石',
-u'以卵擊石',
-u'以卵投石',
-u'一亂塗地',
-u'意亂心忙',
-u'議論多成功少',
-u'議論紛錯',
-u'議論紛紛',
-u'議論紛纭',
-u'議論風發',
-u'議論風生',
-u'議論英發',
-u'一落千丈',
-u'遺落世事',
-u'倚闾望切',
-u'一馬不背兩鞍',
-u'一馬不行百馬憂',
-u'一馬當先',
-u'倚馬可待',
-u'一馬難将兩鞍鞴',
-u'一馬平川',
-u'倚馬七紙',
-u'倚馬千言',
-u'衣馬輕肥',
-u'意馬心猿',
-u'一馬一鞍',
-u'一脈天真',
-u'一脈同氣',
-u'一脈相承',
-u'一脈相傳',
-u'一脈相通',
-u'一脈香煙',
-u'意滿志得',
-u'一毛不拔',
-u'以貌取人',
-u'以毛相馬',
-u'溢美溢惡',
-u'一美遮百醜',
-u'溢美之辭',
-u'溢美之言',
-u'溢美之語',
-u'依門傍戶',
-u'倚門窺戶',
-u'倚門賣俏',
-u'依門賣笑',
-u'一門千指',
-u'一門同氣',
-u'倚門獻笑',
-u'一門心思',
-u'倚門倚闾',
-u'一門一姓',
-u'一夢華胥',
-u'一面如舊',
-u'一面之詞',
-u'一面之交',
-u'一面之款',
-u'一面之識',
-u'一面之雅',
-u'一面之緣',
-u'一民同俗',
-u'醫民醫國',
-u'一暝不視',
-u'一命歸西',
-u'一命歸陰',
-u'一鳴驚人',
-u'一命鳴呼',
-u'遺名去利',
-u'異名同實',
-u'一銘網吧',
-u'一命嗚呼',
-u'一命之榮',
-u'以沫相濡',
-u'一模一樣',
-u'一模二樣',
-u'一目了然',
-u'一木難扶',
-u'一木難之',
-u'一木難支大廈',
-u'異木奇花',
-u'一沐三捉發',
-u'一目十行',
-u'一目數行',
-u'一目五行',
-u'一目之士',
-u'一木之枝',
-u'一男半女',
-u'疑難雜症',
-u'亦能覆舟',
-u'旖旎風光',
-u'一年半載',
-u'一年被蛇咬',
-u'一年被蛇咬三年怕草索',
-u'一年被蛇咬三年怕井繩',
-u'一年被蛇咬十年怕井繩',
-u'一年不如一年',
-u'一年春盡一年春',
-u'一年到頭',
-u'一年容易',
-u'一年三節',
-u'一年一度',
-u'一念之差',
-u'一年之計莫如樹谷',
-u'一年之計在于春',
-u'一念之誤',
-u'遺孽馀烈',
-u'一牛吼地',
-u'一牛九鎖',
-u'一牛鳴地',
-u'一諾千金',
-u'一諾無辭',
-u'一拍即合',
-u'一盤散沙',
-u'一噴一醒',
-u'一屁股兩肋的債',
-u'一片冰心',
-u'一片赤心',
-u'一片丹心',
-u'遺篇斷簡',
-u'以偏概全',
-u'一片宮商',
-u'一片胡言',
-u'一片焦土',
-u'一片苦心',
-u'一片散沙',
-u'一片汪洋',
-u'一片至誠',
-u'一偏之見',
-u'一偏之論',
-u'遺篇墜款',
-u'一品白衫',
-u'一貧如洗',
-u'一颦一笑',
-u'一抔黃土',
-u'一暴十寒',
-u'一旗半槍',
-u'意氣飛揚',
-u'意氣風發',
-u'意氣高昂',
-u'一氣呵成',
-u'一氣渾成',
-u'以其昏昏',
-u'以其昏昏使人昭昭',
-u'遺棄技能',
-u'一栖兩雄',
-u'以其人之道',
-u'以其人之道還治其人之身',
-u'意氣相得',
-u'意氣相合',
-u'意氣相傾',
-u'義氣相投',
-u'意氣軒昂',
-u'移氣養體',
-u'意氣揚揚',
-u'一氣一個死兒',
-u'一旗一槍',
-u'意氣用事',
-u'意氣之争',
-u'一齊衆楚',
-u'意氣自如',
-u'意氣自若',
-u'一千八百擔',
-u'意前筆後',
-u'一錢不落虛空地',
-u'一錢不名',
-u'一錢不值',
-u'一乾二淨',
-u'益謙虧盈',
-u'一錢難倒英雄漢',
-u'一錢如命',
-u'一謙四益',
-u'以千歲爲一朝',
-u'抑強扶弱',
-u'以強淩弱',
-u'一牆難擋八面風',
-u'以強勝弱',
-u'一槍一旗',
-u'一竅不通',
-u'贻诮多方',
-u'一鍬掘個井',
-u'一竅通百竅通',
-u'一切平等',
-u'誼切苔岑',
-u'一切萬物',
-u'一切現成',
-u'一切衆生',
-u'以勤補拙',
-u'一琴一鶴',
-u'遺寝載懷',
-u'衣輕乘肥',
-u'一清二白',
-u'一清二楚',
-u'怡情理性',
-u'移情遣意',
-u'一清如水',
-u'怡情養性',
-u'怡情悅性',
-u'一窮二白',
-u'易求無價寶難得有情人',
-u'以求一逞',
-u'一丘一壑',
-u'一邱之貉',
-u'一去不複返',
-u'逸趣橫生',
-u'以屈求伸',
-u'異曲同工',
-u'一曲陽關',
-u'亦趨亦步',
-u'一曲之見',
-u'一曲之士',
-u'以權達變',
-u'一犬吠形',
-u'一犬吠形百犬吠聲',
-u'以權謀私',
-u'一拳碎黃鶴',
-u'以筌爲魚',
-u'一拳柱定',
-u'轶群絕類',
-u'逸群絕倫',
-u'逸群之才',
-u'依然故我',
-u'毅然決然',
-u'依然如故',
-u'怡然自得',
-u'怡然自樂',
-u'夷然自若',
-u'一讓一個肯',
-u'意惹情牽',
-u'一人不敵兩人計',
-u'一人不敵衆人智',
-u'一人差不及一步',
-u'一人承擔',
-u'一人傳虛',
-u'一人傳虛萬人傳實',
-u'一人當十',
-u'一人道好',
-u'一人得道',
-u'一人得道雞犬飛升',
-u'一人得道雞犬升天',
-u'一人飛升仙及雞犬',
-u'以人廢言',
-u'一人複楚',
-u'一人過急一步',
-u'弋人何篡',
-u'贻人口舌',
-u'贻人口實',
-u'依人籬下',
-u'一人立志萬夫莫奪',
-u'一人兩心',
-u'倚人盧下',
-u'疑人莫托托人莫疑',
-u'疑人莫用',
-u'一人難唱獨闆腔',
-u'一人難順百人意',
-u'一人拼命萬夫莫當',
-u'一人拼命萬夫難擋',
-u'一人善射',
-u'一人善射百夫決拾',
-u'一人甚緩',
-u'一人首倡',
-u'一人貪戾',
-u'以忍爲阍',
-u'以人爲鑒',
-u'以人爲鏡',
-u'疑人勿使使人勿疑',
-u'疑人勿用',
-u'疑人勿用用人莫疑',
-u'疑人勿用用人勿疑',
-u'一人向隅滿座不歡',
-u'一人向隅滿坐不樂',
-u'一人一般心',
-u'一人永占',
-u'一人有慶',
-u'一人造反九族全誅',
-u'以人擇官',
-u'一人之交',
-u'一人之下',
-u'一人之下萬人之上',
-u'一人之心千萬人之心也',
-u'一人做事一人當',
-u'一人作罪一人當',
-u'一仍舊貫',
-u'一日必葺',
-u'一日不稼百日不食',
-u'一日不見',
-u'一日不見如隔三秋',
-u'一日不識羞三日不忍餓',
-u'移日蔔夜',
-u'一日夫妻',
-u'一日夫妻百日恩',
-u'以日繼夜',
-u'一日叫娘終身是母',
-u'一日九遷',
-u'一日千裏',
-u'一日千丈',
-u'一日三覆',
-u'一日三秋',
-u'一日三歲',
-u'一日三省',
-u'一日三月',
-u'一日身死',
-u'一日萬幾',
-u'一日萬裏',
-u'以日爲年',
-u'一日爲親終久托福',
-u'一日爲師終生爲父',
-u'一日之長',
-u'一日之計在于晨',
-u'一日之計在于寅',
-u'一日之雅',
-u'以容取人',
-u'以肉啖虎',
-u'以柔克剛',
-u'以肉去蟻',
-u'以肉驅蠅',
-u'以肉餧虎',
-u'以肉喂虎',
-u'以柔制剛',
-u'一肉之味',
-u'易如反幾',
-u'易如反掌',
-u'一如既往',
-u'易如破竹',
-u'易如拾芥',
-u'易如拾遺',
-u'易如轉規',
-u'以弱勝強',
-u'以弱制強',
-u'抑塞磊落',
-u'一掃而光',
-u'一掃而空',
-u'以殺去殺',
-u'以殺止殺',
-u'移山拔海',
-u'依山傍水',
-u'一山不藏二虎',
-u'一山不容二虎',
-u'移山倒海',
-u'移山回海',
-u'移山竭海',
-u'移山跨海',
-u'衣衫藍縷',
-u'一山難容二虎',
-u'移山填海',
-u'移山造海',
-u'移商換羽',
-u'一觞一詠',
-u'衣裳之會',
-u'羿射九日',
-u'一蛇兩頭',
-u'一射之地',
-u'以身報國',
-u'一身充二任',
-u'遺哂大方',
-u'一身都是膽',
-u'一身而二任',
-u'一身二任',
-u'疑神見鬼',
-u'一身兩頭',
-u'一身兩役',
-u'一身是膽',
-u'以身試法',
-u'一身是糁',
-u'以身試險',
-u'以慎爲鍵',
-u'一身五心',
-u'以身許國',
-u'以身殉國',
-u'以身殉職',
-u'頤神養氣',
-u'頤神養壽',
-u'頤神養性',
-u'疑神疑鬼',
-u'一身做不得兩件事',
-u'以身作則',
-u'一聲不響',
-u'一生都是命安排',
-u'一生九死',
-u'以升量石',
-u'怡聲下氣',
-u'一生一代',
-u'一生一世',
-u'遺聲馀價',
-u'一生之計在于勤',
-u'遺聲墜緒',
-u'一十八層地獄',
-u'遺世拔俗',
-u'一時半刻',
-u'一時半霎',
-u'一時半晌',
-u'一時伯仲',
-u'一事不知',
-u'一事不知學者之恥',
-u'衣食不周',
-u'遺世獨立',
-u'一士谔谔',
-u'一世兒吃不了',
-u'一石二鳥',
-u'衣食父母',
-u'一時橫流',
-u'一事精百事精',
-u'醫時救弊',
-u'遺世絕俗',
-u'一時口惠',
-u'一時亮瑜',
-u'倚勢淩人',
-u'一世龍門',
-u'驿使梅花',
-u'一時名流',
-u'一時千載',
-u'一時權宜',
-u'一世如駒過隙',
-u'一時三刻',
-u'一室生春',
-u'一矢雙穿',
-u'衣食稅租',
-u'一視同仁',
-u'以石投卵',
-u'以石投水',
-u'遺世忘累',
-u'一事無成',
-u'疑事無功',
-u'一世異朝市',
-u'一是一二是二',
-u'宜室宜家',
-u'一時一刻',
-u'轶事遺聞',
-u'一式一樣',
-u'刈蓍遺簪',
-u'一時瑜亮',
-u'遺世越俗',
-u'一時之權',
-u'一世之雄',
-u'一時之秀',
-u'一時之選',
-u'衣食住行',
-u'一失足成千古恨',
-u'一手包辦',
-u'一手包攬',
-u'一手承運',
-u'一手獨拍',
-u'一手獨拍雖疾無聲',
-u'以手加額',
-u'一手交錢一手交貨',
-u'一手難掩天下人耳目',
-u'以售其奸',
-u'一手提拔',
-u'一手托天',
-u'以守爲攻',
-u'一手五指',
-u'益壽延年',
-u'一手一腳',
-u'一手一足',
-u'一手遮天',
-u'一樹百獲',
-u'以疏間親',
-u'醫術精湛',
-u'以書爲禦',
-u'以叔援嫂',
-u'一輸再輸',
-u'醫術湛深',
-u'一雙兩好',
-u'沂水春風',
-u'以水濟水',
-u'以水救水',
-u'以水投石',
-u'以水投水',
-u'沂水舞雩',
-u'以水洗血',
-u'沂水弦歌',
-u'一絲半氣',
-u'一絲半絲',
-u'一絲半粟',
-u'一絲不苟',
-u'一絲不挂',
-u'一絲不紊',
-u'以私廢公',
-u'以私害公',
-u'一絲兩縷',
-u'一絲兩氣',
-u'一絲一毫',
-u'一死一生',
-u'一死一生乃知交情',
-u'疑似之間',
-u'遺俗絕塵',
-u'易俗移風',
-u'一歲九遷',
-u'一歲三遷',
-u'一穗三秀',
-u'一歲使長百歲奴',
-u'一歲載赦',
-u'一索成男',
-u'一索得男',
-u'以索續組',
-u'一塌刮子',
-u'一榻橫陳',
-u'一塌胡塗',
-u'一塌括子',
-u'一台二絕',
-u'一台二妙',
-u'逸态橫生',
-u'儀态萬方',
-u'儀态萬千',
-u'一潭死水',
-u'一彈指頃',
-u'以螳當車',
-u'以湯沃沸',
-u'以湯沃雪',
-u'怡堂燕雀',
-u'以湯止沸',
-u'以桃代李',
-u'一體同心',
-u'倚天拔地',
-u'一天半天',
-u'一天到晚',
-u'移天換日',
-u'移天徙日',
-u'以天下爲己任',
-u'一天星鬥',
-u'一天一地',
-u'一天一個現在',
-u'移天易日',
-u'一條道走到黑',
-u'一條手臂',
-u'一條跳闆上走路',
-u'一聽就懂了',
-u'以莛叩鍾',
-u'以莛撞鍾',
-u'一通百通',
-u'易同反掌',
-u'一統天下',
-u'一頭放火一頭放水',
-u'依頭縷當',
-u'依頭順尾',
-u'一頭撞倒南牆',
-u'異途同歸',
-u'一吐爲快',
-u'一團和氣',
-u'疑團滿腹',
-u'疑團莫釋',
-u'一團漆黑',
-u'一推兩搡',
-u'一退六二五',
-u'以退爲進',
-u'意外的變化',
-u'意外停機',
-u'一碗飯時',
-u'以萬裏爲一步',
-u'一碗水端平',
-u'一碗水往平處端',
-u'億萬斯年',
-u'一丸五色',
-u'億萬之心',
-u'億萬之衆',
-u'一網打盡',
-u'一往而深',
-u'一望而知',
-u'以往鑒來',
-u'一網盡掃',
-u'一往情深',
-u'意往神馳',
-u'一望無邊',
-u'一望無際',
-u'一往無前',
-u'一望無垠',
-u'一往直前',
-u'以爲後圖',
-u'一葦可航',
-u'依違兩可',
-u'以僞亂真',
-u'意味深長',
-u'以微知着',
-u'以微知著',
-u'一文不名',
-u'一文不值',
-u'異聞傳說',
-u'以文害辭',
-u'以文會友',
-u'以文亂法',
-u'一文錢難倒英雄漢',
-u'一聞千悟',
-u'逸聞趣事',
-u'一文如命',
-u'一問三不知',
-u'逸聞瑣事',
-u'一問一個肯',
-u'遺文逸句',
-u'一問一臨',
-u'轶聞遺事',
-u'一卧不起',
-u'一物不成兩物現在',
-u'一物不将',
-u'一物不知',
-u'一無長物',
-u'以五尺爲一步',
-u'義無反顧',
-u'一嗚驚人',
-u'贻誤軍機',
-u'一無可取',
-u'一誤豈能再誤',
-u'贻誤戎機',
-u'一無是處',
-u'遺物識心',
-u'一無所長',
-u'一無所成',
-u'一無所得',
-u'一無所好',
-u'一無所獲',
-u'一無所能',
-u'一無所求',
-u'一無所取',
-u'一無所聞',
-u'一無所有',
-u'一無所知',
-u'遺物忘形',
-u'一無下落',
-u'一物降一物',
-u'義無旋踵',
-u'一五一十',
-u'以物易物',
-u'一物一制',
-u'一物一主',
-u'一誤再誤',
-u'一物自有一主',
-u'一息尚存',
-u'以郄視文',
-u'一息奄奄',
-u'宜喜宜嗔',
-u'一夕一朝',
-u'一席之地',
-u'一獻三酬',
-u'一獻三售',
-u'一線生機',
-u'一現昙華',
-u'一線希望',
-u'夷險一節',
-u'一線之路',
-u'衣香鬓影',
-u'意想不到',
-u'異香撲鼻',
-u'一廂情原',
-u'異想天開',
-u'意向系統',
-u'一笑百媚',
-u'以小搏大',
-u'贻笑大方',
-u'贻笑後人',
-u'以小見大',
-u'一笑了事',
-u'一笑了之',
-u'贻笑千古',
-u'一笑千金',
-u'贻笑千秋',
-u'一笑傾城',
-u'以小人之心',
-u'以小人之心度君子之腹',
-u'衣宵食旰',
-u'贻笑萬世',
-u'移孝爲忠',
-u'一笑一颦',
-u'一笑值千金',
-u'一笑置之',
-u'移孝作忠',
-u'一瀉百裏',
-u'一些半些',
-u'一蟹不如一蟹',
-u'一瀉千裏',
-u'一瀉萬裏',
-u'一瀉汪洋',
-u'疑信參半',
-u'以心傳心',
-u'一心挂兩頭',
-u'疑心生暗鬼',
-u'一心同功',
-u'一心同歸',
-u'一心同體',
-u'億辛萬苦',
-u'以心問心',
-u'一心無二',
-u'一心無挂礙',
-u'依心像意',
-u'一心一德',
-u'一心一腹',
-u'一心一計',
-u'一心一力',
-u'一心一路',
-u'一心一意',
-u'意興盎然',
-u'一星半點',
-u'遺形藏志',
-u'逸興遄飛',
-u'逸興橫飛',
-u'移星換鬥',
-u'義行可風',
-u'遺形去貌',
-u'以刑去刑',
-u'意興索然',
-u'遺形忘性',
-u'疑行無成',
-u'怡性養神',
-u'頤性養壽',
-u'義形于色',
-u'逸興雲飛',
-u'以刑緻刑',
-u'一行作吏',
-u'贻羞萬年',
-u'衣繡夜行',
-u'衣繡夜遊',
-u'遺休馀烈',
-u'衣繡晝行',
-u'醫學成像',
-u'蟻穴壞堤',
-u'蟻穴潰堤',
-u'以血洗血',
-u'以學愈愚',
-u'蟻穴自封',
-u'一薰一莸',
-u'遺訓馀風',
-u'以牙還牙',
-u'易牙之味',
-u'一言半辭',
-u'一言半句',
-u'一言半語',
-u'一言不發',
-u'一言不合',
-u'一言不再',
-u'一言抄百種',
-u'一言抄百總',
-u'一言出口驷馬難追',
-u'一言而定',
-u'一言偾事',
-u'以眼還眼',
-u'以眼還眼以牙還牙',
-u'一言既出',
-u'一言既出如白染皂',
-u'一言既出驷馬難追',
-u'一言九鼎',
-u'以言舉人',
-u'一言可采',
-u'一言可盡',
-u'一言可辟',
-u'一言賴語',
-u'一言兩語',
-u'一言難盡',
-u'一言難罄',
-u'一言千金',
-u'以言取人',
-u'以言取人惟恐有失',
-u'一言喪邦',
-u'一言爲定',
-u'以言爲諱',
-u'一言陷人',
-u'一言興邦',
-u'一言興邦一言喪邦',
-u'一言興國',
-u'溢言虛美',
-u'以言徇物',
-u'一言以敝',
-u'一言以蔽之',
-u'一言一行',
-u'怡顔悅色',
-u'一言之信',
-u'一言中的',
-u'抑揚頓挫',
-u'依樣葫蘆',
-u'依樣畫葫蘆',
-u'頤養精神',
-u'一樣米飼百樣人',
-u'以養傷身',
-u'一樣生意兩樣做',
-u'頤養天年',
-u'以羊易牛',
-u'一搖三晃',
-u'一葉報秋',
-u'一夜被蛇咬十日怕麻繩',
-u'以噎廢飡',
-u'一夜夫妻百夜恩',
-u'以夜繼日',
-u'以夜繼朝',
-u'以夜繼晝',
-u'一葉落而知秋',
-u'一葉落知天下秋',
-u'一葉迷山',
-u'一夜受孤凄',
-u'一夜未眠',
-u'以夜續晝',
-u'一葉障目',
-u'一葉障目不見泰山',
-u'一噎止餐',
-u'一葉知秋',
-u'悒悒不樂',
-u'依依不舍',
-u'以镒稱铢',
-u'以一持萬',
-u'逸以待勞',
-u'一衣帶水',
-u'一以當百',
-u'一以當十',
-u'以義斷恩',
-u'以夷伐夷',
-u'翼翼飛鸾',
-u'以一奉百',
-u'以義割恩',
-u'以夷攻夷',
-u'一意孤行',
-u'一以貫之',
-u'以逸擊勞',
-u'以一警百',
-u'以疑決疑',
-u'薏苡蒙謗',
-u'薏苡明珠',
-u'以意逆志',
-u'移易遷變',
-u'意義深長',
-u'以意爲之',
-u'依依惜別',
-u'翼翼小心',
-u'薏苡之謗',
-u'薏苡之讒',
-u'以一知萬',
-u'以夷制夷',
-u'一飲而盡',
-u'以蚓投魚',
-u'一吟一詠',
-u'一飲一啄',
-u'遺音馀韻',
-u'一應俱全',
-u'一迎一和',
-u'挹盈注虛',
-u'一擁而入',
-u'一擁而上',
-u'蟻擁蜂攢',
-u'意猶未足',
-u'移有足無',
-u'一語不發',
-u'一雨成秋',
-u'一語道破',
-u'以玉抵鵲',
-u'以玉抵烏',
-u'抑郁寡歡',
-u'以譽進能',
-u'一語驚醒夢中人',
-u'瘗玉埋香',
-u'一語破的',
-u'以魚驅蠅',
-u'一隅三反',
-u'一語雙關',
-u'以譽爲賞',
-u'倚玉偎香',
-u'溢于言表',
-u'溢于言外',
-u'一予一奪',
-u'一隅之地',
-u'一隅之見',
-u'一隅之說',
-u'一語中的',
-u'一語中人',
-u'一語撞倒牆',
-u'以怨報德',
-u'一元大武',
-u'一元複始',
-u'一元更始',
-u'一緣一會',
-u'一緣緣悭',
-u'一月九遷',
-u'逸韻高緻',
-u'意在筆前',
-u'意在筆先',
-u'意在沛公',
-u'意在言外',
-u'遺簪弊屦',
-u'遺簪弊履',
-u'遺簪堕珥',
-u'遺簪堕履',
-u'遺簪絕纓',
-u'遺簪棄舄',
-u'遺簪脫舄',
-u'遺簪墜珥',
-u'遺簪墜屦',
-u'遺簪墜履',
-u'遺簪墜舄',
-u'以澤量屍',
-u'一則以懼',
-u'一則以喜',
-u'一則以喜一則以懼',
-u'易箦之際',
-u'一眨巴眼',
-u'一紮腳兒',
-u'一宅分兩院',
-u'一戰成名',
-u'一戰定乾坤',
-u'一戰定勝負',
-u'以戰去戰',
-u'以戰養戰',
-u'一丈五尺',
-u'一張一弛',
-u'易漲易退山溪水',
-u'一張嘴不能言兩宗事',
-u'一朝被蛇咬三年怕井繩',
-u'一朝被蛇咬十年怕井繩',
-u'一着不慎',
-u'一着不慎滿盤皆輸',
-u'一着不慎全盤皆輸',
-u'一朝懷胎十月分娩',
-u'一朝千裏',
-u'一朝權在手',
-u'一朝權在手便把令來行',
-u'一朝一夕',
-u'億兆一心',
-u'一朝之忿',
-u'一朝之患',
-u'一着走錯滿盤皆輸',
-u'易轍改弦',
-u'一折一磨',
-u'一枕邯鄲',
-u'一枕槐安',
-u'一枕黃梁',
-u'一針見血',
-u'一枕南柯',
-u'一針一線',
-u'義正詞嚴',
-u'義正辭約',
-u'一争兩醜一讓兩有',
-u'一正壓百邪',
-u'一緻百慮',
-u'一擲百萬',
-u'一知半見',
-u'一肢半節',
-u'以直報怨',
-u'以指測河',
-u'頤指風使',
-u'一緻估計',
-u'一紙具文',
-u'一紙空文',
-u'以指撓沸',
-u'一知片解',
-u'頤指氣使',
-u'一擲千金',
-u'一擲乾坤',
-u'一之謂甚',
-u'意志消沉',
-u'怡志養神',
-u'一肢一節',
-u'一枝一栖',
-u'一之已甚',
-u'一至于此',
-u'一至于斯',
-u'意志之冠',
-u'意志之力',
-u'一枝之栖',
-u'以衆暴寡',
-u'義重恩深',
-u'以終天年',
-u'一中同長',
-u'一周七喜',
-u'一柱承天',
-u'以铢稱镒',
-u'一竹竿打到底',
-u'遺珠棄璧',
-u'一柱擎天',
-u'以珠彈雀',
-u'意轉心回',
-u'亦莊亦諧',
-u'以錐餐壺',
-u'以錐飡壸',
-u'以錐刺地',
-u'一錐子紮不出個屁來',
-u'一資半級',
-u'一字半句',
-u'一字褒貶',
-u'一字不苟',
-u'一字不識',
-u'一字不提',
-u'一字不忘',
-u'一字不易',
-u'一字長城',
-u'一字長蛇陣',
-u'一子出家九祖升天',
-u'一子出家七祖升天',
-u'一字兼金',
-u'一字連城',
-u'以紫亂朱',
-u'一字千金',
-u'一字千鈞',
-u'一字千秋',
-u'一字入公門',
-u'一字三缣',
-u'以紫爲朱',
-u'一子悟道九族生天',
-u'衣紫腰黃',
-u'衣紫腰金',
-u'衣紫腰銀',
-u'一字一闆',
-u'一字一句',
-u'一字一淚',
-u'一字一珠',
-u'以子之矛',
-u'以子之矛攻子之盾',
-u'一字值千金',
-u'一字之師',
-u'一宗不了又一宗',
-u'一走了之',
-u'衣租食稅',
-u'一足曳後',
-u'一足引前',
-u'一卒之令',
-u'一醉解千愁',
-u'移樽就教',
-u'一座冰山化雪水',
-u'一坐皆驚',
-u'一坐盡驚',
-u'一坐盡傾',
-u'一坐一起',
-u'飲冰茹檗',
-u'飲冰茹蘖',
-u'飲冰食檗',
-u'飲冰食蘖',
-u'飲冰吞檗',
-u'因才施教',
-u'陰曹地府',
-u'陰差陽錯',
-u'引車賣漿',
-u'寅吃卯糧',
-u'龂齒彈舌',
-u'飲醇自醉',
-u'淫詞穢語',
-u'淫辭邪說',
-u'淫詞亵語',
-u'淫詞豔曲',
-u'隐錯撒播',
-u'陰錯陽差',
-u'飲膽嘗血',
-u'飲酖止渴',
-u'陰地好不如心地好',
-u'因敵取資',
-u'因敵爲資',
-u'因地制宜',
-u'飲犢上流',
-u'引短推長',
-u'喑噁叱咤',
-u'隐惡揚善',
-u'因而變之',
-u'引而不發',
-u'因風吹火',
-u'因風吹火用力不多',
-u'吟風弄月',
-u'吟風詠月',
-u'因風縱火',
-u'陰服微行',
-u'因公假私',
-u'因公行私',
-u'引狗入寨',
-u'飲谷栖丘',
-u'堙谷塹山',
-u'引古喻今',
-u'引古證今',
-u'引鬼上門',
-u'因果報應',
-u'因果邏輯',
-u'因果推理',
-u'引過自責',
-u'引吭悲歌',
-u'引吭高唱',
-u'引吭高歌',
-u'引吭高聲',
-u'殷浩書空',
-u'銀河倒瀉',
-u'飲河滿腹',
-u'飲河鼹鼠',
-u'飲恨而終',
-u'飲恨吞聲',
-u'引虎拒狼',
-u'引虎入室',
-u'引虎自衛',
-u'銀花火樹',
-u'吟花詠柳',
-u'隐晦曲折',
-u'飲灰洗胃',
-u'陰魂不散',
-u'因禍得福',
-u'引火燒身',
-u'引火手杖',
-u'因禍爲福',
-u'隐迹鬼魂',
-u'隐迹埋名',
-u'銀甲護腿',
-u'殷鑒不遠',
-u'引腳分配',
-u'引經據典',
-u'引經據古',
-u'引頸受戮',
-u'引咎責躬',
-u'引咎自責',
-u'引狼拒虎',
-u'引狼入室',
-u'引狼自衛',
-u'引類呼朋',
-u'印累绶若',
-u'因利乘便',
-u'引領而望',
-u'因陋就寡',
-u'因陋就簡',
-u'因陋守舊',
-u'飲露餐風',
-u'引律比附',
-u'飲馬長江',
-u'飲馬投錢',
-u'殷民阜财',
-u'隐名埋姓',
-u'陰謀詭計',
-u'陰謀飾物',
-u'陰謀之書',
-u'因難見巧',
-u'寅年吃了卯糧',
-u'陰凝冰堅',
-u'陰凝堅冰',
-u'淫朋密友',
-u'淫朋狎友',
-u'崟崎磊落',
-u'崟崎曆落',
-u'飲氣吞聲',
-u'飲泉清節',
-u'隐然敵國',
-u'隐忍不發',
-u'隐忍不言',
-u'因人成事',
-u'因人而異',
-u'引人入勝',
-u'因任授官',
-u'因人制宜',
-u'引人注目',
-u'引日成歲',
-u'音容凄斷',
-u'音容如在',
-u'音容宛在',
-u'音容笑貌',
-u'隐若敵國',
-u'陰山背後',
-u'引商刻角',
-u'引商刻羽',
-u'引伸觸類',
-u'淫聲浪态',
-u'淫聲浪語',
-u'引繩排根',
-u'引繩批根',
-u'引繩棋布',
-u'引繩切墨',
-u'音聲如鍾',
-u'因勢利導',
-u'飲食男女',
-u'飲食男女人之大欲',
-u'飲食起居',
-u'因事制宜',
-u'引手投足',
-u'引首以望',
-u'因樹爲屋',
-u'印刷體漢字識別',
-u'飲水辨源',
-u'飲水啜菽',
-u'飲水栖衡',
-u'飲水曲肱',
-u'引水入牆',
-u'飲水食蘖',
-u'飲水食菽',
-u'飲水思源',
-u'飲水知源',
-u'因斯迪安',
-u'音素爆破',
-u'因特網平台提供者',
-u'隐天蔽日',
-u'音問兩絕',
-u'因烏及屋',
-u'引物連類',
-u'因襲陳規',
-u'茵席之臣',
-u'引線穿針',
-u'因小失大',
-u'淫心大動',
-u'淫心匿行',
-u'引新吐故',
-u'音信杳無',
-u'隐姓埋名',
-u'飲血崩心',
-u'飲血茹毛',
-u'飲血雙刀',
-u'因循苟且',
-u'因循守舊',
-u'因循坐誤',
-u'淫言诐行',
-u'淫言狎語',
-u'淫言媟語',
-u'陰陽慘舒',
-u'陰陽怪氣',
-u'陰陽交錯',
-u'銀樣蠟槍頭',
-u'陰陽雙劍',
-u'因噎廢食',
-u'引以爲恥',
-u'引以爲憾',
-u'引以爲戒',
-u'引以爲榮',
-u'陰疑陽戰',
-u'龈龈計較',
-u'隐隐約約',
-u'陰影抗性',
-u'陰影之爪',
-u'殷憂啓聖',
-u'引喻失義',
-u'引玉之磚',
-u'夤緣而上',
-u'夤緣攀附',
-u'夤緣求進',
-u'因緣爲市',
-u'隐約其詞',
-u'隐占身體',
-u'飲鸩解渴',
-u'引針拾芥',
-u'飲鸩止渴',
-u'音正詞圓',
-u'寅支卯糧',
-u'引錐刺股',
-u'蔭子封妻',
-u'引足救經',
-u'鷹鼻鹞眼',
-u'應變無方',
-u'英才蓋世',
-u'莺猜燕妒',
-u'莺巢燕壘',
-u'莺俦燕侶',
-u'螢窗雪案',
-u'迎春接福',
-u'迎春納福',
-u'蠅攢蟻附',
-u'蠅攢蟻聚',
-u'鷹撮霆擊',
-u'應答如流',
-u'應答如響',
-u'螢燈雪屋',
-u'應對進退',
-u'應對如流',
-u'應對如響',
-u'莺飛草長',
-u'莺飛燕舞',
-u'蠅飛蟻聚',
-u'蠅糞點玉',
-u'迎風待月',
-u'英風亮節',
-u'迎風冒雪',
-u'迎風招展',
-u'蠅附骥尾而緻千裏',
-u'應付裕如',
-u'應付自如',
-u'莺歌蝶舞',
-u'莺歌燕舞',
-u'莺歌燕語',
-u'莺閨燕閣',
-u'莺花猶怕春光老',
-u'影魂劣魔',
-u'鷹擊長空',
-u'應機立斷',
-u'鷹擊毛摯',
-u'蠅集蟻附',
-u'赢奸賣俏',
-u'郢匠揮斤',
-u'鷹角長弓',
-u'硬角束帶',
-u'應接不暇',
-u'應節合拍',
-u'赢金一經',
-u'硬精金錠',
-u'盈科後進',
-u'應恐是癡人',
-u'硬來軟接',
-u'迎來送往',
-u'硬來硬抗',
-u'蠅利蝸名',
-u'鷹瞵鹗視',
-u'鷹瞵虎攫',
-u'鷹瞵虎視',
-u'鷹瞵鴞視',
-u'膺箓受圖',
-u'盈滿之咎',
-u'迎門請盜',
-u'應名點卯',
-u'蠅名蝸利',
-u'蠅鳴蚓唱',
-u'鷹拿燕雀',
-u'鷹拿雁捉',
-u'硬皮恐獸',
-u'盈篇累牍',
-u'嘤其鳴矣',
-u'嘤其鳴矣求其友聲',
-u'莺期燕約',
-u'盈千累萬',
-u'萦青缭白',
-u'鷹觑鹘望',
-u'鷹犬塞途',
-u'應權通變',
-u'鷹犬爪牙',
-u'鷹犬之才',
-u'迎刃冰解',
-u'迎刃而解',
-u'迎刃而理',
-u'郢人斤斧',
-u'郢人斤斫',
-u'迎刃立解',
-u'迎刃以解',
-u'郢人運斧',
-u'郢人斫垩',
-u'迎神賽會',
-u'英聲茂實',
-u'英聲欺人',
-u'蠅聲蛙躁',
-u'莺聲燕語',
-u'應時對景',
-u'鷹視虎步',
-u'鷹視狼步',
-u'鷹視狼顧',
-u'郢書燕說',
-u'營私罔利',
-u'營私舞弊',
-u'營私植黨',
-u'營私作弊',
-u'蠅随骥尾',
-u'鷹隼飛翔',
-u'鷹睃狼顧',
-u'櫻桃好吃樹難栽',
-u'莺啼燕語',
-u'應天承運',
-u'應天從人',
-u'應天順民',
-u'應天順人',
-u'迎頭趕上',
-u'鷹頭雀腦',
-u'蠅頭鼠汴',
-u'迎頭痛擊',
-u'蠅頭微利',
-u'蠅頭蝸角',
-u'蠅頭細書',
-u'蠅頭小楷',
-u'蠅頭小利',
-u'膺圖受箓',
-u'穎脫而出',
-u'穎悟絕倫',
-u'穎悟絕人',
-u'鹦鹉學舌',
-u'鹦鹉學語',
-u'應弦而倒',
-u'迎新棄舊',
-u'迎新送故',
-u'迎新送舊',
-u'鷹心雁爪',
-u'影形不離',
-u'英雄輩出',
-u'英雄本色',
-u'英雄出亂世',
-u'英雄出自少年',
-u'英雄豪傑',
-u'英雄枯骨',
-u'英雄末路',
-u'英雄平台',
-u'英雄氣短',
-u'英雄氣短兒女情長',
-u'英雄入彀',
-u'英雄哨崗',
-u'英雄神力',
-u'英雄生亂世',
-u'英雄所見略同',
-u'英雄無用武之地',
-u'英雄行險道',
-u'英雄之顱',
-u'映雪讀書',
-u'映雪囊螢',
-u'影牙城堡',
-u'鷹揚虎視',
-u'影翼巢穴',
-u'鷹翼廣場',
-u'莺吟燕舞',
-u'影影綽綽',
-u'營蠅斐錦',
-u'營營苟苟',
-u'蠅營狗鑽',
-u'盈盈秋水',
-u'蠅營鼠窺',
-u'蠅營蟻附',
-u'蠅營蟻聚',
-u'盈盈一水',
-u'英英玉立',
-u'營營逐逐',
-u'應有盡有',
-u'萦語水池',
-u'映月讀書',
-u'應運而生',
-u'盈則必虧',
-u'鷹爪之擊',
-u'鷹摯狼食',
-u'影隻形單',
-u'影隻形孤',
-u'郢中白雪',
-u'影鑄火炬',
-u'鷹抓燕雀',
-u'英姿勃勃',
-u'英姿煥發',
-u'英姿飒爽',
-u'鷹嘴鹞目',
-u'用兵如神',
-u'用兵一時',
-u'擁兵自固',
-u'勇不可當',
-u'永不磨滅',
-u'用不同的方法',
-u'詠嘲風月',
-u'勇誠忠義',
-u'永垂不朽',
-u'永垂青史',
-u'永垂竹帛',
-u'庸耳俗目',
-u'勇而無謀',
-u'用非其人',
-u'用非所學',
-u'用管窺天',
-u'勇冠三軍',
-u'勇冠三茄',
-u'擁篲救火',
-u'永劫沉輪',
-u'用進廢退',
-u'用盡心機',
-u'用力不多',
-u'勇莽剛直',
-u'雍門刎首',
-u'勇猛果敢',
-u'勇猛精進',
-u'用其所長',
-u'用人不疑疑人不用',
-u'用人處事',
-u'用人如器各取所長',
-u'用人勿疑',
-u'庸人自擾',
-u'庸人自擾之',
-u'雍容不迫',
-u'雍容大度',
-u'雍容大雅',
-u'雍容典雅',
-u'雍容爾雅',
-u'雍榮華貴',
-u'雍榮閑雅',
-u'雍榮雅步',
-u'詠桑寓柳',
-u'用舍行藏',
-u'永生力量',
-u'永生峭壁',
-u'永生永世',
-u'永世不忘',
-u'永世長存',
-u'永矢弗谖',
-u'永世無窮',
-u'用手掌打一下',
-u'擁書百城',
-u'擁書南面',
-u'饔飧不飽',
-u'饔飧不給',
-u'饔飧不濟',
-u'用天因地',
-u'勇往直前',
-u'擁霧翻波',
-u'永無寧日',
-u'用武之地',
-u'永無止境',
-u'用夏變夷',
-u'用心計較般般錯',
-u'用心竭力',
-u'用心良苦',
-u'用心用意',
-u'用行舍藏',
-u'庸言庸行',
-u'永夜港者',
-u'用逸待勞',
-u'用一當十',
-u'庸醫殺人',
-u'庸庸碌碌',
-u'永永無窮',
-u'永遠醒目',
-u'詠月嘲風',
-u'詠月嘲花',
-u'用在一時',
-u'用在一朝',
-u'勇者不懼',
-u'擁政愛民',
-u'用之不竭',
-u'永志不忘',
-u'用智鋪謀',
-u'傭中佼佼',
-u'用珠計數',
-u'用字記數',
-u'有案可查',
-u'有案可稽',
-u'幽暗沼澤',
-u'有百害而無一利',
-u'有闆有眼',
-u'有備無患',
-u'有本有原',
-u'油壁香車',
-u'遊必有方',
-u'有鼻子有眼',
-u'由表及裏',
-u'有病不治常得中醫',
-u'有才無命',
-u'有财有勢',
-u'有茶有酒多兄弟',
-u'憂讒畏譏',
-u'有翅難展',
-u'有恥且格',
-u'有尺水行尺船',
-u'又吃魚又嫌腥',
-u'有初鮮終',
-u'遊辭巧飾',
-u'有膽有識',
-u'又當別論',
-u'遊蕩不羁',
-u'有道之士',
-u'有的放矢',
-u'誘敵深入',
-u'有豆腐不吃渣',
-u'狖轭鼯軒',
-u'有兒靠兒無兒靠婿',
-u'有兒貧不久',
-u'尤而效之',
-u'有煩老兄',
-u'有犯無隐',
-u'憂憤成疾',
-u'有鳳來儀',
-u'遊蜂浪蝶',
-u'遊蜂戲蝶',
-u'有風有化',
-u'友風子雨',
-u'有福傷财',
-u'有福同享',
-u'有福同享有禍同當',
-u'有福同享有難同當',
-u'有服之親',
-u'有福之人不落無福之地',
-u'有負衆望',
-u'油幹燈盡',
-u'油幹火盡',
-u'有根有底',
-u'有根有苗',
-u'憂公忘私',
-u'油光晶亮',
-u'油光可鑒',
-u'幽光礦洞',
-u'油光水滑',
-u'遊光揚聲',
-u'憂國愛民',
-u'憂國奉公',
-u'有國難投',
-u'油鍋内添上一把柴',
-u'憂國忘家',
-u'憂國憂民',
-u'有過之而無不及',
-u'有過之無不及',
-u'有害無利',
-u'有行無市',
-u'有何面目',
-u'有恒者得之',
-u'尤紅殢翠',
-u'又哄又勸',
-u'又紅又專',
-u'有後娘就有後爹',
-u'有話便長無話便短',
-u'有花方酌酒',
-u'有話好說',
-u'尤花殢雪',
-u'憂患馀生',
-u'遊回磨轉',
-u'有魂沒識',
-u'有機可乘',
-u'有己無人',
-u'又急又氣',
-u'幼嫁從親再嫁由身',
-u'有家難奔有國難投',
-u'有加無已',
-u'油煎火燎',
-u'又見一簾幽夢',
-u'右翦左屠',
-u'油澆火燎',
-u'猶解倒懸',
-u'有借有還再借不難',
-u'有今兒沒明兒',
-u'由近及遠',
-u'有進無退',
-u'有盡有讓',
-u'有近有遠有厚有薄',
-u'右軍習氣',
-u'猶恐失之',
-u'有口不能言',
-u'有口皆碑',
-u'有口難辨',
-u'有口難分',
-u'有口難言',
-u'有口無心',
-u'有口無行',
-u'有苦難言',
-u'有苦時同受有樂時同樂',
-u'有虧職守',
-u'有來無回',
-u'由來已久',
-u'有來有去',
-u'有來有往',
-u'有老了的',
-u'有勞有逸',
-u'有了存孝不顯彥章',
-u'有棱有角',
-u'有利必有害',
-u'有例不滅無例不興',
-u'有理不怕勢來壓',
-u'有理不在高聲',
-u'有理不在聲高',
-u'有利可圖',
-u'有例可援',
-u'有理讓三分',
-u'有利無弊',
-u'有理無錢莫進來',
-u'有利有弊',
-u'有毛不算秃',
-u'優孟衣冠',
-u'有名亡實',
-u'有名無實',
-u'遊目騁觀',
-u'遊目騁懷',
-u'有目共睹',
-u'有目共見',
-u'有目共賞',
-u'有目如盲',
-u'有目無睹',
-u'有你不多沒你不少',
-u'有你沒我',
-u'有年無月',
-u'有牛別嫌慢有飯別嫌爛',
-u'有女懷春',
-u'有蠙可乘',
-u'有憑有據',
-u'有其父必有其子',
-u'有氣沒力',
-u'幽期密約',
-u'遊騎無歸',
-u'有氣無力',
-u'有氣無煙',
-u'又氣又急',
-u'有錢不買半年閑',
-u'有錢道真語',
-u'油乾燈草盡',
-u'油乾燈盡',
-u'油乾火盡',
-u'有錢堪出衆',
-u'有錢買馬沒錢置鞍',
-u'有錢難買願意',
-u'有錢難買針',
-u'有錢難買子孫賢',
-u'有錢能使鬼推磨',
-u'有千年産沒千年主',
-u'由淺入深',
-u'有錢王八大三輩',
-u'有錢用在刀刃上',
-u'有錢有勢',
-u'油腔滑調',
-u'誘秦诓楚',
-u'有求必應',
-u'有屈無伸',
-u'有權不用枉做官',
-u'幽泉法履',
-u'油然而生',
-u'褎然冠首',
-u'褎然舉首',
-u'悠然自得',
-u'由人而貧貧者有十',
-u'遊刃有馀',
-u'遊刃馀地',
-u'有人緣兒',
-u'優柔寡斷',
-u'優柔餍饫',
-u'褎如充耳',
-u'有如皦日',
-u'有如拾芥',
-u'有如水火',
-u'有三有倆',
-u'有色眼鏡',
-u'有山必有路',
-u'遊山玩景',
-u'遊山玩水',
-u'有山無木有水無魚',
-u'有傷風化',
-u'遊商遺骨',
-u'有什麽施主有什麽和尚',
-u'憂深思遠',
-u'有生力量',
-u'優勝劣敗',
-u'有生烈焰',
-u'有聲沒氣',
-u'憂盛危明',
-u'有聲無氣',
-u'有聲無實',
-u'有生以來',
-u'有聲有色',
-u'有生之年',
-u'有失必有得',
-u'有是父必有是子',
-u'有失體統',
-u'有恃無恐',
-u'有始無終',
-u'有失迎迓',
-u'有始有終',
-u'有始有卒',
-u'有事之秋',
-u'有識之士',
-u'遊手好閑',
-u'右手畫圓',
-u'右手畫圓左手畫方',
-u'遊手偷閑',
-u'有數存焉',
-u'幼雙帆龍',
-u'有水必有渡',
-u'猶水勝火',
-u'又說又笑',
-u'有死了的',
-u'遊思妄想',
-u'有死無二',
-u'有損無益',
-u'有所不爲而後可以有爲',
-u'有所顧忌',
-u'有所矜式',
-u'有所作爲',
-u'遊談無根',
-u'優昙一現',
-u'有田不耕倉廪虛',
-u'有天理倒沒飯吃',
-u'有天沒日',
-u'有天沒日頭',
-u'有天無日',
-u'有條不紊',
-u'有條有理',
-u'有亭翼然',
-u'油頭粉面',
-u'油頭光棍',
-u'油頭滑臉',
-u'油頭滑面',
-u'油頭滑腦',
-u'有頭沒腦',
-u'有頭無腦',
-u'有頭無尾',
-u'有頭有臉',
-u'有頭有腦',
-u'有頭有尾',
-u'有腿沒褲子',
-u'有托而逃',
-u'有爲功德',
-u'有爲有守',
-u'有問必答',
-u'有聞必錄',
-u'有文無行',
-u'有我無人',
-u'有無相通',
-u'有物有則',
-u'遊戲筆墨',
-u'遊戲塵寰',
-u'遊戲翰墨',
-u'有隙可乘',
-u'遊戲三昧',
-u'遊閑公子',
-u'優賢飏曆',
-u'悠閑自在',
-u'遊響停雲',
-u'有心拜節寒食不遲',
-u'憂心忡忡',
-u'遊心駭耳',
-u'憂心悄悄',
-u'憂心如搗',
-u'憂心如焚',
-u'憂心如薰',
-u'憂心若醉',
-u'有心無力',
-u'有心眼兒',
-u'有心有意',
-u'遊心寓目',
-u'有心栽花花不發',
-u'憂形于色',
-u'有須眉氣',
-u'有血有肉',
-u'幼學壯行',
-u'優雅聖契',
-u'有眼不識金鑲玉',
-u'有眼不識泰山',
-u'油鹽醬醋',
-u'有眼如盲',
-u'右眼跳禍',
-u'有眼無瞳',
-u'有眼無珠',
-u'有言在先',
-u'有樣學樣',
-u'有要沒緊',
-u'誘掖後進',
-u'誘掖獎勸',
-u'遊移不定',
-u'有一搭沒一搭',
-u'有一得一',
-u'有一頓沒一頓',
-u'有一分心盡一分力',
-u'有以藉口',
-u'有一句說一句',
-u'有一利必有一弊',
-u'有一利即有一弊',
-u'有一利就有一弊',
-u'油一路水一路',
-u'有以善處',
-u'有一手兒',
-u'有一無二',
-u'有意無意',
-u'猶以一杯水',
-u'有意栽花花不發',
-u'幽影突襲',
-u'遊泳速度',
-u'有勇無謀',
-u'有勇有謀',
-u'有勇知方',
-u'優遊不斷',
-u'悠悠蕩蕩',
-u'優遊涵泳',
-u'悠悠忽忽',
-u'優遊歲月',
-u'優遊自得',
-u'優遊自如',
-u'優遊自若',
-u'優遊自适',
-u'優遊自在',
-u'優遊卒歲',
-u'有魚不吃蝦',
-u'猶豫不決',
-u'囿于成見',
-u'有願必成',
-u'有冤的報冤有仇的報仇',
-u'有緣千裏來相會',
-u'優越護符',
-u'有約在先',
-u'遊雲驚龍',
-u'尤雲殢雪',
-u'尤雲殢雨',
-u'優哉遊哉',
-u'有棗沒棗打三竿',
-u'有則敗之',
-u'有則改之',
-u'有則改之無則加勉',
-u'有賊心沒賊膽',
-u'有增無損',
-u'有增無已',
-u'有張沒智',
-u'有朝一日',
-u'有證爲憑',
-u'有征無戰',
-u'有志不在年高',
-u'有志竟成',
-u'有志難酬',
-u'有枝添葉',
-u'有志無時',
-u'有質無形',
-u'有枝有葉',
-u'有志者不在年高',
-u'有志者成之',
-u'有志者事竟成',
-u'有志者事意成',
-u'有志之士',
-u'牖中窺日',
-u'由衷之言',
-u'有周郎癖',
-u'有狀元徒弟沒狀元師傅',
-u'油漬麻花',
-u'油嘴花唇',
-u'油嘴滑舌',
-u'有嘴沒舌',
-u'有嘴沒心',
-u'有嘴無心',
-u'油嘴油舌',
-u'又作別論',
-u'又作馮婦',
-u'有作有爲',
-u'于安思危',
-u'欲罷不能',
-u'瑜百瑕一',
-u'鹬蚌持争',
-u'鹬蚌持争漁翁得利',
-u'鹬蚌相持',
-u'鹬蚌相持漁人得利',
-u'鹬蚌相持漁人獲利',
-u'鹬蚌相持漁翁得利',
-u'鹬蚌相鬥',
-u'鹬蚌相危',
-u'鹬蚌相争',
-u'鹬蚌相争漁翁得利',
-u'餘杯冷炙',
-u'魚鼈同一波',
-u'雨鬓風鬟',
-u'寓兵于農',
-u'餘波蕩漾',
-u'魚帛狐篝',
-u'魚帛狐聲',
-u'餘波未平',
-u'語不驚人',
-u'語不驚人死不休',
-u'譽不絕口',
-u'愚不可及',
-u'語不投機',
-u'瑜不掩瑕',
-u'玉不琢不成器',
-u'玉慘花愁',
-u'雨僝風僽',
-u'雨僝雲僽',
-u'魚腸尺素',
-u'語長心重',
-u'魚腸雁足',
-u'魚沉鴻斷',
-u'魚沉雁靜',
-u'魚沉雁落',
-u'魚沉雁渺',
-u'魚沉雁杳',
-u'玉成其美',
-u'玉成其事',
-u'玉尺量才',
-u'予齒去角',
-u'鬻寵擅權',
-u'雨愁煙恨',
-u'語出月脅',
-u'魚傳尺素',
-u'杅穿皮蠹',
-u'逾次超秩',
-u'榆次之辱',
-u'雨湊雲集',
-u'雨打風吹',
-u'魚大水小',
-u'羽蹈烈火',
-u'雨棟風簾',
-u'語短情長',
-u'雨斷雲銷',
-u'漁奪侵牟',
-u'予奪生殺',
-u'語多言必失',
-u'鬻兒賣女',
-u'盂方水方',
-u'榆枋之見',
-u'于飛之樂',
-u'馭鳳骖鶴',
-u'魚封雁帖',
-u'餘風遺文',
-u'魚釜塵甑',
-u'愚夫蠢婦',
-u'籲咈都俞',
-u'愚夫愚婦',
-u'雨覆雲翻',
-u'欲蓋而彰',
-u'欲蓋彌彰',
-u'饫甘餍肥',
-u'餘膏剩馥',
-u'雨膏煙膩',
-u'愚公移山',
-u'玉骨冰肌',
-u'魚骨牙簽',
-u'魚貫而出',
-u'魚貫而入',
-u'魚貫而行',
-u'玉關人老',
-u'魚貫雁比',
-u'魚貫雁行',
-u'餘光分人',
-u'玉圭金臬',
-u'于歸之嘉',
-u'雨過天青',
-u'雨過天未晴',
-u'漁海樵山',
-u'欲壑難填',
-u'雨恨雲愁',
-u'雨後春筍',
-u'雨後送傘',
-u'于呼哀哉',
-u'與虎謀皮',
-u'與虎添翼',
-u'雨花墜子',
-u'逾淮之橘',
-u'玉毀椟中',
-u'迂回曲折',
-u'獄貨非寶',
-u'浴火鳳凰',
-u'鬻雞爲鳳',
-u'餘悸猶存',
-u'雨迹雲蹤',
-u'羽嘉腕甲',
-u'于家爲國',
-u'欲加之罪',
-u'欲加之罪何患無辭',
-u'玉減香銷',
-u'魚箋雁書',
-u'語簡意赅',
-u'玉潔冰清',
-u'玉潔松貞',
-u'語近詞冗',
-u'雨巾風帽',
-u'餘燼複起',
-u'餘燼複然',
-u'于今爲烈',
-u'纡金曳紫',
-u'語近指遠',
-u'魚驚鳥散',
-u'雨井煙垣',
-u'與君一席話勝讀十年書',
-u'魚潰鳥離',
-u'魚潰鳥散',
-u'玉昆金友',
-u'魚爛而亡',
-u'魚爛河決',
-u'魚爛取亡',
-u'魚爛土崩',
-u'魚爛瓦解',
-u'玉粒桂薪',
-u'雨笠煙蓑',
-u'雨簾雲棟',
-u'鬻良雜苦',
-u'雨鬣霜蹄',
-u'魚瞵鹗睨',
-u'雨淋日曬',
-u'雨淋日炙',
-u'雨零星亂',
-u'雨零星散',
-u'魚龍百變',
-u'魚龍變化',
-u'魚龍混雜',
-u'魚龍曼羨',
-u'魚龍曼衍',
-u'魚龍香涎',
-u'玉樓赴召',
-u'玉漏猶滴',
-u'魚魯帝虎',
-u'雨露之恩',
-u'輿論嘩然',
-u'玉律金科',
-u'雨霾風障',
-u'譽滿天下',
-u'羽毛鬥篷',
-u'羽毛豐滿',
-u'玉貌花容',
-u'羽毛未豐',
-u'鬻矛譽楯',
-u'愚眉肉眼',
-u'愚昧無知',
-u'魚米之地',
-u'魚米之鄉',
-u'語妙絕倫',
-u'餘妙繞梁',
-u'語妙天下',
-u'與民除害',
-u'與民更始',
-u'與民同樂',
-u'裕民足國',
-u'榆瞑豆重',
-u'雨沐風餐',
-u'榆木圪垯',
-u'魚目混珍',
-u'魚目混珠',
-u'魚目間珠',
-u'榆木腦袋',
-u'榆木腦殼',
-u'遇難呈祥',
-u'魚餒肉敗',
-u'逾年曆歲',
-u'鬻驽竊價',
-u'纡佩金紫',
-u'玉佩瓊琚',
-u'浴盆曲線',
-u'玉砌雕闌',
-u'娛妻弄子',
-u'雨泣雲愁',
-u'與其坐而論道',
-u'逾千越萬',
-u'踰牆避命',
-u'遇強不弱',
-u'逾牆窺蠙',
-u'逾牆窺隙',
-u'踰牆相從',
-u'逾牆越舍',
-u'逾牆鑽蠙',
-u'踰牆鑽隙',
-u'踰牆鑽穴',
-u'玉橋海灘',
-u'欲擒故縱',
-u'玉清冰潔',
-u'纡青佩紫',
-u'纡青拖紫',
-u'寓情于景',
-u'欲求生富貴',
-u'欲取姑予',
-u'予取予奪',
-u'予取予求',
-u'予取予攜',
-u'與人不和',
-u'與人不睦',
-u'遇人不淑',
-u'漁人得利',
-u'與人方便',
-u'與人方便自己方便',
-u'予人口實',
-u'魚人鳍湯',
-u'與人爲善',
-u'欲人勿知莫若勿爲',
-u'漁人之利',
-u'愚人之盟',
-u'與日俱增',
-u'魚肉百姓',
-u'魚肉青菜',
-u'魚肉鄉裏',
-u'魚肉鄉民',
-u'玉汝于成',
-u'玉軟花柔',
-u'玉潤冰清',
-u'玉潤珠圓',
-u'遇弱不欺',
-u'雨散風流',
-u'雨散雲飛',
-u'雨散雲收',
-u'逾沙轶漠',
-u'羽扇綸巾',
-u'逾山越海',
-u'魚沈落雁',
-u'鬻聲釣世',
-u'魚生空釜',
-u'魚升龍門',
-u'餘聲三日',
-u'逾繩越契',
-u'玉石不分',
-u'與世長辭',
-u'與世沉浮',
-u'與世浮沉',
-u'與世俯仰',
-u'與世隔絕',
-u'玉石混淆',
-u'玉石皆碎',
-u'玉食錦衣',
-u'玉石俱摧',
-u'玉石俱焚',
-u'玉石俱碎',
-u'玉石礦洞',
-u'與世沈浮',
-u'遇事生端',
-u'遇事生風',
-u'玉石同沉',
-u'玉石同碎',
-u'與世推移',
-u'于事無補',
-u'與世無争',
-u'玉石相揉',
-u'與時消息',
-u'與時偕行',
-u'與世偃仰',
-u'玉石雜糅',
-u'餘食贅行',
-u'與受同科',
-u'雨收雲散',
-u'玉樹臨風',
-u'玉樹瓊枝',
-u'魚書雁帛',
-u'魚書雁帖',
-u'魚書雁信',
-u'玉樹芝蘭',
-u'遇水叠橋',
-u'欲誰歸罪',
-u'魚水和諧',
-u'遇水架橋',
-u'魚水深情',
-u'魚水相逢',
-u'魚水相懽',
-u'魚水相歡',
-u'魚水相投',
-u'雨順風調',
-u'雨絲風片',
-u'輿死扶傷',
-u'魚死網破',
-u'語四言三',
-u'欲速不達',
-u'欲速反遲',
-u'語素分解',
-u'雨宿風餐',
-u'魚素久睽',
-u'語素生成',
-u'欲速則不達',
-u'玉碎香殘',
-u'玉碎香銷',
-u'玉碎珠沉',
-u'雨蓑風笠',
-u'雨蓑煙笠',
-u'迂談闊論',
-u'玉堂金馬',
-u'玉堂人物',
-u'餘桃啖君',
-u'籲天呼地',
-u'雨條煙葉',
-u'與頭一邊兒粗',
-u'魚網鴻離',
-u'漁網妖蛛',
-u'魚爲奔波始化龍',
-u'餘味無窮',
-u'魚尾雁行',
-u'饫聞厭見',
-u'漁翁得利',
-u'漁翁之利',
-u'雨卧風餐',
-u'遇物持平',
-u'語無倫次',
-u'語無诠次',
-u'與物無競',
-u'與物無忤',
-u'與吳益恭書',
-u'禹惜寸陰',
-u'餘霞成绮',
-u'餘霞散绮',
-u'踰閑蕩檢',
-u'逾限控制',
-u'魚縣鳥竄',
-u'餘響繞梁',
-u'玉箫金琯',
-u'語笑喧呼',
-u'語笑喧嘩',
-u'語笑喧阗',
-u'雨消雲散',
-u'雨歇雲收',
-u'于心何忍',
-u'于心無愧',
-u'娛心悅目',
-u'餘腥殘穢',
-u'禹行舜趨',
-u'羽須小屋',
-u'浴血奮戰',
-u'語焉不詳',
-u'魚雁沉沉',
-u'玉燕投懷',
-u'魚雁往返',
-u'語言無味面目可憎',
-u'魚雁鮮通',
-u'欲言又止',
-u'漁陽鞞鼓',
-u'漁陽鼙鼓',
-u'雨旸時若',
-u'欲揚先抑',
-u'魚杳雁沉',
-u'玉液金波',
-u'玉液金漿',
-u'玉葉金枝',
-u'玉液瓊漿',
-u'餘業遺烈',
-u'欲益反弊',
-u'欲益反損',
-u'褕衣甘食',
-u'寓意深長',
-u'寓意深遠',
-u'羽翼已成',
-u'遇飲酒時須飲酒',
-u'餘音嘹喨',
-u'餘音缭繞',
-u'餘音袅袅',
-u'餘音繞梁',
-u'餘勇可賈',
-u'魚遊沸鼎',
-u'魚遊沸釜',
-u'魚遊釜底',
-u'魚遊釜内',
-u'魚遊釜中',
-u'魚遊濠上',
-u'玉友金昆',
-u'魚遊燋釜',
-u'郁郁不得志',
-u'郁郁不樂',
-u'郁郁蒼蒼',
-u'郁郁沉沉',
-u'郁郁蔥蔥',
-u'郁郁寡歡',
-u'郁郁累累',
-u'郁郁芊芊',
-u'玉宇瓊樓',
-u'魚與熊掌',
-u'魚魚雅雅',
-u'魚躍龍門',
-u'魚躍鸢飛',
-u'雨約雲期',
-u'餘韻流風',
-u'雨沾雲惹',
-u'愚者千慮',
-u'愚者千慮必有一得',
-u'愚者千慮或有一得',
-u'愚者千慮亦有一得',
-u'餘珍璧謝',
-u'玉振金聲',
-u'玉質金相',
-u'與之俱黑',
-u'魚質龍文',
-u'欲知其人先觀其友',
-u'玉卮無當',
-u'喻之以理',
-u'予智予雄',
-u'與衆不同',
-u'雨中急馳',
-u'語重情深',
-u'語重心長',
-u'語重心沉',
-u'雨僽風僝',
-u'宇宙母艦',
-u'纡朱懷金',
-u'玉柱擎天',
-u'纡朱拖紫',
-u'纡朱曳紫',
-u'雨竹原創文學網',
-u'餘子碌碌',
-u'毓子孕孫',
-u'雨蹤雲迹',
-u'玉走金飛',
-u'纡尊降貴',
-u'袁安高卧',
-u'猿悲鶴怨',
-u'援筆成章',
-u'原璧歸趙',
-u'援筆立成',
-u'援鼈失龜',
-u'淵博褶裙',
-u'遠不間親',
-u'沅茝醴蘭',
-u'猿腸寸斷',
-u'冤沉海底',
-u'沅茞澧蘭',
-u'鴛俦鳳侶',
-u'遠愁近慮',
-u'遠垂不朽',
-u'遠到時來鐵樹花開',
-u'元惡大憝',
-u'元惡大奸',
-u'怨而不怒',
-u'元方季方',
-u'蜎飛蠕動',
-u'蜎飛蝡動',
-u'鸢飛魚躍',
-u'緣分五月',
-u'原封不動',
-u'原封未動',
-u'遠隔千裏近在眼前',
-u'冤各有頭債各有主',
-u'援古刺今',
-u'援古證今',
-u'猿鶴蟲沙',
-u'猿鶴沙蟲',
-u'猿猴取月',
-u'遠懷近集',
-u'冤家不可結結了無休歇',
-u'冤家對頭',
-u'冤家路狹',
-u'冤家路窄',
-u'冤家碰見冤家對',
-u'怨家債主',
-u'鸢肩豺目',
-u'鸢肩羔膝',
-u'鸢肩鹄頸',
-u'元奸巨惡',
-u'遠見束帶',
-u'遠見卓識',
-u'沅江九肋',
-u'遠交近攻',
-u'猿驚鶴怨',
-u'元經秘旨',
-u'淵涓蠖濩',
-u'遠來的和尚好念經',
-u'遠來的和尚會念經',
-u'遠來和尚好看經',
-u'原來如此',
-u'元龍高卧',
-u'元龍豪氣',
-u'遠路無輕載',
-u'遠慮深謀',
-u'鼋鳴鼈應',
-u'遠謀深算',
-u'淵謀遠略',
-u'緣木求魚',
-u'遠年近日',
-u'遠年近歲',
-u'怨女曠夫',
-u'怨氣沖天',
-u'怨氣滿腹',
-u'緣悭命蹇',
-u'遠親不如近鄰',
-u'遠親近鄰',
-u'緣情體物',
-u'淵清玉絜',
-u'遠求骐骥',
-u'元戎啓行',
-u'怨入骨髓',
-u'冤殺旁人笑殺賊',
-u'遠山芙蓉',
-u'遠涉重洋',
-u'源深流長',
-u'原生材料',
-u'怨生莫怨死',
-u'怨聲載道',
-u'元石簡介',
-u'圓首方足',
-u'源殊派異',
-u'遠水救不得近火',
-u'遠溯博索',
-u'猿啼鶴唳',
-u'年年有餘',
-u'猿啼鶴怨',
-u'冤天屈地',
-u'怨天尤人',
-u'怨天怨地',
-u'淵亭山立',
-u'淵渟嶽立',
-u'淵渟嶽峙',
-u'淵渟澤彙',
-u'源頭活水',
-u'淵圖遠算',
-u'猿王重盔',
-u'緣文生義',
-u'原形敗露',
-u'原形畢露',
-u'遠行一趟',
-u'猿穴壞山',
-u'鴛鴦雙劍',
-u'原野疾馳',
-u'淵湧風厲',
-u'冤有頭債有主',
-u'淵魚叢爵',
-u'淵魚叢雀',
-u'元元本本',
-u'源源不斷',
-u'源源不絕',
-u'源源而來',
-u'淵蜎蠖伏',
-u'源遠流長',
-u'原原委委',
-u'冤冤相報',
-u'冤冤相報何時了',
-u'淵源有自',
-u'元元之民',
-u'遠在天邊近在眼前',
-u'圓鑿方枘',
-u'怨者墓碑',
-u'遠征營地',
-u'源質壁壘',
-u'遠至迩安',
-u'沅芷澧蘭',
-u'沅芷湘蘭',
-u'遠矚高瞻',
-u'遠走高飛',
-u'月白風清',
-u'越次超倫',
-u'月旦春秋',
-u'月到中秋分外圓',
-u'月地雲階',
-u'約定俗成',
-u'約法三章',
-u'越凫楚乙',
-u'月宮折桂',
-u'越古超今',
-u'月黑風高',
-u'月黑殺人',
-u'月痕林地',
-u'悅近來遠',
-u'月朗風清',
-u'月朗星稀',
-u'月露風雲',
-u'月露之體',
-u'月落參橫',
-u'月落烏啼',
-u'月落星沉',
-u'月落星沈',
-u'躍馬彎弓',
-u'躍馬揚鞭',
-u'月滿則虧',
-u'月貌花龐',
-u'月貌花容',
-u'月明千裏',
-u'月明如水',
-u'月明如晝',
-u'月明星稀',
-u'月沒參橫',
-u'悅目賞心',
-u'悅目娛心',
-u'越鳥南栖',
-u'粵犬吠雪',
-u'月泉神殿',
-u'月缺不改光',
-u'月缺花殘',
-u'月缺難圓',
-u'躍然紙上',
-u'閱人多矣',
-u'月如懸弓少雨多風',
-u'月神長弓',
-u'月是故鄉圓',
-u'越瘦秦肥',
-u'閱微草堂筆記',
-u'月夕花晨',
-u'月夕花朝',
-u'月下花前',
-u'月下老兒',
-u'月下老人',
-u'月夜花朝',
-u'月夜枭獸',
-u'月異日新',
-u'説一是一説二是二',
-u'月盈則食',
-u'月圓花好',
-u'嶽嶽磊磊',
-u'嶽嶽荦荦',
-u'躍躍欲試',
-u'月暈礎潤',
-u'月暈而風',
-u'月暈而風礎潤而雨',
-u'月暈知風礎潤知雨',
-u'月章星句',
-u'月爪枭獸',
-u'月照竹林',
-u'嶽鎮淵渟',
-u'月之哀傷',
-u'月值年災',
-u'刖趾适屦',
-u'刖趾适履',
-u'嶽峙淵渟',
-u'月中折桂',
-u'月墜花折',
-u'越俎代庖',
-u'隕雹飛霜',
-u'雲悲海思',
-u'運筆如飛',
-u'雲布雨潤',
-u'雲布雨施',
-u'運策決機',
-u'運策帷幄',
-u'雲程發轫',
-u'雲程萬裏',
-u'運籌出奇',
-u'雲愁海思',
-u'運籌畫策',
-u'運籌建策',
-u'運籌借箸',
-u'運籌決策',
-u'運籌決勝',
-u'運籌決算',
-u'運籌千裏',
-u'運籌設策',
-u'運籌帏幄',
-u'運籌帷帳',
-u'運籌演謀',
-u'雲愁雨怨',
-u'運籌制勝',
-u'雲窗霧閣',
-u'雲窗霧檻',
-u'雲窗霞戶',
-u'雲窗月戶',
-u'雲窗月帳',
-u'雲次鱗集',
-u'雲從龍風從虎',
-u'雲淡風輕',
-u'運掉自如',
-u'韫椟藏珠',
-u'韫椟而藏',
-u'雲翻雨覆',
-u'雲飛泥沉',
-u'雲飛煙滅',
-u'雲飛雨散',
-u'運斧般門',
-u'運乖時蹇',
-u'雲過天空',
-u'缊褐瓢箪',
-u'雲合霧集',
-u'雲合響應',
-u'雲合景從',
-u'勻紅點翠',
-u'雲鬟霧鬓',
-u'雲集景從',
-u'運計鋪謀',
-u'雲集響應',
-u'雲集景附',
-u'運蹇時低',
-u'運蹇時乖',
-u'雲交雨合',
-u'蘊藉含蓄',
-u'雲階月地',
-u'運斤成風',
-u'運斤如風',
-u'雲錦天章',
-u'雲淨天空',
-u'雲谲波詭',
-u'雲開見日',
-u'雲開見天',
-u'運開時泰',
-u'雲開霧散',
-u'雲開霧釋',
-u'雲裏千條路雲外路無數',
-u'雲龍風虎',
-u'雲龍井蛙',
-u'雲龍九現',
-u'雲羅天網',
-u'雲夢閑情',
-u'雲迷霧鎖',
-u'雲迷霧罩',
-u'雲泥殊路',
-u'雲泥異路',
-u'雲泥之別',
-u'雲泥之差',
-u'雲霓之望',
-u'蘊奇待價',
-u'雲起龍襄',
-u'雲起雪飛',
-u'雲期雨信',
-u'雲期雨約',
-u'雲情雨意',
-u'運去金成鐵',
-u'雲趨鹜赴',
-u'雲擾幅裂',
-u'雲容月貌',
-u'雲散風流',
-u'殒身不恤',
-u'隕身糜骨',
-u'殒身碎首',
-u'雲收雨散',
-u'雲舒霞卷',
-u'雲樹遙隔',
-u'雲樹之思',
-u'運算速度',
-u'雲天高誼',
-u'雲天霧地',
-u'暈頭轉向',
-u'雲屯飙散',
-u'雲屯鳥散',
-u'雲屯森立',
-u'雲屯霧集',
-u'雲屯霧散',
-u'雲屯席卷',
-u'雲屯星聚',
-u'雲屯蟻聚',
-u'雲屯雨集',
-u'運旺時盛',
-u'允文允武',
-u'雲霧迷蒙',
-u'雲消霧散',
-u'雲消雨散',
-u'雲心鶴眼',
-u'雲心水性',
-u'雲興霞輝',
-u'雲興霞蔚',
-u'雲行雨洽',
-u'雲行雨施',
-u'雲煙過眼',
-u'雲湧飙發',
-u'雲湧風飛',
-u'運用之妙存乎一心',
-u'運用之妙在于一心',
-u'雲尤雨殢',
-u'雲雨巫山',
-u'韻語陽秋',
-u'暈暈沉沉',
-u'運運亨通',
-u'芸芸衆生',
-u'雲朝雨暮',
-u'雲蒸龍變',
-u'雲蒸霧集',
-u'雲蒸霞蔚',
-u'允執厥中',
-u'勻脂抹粉',
-u'運智鋪謀',
-u'允執其中',
-u'運之掌上',
-u'雲中白鶴',
-u'雲中仙鶴',
-u'運轉時來',
-u'運拙時乖',
-u'運拙時艱',
-u'運作主管',
-u'砸鍋賣鐵',
-u'雜燴蚌肉',
-u'雜亂無序',
-u'雜亂無章',
-u'雜七雜八',
-u'雜味炖肉',
-u'咂嘴弄唇',
-u'咂嘴弄舌',
-u'咂嘴舔唇',
-u'咂嘴咂舌',
-u'載沉載浮',
-u'在陳之厄',
-u'載馳載驅',
-u'在此一舉',
-u'載歌且舞',
-u'載歌載舞',
-u'在谷滿谷',
-u'在官言坩',
-u'在官言官',
-u'載懽載笑',
-u'載鬼一車',
-u'在海邊體驗生活',
-u'載歡載笑',
-u'再回首是百年身',
-u'再回頭是百年身',
-u'宰雞教猴',
-u'在家不會迎賓客',
-u'在家出家',
-u'在家敬父母何必遠燒香',
-u'在家千日好出門一時難',
-u'在家爲父子受事爲君臣',
-u'在家由父',
-u'在江湖中',
-u'在劫難逃',
-u'再接再曆',
-u'載酒問字',
-u'再苦不吃皺眉飯',
-u'災梨禍棗',
-u'災年無災民',
-u'載驅載馳',
-u'在人矮檐下',
-u'在人矮檐下怎敢不低頭',
-u'在人耳目',
-u'在人屋檐下怎敢不低頭',
-u'再三叮咛',
-u'再三留不住',
-u'再三須慎意',
-u'再三再四',
-u'在色之戒',
-u'在商必言利',
-u'在時間先後',
-u'再衰三涸',
-u'再衰三竭',
-u'再思可矣',
-u'在所不辭',
-u'在所不惜',
-u'在所難免',
-u'在天之靈',
-u'在外靠朋友',
-u'宰相肚裏好撐船',
-u'宰相肚裏能撐船',
-u'宰相家人七品官',
-u'載笑載言',
-u'載一抱素',
-u'在一個跳闆上走',
-u'在圓地上走',
-u'再造之恩',
-u'載舟覆舟',
-u'再做道理',
-u'再作馮婦',
-u'贊不絕口',
-u'贊恩之眼',
-u'贊口不絕',
-u'暫勞永逸',
-u'攢眉苦臉',
-u'贊聲不絕',
-u'暫時故障',
-u'贊歎不已',
-u'暫停狀态',
-u'簪纓世胄',
-u'簪纓世族',
-u'暫駐命令',
-u'臧谷亡羊',
-u'贓官污吏',
-u'贓賄狼藉',
-u'贓貨狼藉',
-u'葬禮護腕',
-u'臧否人物',
-u'葬身魚腹',
-u'贓私狼藉',
-u'髒污狼藉',
-u'贓盈惡貫',
-u'皂白不分',
-u'鑿壁偷光',
-u'早朝晏罷',
-u'造車合轍',
-u'早晨不做官晚上不唱喏',
-u'早出暮歸',
-u'早出晚歸',
-u'造次顛沛',
-u'造次行事',
-u'造端倡始',
-u'造端讬始',
-u'造惡不悛',
-u'遭逢不偶',
-u'遭逢會遇',
-u'遭逢際會',
-u'遭逢時會',
-u'造福桑梓',
-u'澡垢索疵',
-u'鑿骨搗髓',
-u'鑿龜數策',
-u'棗花雖小結實成',
-u'造化小兒',
-u'竈灰築不成牆',
-u'遭際不偶',
-u'造極登峰',
-u'遭際時會',
-u'遭家不造',
-u'造繭自縛',
-u'遭劫在數',
-u'早韭晚菘',
-u'糟糠之妻',
-u'糟糠之妻不下堂',
-u'鑿刻束帶',
-u'鑿空取辦',
-u'鑿空投隙',
-u'鑿空之論',
-u'早撂到脖子後頭去了',
-u'造謀布阱',
-u'鑿壞而遁',
-u'鑿壞以遁',
-u'早起的鳥兒捉蟲多',
-u'早起三光晚起三慌',
-u'蚤寝晏起',
-u'遭傾遇禍',
-u'澡身浴德',
-u'遭時不偶',
-u'遭時定制',
-u'蚤虱枯魚',
-u'遭事制宜',
-u'皂絲麻線',
-u'鑿隧入井',
-u'早喂貓晚喂狗',
-u'造微入妙',
-u'早爲之計',
-u'早霞不出門晚霞行千裏',
-u'造型變換',
-u'躁言醜句',
-u'造言捏詞',
-u'造言生事',
-u'早養兒得濟',
-u'造謠惑衆',
-u'造謠生非',
-u'造謠生事',
-u'造謠中傷',
-u'造因得果',
-u'鑿飲耕食',
-u'造因結果',
-u'鑿楹納書',
-u'遭遇不偶',
-u'遭遇際會',
-u'遭遇運會',
-u'鑿鑿可據',
-u'鑿鑿有據',
-u'早占勿藥',
-u'早知今日',
-u'早知今日何必當初',
-u'早知今日悔不當初',
-u'蚤知之士',
-u'鑿柱取書',
-u'造作矯揉',
-u'澤被後世',
-u'責備求全',
-u'擇地而蹈',
-u'擇肥而噬',
-u'擇福宜重',
-u'澤及枯骨',
-u'擇鄰而居',
-u'擇其善者而從之',
-u'擇善而從',
-u'擇善而行',
-u'齰舌緘唇',
-u'昃食宵衣',
-u'責實循名',
-u'責無旁貸',
-u'啧有煩言',
-u'擇優錄取',
-u'責有所歸',
-u'責有攸歸',
-u'啧啧稱奇',
-u'啧啧稱羨',
-u'啧啧稱贊',
-u'擇主而事',
-u'賊臣亂子',
-u'賊臣逆子',
-u'賊喊捉賊',
-u'賊眉鼠眼',
-u'賊眉賊眼',
-u'賊去關門',
-u'賊人膽虛',
-u'賊人心虛',
-u'賊是小人',
-u'賊頭狗腦',
-u'賊頭鬼腦',
-u'賊頭鼠腦',
-u'賊頭賊腦',
-u'賊心不死',
-u'賊咬一口入骨三分',
-u'賊子亂臣',
-u'賊走了關門',
-u'怎得見波濤',
-u'怎敢不低頭',
-u'谮下謾上',
-u'憎愛分明',
-u'曾不慘然',
-u'甑塵釜魚',
-u'增強鈍器',
-u'曾參殺人',
-u'憎惡噴吐',
-u'甑中生塵',
-u'曾子殺彘',
-u'詐敗佯輸',
-u'詐癡不顛',
-u'詐癡佯呆',
-u'乍富不知新受用',
-u'紮根串連',
-u'詐奸不及',
-u'乍毛變色',
-u'乍暖還寒',
-u'乍貧難改舊家風',
-u'詐啞佯聾',
-u'摘膽剜心',
-u'債多不愁',
-u'債多心不亂',
-u'債多心反安',
-u'摘伏發隐',
-u'摘瓜抱蔓',
-u'摘奸發伏',
-u'摘句尋章',
-u'窄門窄戶',
-u'齋明盛服',
-u'摘三問四',
-u'摘山煮海',
-u'債台高築',
-u'齋心滌慮',
-u'摘心去汴',
-u'宅心忠厚',
-u'摘豔薰香',
-u'摘埴索塗',
-u'宅中圖大',
-u'戰不旋踵',
-u'斬草除根',
-u'展翅高飛',
-u'斬釘截鐵',
-u'斬釘切鐵',
-u'湛恩汪濊',
-u'沾風惹草',
-u'斬竿揭木',
-u'斬鋼截鐵',
-u'戰鼓頻仍',
-u'斬骨手斧',
-u'斬關奪隘',
-u'沾花惹草',
-u'粘花惹絮',
-u'戰火紛飛',
-u'戰禍連年',
-u'戰火餘生',
-u'斬将奪旗',
-u'斬将搴旗',
-u'斬将刈旗',
-u'展腳伸腰',
-u'展盡底蘊',
-u'斬盡殺絕',
-u'斬荊披棘',
-u'戰栗圖騰',
-u'占領墓地',
-u'嶄露頭腳',
-u'斬木揭竿',
-u'沾泥帶水',
-u'瞻前顧後',
-u'沾親帶故',
-u'沾親帶友',
-u'瞻情顧意',
-u'棧山航海',
-u'戰勝攻取',
-u'鹯視狼顧',
-u'斬首利斧',
-u'沾死碰亡',
-u'沾體塗足',
-u'戰天鬥地',
-u'斬頭瀝血',
-u'斬頭去尾',
-u'瞻望咨嗟',
-u'戰無不克',
-u'戰無不勝',
-u'戰無不勝攻無不克',
-u'戰無不勝攻無不取',
-u'展翔高飛',
-u'占小便宜吃大虧',
-u'戰熊背心',
-u'戰熊熱褲',
-u'詹言曲說',
-u'展眼舒眉',
-u'詀言詀語',
-u'瞻雲就日',
-u'戰雲彌漫',
-u'戰雲濃密',
-u'戰戰惶惶',
-u'戰戰兢兢',
-u'戰戰栗栗',
-u'湛湛青天',
-u'詹詹炎炎',
-u'戰戰搖搖',
-u'戰戰業業',
-u'沾沾自好',
-u'沾沾自滿',
-u'沾沾自喜',
-u'沾沾自衒',
-u'站着茅坑不拉屎',
-u'站着說話不腰疼',
-u'饘粥餬口',
-u'輾轉反側',
-u'長傲飾非',
-u'張本繼末',
-u'張敞畫眉',
-u'張翅欲飛',
-u'張唇植髭',
-u'長大各鄉裏',
-u'張大其詞',
-u'張大其事',
-u'張燈結采',
-u'丈二和尚',
-u'丈二和尚摸不着頭腦',
-u'章甫薦履',
-u'丈夫有淚不輕彈',
-u'張公吃酒李公顛',
-u'張公吃酒李公醉',
-u'張冠李戴',
-u'張皇其事',
-u'張徨失措',
-u'長虺成蛇',
-u'張甲李乙',
-u'仗節死義',
-u'章句小儒',
-u'章句之徒',
-u'章決句斷',
-u'獐麇馬鹿',
-u'張口掉舌',
-u'張口結舌',
-u'張口結舌面紅耳赤',
-u'張良借箸',
-u'杖履相從',
-u'杖履縱橫',
-u'仗馬寒蟬',
-u'張脈偾興',
-u'張袂成帷',
-u'張袂成陰',
-u'張眉努目',
-u'張眉努眼',
-u'張眉張眼',
-u'彰明較着',
-u'彰明較著',
-u'彰明昭着',
-u'彰明昭著',
-u'長年三老',
-u'仗氣使酒',
-u'張三李四',
-u'彰善瘅惡',
-u'障栅同步',
-u'掌上觀文',
-u'掌上明珠',
-u'仗勢欺人',
-u'章台楊柳',
-u'獐頭鼠目',
-u'彰往考來',
-u'張王李趙',
-u'張王趙李',
-u'瘴鄉惡土',
-u'張牙舞爪',
-u'張眼露睛',
-u'仗義疏财',
-u'仗義執言',
-u'長幼有叙',
-u'長幼尊卑',
-u'瘴雨蠻煙',
-u'長者賜不敢辭',
-u'長者墓碑',
-u'張嘴挢舌',
-u'長嘴泥鳅',
-u'照本宣科',
-u'招兵買馬',
-u'朝不保暮',
-u'朝不保夕',
-u'朝不及夕',
-u'朝不慮夕',
-u'朝不謀夕',
-u'招财進寶',
-u'朝趁暮食',
-u'朝成暮遍',
-u'朝成暮毀',
-u'朝成夕毀',
-u'朝穿暮塞',
-u'昭德塞違',
-u'朝發暮至',
-u'朝發夕至',
-u'招風攬火',
-u'招風惹草',
-u'招蜂惹蝶',
-u'招風惹雨',
-u'招蜂引蝶',
-u'朝歌暮弦',
-u'朝歌夜弦',
-u'朝更暮改',
-u'照功行賞',
-u'朝過夕改',
-u'照葫蘆畫瓢',
-u'招花惹草',
-u'朝華夕秀',
-u'朝歡暮樂',
-u'召回符文',
-u'招魂法袍',
-u'朝齑暮鹽',
-u'招架不住',
-u'招架等級',
-u'招架掌握',
-u'朝經暮史',
-u'招軍買馬',
-u'朝梁暮陳',
-u'朝梁暮晉',
-u'朝梁暮周',
-u'朝令暮改',
-u'朝令夕改',
-u'昭聾發聩',
-u'朝露溘至',
-u'照貓畫虎',
-u'兆民鹹賴',
-u'朝攀暮折',
-u'朝氣蓬勃',
-u'趙錢孫李依不依随你',
-u'朝乾夕愓',
-u'朝乾夕惕',
-u'朝秦暮楚',
-u'招權納賄',
-u'招權納賂',
-u'招權納赇',
-u'昭然若揭',
-u'照人肝膽',
-u'招人物議',
-u'昭如日星',
-u'昭如月星',
-u'着三不着兩',
-u'朝三暮二',
-u'朝三暮四',
-u'朝折暮折',
-u'朝升暮合',
-u'朝生暮死',
-u'朝生夕死',
-u'招是搬非',
-u'招是攬非',
-u'招事惹非',
-u'招是生非',
-u'朝思暮想',
-u'朝斯夕斯',
-u'招亡納叛',
-u'朝聞道夕死可矣',
-u'朝聞夕改',
-u'朝聞夕死',
-u'朝夕相處',
-u'招賢納士',
-u'招降納叛',
-u'朝陽鳴鳳',
-u'招搖過巿',
-u'招搖過市',
-u'招搖撞騙',
-u'朝衣東市',
-u'朝夷暮跖',
-u'照螢映雪',
-u'朝饔夕飧',
-u'朝雲暮雨',
-u'招災攬禍',
-u'招災惹禍',
-u'兆載永劫',
-u'照章辦事',
-u'朝朝暮暮',
-u'昭昭在目',
-u'照着葫蘆畫瓢',
-u'召之即來揮之即去',
-u'朝鍾暮鼓',
-u'朝種暮獲',
-u'朝奏暮召',
-u'朝奏夕召',
-u'折臂三公',
-u'折臂折肱',
-u'這才叫現世報',
-u'折長補短',
-u'遮地蓋天',
-u'遮地漫天',
-u'折鼎覆餗',
-u'折斷胫骨',
-u'折槁振落',
-u'遮垢藏污',
-u'折骨絕筋',
-u'折箭爲戒',
-u'折翦爲盟',
-u'折簡相召',
-u'折節待士',
-u'折節讀書',
-u'折節禮士',
-u'折節下交',
-u'折節下士',
-u'折節向學',
-u'折節學問',
-u'折矩周規',
-u'遮空蔽日',
-u'折柳話別',
-u'折柳攀花',
-u'轍亂旗靡',
-u'遮目如盲',
-u'遮前掩後',
-u'折券棄債',
-u'遮人耳目',
-u'哲人其萎',
-u'遮人眼目',
-u'遮三瞞四',
-u'這山望着那山高',
-u'着書立說',
-u'這堂英語課',
-u'遮天蔽日',
-u'遮天蓋地',
-u'遮天蓋日',
-u'遮天迷地',
-u'遮天映日',
-u'遮污藏垢',
-u'遮掩耳目',
-u'折腰升鬥',
-u'者也之乎',
-u'這一步兒去',
-u'着衣吃飯',
-u'赭衣塞路',
-u'折獄斷案',
-u'詟谀立懦',
-u'褶皺花冠',
-u'折足覆餗',
-u'振筆疾書',
-u'振臂一呼',
-u'振筆直書',
-u'振兵釋旅',
-u'貞不絕俗',
-u'真才實學',
-u'真刀真槍',
-u'振動匕首',
-u'振動輕劍',
-u'真斷岩斬',
-u'震耳尖嘯',
-u'震耳咆哮',
-u'震耳嗓音',
-u'震耳欲聾',
-u'枕方寝繩',
-u'振奮人心',
-u'貞風亮節',
-u'針鋒相對',
-u'貞婦愛色',
-u'枕幹之雠',
-u'貞高絕俗',
-u'枕戈嘗膽',
-u'枕戈達旦',
-u'枕戈待旦',
-u'枕戈待敵',
-u'枕戈待命',
-u'枕戈汗馬',
-u'枕戈擊楫',
-u'枕戈披甲',
-u'枕戈泣血',
-u'枕戈寝甲',
-u'枕戈以待',
-u'枕戈飲膽',
-u'枕戈飲血',
-u'枕戈剚刃',
-u'枕戈坐甲',
-u'震古铄今',
-u'震撼人心',
-u'真橫掃千軍',
-u'枕籍經史',
-u'震擊獵槍',
-u'針尖對麥芒',
-u'真叫活見鬼',
-u'貞節聖女',
-u'針芥相投',
-u'針芥之合',
-u'針芥之契',
-u'針芥之投',
-u'真金不怕火',
-u'真金不怕火煉',
-u'枕經籍書',
-u'振警愚鉗',
-u'枕冷衾寒',
-u'振領提綱',
-u'枕流漱石',
-u'振聾發瞶',
-u'震聾發聩',
-u'振聾啓瞶',
-u'振鹭充娣',
-u'振鹭在娣',
-u'陣馬風樯',
-u'振民育德',
-u'真命天子',
-u'赈貧貸乏',
-u'振貧濟乏',
-u'真憑實據',
-u'甄奇錄異',
-u'真槍實彈',
-u'珍禽奇獸',
-u'珍禽異獸',
-u'真情實感',
-u'真情實意',
-u'振窮恤寡',
-u'振窮恤貧',
-u'振裘持領',
-u'枕麹藉糟',
-u'真人不露相',
-u'真人面前不說假話',
-u'鎮日鎮夜',
-u'振弱除暴',
-u'枕山臂江',
-u'枕善而居',
-u'枕山負海',
-u'枕山襟海',
-u'枕山栖谷',
-u'枕石寝繩',
-u'枕石漱流',
-u'枕石嗽流',
-u'振衰起蔽',
-u'貞松勁柏',
-u'震天動地',
-u'針頭線腦',
-u'針頭線尾',
-u'針頭削鐵',
-u'真僞莫辨',
-u'枕穩衾溫',
-u'枕席過師',
-u'枕席還師',
-u'枕溪靠湖',
-u'貞下起元',
-u'真相畢露',
-u'真相大白',
-u'真心誠意',
-u'甄心動懼',
-u'真心實意',
-u'真心真意',
-u'振興中華',
-u'真兇實犯',
-u'珍馐佳肴',
-u'珍馐美馔',
-u'真言聖契',
-u'真言術盾',
-u'枕岩漱流',
-u'真言術韌',
-u'振衣而起',
-u'真易筋經',
-u'振衣提領',
-u'振衣濯足',
-u'貞元會合',
-u'真髒實犯',
-u'真贓真賊',
-u'振振有詞',
-u'針織便鞋',
-u'真炙炎陣',
-u'真知卓見',
-u'枕中鴻寶',
-u'斟酌損益',
-u'振作有爲',
-u'正本澄源',
-u'正本清源',
-u'争長競短',
-u'争長論短',
-u'正常響應',
-u'政出多門',
-u'正大光明',
-u'正大堂煌',
-u'争短論長',
-u'整頓幹坤',
-u'争多論少',
-u'正兒巴經',
-u'正法眼藏',
-u'正法直度',
-u'争分奪秒',
-u'整紛剔蠹',
-u'争鋒吃醋',
-u'征服印記',
-u'整躬率物',
-u'争功诿過',
-u'正冠李下',
-u'整冠納履',
-u'證龜成鼈',
-u'正規文法',
-u'争雞失羊',
-u'正己守道',
-u'整甲繕兵',
-u'政簡刑清',
-u'政教合一',
-u'整襟危坐',
-u'正經八百',
-u'正經八闆',
-u'正經八本',
-u'整舊如新',
-u'證據理論',
-u'證據确鑿',
-u'證據推理',
-u'整軍經武',
-u'正理平治',
-u'征斂無度',
-u'政令不一',
-u'正龍拍虎',
-u'整旅厲卒',
-u'争貓丢牛',
-u'正名定分',
-u'争名奪利',
-u'正明公道',
-u'争名競利',
-u'争名于朝争利于市',
-u'征名責實',
-u'整年累月',
-u'猙獰面目',
-u'争奇鬥豔',
-u'正氣凜然',
-u'争前恐後',
-u'争強鬥狠',
-u'争強鬥勝',
-u'争強好勝',
-u'争強顯勝',
-u'政清人和',
-u'争權奪利',
-u'争權攘利',
-u'正人君子',
-u'鄭人買履',
-u'鄭人實履',
-u'鄭人争年',
-u'正容亢色',
-u'峥嵘歲月',
-u'正色敢言',
-u'正色厲聲',
-u'正色危言',
-u'正色直繩',
-u'正色直言',
-u'蒸沙成飯',
-u'蒸沙爲飯',
-u'正身明法',
-u'正身清心',
-u'正身率下',
-u'正聲雅音',
-u'正式測試',
-u'正視繩行',
-u'正始之音',
-u'證書廢除',
-u'争他一腳豚',
-u'整體磁頭',
-u'正統韓服',
-u'政通人和',
-u'鄭衛之音',
-u'争先恐後',
-u'正邪自古同冰炭',
-u'正心誠意',
-u'正言不諱',
-u'争妍鬥豔',
-u'正言厲色',
-u'正言厲顔',
-u'正言直谏',
-u'政以賄成',
-u'整衣斂容',
-u'睜一眼閉一眼',
-u'政由己出',
-u'争戰手套',
-u'征兆測試',
-u'鄭昭宋聾',
-u'睜着眼做合着眼受',
-u'铮铮佼佼',
-u'整整截截',
-u'正正經經',
-u'正正氣氣',
-u'蒸蒸日上',
-u'正正堂堂',
-u'铮铮鐵骨',
-u'铮铮鐵漢',
-u'铮铮硬骨',
-u'铮铮有聲',
-u'正正之旗',
-u'正直無私',
-u'正直無邪',
-u'正中己懷',
-u'鄭重其辭',
-u'鄭重其事',
-u'正中下懷',
-u'整裝待發',
-u'整字分解',
-u'芝艾俱焚',
-u'芝艾俱盡',
-u'窒礙難行',
-u'芝艾同焚',
-u'知白守黑',
-u'止暴禁非',
-u'栉比鱗差',
-u'栉比鱗臻',
-u'知必言言必盡',
-u'知彼知己',
-u'枝別條異',
-u'治病救人',
-u'炙冰使燥',
-u'指不勝偻',
-u'指不勝屈',
-u'枝布葉分',
-u'智藏瘝在',
-u'芝草無根',
-u'至誠高節',
-u'至誠之道',
-u'知恥必勇',
-u'知恥不辱',
-u'咫尺千裏',
-u'咫尺天涯',
-u'咫尺天顔',
-u'咫尺萬裏',
-u'咫尺威顔',
-u'稚齒婑媠',
-u'咫尺之功',
-u'咫尺之書',
-u'志沖鬥牛',
-u'隻愁不養不愁不長',
-u'織楚成門',
-u'支床叠屋',
-u'枝詞蔓說',
-u'枝詞蔓語',
-u'隻此一家',
-u'隻此一家別無分店',
-u'執粗井竈',
-u'志大才疏',
-u'治大國如烹小鮮',
-u'枝大于本',
-u'至大至剛',
-u'紙帶穿孔',
-u'隻待雨淋頭',
-u'至當不易',
-u'織當訪婢',
-u'隻當它玩笑',
-u'植黨營私',
-u'植黨自私',
-u'直道而行',
-u'直搗黃龍',
-u'治得了病治不了命',
-u'志得氣盈',
-u'志得意滿',
-u'擲地賦聲',
-u'制敵機先',
-u'擲地金聲',
-u'擲地有聲',
-u'知地知天',
-u'擲地作金石聲',
-u'指東話西',
-u'指東說西',
-u'紙短情長',
-u'枝對葉比',
-u'枝多風難折',
-u'枝多葉更茂',
-u'知恩報德',
-u'知恩報恩',
-u'執而不化',
-u'質而不俚',
-u'質而不野',
-u'摯而有別',
-u'執法不阿',
-u'植發沖冠',
-u'植發穿冠',
-u'知法犯法',
-u'執法如山',
-u'執法無私',
-u'陟罰臧否',
-u'枝繁葉茂',
-u'指方畫圓',
-u'質非文是',
-u'止沸益薪',
-u'芝焚蕙歎',
-u'支分節解',
-u'枝分縷解',
-u'枝分葉散',
-u'支分族解',
-u'栉風沐雨',
-u'栉風酾雨',
-u'炙膚皲足',
-u'知夫莫如妻',
-u'知夫莫若妻',
-u'雉伏鼠竄',
-u'指腹爲婚',
-u'枝附葉從',
-u'枝附葉連',
-u'枝附葉著',
-u'枝附葉着',
-u'枝附影從',
-u'枝幹相持',
-u'脂膏不潤',
-u'脂膏莫潤',
-u'趾高氣揚',
-u'至高無上',
-u'止戈散馬',
-u'止戈爲武',
-u'止戈興仁',
-u'跖狗吠堯',
-u'栉垢爬癢',
-u'指古摘今',
-u'志廣才疏',
-u'紙貴洛陽',
-u'治郭安邦',
-u'治國安民',
-u'知過必改',
-u'知過不難改過難',
-u'知過君子',
-u'知過能改',
-u'擲果潘安',
-u'擲果潘郎',
-u'擲果盈車',
-u'紙糊的老虎吓不倒人',
-u'陟岵瞻望',
-u'之乎者也',
-u'陟岵陟屺',
-u'摭華捐實',
-u'質懷抱真',
-u'指麾可定',
-u'智昏菽麥',
-u'隻雞鬥酒',
-u'鸷擊狼噬',
-u'指雞罵狗',
-u'隻雞絮酒',
-u'知己知彼',
-u'知己知彼百戰百勝',
-u'知己之遇',
-u'炙雞漬酒',
-u'隻雞樽酒',
-u'彘肩鬥酒',
-u'胝肩繭足',
-u'隻見樹木',
-u'隻見樹木不見森林',
-u'志堅行苦',
-u'隻見一個人',
-u'咫角骖駒',
-u'志驕氣盈',
-u'志驕意滿',
-u'直接存儲器存取',
-u'枝節橫生',
-u'直截了當',
-u'志潔行芳',
-u'知今博古',
-u'智盡能索',
-u'執經問難',
-u'執經問字',
-u'智均力敵',
-u'止渴思梅',
-u'止渴望梅',
-u'隻可意會',
-u'隻可意會不可言傳',
-u'執柯作伐',
-u'指空話空',
-u'直口無言',
-u'知來藏往',
-u'芝蘭玉樹',
-u'芝蘭之室',
-u'紙裏包不住火',
-u'至理名言',
-u'支離破碎',
-u'執禮甚卑',
-u'指李推張',
-u'吱哩哇啦',
-u'志立則功就',
-u'直諒多聞',
-u'執兩用中',
-u'枝流葉布',
-u'指鹿爲馬',
-u'指鹿作馬',
-u'隻輪不返',
-u'隻輪無反',
-u'紙落雲煙',
-u'芝麻開花節節高',
-u'志滿氣得',
-u'志滿氣驕',
-u'志滿意得',
-u'直眉瞪眼',
-u'直眉楞眼',
-u'直眉怒目',
-u'志美行厲',
-u'執迷不返',
-u'執迷不誤',
-u'執迷不醒',
-u'知命不憂',
-u'知名當世',
-u'指名道姓',
-u'緻命的青銅短劍',
-u'知命樂天',
-u'知命之年',
-u'枝末生根',
-u'直木必伐',
-u'栉沐風雨',
-u'直木先伐',
-u'知難而進',
-u'知難而退',
-u'指南攻北',
-u'直内方外',
-u'智能模拟支持系統',
-u'鸷匿鳥形',
-u'鸷鳥不群',
-u'鸷鳥将擊卑飛斂翼',
-u'鸷鳥累百不如一鹗',
-u'隻怕立志不堅',
-u'隻怕秋來有冷時',
-u'隻怕人情兩面刀',
-u'隻怕有心人',
-u'執憑文帖',
-u'直撲無華',
-u'隻騎不反',
-u'知其不可而爲之',
-u'執其兩端',
-u'知其一不知其二',
-u'知其一而不知其二',
-u'知其一未睹其二',
-u'隻欠東風',
-u'至親骨肉',
-u'至親好友',
-u'至親莫如郎舅',
-u'指親托故',
-u'知情不舉',
-u'知情不舉罪加一等',
-u'知情達理',
-u'直情徑行',
-u'智窮才盡',
-u'直取要害',
-u'跖犬吠堯',
-u'跖犬噬堯',
-u'直權無華',
-u'指囷相贈',
-u'直認不諱',
-u'執認己意',
-u'知人論世',
-u'知人善任',
-u'至人無夢',
-u'知人下士',
-u'知人知面不知心',
-u'知人之明',
-u'指日成功',
-u'指日而待',
-u'指日高陞',
-u'指日可待',
-u'指日可下',
-u'指日誓心',
-u'知榮守辱',
-u'直入公堂',
-u'置若罔聞',
-u'指桑罵槐',
-u'指桑說槐',
-u'指山賣磨',
-u'植善傾惡',
-u'指山說磨',
-u'至善至美',
-u'紙上得來終覺淺',
-u'直上青雲',
-u'紙上談兵',
-u'直上直下',
-u'枝少風易折',
-u'隻身孤影',
-u'置身事外',
-u'至聖先師',
-u'執勝之地',
-u'至聖至明',
-u'治世安民撥亂反正',
-u'知識密集型産業',
-u'志士仁人',
-u'知事少時煩惱少',
-u'指矢天日',
-u'直是無着力處',
-u'知識組織',
-u'指手點腳',
-u'指手頓腳',
-u'指手劃腳',
-u'炙手可熱',
-u'支手舞腳',
-u'知書達禮',
-u'直抒己見',
-u'擲鼠忌器',
-u'直抒胸臆',
-u'祗樹有緣',
-u'栉霜沐露',
-u'置水之情',
-u'知死必勇',
-u'至死不變',
-u'至死不貳',
-u'至死不泯',
-u'至死不怕難',
-u'至死不悟',
-u'至死不移',
-u'至死不渝',
-u'治絲而棼',
-u'知死而後勇',
-u'之死靡二',
-u'之死靡他',
-u'至死無對證',
-u'治絲益棼',
-u'隻似在圓地上走',
-u'止松熊怪',
-u'止松要塞',
-u'止談風月',
-u'知疼着熱',
-u'知疼着癢',
-u'指天畫地',
-u'指天射魚',
-u'指天誓日',
-u'指天爲誓',
-u'隻聽樓梯響',
-u'隻聽樓梯響不見人下來',
-u'志同道合',
-u'雉頭狐腋',
-u'枝外生枝',
-u'知往鑒今',
-u'知微知彰',
-u'執文害意',
-u'知我者爲我心憂',
-u'知我罪我',
-u'之無不識',
-u'知無不言',
-u'知無不言言無不盡',
-u'支吾其詞',
-u'窒息孢子',
-u'窒息指環',
-u'指瑕造隙',
-u'智小謀大',
-u'智小言大',
-u'置信測度',
-u'知心能幾人',
-u'知雄守雌',
-u'知羞識廉',
-u'隻許州官放火',
-u'隻許州官放火不許百姓點燈',
-u'志學之年',
-u'直言不諱',
-u'直言骨鲠',
-u'直言賈禍',
-u'直言極谏',
-u'隻言片語',
-u'直言切谏',
-u'直言取禍',
-u'指雁爲羹',
-u'直言勿諱',
-u'直言無隐',
-u'直言正谏',
-u'直言正論',
-u'直言正色',
-u'隻要功夫深',
-u'隻要功夫深鐵杵磨成針',
-u'枝葉扶疏',
-u'枝葉扶蘇',
-u'枝葉相持',
-u'質疑辨惑',
-u'執意不從',
-u'執一不回',
-u'知一而不知二',
-u'至矣盡矣',
-u'知一萬畢',
-u'質疑問難',
-u'知易行難',
-u'知音谙呂',
-u'知音說與知音聽',
-u'志盈心滿',
-u'智勇兼全',
-u'智勇雙全',
-u'隻有錯拿沒有錯放',
-u'隻有贱賣哪有贱買',
-u'質伛影曲',
-u'知遇之恩',
-u'止于至善',
-u'枝源派本',
-u'緻遠任重',
-u'智圓行方',
-u'志在千裏',
-u'志在四方',
-u'志在四海',
-u'至再至三',
-u'指皁爲白',
-u'制造藥劑',
-u'職責分開',
-u'擲杖成龍',
-u'指掌可取',
-u'枝爪護手',
-u'知者減半',
-u'智者見智',
-u'智者見智仁者見仁',
-u'智者見諸未萌',
-u'智者千慮',
-u'智者千慮必有一失',
-u'智者千慮或有一失',
-u'隻争旦夕',
-u'隻争來早與來遲',
-u'隻争朝夕',
-u'知止不殆',
-u'置之不顧',
-u'置之不理',
-u'知止常止',
-u'緻之度外',
-u'置之高閣',
-u'置之腦後',
-u'隻知其一',
-u'隻知其一不知其二',
-u'隻知其一未知其二',
-u'置之死地',
-u'置之死地而後快',
-u'置之死地而後生',
-u'擿埴索途',
-u'知之爲知之不知爲不知',
-u'支支吾吾',
-u'隻知有己不知有人',
-u'趾踵相錯',
-u'趾踵相接',
-u'隻重衣衫不重人',
-u'智周萬物',
-u'置諸高閣',
-u'指豬罵狗',
-u'直撞橫沖',
-u'置錐之地',
-u'隻字不提',
-u'知子莫若父',
-u'之子于歸',
-u'知子者莫若父',
-u'知足不辱',
-u'知足長安',
-u'知足常樂',
-u'知足常足',
-u'志足意滿',
-u'知足者常樂',
-u'知足知止',
-u'紙醉金迷',
-u'至尊一戒',
-u'至尊至貴',
-u'中飽私囊',
-u'重病拖家貧',
-u'忠不避危',
-u'鍾不打不鳴',
-u'鍾不扣不鳴鼓不打不響',
-u'重财輕義',
-u'忠臣不怕死怕死不忠臣',
-u'忠臣出于孝子之門',
-u'終成泡影',
-u'衆楚群咻',
-u'衆川赴海',
-u'中道而廢',
-u'鍾的聲兒樹的影兒',
-u'鍾鼎高門',
-u'鍾鼎人家',
-u'鍾鼎山林',
-u'鍾鼎之家',
-u'種豆得豆',
-u'衆多非一',
-u'終而複始',
-u'終非池中物',
-u'忠肝義膽',
-u'忠肝義糁',
-u'中冓之言',
-u'鍾鼓之色',
-u'鍾鼓馔玉',
-u'衆寡不敵',
-u'種瓜得瓜',
-u'種瓜得瓜種豆得豆',
-u'衆寡勢殊',
-u'衆寡懸絕',
-u'衆寡懸殊',
-u'忠貫白日',
-u'重關擊柝',
-u'忠貫日月',
-u'中國第一曆史檔案館',
-u'中國俗語庫',
-u'衆好衆惡',
-u'中河失舟',
-u'中河失舟一壺千金',
-u'重厚寡言',
-u'重厚少文',
-u'衆虎同心',
-u'中華人民共和國',
-u'衆毀銷骨',
-u'種火又長柱門又短',
-u'踵迹相接',
-u'忠見疑信見謗',
-u'重結締皮',
-u'踵接肩摩',
-u'踵決肘見',
-u'終軍請纓',
-u'衆口嗷嗷',
-u'衆口紛纭',
-u'衆口交傳',
-u'衆口交詈',
-u'衆口交贊',
-u'衆口難調',
-u'衆口如一',
-u'衆口铄金',
-u'衆口同聲',
-u'衆口相傳',
-u'衆口銷金',
-u'衆口熏天',
-u'衆口一辭',
-u'中饋乏人',
-u'中饋猶虛',
-u'重垃圾箱',
-u'重廊複閣',
-u'中裏巴人',
-u'中立不倚',
-u'鍾靈毓秀',
-u'中流底柱',
-u'衆流歸海',
-u'中流擊楫',
-u'中流失舟一壺千金',
-u'中流一壺',
-u'中流一壸',
-u'鍾漏并歇',
-u'種麻得麻',
-u'種麥得麥',
-u'衆盲摸象',
-u'衆毛攢裘',
-u'衆毛飛骨',
-u'重門擊柝',
-u'鍾鳴鼎列',
-u'鍾鳴鼎食',
-u'鍾鳴鼎重',
-u'鍾鳴漏盡',
-u'重磨刀石',
-u'衆目共睹',
-u'衆目共視',
-u'衆目具瞻',
-u'衆目睽睽',
-u'冢木已拱',
-u'衆目昭彰',
-u'終南捷徑',
-u'重男輕女',
-u'衆難群疑',
-u'重逆無道',
-u'中年況味苦于酒',
-u'衆怒不可犯',
-u'衆怒難犯',
-u'衆怒難任',
-u'衆怒如水火',
-u'衆叛親離',
-u'重平衡石',
-u'重氣輕命',
-u'重氣輕生',
-u'終其天年',
-u'重氣徇命',
-u'衆擎易舉',
-u'衆犬吠聲',
-u'重拳猛擊',
-u'重拳先生',
-u'重泉之下',
-u'衆人廣坐',
-u'衆人國士',
-u'衆人拾柴火焰高',
-u'衆人是聖人',
-u'種上蒺藜就要紮腳',
-u'中傷之盾',
-u'重賞之下',
-u'重賞之下必有死夫',
-u'重賞之下必有勇夫',
-u'重賞之下死士多',
-u'重賞之下勇士多',
-u'衆少成多',
-u'終身不恥',
-u'終身不辱',
-u'終身大事',
-u'終始不渝',
-u'終始如一',
-u'終始若一',
-u'踵事增華',
-u'衆矢之的',
-u'衆說紛揉',
-u'衆說紛纭',
-u'螽斯衍慶',
-u'螽斯蟄蟄',
-u'螽斯之墳',
-u'螽斯之慶',
-u'衆所共知',
-u'衆所周知',
-u'重鐵護腿',
-u'重鐵護腕',
-u'中外合璧',
-u'重望高名',
-u'衆望所歸',
-u'衆望攸歸',
-u'重尾分布',
-u'中文文本校改系統',
-u'踵武前賢',
-u'踵武相接',
-u'中西合璧',
-u'重熙累洽',
-u'仲夏篝火',
-u'仲夏臘腸',
-u'仲夏商人',
-u'仲夏司儀',
-u'忠孝節義',
-u'忠孝兩全',
-u'衆心成城',
-u'忠心赤膽',
-u'忠心耿耿',
-u'忠心貫日',
-u'衆心如城',
-u'衆星攢月',
-u'衆星拱北',
-u'衆星拱極',
-u'衆星拱月',
-u'衆星環極',
-u'衆星朗朗',
-u'衆星捧月',
-u'終須還到老',
-u'衆喣飄山',
-u'衆喣山動',
-u'終須無煩惱',
-u'重岩叠嶂',
-u'忠言逆耳',
-u'衆議成林',
-u'重義輕财',
-u'重義輕生',
-u'中醫運氣學說',
-u'重雍襲熙',
-u'中庸之道',
-u'重宇別院',
-u'重于泰山',
-u'衆怨之的',
-u'中原逐鹿',
-u'衆月之淚',
-u'鍾在寺裏聲在外邊',
-u'衆則難摧',
-u'忠貞不渝',
-u'衆志成城',
-u'重紙累劄',
-u'踵趾相接',
-u'冢中枯骨',
-u'衆啄同音',
-u'重足屏息',
-u'種族特長',
-u'踵足相接',
-u'重足一蹟',
-u'衆醉獨醒',
-u'重作馮婦',
-u'驟不及防',
-u'舟車勞頓',
-u'周陳國大長公主傳',
-u'晝度夜思',
-u'周而不比',
-u'周而複始',
-u'驟風暴雨',
-u'驟風急雨',
-u'晝伏夜動',
-u'晝伏夜行',
-u'晝伏夜遊',
-u'晝幹夕惕',
-u'晝耕夜誦',
-u'周公大義滅親',
-u'周公吐哺',
-u'州官放火',
-u'周規折矩',
-u'周急繼乏',
-u'晝警暮巡',
-u'晝警夕惕',
-u'周郎顧曲',
-u'周期竊取',
-u'晝乾夕惕',
-u'周情孔思',
-u'周窮恤匮',
-u'晝日三接',
-u'晝日晝夜',
-u'周三徑一',
-u'謅上抑下',
-u'粥少僧多',
-u'舟水之喻',
-u'晝思夜想',
-u'晝想夜夢',
-u'肘脅之患',
-u'肘行膝步',
-u'周旋到底',
-u'晝夜兼程',
-u'晝夜兼行',
-u'肘腋之患',
-u'晝吟宵哭',
-u'晝陰夜陽',
-u'周遊列國',
-u'驟雨暴風',
-u'驟雨狂風',
-u'诪張變眩',
-u'诪張爲幻',
-u'舟中敵國',
-u'粥粥無能',
-u'周轉不靈',
-u'竹芭松茂',
-u'竹柏異心',
-u'竹報平安',
-u'竹苞松茂',
-u'誅暴讨逆',
-u'豬卑狗險',
-u'珠璧交輝',
-u'珠璧聯輝',
-u'助邊輸财',
-u'珠箔銀屏',
-u'祝不勝詛',
-u'住場好不如肚腸好',
-u'箸長碗短',
-u'築巢引來金鳳凰',
-u'珠沉璧碎',
-u'珠沉滄海',
-u'珠沉玉碎',
-u'珠沉玉隕',
-u'铢稱寸量',
-u'鑄成大錯',
-u'誅鋤異己',
-u'鑄錘大師',
-u'朱唇粉面',
-u'朱唇皓齒',
-u'朱唇玉面',
-u'屬詞比事',
-u'珠翠之珍',
-u'铢寸累積',
-u'逐宕失返',
-u'逐電追風',
-u'鑄鼎象物',
-u'煮豆燃豆箕',
-u'煮豆燃箕',
-u'煮豆燃萁',
-u'逐隊成群',
-u'諸惡莫作',
-u'祝發空門',
-u'祝發文身',
-u'朱轓皁蓋',
-u'铢分毫析',
-u'翥鳳翔鸾',
-u'鑄斧大師',
-u'豬肝餡餅',
-u'朱幹玉戚',
-u'珠歌翠舞',
-u'朱閣青樓',
-u'祝鲠祝噎',
-u'祝鲠祝饐',
-u'珠宮貝阙',
-u'誅故贳誤',
-u'珠光寶氣',
-u'珠光頭飾',
-u'珠規玉矩',
-u'煮鶴焚琴',
-u'煮鶴燒琴',
-u'朱紅雕像',
-u'駐紅卻白',
-u'諸侯并起',
-u'拄笏看山',
-u'拄笏西山',
-u'珠還合浦',
-u'铢積寸累',
-u'铢積絲累',
-u'逐機應變',
-u'铢積锱累',
-u'拄頰看山',
-u'鑄甲銷戈',
-u'鑄劍大師',
-u'鑄劍爲犁',
-u'助桀爲暴',
-u'助桀爲惡',
-u'助桀爲虐',
-u'逐近棄遠',
-u'誅盡殺絕',
-u'主敬存誠',
-u'逐句逐字',
-u'逐客下令',
-u'竹籃打水',
-u'逐浪随波',
-u'铢累寸積',
-u'竹籬茅舍',
-u'竹籬茅舍風光好',
-u'珠聯璧合',
-u'株連蔓引',
-u'珠聯玉映',
-u'铢量寸度',
-u'铢兩分寸',
-u'铢兩悉稱',
-u'铢兩相稱',
-u'珠零錦粲',
-u'珠零玉落',
-u'珠流璧轉',
-u'逐流忘返',
-u'竹籠鑰匙',
-u'朱樓碧瓦',
-u'朱樓绮戶',
-u'舳舻銜接',
-u'舳舻相繼',
-u'舳舻相接',
-u'逐鹿中原',
-u'祝僇祝鲠',
-u'朱輪華毂',
-u'珠落玊盤',
-u'珠落玉盤',
-u'竹馬之交',
-u'竹馬之友',
-u'屬毛離裏',
-u'朱門酒肉臭',
-u'朱門酒肉臭路有凍死骨',
-u'朱門繡戶',
-u'朱甍碧瓦',
-u'逐麋而失之',
-u'逐名趨勢',
-u'逐末棄本',
-u'逐末舍本',
-u'逐末忘本',
-u'鑄木镂冰',
-u'朱槃玉敦',
-u'珠槃玉敦',
-u'豬朋狗友',
-u'諸親好友',
-u'諸親六眷',
-u'竹青王蛇',
-u'誅求不已',
-u'誅求無度',
-u'誅求無厭',
-u'誅求無已',
-u'朱雀玄武',
-u'屬人耳目',
-u'助人爲樂',
-u'助人下石',
-u'逐日彩鹫',
-u'逐日追風',
-u'諸如此比',
-u'諸如此類',
-u'諸如此例',
-u'侏儒觀戲',
-u'侏儒一節',
-u'諸若此類',
-u'諸色人等',
-u'朱砂沒有紅土爲貴',
-u'劚山覓玉',
-u'鑄山煮海',
-u'主少國疑',
-u'築舍道傍',
-u'主聖臣良',
-u'築室道謀',
-u'築室反耕',
-u'铢施兩較',
-u'諸使外國一輩',
-u'柱石之堅',
-u'著手成春',
-u'著手回春',
-u'主守自盜',
-u'著述等身',
-u'著書立說',
-u'蛛絲便鞋',
-u'蛛絲馬迹',
-u'蛛絲之靴',
-u'主算者艴然',
-u'珠胎暗結',
-u'築壇拜将',
-u'柱天踏地',
-u'助天爲虐',
-u'鑄鐵矛柄',
-u'鑄鐵弩機',
-u'珠投璧抵',
-u'竹頭木屑',
-u'豬突狼奔',
-u'豬突豨勇',
-u'祝鮀之佞',
-u'珠圍翠繞',
-u'珠圍翠擁',
-u'麈尾之誨',
-u'助我張目',
-u'逐物不還',
-u'著毋庸議',
-u'朱弦三歎',
-u'褚小杯大',
-u'褚小懷大',
-u'柱小傾大',
-u'逐新趣異',
-u'鑄新淘舊',
-u'誅心之論',
-u'注玄尚白',
-u'豬牙匕首',
-u'朱顔翠發',
-u'朱顔鶴發',
-u'朱顔綠發',
-u'駐顔益壽',
-u'駐顔有術',
-u'祝咽祝哽',
-u'朱衣點頭',
-u'助憶符号',
-u'朱衣使者',
-u'主一無适',
-u'逐影吠聲',
-u'逐影随波',
-u'逐影尋聲',
-u'主憂臣辱',
-u'諸有此類',
-u'杼柚空虛',
-u'杼柚其空',
-u'杼柚之空',
-u'珠玉滿堂',
-u'劚玉如泥',
-u'珠玉在側',
-u'著于竹帛',
-u'屬垣有耳',
-u'珠圓玉潔',
-u'珠圓玉潤',
-u'朱雲折檻',
-u'燭照數計',
-u'煮粥焚須',
-u'助纣爲虐',
-u'逐逐眈眈',
-u'铢铢較量',
-u'铢铢校量',
-u'諸子百家',
-u'煮字療饑',
-u'朱紫難別',
-u'逐字逐句',
-u'著作等身',
-u'抓耳撓腮',
-u'抓耳搔腮',
-u'抓乖賣俏',
-u'抓乖弄俏',
-u'抓破臉皮',
-u'抓破臉子',
-u'抓破面皮',
-u'拽布披麻',
-u'拽布拖麻',
-u'拽耙扶犁',
-u'拽巷邏街',
-u'拽象拖犀',
-u'轉悲爲喜',
-u'轉嗔爲喜',
-u'轉愁爲喜',
-u'轉鬥千裏',
-u'專斷獨行',
-u'專犯忌諱',
-u'剸繁決劇',
-u'剸繁治劇',
-u'專房之寵',
-u'專國弄權',
-u'專橫跋扈',
-u'轉喉觸諱',
-u'轉禍爲福',
-u'磚家叫獸',
-u'專精覃思',
-u'專門利人',
-u'轉怒爲喜',
-u'轉日回天',
-u'轉入轉出',
-u'專擅獨斷',
-u'專事口舌',
-u'轉死溝壑',
-u'轉死溝渠',
-u'磚頭瓦塊也有翻身之日',
-u'轉土成水',
-u'轉彎抹角',
-u'轉危爲安',
-u'專線接入',
-u'專心一意',
-u'專心一緻',
-u'專心緻志',
-u'轉眼之間',
-u'專一不移',
-u'轉義序列',
-u'專用自動小交換機',
-u'轉憂爲喜',
-u'馔玉炊金',
-u'馔玉炊珠',
-u'專欲難成',
-u'轉災爲福',
-u'轉輾反側',
-u'轉戰千裏',
-u'專恣跋扈',
-u'壯臂開勁弓',
-u'裝點門面',
-u'壯發沖冠',
-u'裝瘋扮傻',
-u'裝瘋賣傻',
-u'裝瘋作傻',
-u'裝潢門面',
-u'壯烈犧牲',
-u'裝聾賣傻',
-u'裝聾作啞',
-u'裝沒事人一大堆',
-u'妝嫫費黛',
-u'裝模作樣',
-u'壯氣淩雲',
-u'壯氣吞牛',
-u'裝腔作勢',
-u'裝腔作态',
-u'裝怯作勇',
-u'裝傻充愣',
-u'裝神弄鬼',
-u'莊生夢蝶',
-u'壯士斷腕',
-u'壯士解腕',
-u'撞頭搕腦',
-u'莊舄越吟',
-u'壯心不已',
-u'莊嚴寶相',
-u'莊嚴護腕',
-u'裝妖作怪',
-u'撞陣沖軍',
-u'壯志豪情',
-u'壯志淩雲',
-u'壯志未酬',
-u'壯志未酬身先死',
-u'莊周夢蝶',
-u'追本窮源',
-u'追本溯源',
-u'追奔逐北',
-u'錐處囊中',
-u'錐刀之利',
-u'錐刀之末',
-u'追風捕影',
-u'追風掣電',
-u'追風覓影',
-u'追風蹑景',
-u'追風蹑影',
-u'追風逐電',
-u'追風逐日',
-u'追風逐影',
-u'追根查源',
-u'追根究蒂',
-u'追根窮源',
-u'追根求源',
-u'追根溯源',
-u'追根問底',
-u'追根尋底',
-u'椎鼓鳴鍾',
-u'追懽賣笑',
-u'追歡買笑',
-u'追歡取樂',
-u'追歡作樂',
-u'追悔何及',
-u'追悔莫及',
-u'追魂奪命',
-u'追魂奪魄',
-u'追魂冥蛇',
-u'墜溷飄茵',
-u'追魂攝魄',
-u'椎髻布衣',
-u'椎理穿掘',
-u'追獵腰帶',
-u'追趨逐耆',
-u'贅食太倉',
-u'椎天搶地',
-u'追亡逐北',
-u'追亡逐遁',
-u'墜茵落溷',
-u'追遠慎終',
-u'追雲彩鹫',
-u'追雲逐電',
-u'惴惴不安',
-u'贅字号兒聽題',
-u'諄諄不倦',
-u'諄諄诰誡',
-u'諄諄教導',
-u'諄諄善誘',
-u'灼艾分痛',
-u'捉班做勢',
-u'拙貝羅香',
-u'捉刀代筆',
-u'斫雕爲樸',
-u'卓爾不群',
-u'卓爾獨行',
-u'擢發莫數',
-u'擢發難數',
-u'斲方爲圓',
-u'捉風捕影',
-u'捉風捕月',
-u'酌古參今',
-u'濁骨凡胎',
-u'酌古沿今',
-u'酌古禦今',
-u'酌古斟今',
-u'酌古準今',
-u'卓乎不群',
-u'捉虎擒蛟',
-u'捉虎容易放虎難',
-u'捉雞罵狗',
-u'灼見真知',
-u'擢筋剝膚',
-u'擢筋割骨',
-u'捉衿見肘',
-u'捉衿露肘',
-u'捉衿肘見',
-u'酌金馔玉',
-u'濁泾清渭',
-u'卓絕千古',
-u'拙口笨腮',
-u'拙口鈍腮',
-u'卓立雞群',
-u'斫輪老手',
-u'卓荦不羁',
-u'卓荦超倫',
-u'卓荦之士',
-u'捉摸不定',
-u'卓然不群',
-u'卓然成家',
-u'着人先鞭',
-u'捉生替死',
-u'着手成春',
-u'捉鼠拿貓',
-u'酌水知源',
-u'濯污揚清',
-u'捉影捕風',
-u'酌盈劑虛',
-u'酌盈注虛',
-u'濯纓濯足',
-u'卓有成就',
-u'卓有成效',
-u'捉賊見贓',
-u'捉賊見贓厮打驗傷',
-u'捉賊要贓捉奸要雙',
-u'捉賊捉髒',
-u'濁質凡姿',
-u'濁之水精',
-u'茁壯成長',
-u'浞訾栗斯',
-u'濯足濯纓',
-u'拙嘴笨腮',
-u'拙嘴笨舌',
-u'自拔來歸',
-u'自暴自棄',
-u'自卑之刺',
-u'自不待言',
-u'自不量力',
-u'自慚譾陋',
-u'自慚鸠陋',
-u'自慚鸠拙',
-u'自慚形穢',
-u'自成一格',
-u'自成一家',
-u'子醜寅卯',
-u'自出機軸',
-u'自出機杼',
-u'自出心裁',
-u'自出一家',
-u'自吹自擂',
-u'自吹自捧',
-u'自厝同異',
-u'自得其樂',
-u'自底向上',
-u'紫電辟邪',
-u'自頂向下',
-u'自動電話翻譯系統',
-u'自負不凡',
-u'自甘暴棄',
-u'自甘堕落',
-u'自告奮勇',
-u'自高自大',
-u'自顧不暇',
-u'自古嫦娥愛少年',
-u'自古紅顔多薄命',
-u'自古紅顔多禍水',
-u'自古妻賢夫禍少',
-u'自古英雄不讀書',
-u'自劊以下',
-u'自恨枝無葉',
-u'自劃界塊',
-u'自壞長城',
-u'自己跌倒自己爬',
-u'自給自足',
-u'自家心裏急',
-u'自家有病自家知',
-u'自家有過人說要聽',
-u'自矜功伐',
-u'谘經诹史',
-u'自救不暇',
-u'趑趄不前',
-u'趑趄嗫嚅',
-u'自掘墳墓',
-u'自覺形穢',
-u'自覺自願',
-u'自郐而下',
-u'自郐無譏',
-u'自郐以下',
-u'自愧不如',
-u'自愧弗如',
-u'自力更生',
-u'自立門戶',
-u'眦裂發指',
-u'子路負米',
-u'子路結纓',
-u'自賣自誇',
-u'孳蔓難圖',
-u'子卯不樂',
-u'自媒自衒',
-u'自命不凡',
-u'自鳴得意',
-u'自命清高',
-u'子母雙劍',
-u'子女玉帛',
-u'紫氣東來',
-u'自欺欺人',
-u'自棄自暴',
-u'自強不息',
-u'自輕自贱',
-u'恣情縱慾',
-u'自求多福',
-u'自取咎戾',
-u'自取滅亡',
-u'自取其禍',
-u'自取其咎',
-u'自取罪戾',
-u'自身恐懼',
-u'自身難保',
-u'資深望重',
-u'自生自滅',
-u'自食惡果',
-u'自食其惡果',
-u'自食其果',
-u'自食其力',
-u'自食其言',
-u'自視甚高',
-u'茲事體大',
-u'自始至終',
-u'自始自終',
-u'自樹一幟',
-u'恣肆無忌',
-u'自私自利',
-u'恣睢無忌',
-u'恣睢自用',
-u'自損三千',
-u'子孫愚兮禮義疏',
-u'姿态識別',
-u'姿态萬千',
-u'自歎弗如',
-u'自讨苦吃',
-u'自讨沒趣',
-u'自投羅網',
-u'自衛打擊',
-u'子爲父隐',
-u'恣蚊飼血',
-u'自我表現',
-u'自我吹噓',
-u'自我定身',
-u'自我複活',
-u'自我昏迷',
-u'自我解嘲',
-u'自我陶醉',
-u'自我犧牲',
-u'自我治療',
-u'自我作古',
-u'恣無忌憚',
-u'子午雙刀',
-u'自西北至西南方',
-u'仔細觀看',
-u'子夏懸鹑',
-u'自相殘害',
-u'自相殘殺',
-u'自相驚擾',
-u'自相驚憂',
-u'自相矛盾',
-u'自相水火',
-u'自相魚肉',
-u'自小多才學',
-u'子孝父慈',
-u'子孝父心寬',
-u'字挾風霜',
-u'自信不疑',
-u'恣心所欲',
-u'自新之路',
-u'恣心縱欲',
-u'自行其是',
-u'自行由得我官差急如火',
-u'自省知識',
-u'恣兇稔惡',
-u'子虛烏有',
-u'自學成才',
-u'自尋短見',
-u'自尋煩惱',
-u'自崖而反',
-u'龇牙裂嘴',
-u'自言自語',
-u'自業自得',
-u'子以母貴母以子貴',
-u'姿意妄爲',
-u'恣意妄行',
-u'自以爲得計',
-u'自以爲是',
-u'恣意爲之',
-u'自贻伊咎',
-u'自诒伊戚',
-u'子以足指',
-u'自用則小',
-u'自由泛濫',
-u'自由放任',
-u'自有公論',
-u'自有旁人話短長',
-u'自由自在',
-u'自圓其說',
-u'自怨自艾',
-u'子曰詩雲',
-u'自在不成人',
-u'字斟句酌',
-u'字正腔圓',
-u'紫芝眉宇',
-u'自知之明',
-u'锱铢必較',
-u'锱铢不爽',
-u'锱铢較量',
-u'自裝鬼臉',
-u'孜孜不辍',
-u'孜孜不怠',
-u'孜孜不倦',
-u'孳孳不息',
-u'孜孜不懈',
-u'孜孜汲汲',
-u'孜孜矻矻',
-u'子子孫孫',
-u'孜孜無怠',
-u'孜孜無倦',
-u'孜孜以求',
-u'字字珠玑',
-u'字字珠玉',
-u'自作聰明',
-u'自作怪相',
-u'自作解人',
-u'自作門戶',
-u'自作主張',
-u'自作自受',
-u'總而言之',
-u'縱風止燎',
-u'綜核名實',
-u'縱橫捭阖',
-u'縱橫馳騁',
-u'縱橫交錯',
-u'縱橫交貫',
-u'縱橫開阖',
-u'縱橫天下',
-u'縱虎出匣',
-u'縱虎歸山',
-u'縱虎歸山放龍人海',
-u'總角之好',
-u'總角之交',
-u'宗師案臨',
-u'總總林林',
-u'走筆疾書',
-u'走伏無地',
-u'走花溜冰',
-u'走花溜水',
-u'走了和尚走不了廟',
-u'走了酒字下這道兒',
-u'走了三魂掉了七魄',
-u'走漏天機',
-u'走馬到任',
-u'走馬赴任',
-u'走馬觀花',
-u'走馬看花',
-u'走馬臨崖收缰晚',
-u'走馬上任',
-u'走馬章台',
-u'走南闖北',
-u'走三家不如坐一家',
-u'走殺金剛坐殺佛',
-u'走石飛沙',
-u'走投沒路',
-u'走頭無路',
-u'走爲上策',
-u'走爲上計',
-u'走爲上着',
-u'鄒衍談天',
-u'鄒纓齊紫',
-u'足兵足食',
-u'足不出戶',
-u'足不出門',
-u'足不窺戶',
-u'足不履影',
-u'足不逾戶',
-u'足尺加二',
-u'足蹈手舞',
-u'祖爾祭壇',
-u'足高氣強',
-u'足高氣揚',
-u'祖功宗德',
-u'卒極之事',
-u'足趼舌敝',
-u'足繭手胝',
-u'镞砺括羽',
-u'阻山帶河',
-u'足食豐衣',
-u'足食足兵',
-u'祖述堯舜',
-u'祖述堯舜憲章文武',
-u'祖武宗文',
-u'足衣足食',
-u'足音跫然',
-u'租用線路',
-u'足智多謀',
-u'祖宗成法',
-u'祖宗法度',
-u'祖宗家法',
-u'足足有餘',
-u'俎樽折沖',
-u'鑽冰求火',
-u'鑽冰求酥',
-u'鑽冰取火',
-u'鑽洞覓縫',
-u'鑽故紙堆',
-u'鑽火得冰',
-u'鑽堅研微',
-u'鑽堅仰高',
-u'鑽懶幫閑',
-u'鑽木取火',
-u'鑽牛角尖',
-u'鑽皮出羽',
-u'鑽山塞海',
-u'鑽水求酥',
-u'鑽燧取火',
-u'鑽天打洞',
-u'鑽天覓縫',
-u'鑽天入地',
-u'鑽頭不顧尾',
-u'鑽頭就鎖',
-u'鑽頭覓縫',
-u'鑽隙踰牆',
-u'鑽心刺骨',
-u'鑽穴踰牆',
-u'鑽穴逾隙',
-u'鑽穴踰垣',
-u'罪不可逭',
-u'罪不容死',
-u'罪不容誅',
-u'罪不勝誅',
-u'醉成一灘泥',
-u'罪大惡極',
-u'罪當萬死',
-u'罪惡貫盈',
-u'罪惡如山',
-u'罪惡深重',
-u'罪惡滔天',
-u'罪惡昭彰',
-u'罪惡昭著',
-u'蕞爾小國',
-u'醉發醒時言',
-u'罪該萬死',
-u'醉後乾坤大',
-u'醉後添杯不如無',
-u'罪加一等',
-u'醉酒飽德',
-u'嘴快舌長',
-u'罪魁禍首',
-u'晬面盎背',
-u'罪逆深重',
-u'罪孽深重',
-u'嘴清舌白',
-u'罪人不孥',
-u'罪人不帑',
-u'醉山頹倒',
-u'嘴上無毛辦事不牢',
-u'醉生夢死',
-u'醉是醒時言',
-u'醉死夢生',
-u'嘴甜心苦',
-u'嘴甜心苦兩面三刀',
-u'醉吐相茵',
-u'醉翁之意不在酒',
-u'罪無可逭',
-u'醉舞狂歌',
-u'醉仙墜子',
-u'罪業深重',
-u'罪以功除',
-u'罪應萬死',
-u'罪有應得',
-u'罪有攸歸',
-u'醉玉頹山',
-u'罪在不赦',
-u'罪責難逃',
-u'嘴直心快',
-u'遵道秉義',
-u'遵而不失',
-u'遵而勿失',
-u'尊古卑今',
-u'尊己卑人',
-u'樽酒論文',
-u'尊年尚齒',
-u'樽前月下',
-u'尊師貴道',
-u'尊師如尊父',
-u'遵時養晦',
-u'尊師重道',
-u'尊無二上',
-u'尊賢使能',
-u'尊姓大名',
-u'遵厭兆祥',
-u'遵養待時',
-u'遵養晦時',
-u'遵養時晦',
-u'樽中酒不空',
-u'尊主澤民',
-u'尊俎折沖',
-u'作壁上觀',
-u'坐不安席',
-u'坐不重席',
-u'坐不垂堂',
-u'坐不改姓',
-u'坐不改姓行不改名',
-u'坐不窺堂',
-u'坐車兒往東拽',
-u'坐吃山崩',
-u'坐吃山空',
-u'坐吃山空立地吃陷',
-u'坐籌帷幄',
-u'作辍無常',
-u'作歹爲非',
-u'左道旁門',
-u'坐地分髒',
-u'坐地自劃',
-u'作惡多端',
-u'坐而待弊',
-u'坐而待旦',
-u'坐而論道',
-u'作法自弊',
-u'左輔右弼',
-u'作福作威',
-u'做剛做柔',
-u'做個俏臉給瞎子看',
-u'做個俏眼給瞎子看',
-u'左顧右眄',
-u'左顧右盼',
-u'作古正經',
-u'坐觀成敗',
-u'做官的把印丢了',
-u'做鬼做神',
-u'作好作歹',
-u'做好做惡',
-u'坐懷不亂',
-u'左家嬌女',
-u'作嫁衣裳',
-u'作奸犯科',
-u'作奸犯罪',
-u'左建外易',
-u'作繭自縛',
-u'坐轎的不知扛轎的辛苦',
-u'坐戒垂堂',
-u'作金石聲',
-u'坐井觀天',
-u'坐井窺天',
-u'做客莫在後',
-u'作浪興風',
-u'做了皇帝想登仙',
-u'坐冷闆凳',
-u'坐立不安',
-u'左鄰右裏',
-u'左鄰右舍',
-u'坐糜廪粟',
-u'作嘔瘟疫',
-u'左鉛右椠',
-u'做俏臉給瞎子看',
-u'做俏眼給瞎子看',
-u'做人做世',
-u'作如是觀',
-u'坐山觀虎鬥',
-u'作善降祥',
-u'座上客常滿',
-u'坐上琴心',
-u'作舍道邊',
-u'作舍道旁',
-u'做神做鬼',
-u'坐視不救',
-u'坐視成敗',
-u'坐失機宜',
-u'坐失良機',
-u'坐食山空',
-u'坐失事機',
-u'左手不托右手',
-u'左手畫方',
-u'左手進右手出',
-u'坐收漁利',
-u'坐收漁人之利',
-u'坐樹不言',
-u'坐樹無言',
-u'左書右息',
-u'左思右想',
-u'左提右挈',
-u'左圖右史',
-u'左圖右書',
-u'昨晚上說的',
-u'作威作福',
-u'坐卧不安',
-u'坐卧不離',
-u'坐卧不寧',
-u'坐卧針氈',
-u'坐無虛席',
-u'坐享其成',
-u'坐享其功',
-u'坐享清福',
-u'做小動作',
-u'作小服低',
-u'坐薪嘗膽',
-u'坐薪懸膽',
-u'坐言起行',
-u'左眼跳财右眼跳災',
-u'作言造語',
-u'左也不是右也不是',
-u'昨夜燈花報今日喜鵲噪',
-u'坐以待斃',
-u'坐以待旦',
-u'做一天和尚撞一天鍾',
-u'左宜右宜',
-u'左宜右有',
-u'左萦右拂',
-u'坐擁百城',
-u'疵蒙謬累',
-u'佐雍得嘗',
-u'坐擁書城',
-u'左擁右抱',
-u'疵蒙謬累',
-u'左右采獲',
-u'左右逢原',
-u'左右開弓',
-u'左右兩難',
-u'左右圖史',
-u'左右爲難',
-u'作育人材',
-u'坐于塗炭',
-u'作育英才',
-u'坐運籌策',
-u'作賊心虛',
-u'做張做勢',
-u'做張做緻',
-u'左支右绌',
-u'左支右調',
-u'左支右吾',
-]
\ No newline at end of file
+# -*- coding: utf-8 -*-
+"""
+Idiom dictionary of the idiom-chain game, loaded from idiom.dat.
+
+The file holds the idioms sorted and encoded in UTF-8 in one blob with an
+offset table, followed by the first-character and last-character indexes,
+all integers are unsigned 32 bits little-endian:
+
+    magic 'IDM1'
+    header: count, blob size, first index size, last index size
+    offsets: count+1 byte offsets of each idiom in the blob
+    blob: the idioms in code point order
+    first index: (code point, start, end) ranges of idioms by first character
+    last index: (code point, start, end) ranges of lastOrder by last character
+    lastOrder: count idiom numbers grouped by last character
+
+Nothing is read until the dictionary is used for the first time, and an
+idiom is only decoded when it is accessed. The source of the dictionary is
+idioms.txt, one idiom per line, edit it and rebuild the file with:
+
+    python idiom.py [idioms.txt]
+"""
+import os, sys, struct
+
+MAGIC='IDM1'
+DATA_FILE=os.path.join(os.path.dirname(os.path.abspath(__file__)),'idiom.dat')
+SOURCE_FILE=os.path.join(os.path.dirname(os.path.abspath(__file__)),'idioms.txt')
+
+_UINT='<I'
+_HEADER='<4sIIII'
+_HEADER_SIZE=struct.calcsize(_HEADER)
+_ENTRY='<III'
+_ENTRY_SIZE=struct.calcsize(_ENTRY)
+
+class IdiomData():
+    """
+    The raw content of idiom.dat, read on first access.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+
+    def load(self):
+        if self.data is None:
+            f = open(self.path, 'rb')
+            try:
+                data = f.read()
+            finally:
+                f.close()
+            (magic, count, blobSize, firstSize, lastSize) = struct.unpack_from(_HEADER, data, 0)
+            if magic != MAGIC:
+                raise ValueError('%s is not an idiom dictionary' % self.path)
+            self.count = count
+            self.offsetStart = _HEADER_SIZE
+            self.blobStart = self.offsetStart + (count + 1) * 4
+            self.firstStart = self.blobStart + blobSize
+            self.firstSize = firstSize
+            self.lastStart = self.firstStart + firstSize * _ENTRY_SIZE
+            self.lastSize = lastSize
+            self.lastOrderStart = self.lastStart + lastSize * _ENTRY_SIZE
+            self.data = data
+        return self
+
+    def offset(self, index):
+        return struct.unpack_from(_UINT, self.data, self.offsetStart + index * 4)[0]
+
+    def encoded(self, index):
+        start = self.blobStart + self.offset(index)
+        end = self.blobStart + self.offset(index + 1)
+        return self.data[start:end]
+
+    def word(self, index):
+        return self.encoded(index).decode('utf-8')
+
+    def lastOrder(self, index):
+        return struct.unpack_from(_UINT, self.data, self.lastOrderStart + index * 4)[0]
+
+    def ranges(self, start, size):
+        result = {}
+        for i in range(size):
+            (codePoint, first, last) = struct.unpack_from(_ENTRY, self.data, start + i * _ENTRY_SIZE)
+            result[unichr(codePoint)] = (first, last)
+        return result
+
+    def find(self, word):
+        """
+        Return the index of the word, or -1. The blob is sorted by code
+        point, which is the same as the order of the UTF-8 bytes.
+        """
+        if isinstance(word, str):
+            try:
+                word = word.decode('utf-8')
+            except UnicodeDecodeError:
+                return -1
+        elif not isinstance(word, unicode):
+            return -1
+        encoded = word.encode('utf-8')
+        low = 0
+        high = self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.encoded(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self.encoded(low) == encoded:
+            return low
+        return -1
+
+
+class IdiomList():
+    """
+    Read only sequence of all the idioms.
+    """
+
+    def __init__(self, data):
+        self._data = data
+
+    def __len__(self):
+        return self._data.load().count
+
+    def __getitem__(self, index):
+        data = self._data.load()
+        if isinstance(index, slice):
+            return tuple([data.word(i) for i in range(*index.indices(data.count))])
+        if index < 0:
+            index += data.count
+        if index < 0 or index >= data.count:
+            raise IndexError('idiom index out of range')
+        return data.word(index)
+
+    def __iter__(self):
+        data = self._data.load()
+        for index in range(data.count):
+            yield data.word(index)
+
+    def __contains__(self, word):
+        return self._data.load().find(word) >= 0
+
+    def index(self, word):
+        index = self._data.load().find(word)
+        if index < 0:
+            raise ValueError('%r is not an idiom' % (word,))
+        return index
+
+
+class IdiomIndex():
+    """
+    Read only mapping of a character to the tuple of idioms starting
+    (or ending) with it.
+    """
+
+    def __init__(self, data, byLastChar=False):
+        self._data = data
+        self._byLastChar = byLastChar
+        self._ranges = None
+
+    def _getRanges(self):
+        if self._ranges is None:
+            data = self._data.load()
+            if self._byLastChar:
+                self._ranges = data.ranges(data.lastStart, data.lastSize)
+            else:
+                self._ranges = data.ranges(data.firstStart, data.firstSize)
+        return self._ranges
+
+    def get(self, char, default=None):
+        try:
+            (start, end) = self._getRanges()[char]
+        except KeyError:
+            return default
+        data = self._data
+        if self._byLastChar:
+            return tuple([data.word(data.lastOrder(i)) for i in range(start, end)])
+        return tuple([data.word(i) for i in range(start, end)])
+
+    def __getitem__(self, char):
+        result = self.get(char)
+        if result is None:
+            raise KeyError(char)
+        return result
+
+    def __contains__(self, char):
+        return char in self._getRanges()
+
+    def __len__(self):
+        return len(self._getRanges())
+
+    def keys(self):
+        return self._getRanges().keys()
+
+
+def build(words, path=DATA_FILE):
+    """
+    Write the given idioms to path in the idiom.dat format.
+    """
+    words = sorted(set([unicode(word).strip() for word in words if word.strip()]))
+    offsets = [0]
+    blob = []
+    for word in words:
+        encoded = word.encode('utf-8')
+        blob.append(encoded)
+        offsets.append(offsets[-1] + len(encoded))
+    blob = ''.join(blob)
+
+    first = []
+    for (index, word) in enumerate(words):
+        if first and first[-1][0] == ord(word[0]):
+            first[-1][2] = index + 1
+        else:
+            first.append([ord(word[0]), index, index + 1])
+
+    lastOrder = sorted(range(len(words)), key=lambda index: (words[index][-1], index))
+    last = []
+    for (position, index) in enumerate(lastOrder):
+        codePoint = ord(words[index][-1])
+        if last and last[-1][0] == codePoint:
+            last[-1][2] = position + 1
+        else:
+            last.append([codePoint, position, position + 1])
+
+    output = [struct.pack(_HEADER, MAGIC, len(words), len(blob), len(first), len(last))]
+    output.append(struct.pack('<%dI' % len(offsets), *offsets))
+    output.append(blob)
+    for entry in first + last:
+        output.append(struct.pack(_ENTRY, *entry))
+    output.append(struct.pack('<%dI' % len(lastOrder), *lastOrder))
+
+    f = open(path, 'wb')
+    try:
+        f.write(''.join(output))
+    finally:
+        f.close()
+    return len(words)
+
+
+_data = IdiomData(DATA_FILE)
+
+#read only, the idiom-chain game keeps its own set of used idioms
+idioms = IdiomList(_data)
+idiomSet = idioms
+idiomsByFirstChar = IdiomIndex(_data)
+idiomsByLastChar = IdiomIndex(_data, True)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        print 'usage: python idiom.py [idioms.txt]'
+        sys.exit(1)
+    source = SOURCE_FILE
+    if len(sys.argv) == 2:
+        source = sys.argv[1]
+    f = open(source, 'rb')
+    try:
+        lines = f.read().decode('utf-8').splitlines()
+    finally:
+        f.close()
+    print '%d idioms written to %s' % (build(lines), DATA_FILE)